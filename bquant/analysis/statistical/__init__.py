@@ -384,6 +384,7 @@ def correlation_matrix(data: pd.DataFrame, method: str = 'pearson') -> pd.DataFr
 try:
     from .hypothesis_testing import (
         HypothesisTestResult,
+        HypothesisTestRegistry,
         HypothesisTestSuite,
         run_all_hypothesis_tests,
         run_single_hypothesis_test
@@ -408,6 +409,7 @@ __all__ = [
 if _hypothesis_testing_available:
     __all__.extend([
         'HypothesisTestResult',
+        'HypothesisTestRegistry',
         'HypothesisTestSuite', 
         'run_all_hypothesis_tests',
         'run_single_hypothesis_test'
@@ -9,7 +9,9 @@ import pandas as pd
 import numpy as np
 from scipy import stats
 from scipy.stats import ttest_ind, mannwhitneyu, chi2_contingency
-from typing import Dict, Any, Optional, List, Union
+from typing import Dict, Any, Optional, List, Union, Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+import os
 import warnings
 from dataclasses import dataclass
 from datetime import datetime
@@ -17,6 +19,7 @@ from datetime import datetime
 from ...core.logging_config import get_logger
 from ...core.exceptions import StatisticalAnalysisError
 from .. import AnalysisResult
+from ..zones.feature_table import ZoneFeatureTable, as_feature_frame
 
 # Получаем логгер для модуля
 logger = get_logger(__name__)
@@ -72,19 +75,98 @@ class HypothesisTestResult:
         }
 
 
+class HypothesisTestRegistry:
+    """
+    Реестр тестов, выполняемых :meth:`HypothesisTestSuite.run_all_tests`.
+    
+    Тест — функция ``(suite, zones_features) -> HypothesisTestResult``, где
+    ``zones_features`` — :class:`ZoneFeatureTable`. Встроенные тесты
+    зарегистрированы методами HypothesisTestSuite; порядок регистрации
+    определяет порядок результатов.
+    
+    Example:
+        @HypothesisTestRegistry.register('long_bull_zones', description='...')
+        def long_bull_zones(suite, zones_features):
+            bull = zones_features.by_zone_type('bull')
+            ...
+            return HypothesisTestResult(...)
+    """
+    
+    _tests: Dict[str, Callable[..., 'HypothesisTestResult']] = {}
+    _metadata: Dict[str, Dict[str, Any]] = {}
+    
+    @classmethod
+    def register(cls, name: str, description: str = ""):
+        """
+        Декоратор для регистрации теста.
+        
+        Args:
+            name: Уникальное имя теста (ключ в results['tests'])
+            description: Человекочитаемое описание
+        """
+        def decorator(test_func):
+            if name in cls._tests:
+                logger.warning(f"Overwriting existing hypothesis test: {name}")
+            
+            cls._tests[name] = test_func
+            cls._metadata[name] = {
+                'description': description,
+                'function': test_func.__name__
+            }
+            logger.debug(f"Registered hypothesis test: {name}")
+            return test_func
+        
+        return decorator
+    
+    @classmethod
+    def unregister(cls, name: str) -> None:
+        """Удалить тест из реестра."""
+        cls._tests.pop(name, None)
+        cls._metadata.pop(name, None)
+    
+    @classmethod
+    def get(cls, name: str) -> Callable[..., 'HypothesisTestResult']:
+        """
+        Получить функцию теста по имени.
+        
+        Raises:
+            ValueError: Если тест не найден
+        """
+        if name not in cls._tests:
+            available = ', '.join(cls.list_tests())
+            raise ValueError(f"Unknown hypothesis test: '{name}'. Available: {available}")
+        return cls._tests[name]
+    
+    @classmethod
+    def list_tests(cls) -> List[str]:
+        """Список имен зарегистрированных тестов."""
+        return list(cls._tests.keys())
+    
+    @classmethod
+    def get_info(cls, name: str) -> Dict[str, Any]:
+        """Метаданные теста."""
+        cls.get(name)
+        return dict(cls._metadata[name])
+
+
 class HypothesisTestSuite:
     """
     Набор статистических тестов для анализа торговых зон и паттернов.
     """
     
-    def __init__(self, alpha: float = 0.05):
+    def __init__(self, alpha: float = 0.05, n_jobs: Optional[int] = 1):
         """
         Инициализация набора тестов.
         
         Args:
             alpha: Уровень значимости для всех тестов
+            n_jobs: Потоки для независимых тестов в run_all_tests
+                (1 = последовательно, -1 или None = по числу CPU).
+                Тесты считаются в основном в scipy/numpy, которые отпускают GIL
         """
         self.alpha = alpha
+        cpus = os.cpu_count() or 1
+        self.n_jobs = cpus if n_jobs is None or n_jobs < 0 else max(1, int(n_jobs))
         self.logger = get_logger(f"{__name__}.HypothesisTestSuite")
         
         self.logger.info(f"Initialized hypothesis test suite with alpha={alpha}")
@@ -105,7 +187,7 @@ class HypothesisTestSuite:
         self.logger.info("Testing zone duration hypothesis")
         
         try:
-            df_features = pd.DataFrame(zones_features)
+            df_features = as_feature_frame(zones_features)
             
             if 'duration' not in df_features.columns or 'price_return' not in df_features.columns:
                 raise StatisticalAnalysisError("Missing required columns: 'duration' or 'price_return'")
@@ -179,7 +261,7 @@ class HypothesisTestSuite:
         self.logger.info("Testing histogram slope hypothesis")
         
         try:
-            df_features = pd.DataFrame(zones_features)
+            df_features = as_feature_frame(zones_features)
             
             required_cols = ['hist_slope', 'duration']
             missing_cols = [col for col in required_cols if col not in df_features.columns]
@@ -248,15 +330,16 @@ class HypothesisTestSuite:
         self.logger.info("Testing bull-bear asymmetry hypothesis")
         
         try:
-            df_features = pd.DataFrame(zones_features)
+            table = ZoneFeatureTable.from_features(zones_features)
+            df_features = table.frame
             
             required_cols = ['zone_type', 'duration', 'price_return']
             missing_cols = [col for col in required_cols if col not in df_features.columns]
             if missing_cols:
                 raise StatisticalAnalysisError(f"Missing required columns: {missing_cols}")
             
-            bull_zones = df_features[df_features['zone_type'] == 'bull']
-            bear_zones = df_features[df_features['zone_type'] == 'bear']
+            bull_zones = table.by_zone_type('bull')
+            bear_zones = table.by_zone_type('bear')
             
             if len(bull_zones) == 0 or len(bear_zones) == 0:
                 raise StatisticalAnalysisError("Insufficient data: need both bull and bear zones")
@@ -336,11 +419,13 @@ class HypothesisTestSuite:
         self.logger.info("Testing sequence hypothesis")
         
         try:
-            if 'zone_type' not in zones_features[0]:
+            df_features = as_feature_frame(zones_features)
+            
+            if 'zone_type' not in df_features.columns:
                 raise StatisticalAnalysisError("Missing 'zone_type' field in zone features")
             
             # Создаем последовательность типов зон
-            zone_types = [zone['zone_type'] for zone in zones_features]
+            zone_types = df_features['zone_type'].tolist()
             
             if len(zone_types) < 3:
                 raise StatisticalAnalysisError("Need at least 3 zones for sequence analysis")
@@ -413,7 +498,7 @@ class HypothesisTestSuite:
         self.logger.info("Testing volatility hypothesis")
         
         try:
-            df_features = pd.DataFrame(zones_features)
+            df_features = as_feature_frame(zones_features, copy=True)
             
             # Определяем прокси волатильности
             if 'price_return_atr' in df_features.columns:
@@ -513,7 +598,8 @@ class HypothesisTestSuite:
         self.logger.info("Testing correlation-drawdown hypothesis")
         
         try:
-            df_features = pd.DataFrame(zones_features)
+            table = ZoneFeatureTable.from_features(zones_features)
+            df_features = table.frame
             
             required_cols = ['correlation_price_hist', 'zone_type']
             missing_cols = [col for col in required_cols if col not in df_features.columns]
@@ -522,8 +608,8 @@ class HypothesisTestSuite:
             
             # Для бычьих зон используем drawdown_from_peak
             # Для медвежьих - rally_from_trough (инвертируем для симметрии)
-            bull_zones = df_features[df_features['zone_type'] == 'bull'].copy()
-            bear_zones = df_features[df_features['zone_type'] == 'bear'].copy()
+            bull_zones = table.by_zone_type('bull')
+            bear_zones = table.by_zone_type('bear')
             
             # Проверяем наличие нужных колонок
             if 'drawdown_from_peak' not in bull_zones.columns and len(bull_zones) > 0:
@@ -534,30 +620,32 @@ class HypothesisTestSuite:
             
             # Объединяем данные для анализа
             # Для bear зон используем abs(rally_from_trough) как аналог drawdown
-            combined_data = []
+            combined_parts = []
             
             if len(bull_zones) > 0:
                 bull_clean = bull_zones[['correlation_price_hist', 'drawdown_from_peak']].dropna()
-                for _, row in bull_clean.iterrows():
-                    combined_data.append({
-                        'correlation': row['correlation_price_hist'],
-                        'drawdown': abs(row['drawdown_from_peak'])  # abs для унификации
-                    })
+                combined_parts.append(pd.DataFrame({
+                    'correlation': bull_clean['correlation_price_hist'].to_numpy(),
+                    'drawdown': bull_clean['drawdown_from_peak'].abs().to_numpy()  # abs для унификации
+                }))
             
             if len(bear_zones) > 0:
                 bear_clean = bear_zones[['correlation_price_hist', 'rally_from_trough']].dropna()
-                for _, row in bear_clean.iterrows():
-                    combined_data.append({
-                        'correlation': row['correlation_price_hist'],
-                        'drawdown': abs(row['rally_from_trough'])  # abs для унификации
-                    })
+                combined_parts.append(pd.DataFrame({
+                    'correlation': bear_clean['correlation_price_hist'].to_numpy(),
+                    'drawdown': bear_clean['rally_from_trough'].abs().to_numpy()  # abs для унификации
+                }))
+            
+            df_combined = (
+                pd.concat(combined_parts, ignore_index=True)
+                if combined_parts else pd.DataFrame(columns=['correlation', 'drawdown'])
+            )
             
-            if len(combined_data) < 10:
+            if len(df_combined) < 10:
                 raise StatisticalAnalysisError(
-                    f"Insufficient data for correlation-drawdown test (need at least 10 zones, got {len(combined_data)})"
+                    f"Insufficient data for correlation-drawdown test (need at least 10 zones, got {len(df_combined)})"
                 )
             
-            df_combined = pd.DataFrame(combined_data)
             
             # Разделяем на high_corr (>0.7) и low_corr (<0.3)
             high_corr = df_combined[df_combined['correlation'] > 0.7]
@@ -643,7 +731,7 @@ class HypothesisTestSuite:
         try:
             from statsmodels.tsa.stattools import adfuller
             
-            df_features = pd.DataFrame(zones_features)
+            df_features = as_feature_frame(zones_features)
             
             if 'duration' not in df_features.columns:
                 raise StatisticalAnalysisError("Missing 'duration' column")
@@ -742,7 +830,7 @@ class HypothesisTestSuite:
         self.logger.info("Testing support/resistance hypothesis")
         
         try:
-            df_features = pd.DataFrame(zones_features)
+            df_features = as_feature_frame(zones_features, copy=True)
             
             required_cols = ['start_price', 'duration']
             missing_cols = [col for col in required_cols if col not in df_features.columns]
@@ -757,14 +845,10 @@ class HypothesisTestSuite:
             if len(price_levels) == 0:
                 raise StatisticalAnalysisError("No price levels provided or identified")
             
-            # Для каждой зоны определяем близость к уровню
-            near_level_mask = []
-            for _, zone in df_features.iterrows():
-                start_price = zone['start_price']
-                is_near = self._is_near_level(start_price, price_levels, tolerance_pct)
-                near_level_mask.append(is_near)
-            
-            df_features['near_level'] = near_level_mask
+            # Для каждой зоны определяем близость к уровню (все зоны сразу)
+            df_features['near_level'] = self._near_level_mask(
+                df_features['start_price'].to_numpy(dtype=float), price_levels, tolerance_pct
+            )
             
             # Разделяем зоны
             near_level = df_features[df_features['near_level'] == True]
@@ -923,6 +1007,38 @@ class HypothesisTestSuite:
                 return True
         return False
     
+    @staticmethod
+    def _near_level_mask(prices: np.ndarray, levels: Iterable[float], tolerance_pct: float) -> np.ndarray:
+        """
+        Векторная версия :meth:`_is_near_level` для массива цен.
+        
+        Цена близка к уровню L, если попадает в [L(1 - t), L(1 + t)]. Для
+        положительных уровней обе границы растут вместе с L, поэтому после
+        сортировки достаточно одного ``searchsorted``: ближайший кандидат —
+        последний уровень с нижней границей не выше цены.
+        
+        Args:
+            prices: Проверяемые цены
+            levels: Список уровней
+            tolerance_pct: Допуск в процентах
+        
+        Returns:
+            Булев массив той же длины, что и prices
+        """
+        prices = np.asarray(prices, dtype=float)
+        tol = tolerance_pct / 100
+        levels = np.sort(np.asarray(list(levels), dtype=float))
+        # Для отрицательных уровней (или допуска) допуск отрицателен — совпадений нет
+        levels = levels[levels >= 0]
+        if tol < 0 or len(levels) == 0:
+            return np.zeros(len(prices), dtype=bool)
+        
+        lower = levels - levels * tol
+        upper = levels + levels * tol
+        idx = np.searchsorted(lower, prices, side='right') - 1
+        candidate = np.clip(idx, 0, None)
+        return (idx >= 0) & (prices <= upper[candidate])
+    
     def _runs_test(self, binary_sequence: List[int]) -> tuple:
         """
         Runs test для проверки случайности бинарной последовательности.
@@ -933,18 +1049,16 @@ class HypothesisTestSuite:
         Returns:
             Tuple (z_statistic, p_value)
         """
-        n = len(binary_sequence)
-        n1 = sum(binary_sequence)
+        sequence = np.asarray(binary_sequence)
+        n = len(sequence)
+        n1 = int(sequence.sum())
         n0 = n - n1
         
         if n1 == 0 or n0 == 0:
             return 0.0, 1.0
         
         # Подсчет runs (серий)
-        runs = 1
-        for i in range(1, n):
-            if binary_sequence[i] != binary_sequence[i-1]:
-                runs += 1
+        runs = 1 + int(np.count_nonzero(sequence[1:] != sequence[:-1]))
         
         # Ожидаемое количество runs
         expected_runs = (2 * n1 * n0) / n + 1
@@ -963,46 +1077,59 @@ class HypothesisTestSuite:
         
         return z, p_value
     
-    def run_all_tests(self, zones_features: List[Dict[str, Any]]) -> AnalysisResult:
+    def run_all_tests(self,
+                      zones_features: List[Dict[str, Any]],
+                      tests: Optional[List[str]] = None) -> AnalysisResult:
         """
         Выполнить все тесты гипотез.
         
+        Признаки один раз приводятся к :class:`ZoneFeatureTable`, которую
+        (вместе с общими группировками bull/bear) используют все тесты.
+        При ``n_jobs > 1`` независимые тесты выполняются в пуле потоков.
+        
         Args:
-            zones_features: Список словарей с характеристиками зон
+            zones_features: Список словарей с характеристиками зон или ZoneFeatureTable
+            tests: Имена тестов из HypothesisTestRegistry (по умолчанию — все)
         
         Returns:
             AnalysisResult с результатами всех тестов
         """
         self.logger.info("Running all hypothesis tests")
         
-        if not zones_features:
+        if zones_features is None or len(zones_features) == 0:
             raise StatisticalAnalysisError("No zone features provided")
         
-        tests = {}
+        zones_features = ZoneFeatureTable.from_features(zones_features)
         
-        # Выполняем все тесты
-        test_methods = [
-            ('zone_duration', self.test_zone_duration_hypothesis),
-            ('histogram_slope', self.test_histogram_slope_hypothesis),
-            ('bull_bear_asymmetry', self.test_bull_bear_asymmetry_hypothesis),
-            ('sequence_patterns', self.test_sequence_hypothesis),
-            ('volatility_effects', self.test_volatility_hypothesis),
-            ('correlation_drawdown', self.test_correlation_drawdown_hypothesis),
-            ('duration_stationarity', self.test_zone_duration_stationarity)
-        ]
+        test_names = HypothesisTestRegistry.list_tests() if tests is None else list(tests)
+        test_funcs = [(name, HypothesisTestRegistry.get(name)) for name in test_names]
         
-        for test_name, test_method in test_methods:
+        # Общие группировки считаются один раз до запуска потоков
+        if 'zone_type' in zones_features:
+            zones_features.by_zone_type('bull')
+            zones_features.by_zone_type('bear')
+        
+        def run_one(test_name: str, test_func: Callable) -> Dict[str, Any]:
             try:
-                result = test_method(zones_features)
-                tests[test_name] = result.to_dict()
+                return test_func(self, zones_features).to_dict()
             except Exception as e:
                 self.logger.warning(f"Test {test_name} failed: {e}")
-                tests[test_name] = {
+                return {
                     'error': str(e),
                     'test_type': test_name,
                     'significant': False
                 }
         
+        workers = min(self.n_jobs, len(test_funcs))
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [executor.submit(run_one, name, func) for name, func in test_funcs]
+                outcomes = [future.result() for future in futures]
+        else:
+            outcomes = [run_one(name, func) for name, func in test_funcs]
+        
+        tests = dict(zip(test_names, outcomes))
+        
         # Подсчет значимых результатов
         significant_count = sum(1 for test_result in tests.values() 
                               if test_result.get('significant', False))
@@ -1035,6 +1162,20 @@ class HypothesisTestSuite:
         )
 
 
+# Встроенные тесты run_all_tests (порядок = порядок результатов)
+for _name, _method, _description in [
+    ('zone_duration', 'test_zone_duration_hypothesis', 'Long vs short zones: price return'),
+    ('histogram_slope', 'test_histogram_slope_hypothesis', 'Oscillator slope vs zone duration'),
+    ('bull_bear_asymmetry', 'test_bull_bear_asymmetry_hypothesis', 'Bull vs bear zones: duration and return'),
+    ('sequence_patterns', 'test_sequence_hypothesis', 'Randomness of the zone type sequence'),
+    ('volatility_effects', 'test_volatility_hypothesis', 'Volatility proxy vs zone characteristics'),
+    ('correlation_drawdown', 'test_correlation_drawdown_hypothesis', 'Price/indicator correlation vs drawdown'),
+    ('duration_stationarity', 'test_zone_duration_stationarity', 'ADF stationarity of zone durations'),
+]:
+    HypothesisTestRegistry.register(_name, description=_description)(getattr(HypothesisTestSuite, _method))
+del _name, _method, _description
+
+
 # Удобные функции для быстрого использования
 def run_all_hypothesis_tests(zones_features: List[Dict[str, Any]], alpha: float = 0.05) -> Dict[str, Any]:
     """
@@ -1100,6 +1241,7 @@ def run_single_hypothesis_test(zones_features: List[Dict[str, Any]],
 # Экспорт
 __all__ = [
     'HypothesisTestResult',
+    'HypothesisTestRegistry',
     'HypothesisTestSuite',
     'run_all_hypothesis_tests',
     'run_single_hypothesis_test'
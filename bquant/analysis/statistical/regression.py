@@ -14,6 +14,7 @@ from datetime import datetime
 from ...core.logging_config import get_logger
 from ...core.exceptions import StatisticalAnalysisError
 from .. import BaseAnalyzer
+from ..zones.feature_table import as_feature_frame
 
 logger = get_logger(__name__)
 
@@ -118,7 +119,7 @@ class ZoneRegressionAnalyzer(BaseAnalyzer):
             from statsmodels.api import OLS, add_constant
             from statsmodels.stats.outliers_influence import variance_inflation_factor
             
-            df = pd.DataFrame(zones_features)
+            df = as_feature_frame(zones_features)
             
             # Default predictors
             if predictors is None:
@@ -257,7 +258,7 @@ class ZoneRegressionAnalyzer(BaseAnalyzer):
             from statsmodels.api import OLS, add_constant
             from statsmodels.stats.outliers_influence import variance_inflation_factor
             
-            df = pd.DataFrame(zones_features)
+            df = as_feature_frame(zones_features)
             
             # Default predictors
             if predictors is None:
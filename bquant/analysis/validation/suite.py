@@ -3,20 +3,35 @@ Validation suite for model robustness testing.
 
 Provides comprehensive validation methods including out-of-sample testing,
 walk-forward analysis, sensitivity analysis, and Monte Carlo simulation.
+
+Walk-forward windows, parameter combinations and Monte Carlo simulations are
+independent tasks: with ``n_jobs > 1`` they are fanned out over a process pool
+(the analysis function and the data are sent to each worker once), results are
+reported through ``progress_callback`` as they complete, and every simulation
+uses its own seed, so results do not depend on scheduling.
 """
 
 import pandas as pd
 import numpy as np
-from typing import Dict, Any, List, Optional, Callable
+from typing import Dict, Any, List, Optional, Callable, Iterator, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
 import itertools
+import os
+import pickle
+
+from scipy import stats
 
 from ...core.logging_config import get_logger
 from ...core.exceptions import AnalysisError
 
 logger = get_logger(__name__)
 
+# Probability of a simulation reaching the real metric below which the real
+# result is above the 95th percentile of the simulated distribution
+P95_EXCEEDANCE = 0.05
+
 
 @dataclass
 class ValidationResult:
@@ -53,6 +68,148 @@ class ValidationResult:
         }
 
 
+def _extract_metrics(analysis_result: Any) -> Dict[str, Any]:
+    """Extract a metrics dictionary from an analysis result."""
+    if isinstance(analysis_result, dict):
+        return analysis_result
+    elif hasattr(analysis_result, 'to_dict'):
+        return analysis_result.to_dict()
+    elif hasattr(analysis_result, 'results'):
+        # AnalysisResult object
+        if isinstance(analysis_result.results, dict):
+            return analysis_result.results
+        else:
+            return {'result': analysis_result.results}
+    else:
+        return {'result': str(analysis_result)}
+
+
+def _generate_synthetic_data(data: pd.DataFrame,
+                             method: str = 'returns',
+                             seed: Optional[int] = None) -> pd.DataFrame:
+    """
+    Generate synthetic data for Monte Carlo testing.
+
+    Uses a private ``RandomState(seed)`` (same stream as the legacy
+    ``np.random.seed(seed)``) so that simulations are reproducible in any
+    process and do not touch the global random state.
+    """
+    rng = np.random.RandomState(seed)
+    synthetic = data.copy()
+
+    if method == 'returns':
+        # Shuffle returns but keep structure
+        if 'close' in data.columns:
+            returns = data['close'].pct_change().dropna()
+            shuffled_returns = rng.permutation(returns.values)
+
+            # Reconstruct prices from shuffled returns
+            synthetic_close = np.cumprod(np.concatenate([[data['close'].iloc[0]], 1 + shuffled_returns]))
+
+            synthetic['close'] = synthetic_close[:len(data)]
+
+            # Update OHLC proportionally if available
+            if all(col in data.columns for col in ['open', 'high', 'low']):
+                ratio_oh = data['high'] / data['close']
+                ratio_ol = data['low'] / data['close']
+                ratio_oc = data['open'] / data['close']
+
+                synthetic['high'] = synthetic['close'] * ratio_oh
+                synthetic['low'] = synthetic['close'] * ratio_ol
+                synthetic['open'] = synthetic['close'] * ratio_oc
+
+    elif method == 'prices':
+        # Shuffle prices directly
+        if 'close' in data.columns:
+            synthetic['close'] = rng.permutation(data['close'].values)
+
+            if 'open' in data.columns:
+                synthetic['open'] = rng.permutation(data['open'].values)
+            if 'high' in data.columns:
+                synthetic['high'] = rng.permutation(data['high'].values)
+            if 'low' in data.columns:
+                synthetic['low'] = rng.permutation(data['low'].values)
+
+    elif method == 'full':
+        # Generate random walk
+        if 'close' in data.columns:
+            start_price = data['close'].iloc[0]
+            returns_std = data['close'].pct_change().std()
+
+            random_returns = rng.normal(0, returns_std, len(data))
+            synthetic['close'] = np.cumprod(np.concatenate([[start_price], 1 + random_returns[1:]]))
+
+            # Generate OHLC with noise
+            noise = rng.normal(1, 0.005, len(data))
+            synthetic['high'] = synthetic['close'] * (1 + abs(noise))
+            synthetic['low'] = synthetic['close'] * (1 - abs(noise))
+            synthetic['open'] = synthetic['close'] * noise
+
+    return synthetic
+
+
+def _simulation_seed(random_state: Optional[int], index: int) -> int:
+    """
+    Seed of one Monte Carlo simulation (depends only on its index).
+    
+    Keeps the legacy derivation ``seed = i``; ``random_state`` only offsets
+    it, so ``random_state=None`` and ``random_state=0`` reproduce the
+    simulations of earlier releases.
+    """
+    if random_state is None:
+        return index
+    return (random_state + index) % 2**32
+
+
+# --- tasks ------------------------------------------------------------------------------
+
+# (kind, key, payload): 'window' -> (start, train_end, test_end),
+# 'params' -> params dict, 'simulation' -> (seed, shuffle_method, metric_key)
+ValidationTask = Tuple[str, int, Any]
+
+_worker_state: Dict[str, Any] = {}
+
+
+def _init_worker(analyze_func: Callable, data: pd.DataFrame) -> None:
+    """Pool initializer: keep the analysis function and data for all tasks of the worker."""
+    _worker_state['analyze_func'] = analyze_func
+    _worker_state['data'] = data
+
+
+def _run_worker_task(task: ValidationTask) -> Dict[str, Any]:
+    return _execute_task(_worker_state['analyze_func'], _worker_state['data'], task)
+
+
+def _execute_task(analyze_func: Callable, data: pd.DataFrame, task: ValidationTask) -> Dict[str, Any]:
+    """Run one validation task; never raises (errors are returned)."""
+    kind, key, payload = task
+    try:
+        if kind == 'window':
+            start, train_end, test_end = payload
+            # Windows are positional slices of the shared data, not copies
+            train_metrics = _extract_metrics(analyze_func(data.iloc[start:train_end]))
+            test_metrics = _extract_metrics(analyze_func(data.iloc[train_end:test_end]))
+            return {'key': key, 'train_metrics': train_metrics, 'test_metrics': test_metrics}
+        if kind == 'params':
+            return {'key': key, 'metrics': _extract_metrics(analyze_func(data, **payload))}
+        if kind == 'simulation':
+            seed, shuffle_method, metric_key = payload
+            synthetic_data = _generate_synthetic_data(data, shuffle_method, seed=seed)
+            metrics = _extract_metrics(analyze_func(synthetic_data))
+            return {'key': key, 'value': metrics.get(metric_key, 0)}
+        raise ValueError(f"Unknown validation task: {kind}")
+    except Exception as e:  # noqa: BLE001 - reported to the caller
+        return {'key': key, 'error': f"{type(e).__name__}: {e}"}
+
+
+def _exceedance_bounds(exceed: int, total: int, confidence: float) -> Tuple[float, float]:
+    """Clopper-Pearson interval for P(simulated metric >= real metric)."""
+    tail = (1 - confidence) / 2
+    lower = stats.beta.ppf(tail, exceed, total - exceed + 1) if exceed > 0 else 0.0
+    upper = stats.beta.ppf(1 - tail, exceed + 1, total - exceed) if exceed < total else 1.0
+    return float(lower), float(upper)
+
+
 class ValidationSuite:
     """
     Suite of validation methods for model robustness testing.
@@ -64,20 +221,88 @@ class ValidationSuite:
     - Monte Carlo simulation (random data testing)
     """
     
-    def __init__(self, degradation_threshold: float = 0.2):
+    def __init__(self,
+                 degradation_threshold: float = 0.2,
+                 n_jobs: Optional[int] = 1,
+                 mp_context=None):
         """
         Initialize validation suite.
         
         Args:
             degradation_threshold: Maximum acceptable degradation (0.2 = 20%)
+            n_jobs: Worker processes for walk-forward, sensitivity and Monte Carlo
+                tasks (1 = serial, -1 or None = all CPUs). The analysis function
+                must be picklable (module-level function or partial) to run in
+                parallel; otherwise the suite falls back to serial execution.
+            mp_context: multiprocessing context for the process pool
         """
         self.degradation_threshold = degradation_threshold
+        self.n_jobs = self._resolve_n_jobs(n_jobs)
+        self.mp_context = mp_context
         self.logger = get_logger(f"{__name__}.ValidationSuite")
         
         self.logger.info(
             f"Initialized validation suite with degradation_threshold={degradation_threshold}"
         )
     
+    @staticmethod
+    def _resolve_n_jobs(n_jobs: Optional[int]) -> int:
+        cpus = os.cpu_count() or 1
+        if n_jobs is None or n_jobs < 0:
+            return cpus
+        return max(1, int(n_jobs))
+    
+    def _iter_tasks(self,
+                    analyze_func: Callable,
+                    data: pd.DataFrame,
+                    tasks: List[ValidationTask]) -> Iterator[Dict[str, Any]]:
+        """
+        Execute tasks serially or on a process pool.
+        
+        Yields task outcomes in completion order. Closing the generator (e.g. on
+        early stopping) cancels tasks that have not started yet.
+        """
+        workers = min(self.n_jobs, len(tasks))
+        if workers > 1:
+            try:
+                pickle.dumps(analyze_func)
+            except Exception as e:  # noqa: BLE001 - lambdas, closures, bound local objects
+                self.logger.warning(
+                    f"analyze_func is not picklable ({type(e).__name__}); running {len(tasks)} tasks serially"
+                )
+                workers = 1
+        
+        if workers <= 1:
+            for task in tasks:
+                yield _execute_task(analyze_func, data, task)
+            return
+        
+        executor = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=self.mp_context,
+            initializer=_init_worker,
+            initargs=(analyze_func, data),
+        )
+        pending = iter(tasks)
+        in_flight = set()
+        try:
+            while True:
+                # Bounded submission keeps cancellation cheap on early stopping
+                for task in itertools.islice(pending, 2 * workers - len(in_flight)):
+                    in_flight.add(executor.submit(_run_worker_task, task))
+                if not in_flight:
+                    break
+                done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+    
+    @staticmethod
+    def _report(progress_callback: Optional[Callable[[Dict[str, Any]], None]], **event: Any) -> None:
+        if progress_callback is not None:
+            progress_callback(event)
+    
     def out_of_sample_test(self,
                           analyze_func: Callable,
                           data: pd.DataFrame,
@@ -166,20 +391,26 @@ class ValidationSuite:
                          train_window: int = 1000,
                          test_window: int = 200,
                          step_size: int = 100,
-                         metric_key: str = 'total_zones') -> ValidationResult:
+                         metric_key: str = 'total_zones',
+                         progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None) -> ValidationResult:
         """
         Walk-forward validation using rolling windows.
         
         Simulates real trading: train on [0:N], test on [N:N+M],
         retrain on [0:N+step], test on [N+step:N+step+M], etc.
+        Windows are independent and run on ``n_jobs`` workers.
         
         Args:
-            analyze_func: Analysis function to validate
+            analyze_func: Analysis function to validate. Windows are passed
+                as ``iloc`` slices of ``data`` without copying, so the function
+                must not modify its input in place
             data: Full dataset
             train_window: Training window size (bars)
             test_window: Test window size (bars)
             step_size: Step size for rolling window
             metric_key: Key metric to track
+            progress_callback: Called with a dict per completed window
+                (``completed``, ``total``, ``iteration``, ``train_metric``, ``test_metric``)
         
         Returns:
             ValidationResult with results across all iterations
@@ -196,43 +427,51 @@ class ValidationSuite:
                     f"{train_window + test_window} bars, got {len(data)}"
                 )
             
+            # Rolling windows
+            windows = [
+                (iteration, start_idx, start_idx + train_window, start_idx + train_window + test_window)
+                for iteration, start_idx in enumerate(
+                    range(0, len(data) - train_window - test_window + 1, step_size)
+                )
+            ]
+            tasks = [('window', iteration, (start, train_end, test_end))
+                     for iteration, start, train_end, test_end in windows]
+            
+            outcomes = {}
+            for outcome in self._iter_tasks(analyze_func, data, tasks):
+                if 'error' in outcome:
+                    raise AnalysisError(f"Window {outcome['key']} failed: {outcome['error']}")
+                outcomes[outcome['key']] = outcome
+                self._report(
+                    progress_callback,
+                    validation_type='walk_forward',
+                    completed=len(outcomes),
+                    total=len(tasks),
+                    iteration=outcome['key'],
+                    train_metric=outcome['train_metrics'].get(metric_key, 0),
+                    test_metric=outcome['test_metrics'].get(metric_key, 0),
+                )
+            
             iterations = []
             train_results = []
             test_results = []
             
-            # Rolling window analysis
-            start_idx = 0
-            iteration = 0
-            
-            while start_idx + train_window + test_window <= len(data):
-                train_end = start_idx + train_window
-                test_end = train_end + test_window
-                
-                train_data = data.iloc[start_idx:train_end].copy()
-                test_data = data.iloc[train_end:test_end].copy()
-                
-                # Run analysis
-                train_result = analyze_func(train_data)
-                test_result = analyze_func(test_data)
-                
-                train_metrics = self._extract_metrics(train_result)
-                test_metrics = self._extract_metrics(test_result)
+            for iteration, start, train_end, test_end in windows:
+                train_metrics = outcomes[iteration]['train_metrics']
+                test_metrics = outcomes[iteration]['test_metrics']
                 
                 train_results.append(train_metrics)
                 test_results.append(test_metrics)
                 
                 iterations.append({
                     'iteration': iteration,
-                    'train_start': start_idx,
+                    'train_start': start,
                     'train_end': train_end,
                     'test_start': train_end,
                     'test_end': test_end,
                     'train_metrics': train_metrics,
                     'test_metrics': test_metrics
                 })
-                
-                start_idx += step_size
-                iteration += 1
             
             if not iterations:
                 raise AnalysisError("No iterations completed in walk-forward test")
@@ -255,6 +494,7 @@ class ValidationSuite:
                 'avg_test_metric': avg_test_metric,
                 'std_train_metric': np.std([m.get(metric_key, 0) for m in train_results]),
                 'std_test_metric': np.std([m.get(metric_key, 0) for m in test_results]),
+                'n_jobs': self.n_jobs,
                 'timestamp': datetime.now().isoformat()
             }
             
@@ -283,7 +523,8 @@ class ValidationSuite:
                            analyze_func: Callable,
                            data: pd.DataFrame,
                            param_ranges: Dict[str, List[Any]],
-                           metric_key: str = 'total_zones') -> ValidationResult:
+                           metric_key: str = 'total_zones',
+                           progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None) -> ValidationResult:
         """
         Sensitivity analysis for parameter variations.
         
@@ -295,6 +536,8 @@ class ValidationSuite:
             param_ranges: Parameter ranges to test, e.g.:
                          {'macd_fast': [10, 12, 14], 'min_duration': [2, 3, 5]}
             metric_key: Key metric to track
+            progress_callback: Called with a dict per completed combination
+                (``completed``, ``total``, ``params``, ``metric_value``)
         
         Returns:
             ValidationResult with results for all parameter combinations
@@ -312,33 +555,45 @@ class ValidationSuite:
             
             self.logger.info(f"Testing {len(combinations)} parameter combinations")
             
+            tasks = [('params', i, dict(zip(param_names, combo))) for i, combo in enumerate(combinations)]
+            outcomes = {}
+            
+            for outcome in self._iter_tasks(analyze_func, data, tasks):
+                outcomes[outcome['key']] = outcome
+                params = tasks[outcome['key']][2]
+                if 'error' in outcome:
+                    self.logger.warning(f"Failed for params {params}: {outcome['error']}")
+                self._report(
+                    progress_callback,
+                    validation_type='sensitivity_analysis',
+                    completed=len(outcomes),
+                    total=len(tasks),
+                    params=params,
+                    metric_value=outcome['metrics'].get(metric_key, 0) if 'metrics' in outcome else None,
+                )
+            
             results = []
             metrics = []
             
-            for combo in combinations:
-                params = dict(zip(param_names, combo))
-                
-                try:
-                    # Run analysis with these parameters
-                    result = analyze_func(data, **params)
-                    result_metrics = self._extract_metrics(result)
-                    
-                    results.append({
-                        'params': params,
-                        'metrics': result_metrics,
-                        'metric_value': result_metrics.get(metric_key, 0)
-                    })
-                    
-                    metrics.append(result_metrics.get(metric_key, 0))
-                    
-                except Exception as e:
-                    self.logger.warning(f"Failed for params {params}: {e}")
+            for _, key, params in tasks:
+                outcome = outcomes[key]
+                if 'error' in outcome:
                     results.append({
                         'params': params,
                         'metrics': None,
                         'metric_value': None,
-                        'error': str(e)
+                        'error': outcome['error']
                     })
+                    continue
+                
+                result_metrics = outcome['metrics']
+                results.append({
+                    'params': params,
+                    'metrics': result_metrics,
+                    'metric_value': result_metrics.get(metric_key, 0)
+                })
+                
+                metrics.append(result_metrics.get(metric_key, 0))
             
             if not metrics:
                 raise AnalysisError("No successful parameter combinations")
@@ -401,12 +656,18 @@ class ValidationSuite:
                         data: pd.DataFrame,
                         n_simulations: int = 1000,
                         metric_key: str = 'total_zones',
-                        shuffle_method: str = 'returns') -> ValidationResult:
+                        shuffle_method: str = 'returns',
+                        random_state: Optional[int] = None,
+                        early_stopping: bool = False,
+                        confidence: float = 0.99,
+                        min_simulations: int = 100,
+                        progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None) -> ValidationResult:
         """
         Monte Carlo test using random data simulations.
         
         Generates synthetic data with shuffled prices to test if strategy
-        performs better than on random data.
+        performs better than on random data. Simulations run on ``n_jobs``
+        workers; simulation ``i`` always uses the same seed.
         
         Args:
             analyze_func: Analysis function to test
@@ -417,6 +678,16 @@ class ValidationSuite:
                           'returns' - shuffle returns
                           'prices' - shuffle prices
                           'full' - completely random walk
+            random_state: Offset of the per-simulation seeds: simulation ``i``
+                uses seed ``random_state + i`` (None = seed ``i``, as before)
+            early_stopping: Stop once the p95 test is statistically decided:
+                the Clopper-Pearson interval of P(simulated >= real) lies
+                entirely below or above 5%
+            confidence: Confidence level of that interval
+            min_simulations: Simulations completed before early stopping is considered
+            progress_callback: Called with a dict per completed simulation
+                (``completed``, ``total``, ``simulation``, ``metric_value``,
+                ``exceedance_bounds``)
         
         Returns:
             ValidationResult comparing real vs random data performance
@@ -435,20 +706,55 @@ class ValidationSuite:
             real_metrics = self._extract_metrics(real_result)
             real_metric_value = real_metrics.get(metric_key, 0)
             
+            tasks = [
+                ('simulation', i, (_simulation_seed(random_state, i), shuffle_method, metric_key))
+                for i in range(n_simulations)
+            ]
+            
             # Run simulations
-            simulation_metrics = []
+            simulation_values = {}
+            completed = 0
+            exceed = 0
+            bounds = (0.0, 1.0)
+            stopped_early = False
+            
+            outcomes = self._iter_tasks(analyze_func, data, tasks)
+            try:
+                for outcome in outcomes:
+                    completed += 1
+                    if 'error' in outcome:
+                        self.logger.warning(f"Simulation {outcome['key']} failed: {outcome['error']}")
+                    else:
+                        simulation_values[outcome['key']] = outcome['value']
+                        exceed += outcome['value'] >= real_metric_value
+                        bounds = _exceedance_bounds(exceed, len(simulation_values), confidence)
+                    
+                    self._report(
+                        progress_callback,
+                        validation_type='monte_carlo',
+                        completed=completed,
+                        total=n_simulations,
+                        simulation=outcome['key'],
+                        metric_value=outcome.get('value'),
+                        exceedance_bounds=bounds,
+                    )
+                    
+                    if (early_stopping
+                            and len(simulation_values) >= min_simulations
+                            and (bounds[1] < P95_EXCEEDANCE or bounds[0] > P95_EXCEEDANCE)):
+                        stopped_early = completed < n_simulations
+                        break
+            finally:
+                outcomes.close()
+            
+            if stopped_early:
+                self.logger.info(
+                    f"Monte Carlo decided after {completed}/{n_simulations} simulations "
+                    f"(exceedance in [{bounds[0]:.4f}, {bounds[1]:.4f}])"
+                )
             
-            for i in range(n_simulations):
-                # Generate synthetic data
-                synthetic_data = self._generate_synthetic_data(data, shuffle_method, seed=i)
-                
-                try:
-                    sim_result = analyze_func(synthetic_data)
-                    sim_metrics = self._extract_metrics(sim_result)
-                    simulation_metrics.append(sim_metrics.get(metric_key, 0))
-                except Exception as e:
-                    self.logger.warning(f"Simulation {i} failed: {e}")
-                    continue
+            # Simulation order does not depend on completion order
+            simulation_metrics = [simulation_values[key] for key in sorted(simulation_values)]
             
             if len(simulation_metrics) < 10:
                 raise AnalysisError(
@@ -481,6 +787,11 @@ class ValidationSuite:
                 'percentile_real': percentile,
                 'z_score': (real_metric_value - sim_mean) / sim_std if sim_std > 0 else 0,
                 'p95_threshold': np.percentile(simulation_metrics, 95),
+                'random_state': random_state,
+                'completed_simulations': completed,
+                'stopped_early': stopped_early,
+                'exceedance_bounds': bounds,
+                'n_jobs': self.n_jobs,
                 'timestamp': datetime.now().isoformat()
             }
             
@@ -516,18 +827,7 @@ class ValidationSuite:
         Returns:
             Dictionary of extracted metrics
         """
-        if isinstance(analysis_result, dict):
-            return analysis_result
-        elif hasattr(analysis_result, 'to_dict'):
-            return analysis_result.to_dict()
-        elif hasattr(analysis_result, 'results'):
-            # AnalysisResult object
-            if isinstance(analysis_result.results, dict):
-                return analysis_result.results
-            else:
-                return {'result': analysis_result.results}
-        else:
-            return {'result': str(analysis_result)}
+        return _extract_metrics(analysis_result)
     
     def _calculate_degradation(self, train_metric: float, test_metric: float) -> float:
         """
@@ -560,67 +860,7 @@ class ValidationSuite:
         Returns:
             Synthetic DataFrame with same structure as original
         """
-        if seed is not None:
-            np.random.seed(seed)
-        
-        synthetic = data.copy()
-        
-        if method == 'returns':
-            # Shuffle returns but keep structure
-            if 'close' in data.columns:
-                returns = data['close'].pct_change().dropna()
-                shuffled_returns = np.random.permutation(returns.values)
-                
-                # Reconstruct prices from shuffled returns
-                synthetic_close = [data['close'].iloc[0]]
-                for ret in shuffled_returns:
-                    synthetic_close.append(synthetic_close[-1] * (1 + ret))
-                
-                synthetic['close'] = synthetic_close[:len(data)]
-                
-                # Update OHLC proportionally if available
-                if all(col in data.columns for col in ['open', 'high', 'low']):
-                    ratio_oh = data['high'] / data['close']
-                    ratio_ol = data['low'] / data['close']
-                    ratio_oc = data['open'] / data['close']
-                    
-                    synthetic['high'] = synthetic['close'] * ratio_oh
-                    synthetic['low'] = synthetic['close'] * ratio_ol
-                    synthetic['open'] = synthetic['close'] * ratio_oc
-                    
-        elif method == 'prices':
-            # Shuffle prices directly
-            if 'close' in data.columns:
-                synthetic['close'] = np.random.permutation(data['close'].values)
-                
-                if 'open' in data.columns:
-                    synthetic['open'] = np.random.permutation(data['open'].values)
-                if 'high' in data.columns:
-                    synthetic['high'] = np.random.permutation(data['high'].values)
-                if 'low' in data.columns:
-                    synthetic['low'] = np.random.permutation(data['low'].values)
-                    
-        elif method == 'full':
-            # Generate random walk
-            if 'close' in data.columns:
-                start_price = data['close'].iloc[0]
-                returns_std = data['close'].pct_change().std()
-                
-                random_returns = np.random.normal(0, returns_std, len(data))
-                synthetic_close = [start_price]
-                
-                for ret in random_returns[1:]:
-                    synthetic_close.append(synthetic_close[-1] * (1 + ret))
-                
-                synthetic['close'] = synthetic_close
-                
-                # Generate OHLC with noise
-                noise = np.random.normal(1, 0.005, len(data))
-                synthetic['high'] = synthetic['close'] * (1 + abs(noise))
-                synthetic['low'] = synthetic['close'] * (1 - abs(noise))
-                synthetic['open'] = synthetic['close'] * noise
-        
-        return synthetic
+        return _generate_synthetic_data(data, method, seed=seed)
     
     def _validate_result(self, result: ValidationResult) -> bool:
         """
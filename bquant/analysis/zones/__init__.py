@@ -541,6 +541,32 @@ except ImportError as e:
     logger.warning(f"Zone analysis pipeline not available: {e}")
     _pipeline_available = False
 
+# Импорт пакетного запуска pipeline в пуле процессов
+try:
+    from .batch import (
+        BatchJob,
+        BatchJobResult,
+        ZoneBatchRunner,
+        run_zone_analysis_batch
+    )
+    _batch_available = True
+    logger.debug("Zone batch runner loaded successfully")
+except ImportError as e:
+    logger.warning(f"Zone batch runner not available: {e}")
+    _batch_available = False
+
+# Импорт инкрементального (потокового) pipeline
+try:
+    from .incremental import (
+        IncrementalUpdate,
+        IncrementalZonePipeline
+    )
+    _incremental_available = True
+    logger.debug("Incremental zone pipeline loaded successfully")
+except ImportError as e:
+    logger.warning(f"Incremental zone pipeline not available: {e}")
+    _incremental_available = False
+
 # Импорт Convenience Presets (новая архитектура - Stage 2.2)
 try:
     from .presets import (
@@ -563,6 +589,8 @@ try:
         analyze_zones_distribution,
         extract_zone_features
     )
+    from .batch_features import ZoneSegments, compute_zone_base_features
+    from .feature_table import ZoneFeatureTable, as_feature_frame
     _zone_features_available = True
     logger.debug("Zone features module loaded successfully")
 except ImportError as e:
@@ -630,13 +658,33 @@ if _pipeline_available:
         'analyze_zones'
     ])
 
+# Добавляем batch runner если доступен
+if _batch_available:
+    __all__.extend([
+        'BatchJob',
+        'BatchJobResult',
+        'ZoneBatchRunner',
+        'run_zone_analysis_batch'
+    ])
+
+# Добавляем инкрементальный pipeline если доступен
+if _incremental_available:
+    __all__.extend([
+        'IncrementalUpdate',
+        'IncrementalZonePipeline'
+    ])
+
 # Добавляем zone features если доступен
 if _zone_features_available:
     __all__.extend([
         'ZoneFeatures',
         'ZoneFeaturesAnalyzer',
         'analyze_zones_distribution',
-        'extract_zone_features'
+        'extract_zone_features',
+        'ZoneSegments',
+        'compute_zone_base_features',
+        'ZoneFeatureTable',
+        'as_feature_frame'
     ])
 
 # Добавляем sequence analysis если доступен  
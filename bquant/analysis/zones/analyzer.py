@@ -9,15 +9,27 @@ Universal Zone Analyzer
 - Чистая координация без адаптеров
 """
 
-from typing import List, Optional, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Callable, List, Optional, Dict, Any
 import pandas as pd
 from datetime import datetime
 
 from .models import ZoneInfo, ZoneAnalysisResult
+from .feature_table import ZoneFeatureTable
 from bquant.core.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Терминальные стадии анализа (поля ZoneAnalysisResult), независимые друг от друга
+ANALYSIS_STAGES = (
+    'statistics',
+    'hypothesis_tests',
+    'sequence_analysis',
+    'clustering',
+    'regression_results',
+)
+
 
 class UniversalZoneAnalyzer:
     """
@@ -56,7 +68,8 @@ class UniversalZoneAnalyzer:
                  shape_strategy=None,
                  divergence_strategy=None,
                  volatility_strategy=None,
-                 volume_strategy=None):
+                 volume_strategy=None,
+                 n_jobs: Optional[int] = 1):
         """
         Инициализация с Dependency Injection.
         
@@ -71,6 +84,8 @@ class UniversalZoneAnalyzer:
             divergence_strategy: Стратегия для divergence анализа (передается в features_analyzer)
             volatility_strategy: Стратегия для volatility анализа (передается в features_analyzer)
             volume_strategy: Стратегия для volume анализа (передается в features_analyzer)
+            n_jobs: Потоки для независимых терминальных стадий
+                (1 = последовательно, по умолчанию; None = по одному на стадию)
         """
         self.logger = logger
         
@@ -116,6 +131,7 @@ class UniversalZoneAnalyzer:
         self.sequences = sequence_analyzer
         self.regression = regression_analyzer
         self.validation = validation_suite
+        self.n_jobs = None if n_jobs is None or n_jobs < 1 else int(n_jobs)
         
         self.logger.info("UniversalZoneAnalyzer initialized with DI components")
     
@@ -125,7 +141,8 @@ class UniversalZoneAnalyzer:
                       perform_clustering: bool = True,
                       n_clusters: int = 3,
                       run_regression: bool = False,
-                      run_validation: bool = False) -> ZoneAnalysisResult:
+                      run_validation: bool = False,
+                      zones_features: Optional[List[Any]] = None) -> ZoneAnalysisResult:
         """
         Анализ готовых зон.
         
@@ -138,6 +155,9 @@ class UniversalZoneAnalyzer:
             n_clusters: Количество кластеров
             run_regression: Выполнять ли регрессионный анализ
             run_validation: Выполнять ли валидацию
+            zones_features: Уже извлеченные признаки зон (ZoneFeatures или
+                ZoneFeatureTable); если заданы, извлечение признаков пропускается
+                (инкрементальный режим)
             
         Returns:
             ZoneAnalysisResult с полными результатами анализа
@@ -148,42 +168,131 @@ class UniversalZoneAnalyzer:
         self.logger.info(f"Starting analysis of {len(zones)} zones")
         
         # 1. Извлечение признаков (БЕЗ адаптеров!)
-        zones_features = self.features.extract_all_zones_features(zones)
+        if zones_features is None:
+            zones_features = self.features.extract_all_zones_features(zones)
+            
+            # ✅ v2.1 FIX: Write features back to ZoneInfo for convenient access
+            # This makes features immediately available in zone.features dict
+            for zone, features in zip(zones, zones_features):
+                zone.features = features.to_dict()
         
-        # ✅ v2.1 FIX: Write features back to ZoneInfo for convenient access
-        # This makes features immediately available in zone.features dict
-        for zone, features in zip(zones, zones_features):
-            zone.features = features.to_dict()
+        # Колоночная таблица признаков: строится один раз, используется всеми стадиями
+        feature_table = ZoneFeatureTable.from_features(zones_features)
         
-        # 2. Статистический анализ
-        statistics = self.features.analyze_zones_distribution([f.to_dict() for f in zones_features])
+        # 2-6. Статистика, гипотезы, последовательности, кластеризация, регрессия
+        stages = self.analysis_stages(
+            len(zones),
+            perform_clustering=perform_clustering,
+            n_clusters=n_clusters,
+            run_regression=run_regression,
+        )
+        stage_results = self.run_analysis_stages(feature_table, stages)
         
-        # 3. Тестирование гипотез
-        hypothesis_tests = self.hypotheses.run_all_tests([f.to_dict() for f in zones_features])
+        return self.assemble_result(zones, data, stage_results, run_validation=run_validation)
+    
+    def analysis_stages(self,
+                        n_zones: int,
+                        perform_clustering: bool = True,
+                        n_clusters: int = 3,
+                        run_regression: bool = False) -> Dict[str, Callable[[ZoneFeatureTable], Any]]:
+        """
+        Терминальные стадии анализа, применимые к ``n_zones`` зонам.
         
-        # 4. Анализ последовательностей (требует минимум 3 зоны)
-        sequence_analysis = None
-        if len(zones_features) >= 3:
-            try:
-                sequence_analysis = self.sequences.analyze_zone_transitions(zones_features)
-            except Exception as e:
-                self.logger.error(f"Failed to perform sequence analysis: {e}")
-                sequence_analysis = {'error': str(e)}
-        
-        # 5. Кластеризация (опционально)
-        clustering = None
-        if perform_clustering and len(zones) >= n_clusters:
-            clustering = self.sequences.cluster_zones(zones_features, n_clusters=n_clusters)
-            self.logger.info(f"Performed clustering: {n_clusters} clusters")
-        
-        # 6. Регрессия (опционально)
-        regression_results = None
-        if run_regression and self.regression and len(zones) > 10:
-            regression_results = {
-                'duration': self.regression.predict_zone_duration([f.to_dict() for f in zones_features]),
-                'return': self.regression.predict_price_return([f.to_dict() for f in zones_features])
-            }
-            self.logger.info("Performed regression analysis")
+        Стадии независимы друг от друга: каждая получает только таблицу
+        признаков. Имена совпадают с полями :class:`ZoneAnalysisResult`
+        (см. :data:`ANALYSIS_STAGES`).
+        
+        Args:
+            n_zones: Количество зон
+            perform_clustering: Выполнять ли кластеризацию
+            n_clusters: Количество кластеров
+            run_regression: Выполнять ли регрессионный анализ
+        
+        Returns:
+            Словарь ``имя стадии -> функция(feature_table)``
+        """
+        stages: Dict[str, Callable[[ZoneFeatureTable], Any]] = {
+            'statistics': self.features.analyze_zones_distribution,
+            'hypothesis_tests': self.hypotheses.run_all_tests,
+        }
+        # Анализ последовательностей требует минимум 3 зоны
+        if n_zones >= 3:
+            stages['sequence_analysis'] = self._sequence_stage
+        if perform_clustering and n_zones >= n_clusters:
+            stages['clustering'] = partial(self._clustering_stage, n_clusters=n_clusters)
+        if run_regression and self.regression and n_zones > 10:
+            stages['regression_results'] = self._regression_stage
+        return stages
+    
+    def run_analysis_stages(self,
+                            feature_table: ZoneFeatureTable,
+                            stages: Dict[str, Callable[[ZoneFeatureTable], Any]]) -> Dict[str, Any]:
+        """
+        Выполнить независимые стадии над одной таблицей признаков.
+        
+        По умолчанию (``n_jobs=1``) стадии выполняются последовательно.
+        При ``n_jobs != 1`` стадии выполняются в пуле потоков (расчеты идут
+        в numpy/scipy/sklearn, которые отпускают GIL); исключение стадии
+        пробрасывается вызывающему коду.
+        
+        Returns:
+            Словарь ``имя стадии -> результат``
+        """
+        # Общие группировки считаются один раз до запуска потоков
+        if 'zone_type' in feature_table:
+            feature_table.by_zone_type('bull')
+            feature_table.by_zone_type('bear')
+        
+        workers = min(self.n_jobs or len(stages), len(stages))
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = {name: executor.submit(stage, feature_table) for name, stage in stages.items()}
+                return {name: future.result() for name, future in futures.items()}
+        return {name: stage(feature_table) for name, stage in stages.items()}
+    
+    def _sequence_stage(self, feature_table: ZoneFeatureTable) -> Any:
+        try:
+            return self.sequences.analyze_zone_transitions(feature_table)
+        except Exception as e:
+            self.logger.error(f"Failed to perform sequence analysis: {e}")
+            return {'error': str(e)}
+    
+    def _clustering_stage(self, feature_table: ZoneFeatureTable, n_clusters: int) -> Any:
+        clustering = self.sequences.cluster_zones(feature_table, n_clusters=n_clusters)
+        self.logger.info(f"Performed clustering: {n_clusters} clusters")
+        return clustering
+    
+    def _regression_stage(self, feature_table: ZoneFeatureTable) -> Dict[str, Any]:
+        regression_results = {
+            'duration': self.regression.predict_zone_duration(feature_table),
+            'return': self.regression.predict_price_return(feature_table)
+        }
+        self.logger.info("Performed regression analysis")
+        return regression_results
+    
+    def assemble_result(self,
+                        zones: List[ZoneInfo],
+                        data: pd.DataFrame,
+                        stage_results: Dict[str, Any],
+                        run_validation: bool = False) -> ZoneAnalysisResult:
+        """
+        Собрать ZoneAnalysisResult из результатов стадий.
+        
+        Args:
+            zones: Проанализированные зоны
+            data: Исходный DataFrame (метаданные берутся из ``data.attrs``)
+            stage_results: Результаты :meth:`run_analysis_stages`; отсутствующие
+                стадии считаются невыполненными
+            run_validation: Запрошена ли валидация
+        
+        Returns:
+            ZoneAnalysisResult
+        """
+        statistics = stage_results.get('statistics')
+        hypothesis_tests = stage_results.get('hypothesis_tests')
+        sequence_analysis = stage_results.get('sequence_analysis')
+        clustering = stage_results.get('clustering')
+        regression_results = stage_results.get('regression_results')
         
         # 7. Валидация (опционально)
         validation_results = None
@@ -255,6 +364,7 @@ class UniversalZoneAnalyzer:
 
 # Экспорт
 __all__ = [
+    'ANALYSIS_STAGES',
     'UniversalZoneAnalyzer'
 ]
 
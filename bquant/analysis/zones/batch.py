@@ -0,0 +1,456 @@
+"""
+Пакетный запуск ZoneAnalysisPipeline в пуле процессов.
+
+Анализ зон - CPU-bound код pandas/scipy, поэтому потоки упираются в GIL.
+:class:`ZoneBatchRunner` раздает задания ``(DataFrame | путь, ZoneAnalysisConfig)``
+по ``ProcessPoolExecutor``: числовые колонки OHLCV передаются воркерам через
+``multiprocessing.shared_memory`` (без pickle фреймов), результаты возвращаются
+по мере готовности, у каждого задания свои тайминги, а ошибка одного задания
+не останавливает остальные.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+import traceback
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from multiprocessing import shared_memory
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from bquant.core.logging_config import get_logger
+
+from .models import ZoneAnalysisResult
+from .pipeline import ZoneAnalysisConfig
+
+logger = get_logger(__name__)
+
+_ALIGNMENT = 64
+
+
+@dataclass
+class BatchJob:
+    """One pipeline run in a batch.
+
+    Attributes:
+        source: OHLCV DataFrame or path to a CSV file (loaded inside the worker
+            with :func:`bquant.data.loader.load_ohlcv_data`).
+        config: Pipeline configuration.
+        job_id: Identifier reported back in :class:`BatchJobResult`
+            (defaults to the file name or ``job_<n>``).
+        strategies: Keyword arguments for :class:`UniversalZoneAnalyzer`
+            (``swing_strategy='find_peaks'`` etc.), the batch counterpart of
+            ``ZoneAnalysisBuilder.with_strategies()``.
+        swing_preset: Optional swing preset applied to the pipeline.
+        load_kwargs: Extra arguments for ``load_ohlcv_data`` (``symbol``,
+            ``timeframe``, ``validate_data``) when ``source`` is a path.
+    """
+    source: Union[pd.DataFrame, str, Path]
+    config: ZoneAnalysisConfig
+    job_id: Optional[str] = None
+    strategies: Dict[str, Any] = field(default_factory=dict)
+    swing_preset: Optional[str] = None
+    load_kwargs: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class BatchJobResult:
+    """Outcome of one :class:`BatchJob`.
+
+    Attributes:
+        job_id: Identifier of the job.
+        success: Whether the pipeline finished without raising.
+        result: Pipeline result for successful jobs.
+        error: ``"ExceptionType: message"`` for failed jobs.
+        traceback: Formatted traceback from the worker (if available).
+        timings: Seconds spent per phase: ``load`` and ``analysis`` (measured
+            in the worker), ``total`` (worker) and ``wall`` (submission to
+            completion as seen by the runner).
+        worker_pid: PID of the worker process that ran the job.
+    """
+    job_id: str
+    success: bool
+    result: Optional[ZoneAnalysisResult] = None
+    error: Optional[str] = None
+    traceback: Optional[str] = None
+    timings: Dict[str, float] = field(default_factory=dict)
+    worker_pid: Optional[int] = None
+
+    @property
+    def duration(self) -> Optional[float]:
+        """Worker-side run time of the job in seconds."""
+        return self.timings.get('total')
+
+
+# --- shared memory transport ---------------------------------------------------------
+
+@dataclass
+class SharedFrameSpec:
+    """Picklable description of a DataFrame laid out in a shared memory block.
+
+    Fixed-width columns (numeric, bool, naive datetime) and a datetime/numeric
+    index live in the block; any other columns travel in ``extra``.
+    """
+    shm_name: str
+    n_rows: int
+    columns: List[Tuple[str, str, int]]
+    column_order: List[Any]
+    index: Optional[Tuple[Any, str, int, Optional[str], Optional[str]]] = None
+    pickled_index: Optional[pd.Index] = None
+    extra: Optional[pd.DataFrame] = None
+    attrs: Dict[str, Any] = field(default_factory=dict)
+
+
+def _is_fixed_width(dtype) -> bool:
+    return isinstance(dtype, np.dtype) and dtype.kind in 'biufcmM'
+
+
+def share_frame(df: pd.DataFrame) -> Tuple[shared_memory.SharedMemory, SharedFrameSpec]:
+    """Copy the fixed-width columns of ``df`` into a new shared memory block.
+
+    The caller owns the returned block and must ``close()`` and ``unlink()``
+    it once the consumer has attached (see :func:`attach_frame`).
+    """
+    arrays: List[Tuple[Any, np.ndarray]] = []
+    extra_cols = []
+    for name in df.columns:
+        column = df[name]
+        if _is_fixed_width(column.dtype):
+            arrays.append((name, np.ascontiguousarray(column.to_numpy())))
+        else:
+            extra_cols.append(name)
+
+    index_array = None
+    index_tz = None
+    index_freq = None
+    if isinstance(df.index, pd.DatetimeIndex):
+        naive = df.index.tz_convert('UTC').tz_localize(None) if df.index.tz is not None else df.index
+        index_array = np.ascontiguousarray(naive.to_numpy())
+        index_tz = str(df.index.tz) if df.index.tz is not None else None
+        index_freq = df.index.freqstr
+    elif not isinstance(df.index, pd.RangeIndex) and _is_fixed_width(df.index.dtype):
+        index_array = np.ascontiguousarray(df.index.to_numpy())
+
+    layout = []
+    offset = 0
+    for name, values in arrays:
+        layout.append((name, values.dtype.str, offset))
+        offset += -(-values.nbytes // _ALIGNMENT) * _ALIGNMENT
+    index_offset = offset
+    if index_array is not None:
+        offset += index_array.nbytes
+
+    shm = shared_memory.SharedMemory(create=True, size=max(offset, 1))
+    for (name, values), (_, dtype, start) in zip(arrays, layout):
+        np.ndarray(values.shape, dtype=values.dtype, buffer=shm.buf, offset=start)[:] = values
+
+    index_spec = None
+    pickled_index = None
+    if index_array is not None:
+        np.ndarray(index_array.shape, dtype=index_array.dtype, buffer=shm.buf,
+                   offset=index_offset)[:] = index_array
+        index_spec = (df.index.name, index_array.dtype.str, index_offset, index_tz, index_freq)
+    else:
+        pickled_index = df.index
+
+    spec = SharedFrameSpec(
+        shm_name=shm.name,
+        n_rows=len(df),
+        columns=layout,
+        column_order=list(df.columns),
+        index=index_spec,
+        pickled_index=pickled_index,
+        extra=df[extra_cols].reset_index(drop=True) if extra_cols else None,
+        attrs=dict(df.attrs),
+    )
+    return shm, spec
+
+
+def attach_frame(spec: SharedFrameSpec) -> pd.DataFrame:
+    """Rebuild a private DataFrame from a :class:`SharedFrameSpec`.
+
+    Column data is copied out of the block, so the block can be released
+    independently of the returned frame.
+    """
+    shm = shared_memory.SharedMemory(name=spec.shm_name)
+    try:
+        n = spec.n_rows
+        data = {}
+        for name, dtype, offset in spec.columns:
+            data[name] = np.ndarray((n,), dtype=np.dtype(dtype), buffer=shm.buf, offset=offset).copy()
+
+        if spec.index is not None:
+            name, dtype, offset, tz, freq = spec.index
+            raw = np.ndarray((n,), dtype=np.dtype(dtype), buffer=shm.buf, offset=offset).copy()
+            if raw.dtype.kind == 'M':
+                index = pd.DatetimeIndex(raw, name=name)
+                if tz is not None:
+                    index = index.tz_localize('UTC').tz_convert(tz)
+                if freq is not None:
+                    index.freq = freq
+            else:
+                index = pd.Index(raw, name=name)
+        else:
+            index = spec.pickled_index
+    finally:
+        shm.close()
+
+    if spec.extra is not None:
+        for name in spec.extra.columns:
+            data[name] = spec.extra[name].to_numpy()
+    frame = pd.DataFrame(data, index=index)[spec.column_order]
+    frame.attrs.update(spec.attrs)
+    return frame
+
+
+# --- worker ---------------------------------------------------------------------------
+
+def _execute_job(job_id: str,
+                 kind: str,
+                 source: Any,
+                 config: ZoneAnalysisConfig,
+                 strategies: Dict[str, Any],
+                 swing_preset: Optional[str],
+                 load_kwargs: Dict[str, Any],
+                 enable_cache: bool) -> BatchJobResult:
+    """Run one job inside a worker process; never raises."""
+    timings: Dict[str, float] = {}
+    started = time.perf_counter()
+    try:
+        if kind == 'shared':
+            df = attach_frame(source)
+        elif kind == 'path':
+            from bquant.data.loader import load_ohlcv_data
+            df = load_ohlcv_data(source, **load_kwargs)
+        else:
+            df = source
+        loaded = time.perf_counter()
+        timings['load'] = loaded - started
+
+        from .analyzer import UniversalZoneAnalyzer
+        from .pipeline import ZoneAnalysisPipeline
+
+        analyzer = UniversalZoneAnalyzer(**strategies) if strategies else None
+        pipeline = ZoneAnalysisPipeline(config, zone_analyzer=analyzer, enable_cache=enable_cache)
+        if swing_preset is not None:
+            pipeline.with_swing_preset(swing_preset)
+        result = pipeline.run(df)
+
+        finished = time.perf_counter()
+        timings['analysis'] = finished - loaded
+        timings['total'] = finished - started
+        return BatchJobResult(job_id=job_id, success=True, result=result,
+                              timings=timings, worker_pid=os.getpid())
+    except Exception as e:  # noqa: BLE001 - failure isolation: report, do not raise
+        timings['total'] = time.perf_counter() - started
+        return BatchJobResult(
+            job_id=job_id,
+            success=False,
+            error=f"{type(e).__name__}: {e}",
+            traceback=traceback.format_exc(),
+            timings=timings,
+            worker_pid=os.getpid(),
+        )
+
+
+# --- runner ---------------------------------------------------------------------------
+
+class ZoneBatchRunner:
+    """
+    Параллельный запуск ZoneAnalysisPipeline по множеству заданий.
+
+    Example:
+        jobs = [
+            BatchJob(df_xau_1h, config, job_id='XAUUSD_1h'),
+            BatchJob('data/EURUSD_4h.csv', config),
+        ]
+        runner = ZoneBatchRunner(max_workers=8)
+        for item in runner.run(jobs):  # по мере готовности
+            print(item.job_id, item.success, item.timings)
+    """
+
+    def __init__(self,
+                 max_workers: Optional[int] = None,
+                 *,
+                 enable_cache: bool = False,
+                 use_shared_memory: bool = True,
+                 max_pending: Optional[int] = None,
+                 max_crash_retries: int = 1,
+                 mp_context=None):
+        """
+        Args:
+            max_workers: Количество процессов (по умолчанию ``os.cpu_count()``)
+            enable_cache: Использовать кэш pipeline в воркерах
+            use_shared_memory: Передавать DataFrame через shared memory
+                (иначе - pickle фрейма целиком)
+            max_pending: Максимум заданий в полете (по умолчанию ``2 * max_workers``);
+                ограничивает число одновременно живых блоков shared memory
+            max_crash_retries: Сколько раз перезапускать задания, прерванные
+                падением процесса-воркера
+            mp_context: Контекст multiprocessing для ``ProcessPoolExecutor``
+        """
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.enable_cache = enable_cache
+        self.use_shared_memory = use_shared_memory
+        self.max_pending = max_pending or 2 * self.max_workers
+        self.max_crash_retries = max_crash_retries
+        self.mp_context = mp_context
+        self.logger = get_logger(f"{__name__}.ZoneBatchRunner")
+
+    def run(self, jobs: Iterable[BatchJob]) -> Iterator[BatchJobResult]:
+        """
+        Выполнить задания и отдавать результаты по мере завершения.
+
+        Args:
+            jobs: Задания (итерируются лениво)
+
+        Yields:
+            BatchJobResult в порядке завершения
+        """
+        queue = deque((job, 0) for job in self._with_ids(jobs))
+        in_flight: Dict[Any, Tuple[BatchJob, int, float, Optional[shared_memory.SharedMemory]]] = {}
+        executor = self._create_executor()
+        try:
+            while queue or in_flight:
+                while queue and len(in_flight) < self.max_pending:
+                    job, attempt = queue.popleft()
+                    try:
+                        future, shm = self._submit(executor, job)
+                    except Exception as e:  # noqa: BLE001 - e.g. unpicklable config
+                        yield BatchJobResult(job_id=job.job_id, success=False,
+                                             error=f"{type(e).__name__}: {e}",
+                                             traceback=traceback.format_exc())
+                        continue
+                    in_flight[future] = (job, attempt, time.perf_counter(), shm)
+
+                if not in_flight:
+                    continue
+
+                done, _ = wait(list(in_flight), return_when=FIRST_COMPLETED)
+                if any(isinstance(future.exception(), BrokenProcessPool) for future in done):
+                    # A crashed worker fails every pending future of the pool:
+                    # collect them all, requeue within the retry budget, restart.
+                    done, _ = wait(list(in_flight))
+                    self.logger.warning("Worker process crashed; restarting process pool")
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    executor = self._create_executor()
+
+                for future in done:
+                    job, attempt, submitted, shm = in_flight.pop(future)
+                    self._release(shm)
+                    try:
+                        item = future.result()
+                    except BrokenProcessPool as e:
+                        if attempt < self.max_crash_retries:
+                            queue.append((job, attempt + 1))
+                            continue
+                        item = BatchJobResult(job_id=job.job_id, success=False,
+                                              error=f"{type(e).__name__}: {e}")
+                    except Exception as e:  # noqa: BLE001 - e.g. unpicklable result
+                        item = BatchJobResult(job_id=job.job_id, success=False,
+                                              error=f"{type(e).__name__}: {e}",
+                                              traceback=traceback.format_exc())
+                    item.timings['wall'] = time.perf_counter() - submitted
+                    self._log_result(item)
+                    yield item
+        finally:
+            for _, _, _, shm in in_flight.values():
+                self._release(shm)
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def run_all(self, jobs: Iterable[BatchJob]) -> List[BatchJobResult]:
+        """Выполнить все задания и вернуть результаты в порядке заданий."""
+        jobs = list(self._with_ids(jobs))
+        order = {job.job_id: position for position, job in enumerate(jobs)}
+        return sorted(self.run(jobs), key=lambda item: order[item.job_id])
+
+    def _with_ids(self, jobs: Iterable[BatchJob]) -> Iterator[BatchJob]:
+        seen = set()
+        for position, job in enumerate(jobs):
+            if job.job_id is None:
+                if isinstance(job.source, (str, Path)):
+                    job.job_id = Path(job.source).stem
+                else:
+                    job.job_id = f"job_{position}"
+            if job.job_id in seen:
+                job.job_id = f"{job.job_id}_{position}"
+            seen.add(job.job_id)
+            yield job
+
+    def _create_executor(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(max_workers=self.max_workers, mp_context=self.mp_context)
+
+    def _submit(self, executor: ProcessPoolExecutor, job: BatchJob):
+        shm = None
+        if isinstance(job.source, pd.DataFrame):
+            if self.use_shared_memory:
+                shm, spec = share_frame(job.source)
+                kind, source = 'shared', spec
+            else:
+                kind, source = 'frame', job.source
+        else:
+            kind, source = 'path', str(job.source)
+        try:
+            future = executor.submit(
+                _execute_job, job.job_id, kind, source, job.config, job.strategies,
+                job.swing_preset, job.load_kwargs, self.enable_cache,
+            )
+        except BaseException:
+            self._release(shm)
+            raise
+        return future, shm
+
+    @staticmethod
+    def _release(shm: Optional[shared_memory.SharedMemory]) -> None:
+        if shm is None:
+            return
+        shm.close()
+        try:
+            shm.unlink()
+        except FileNotFoundError:
+            pass
+
+    def _log_result(self, item: BatchJobResult) -> None:
+        if item.success:
+            self.logger.info(
+                f"Batch job {item.job_id} finished in {item.timings.get('total', 0.0):.2f}s "
+                f"(pid={item.worker_pid})"
+            )
+        else:
+            self.logger.warning(f"Batch job {item.job_id} failed: {item.error}")
+
+
+def run_zone_analysis_batch(jobs: Iterable[BatchJob],
+                            max_workers: Optional[int] = None,
+                            **runner_kwargs) -> List[BatchJobResult]:
+    """
+    Удобная функция: выполнить задания в пуле процессов.
+
+    Args:
+        jobs: Задания BatchJob
+        max_workers: Количество процессов
+        **runner_kwargs: Параметры ZoneBatchRunner
+
+    Returns:
+        Результаты в порядке заданий
+    """
+    return ZoneBatchRunner(max_workers=max_workers, **runner_kwargs).run_all(jobs)
+
+
+# Экспорт
+__all__ = [
+    'BatchJob',
+    'BatchJobResult',
+    'SharedFrameSpec',
+    'ZoneBatchRunner',
+    'attach_frame',
+    'run_zone_analysis_batch',
+    'share_frame',
+]
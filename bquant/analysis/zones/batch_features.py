@@ -0,0 +1,326 @@
+"""
+Векторизованный расчет базовых признаков зон.
+
+Все зоны одного прогона описываются массивами ``start_idx``/``end_idx`` над
+общими NumPy-колонками (см. :class:`~bquant.analysis.zones.models.ZoneColumnStore`),
+поэтому базовые признаки считаются сегментными редукциями
+(``np.fmax.reduceat`` и т.п.) за один проход по данным, без создания
+DataFrame на каждую зону.
+"""
+
+from __future__ import annotations
+
+from typing import Mapping, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+from .models import ZoneColumnStore
+
+ColumnSource = Union[pd.DataFrame, ZoneColumnStore, Mapping[str, np.ndarray]]
+
+
+class ZoneSegments:
+    """Segment layout of several zones over the same column arrays.
+
+    Zone windows are gathered into one flat buffer (``positions``) so that
+    every reduction is a single ``ufunc.reduceat`` call. Windows may overlap
+    or leave gaps; for the usual non-overlapping detection output the flat
+    buffer is at most as long as the source series.
+
+    Args:
+        start_idx: Inclusive start positions of the zones.
+        end_idx: Inclusive end positions of the zones.
+        n_rows: Length of the source columns (used for bounds validation).
+    """
+
+    def __init__(self, start_idx: Sequence[int], end_idx: Sequence[int], n_rows: int):
+        starts = np.asarray(start_idx, dtype=np.int64)
+        ends = np.asarray(end_idx, dtype=np.int64)
+        if starts.shape != ends.shape or starts.ndim != 1:
+            raise ValueError("start_idx and end_idx must be 1-D arrays of equal length")
+        if len(starts) and (
+            starts.min() < 0 or ends.max() >= n_rows or np.any(ends < starts)
+        ):
+            raise ValueError(f"Invalid zone windows for series of length {n_rows}")
+
+        self.starts = starts
+        self.ends = ends
+        self.lengths = ends - starts + 1
+        self.offsets = np.zeros(len(starts), dtype=np.int64)
+        if len(starts) > 1:
+            np.cumsum(self.lengths[:-1], out=self.offsets[1:])
+        total = int(self.lengths.sum())
+
+        # Segment id and local position of every flat element
+        self.segment_of = np.repeat(np.arange(len(starts)), self.lengths)
+        self.local_pos = np.arange(total, dtype=np.int64) - np.repeat(self.offsets, self.lengths)
+        self.positions = np.repeat(starts, self.lengths) + self.local_pos
+
+        self.is_first = np.zeros(total, dtype=bool)
+        self.is_first[self.offsets] = True
+        self.is_last = np.zeros(total, dtype=bool)
+        self.is_last[self.offsets + self.lengths - 1] = True
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def gather(self, values: np.ndarray) -> np.ndarray:
+        """Return zone windows of ``values`` concatenated into a flat float buffer."""
+        return np.asarray(values, dtype=np.float64)[self.positions]
+
+    # --- reductions over gathered buffers -------------------------------------------
+
+    def max(self, flat: np.ndarray) -> np.ndarray:
+        """NaN-skipping maximum per zone (NaN for all-NaN zones, like pandas)."""
+        return np.fmax.reduceat(flat, self.offsets)
+
+    def min(self, flat: np.ndarray) -> np.ndarray:
+        """NaN-skipping minimum per zone."""
+        return np.fmin.reduceat(flat, self.offsets)
+
+    def count(self, flat: np.ndarray) -> np.ndarray:
+        """Number of non-NaN values per zone."""
+        return np.add.reduceat((~np.isnan(flat)).astype(np.int64), self.offsets)
+
+    def mean(self, flat: np.ndarray) -> np.ndarray:
+        """NaN-skipping mean per zone."""
+        counts = self.count(flat)
+        sums = np.add.reduceat(np.where(np.isnan(flat), 0.0, flat), self.offsets)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(counts > 0, sums / counts, np.nan)
+
+    def std(self, flat: np.ndarray, ddof: int = 1) -> np.ndarray:
+        """NaN-skipping two-pass standard deviation per zone (pandas semantics)."""
+        counts = self.count(flat)
+        means = self.mean(flat)
+        dev = flat - means[self.segment_of]
+        sq = np.add.reduceat(np.where(np.isnan(dev), 0.0, dev * dev), self.offsets)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(counts > ddof, np.sqrt(sq / (counts - ddof)), np.nan)
+
+    def first(self, flat: np.ndarray) -> np.ndarray:
+        """First value of every zone."""
+        return flat[self.offsets]
+
+    def last(self, flat: np.ndarray) -> np.ndarray:
+        """Last value of every zone."""
+        return flat[self.offsets + self.lengths - 1]
+
+    def argmax(self, flat: np.ndarray) -> np.ndarray:
+        """Local position of the first maximum per zone (``idxmax`` semantics)."""
+        return self._arg_extreme(flat, self.max(flat))
+
+    def argmin(self, flat: np.ndarray) -> np.ndarray:
+        """Local position of the first minimum per zone (``idxmin`` semantics)."""
+        return self._arg_extreme(flat, self.min(flat))
+
+    def _arg_extreme(self, flat: np.ndarray, extreme: np.ndarray) -> np.ndarray:
+        hits = flat == extreme[self.segment_of]
+        big = np.iinfo(np.int64).max
+        pos = np.minimum.reduceat(np.where(hits, self.local_pos, big), self.offsets)
+        # All-NaN zones have no hit; report position 0 like a degenerate idxmax.
+        return np.where(pos == big, 0, pos)
+
+    def max_abs_diff(self, flat: np.ndarray) -> np.ndarray:
+        """Maximum absolute first difference inside each zone (NaN for 1-bar zones)."""
+        diff = np.empty_like(flat)
+        diff[0] = np.nan
+        np.subtract(flat[1:], flat[:-1], out=diff[1:])
+        diff[self.is_first] = np.nan
+        return self.max(np.abs(diff))
+
+    def corr(self, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        """Pearson correlation per zone over pairwise-complete observations."""
+        valid = ~(np.isnan(x) | np.isnan(y))
+        xv = np.where(valid, x, np.nan)
+        yv = np.where(valid, y, np.nan)
+        counts = self.count(xv)
+        dx = xv - self.mean(xv)[self.segment_of]
+        dy = yv - self.mean(yv)[self.segment_of]
+        dx = np.where(valid, dx, 0.0)
+        dy = np.where(valid, dy, 0.0)
+        sxy = np.add.reduceat(dx * dy, self.offsets)
+        sxx = np.add.reduceat(dx * dx, self.offsets)
+        syy = np.add.reduceat(dy * dy, self.offsets)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            result = sxy / np.sqrt(sxx * syy)
+        result = np.clip(result, -1.0, 1.0)
+        return np.where(counts >= 2, result, np.nan)
+
+    def count_peaks(self, flat: np.ndarray, height: np.ndarray) -> np.ndarray:
+        """Count local maxima per zone like ``scipy.signal.find_peaks(x, height=h)``.
+
+        Plateaus count once; maxima touching a zone boundary are ignored,
+        exactly as ``find_peaks`` does on the zone slice. A value exactly equal
+        to ``height`` may be classified differently from a per-zone call only
+        when ``height`` itself differs by floating point rounding.
+        """
+        n = len(flat)
+        if n == 0:
+            return np.zeros(len(self), dtype=np.int64)
+
+        # Runs of equal values never cross a zone boundary.
+        breaks = np.empty(n, dtype=bool)
+        breaks[0] = True
+        np.not_equal(flat[1:], flat[:-1], out=breaks[1:])
+        breaks |= self.is_first
+        run_start = np.flatnonzero(breaks)
+        run_end = np.append(run_start[1:] - 1, n - 1)
+        run_value = flat[run_start]
+
+        inner = ~self.is_first[run_start] & ~self.is_last[run_end]
+        prev_value = np.concatenate(([np.nan], run_value[:-1]))
+        next_value = np.concatenate((run_value[1:], [np.nan]))
+        seg = self.segment_of[run_start]
+        is_peak = (
+            inner
+            & (prev_value < run_value)
+            & (next_value < run_value)
+            & (run_value >= height[seg])
+        )
+        return np.bincount(seg[is_peak], minlength=len(self)).astype(np.int64)
+
+
+def _column_getter(data: ColumnSource):
+    if isinstance(data, ZoneColumnStore):
+        return data.column, set(data.columns), len(data)
+    if isinstance(data, pd.DataFrame):
+        return (lambda name: data[name].to_numpy()), set(data.columns), len(data)
+    if isinstance(data, Mapping):
+        lengths = {len(v) for v in data.values()}
+        if len(lengths) > 1:
+            raise ValueError("All columns must have the same length")
+        n_rows = lengths.pop() if lengths else 0
+        return (lambda name: np.asarray(data[name])), set(data.keys()), n_rows
+    raise TypeError(f"Unsupported column source: {type(data)}")
+
+
+def compute_zone_base_features(
+    data: ColumnSource,
+    start_idx: Sequence[int],
+    end_idx: Sequence[int],
+    zone_types: Optional[Sequence[str]] = None,
+    indicator_col: Optional[str] = None,
+) -> pd.DataFrame:
+    """Compute base zone features for many zones in one vectorised pass.
+
+    Args:
+        data: Full-length columns (DataFrame, :class:`ZoneColumnStore` or a
+            mapping of NumPy arrays). Requires ``close``, ``high`` and ``low``;
+            ``atr``, ``macd``/``macd_hist`` and ``indicator_col`` are used when
+            present.
+        start_idx: Inclusive zone start positions.
+        end_idx: Inclusive zone end positions.
+        zone_types: Optional ``'bull'``/``'bear'`` label per zone; controls the
+            type-specific drawdown/rally and peak/trough timing columns.
+        indicator_col: Oscillator column used for amplitude, slope,
+            correlation and ``oscillator_*`` statistics.
+
+    Returns:
+        DataFrame with one row per zone (in input order). Column names follow
+        :class:`~bquant.analysis.zones.zone_features.ZoneFeatures` fields and
+        its metadata keys; values match the per-zone extraction up to
+        floating point rounding.
+
+    Raises:
+        ValueError: If required columns are missing or windows are invalid.
+    """
+    get, columns, n_rows = _column_getter(data)
+    missing = {"close", "high", "low"} - columns
+    if missing:
+        raise ValueError(f"Missing required columns: {sorted(missing)}")
+
+    seg = ZoneSegments(start_idx, end_idx, n_rows)
+    if zone_types is None:
+        zone_types = [None] * len(seg)
+    zone_types = np.asarray(zone_types, dtype=object)
+    if len(zone_types) != len(seg):
+        raise ValueError("zone_types must have one entry per zone")
+
+    out = {
+        "zone_type": zone_types,
+        "start_idx": seg.starts,
+        "end_idx": seg.ends,
+        "duration": seg.lengths,
+    }
+    if len(seg) == 0:
+        return pd.DataFrame(out)
+
+    close = seg.gather(get("close"))
+    high = seg.gather(get("high"))
+    low = seg.gather(get("low"))
+
+    start_price = seg.first(close)
+    end_price = seg.last(close)
+    max_price = seg.max(high)
+    min_price = seg.min(low)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        price_return = end_price / start_price - 1
+        price_range_pct = max_price / min_price - 1
+    out.update(
+        start_price=start_price,
+        end_price=end_price,
+        price_return=price_return,
+        max_price=max_price,
+        min_price=min_price,
+        price_range=max_price - min_price,
+        price_range_pct=price_range_pct,
+        num_peaks=seg.count_peaks(high, seg.mean(high)),
+        num_troughs=seg.count_peaks(-low, -seg.mean(low)),
+    )
+
+    is_bull = zone_types == "bull"
+    is_bear = zone_types == "bear"
+    with np.errstate(invalid="ignore", divide="ignore"):
+        out["drawdown_from_peak"] = np.where(is_bull, end_price / max_price - 1, np.nan)
+        out["rally_from_trough"] = np.where(is_bear, end_price / min_price - 1, np.nan)
+        out["peak_time_ratio"] = np.where(is_bull, seg.argmax(high) / seg.lengths, np.nan)
+        out["trough_time_ratio"] = np.where(is_bear, seg.argmin(low) / seg.lengths, np.nan)
+
+    if "atr" in columns:
+        atr = seg.gather(get("atr"))
+        atr_start = seg.first(atr)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            out["atr_normalized_return"] = np.where(atr_start > 0, price_return / atr_start, np.nan)
+        out.update(atr_start=atr_start, atr_end=seg.last(atr), avg_atr=seg.mean(atr))
+
+    if "macd" in columns:
+        macd = seg.gather(get("macd"))
+        out.update(
+            max_macd=seg.max(macd),
+            min_macd=seg.min(macd),
+            avg_macd=seg.mean(macd),
+            macd_std=seg.std(macd),
+        )
+    if "macd_hist" in columns:
+        hist = seg.gather(get("macd_hist"))
+        out.update(
+            max_hist=seg.max(hist),
+            min_hist=seg.min(hist),
+            avg_hist=seg.mean(hist),
+            hist_std=seg.std(hist),
+        )
+
+    if indicator_col is not None and indicator_col in columns:
+        osc = seg.gather(get(indicator_col))
+        osc_max = seg.max(osc)
+        osc_min = seg.min(osc)
+        out.update(
+            hist_amplitude=osc_max - osc_min,
+            hist_slope=seg.max_abs_diff(osc),
+            oscillator_max=osc_max,
+            oscillator_min=osc_min,
+            oscillator_avg=seg.mean(osc),
+            oscillator_std=seg.std(osc),
+            correlation_price_hist=np.where(seg.lengths >= 3, seg.corr(close, osc), np.nan),
+        )
+
+    return pd.DataFrame(out)
+
+
+# Экспорт
+__all__ = [
+    'ZoneSegments',
+    'compute_zone_base_features',
+]
@@ -2,15 +2,18 @@
 
 from __future__ import annotations
 
-from dataclasses import asdict
+from dataclasses import asdict, is_dataclass
 from datetime import datetime
 from typing import Any, Optional, TYPE_CHECKING
 import hashlib
 import json
 
+import numpy as np
 import pandas as pd
 
 from bquant import __version__
+from bquant.core.config import get_cache_config
+from bquant.core.fingerprint import fingerprint, fingerprint_frame
 from bquant.core.logging_config import get_logger
 
 from .models import ZoneAnalysisResult
@@ -19,6 +22,21 @@ if TYPE_CHECKING:
     from .pipeline import ZoneAnalysisConfig
 
 
+OHLC_COLUMNS = ("open", "high", "low", "close")
+
+
+class _NoneStage:
+    """Marker stored in place of a stage output that is ``None``."""
+
+    __slots__ = ()
+
+    def __reduce__(self):
+        return "_NONE_STAGE"
+
+
+_NONE_STAGE = _NoneStage()
+
+
 class ZoneAnalysisCache:
     """Manage cached results for the zone analysis pipeline.
 
@@ -29,7 +47,13 @@ class ZoneAnalysisCache:
 
     # v3 (issue #110): ZigZag swings now come from the non-repainting backtest=True
     # detector, so serialized swing sets / confirmation_index differ from v2.
-    CACHE_VERSION = 3
+    # v4: ZigZag config carries the global-mode engine ('pandas_ta' | 'native').
+    # v5: batch feature extraction takes divergences from whole-series extrema.
+    CACHE_VERSION = 5
+
+    # Prefix of per-stage entries (the ``zone_analysis_`` prefix maps them to
+    # the ``'zones'`` memory namespace of the cache manager)
+    STAGE_KEY_PREFIX = "zone_analysis_stage_"
 
     def __init__(self, cache_manager: Optional[Any]) -> None:
         self._cache_manager = cache_manager
@@ -67,6 +91,53 @@ class ZoneAnalysisCache:
         final_hash = hashlib.sha256("|".join(key_parts).encode()).hexdigest()
         return f"zone_analysis_{final_hash}"
 
+    def stage_key(self, stage: str, *parts: str) -> str:
+        """Create a content-addressed key for one pipeline stage.
+
+        Args:
+            stage: Stage name (``"prepare_data"``, ``"detect_zones"``, ...).
+            *parts: Signatures of the stage inputs: keys of upstream stages
+                and the stage's slice of the configuration.
+
+        Returns:
+            Deterministic cache key string.
+        """
+
+        key_parts = [f"version={self.CACHE_VERSION}", f"stage={stage}", *parts]
+        final_hash = hashlib.sha256("|".join(key_parts).encode()).hexdigest()
+        return f"{self.STAGE_KEY_PREFIX}{stage}_{final_hash}"
+
+    def load_stage(self, stage_key: str, default: Any = None) -> Optional[Any]:
+        """Load an intermediate stage output.
+
+        Args:
+            stage_key: Key produced by :meth:`stage_key`.
+            default: Value returned on a miss. Pass a sentinel to tell a miss
+                apart from a cached stage whose output is ``None``.
+        """
+
+        if self._cache_manager is None:
+            return default
+        value = self._cache_manager.get(stage_key)
+        if value is None:
+            return default
+        return None if value is _NONE_STAGE else value
+
+    def save_stage(self, stage_key: str, value: Any, *, ttl: Optional[int] = None) -> None:
+        """Keep an intermediate stage output in memory.
+
+        Stage outputs hold live objects (frames, zone views) of the current
+        process, so they are not written to the disk cache. A ``None`` output
+        is stored as a marker so the stage is not recomputed on the next run.
+        """
+
+        if self._cache_manager is None:
+            return
+        if value is None:
+            value = _NONE_STAGE
+        self._cache_manager.put(stage_key, value, ttl=ttl, disk=False)
+        self.logger.debug("Saved zone analysis stage entry: %s", stage_key[:40])
+
     def load(self, cache_key: str) -> Optional[ZoneAnalysisResult]:
         """Load a result from cache if available and version compatible."""
 
@@ -132,11 +203,17 @@ class ZoneAnalysisCache:
 
     @staticmethod
     def compute_data_hash(df: pd.DataFrame) -> str:
-        """Compute a deterministic hash for the OHLC portion of the dataframe."""
+        """Compute a deterministic fingerprint for the OHLC portion of the dataframe.
+
+        The fingerprint is hashed over raw column buffers and memoized per
+        object, so repeated runs on the same frame skip re-hashing. The
+        ``fingerprint_mode`` cache setting selects full or sampled hashing.
+        """
 
-        if not set(["open", "high", "low", "close"]).issubset(df.columns):
+        if not set(OHLC_COLUMNS).issubset(df.columns):
             raise ValueError("Dataframe must contain open, high, low, close columns")
-        return str(pd.util.hash_pandas_object(df[["open", "high", "low", "close"]]).sum())
+        mode = get_cache_config().get("fingerprint_mode", "full")
+        return fingerprint_frame(df, OHLC_COLUMNS, mode=mode)
 
     @staticmethod
     def config_signature(config: "ZoneAnalysisConfig") -> str:
@@ -155,6 +232,49 @@ class ZoneAnalysisCache:
         }
         return json.dumps(payload, sort_keys=True, default=str)
 
+    @staticmethod
+    def value_signature(value: Any) -> str:
+        """Serialize a configuration slice for stage keys.
+
+        Frames and arrays embedded in the configuration (e.g. ``zones_data`` of
+        the preloaded detection strategy) are represented by their content
+        fingerprint instead of their truncated ``str()``.
+        """
+
+        def _default(obj: Any) -> str:
+            if isinstance(obj, (pd.DataFrame, pd.Series, np.ndarray)):
+                return fingerprint(obj)
+            return str(obj)
+
+        return json.dumps(value, sort_keys=True, default=_default)
+
+    @staticmethod
+    def component_signature(component: Any) -> str:
+        """Serialize the configuration of a strategy or analyzer component.
+
+        Uses ``config_hash()`` when available, the field repr for dataclasses
+        and otherwise the class name with the scalar instance attributes.
+        """
+
+        if component is None:
+            return "None"
+        config_hash = getattr(component, "config_hash", None)
+        if callable(config_hash):
+            return json.dumps(config_hash(), sort_keys=True, default=str)
+        if is_dataclass(component):
+            return repr(component)
+        scalars = {
+            name: value
+            for name, value in sorted(getattr(component, "__dict__", {}).items())
+            if isinstance(value, (str, int, float, bool, type(None)))
+        }
+        cls = type(component)
+        return json.dumps(
+            {"class": f"{cls.__module__}.{cls.__qualname__}", "params": scalars},
+            sort_keys=True,
+            default=str,
+        )
+
     @staticmethod
     def swing_signature(swing_config: Any) -> str:
         """Serialize swing configuration for cache hashing."""
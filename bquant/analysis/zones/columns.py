@@ -0,0 +1,129 @@
+"""
+Derived column requirements of zone analysis.
+
+Strategies and analyzers declare the derived columns they read from the
+prepared frame in a ``derived_columns`` class attribute, e.g.::
+
+    class CombinedVolatilityStrategy:
+        derived_columns: ClassVar[Tuple[str, ...]] = ('atr',)
+
+The pipeline collects the declarations of all active components
+(:func:`required_columns`) and computes exactly the missing ones once per
+run (:func:`compute_derived_columns`). Each column is produced by a
+vectorized NumPy kernel registered with :func:`register_derived_column`;
+kernels receive their input columns as ``float64`` keyword arguments.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from bquant.core.logging_config import get_logger
+from bquant.indicators.streaming import ewm_init, true_range
+
+logger = get_logger(__name__)
+
+# Wilder smoothing period of 'atr' (same as the AverageTrueRange default)
+ATR_PERIOD = 14
+
+
+@dataclass(frozen=True)
+class DerivedColumn:
+    """Registered derived column.
+
+    Attributes:
+        name: Column name in the prepared frame.
+        inputs: Input columns, passed to ``kernel`` as keyword arguments.
+        kernel: Vectorized function returning one value per row.
+        description: Short description.
+    """
+
+    name: str
+    inputs: Tuple[str, ...]
+    kernel: Callable[..., np.ndarray]
+    description: str = ""
+
+
+DERIVED_COLUMNS: Dict[str, DerivedColumn] = {}
+
+
+def register_derived_column(name: str, inputs: Iterable[str], description: str = ""):
+    """Decorator registering ``kernel`` as the producer of column ``name``."""
+
+    def decorator(kernel: Callable[..., np.ndarray]) -> Callable[..., np.ndarray]:
+        DERIVED_COLUMNS[name] = DerivedColumn(name, tuple(inputs), kernel, description)
+        return kernel
+
+    return decorator
+
+
+@register_derived_column("true_range", ("high", "low", "close"), "True range (high - low on the first bar)")
+def _true_range_kernel(high: np.ndarray, low: np.ndarray, close: np.ndarray) -> np.ndarray:
+    return true_range(high, low, close)
+
+
+@register_derived_column("atr", ("high", "low", "close"), f"Average true range, Wilder smoothing ({ATR_PERIOD})")
+def _atr_kernel(high: np.ndarray, low: np.ndarray, close: np.ndarray) -> np.ndarray:
+    values, _ = ewm_init(true_range(high, low, close), alpha=1 / ATR_PERIOD, adjust=False)
+    return values
+
+
+def required_columns(*components: Any) -> Tuple[str, ...]:
+    """Union of the ``derived_columns`` declared by ``components`` (in declaration order)."""
+    names: List[str] = []
+    for component in components:
+        for name in getattr(component, "derived_columns", ()) or ():
+            if name not in names:
+                names.append(name)
+    return tuple(names)
+
+
+def compute_derived_columns(
+    df: pd.DataFrame,
+    names: Iterable[str],
+    extra: Optional[Mapping[str, Any]] = None,
+) -> Dict[str, np.ndarray]:
+    """Compute the requested derived columns missing from ``df``.
+
+    Args:
+        df: Source frame.
+        names: Requested columns; ones already in ``df`` or ``extra`` are skipped.
+        extra: Columns about to be added to ``df`` (e.g. indicator output),
+            usable as kernel inputs.
+
+    Returns:
+        Mapping of column name to values aligned with ``df`` rows. Unknown
+        columns and columns with missing inputs are skipped with a warning.
+    """
+    extra = extra or {}
+    available = set(df.columns) | set(extra)
+    result: Dict[str, np.ndarray] = {}
+    for name in names:
+        if name in available or name in result:
+            continue
+        spec = DERIVED_COLUMNS.get(name)
+        if spec is None:
+            logger.warning(f"Unknown derived column '{name}' requested, skipped")
+            continue
+        missing = [column for column in spec.inputs if column not in available]
+        if missing:
+            logger.warning(f"Derived column '{name}' needs missing columns {missing}, skipped")
+            continue
+        arrays = {
+            column: np.asarray(extra[column] if column in extra else df[column], dtype=np.float64)
+            for column in spec.inputs
+        }
+        result[name] = spec.kernel(**arrays)
+    return result
+
+
+__all__ = [
+    "ATR_PERIOD",
+    "DERIVED_COLUMNS",
+    "DerivedColumn",
+    "compute_derived_columns",
+    "register_derived_column",
+    "required_columns",
+]
@@ -15,7 +15,7 @@ from typing import List, Callable, Literal
 
 from .base import ZoneDetectionStrategy, ZoneDetectionConfig
 from .registry import ZoneDetectionRegistry
-from ..models import ZoneInfo
+from ..models import ZoneInfo, ZoneColumnStore
 from bquant.core.logging_config import get_logger
 
 
@@ -86,7 +86,8 @@ class CombinedRulesDetection:
         if logic not in ['AND', 'OR']:
             raise ValueError(f"logic must be 'AND' or 'OR', got '{logic}'")
         
-        df = data.copy()
+        df = data.copy()  # one private copy shared by every zone view of this call
+        store = ZoneColumnStore(df)
         
         # Вычислить все условия
         condition_results = []
@@ -126,7 +127,7 @@ class CombinedRulesDetection:
             if zone_type not in config.zone_types:
                 continue
             
-            zone_data = df.iloc[start_idx:end_idx + 1].copy()
+            zone_data = store.view(start_idx, end_idx)
             
             zone = ZoneInfo(
                 zone_id=len(zones),
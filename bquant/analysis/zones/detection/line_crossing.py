@@ -15,7 +15,7 @@ from typing import List
 
 from .base import ZoneDetectionStrategy, ZoneDetectionConfig
 from .registry import ZoneDetectionRegistry
-from ..models import ZoneInfo
+from ..models import ZoneInfo, ZoneColumnStore
 from bquant.core.logging_config import get_logger
 
 
@@ -71,7 +71,8 @@ class LineCrossingDetection:
             if col not in data.columns:
                 raise ValueError(f"Column '{col}' not found in data")
         
-        df = data.copy()
+        df = data.copy()  # one private copy shared by every zone view of this call
+        store = ZoneColumnStore(df)
         
         # Разница между линиями
         diff = df[line1_col].values - df[line2_col].values
@@ -104,7 +105,7 @@ class LineCrossingDetection:
             if zone_type not in config.zone_types:
                 continue
             
-            zone_data = df.iloc[start_idx:end_idx + 1].copy()
+            zone_data = store.view(start_idx, end_idx)
             
             zone = ZoneInfo(
                 zone_id=len(zones),
@@ -15,7 +15,7 @@ from typing import List
 
 from .base import ZoneDetectionStrategy, ZoneDetectionConfig
 from .registry import ZoneDetectionRegistry
-from ..models import ZoneInfo
+from ..models import ZoneInfo, ZoneColumnStore
 from bquant.core.logging_config import get_logger
 
 
@@ -78,7 +78,8 @@ class ThresholdDetection:
         if indicator_col not in data.columns:
             raise ValueError(f"Indicator column '{indicator_col}' not found")
         
-        df = data.copy()
+        df = data.copy()  # one private copy shared by every zone view of this call
+        store = ZoneColumnStore(df)
         indicator_values = df[indicator_col].values
         
         # Классификация по порогам
@@ -107,7 +108,7 @@ class ThresholdDetection:
             if zone_type not in config.zone_types:
                 continue
             
-            zone_data = df.iloc[start_idx:end_idx + 1].copy()
+            zone_data = store.view(start_idx, end_idx)
             
             zone = ZoneInfo(
                 zone_id=len(zones),
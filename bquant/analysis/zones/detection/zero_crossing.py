@@ -16,7 +16,7 @@ from typing import List
 
 from .base import ZoneDetectionStrategy, ZoneDetectionConfig
 from .registry import ZoneDetectionRegistry
-from ..models import ZoneInfo
+from ..models import ZoneInfo, ZoneColumnStore
 from bquant.core.logging_config import get_logger
 
 
@@ -87,7 +87,8 @@ class ZeroCrossingDetection:
                 f"Available: {list(data.columns)}"
             )
         
-        df = data.copy()
+        df = data.copy()  # one private copy shared by every zone view of this call
+        store = ZoneColumnStore(df)
         indicator_values = df[indicator_col].values
         
         # Опциональное сглаживание
@@ -131,7 +132,7 @@ class ZeroCrossingDetection:
                 continue
             
             # Создать ZoneInfo
-            zone_data = df.iloc[start_idx:end_idx + 1].copy()
+            zone_data = store.view(start_idx, end_idx)
             
             zone = ZoneInfo(
                 zone_id=len(zones),
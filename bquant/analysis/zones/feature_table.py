@@ -0,0 +1,189 @@
+"""
+Колоночная таблица признаков зон.
+
+:class:`ZoneFeatureTable` строится один раз на прогон анализа из списка
+:class:`~bquant.analysis.zones.zone_features.ZoneFeatures` (или словарей) и
+передается всем последующим стадиям: статистике распределения, тестам гипотез,
+анализу последовательностей, кластеризации и регрессии. Вложенные метрики
+стратегий (``metadata['swing_metrics']`` и т.п.) разворачиваются в плоские
+колонки ``swing_metrics.<поле>``.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List, Mapping, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+from ...core.exceptions import AnalysisError
+from .zone_features import ZoneFeatures
+
+# Вложенные словари metadata, разворачиваемые в плоские колонки
+NESTED_METRICS = (
+    'swing_metrics',
+    'shape_metrics',
+    'divergence_metrics',
+    'volatility_metrics',
+    'volume_metrics',
+)
+
+FeatureSource = Union['ZoneFeatureTable', pd.DataFrame, Sequence[Union[ZoneFeatures, Mapping[str, Any]]]]
+
+
+def _feature_record(zone: Union[ZoneFeatures, Mapping[str, Any]]) -> Mapping[str, Any]:
+    if isinstance(zone, ZoneFeatures):
+        return zone.to_dict()
+    if isinstance(zone, Mapping):
+        return zone
+    raise AnalysisError(f"Invalid zone features type: {type(zone)}")
+
+
+class ZoneFeatureTable:
+    """Columnar, read-only view of the features of all zones of one run.
+
+    Columns are NumPy-backed pandas columns with the same names and dtypes as
+    ``pd.DataFrame([f.to_dict() for f in zones_features])``, plus flattened
+    ``<group>.<field>`` columns for the nested strategy metrics listed in
+    :data:`NESTED_METRICS`. Row order is the zone order.
+
+    The shared :attr:`frame` must not be modified by consumers; stages that
+    add columns work on :meth:`to_frame` (a copy).
+
+    Args:
+        frame: Feature frame, one row per zone.
+    """
+
+    def __init__(self, frame: pd.DataFrame):
+        self._frame = frame
+        self._groups: Dict[Any, pd.DataFrame] = {}
+
+    @classmethod
+    def from_features(cls, zones_features: FeatureSource) -> 'ZoneFeatureTable':
+        """Build a table from ``ZoneFeatures``/dicts (returned as is for a table)."""
+        if isinstance(zones_features, ZoneFeatureTable):
+            return zones_features
+        if isinstance(zones_features, pd.DataFrame):
+            return cls(zones_features.reset_index(drop=True))
+
+        records = [_feature_record(zone) for zone in zones_features]
+        frame = pd.DataFrame(records)
+        if len(frame) and 'metadata' in frame.columns:
+            flattened = cls._flatten_nested(frame['metadata'])
+            if flattened:
+                frame = pd.concat([frame, pd.DataFrame(flattened, index=frame.index)], axis=1)
+        return cls(frame)
+
+    @staticmethod
+    def _flatten_nested(metadata: pd.Series) -> Dict[str, np.ndarray]:
+        """Flatten the nested metric dicts of every zone into column arrays."""
+        n_rows = len(metadata)
+        columns: Dict[str, List[Any]] = {}
+        for row, meta in enumerate(metadata):
+            if not isinstance(meta, Mapping):
+                continue
+            for group in NESTED_METRICS:
+                metrics = meta.get(group)
+                if not isinstance(metrics, Mapping):
+                    continue
+                for key, value in metrics.items():
+                    if isinstance(value, (Mapping, list, tuple, np.ndarray)):
+                        continue
+                    name = f"{group}.{key}"
+                    column = columns.get(name)
+                    if column is None:
+                        column = columns[name] = [None] * n_rows
+                    column[row] = value
+        return {name: _column_array(values) for name, values in columns.items()}
+
+    @property
+    def frame(self) -> pd.DataFrame:
+        """Shared feature frame (do not modify)."""
+        return self._frame
+
+    @property
+    def columns(self) -> List[str]:
+        return list(self._frame.columns)
+
+    def __len__(self) -> int:
+        return len(self._frame)
+
+    def __contains__(self, column: str) -> bool:
+        return column in self._frame.columns
+
+    def column(self, name: str) -> np.ndarray:
+        """Column values as a NumPy array."""
+        return self._frame[name].to_numpy()
+
+    def by_zone_type(self, zone_type: str) -> pd.DataFrame:
+        """Rows of one zone type (computed once per table; do not modify)."""
+        group = self._groups.get(zone_type)
+        if group is None:
+            if 'zone_type' in self._frame.columns:
+                group = self._frame[self._frame['zone_type'] == zone_type]
+            else:
+                group = self._frame.iloc[0:0]
+            self._groups[zone_type] = group
+        return group
+
+    def to_frame(self, copy: bool = True) -> pd.DataFrame:
+        """Feature frame; a copy unless ``copy=False``."""
+        return self._frame.copy() if copy else self._frame
+
+    def to_records(self) -> List[Dict[str, Any]]:
+        """Row dictionaries (without the flattened nested columns)."""
+        base = [c for c in self._frame.columns if not _is_flattened(c)]
+        return self._frame[base].to_dict('records')
+
+    def to_arrow(self):
+        """Arrow table of the scalar columns (``metadata`` is left out)."""
+        import pyarrow as pa
+
+        scalar = [c for c in self._frame.columns if c != 'metadata']
+        return pa.Table.from_pandas(self._frame[scalar], preserve_index=False)
+
+
+def _is_flattened(column: str) -> bool:
+    return any(column.startswith(f"{group}.") for group in NESTED_METRICS)
+
+
+def _column_array(values: List[Any]) -> np.ndarray:
+    """Typed array for one flattened column (missing numbers become NaN)."""
+    present = [value for value in values if value is not None]
+    numeric = all(
+        isinstance(value, (int, float, np.number)) and not isinstance(value, (bool, np.bool_))
+        for value in present
+    )
+    if numeric and len(present) < len(values):
+        return np.array([np.nan if value is None else value for value in values], dtype=np.float64)
+    if numeric or all(isinstance(value, (bool, np.bool_)) for value in present):
+        return np.asarray(values)
+    return np.asarray(values, dtype=object)
+
+
+def as_feature_frame(zones_features: FeatureSource, copy: bool = False) -> pd.DataFrame:
+    """
+    DataFrame of zone features for analysis stages.
+
+    A :class:`ZoneFeatureTable` is used directly (no conversion); a list of
+    ``ZoneFeatures``/dicts is converted once.
+
+    Args:
+        zones_features: Table, DataFrame or list of ``ZoneFeatures``/dicts
+        copy: Return a frame the caller may modify
+
+    Returns:
+        Feature frame, one row per zone
+    """
+    if isinstance(zones_features, (ZoneFeatureTable, pd.DataFrame)):
+        table = ZoneFeatureTable.from_features(zones_features)
+        return table.to_frame(copy=copy)
+    # Freshly built from records: already private to the caller
+    return ZoneFeatureTable.from_features(zones_features).frame
+
+
+__all__ = [
+    'NESTED_METRICS',
+    'ZoneFeatureTable',
+    'as_feature_frame',
+]
@@ -0,0 +1,466 @@
+"""
+Incremental (append-only) zone analysis for streaming bars.
+
+``ZoneAnalysisPipeline.run`` recomputes the indicator, zone detection and
+features over the whole history on every call. :class:`IncrementalZonePipeline`
+keeps the state between calls instead:
+
+* the indicator is extended from carried state (``init_state``/``update`` of
+  streaming custom indicators, a bounded tail recomputation for the others);
+* zone detection re-runs only over the trailing window that starts at the
+  still-open zone (or, before any zone exists, at the last segment
+  boundary), so closed zones are finalized exactly once;
+* features of closed zones are extracted once and aggregate statistics are
+  updated with running moments.
+
+Per-append cost is proportional to the new bars plus the open zone, not to the
+history length. The full :class:`ZoneAnalysisResult` (distribution quantiles,
+hypothesis tests, sequences, clustering) is assembled on demand by
+:meth:`IncrementalZonePipeline.result` from the cached features.
+"""
+
+from dataclasses import dataclass, field, replace
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from bquant.core.logging_config import get_logger
+from bquant.indicators import CustomIndicator, IndicatorFactory
+
+from .analyzer import UniversalZoneAnalyzer
+from .detection import ZoneDetectionRegistry
+from .models import ZoneAnalysisResult, ZoneInfo
+from .pipeline import ZoneAnalysisConfig
+
+logger = get_logger(__name__)
+
+
+class _StreamingIndicator:
+    """Carried indicator state via ``CustomIndicator.init_state``/``update``.
+
+    The first batch is calculated in full (vectorized); later batches are
+    continued from the state in O(new bars).
+    """
+
+    def __init__(self, indicator):
+        self.indicator = indicator
+        self.state = None
+
+    def update(self, bars: pd.DataFrame, history: Optional[pd.DataFrame] = None) -> pd.DataFrame:
+        if self.state is None:
+            result, self.state = self.indicator.calculate_with_state(bars)
+        else:
+            result = self.indicator.update(self.state, bars)
+        return result.data
+
+
+class _TailIndicator:
+    """Generic indicator extension: recompute over a bounded tail of history.
+
+    Exact for window-based indicators whose window fits into ``lookback``;
+    recursive indicators (EMA-like) are approximated with a truncated history.
+    """
+
+    def __init__(self, source: str, name: str, params: Dict[str, Any], lookback: int):
+        self.indicator = IndicatorFactory.create(source=source, indicator=name, **params)
+        self.lookback = lookback
+
+    def update(self, bars: pd.DataFrame, history: Optional[pd.DataFrame] = None) -> pd.DataFrame:
+        frame = bars if history is None or history.empty else pd.concat([history, bars])
+        result = self.indicator.calculate(frame).data
+        return result.iloc[-len(bars):]
+
+
+class _ColumnBuffer:
+    """Append-only columnar history with amortized O(1) growth per bar."""
+
+    def __init__(self):
+        self._columns: Dict[str, np.ndarray] = {}
+        self._index: Optional[np.ndarray] = None
+        self._index_meta: Optional[Dict[str, Any]] = None
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def columns(self) -> List[str]:
+        return list(self._columns)
+
+    def last_label(self) -> Any:
+        return self._wrap_index(self._index[self._size - 1:self._size])[0]
+
+    def _split_index(self, index: pd.Index) -> np.ndarray:
+        if isinstance(index, pd.DatetimeIndex):
+            if self._index_meta is not None and self._index_meta['kind'] == 'datetime':
+                index = index.as_unit(self._index_meta['unit'])  # asi8 values share one unit
+            meta = {'kind': 'datetime', 'tz': index.tz, 'unit': index.unit, 'name': index.name}
+            values = index.asi8
+        else:
+            meta = {'kind': 'other', 'dtype': index.dtype, 'name': index.name}
+            values = index.to_numpy()
+        if self._index_meta is None:
+            self._index_meta = meta
+        elif meta['kind'] != self._index_meta['kind']:
+            raise ValueError("Appended bars must keep the index type of the history")
+        return values
+
+    def _wrap_index(self, values: np.ndarray) -> pd.Index:
+        meta = self._index_meta
+        if meta['kind'] == 'datetime':
+            index = pd.DatetimeIndex(values.view(f"M8[{meta['unit']}]"), name=meta['name'])
+            return index.tz_localize('UTC').tz_convert(meta['tz']) if meta['tz'] is not None else index
+        return pd.Index(values, dtype=meta['dtype'], name=meta['name'])
+
+    def _reserve(self, size: int) -> None:
+        capacity = len(self._index) if self._index is not None else 0
+        if size <= capacity:
+            return
+        new_capacity = max(size, 2 * capacity, 1024)
+        for name, values in self._columns.items():
+            grown = np.empty(new_capacity, dtype=values.dtype)
+            grown[:self._size] = values[:self._size]
+            self._columns[name] = grown
+        grown = np.empty(new_capacity, dtype=self._index.dtype)
+        grown[:self._size] = self._index[:self._size]
+        self._index = grown
+
+    def append(self, frame: pd.DataFrame) -> None:
+        index_values = self._split_index(frame.index)
+        if self._index is None:
+            self._index = np.empty(0, dtype=index_values.dtype)
+            for name in frame.columns:
+                self._columns[name] = np.empty(0, dtype=frame[name].to_numpy().dtype)
+        elif list(frame.columns) != self.columns:
+            raise ValueError(
+                f"Appended bars must have columns {self.columns}, got {list(frame.columns)}"
+            )
+
+        stop = self._size + len(frame)
+        self._reserve(stop)
+        self._index[self._size:stop] = index_values
+        for name in frame.columns:
+            values = frame[name].to_numpy()
+            if not np.can_cast(values.dtype, self._columns[name].dtype, casting='same_kind'):
+                self._columns[name] = self._columns[name].astype(np.result_type(values, self._columns[name]))
+            self._columns[name][self._size:stop] = values
+        self._size = stop
+
+    def frame(self, start: int = 0, stop: Optional[int] = None) -> pd.DataFrame:
+        """Copy rows ``[start, stop)`` into a new DataFrame."""
+        stop = self._size if stop is None else stop
+        return pd.DataFrame(
+            {name: values[start:stop].copy() for name, values in self._columns.items()},
+            index=self._wrap_index(self._index[start:stop].copy()),
+        )
+
+
+class _RunningMoments:
+    """Welford running moments (count, mean, std with ddof=1, min, max)."""
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.min = np.inf
+        self.max = -np.inf
+
+    def add(self, value: Optional[float]) -> None:
+        if value is None or value != value:
+            return
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def to_dict(self) -> Optional[Dict[str, float]]:
+        if not self.count:
+            return None
+        return {
+            'count': self.count,
+            'mean': float(self.mean),
+            'std': float(np.sqrt(self._m2 / (self.count - 1))) if self.count > 1 else float('nan'),
+            'min': float(self.min),
+            'max': float(self.max),
+        }
+
+
+@dataclass
+class IncrementalUpdate:
+    """Outcome of a single :meth:`IncrementalZonePipeline.append` call."""
+    new_bars: int
+    total_bars: int
+    closed_zones: List[ZoneInfo] = field(default_factory=list)
+    open_zone: Optional[ZoneInfo] = None
+
+
+class IncrementalZonePipeline:
+    """
+    Stateful append-only counterpart of :class:`ZoneAnalysisPipeline`.
+
+    Swings are computed per zone: a global swing pass (``swing_scope='global'``)
+    is inherently O(history) per update and is not supported here, so the
+    configuration must use ``swing_scope='per_zone'``.
+
+    Args:
+        config: Pipeline configuration (indicator and zone detection settings).
+        zone_analyzer: Analyzer used for feature extraction and the on-demand
+            full result (default: :class:`UniversalZoneAnalyzer`).
+        indicator_lookback: Bars of history used to extend indicators that have
+            no carried state (indicators without ``supports_streaming``).
+        detection_lookback: Extra bars before the open zone passed to the
+            detector (default: ``rules['smooth_window']`` when smoothing is used, else 1).
+
+    Raises:
+        ValueError: If ``zone_detection`` is missing or ``swing_scope`` is ``'global'``.
+
+    Example:
+        stream = IncrementalZonePipeline(config)
+        stream.append(history)
+        for bars in feed:
+            update = stream.append(bars)
+            for zone in update.closed_zones:
+                notify(zone.features)
+    """
+
+    def __init__(self,
+                 config: ZoneAnalysisConfig,
+                 zone_analyzer: Optional[UniversalZoneAnalyzer] = None,
+                 *,
+                 indicator_lookback: int = 500,
+                 detection_lookback: Optional[int] = None):
+        if config.zone_detection is None:
+            raise ValueError("ZoneAnalysisConfig.zone_detection is required")
+        if config.swing_scope == 'global':
+            raise ValueError(
+                "IncrementalZonePipeline computes swings per zone; "
+                "use ZoneAnalysisConfig(swing_scope='per_zone')"
+            )
+
+        self.config = config
+        self.analyzer = zone_analyzer or UniversalZoneAnalyzer()
+        self.logger = get_logger(f"{__name__}.IncrementalZonePipeline")
+        self.indicator_lookback = indicator_lookback
+
+        if detection_lookback is None:
+            # At least one bar before the open zone so its starting boundary is visible
+            smooth_window = config.zone_detection.rules.get('smooth_window') or 0
+            detection_lookback = max(1, int(smooth_window))
+        self.detection_lookback = detection_lookback
+
+        self._detector = ZoneDetectionRegistry.get(config.zone_detection.strategy_name)
+        self._indicator = self._create_indicator_state()
+        self._buffer = _ColumnBuffer()
+        self._frontier = 0
+        self._closed: List[ZoneInfo] = []
+        self._features: List[Any] = []
+        self._open_zone: Optional[ZoneInfo] = None
+        self._counts = {'bull': 0, 'bear': 0}
+        self._moments = {
+            column: {scope: _RunningMoments() for scope in ('overall', 'bull', 'bear')}
+            for column in ('duration', 'price_return')
+        }
+
+    def _create_indicator_state(self):
+        indicator = self.config.indicator
+        if indicator is None:
+            return None
+        instance = IndicatorFactory.create(source=indicator.source, indicator=indicator.name, **indicator.params)
+        if isinstance(instance, CustomIndicator) and instance.supports_streaming:
+            return _StreamingIndicator(instance)
+        self.logger.info(
+            "Indicator %s.%s has no carried state; extending over the last %d bars",
+            indicator.source, indicator.name, self.indicator_lookback,
+        )
+        return _TailIndicator(indicator.source, indicator.name, indicator.params, self.indicator_lookback)
+
+    # ------------------------------------------------------------------ state
+
+    @property
+    def n_bars(self) -> int:
+        """Number of bars received so far."""
+        return len(self._buffer)
+
+    @property
+    def closed_zones(self) -> List[ZoneInfo]:
+        """Finalized zones (their features are attached and never recomputed)."""
+        return list(self._closed)
+
+    @property
+    def open_zone(self) -> Optional[ZoneInfo]:
+        """Provisional trailing zone touching the last bar (no features yet)."""
+        return self._open_zone
+
+    @property
+    def statistics(self) -> Dict[str, Any]:
+        """Running aggregate statistics over closed zones."""
+        total = len(self._features)
+        return {
+            'total_statistics': {
+                'total_zones': total,
+                'bull_zones_count': self._counts['bull'],
+                'bear_zones_count': self._counts['bear'],
+                'bull_ratio': self._counts['bull'] / total if total else 0,
+                'bear_ratio': self._counts['bear'] / total if total else 0,
+            },
+            'duration_distribution': self._moments_dict('duration'),
+            'return_distribution': self._moments_dict('price_return'),
+        }
+
+    def _moments_dict(self, column: str) -> Dict[str, Any]:
+        scopes = {scope: moments.to_dict() for scope, moments in self._moments[column].items()}
+        return {scope: stats for scope, stats in scopes.items() if stats is not None}
+
+    def data(self) -> pd.DataFrame:
+        """Full history with indicator columns (O(history) copy)."""
+        return self._buffer.frame()
+
+    # ----------------------------------------------------------------- update
+
+    def append(self, bars: pd.DataFrame) -> IncrementalUpdate:
+        """
+        Append new bars and update zones.
+
+        Args:
+            bars: New bars (same columns as the first batch, strictly after the
+                last received bar when the index is a DatetimeIndex).
+
+        Returns:
+            :class:`IncrementalUpdate` with zones closed by these bars and the
+            current open zone.
+        """
+        if bars is None or bars.empty:
+            return IncrementalUpdate(0, self.n_bars, [], self._open_zone)
+
+        if self.n_bars and isinstance(bars.index, pd.DatetimeIndex):
+            if bars.index[0] <= self._buffer.last_label():
+                raise ValueError("Appended bars must be strictly after the last received bar")
+
+        enriched = self._extend_indicator(bars)
+        self._buffer.append(enriched)
+
+        closed, open_zone, window = self._redetect_tail()
+        if closed:
+            self._finalize(closed)
+        self._open_zone = open_zone
+        if open_zone is not None:
+            self._frontier = open_zone.start_idx
+        elif closed:
+            self._frontier = closed[-1].end_idx + 1
+        else:
+            self._frontier = self._segment_frontier(window)
+
+        return IncrementalUpdate(len(bars), self.n_bars, closed, open_zone)
+
+    def _extend_indicator(self, bars: pd.DataFrame) -> pd.DataFrame:
+        if self._indicator is None:
+            return bars
+
+        history = None
+        if isinstance(self._indicator, _TailIndicator) and self.n_bars:
+            start = max(0, self.n_bars - self.indicator_lookback)
+            history = self._buffer.frame(start)[list(bars.columns)]
+
+        values = self._indicator.update(bars, history)
+        enriched = bars.copy()
+        for column in values.columns:
+            enriched[column] = values[column].to_numpy()
+        return enriched
+
+    def _window_start(self) -> int:
+        return max(0, self._frontier - self.detection_lookback)
+
+    def _redetect_tail(self):
+        """Re-run detection on the window starting at the open zone."""
+        n_bars = self.n_bars
+        window_start = self._window_start()
+        window = self._buffer.frame(window_start)
+
+        zones = self._detector.detect_zones(window, self.config.zone_detection)
+
+        closed: List[ZoneInfo] = []
+        open_zone: Optional[ZoneInfo] = None
+        for zone in zones:
+            zone.start_idx += window_start
+            zone.end_idx += window_start
+            if zone.start_idx < self._frontier:
+                continue  # lookback bars belong to already finalized history
+            if zone.end_idx == n_bars - 1:
+                open_zone = zone
+            else:
+                closed.append(zone)
+        return closed, open_zone, window
+
+    def _segment_frontier(self, window: pd.DataFrame) -> int:
+        """
+        Frontier when the window holds no zone yet.
+
+        Segments that ended before the last bar were rejected for good, so only
+        the trailing segment can still become a zone. Detection is repeated
+        with ``min_duration=1`` to find where it starts; when the trailing bars
+        belong to an excluded zone type, nothing before the next bar can start
+        a zone. This keeps the window bounded before the first zone is found.
+        """
+        window_start = self._window_start()
+        relaxed = replace(self.config.zone_detection, min_duration=1)
+        segments = self._detector.detect_zones(window, relaxed)
+        if segments and segments[-1].end_idx + window_start == self.n_bars - 1:
+            return max(self._frontier, segments[-1].start_idx + window_start)
+        return self.n_bars
+
+    def _finalize(self, zones: List[ZoneInfo]) -> None:
+        for offset, zone in enumerate(zones):
+            zone.zone_id = len(self._closed) + offset
+
+        features = self.analyzer.features.extract_all_zones_features(zones)
+        by_id = {item.zone_id: item for item in features}
+        for zone in zones:
+            item = by_id.get(zone.zone_id)
+            if item is None:
+                continue  # rejected by the features analyzer (e.g. min_duration)
+            zone.features = item.to_dict()
+            self._features.append(item)
+            self._update_statistics(item)
+
+        self._closed.extend(zones)
+        self.logger.debug("Finalized %d zones (total %d)", len(zones), len(self._closed))
+
+    def _update_statistics(self, item: Any) -> None:
+        if item.zone_type in self._counts:
+            self._counts[item.zone_type] += 1
+        for column, scopes in self._moments.items():
+            value = getattr(item, column)
+            scopes['overall'].add(value)
+            if item.zone_type in scopes:
+                scopes[item.zone_type].add(value)
+
+    # ----------------------------------------------------------------- result
+
+    def result(self) -> ZoneAnalysisResult:
+        """
+        Assemble the full analysis over closed zones from cached features.
+
+        Distribution statistics, hypothesis tests, sequence analysis and
+        clustering are recomputed from the features (O(zones)); zone features
+        themselves are not re-extracted.
+        """
+        zones = [zone for zone in self._closed if zone.features is not None]
+        return self.analyzer.analyze_zones(
+            zones,
+            self.data(),
+            perform_clustering=self.config.perform_clustering,
+            n_clusters=self.config.n_clusters,
+            run_regression=self.config.run_regression,
+            run_validation=self.config.run_validation,
+            zones_features=self._features,
+        )
+
+
+# Экспорт
+__all__ = [
+    'IncrementalUpdate',
+    'IncrementalZonePipeline',
+]
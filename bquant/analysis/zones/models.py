@@ -16,7 +16,6 @@ from typing import Optional, Dict, Any, List, Union, Tuple
 from datetime import datetime
 from pathlib import Path
 from importlib import import_module
-from bisect import bisect_left, bisect_right
 
 import numpy as np
 import pandas as pd
@@ -87,20 +86,184 @@ class SwingPoint:
             self.strategy_params = {}
 
 
-@dataclass
+SWING_TYPE_CODES: Dict[str, int] = {"peak": 1, "trough": -1}
+_SWING_TYPE_NAMES: Dict[int, str] = {code: name for name, code in SWING_TYPE_CODES.items()}
+
+
+def _readonly(values: np.ndarray) -> np.ndarray:
+    """Return a read-only view of ``values`` (the caller's array is left untouched)."""
+    if values.flags.writeable:
+        values = values.view()
+        values.flags.writeable = False
+    return values
+
+
+def _optional_float_column(values: Optional[Any], size: int) -> np.ndarray:
+    """Float64 column where ``None`` entries (or a missing column) become NaN."""
+    if values is None:
+        return np.full(size, np.nan)
+    if isinstance(values, np.ndarray):
+        return values.astype(np.float64, copy=False)
+    return np.array([np.nan if value is None else value for value in values], dtype=np.float64)
+
+
+def _optional_scalar(value: float, cast=float) -> Optional[Any]:
+    return None if np.isnan(value) else cast(value)
+
+
+def _python_timestamp(value: Any) -> Any:
+    if value is pd.NaT:
+        return None
+    if isinstance(value, pd.Timestamp):
+        return value.to_pydatetime(warn=False)
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+def _encode_swing_types(swing_types: Any) -> np.ndarray:
+    """Map ``'peak'``/``'trough'`` labels (or ready codes) to int8 type codes."""
+    values = np.asarray(swing_types)
+    if values.dtype.kind in "iu":
+        codes = values.astype(np.int8, copy=False)
+    else:
+        try:
+            codes = np.array([SWING_TYPE_CODES[value] for value in values.tolist()], dtype=np.int8)
+        except KeyError as exc:
+            raise ValueError(f"Unknown swing type: {exc.args[0]!r}") from None
+    if codes.size and not np.isin(codes, list(_SWING_TYPE_NAMES)).all():
+        raise ValueError("Swing type codes must be 1 (peak) or -1 (trough)")
+    return codes
+
+
+class SwingPointsView:
+    """Read-only window over the columns of a :class:`SwingContext`.
+
+    Returned by :meth:`SwingContext.slice`. The column attributes are NumPy
+    views of the context arrays (no copy), so per-zone aggregation can work on
+    them directly. Indexing and iteration materialize :class:`SwingPoint`
+    objects on demand, which keeps list-based consumers working.
+
+    Example:
+        >>> swings = context.slice(0, 20)
+        >>> swings.indices
+        array([ 5, 15])
+        >>> swings[0].swing_type
+        'peak'
+    """
+
+    __slots__ = ("_context", "_start", "_stop")
+
+    def __init__(self, context: "SwingContext", start: int, stop: int):
+        self._context = context
+        self._start = start
+        self._stop = stop
+
+    @property
+    def context(self) -> "SwingContext":
+        return self._context
+
+    @property
+    def start(self) -> int:
+        """Position of the first point of the view in the context."""
+        return self._start
+
+    @property
+    def stop(self) -> int:
+        """Exclusive end position of the view in the context."""
+        return self._stop
+
+    @property
+    def indices(self) -> np.ndarray:
+        return self._context.indices[self._start:self._stop]
+
+    @property
+    def prices(self) -> np.ndarray:
+        return self._context.prices[self._start:self._stop]
+
+    @property
+    def type_codes(self) -> np.ndarray:
+        return self._context.type_codes[self._start:self._stop]
+
+    @property
+    def amplitude_to_next(self) -> np.ndarray:
+        return self._context.amplitude_to_next[self._start:self._stop]
+
+    @property
+    def duration_to_next(self) -> np.ndarray:
+        return self._context.duration_to_next[self._start:self._stop]
+
+    @property
+    def confirmation_index(self) -> np.ndarray:
+        return self._context.confirmation_index[self._start:self._stop]
+
+    @property
+    def timestamps(self) -> pd.Index:
+        return self._context.timestamps[self._start:self._stop]
+
+    def __len__(self) -> int:
+        return self._stop - self._start
+
+    def __iter__(self):
+        for position in range(self._start, self._stop):
+            yield self._context.point(position)
+
+    def __getitem__(self, key: Union[int, slice]) -> Union[SwingPoint, "SwingPointsView", List[SwingPoint]]:
+        size = len(self)
+        if isinstance(key, slice):
+            start, stop, step = key.indices(size)
+            if step == 1:
+                return SwingPointsView(self._context, self._start + start, self._start + max(start, stop))
+            return [self[i] for i in range(start, stop, step)]
+        position = int(key)
+        if position < 0:
+            position += size
+        if not 0 <= position < size:
+            raise IndexError("swing point index out of range")
+        return self._context.point(self._start + position)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (SwingPointsView, list, tuple)):
+            return len(self) == len(other) and list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return (
+            f"SwingPointsView(strategy={self._context.strategy_name!r}, "
+            f"points={len(self)}, positions={self._start}:{self._stop})"
+        )
+
+    def to_list(self) -> List[SwingPoint]:
+        """Materialize the view as a list of :class:`SwingPoint` objects."""
+        return list(self)
+
+
 class SwingContext:
     """Global context for swing points calculated on the full dataset.
 
     The context stores swing points detected by a strategy once and allows
     efficient slicing for individual zones without recomputing the strategy.
+    Points are held column-wise: int64 positions, float64 prices, int8 type
+    codes (``1`` peak, ``-1`` trough) and float64 ``amplitude_to_next`` /
+    ``duration_to_next`` / ``confirmation_index`` arrays (NaN for ``None``),
+    plus one ``strategy_params`` dict shared by all points. All arrays are
+    read-only.
+
+    Strategies build contexts with :meth:`from_arrays`; the constructor still
+    accepts a list of :class:`SwingPoint` objects for backward compatibility.
 
     Attributes:
-        swing_points: Chronologically ordered list of :class:`SwingPoint` objects.
-        indices: Sorted NumPy array of integer positions for fast slicing.
         full_data_length: Number of rows in the original dataset.
         strategy_name: Name of the strategy that produced the swings.
         strategy_params: Parameters of the strategy for traceability.
 
+    Args:
+        swing_points: Chronologically ordered :class:`SwingPoint` objects.
+        indices: Sorted integer positions of ``swing_points``.
+        full_data_length: Number of rows in the original dataset.
+        strategy_name: Name of the strategy that produced the swings.
+        strategy_params: Parameters of the strategy.
+
     Example:
         >>> context = SwingContext(
         ...     swing_points=[
@@ -116,23 +279,233 @@ class SwingContext:
         [5, 15]
     """
 
-    swing_points: List[SwingPoint]
-    indices: np.ndarray
-    full_data_length: int
-    strategy_name: str
-    strategy_params: Dict[str, Any]
-
-    def __post_init__(self) -> None:
-        if not isinstance(self.indices, np.ndarray):
-            self.indices = np.asarray(self.indices, dtype=int)
-        if self.indices.ndim != 1:
+    def __init__(
+        self,
+        swing_points: List[SwingPoint],
+        indices: np.ndarray,
+        full_data_length: int,
+        strategy_name: str,
+        strategy_params: Dict[str, Any],
+    ):
+        indices = np.asarray(indices, dtype=np.int64)
+        if indices.ndim != 1:
             raise ValueError("SwingContext.indices must be a one-dimensional array")
-        if len(self.indices) != len(self.swing_points):
+        if len(indices) != len(swing_points):
             raise ValueError(
                 "SwingContext.indices must have the same length as swing_points"
             )
+        self._set_columns(
+            indices=indices,
+            prices=np.array([sp.price for sp in swing_points], dtype=np.float64),
+            type_codes=_encode_swing_types([sp.swing_type for sp in swing_points]),
+            timestamps=[sp.timestamp for sp in swing_points],
+            amplitude_to_next=_optional_float_column([sp.amplitude_to_next for sp in swing_points], 0),
+            duration_to_next=_optional_float_column([sp.duration_to_next for sp in swing_points], 0),
+            confirmation_index=_optional_float_column([sp.confirmation_index for sp in swing_points], 0),
+            point_ids=np.array([sp.point_id for sp in swing_points], dtype=np.int64),
+        )
+        self.full_data_length = full_data_length
+        self.strategy_name = strategy_name
+        self.strategy_params = strategy_params
+
+    @classmethod
+    def from_arrays(
+        cls,
+        indices: Any,
+        prices: Any,
+        swing_types: Any,
+        timestamps: Any,
+        *,
+        full_data_length: int,
+        strategy_name: str,
+        strategy_params: Optional[Dict[str, Any]] = None,
+        amplitude_to_next: Optional[Any] = None,
+        duration_to_next: Optional[Any] = None,
+        confirmation_index: Optional[Any] = None,
+        point_ids: Optional[Any] = None,
+    ) -> "SwingContext":
+        """Build a context directly from column arrays.
+
+        Args:
+            indices: Sorted integer positions of the swing points.
+            prices: Prices at the swing points.
+            swing_types: ``'peak'``/``'trough'`` labels or int8 type codes.
+            timestamps: Index values of the swing points.
+            full_data_length: Number of rows in the original dataset.
+            strategy_name: Name of the strategy that produced the swings.
+            strategy_params: Parameters of the strategy (shared by all points).
+            amplitude_to_next: Percentage change to the next point; derived
+                from ``prices`` when omitted (NaN for the last point and zero prices).
+            duration_to_next: Bars to the next point; derived from ``indices``
+                when omitted (NaN for the last point).
+            confirmation_index: Confirmation positions (NaN when unconfirmed);
+                all NaN when omitted.
+            point_ids: Point identifiers; ``0..n-1`` when omitted.
+
+        Returns:
+            Column-backed :class:`SwingContext`.
+
+        Raises:
+            ValueError: If the columns are not one-dimensional arrays of equal length.
+        """
+        indices = np.asarray(indices, dtype=np.int64)
+        prices = np.asarray(prices, dtype=np.float64)
+        if indices.ndim != 1:
+            raise ValueError("SwingContext.indices must be a one-dimensional array")
+        size = len(indices)
+
+        if amplitude_to_next is None:
+            amplitude_to_next = np.full(size, np.nan)
+            if size > 1:
+                current, following = prices[:-1], prices[1:]
+                nonzero = current != 0
+                amplitude_to_next[:-1][nonzero] = (following[nonzero] / current[nonzero] - 1) * 100
+        if duration_to_next is None:
+            duration_to_next = np.full(size, np.nan)
+            if size > 1:
+                duration_to_next[:-1] = np.maximum(np.diff(indices), 0)
+
+        context = cls.__new__(cls)
+        context._set_columns(
+            indices=indices,
+            prices=prices,
+            type_codes=_encode_swing_types(swing_types),
+            timestamps=timestamps,
+            amplitude_to_next=_optional_float_column(amplitude_to_next, size),
+            duration_to_next=_optional_float_column(duration_to_next, size),
+            confirmation_index=_optional_float_column(confirmation_index, size),
+            point_ids=None if point_ids is None else np.asarray(point_ids, dtype=np.int64),
+        )
+        context.full_data_length = int(full_data_length)
+        context.strategy_name = strategy_name
+        context.strategy_params = {} if strategy_params is None else strategy_params
+        return context
+
+    def _set_columns(
+        self,
+        *,
+        indices: np.ndarray,
+        prices: np.ndarray,
+        type_codes: np.ndarray,
+        timestamps: Any,
+        amplitude_to_next: np.ndarray,
+        duration_to_next: np.ndarray,
+        confirmation_index: np.ndarray,
+        point_ids: Optional[np.ndarray],
+    ) -> None:
+        timestamps = timestamps if isinstance(timestamps, pd.Index) else pd.Index(list(timestamps))
+        size = len(indices)
+        columns = (prices, type_codes, timestamps, amplitude_to_next, duration_to_next, confirmation_index)
+        if any(len(column) != size for column in columns) or (
+            point_ids is not None and len(point_ids) != size
+        ):
+            raise ValueError("SwingContext columns must all have the same length")
+        if any(np.ndim(column) != 1 for column in columns):
+            raise ValueError("SwingContext columns must be one-dimensional")
+        if point_ids is not None and np.array_equal(point_ids, np.arange(size)):
+            point_ids = None
+
+        self._indices = _readonly(indices)
+        self._prices = _readonly(prices)
+        self._type_codes = _readonly(type_codes)
+        self._timestamps = timestamps
+        self._amplitude_to_next = _readonly(amplitude_to_next)
+        self._duration_to_next = _readonly(duration_to_next)
+        self._confirmation_index = _readonly(confirmation_index)
+        self._point_ids = None if point_ids is None else _readonly(point_ids)
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        for name, value in state.items():
+            if isinstance(value, np.ndarray):
+                setattr(self, name, _readonly(value))
+
+    def __repr__(self) -> str:
+        return (
+            f"SwingContext(strategy_name={self.strategy_name!r}, points={self.num_points}, "
+            f"full_data_length={self.full_data_length})"
+        )
+
+    @property
+    def num_points(self) -> int:
+        return len(self._indices)
+
+    @property
+    def indices(self) -> np.ndarray:
+        """Sorted int64 positions of the swing points in the full dataset."""
+        return self._indices
+
+    @property
+    def prices(self) -> np.ndarray:
+        return self._prices
+
+    @property
+    def type_codes(self) -> np.ndarray:
+        """int8 swing types: ``1`` for peaks, ``-1`` for troughs."""
+        return self._type_codes
+
+    @property
+    def amplitude_to_next(self) -> np.ndarray:
+        return self._amplitude_to_next
+
+    @property
+    def duration_to_next(self) -> np.ndarray:
+        return self._duration_to_next
 
-    def slice(self, start_idx: int, end_idx: int) -> List[SwingPoint]:
+    @property
+    def confirmation_index(self) -> np.ndarray:
+        return self._confirmation_index
+
+    @property
+    def timestamps(self) -> pd.Index:
+        return self._timestamps
+
+    @property
+    def point_ids(self) -> np.ndarray:
+        if self._point_ids is None:
+            return np.arange(self.num_points, dtype=np.int64)
+        return self._point_ids
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the point columns."""
+        total = sum(
+            column.nbytes
+            for column in (
+                self._indices, self._prices, self._type_codes, self._amplitude_to_next,
+                self._duration_to_next, self._confirmation_index,
+            )
+        )
+        if self._point_ids is not None:
+            total += self._point_ids.nbytes
+        return total + int(self._timestamps.memory_usage())
+
+    @property
+    def swing_points(self) -> List[SwingPoint]:
+        """All points materialized as :class:`SwingPoint` objects (a new list per call)."""
+        return self.view().to_list()
+
+    def point(self, position: int) -> SwingPoint:
+        """Materialize the point at ``position`` as a :class:`SwingPoint`."""
+        point_id = position if self._point_ids is None else int(self._point_ids[position])
+        return SwingPoint(
+            point_id=point_id,
+            timestamp=_python_timestamp(self._timestamps[position]),
+            index=int(self._indices[position]),
+            price=float(self._prices[position]),
+            swing_type=_SWING_TYPE_NAMES[int(self._type_codes[position])],
+            amplitude_to_next=_optional_scalar(self._amplitude_to_next[position]),
+            duration_to_next=_optional_scalar(self._duration_to_next[position], int),
+            strategy_name=self.strategy_name,
+            strategy_params=self.strategy_params,
+            confirmation_index=_optional_scalar(self._confirmation_index[position], int),
+        )
+
+    def view(self) -> SwingPointsView:
+        """View over all swing points."""
+        return SwingPointsView(self, 0, self.num_points)
+
+    def slice(self, start_idx: int, end_idx: int) -> SwingPointsView:
         """Return swing points for the given zone range with neighbor padding.
 
         Args:
@@ -140,23 +513,22 @@ class SwingContext:
             end_idx: Inclusive end index of the zone.
 
         Returns:
-            List of swing points that fall inside the zone boundaries including
-            one neighboring swing point on each side (when available) to keep
-            swing amplitudes intact.
+            :class:`SwingPointsView` of the points that fall inside the zone
+            boundaries including one neighboring swing point on each side
+            (when available) to keep swing amplitudes intact.
         """
 
-        if not self.swing_points:
-            return []
-
-        left = bisect_left(self.indices, start_idx)
-        right = bisect_right(self.indices, end_idx)
+        left = int(np.searchsorted(self._indices, start_idx, side="left"))
+        right = int(np.searchsorted(self._indices, end_idx, side="right"))
 
         left_with_neighbor = max(0, left - 1)
-        right_with_neighbor = min(len(self.swing_points), right + 1)
+        right_with_neighbor = min(self.num_points, right + 1)
+        if right_with_neighbor < left_with_neighbor:
+            right_with_neighbor = left_with_neighbor
 
-        return self.swing_points[left_with_neighbor:right_with_neighbor]
+        return SwingPointsView(self, left_with_neighbor, right_with_neighbor)
 
-    def get_swings_for_zone(self, zone: "ZoneInfo") -> List[SwingPoint]:
+    def get_swings_for_zone(self, zone: "ZoneInfo") -> SwingPointsView:
         """Convenience helper to slice swings for the provided zone."""
 
         return self.slice(zone.start_idx, zone.end_idx)
@@ -178,14 +550,219 @@ class SwingContext:
                     "strategy_params": sp.strategy_params,
                     "confirmation_index": sp.confirmation_index,
                 }
-                for sp in self.swing_points
+                for sp in self.view()
             ],
-            "indices": self.indices.tolist(),
+            "indices": self._indices.tolist(),
             "full_data_length": self.full_data_length,
             "strategy_name": self.strategy_name,
             "strategy_params": self.strategy_params,
         }
 
+    def to_arrow(self):
+        """Arrow table of the point columns (numeric columns are not copied).
+
+        Context attributes are stored in the schema metadata under
+        ``b'bquant.swing_context'``; :meth:`from_arrow` restores the context.
+        """
+        import pyarrow as pa
+
+        table = pa.table({
+            "index": self._indices,
+            "price": self._prices,
+            "type_code": self._type_codes,
+            "timestamp": pa.array(self._timestamps),
+            "amplitude_to_next": self._amplitude_to_next,
+            "duration_to_next": self._duration_to_next,
+            "confirmation_index": self._confirmation_index,
+            "point_id": self.point_ids,
+        })
+        meta = json.dumps({
+            "full_data_length": self.full_data_length,
+            "strategy_name": self.strategy_name,
+            "strategy_params": self.strategy_params,
+        }, default=str)
+        return table.replace_schema_metadata({b"bquant.swing_context": meta.encode()})
+
+    @classmethod
+    def from_arrow(cls, table) -> "SwingContext":
+        """Restore a context written by :meth:`to_arrow` (numeric columns without copies)."""
+        meta = json.loads(table.schema.metadata[b"bquant.swing_context"])
+
+        def column(name: str) -> np.ndarray:
+            values = table.column(name)
+            if values.num_chunks == 1:
+                return values.chunk(0).to_numpy(zero_copy_only=False)
+            return values.to_numpy()
+
+        return cls.from_arrays(
+            column("index"),
+            column("price"),
+            column("type_code"),
+            pd.Index(table.column("timestamp").to_pandas()),
+            amplitude_to_next=column("amplitude_to_next"),
+            duration_to_next=column("duration_to_next"),
+            confirmation_index=column("confirmation_index"),
+            point_ids=column("point_id"),
+            **meta,
+        )
+
+
+class ZoneColumnStore:
+    """Shared, read-only column store backing lazy zone windows.
+
+    Detection strategies copy their input once per ``detect_zones`` call, wrap
+    the copy in a store and hand every zone a :class:`ZoneDataView` (an offset
+    range into the store) instead of a private per-zone ``DataFrame`` copy.
+    Column arrays are exposed as read-only NumPy views of the store frame and
+    are extracted lazily, once per column.
+
+    Note:
+        The store does not copy ``data`` itself: mutating the wrapped frame is
+        reflected in every zone view. Built-in strategies therefore pass a frame
+        they own, so zones never alias the caller's ``DataFrame``.
+
+    Example:
+        >>> store = ZoneColumnStore(df)
+        >>> view = store.view(10, 24)
+        >>> view.column('close').shape
+        (15,)
+    """
+
+    def __init__(self, data: pd.DataFrame):
+        self._frame = data
+        self._columns: Dict[str, np.ndarray] = {}
+
+    @property
+    def frame(self) -> pd.DataFrame:
+        """Source dataframe shared by all views."""
+        return self._frame
+
+    @property
+    def index(self) -> pd.Index:
+        """Index of the source dataframe."""
+        return self._frame.index
+
+    @property
+    def columns(self) -> pd.Index:
+        """Column labels of the source dataframe."""
+        return self._frame.columns
+
+    def __len__(self) -> int:
+        return len(self._frame)
+
+    def column(self, name: str) -> np.ndarray:
+        """Return the full column as a read-only NumPy array (no copy when possible)."""
+        values = self._columns.get(name)
+        if values is None:
+            values = self._frame[name].to_numpy()
+            if values.flags.writeable:
+                values = values.view()
+                values.flags.writeable = False
+            self._columns[name] = values
+        return values
+
+    def view(self, start_idx: int, end_idx: int) -> "ZoneDataView":
+        """Return a view over the inclusive positional range ``[start_idx, end_idx]``."""
+        return ZoneDataView(self, int(start_idx), int(end_idx) + 1)
+
+
+class ZoneDataView:
+    """Lazy window over a :class:`ZoneColumnStore`.
+
+    Provides the read-only subset of the ``DataFrame`` API used by feature
+    extraction and visualization (``columns``, ``index``, ``len()``,
+    ``view[col]``) without copying. :meth:`to_frame` materializes a private
+    ``DataFrame`` copy when a caller needs full pandas semantics.
+
+    Attributes:
+        store: Backing column store.
+        start: Inclusive start position in the store.
+        stop: Exclusive end position in the store.
+    """
+
+    __slots__ = ("store", "start", "stop")
+
+    def __init__(self, store: ZoneColumnStore, start: int, stop: int):
+        if start < 0 or stop > len(store) or start > stop:
+            raise ValueError(
+                f"Invalid zone window [{start}, {stop}) for store of length {len(store)}"
+            )
+        self.store = store
+        self.start = start
+        self.stop = stop
+
+    def __len__(self) -> int:
+        return self.stop - self.start
+
+    def __repr__(self) -> str:
+        return f"ZoneDataView(start={self.start}, stop={self.stop}, columns={len(self.columns)})"
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self.column(name)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self.store.columns
+
+    @property
+    def empty(self) -> bool:
+        """``True`` when the window contains no rows."""
+        return self.stop == self.start
+
+    @property
+    def columns(self) -> pd.Index:
+        """Column labels available through the view."""
+        return self.store.columns
+
+    @property
+    def index(self) -> pd.Index:
+        """Index labels of the window (a slice of the source index)."""
+        return self.store.index[self.start:self.stop]
+
+    def column(self, name: str) -> np.ndarray:
+        """Return the window of ``name`` as a read-only NumPy view."""
+        return self.store.column(name)[self.start:self.stop]
+
+    def to_frame(self) -> pd.DataFrame:
+        """Materialize the window as an independent ``DataFrame``."""
+        return self.store.frame.iloc[self.start:self.stop].copy()
+
+
+class _ZoneDataField:
+    """Descriptor behind ``ZoneInfo.data``.
+
+    Accepts either a ``DataFrame`` (stored as-is) or a :class:`ZoneDataView`
+    (materialized on first attribute access and cached on the instance, so
+    repeated reads return the same object and in-place edits persist).
+    """
+
+    def __set_name__(self, owner, name: str) -> None:
+        self._name = name
+        self._frame_attr = f"_{name}_frame"
+        self._view_attr = f"_{name}_view"
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return None  # dataclass default: data is optional when a view is unavailable
+        frame = obj.__dict__.get(self._frame_attr)
+        if frame is None and self._name in obj.__dict__:
+            # Instances pickled before the lazy layout keep the frame under the plain name
+            frame = obj.__dict__.pop(self._name)
+            self.__set__(obj, frame)
+        if frame is None:
+            view = obj.__dict__.get(self._view_attr)
+            if view is not None:
+                frame = view.to_frame()
+                obj.__dict__[self._frame_attr] = frame
+        return frame
+
+    def __set__(self, obj, value) -> None:
+        if isinstance(value, ZoneDataView):
+            obj.__dict__[self._view_attr] = value
+            obj.__dict__[self._frame_attr] = None
+        else:
+            obj.__dict__[self._view_attr] = None
+            obj.__dict__[self._frame_attr] = value
+
 
 @dataclass
 class ZoneInfo:
@@ -200,6 +777,8 @@ class ZoneInfo:
         end_time: Timestamp of the last bar belonging to the zone.
         duration: Number of bars in the zone.
         data: Slice of the source dataframe containing OHLCV columns (plus indicators).
+            May be assigned either a ``DataFrame`` or a :class:`ZoneDataView`; a view
+            is materialized into a ``DataFrame`` on first access.
         features: Optional dictionary of computed feature metrics (populated by analyzers).
         indicator_context: Optional metadata produced by the detection strategy
             (strategy name, indicator columns, thresholds, etc.).
@@ -208,6 +787,8 @@ class ZoneInfo:
     Notes:
         * ``indicator_context`` is set by the detection stage; the pipeline does not mutate it.
         * ``swing_context`` is injected in global swing mode and remains ``None`` for per-zone mode.
+        * Built-in detection strategies pass a :class:`ZoneDataView`; consumers that only
+          need column values should read through :attr:`data_view` to avoid materializing.
     """
     zone_id: int
     type: str
@@ -216,7 +797,7 @@ class ZoneInfo:
     start_time: datetime
     end_time: datetime
     duration: int
-    data: pd.DataFrame
+    data: Optional[pd.DataFrame] = _ZoneDataField()
     features: Optional[Dict[str, Any]] = None
     indicator_context: Optional[Dict[str, Any]] = None
     swing_context: Optional[SwingContext] = None
@@ -226,13 +807,34 @@ class ZoneInfo:
         if self.indicator_context is None:
             self.indicator_context = {}
 
-    def get_zone_swings(self) -> List[SwingPoint]:
+    @property
+    def data_view(self) -> Optional[ZoneDataView]:
+        """Lazy view backing :attr:`data` (``None`` when the zone holds a plain DataFrame)."""
+        return self.__dict__.get('_data_view')
+
+    @property
+    def is_materialized(self) -> bool:
+        """``True`` once :attr:`data` holds a ``DataFrame`` (eager or materialized view)."""
+        return self.__dict__.get('_data_frame') is not None
+
+    def get_data(self, cache: bool = True) -> Optional[pd.DataFrame]:
+        """Return the zone dataframe, optionally without caching a materialized view.
+
+        Args:
+            cache: When ``False`` and the zone is still backed by a view, build a
+                transient ``DataFrame`` that is not retained on the zone. Batch
+                consumers use this to keep memory close to the source frame size.
+        """
+        if cache or self.is_materialized or self.data_view is None:
+            return self.data
+        return self.data_view.to_frame()
+
+    def get_zone_swings(self) -> Union[SwingPointsView, List[SwingPoint]]:
         """Return swing points for the zone using the attached swing context.
 
         Returns:
-            List of :class:`SwingPoint` extracted from the associated
-            :class:`SwingContext`. Returns an empty list if no context is
-            attached.
+            :class:`SwingPointsView` of the associated :class:`SwingContext`.
+            Returns an empty list if no context is attached.
 
         Example:
             >>> swings = zone.get_zone_swings()
@@ -253,7 +855,11 @@ class ZoneInfo:
         return self.indicator_context.get('signal_line')
     
     def to_analyzer_format(self) -> Dict[str, Any]:
-        """Convert the zone into a dictionary consumed by feature analyzers."""
+        """Convert the zone into a dictionary consumed by feature analyzers.
+
+        ``data`` is the cached zone frame (materialized once from the view and
+        reused by later calls), so repeated conversions do not rebuild it.
+        """
         return {
             'zone_id': self.zone_id,
             'type': self.type,
@@ -263,6 +869,7 @@ class ZoneInfo:
             'end_time': self.end_time,
             'duration': self.duration,
             'data': self.data,
+            'data_view': self.data_view,
             'indicator_context': self.indicator_context,  # Pass to analyzers
             'swing_context': self.swing_context,
             **(self.features or {})
@@ -657,7 +1264,11 @@ class ZoneAnalysisResult:
 __all__ = [
     'ZoneInfo',
     'ZoneAnalysisResult',
+    'ZoneColumnStore',
+    'ZoneDataView',
     'SwingPoint',
-    'SwingContext'
+    'SwingPointsView',
+    'SwingContext',
+    'SWING_TYPE_CODES',
 ]
 
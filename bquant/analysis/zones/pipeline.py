@@ -9,10 +9,19 @@ Components:
 * ``ZoneAnalysisConfig`` – full pipeline configuration container.
 * ``ZoneAnalysisPipeline`` – executes the workflow (optionally with caching).
 * ``ZoneAnalysisBuilder`` – fluent API entry point used by ``analyze_zones``.
+
+With caching enabled the workflow is a DAG of stages
+(``prepare_data → global_swings → detect_zones → features →
+statistics / hypothesis_tests / sequence_analysis / clustering /
+regression_results``). Every stage has a content-addressed key derived from
+the keys of its inputs and its slice of the configuration, so changing e.g.
+only ``n_clusters`` re-runs clustering alone; the independent terminal stages
+run in a thread pool.
 """
 
 from dataclasses import dataclass, field, asdict
-from typing import Any, Dict, List, Literal, Optional
+from typing import Any, Dict, List, Literal, Optional, Tuple
+import copy
 import pandas as pd
 import json
 
@@ -21,12 +30,15 @@ from bquant.indicators.base import IndicatorResult
 from bquant.core.logging_config import get_logger
 from bquant.core.cache import get_cache_manager
 from bquant.core.config import DEFAULT_SWING_PRESET, SWING_PRESETS
+from bquant.analysis.statistical import HypothesisTestRegistry
 from .strategies.swing.thresholds import _AdaptiveSwingStrategy
 
 from .detection import ZoneDetectionRegistry, ZoneDetectionConfig
 from .analyzer import UniversalZoneAnalyzer
 from .models import ZoneInfo, ZoneAnalysisResult, SwingContext
 from .cache import ZoneAnalysisCache
+from .columns import compute_derived_columns, required_columns
+from .feature_table import ZoneFeatureTable
 from .strategies.registry import StrategyRegistry
 from .strategies.swing import (
     FindPeaksSwingStrategy,
@@ -37,6 +49,18 @@ from .strategies.swing import (
 logger = get_logger(__name__)
 
 
+# Strategies of ZoneFeaturesAnalyzer that determine the features stage output
+# Returned by ZoneAnalysisCache.load_stage() on a miss (a cached stage may hold None)
+_STAGE_MISS = object()
+
+_FEATURE_STRATEGY_ATTRS = (
+    "swing_strategy",
+    "shape_strategy",
+    "divergence_strategy",
+    "volatility_strategy",
+    "volume_strategy",
+)
+
 _SWING_CLASS_TO_NAME = {
     ZigZagSwingStrategy: "zigzag",
     FindPeaksSwingStrategy: "find_peaks",
@@ -49,7 +73,11 @@ _SWING_CLASS_TO_NAME = {
 #   v2 (2026-07): SwingPoint.confirmation_index added (causal availability).
 #   v3 (2026-07): confirmation_index now populated by find_peaks & pivot_points
 #                 (previously only zigzag; changes cached swing output).
-CACHE_SCHEMA_VERSION = 3
+#   v4 (2026-10): ZoneInfo.data is backed by a lazy ZoneDataView (pickled layout changed).
+#   v5 (2026-10): SwingContext stores swing points column-wise (pickled layout changed).
+#   v6 (2026-10): prepared data carries the derived columns declared by strategies (atr).
+#   v7 (2026-10): 'atr' is added only when a configured strategy declares it.
+CACHE_SCHEMA_VERSION = 7
 
 
 @dataclass
@@ -166,26 +194,27 @@ class ZoneAnalysisPipeline:
         if cached_result is not None:
             self.logger.info(f"Zone analysis result loaded from cache (key: {cache_key[:8]}...)")
             # Update metadata with fresh dataframe attributes if available
-            if hasattr(df, 'attrs'):
-                if 'symbol' in df.attrs:
-                    cached_result.metadata['symbol'] = df.attrs['symbol']
-                if 'timeframe' in df.attrs:
-                    cached_result.metadata['timeframe'] = df.attrs['timeframe']
-                if 'source' in df.attrs:
-                    cached_result.metadata['source'] = df.attrs['source']
-                if 'dataset_name' in df.attrs:
-                    cached_result.metadata['dataset_name'] = df.attrs['dataset_name']
+            self._refresh_metadata(cached_result, df)
             return cached_result
         
-        # Execute analysis and persist result to cache
+        # Execute analysis stage by stage (reusing cached stages) and persist result
         self.logger.info("Cache miss, running zone analysis...")
-        result = self._run_without_cache(df)
+        result = self._run_stages(df, cache_wrapper)
 
         # Store result (in-memory and disk according to cache policy)
         cache_wrapper.save(cache_key, result, ttl=self.cache_ttl, disk=True)
         self.logger.info(f"Zone analysis result saved to cache (key: {cache_key[:8]}...)")
 
         return result
+
+    @staticmethod
+    def _refresh_metadata(result: ZoneAnalysisResult, df: pd.DataFrame) -> None:
+        """Copy dataset attributes of ``df`` into ``result.metadata``."""
+
+        if hasattr(df, 'attrs'):
+            for name in ('symbol', 'timeframe', 'source', 'dataset_name'):
+                if name in df.attrs:
+                    result.metadata[name] = df.attrs[name]
     
     def _run_without_cache(self, df: pd.DataFrame) -> ZoneAnalysisResult:
         """Execute the pipeline without consulting the cache."""
@@ -214,6 +243,155 @@ class ZoneAnalysisPipeline:
         # Step 5: run feature analysis
         return self._analyze_zones(zones, df_prepared)
 
+    def _run_stages(self, df: pd.DataFrame, cache: ZoneAnalysisCache) -> ZoneAnalysisResult:
+        """Execute the pipeline as a DAG of cached stages.
+
+        Stage outputs are looked up by content-addressed keys (see
+        :meth:`_stage_keys`); only stages whose key is missing are computed.
+        Cached zone lists are never mutated: every run works on shallow
+        copies of the zones.
+        """
+
+        keys = self._stage_keys(df, cache)
+
+        def cached_stage(stage: str, compute):
+            value = cache.load_stage(keys[stage], default=_STAGE_MISS)
+            if value is not _STAGE_MISS:
+                self.logger.info("Stage '%s' loaded from cache", stage)
+                return value
+            value = compute()
+            cache.save_stage(keys[stage], value, ttl=self.cache_ttl)
+            return value
+
+        # prepare_data: identity when there is nothing to add
+        if self.config.indicator is None and set(self._required_columns()) <= set(df.columns):
+            df_prepared = df
+        else:
+            df_prepared = cached_stage("prepare_data", lambda: self._prepare_data(df))
+
+        global_swing_context: Optional[SwingContext] = None
+        if self.config.swing_scope == "global":
+            try:
+                global_swing_context = cached_stage(
+                    "global_swings", lambda: self._calculate_global_swings(df_prepared)
+                )
+            except Exception as exc:  # noqa: BLE001 - стратегические исключения логируются
+                self.logger.warning(
+                    "Global swing calculation failed, falling back to per_zone mode: %s",
+                    exc,
+                )
+
+        zones = cached_stage("detect_zones", lambda: self._detect_zones(df_prepared))
+        zones = [copy.copy(zone) for zone in zones]
+        if not zones or not hasattr(self.analyzer, "analysis_stages"):
+            if global_swing_context is not None and zones:
+                self._inject_swing_context(zones, global_swing_context)
+            result = self._analyze_zones(zones, df_prepared)
+            self._refresh_metadata(result, df)
+            return result
+
+        if global_swing_context is not None:
+            self._inject_swing_context(zones, global_swing_context)
+
+        zones_features = cached_stage(
+            "features", lambda: self.analyzer.features.extract_all_zones_features(zones)
+        )
+        for zone, features in zip(zones, zones_features):
+            zone.features = features.to_dict()
+        feature_table = ZoneFeatureTable.from_features(zones_features)
+
+        stages = self.analyzer.analysis_stages(
+            len(zones),
+            perform_clustering=self.config.perform_clustering,
+            n_clusters=self.config.n_clusters,
+            run_regression=self.config.run_regression,
+        )
+        stage_results: Dict[str, Any] = {}
+        pending = {}
+        for stage, run_stage in stages.items():
+            value = cache.load_stage(keys[stage], default=_STAGE_MISS)
+            if value is not _STAGE_MISS:
+                self.logger.info("Stage '%s' loaded from cache", stage)
+                stage_results[stage] = value
+            else:
+                pending[stage] = run_stage
+        if pending:
+            computed = self.analyzer.run_analysis_stages(feature_table, pending)
+            for stage, value in computed.items():
+                cache.save_stage(keys[stage], value, ttl=self.cache_ttl)
+            stage_results.update(computed)
+
+        result = self.analyzer.assemble_result(
+            zones, df_prepared, stage_results, run_validation=self.config.run_validation
+        )
+        self._refresh_metadata(result, df)
+        return result
+
+    def _stage_keys(self, df: pd.DataFrame, cache: ZoneAnalysisCache) -> Dict[str, str]:
+        """Content-addressed keys of all pipeline stages for ``df``.
+
+        Each key covers the keys of the stage inputs plus the part of the
+        configuration the stage reads, so a configuration change invalidates
+        only the stages downstream of it.
+        """
+
+        signature = ZoneAnalysisCache.value_signature
+        component = ZoneAnalysisCache.component_signature
+        config = self.config
+
+        data_hash = ZoneAnalysisCache.compute_data_hash(df)
+        prepare = cache.stage_key(
+            "prepare_data",
+            f"data={data_hash}",
+            signature(asdict(config.indicator) if config.indicator else None),
+            f"derived={','.join(self._required_columns())}",
+        )
+        swings = cache.stage_key(
+            "global_swings",
+            prepare,
+            ZoneAnalysisCache.swing_signature(self._serialize_swing_configuration()),
+            component(self._get_active_swing_strategy()),
+        )
+        detect = cache.stage_key(
+            "detect_zones",
+            prepare,
+            signature(asdict(config.zone_detection) if config.zone_detection else None),
+        )
+        features_analyzer = getattr(self.analyzer, "features", None)
+        features = cache.stage_key(
+            "features",
+            detect,
+            swings if config.swing_scope == "global" else "per_zone",
+            component(features_analyzer),
+            *(component(getattr(features_analyzer, name, None)) for name in _FEATURE_STRATEGY_ATTRS),
+        )
+
+        # run_all_tests() runs every registered test, so the registry is part of the key
+        registry_tests = [
+            (name, HypothesisTestRegistry.get(name)) for name in HypothesisTestRegistry.list_tests()
+        ]
+        registered_tests = ",".join(
+            f"{name}={test.__module__}.{test.__qualname__}" for name, test in registry_tests
+        )
+        hypotheses = component(getattr(self.analyzer, "hypotheses", None))
+        sequences = component(getattr(self.analyzer, "sequences", None))
+        regression = component(getattr(self.analyzer, "regression", None))
+        return {
+            "prepare_data": prepare,
+            "global_swings": swings,
+            "detect_zones": detect,
+            "features": features,
+            "statistics": cache.stage_key("statistics", features),
+            "hypothesis_tests": cache.stage_key(
+                "hypothesis_tests", features, hypotheses, f"tests={registered_tests}"
+            ),
+            "sequence_analysis": cache.stage_key("sequence_analysis", features, sequences),
+            "clustering": cache.stage_key(
+                "clustering", features, sequences, f"n_clusters={config.n_clusters}"
+            ),
+            "regression_results": cache.stage_key("regression_results", features, regression),
+        }
+
     def _get_active_swing_strategy(self) -> Optional[Any]:
         """Возвратить активную стратегию свингов, используемую анализатором зон."""
 
@@ -250,7 +428,7 @@ class ZoneAnalysisPipeline:
 
         self.logger.info(
             "Global swings calculated: %d swing points detected",
-            len(context.swing_points),
+            context.num_points,
         )
 
         return context
@@ -268,37 +446,38 @@ class ZoneAnalysisPipeline:
             len(zones),
         )
     
-    def _prepare_data(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Enrich the dataframe with indicators when requested."""
-        if self.config.indicator is None:
-            return df  # Indicator already provided
-
-        ind = self.config.indicator
-        self.logger.info(f"Calculating indicator: {ind.source}.{ind.name}")
+    def _required_columns(self) -> Tuple[str, ...]:
+        """Derived columns declared by the configured feature strategies.
 
-        indicator = IndicatorFactory.create(
-            source=ind.source,
-            indicator=ind.name,
-            **ind.params,
+        Only active components contribute: without a strategy that reads e.g.
+        ``'atr'`` the prepared frame gets no such column.
+        """
+        features_analyzer = getattr(self.analyzer, "features", None)
+        return required_columns(
+            features_analyzer,
+            *(getattr(features_analyzer, name, None) for name in _FEATURE_STRATEGY_ATTRS),
         )
 
-        result: IndicatorResult = indicator.calculate(df)
-
-        df_with_indicator = df.copy()
-        for col in result.data.columns:
-            df_with_indicator[col] = result.data[col]
+    def _prepare_data(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Add the indicator and the declared derived columns in one ``assign``."""
+        columns: Dict[str, Any] = {}
 
-        if 'atr' not in df_with_indicator.columns:
-            try:
-                from bquant.data.processor import calculate_derived_indicators
+        ind = self.config.indicator
+        if ind is not None:
+            self.logger.info(f"Calculating indicator: {ind.source}.{ind.name}")
 
-                derived = calculate_derived_indicators(df_with_indicator)
-                if 'atr' in derived.columns:
-                    df_with_indicator['atr'] = derived['atr']
-            except Exception as exc:
-                self.logger.warning(f"Failed to add ATR: {exc}")
+            indicator = IndicatorFactory.create(
+                source=ind.source,
+                indicator=ind.name,
+                **ind.params,
+            )
+            result: IndicatorResult = indicator.calculate(df)
+            columns.update(result.data.items())
 
-        return df_with_indicator
+        columns.update(compute_derived_columns(df, self._required_columns(), columns))
+        if not columns:
+            return df  # Nothing to add
+        return df.assign(**columns)
     
     def _detect_zones(self, df: pd.DataFrame) -> List[ZoneInfo]:
         """Run the configured detection strategy and return zones."""
@@ -18,6 +18,7 @@ from ...core.logging_config import get_logger
 from ...core.exceptions import AnalysisError
 from .. import AnalysisResult, BaseAnalyzer
 from .zone_features import ZoneFeatures
+from .feature_table import as_feature_frame
 
 # Получаем логгер для модуля
 logger = get_logger(__name__)
@@ -121,17 +122,8 @@ class ZoneSequenceAnalyzer(BaseAnalyzer):
             if len(zones_features) < self.min_sequence_length:
                 raise AnalysisError(f"Need at least {self.min_sequence_length} zones for sequence analysis")
             
-            # Конвертируем в DataFrame
-            features_dicts = []
-            for zone in zones_features:
-                if isinstance(zone, ZoneFeatures):
-                    features_dicts.append(zone.to_dict())
-                elif isinstance(zone, dict):
-                    features_dicts.append(zone)
-                else:
-                    raise AnalysisError(f"Invalid zone features type: {type(zone)}")
-            
-            df_features = pd.DataFrame(features_dicts)
+            # Конвертируем в DataFrame (ZoneFeatureTable используется без конвертации)
+            df_features = as_feature_frame(zones_features)
             
             # Создаем последовательность типов зон
             zone_sequence = df_features['zone_type'].tolist()
@@ -203,15 +195,8 @@ class ZoneSequenceAnalyzer(BaseAnalyzer):
             if len(zones_features) < n_clusters:
                 raise AnalysisError(f"Cannot create {n_clusters} clusters from {len(zones_features)} zones")
             
-            # Конвертируем в DataFrame
-            features_dicts = []
-            for zone in zones_features:
-                if isinstance(zone, ZoneFeatures):
-                    features_dicts.append(zone.to_dict())
-                elif isinstance(zone, dict):
-                    features_dicts.append(zone)
-            
-            df_features = pd.DataFrame(features_dicts)
+            # Конвертируем в DataFrame (копия: ниже добавляется колонка 'cluster')
+            df_features = as_feature_frame(zones_features, copy=True)
             
             # Выбираем признаки для кластеризации
             if features_to_use is None:
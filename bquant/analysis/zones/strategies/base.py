@@ -204,6 +204,10 @@ class SwingCalculationStrategy(Protocol):
     def aggregate_for_zone(self, zone: ZoneInfo, context: SwingContext) -> SwingMetrics:
         """Aggregate global swing data into metrics for a particular zone.
 
+        Strategies may additionally provide a batched
+        ``aggregate_for_zones(zones, context) -> List[SwingMetrics]``; feature
+        extraction uses it when all zones share one context.
+
         Args:
             zone: Zone descriptor containing positional information.
             context: Global swing context produced by :meth:`calculate_global`.
@@ -280,6 +284,10 @@ class DivergenceCalculationStrategy(Protocol):
     Protocol for divergence detection algorithms.
     
     Implementations must provide calculate_divergence() and get_metadata() methods.
+    They may additionally provide a batched
+    ``calculate_divergence_batch(data, start_idx, end_idx, indicator_col, indicator_line_col=None)
+    -> List[DivergenceMetrics]``; feature extraction uses it when all zones
+    share one column store.
     """
     
     def calculate_divergence(self, zone_data: pd.DataFrame) -> DivergenceMetrics:
@@ -503,6 +511,9 @@ class VolatilityCalculationStrategy(Protocol):
     Protocol for volatility analysis algorithms.
     
     Implementations must provide calculate_volatility() and get_metadata() methods.
+    They may additionally provide a batched
+    ``calculate_volatility_batch(data, start_idx, end_idx) -> List[Optional[VolatilityMetrics]]``;
+    feature extraction uses it when all zones share one column store.
     """
     
     def calculate_volatility(self, zone_data: pd.DataFrame) -> VolatilityMetrics:
@@ -13,20 +13,64 @@ Examples:
     strategy.calculate_divergence(data, indicator_col='RSI_14')  # RSI
     strategy.calculate_divergence(data, indicator_col='macd_hist')  # MACD
     strategy.calculate_divergence(data, indicator_col='macd', indicator_line_col='macd_signal')  # 2-line
+
+Besides the per-zone :meth:`ClassicDivergenceStrategy.calculate_divergence`,
+:meth:`~ClassicDivergenceStrategy.calculate_divergence_batch` detects the
+extrema of the full series once (:func:`series_extrema`), pairs them with a
+``searchsorted`` nearest-neighbour search and attributes divergences to zones
+by index range.
 """
 
 from dataclasses import dataclass
-from typing import Dict, Any, List, Tuple
+from typing import Dict, Any, List, Optional, Sequence, Tuple
 import pandas as pd
 import numpy as np
-from scipy.signal import find_peaks
+from scipy.signal import find_peaks, peak_prominences
 
 from ..base import DivergenceMetrics, DivergenceCalculationStrategy
 from ..registry import StrategyRegistry
+from ...batch_features import ColumnSource, ZoneSegments, _column_getter
 from .....core.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Maximum distance (bars) between a price extremum and its indicator extremum
+NEAREST_EXTREMUM_DISTANCE = 10
+
+
+@dataclass(frozen=True)
+class SeriesExtrema:
+    """Local maxima of a full series, found once per analysis run.
+
+    Attributes:
+        positions: Sorted positions of the maxima (``find_peaks`` with ``distance``).
+        prominences: Prominence of every maximum over the full series.
+    """
+
+    positions: np.ndarray
+    prominences: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+
+def series_extrema(values, distance: int) -> SeriesExtrema:
+    """Local maxima of ``values`` spaced at least ``distance`` bars apart.
+
+    Prominence filtering is left to the caller: ``find_peaks`` applies the
+    ``distance`` condition before the ``prominence`` one, so keeping the maxima
+    whose prominence reaches a threshold gives the same result as passing that
+    threshold to ``find_peaks``. Pass ``-values`` for minima.
+    """
+    values = np.asarray(values, dtype=float)
+    positions, _ = find_peaks(values, distance=distance)
+    if len(positions):
+        with np.errstate(invalid='ignore'):
+            prominences = peak_prominences(values, positions)[0]
+    else:
+        prominences = np.empty(0, dtype=float)
+    return SeriesExtrema(positions=positions.astype(np.int64), prominences=prominences)
+
 
 @StrategyRegistry.register_divergence_strategy('classic')
 @dataclass
@@ -141,9 +185,220 @@ class ClassicDivergenceStrategy:
             return self._calculate_metrics(divergences, indicator_col, indicator_line_col)
             
         except Exception as e:
-            logger.error(f"Divergence calculation failed for '{indicator_col}': {e}", exc_info=True)
+            logger.error(f"Divergence calculation failed for '{indicator_col}': {e}")
             return self._empty_metrics(indicator_col, indicator_line_col)
     
+    def calculate_divergence_batch(self,
+                                   data: ColumnSource,
+                                   start_idx: Sequence[int],
+                                   end_idx: Sequence[int],
+                                   indicator_col: str,
+                                   indicator_line_col: str = None) -> List[DivergenceMetrics]:
+        """
+        Calculate divergence metrics of many zones of one frame at once.
+        
+        Price and indicator extrema are detected once over the full series
+        (:func:`series_extrema`). A zone keeps the extrema strictly inside its
+        window whose prominence reaches the zone threshold of
+        :meth:`calculate_divergence` (a fraction of the zone standard
+        deviation); consecutive price extrema of a zone are paired with the
+        nearest indicator extrema of the same zone via ``searchsorted``.
+        
+        Unlike slicing, the extrema are those of the whole series: the
+        ``min_peak_distance`` spacing and the prominence are evaluated against
+        bars outside the zone as well. For a zone covering the full series the
+        result equals :meth:`calculate_divergence`.
+        
+        Args:
+            data: Full-length columns (DataFrame, ZoneColumnStore or a mapping
+                of NumPy arrays) with ``close``, ``high``, ``low`` and the
+                oscillator column(s)
+            start_idx: Inclusive zone start positions
+            end_idx: Inclusive zone end positions
+            indicator_col: Name of oscillator column
+            indicator_line_col: Optional signal line column (used for the
+                indicator extrema instead of ``indicator_col``)
+        
+        Returns:
+            One DivergenceMetrics per zone (in input order)
+        """
+        get, columns, n_rows = _column_getter(data)
+        required_cols = ['close', 'high', 'low', indicator_col]
+        if indicator_line_col:
+            required_cols.append(indicator_line_col)
+        missing_cols = [col for col in required_cols if col not in columns]
+        if missing_cols:
+            raise ValueError(f"Zone data must contain columns: {missing_cols}")
+        
+        seg = ZoneSegments(start_idx, end_idx, n_rows)
+        if len(seg) == 0:
+            return []
+        
+        price_highs = np.asarray(get('high'), dtype=float)
+        price_lows = np.asarray(get('low'), dtype=float)
+        indicator_values = np.asarray(get(indicator_line_col or indicator_col), dtype=float)
+        
+        distance = self.min_peak_distance
+        indicator_threshold = self._zone_std(seg, indicator_values) * 0.3
+        # Slopes are compared in the original space; troughs are maxima of -values
+        divergences = [
+            self._batch_regular(
+                seg, price_highs, indicator_values,
+                series_extrema(price_highs, distance), self._zone_std(seg, price_highs) * 0.5,
+                series_extrema(indicator_values, distance), indicator_threshold,
+                bearish=True,
+            ),
+            self._batch_regular(
+                seg, price_lows, indicator_values,
+                series_extrema(-price_lows, distance), self._zone_std(seg, price_lows) * 0.5,
+                series_extrema(-indicator_values, distance), indicator_threshold,
+                bearish=False,
+            ),
+        ]
+        
+        n_zones = len(seg)
+        bearish_count, bullish_count = (
+            np.bincount(zone_ids, minlength=n_zones) for zone_ids, _ in divergences
+        )
+        strength_sum = sum(
+            np.bincount(zone_ids, weights=strengths, minlength=n_zones)
+            for zone_ids, strengths in divergences
+        )
+        counts = bearish_count + bullish_count
+        with np.errstate(invalid='ignore', divide='ignore'):
+            avg_strength = np.where(counts > 0, strength_sum / np.maximum(counts, 1), 0.0)
+        long_enough = seg.lengths >= self.min_peak_distance * 2
+        
+        results = []
+        for zone, count in enumerate(counts.tolist()):
+            if count == 0 or not long_enough[zone]:
+                results.append(self._empty_metrics(indicator_col, indicator_line_col))
+                continue
+            results.append(self._build_metrics(
+                count, float(avg_strength[zone]),
+                int(bullish_count[zone]), int(bearish_count[zone]),
+                indicator_col, indicator_line_col,
+            ))
+        return results
+    
+    @staticmethod
+    def _zone_std(seg: ZoneSegments, values: np.ndarray) -> np.ndarray:
+        """Population std per zone; NaN for zones containing NaN (like ``np.std``)."""
+        flat = seg.gather(values)
+        std = seg.std(flat, ddof=0)
+        return np.where(seg.count(flat) == seg.lengths, std, np.nan)
+    
+    @staticmethod
+    def _zone_extrema(seg: ZoneSegments,
+                      extrema: SeriesExtrema,
+                      threshold: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Extrema of every zone, ordered by zone and position.
+        
+        Keeps the extrema strictly inside a zone window (a slice never reports
+        its edge bars) whose prominence reaches the zone threshold.
+        
+        Returns:
+            Tuple of (zone_ids, positions)
+        """
+        lo = np.searchsorted(extrema.positions, seg.starts, side='right')
+        hi = np.searchsorted(extrema.positions, seg.ends, side='left')
+        counts = np.maximum(hi - lo, 0)
+        zone_ids = np.repeat(np.arange(len(seg)), counts)
+        offsets = np.cumsum(counts) - counts
+        members = np.repeat(lo - offsets, counts) + np.arange(int(counts.sum()))
+        
+        with np.errstate(invalid='ignore'):
+            keep = extrema.prominences[members] >= threshold[zone_ids]
+        return zone_ids[keep], extrema.positions[members[keep]]
+    
+    def _batch_regular(self,
+                       seg: ZoneSegments,
+                       price_values: np.ndarray,
+                       indicator_values: np.ndarray,
+                       price_extrema: SeriesExtrema,
+                       price_threshold: np.ndarray,
+                       indicator_extrema: SeriesExtrema,
+                       indicator_threshold: np.ndarray,
+                       bearish: bool) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Regular divergences of all zones for one direction.
+        
+        Bearish: price higher high with indicator lower high (peaks); bullish:
+        price lower low with indicator higher low (troughs).
+        
+        Returns:
+            Tuple of (zone_ids, strengths), one entry per divergence
+        """
+        price_zone, price_pos = self._zone_extrema(seg, price_extrema, price_threshold)
+        ind_zone, ind_pos = self._zone_extrema(seg, indicator_extrema, indicator_threshold)
+        
+        # Consecutive price extrema of one zone; zones need >= 2 indicator extrema
+        enough = np.bincount(ind_zone, minlength=len(seg)) >= 2
+        pair = np.flatnonzero(
+            (price_zone[:-1] == price_zone[1:]) & enough[price_zone[:-1]]
+        )
+        pair_zone = price_zone[pair]
+        p1, p2 = price_pos[pair], price_pos[pair + 1]
+        
+        # One stride for building and searching the keys (positions < stride)
+        stride = len(price_values) + 1
+        ind_keys = ind_zone.astype(np.int64) * stride + ind_pos
+        i1, found1 = self._nearest_extremum(ind_keys, ind_pos, pair_zone, p1, stride)
+        i2, found2 = self._nearest_extremum(ind_keys, ind_pos, pair_zone, p2, stride)
+        
+        price_slope = price_values[p2] - price_values[p1]
+        indicator_slope = indicator_values[i2] - indicator_values[i1]
+        if bearish:
+            diverges = (price_slope > 0) & (indicator_slope < 0)
+        else:
+            diverges = (price_slope < 0) & (indicator_slope > 0)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            strength = (
+                np.abs(price_slope / price_values[p1])
+                * np.abs(indicator_slope / indicator_values[i1])
+            )
+            valid = found1 & found2 & diverges & (strength >= self.min_divergence_strength)
+        return pair_zone[valid], strength[valid]
+    
+    @staticmethod
+    def _nearest_extremum(keys: np.ndarray,
+                          positions: np.ndarray,
+                          zone_ids: np.ndarray,
+                          targets: np.ndarray,
+                          stride: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Nearest extremum of the same zone for every target position.
+        
+        ``keys`` (``zone * stride + position``) are sorted, so the two
+        candidates are the neighbours of the ``searchsorted`` insertion point;
+        ties go to the earlier extremum, like :meth:`_find_nearest_peak`.
+        
+        Returns:
+            Tuple of (positions, found mask); positions are 0 where not found
+        """
+        if len(keys) == 0:
+            empty = np.zeros(len(targets), dtype=np.int64)
+            return empty, np.zeros(len(targets), dtype=bool)
+        right = np.searchsorted(keys, zone_ids * stride + targets, side='left')
+        left = right - 1
+        right_c = np.minimum(right, len(keys) - 1)
+        left_c = np.maximum(left, 0)
+        
+        max_distance = NEAREST_EXTREMUM_DISTANCE
+        left_dist = np.where(
+            (left >= 0) & (keys[left_c] // stride == zone_ids),
+            targets - positions[left_c], max_distance + 1,
+        )
+        right_dist = np.where(
+            (right < len(keys)) & (keys[right_c] // stride == zone_ids),
+            positions[right_c] - targets, max_distance + 1,
+        )
+        use_right = right_dist < left_dist
+        nearest = np.where(use_right, positions[right_c], positions[left_c])
+        found = np.minimum(left_dist, right_dist) <= max_distance
+        return np.where(found, nearest, 0), found
+    
     def _find_price_extrema(self, zone_data: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
         """
         Find price peaks and troughs using scipy.signal.find_peaks.
@@ -373,23 +628,31 @@ class ClassicDivergenceStrategy:
         """
         Calculate aggregated metrics from detected divergences.
         """
-        # Count divergences by type
-        regular_count = sum(1 for d in divergences if d['type'] == 'regular')
-        
-        # Determine overall type
-        if regular_count > 0:
-            div_type = 'regular'
-        else:
-            div_type = 'none'
-        
         # Calculate average strength
         strengths = [d['strength'] for d in divergences]
         avg_strength = np.mean(strengths) if strengths else 0.0
         
-        # Determine direction (majority vote)
+        # Count by direction (majority vote in _build_metrics)
         bullish_count = sum(1 for d in divergences if d['direction'] == 'bullish')
         bearish_count = sum(1 for d in divergences if d['direction'] == 'bearish')
         
+        return self._build_metrics(
+            len(divergences), float(avg_strength), bullish_count, bearish_count,
+            indicator_col, indicator_line_col
+        )
+    
+    def _build_metrics(self,
+                       divergence_count: int,
+                       avg_strength: float,
+                       bullish_count: int,
+                       bearish_count: int,
+                       indicator_col: str,
+                       indicator_line_col: str = None) -> DivergenceMetrics:
+        """Overall type, majority direction and validated DivergenceMetrics."""
+        # Only regular divergences are detected so far
+        div_type = 'regular' if divergence_count > 0 else 'none'
+        
+        # Determine direction (majority vote)
         if bullish_count > bearish_count:
             direction = 'bullish'
         elif bearish_count > bullish_count:
@@ -399,7 +662,7 @@ class ClassicDivergenceStrategy:
         
         result = DivergenceMetrics(
             divergence_type=div_type,
-            divergence_count=len(divergences),
+            divergence_count=divergence_count,
             divergence_strength=float(avg_strength),
             divergence_direction=direction,
             strategy_name='classic',
@@ -6,15 +6,16 @@ and filters them by minimum amplitude to get significant swings.
 """
 
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Sequence
 
 import numpy as np
 import pandas as pd
 from scipy.signal import find_peaks
 
-from ...models import SwingContext, SwingPoint, ZoneInfo
+from ...models import SwingContext, ZoneInfo
 from ..base import SwingMetrics
 from ..registry import StrategyRegistry
+from .movements import SwingMovements, batch_movement_metrics, movement_metrics, swing_movements
 from .....core.logging_config import get_logger
 
 logger = get_logger(__name__)
@@ -50,67 +51,37 @@ class FindPeaksSwingStrategy:
                 strategy_params=self._build_strategy_params(prominence_value),
             )
 
-        swing_points: List[SwingPoint] = []
-        indices: List[int] = []
+        indices = np.array([point['index'] for point in extrema], dtype=np.int64)
+        prices = np.array([point['price'] for point in extrema], dtype=float)
+        swing_types = [point['type'] for point in extrema]
 
         high_arr = full_data['high'].to_numpy(dtype=float)
         low_arr = full_data['low'].to_numpy(dtype=float)
         full_len = len(full_data)
 
-        for point_id, point in enumerate(extrema):
-            timestamp = point['timestamp']
-            ts = (
-                timestamp.to_pydatetime()
-                if hasattr(timestamp, "to_pydatetime")
-                else timestamp
-            )
-            index_position = int(point['index'])
-            price = point['price']
-
-            amplitude_to_next: Optional[float] = None
-            duration_to_next: Optional[int] = None
-            if point_id < len(extrema) - 1:
-                next_point = extrema[point_id + 1]
-                next_price = next_point['price']
-                if price != 0:
-                    amplitude_to_next = (next_price / price - 1) * 100
-                duration_to_next = max(
-                    0, int(next_point['index']) - index_position
-                )
-
-            confirmation_index = self._confirmation_index(
-                index_position,
-                float(price),
-                point['type'],
+        confirmation_index = [
+            self._confirmation_index(
+                index,
+                price,
+                swing_type,
                 prominence_value,
                 high_arr,
                 low_arr,
                 full_len,
             )
-
-            swing_points.append(
-                SwingPoint(
-                    point_id=point_id,
-                    timestamp=ts,
-                    index=index_position,
-                    price=float(price),
-                    swing_type=point['type'],
-                    amplitude_to_next=amplitude_to_next,
-                    duration_to_next=duration_to_next,
-                    strategy_name='find_peaks',
-                    strategy_params=self._build_strategy_params(prominence_value),
-                    confirmation_index=confirmation_index,
-                )
-            )
-            indices.append(index_position)
+            for index, price, swing_type in zip(indices.tolist(), prices.tolist(), swing_types)
+        ]
 
         logger.info(
-            "FindPeaks global: detected %d swing points", len(swing_points)
+            "FindPeaks global: detected %d swing points", len(indices)
         )
 
-        return SwingContext(
-            swing_points=swing_points,
-            indices=np.asarray(indices, dtype=int),
+        return SwingContext.from_arrays(
+            indices,
+            prices,
+            swing_types,
+            full_data.index[indices],
+            confirmation_index=confirmation_index,
             full_data_length=len(full_data),
             strategy_name='find_peaks',
             strategy_params=self._build_strategy_params(prominence_value),
@@ -129,9 +100,11 @@ class FindPeaksSwingStrategy:
             )
             return self._empty_metrics()
 
-        rallies, drops = self._build_movements_from_points(zone_swings)
+        movements = swing_movements(
+            zone_swings.indices, zone_swings.prices, self.min_amplitude_pct
+        )
 
-        if not rallies and not drops:
+        if not len(movements):
             logger.debug(
                 "Zone %s: no valid movements after amplitude filtering",
                 zone.zone_id,
@@ -139,11 +112,27 @@ class FindPeaksSwingStrategy:
             return self._empty_metrics()
 
         return self._aggregate_metrics(
-            rallies,
-            drops,
+            movements,
             params=context.strategy_params,
         )
 
+    def aggregate_for_zones(
+        self, zones: Sequence[ZoneInfo], context: SwingContext
+    ) -> List[SwingMetrics]:
+        """Aggregate global swings for many zones in one vectorized pass."""
+
+        metrics = batch_movement_metrics(
+            context,
+            zones,
+            strategy_name='find_peaks',
+            strategy_params=context.strategy_params or self._default_strategy_params(),
+            min_amplitude_pct=self.min_amplitude_pct,
+        )
+        return [
+            metric if metric.rally_count or metric.drop_count else self._empty_metrics()
+            for metric in metrics
+        ]
+
     def calculate(self, zone_data: pd.DataFrame) -> SwingMetrics:
         """Calculate comprehensive swing metrics using find_peaks algorithm."""
 
@@ -162,9 +151,13 @@ class FindPeaksSwingStrategy:
                 )
                 return self._empty_metrics()
 
-            rallies, drops = self._build_movements_from_extrema(extrema)
+            movements = swing_movements(
+                [point['index'] for point in extrema],
+                [point['price'] for point in extrema],
+                self.min_amplitude_pct,
+            )
 
-            if not rallies and not drops:
+            if not len(movements):
                 logger.debug(
                     "Extrema filtered out by amplitude threshold: min_amplitude_pct=%.2f",
                     self.min_amplitude_pct,
@@ -172,8 +165,7 @@ class FindPeaksSwingStrategy:
                 return self._empty_metrics()
 
             return self._aggregate_metrics(
-                rallies,
-                drops,
+                movements,
                 params=self._build_strategy_params(prominence_value),
             )
 
@@ -223,185 +215,32 @@ class FindPeaksSwingStrategy:
         extrema.sort(key=lambda item: item['index'])
         return extrema
 
-    def _build_movements_from_extrema(
-        self, extrema: List[Dict[str, Any]]
-    ) -> Tuple[List[Dict[str, float]], List[Dict[str, float]]]:
-        rallies: List[Dict[str, float]] = []
-        drops: List[Dict[str, float]] = []
-
-        for i in range(1, len(extrema)):
-            prev = extrema[i - 1]
-            curr = extrema[i]
-
-            duration_bars = int(curr['index'] - prev['index'])
-            if duration_bars <= 0 or prev['price'] == 0:
-                continue
-
-            price_change_pct = (curr['price'] / prev['price'] - 1) * 100
-            if abs(price_change_pct) < self.min_amplitude_pct * 100:
-                continue
-
-            movement = {
-                'amplitude_pct': abs(price_change_pct),
-                'duration_bars': duration_bars,
-                'speed_pct_per_bar': abs(price_change_pct) / duration_bars,
-            }
-
-            if price_change_pct > 0:
-                rallies.append(movement)
-            elif price_change_pct < 0:
-                drops.append(movement)
-
-        return rallies, drops
-
-    def _build_movements_from_points(
-        self, swings: List[SwingPoint]
-    ) -> Tuple[List[Dict[str, float]], List[Dict[str, float]]]:
-        rallies: List[Dict[str, float]] = []
-        drops: List[Dict[str, float]] = []
-
-        for i in range(len(swings) - 1):
-            curr = swings[i]
-            nxt = swings[i + 1]
-
-            duration_bars = nxt.index - curr.index
-            if duration_bars <= 0 or curr.price == 0:
-                continue
-
-            price_change_pct = (nxt.price / curr.price - 1) * 100
-            if abs(price_change_pct) < self.min_amplitude_pct * 100:
-                continue
-
-            movement = {
-                'amplitude_pct': abs(price_change_pct),
-                'duration_bars': int(duration_bars),
-                'speed_pct_per_bar': abs(price_change_pct) / duration_bars,
-            }
-
-            if price_change_pct > 0:
-                rallies.append(movement)
-            elif price_change_pct < 0:
-                drops.append(movement)
-
-        return rallies, drops
-
     def _aggregate_metrics(
         self,
-        rallies: List[Dict[str, float]],
-        drops: List[Dict[str, float]],
+        movements: SwingMovements,
         *,
         params: Optional[Dict[str, Any]] = None,
     ) -> SwingMetrics:
-        rally_count = len(rallies)
-        drop_count = len(drops)
-
-        if rally_count > 0:
-            rally_amps = [r['amplitude_pct'] for r in rallies]
-            avg_rally_pct = float(np.mean(rally_amps))
-            max_rally_pct = float(np.max(rally_amps))
-            min_rally_pct = float(np.min(rally_amps))
-            rally_amplitude_std = float(np.std(rally_amps))
-            rally_amplitude_median = float(np.median(rally_amps))
-        else:
-            avg_rally_pct = max_rally_pct = min_rally_pct = 0.0
-            rally_amplitude_std = rally_amplitude_median = 0.0
-
-        if drop_count > 0:
-            drop_amps = [d['amplitude_pct'] for d in drops]
-            avg_drop_pct = float(np.mean(drop_amps))
-            max_drop_pct = float(np.max(drop_amps))
-            min_drop_pct = float(np.min(drop_amps))
-            drop_amplitude_std = float(np.std(drop_amps))
-            drop_amplitude_median = float(np.median(drop_amps))
-        else:
-            avg_drop_pct = max_drop_pct = min_drop_pct = 0.0
-            drop_amplitude_std = drop_amplitude_median = 0.0
-
-        if rally_count > 0:
-            rally_durs = [r['duration_bars'] for r in rallies]
-            avg_rally_duration_bars = float(np.mean(rally_durs))
-            max_rally_duration_bars = int(np.max(rally_durs))
-        else:
-            avg_rally_duration_bars = 0.0
-            max_rally_duration_bars = 0
-
-        if drop_count > 0:
-            drop_durs = [d['duration_bars'] for d in drops]
-            avg_drop_duration_bars = float(np.mean(drop_durs))
-            max_drop_duration_bars = int(np.max(drop_durs))
-        else:
-            avg_drop_duration_bars = 0.0
-            max_drop_duration_bars = 0
-
-        if rally_count > 0:
-            rally_speeds = [r['speed_pct_per_bar'] for r in rallies]
-            avg_rally_speed_pct_per_bar = float(np.mean(rally_speeds))
-            max_rally_speed_pct_per_bar = float(np.max(rally_speeds))
-        else:
-            avg_rally_speed_pct_per_bar = 0.0
-            max_rally_speed_pct_per_bar = 0.0
-
-        if drop_count > 0:
-            drop_speeds = [d['speed_pct_per_bar'] for d in drops]
-            avg_drop_speed_pct_per_bar = float(np.mean(drop_speeds))
-            max_drop_speed_pct_per_bar = float(np.max(drop_speeds))
-        else:
-            avg_drop_speed_pct_per_bar = 0.0
-            max_drop_speed_pct_per_bar = 0.0
-
-        rally_to_drop_ratio = (
-            avg_rally_pct / avg_drop_pct if avg_drop_pct > 0 else 0.0
-        )
-        duration_symmetry = (
-            avg_rally_duration_bars / avg_drop_duration_bars
-            if avg_drop_duration_bars > 0
-            else 0.0
+        metrics = movement_metrics(
+            movements,
+            'find_peaks',
+            params or self._default_strategy_params(),
         )
 
-        num_swings = min(rally_count, drop_count)
-
-        metrics = SwingMetrics(
-            num_swings=num_swings,
-            avg_rally_pct=avg_rally_pct,
-            avg_drop_pct=avg_drop_pct,
-            max_rally_pct=max_rally_pct,
-            max_drop_pct=max_drop_pct,
-            rally_to_drop_ratio=rally_to_drop_ratio,
-            rally_count=rally_count,
-            drop_count=drop_count,
-            min_rally_pct=min_rally_pct,
-            min_drop_pct=min_drop_pct,
-            rally_amplitude_std=rally_amplitude_std,
-            drop_amplitude_std=drop_amplitude_std,
-            rally_amplitude_median=rally_amplitude_median,
-            drop_amplitude_median=drop_amplitude_median,
-            avg_rally_duration_bars=avg_rally_duration_bars,
-            avg_drop_duration_bars=avg_drop_duration_bars,
-            max_rally_duration_bars=max_rally_duration_bars,
-            max_drop_duration_bars=max_drop_duration_bars,
-            avg_rally_speed_pct_per_bar=avg_rally_speed_pct_per_bar,
-            avg_drop_speed_pct_per_bar=avg_drop_speed_pct_per_bar,
-            max_rally_speed_pct_per_bar=max_rally_speed_pct_per_bar,
-            max_drop_speed_pct_per_bar=max_drop_speed_pct_per_bar,
-            duration_symmetry=duration_symmetry,
-            strategy_name='find_peaks',
-            strategy_params=params
-            or self._build_strategy_params(
-                None if self.prominence is None else float(self.prominence)
-            ),
-        )
-
-        metrics.validate()
-
         logger.debug(
             "FindPeaks metrics: %d rallies, %d drops, ratio=%.2f",
-            rally_count,
-            drop_count,
-            rally_to_drop_ratio,
+            metrics.rally_count,
+            metrics.drop_count,
+            metrics.rally_to_drop_ratio,
         )
 
         return metrics
 
+    def _default_strategy_params(self) -> Dict[str, Any]:
+        return self._build_strategy_params(
+            None if self.prominence is None else float(self.prominence)
+        )
+
     def _confirmation_index(
         self,
         index: int,
@@ -456,11 +295,8 @@ class FindPeaksSwingStrategy:
 
     def _empty_metrics(self) -> SwingMetrics:
         return self._aggregate_metrics(
-            [],
-            [],
-            params=self._build_strategy_params(
-                None if self.prominence is None else float(self.prominence)
-            ),
+            swing_movements([], []),
+            params=self._default_strategy_params(),
         )
 
     def _validate_input(self, data: pd.DataFrame) -> None:
@@ -0,0 +1,343 @@
+"""
+Swing movement engine shared by the swing strategies.
+
+A movement is the leg between two consecutive swing points: a rally when the
+price rises, a drop when it falls. :func:`swing_movements` computes the legs of
+one zone from position/price arrays in a single vectorized pass and
+:func:`movement_metrics` reduces them to :class:`SwingMetrics`.
+:func:`batch_movement_metrics` aggregates many zones of one
+:class:`SwingContext` at once with segment reductions over the global legs.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ...models import SwingContext, ZoneInfo
+from ..base import SwingMetrics
+
+_STAT_FIELDS = (
+    'count',
+    'avg_pct',
+    'max_pct',
+    'min_pct',
+    'amplitude_std',
+    'amplitude_median',
+    'avg_duration_bars',
+    'max_duration_bars',
+    'avg_speed_pct_per_bar',
+    'max_speed_pct_per_bar',
+)
+
+
+@dataclass(frozen=True)
+class SwingMovements:
+    """Valid legs of a swing sequence as parallel arrays.
+
+    Attributes:
+        amplitude_pct: Absolute price change of every leg (%).
+        duration_bars: Length of every leg in bars (int64, always > 0).
+        speed_pct_per_bar: ``amplitude_pct / duration_bars``.
+        is_rally: ``True`` for rallies, ``False`` for drops.
+    """
+
+    amplitude_pct: np.ndarray
+    duration_bars: np.ndarray
+    speed_pct_per_bar: np.ndarray
+    is_rally: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.amplitude_pct)
+
+    @property
+    def rally_count(self) -> int:
+        return int(np.count_nonzero(self.is_rally))
+
+    @property
+    def drop_count(self) -> int:
+        return len(self) - self.rally_count
+
+
+def _leg_arrays(
+    indices: np.ndarray,
+    prices: np.ndarray,
+    min_amplitude_pct: float,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Signed % change, duration and validity of every consecutive leg."""
+    durations = np.diff(indices)
+    start_prices = prices[:-1]
+    valid = (durations > 0) & (start_prices != 0)
+    change_pct = np.zeros(len(durations))
+    change_pct[valid] = (prices[1:][valid] / start_prices[valid] - 1) * 100
+    # Flat (and NaN) legs are neither rallies nor drops.
+    valid &= (change_pct > 0) | (change_pct < 0)
+    if min_amplitude_pct:
+        valid &= np.abs(change_pct) >= min_amplitude_pct * 100
+    return change_pct, durations, valid
+
+
+def swing_movements(
+    indices: Any,
+    prices: Any,
+    min_amplitude_pct: float = 0.0,
+) -> SwingMovements:
+    """
+    Rallies and drops between consecutive swing points.
+
+    Legs spanning zero bars or starting at a zero price are skipped, as are
+    legs whose absolute change is below ``min_amplitude_pct``.
+
+    Args:
+        indices: Positions of the swing points (ascending).
+        prices: Prices of the swing points.
+        min_amplitude_pct: Minimum leg size as a fraction (``0.02`` = 2%).
+
+    Returns:
+        :class:`SwingMovements` of the valid legs, in order.
+    """
+    indices = np.asarray(indices, dtype=np.int64)
+    prices = np.asarray(prices, dtype=np.float64)
+    if len(indices) < 2:
+        return SwingMovements(
+            np.empty(0), np.empty(0, dtype=np.int64), np.empty(0), np.empty(0, dtype=bool)
+        )
+
+    change_pct, durations, valid = _leg_arrays(indices, prices, min_amplitude_pct)
+    amplitude = np.abs(change_pct[valid])
+    durations = durations[valid]
+    return SwingMovements(
+        amplitude_pct=amplitude,
+        duration_bars=durations,
+        speed_pct_per_bar=amplitude / durations,
+        is_rally=change_pct[valid] > 0,
+    )
+
+
+def _leg_stats(amplitude: np.ndarray, durations: np.ndarray, speeds: np.ndarray) -> Dict[str, Any]:
+    if len(amplitude) == 0:
+        return dict.fromkeys(_STAT_FIELDS, 0.0) | {'count': 0, 'max_duration_bars': 0}
+    return {
+        'count': len(amplitude),
+        'avg_pct': float(np.mean(amplitude)),
+        'max_pct': float(np.max(amplitude)),
+        'min_pct': float(np.min(amplitude)),
+        'amplitude_std': float(np.std(amplitude)),
+        'amplitude_median': float(np.median(amplitude)),
+        'avg_duration_bars': float(np.mean(durations)),
+        'max_duration_bars': int(np.max(durations)),
+        'avg_speed_pct_per_bar': float(np.mean(speeds)),
+        'max_speed_pct_per_bar': float(np.max(speeds)),
+    }
+
+
+def _build_metrics(
+    rally: Dict[str, Any],
+    drop: Dict[str, Any],
+    strategy_name: str,
+    strategy_params: Dict[str, Any],
+) -> SwingMetrics:
+    metrics = SwingMetrics(
+        num_swings=min(rally['count'], drop['count']),
+        avg_rally_pct=rally['avg_pct'],
+        avg_drop_pct=drop['avg_pct'],
+        max_rally_pct=rally['max_pct'],
+        max_drop_pct=drop['max_pct'],
+        rally_to_drop_ratio=(
+            rally['avg_pct'] / drop['avg_pct'] if drop['avg_pct'] > 0 else 0.0
+        ),
+        rally_count=rally['count'],
+        drop_count=drop['count'],
+        min_rally_pct=rally['min_pct'],
+        min_drop_pct=drop['min_pct'],
+        rally_amplitude_std=rally['amplitude_std'],
+        drop_amplitude_std=drop['amplitude_std'],
+        rally_amplitude_median=rally['amplitude_median'],
+        drop_amplitude_median=drop['amplitude_median'],
+        avg_rally_duration_bars=rally['avg_duration_bars'],
+        avg_drop_duration_bars=drop['avg_duration_bars'],
+        max_rally_duration_bars=rally['max_duration_bars'],
+        max_drop_duration_bars=drop['max_duration_bars'],
+        avg_rally_speed_pct_per_bar=rally['avg_speed_pct_per_bar'],
+        avg_drop_speed_pct_per_bar=drop['avg_speed_pct_per_bar'],
+        max_rally_speed_pct_per_bar=rally['max_speed_pct_per_bar'],
+        max_drop_speed_pct_per_bar=drop['max_speed_pct_per_bar'],
+        duration_symmetry=(
+            rally['avg_duration_bars'] / drop['avg_duration_bars']
+            if drop['avg_duration_bars'] > 0
+            else 0.0
+        ),
+        strategy_name=strategy_name,
+        strategy_params=strategy_params,
+    )
+    metrics.validate()
+    return metrics
+
+
+def movement_metrics(
+    movements: SwingMovements,
+    strategy_name: str,
+    strategy_params: Dict[str, Any],
+) -> SwingMetrics:
+    """
+    Reduce the movements of one zone to :class:`SwingMetrics`.
+
+    Args:
+        movements: Output of :func:`swing_movements`.
+        strategy_name: Strategy name stored in the metrics.
+        strategy_params: Strategy parameters stored in the metrics.
+
+    Returns:
+        Validated :class:`SwingMetrics` (all zeros when there are no movements).
+    """
+    rally = movements.is_rally
+    drop = ~rally
+    return _build_metrics(
+        _leg_stats(movements.amplitude_pct[rally], movements.duration_bars[rally], movements.speed_pct_per_bar[rally]),
+        _leg_stats(movements.amplitude_pct[drop], movements.duration_bars[drop], movements.speed_pct_per_bar[drop]),
+        strategy_name,
+        strategy_params,
+    )
+
+
+def _segment_extreme(ufunc, values: np.ndarray, starts: np.ndarray, nonempty: np.ndarray, fill) -> np.ndarray:
+    out = np.full(len(starts), fill, dtype=values.dtype)
+    if nonempty.any():
+        out[nonempty] = ufunc.reduceat(values, starts[nonempty])
+    return out
+
+
+def _segment_stats(
+    segment: np.ndarray,
+    amplitude: np.ndarray,
+    durations: np.ndarray,
+    n_segments: int,
+) -> Dict[str, np.ndarray]:
+    """Per-segment leg statistics; ``segment`` must be sorted ascending."""
+    counts = np.bincount(segment, minlength=n_segments)
+    nonempty = counts > 0
+    safe_counts = np.maximum(counts, 1)
+    starts = np.searchsorted(segment, np.arange(n_segments))
+    speeds = amplitude / durations
+
+    avg_pct = np.bincount(segment, weights=amplitude, minlength=n_segments) / safe_counts
+    deviation = amplitude - avg_pct[segment]
+    amplitude_std = np.sqrt(
+        np.bincount(segment, weights=deviation * deviation, minlength=n_segments) / safe_counts
+    )
+
+    ordered = amplitude[np.lexsort((amplitude, segment))]
+    lower = np.minimum(starts + (counts - 1) // 2, max(len(ordered) - 1, 0))
+    upper = np.minimum(starts + counts // 2, max(len(ordered) - 1, 0))
+    amplitude_median = np.zeros(n_segments)
+    if len(ordered):
+        amplitude_median = np.where(nonempty, (ordered[lower] + ordered[upper]) / 2, 0.0)
+
+    return {
+        'count': counts,
+        'avg_pct': avg_pct,
+        'max_pct': _segment_extreme(np.maximum, amplitude, starts, nonempty, 0.0),
+        'min_pct': _segment_extreme(np.minimum, amplitude, starts, nonempty, 0.0),
+        'amplitude_std': amplitude_std,
+        'amplitude_median': amplitude_median,
+        'avg_duration_bars': np.bincount(segment, weights=durations, minlength=n_segments) / safe_counts,
+        'max_duration_bars': _segment_extreme(np.maximum, durations, starts, nonempty, 0),
+        'avg_speed_pct_per_bar': np.bincount(segment, weights=speeds, minlength=n_segments) / safe_counts,
+        'max_speed_pct_per_bar': _segment_extreme(np.maximum, speeds, starts, nonempty, 0.0),
+    }
+
+
+def _stat_rows(stats: Dict[str, np.ndarray]) -> List[Dict[str, Any]]:
+    columns = [stats[name].tolist() for name in _STAT_FIELDS]
+    return [dict(zip(_STAT_FIELDS, row)) for row in zip(*columns)]
+
+
+def zone_point_ranges(
+    context: SwingContext,
+    zones: Sequence[ZoneInfo],
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Vectorized :meth:`SwingContext.slice` bounds (``start``, ``stop``) of every zone."""
+    zone_starts = np.fromiter((zone.start_idx for zone in zones), dtype=np.int64, count=len(zones))
+    zone_ends = np.fromiter((zone.end_idx for zone in zones), dtype=np.int64, count=len(zones))
+    left = np.searchsorted(context.indices, zone_starts, side='left')
+    right = np.searchsorted(context.indices, zone_ends, side='right')
+    start = np.maximum(left - 1, 0)
+    stop = np.maximum(np.minimum(right + 1, context.num_points), start)
+    return start, stop
+
+
+def batch_movement_metrics(
+    context: SwingContext,
+    zones: Sequence[ZoneInfo],
+    *,
+    strategy_name: str,
+    strategy_params: Dict[str, Any],
+    min_amplitude_pct: float = 0.0,
+) -> List[SwingMetrics]:
+    """
+    Swing metrics of many zones from one global context.
+
+    Legs are computed once for the whole context; each zone selects the legs
+    of its :meth:`SwingContext.slice` range (neighbour points included) and
+    the statistics are reduced per zone with ``bincount``/``reduceat``
+    segment reductions. Results equal calling :func:`swing_movements` and
+    :func:`movement_metrics` zone by zone, up to floating-point summation order.
+
+    Args:
+        context: Global swing context.
+        zones: Zones to aggregate.
+        strategy_name: Strategy name stored in the metrics.
+        strategy_params: Strategy parameters stored in the metrics.
+        min_amplitude_pct: Minimum leg size as a fraction.
+
+    Returns:
+        One :class:`SwingMetrics` per zone, in zone order.
+    """
+    n_zones = len(zones)
+    if n_zones == 0:
+        return []
+
+    start, stop = zone_point_ranges(context, zones)
+    leg_counts = np.maximum(stop - start - 1, 0)
+
+    if context.num_points >= 2:
+        change_pct, durations, valid = _leg_arrays(
+            context.indices, context.prices, min_amplitude_pct
+        )
+    else:
+        change_pct = np.empty(0)
+        durations = np.empty(0, dtype=np.int64)
+        valid = np.empty(0, dtype=bool)
+
+    # Zones overlap by their neighbour points, so legs are gathered per zone.
+    total = int(leg_counts.sum())
+    offsets = np.cumsum(leg_counts) - leg_counts
+    legs = np.repeat(start - offsets, leg_counts) + np.arange(total)
+    segment = np.repeat(np.arange(n_zones), leg_counts)
+
+    keep = valid[legs]
+    legs, segment = legs[keep], segment[keep]
+    change = change_pct[legs]
+    amplitude = np.abs(change)
+    leg_durations = durations[legs]
+    rally = change > 0
+
+    rally_rows = _stat_rows(
+        _segment_stats(segment[rally], amplitude[rally], leg_durations[rally], n_zones)
+    )
+    drop_rows = _stat_rows(
+        _segment_stats(segment[~rally], amplitude[~rally], leg_durations[~rally], n_zones)
+    )
+    return [
+        _build_metrics(rally_stats, drop_stats, strategy_name, strategy_params)
+        for rally_stats, drop_stats in zip(rally_rows, drop_rows)
+    ]
+
+
+__all__ = [
+    'SwingMovements',
+    'swing_movements',
+    'movement_metrics',
+    'zone_point_ranges',
+    'batch_movement_metrics',
+]
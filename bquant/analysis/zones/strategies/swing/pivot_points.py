@@ -8,19 +8,75 @@ and after it.
 """
 
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Sequence
 
 import numpy as np
 import pandas as pd
 
-from ...models import SwingContext, SwingPoint, ZoneInfo
+from ...models import SwingContext, ZoneInfo
 from ..base import SwingMetrics
 from ..registry import StrategyRegistry
+from .movements import SwingMovements, batch_movement_metrics, movement_metrics, swing_movements
 from .....core.logging_config import get_logger
 
 logger = get_logger(__name__)
 
 
+def _window_reduce(values: np.ndarray, window: int, ufunc: np.ufunc) -> np.ndarray:
+    """``ufunc``-reduction of every length-``window`` window (O(n log window)).
+
+    Doubling spans: after step ``s`` the accumulator holds the reduction of
+    ``values[k:k + 2**s]``; a window is the union of two overlapping
+    power-of-two spans. ``np.maximum``/``np.minimum`` propagate NaN.
+    """
+    acc = values
+    span = 1
+    while span * 2 <= window:
+        acc = ufunc(acc[:-span], acc[span:])
+        span *= 2
+    count = len(values) - window + 1
+    return ufunc(acc[:count], acc[window - span:window - span + count])
+
+
+def pivot_indices(values: np.ndarray, left_bars: int, right_bars: int, kind: str = 'high') -> np.ndarray:
+    """Positions of strict N-bar pivots in ``values``.
+
+    Bar ``i`` is a pivot high when ``values[i]`` is strictly greater than every
+    value in ``[i - left_bars, i)`` and in ``(i, i + right_bars]`` (strictly
+    lower for ``kind='low'``). Window maxima/minima are sliding-window
+    reductions over the whole array instead of a Python loop per bar. A NaN in
+    the window (or at ``i``) means "no pivot", as with element-wise comparisons.
+
+    Args:
+        values: 1-D price array (``high`` for pivot highs, ``low`` for lows).
+        left_bars: Bars required to the left.
+        right_bars: Bars required to the right.
+        kind: ``'high'`` or ``'low'``.
+
+    Returns:
+        Sorted int64 array of pivot positions.
+    """
+    if kind not in ('high', 'low'):
+        raise ValueError(f"kind must be 'high' or 'low', got {kind!r}")
+    values = np.asarray(values, dtype=float)
+    start, stop = left_bars, len(values) - right_bars
+    if stop <= start:
+        return np.array([], dtype=np.int64)
+
+    reduce = np.maximum if kind == 'high' else np.minimum
+    beats = np.greater if kind == 'high' else np.less
+
+    centre = values[start:stop]
+    mask = np.ones(len(centre), dtype=bool)
+    if left_bars > 0:
+        # Element k covers [k, k + left_bars) == the left window of bar start + k
+        mask &= beats(centre, _window_reduce(values[:stop - 1], left_bars, reduce))
+    if right_bars > 0:
+        # Element k covers (start + k, start + k + right_bars]
+        mask &= beats(centre, _window_reduce(values[start + 1:], right_bars, reduce))
+    return np.flatnonzero(mask) + start
+
+
 @StrategyRegistry.register_swing_strategy('pivot_points')
 @dataclass
 class PivotPointsSwingStrategy:
@@ -68,57 +124,25 @@ class PivotPointsSwingStrategy:
                 strategy_params=self._strategy_params(),
             )
 
-        swing_points: List[SwingPoint] = []
-        indices: List[int] = []
-
-        for point_id, point in enumerate(extrema):
-            timestamp = point['timestamp']
-            ts = (
-                timestamp.to_pydatetime()
-                if hasattr(timestamp, "to_pydatetime")
-                else timestamp
-            )
-            index_position = int(point['index'])
-            price = point['price']
-
-            amplitude_to_next: Optional[float] = None
-            duration_to_next: Optional[int] = None
-            if point_id < len(extrema) - 1:
-                next_point = extrema[point_id + 1]
-                next_price = next_point['price']
-                if price != 0:
-                    amplitude_to_next = (next_price / price - 1) * 100
-                duration_to_next = max(
-                    0, int(next_point['index']) - index_position
-                )
+        indices = np.array([point['index'] for point in extrema], dtype=np.int64)
+        prices = np.array([point['price'] for point in extrema], dtype=float)
+        swing_types = [point['type'] for point in extrema]
 
-            confirmation_index = self._confirmation_index(
-                index_position, len(full_data)
-            )
-
-            swing_points.append(
-                SwingPoint(
-                    point_id=point_id,
-                    timestamp=ts,
-                    index=index_position,
-                    price=float(price),
-                    swing_type=point['type'],
-                    amplitude_to_next=amplitude_to_next,
-                    duration_to_next=duration_to_next,
-                    strategy_name='pivot_points',
-                    strategy_params=self._strategy_params(),
-                    confirmation_index=confirmation_index,
-                )
-            )
-            indices.append(index_position)
+        confirmation_index = [
+            self._confirmation_index(index, len(full_data))
+            for index, price, swing_type in zip(indices.tolist(), prices.tolist(), swing_types)
+        ]
 
         logger.info(
-            "PivotPoints global: detected %d swing points", len(swing_points)
+            "PivotPoints global: detected %d swing points", len(indices)
         )
 
-        return SwingContext(
-            swing_points=swing_points,
-            indices=np.asarray(indices, dtype=int),
+        return SwingContext.from_arrays(
+            indices,
+            prices,
+            swing_types,
+            full_data.index[indices],
+            confirmation_index=confirmation_index,
             full_data_length=len(full_data),
             strategy_name='pivot_points',
             strategy_params=self._strategy_params(),
@@ -137,16 +161,35 @@ class PivotPointsSwingStrategy:
             )
             return self._empty_metrics()
 
-        rallies, drops = self._build_movements_from_points(zone_swings)
+        movements = swing_movements(
+            zone_swings.indices, zone_swings.prices, self.min_amplitude_pct
+        )
 
-        if not rallies and not drops:
+        if not len(movements):
             logger.debug(
                 "Zone %s: no valid pivot movements after amplitude filtering",
                 zone.zone_id,
             )
             return self._empty_metrics()
 
-        return self._aggregate_metrics(rallies, drops)
+        return self._aggregate_metrics(movements)
+
+    def aggregate_for_zones(
+        self, zones: Sequence[ZoneInfo], context: SwingContext
+    ) -> List[SwingMetrics]:
+        """Aggregate global swings for many zones in one vectorized pass."""
+
+        metrics = batch_movement_metrics(
+            context,
+            zones,
+            strategy_name='pivot_points',
+            strategy_params=self._strategy_params(),
+            min_amplitude_pct=self.min_amplitude_pct,
+        )
+        return [
+            metric if metric.rally_count or metric.drop_count else self._empty_metrics()
+            for metric in metrics
+        ]
 
     def calculate(self, zone_data: pd.DataFrame) -> SwingMetrics:
         """Calculate comprehensive swing metrics using pivot patterns."""
@@ -176,16 +219,20 @@ class PivotPointsSwingStrategy:
                 )
                 return self._empty_metrics()
 
-            rallies, drops = self._build_movements_from_extrema(extrema)
+            movements = swing_movements(
+                [point['index'] for point in extrema],
+                [point['price'] for point in extrema],
+                self.min_amplitude_pct,
+            )
 
-            if not rallies and not drops:
+            if not len(movements):
                 logger.debug(
                     "Pivot movements filtered by amplitude threshold %.2f",
                     self.min_amplitude_pct,
                 )
                 return self._empty_metrics()
 
-            return self._aggregate_metrics(rallies, drops)
+            return self._aggregate_metrics(movements)
 
         except Exception as exc:  # pragma: no cover - defensive logging
             logger.error("PivotPoints swing calculation failed: %s", exc, exc_info=True)
@@ -222,176 +269,14 @@ class PivotPointsSwingStrategy:
         extrema.sort(key=lambda item: item['index'])
         return extrema
 
-    def _build_movements_from_extrema(
-        self, extrema: List[Dict[str, Any]]
-    ) -> Tuple[List[Dict[str, float]], List[Dict[str, float]]]:
-        rallies: List[Dict[str, float]] = []
-        drops: List[Dict[str, float]] = []
-
-        for i in range(1, len(extrema)):
-            prev = extrema[i - 1]
-            curr = extrema[i]
-
-            duration_bars = int(curr['index'] - prev['index'])
-            if duration_bars <= 0 or prev['price'] == 0:
-                continue
-
-            price_change_pct = (curr['price'] / prev['price'] - 1) * 100
-            if abs(price_change_pct) < self.min_amplitude_pct * 100:
-                continue
-
-            movement = {
-                'amplitude_pct': abs(price_change_pct),
-                'duration_bars': duration_bars,
-                'speed_pct_per_bar': abs(price_change_pct) / duration_bars,
-            }
-
-            if price_change_pct > 0:
-                rallies.append(movement)
-            elif price_change_pct < 0:
-                drops.append(movement)
-
-        return rallies, drops
-
-    def _build_movements_from_points(
-        self, swings: List[SwingPoint]
-    ) -> Tuple[List[Dict[str, float]], List[Dict[str, float]]]:
-        rallies: List[Dict[str, float]] = []
-        drops: List[Dict[str, float]] = []
-
-        for i in range(len(swings) - 1):
-            curr = swings[i]
-            nxt = swings[i + 1]
-
-            duration_bars = nxt.index - curr.index
-            if duration_bars <= 0 or curr.price == 0:
-                continue
-
-            price_change_pct = (nxt.price / curr.price - 1) * 100
-            if abs(price_change_pct) < self.min_amplitude_pct * 100:
-                continue
-
-            movement = {
-                'amplitude_pct': abs(price_change_pct),
-                'duration_bars': int(duration_bars),
-                'speed_pct_per_bar': abs(price_change_pct) / duration_bars,
-            }
-
-            if price_change_pct > 0:
-                rallies.append(movement)
-            elif price_change_pct < 0:
-                drops.append(movement)
-
-        return rallies, drops
-
-    def _aggregate_metrics(
-        self,
-        rallies: List[Dict[str, float]],
-        drops: List[Dict[str, float]],
-    ) -> SwingMetrics:
-        rally_count = len(rallies)
-        drop_count = len(drops)
-
-        if rally_count > 0:
-            rally_amps = [r['amplitude_pct'] for r in rallies]
-            avg_rally_pct = float(np.mean(rally_amps))
-            max_rally_pct = float(np.max(rally_amps))
-            min_rally_pct = float(np.min(rally_amps))
-            rally_amplitude_std = float(np.std(rally_amps))
-            rally_amplitude_median = float(np.median(rally_amps))
-        else:
-            avg_rally_pct = max_rally_pct = min_rally_pct = 0.0
-            rally_amplitude_std = rally_amplitude_median = 0.0
-
-        if drop_count > 0:
-            drop_amps = [d['amplitude_pct'] for d in drops]
-            avg_drop_pct = float(np.mean(drop_amps))
-            max_drop_pct = float(np.max(drop_amps))
-            min_drop_pct = float(np.min(drop_amps))
-            drop_amplitude_std = float(np.std(drop_amps))
-            drop_amplitude_median = float(np.median(drop_amps))
-        else:
-            avg_drop_pct = max_drop_pct = min_drop_pct = 0.0
-            drop_amplitude_std = drop_amplitude_median = 0.0
-
-        if rally_count > 0:
-            rally_durs = [r['duration_bars'] for r in rallies]
-            avg_rally_duration_bars = float(np.mean(rally_durs))
-            max_rally_duration_bars = int(np.max(rally_durs))
-        else:
-            avg_rally_duration_bars = 0.0
-            max_rally_duration_bars = 0
-
-        if drop_count > 0:
-            drop_durs = [d['duration_bars'] for d in drops]
-            avg_drop_duration_bars = float(np.mean(drop_durs))
-            max_drop_duration_bars = int(np.max(drop_durs))
-        else:
-            avg_drop_duration_bars = 0.0
-            max_drop_duration_bars = 0
-
-        if rally_count > 0:
-            rally_speeds = [r['speed_pct_per_bar'] for r in rallies]
-            avg_rally_speed_pct_per_bar = float(np.mean(rally_speeds))
-            max_rally_speed_pct_per_bar = float(np.max(rally_speeds))
-        else:
-            avg_rally_speed_pct_per_bar = 0.0
-            max_rally_speed_pct_per_bar = 0.0
-
-        if drop_count > 0:
-            drop_speeds = [d['speed_pct_per_bar'] for d in drops]
-            avg_drop_speed_pct_per_bar = float(np.mean(drop_speeds))
-            max_drop_speed_pct_per_bar = float(np.max(drop_speeds))
-        else:
-            avg_drop_speed_pct_per_bar = 0.0
-            max_drop_speed_pct_per_bar = 0.0
-
-        rally_to_drop_ratio = (
-            avg_rally_pct / avg_drop_pct if avg_drop_pct > 0 else 0.0
-        )
-        duration_symmetry = (
-            avg_rally_duration_bars / avg_drop_duration_bars
-            if avg_drop_duration_bars > 0
-            else 0.0
-        )
-
-        num_swings = min(rally_count, drop_count)
-
-        metrics = SwingMetrics(
-            num_swings=num_swings,
-            avg_rally_pct=avg_rally_pct,
-            avg_drop_pct=avg_drop_pct,
-            max_rally_pct=max_rally_pct,
-            max_drop_pct=max_drop_pct,
-            rally_to_drop_ratio=rally_to_drop_ratio,
-            rally_count=rally_count,
-            drop_count=drop_count,
-            min_rally_pct=min_rally_pct,
-            min_drop_pct=min_drop_pct,
-            rally_amplitude_std=rally_amplitude_std,
-            drop_amplitude_std=drop_amplitude_std,
-            rally_amplitude_median=rally_amplitude_median,
-            drop_amplitude_median=drop_amplitude_median,
-            avg_rally_duration_bars=avg_rally_duration_bars,
-            avg_drop_duration_bars=avg_drop_duration_bars,
-            max_rally_duration_bars=max_rally_duration_bars,
-            max_drop_duration_bars=max_drop_duration_bars,
-            avg_rally_speed_pct_per_bar=avg_rally_speed_pct_per_bar,
-            avg_drop_speed_pct_per_bar=avg_drop_speed_pct_per_bar,
-            max_rally_speed_pct_per_bar=max_rally_speed_pct_per_bar,
-            max_drop_speed_pct_per_bar=max_drop_speed_pct_per_bar,
-            duration_symmetry=duration_symmetry,
-            strategy_name='pivot_points',
-            strategy_params=self._strategy_params(),
-        )
-
-        metrics.validate()
+    def _aggregate_metrics(self, movements: SwingMovements) -> SwingMetrics:
+        metrics = movement_metrics(movements, 'pivot_points', self._strategy_params())
 
         logger.debug(
             "PivotPoints metrics: %d rallies, %d drops, ratio=%.2f",
-            rally_count,
-            drop_count,
-            rally_to_drop_ratio,
+            metrics.rally_count,
+            metrics.drop_count,
+            metrics.rally_to_drop_ratio,
         )
 
         return metrics
@@ -421,7 +306,7 @@ class PivotPointsSwingStrategy:
         return conf if conf < full_data_length else None
 
     def _empty_metrics(self) -> SwingMetrics:
-        return self._aggregate_metrics([], [])
+        return self._aggregate_metrics(swing_movements([], []))
 
     def _validate_input(self, data: pd.DataFrame) -> None:
         required_cols = {'high', 'low', 'close'}
@@ -432,42 +317,14 @@ class PivotPointsSwingStrategy:
             raise ValueError("zone_data cannot be empty")
 
     def _find_pivot_highs(self, data: pd.DataFrame) -> List[int]:
-        highs = data['high'].values
-        pivot_indices: List[int] = []
-
-        for i in range(self.left_bars, len(highs) - self.right_bars):
-            is_pivot = all(
-                highs[i] > highs[i - j] for j in range(1, self.left_bars + 1)
-            )
-
-            if is_pivot:
-                is_pivot = all(
-                    highs[i] > highs[i + j] for j in range(1, self.right_bars + 1)
-                )
-
-            if is_pivot:
-                pivot_indices.append(i)
-
-        return pivot_indices
+        return pivot_indices(
+            data['high'].to_numpy(dtype=float), self.left_bars, self.right_bars, kind='high'
+        ).tolist()
 
     def _find_pivot_lows(self, data: pd.DataFrame) -> List[int]:
-        lows = data['low'].values
-        pivot_indices: List[int] = []
-
-        for i in range(self.left_bars, len(lows) - self.right_bars):
-            is_pivot = all(
-                lows[i] < lows[i - j] for j in range(1, self.left_bars + 1)
-            )
-
-            if is_pivot:
-                is_pivot = all(
-                    lows[i] < lows[i + j] for j in range(1, self.right_bars + 1)
-                )
-
-            if is_pivot:
-                pivot_indices.append(i)
-
-        return pivot_indices
+        return pivot_indices(
+            data['low'].to_numpy(dtype=float), self.left_bars, self.right_bars, kind='low'
+        ).tolist()
 
     def _strategy_params(self) -> Dict[str, Any]:
         return {
@@ -1,7 +1,7 @@
 """Utilities for calculating adaptive swing thresholds."""
 
 from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Sequence
 
 import pandas as pd
 
@@ -101,6 +101,16 @@ class _AdaptiveSwingStrategy:
 
         return self.base_strategy.aggregate_for_zone(zone, context)
 
+    def aggregate_for_zones(
+        self, zones: Sequence[ZoneInfo], context: SwingContext
+    ) -> List[SwingMetrics]:
+        """Delegate batched aggregation (per-zone fallback for base strategies without it)."""
+
+        aggregate = getattr(self.base_strategy, 'aggregate_for_zones', None)
+        if aggregate is None:
+            return [self.base_strategy.aggregate_for_zone(zone, context) for zone in zones]
+        return aggregate(zones, context)
+
     def calculate(self, zone_data: pd.DataFrame) -> SwingMetrics:
         """Per-zone calculation with adaptive thresholds."""
 
@@ -1,30 +1,164 @@
 """
-ZigZag Swing Strategy - swing detection using pandas-ta ZigZag indicator.
+ZigZag Swing Strategy - swing detection using a ZigZag indicator.
 
-This strategy uses the pandas-ta ZigZag algorithm to identify significant
-price swings within a trading zone, filtering out noise and focusing on
-meaningful price movements.
+This strategy uses the ZigZag algorithm to identify significant price swings
+within a trading zone, filtering out noise and focusing on meaningful price
+movements. Global mode runs the pandas-ta ZigZag indicator (or the built-in
+non-repainting kernel :func:`zigzag_pivots` with ``engine='native'``);
+per-zone mode uses the pandas-ta ZigZag indicator.
 """
 
+import math
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Sequence
 
 import numpy as np
 import pandas as pd
 
-from ...models import SwingContext, SwingPoint, ZoneInfo
+from ...models import SwingContext, ZoneInfo
 from ..base import SwingMetrics
 from ..registry import StrategyRegistry
+from .movements import SwingMovements, batch_movement_metrics, movement_metrics, swing_movements
 from .....core.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+ZIGZAG_ENGINES = ('native', 'pandas_ta')
+
+
+@dataclass(frozen=True)
+class ZigZagPivots:
+    """Pivots of one ZigZag pass as parallel arrays.
+
+    Attributes:
+        positions: Bar position of every pivot (int64, increasing).
+        prices: Pivot price (the high of a peak, the low of a trough).
+        type_codes: ``1`` for peaks, ``-1`` for troughs (int8, alternating).
+        confirmation_index: Bar at which the pivot is confirmed (float64);
+            NaN for the last, still-forming pivot.
+    """
+
+    positions: np.ndarray
+    prices: np.ndarray
+    type_codes: np.ndarray
+    confirmation_index: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+
+def zigzag_pivots(high: np.ndarray, low: np.ndarray, legs: int, deviation: float) -> ZigZagPivots:
+    """Non-repainting ZigZag pivots of a high/low series.
+
+    The bars are walked forward keeping the extreme of the current leg (the
+    highest high while looking for a peak, the lowest low while looking for a
+    trough) and the opposite extreme reached after it. A peak is confirmed at
+    the first bar that lies at least ``legs`` bars after it and by which the
+    low has retraced ``deviation`` below it; a trough, when the high has risen
+    ``deviation`` above it. The walk then resumes right after the pivot looking
+    for the opposite extreme, so only the bars between a pivot and its
+    confirmation are read again. Until the first pivot both directions are
+    tracked and the one confirmed first (the earlier pivot on a tie) wins.
+
+    ``confirmation_index`` is the furthest bar read when the pivot is
+    confirmed, so every pivot only depends on the bars up to it: running the
+    kernel on ``high[:t + 1]``/``low[:t + 1]`` yields the same pivots for all
+    those confirmed at or before ``t`` (the ``backtest=True`` contract of
+    pandas-ta's ZigZag). The extreme of the still-forming leg is appended as a
+    last, unconfirmed pivot. Bars with a NaN high or low are skipped.
+
+    Args:
+        high: High prices.
+        low: Low prices.
+        legs: Minimum number of bars between a pivot and its confirmation.
+        deviation: Minimum retracement as a fraction (0.05 == 5%).
+
+    Returns:
+        :class:`ZigZagPivots` with alternating peaks and troughs.
+    """
+    highs = np.asarray(high, dtype=float).tolist()
+    lows = np.asarray(low, dtype=float).tolist()
+    n = len(highs)
+    up, down = 1.0 + deviation, 1.0 - deviation
+
+    positions: List[int] = []
+    prices: List[float] = []
+    types: List[int] = []
+    confirmations: List[float] = []
+
+    # direction: 1 while looking for a peak, -1 for a trough, 0 before the first pivot
+    direction = 0
+    peak_pos = trough_pos = -1
+    peak = trough = 0.0
+    low_after_peak, high_after_trough = math.inf, -math.inf
+    frontier = -1
+    i = 0
+    while i < n:
+        if i > frontier:
+            frontier = i
+        h, l = highs[i], lows[i]
+        if math.isnan(h) or math.isnan(l):
+            i += 1
+            continue
+
+        if direction >= 0:
+            if peak_pos < 0 or h > peak:
+                peak_pos, peak, low_after_peak = i, h, math.inf
+            elif l < low_after_peak:
+                low_after_peak = l
+        if direction <= 0:
+            if trough_pos < 0 or l < trough:
+                trough_pos, trough, high_after_trough = i, l, -math.inf
+            elif h > high_after_trough:
+                high_after_trough = h
+
+        peak_done = (
+            direction >= 0 and i - peak_pos >= legs and low_after_peak <= peak * down
+        )
+        trough_done = (
+            direction <= 0 and i - trough_pos >= legs and high_after_trough >= trough * up
+        )
+        if peak_done and not (trough_done and trough_pos < peak_pos):
+            positions.append(peak_pos)
+            prices.append(peak)
+            types.append(1)
+            confirmations.append(frontier)
+            direction, trough_pos, i = -1, -1, peak_pos + 1
+        elif trough_done:
+            positions.append(trough_pos)
+            prices.append(trough)
+            types.append(-1)
+            confirmations.append(frontier)
+            direction, peak_pos, i = 1, -1, trough_pos + 1
+        else:
+            i += 1
+
+    # The extreme of the still-forming leg
+    if direction > 0 and peak_pos >= 0:
+        positions.append(peak_pos)
+        prices.append(peak)
+        types.append(1)
+        confirmations.append(math.nan)
+    elif direction < 0 and trough_pos >= 0:
+        positions.append(trough_pos)
+        prices.append(trough)
+        types.append(-1)
+        confirmations.append(math.nan)
+
+    return ZigZagPivots(
+        positions=np.asarray(positions, dtype=np.int64),
+        prices=np.asarray(prices, dtype=float),
+        type_codes=np.asarray(types, dtype=np.int8),
+        confirmation_index=np.asarray(confirmations, dtype=float),
+    )
+
+
 
 @StrategyRegistry.register_swing_strategy('zigzag')
 @dataclass
 class ZigZagSwingStrategy:
     """
-    Swing detection using pandas-ta ZigZag algorithm.
+    Swing detection using the ZigZag algorithm.
     
     This strategy identifies swing points by finding price reversals that exceed
     a specified percentage threshold. It provides comprehensive metrics including
@@ -33,9 +167,19 @@ class ZigZagSwingStrategy:
     Attributes:
         legs: Number of bars to confirm a pivot (default: 10)
         deviation: Minimum percentage move to qualify as swing (default: 0.05 = 5%)
+        engine: Global-mode detector: ``'pandas_ta'`` (pandas-ta ``zigzag``
+            with ``backtest=True``, default) or ``'native'`` (built-in
+            :func:`zigzag_pivots`, no pandas-ta needed)
     """
     legs: int = 10
     deviation: float = 0.05  # 5% minimum movement
+    engine: str = 'pandas_ta'
+
+    def __post_init__(self) -> None:
+        if self.engine not in ZIGZAG_ENGINES:
+            raise ValueError(
+                f"Unknown ZigZag engine {self.engine!r}; expected one of {ZIGZAG_ENGINES}"
+            )
 
     def calculate_global(self, full_data: pd.DataFrame) -> SwingContext:
         """Run a single ZigZag pass on the full dataset and build context."""
@@ -51,6 +195,42 @@ class ZigZagSwingStrategy:
             )
             return self._empty_context(len(full_data))
 
+        if self.engine == 'native':
+            return self._native_context(full_data)
+        return self._pandas_ta_context(full_data)
+
+    def _native_context(self, full_data: pd.DataFrame) -> SwingContext:
+        """Global context from the built-in non-repainting kernel."""
+
+        pivots = zigzag_pivots(
+            full_data['high'].to_numpy(dtype=float),
+            full_data['low'].to_numpy(dtype=float),
+            self.legs,
+            self.deviation,
+        )
+
+        if len(pivots) < 2:
+            logger.warning(
+                "ZigZag detected fewer than two swing points in global mode"
+            )
+            return self._empty_context(len(full_data))
+
+        logger.info("ZigZag global: detected %d swing points", len(pivots))
+
+        return SwingContext.from_arrays(
+            pivots.positions,
+            pivots.prices,
+            pivots.type_codes,
+            full_data.index[pivots.positions],
+            confirmation_index=pivots.confirmation_index,
+            full_data_length=len(full_data),
+            strategy_name='zigzag',
+            strategy_params=self._strategy_params(),
+        )
+
+    def _pandas_ta_context(self, full_data: pd.DataFrame) -> SwingContext:
+        """Global context from the pandas-ta ``zigzag`` indicator."""
+
         if self._is_degenerate(full_data):
             logger.warning(
                 "ZigZag global: degenerate input (near-constant high/low). "
@@ -101,64 +281,47 @@ class ZigZagSwingStrategy:
             )
             return self._empty_context(len(full_data))
 
-        swing_points: List[SwingPoint] = []
-        indices: List[int] = []
-
-        timestamps = swing_values.index.to_list()
-        prices = swing_values.to_list()
+        timestamps = swing_values.index
+        prices = swing_values.to_numpy(dtype=float)
+        positions = full_data.index.get_indexer(timestamps)
+        count = len(prices)
 
         high_arr = full_data['high'].to_numpy(dtype=float)
         low_arr = full_data['low'].to_numpy(dtype=float)
 
-        for point_id, (timestamp, price) in enumerate(zip(timestamps, prices)):
-            ts = timestamp.to_pydatetime() if hasattr(timestamp, "to_pydatetime") else timestamp
-            position_arr = full_data.index.get_indexer([timestamp])
-            if -1 in position_arr:
-                logger.debug("Timestamp %s from ZigZag output not present in data index", timestamp)
+        # A swing is a peak when it is above the previous swing; the first one is
+        # typed against the second.
+        type_codes = np.empty(count, dtype=np.int8)
+        type_codes[1:] = np.where(prices[1:] > prices[:-1], 1, -1)
+        type_codes[0] = -1 if prices[1] > prices[0] else 1
+
+        amplitude_to_next = np.full(count, np.nan)
+        duration_to_next = np.full(count, np.nan)
+        confirmation_index = np.full(count, np.nan)
+        for point_id in range(count - 1):
+            position, next_position = positions[point_id], positions[point_id + 1]
+            if position == -1 or next_position == -1:
                 continue
-            position = int(position_arr[0])
+            price = prices[point_id]
+            if price != 0:
+                amplitude_to_next[point_id] = (prices[point_id + 1] / price - 1) * 100
+            duration_to_next[point_id] = max(0, next_position - position)
+            confirmation = self._confirmation_index(
+                int(position), int(next_position), float(price),
+                'peak' if type_codes[point_id] == 1 else 'trough',
+                high_arr, low_arr,
+            )
+            if confirmation is not None:
+                confirmation_index[point_id] = confirmation
 
-            if point_id > 0:
-                prev_price = prices[point_id - 1]
-                swing_type = 'peak' if price > prev_price else 'trough'
-            else:
-                if len(prices) > 1:
-                    swing_type = 'trough' if prices[1] > price else 'peak'
-                else:
-                    swing_type = 'trough'
-
-            amplitude_to_next: Optional[float] = None
-            duration_to_next: Optional[int] = None
-            confirmation_index: Optional[int] = None
-            if point_id < len(prices) - 1:
-                next_price = prices[point_id + 1]
-                next_timestamp = timestamps[point_id + 1]
-                next_position_arr = full_data.index.get_indexer([next_timestamp])
-                if -1 not in next_position_arr:
-                    next_position = int(next_position_arr[0])
-                    if price != 0:
-                        amplitude_to_next = (next_price / price - 1) * 100
-                    duration_to_next = max(0, next_position - position)
-                    confirmation_index = self._confirmation_index(
-                        position, next_position, float(price), swing_type,
-                        high_arr, low_arr,
-                    )
-
-            swing_points.append(
-                SwingPoint(
-                    point_id=point_id,
-                    timestamp=ts,
-                    index=position,
-                    price=float(price),
-                    swing_type=swing_type,
-                    amplitude_to_next=amplitude_to_next,
-                    duration_to_next=duration_to_next,
-                    strategy_name='zigzag',
-                    strategy_params={'legs': self.legs, 'deviation': self.deviation},
-                    confirmation_index=confirmation_index,
-                )
+        found = positions != -1
+        if not found.all():
+            logger.debug(
+                "ZigZag output timestamps not present in data index: %s",
+                list(timestamps[~found]),
             )
-            indices.append(position)
+        point_ids = np.flatnonzero(found)
+        confirmation_index = confirmation_index[found]
 
         # Warm-up (issue #110): the backtest=True detector emits nothing until the
         # second swing forms, so the first two pivots become observable *together*.
@@ -166,21 +329,23 @@ class ZigZagSwingStrategy:
         # the detector actually reports it — pin its availability to the second
         # pivot's (the bar they both first appear at). Later pivots' retrace times are
         # already safe (empirically confirmation_index >= first-appearance).
-        if len(swing_points) >= 2 and swing_points[0].confirmation_index is not None \
-                and swing_points[1].confirmation_index is not None:
-            swing_points[0].confirmation_index = max(
-                swing_points[0].confirmation_index,
-                swing_points[1].confirmation_index,
-            )
-
-        logger.info("ZigZag global: detected %d swing points", len(swing_points))
-
-        return SwingContext(
-            swing_points=swing_points,
-            indices=np.asarray(indices, dtype=int),
+        if len(confirmation_index) >= 2 and not np.isnan(confirmation_index[:2]).any():
+            confirmation_index[0] = max(confirmation_index[0], confirmation_index[1])
+
+        logger.info("ZigZag global: detected %d swing points", len(point_ids))
+
+        return SwingContext.from_arrays(
+            positions[found],
+            prices[found],
+            type_codes[found],
+            timestamps[found],
+            amplitude_to_next=amplitude_to_next[found],
+            duration_to_next=duration_to_next[found],
+            confirmation_index=confirmation_index,
+            point_ids=point_ids,
             full_data_length=len(full_data),
             strategy_name='zigzag',
-            strategy_params={'legs': self.legs, 'deviation': self.deviation},
+            strategy_params=self._strategy_params(),
         )
 
     def aggregate_for_zone(self, zone: ZoneInfo, context: SwingContext) -> SwingMetrics:
@@ -194,8 +359,21 @@ class ZigZagSwingStrategy:
             )
             return self._empty_metrics()
 
-        rallies, drops = self._build_movements_from_points(zone_swings)
-        return self._aggregate_metrics(rallies, drops)
+        return self._aggregate_metrics(
+            swing_movements(zone_swings.indices, zone_swings.prices)
+        )
+
+    def aggregate_for_zones(
+        self, zones: Sequence[ZoneInfo], context: SwingContext
+    ) -> List[SwingMetrics]:
+        """Aggregate global swing context for many zones in one vectorized pass."""
+
+        return batch_movement_metrics(
+            context,
+            zones,
+            strategy_name='zigzag',
+            strategy_params=self._strategy_params(),
+        )
 
     def calculate(self, zone_data: pd.DataFrame) -> SwingMetrics:
         """
@@ -259,197 +437,32 @@ class ZigZagSwingStrategy:
                 )
                 return self._empty_metrics()
 
-            rallies, drops = self._build_movements_from_series(
-                swing_points,
-                zone_data.index,
+            return self._aggregate_metrics(
+                swing_movements(
+                    zone_data.index.get_indexer(swing_points.index),
+                    swing_points.to_numpy(dtype=float),
+                )
             )
-            return self._aggregate_metrics(rallies, drops)
 
         except Exception as e:
             logger.error(f"ZigZag swing calculation failed: {e}", exc_info=True)
             # Return empty metrics on error
             return self._empty_metrics()
-    def _build_movements_from_series(
-        self,
-        swing_points: pd.Series,
-        time_index: pd.Index,
-    ) -> Tuple[List[Dict[str, float]], List[Dict[str, float]]]:
-        rallies: List[Dict[str, float]] = []
-        drops: List[Dict[str, float]] = []
-
-        for i in range(1, len(swing_points)):
-            prev_price = swing_points.iloc[i - 1]
-            curr_price = swing_points.iloc[i]
-
-            prev_idx = swing_points.index[i - 1]
-            curr_idx = swing_points.index[i]
-
-            prev_pos = time_index.get_loc(prev_idx)
-            curr_pos = time_index.get_loc(curr_idx)
-            duration_bars = curr_pos - prev_pos
-
-            if duration_bars <= 0 or prev_price == 0:
-                continue
-
-            price_change_pct = (curr_price / prev_price - 1) * 100
-
-            movement = {
-                'amplitude_pct': abs(price_change_pct),
-                'duration_bars': int(duration_bars),
-                'speed_pct_per_bar': abs(price_change_pct) / duration_bars
-                if duration_bars > 0
-                else 0.0,
-            }
-
-            if price_change_pct > 0:
-                rallies.append(movement)
-            elif price_change_pct < 0:
-                drops.append(movement)
-
-        return rallies, drops
-
-    def _build_movements_from_points(
-        self,
-        swings: List[SwingPoint],
-    ) -> Tuple[List[Dict[str, float]], List[Dict[str, float]]]:
-        rallies: List[Dict[str, float]] = []
-        drops: List[Dict[str, float]] = []
-
-        for i in range(len(swings) - 1):
-            curr = swings[i]
-            nxt = swings[i + 1]
-
-            duration_bars = nxt.index - curr.index
-            if duration_bars <= 0 or curr.price == 0:
-                continue
-
-            price_change_pct = (nxt.price / curr.price - 1) * 100
-
-            movement = {
-                'amplitude_pct': abs(price_change_pct),
-                'duration_bars': int(duration_bars),
-                'speed_pct_per_bar': abs(price_change_pct) / duration_bars,
-            }
-
-            if price_change_pct > 0:
-                rallies.append(movement)
-            elif price_change_pct < 0:
-                drops.append(movement)
-
-        return rallies, drops
-
-    def _aggregate_metrics(
-        self,
-        rallies: List[Dict[str, float]],
-        drops: List[Dict[str, float]],
-    ) -> SwingMetrics:
-        rally_count = len(rallies)
-        drop_count = len(drops)
-
-        if rally_count > 0:
-            rally_amps = [r['amplitude_pct'] for r in rallies]
-            avg_rally_pct = float(np.mean(rally_amps))
-            max_rally_pct = float(np.max(rally_amps))
-            min_rally_pct = float(np.min(rally_amps))
-            rally_amplitude_std = float(np.std(rally_amps))
-            rally_amplitude_median = float(np.median(rally_amps))
-        else:
-            avg_rally_pct = max_rally_pct = min_rally_pct = 0.0
-            rally_amplitude_std = rally_amplitude_median = 0.0
-
-        if drop_count > 0:
-            drop_amps = [d['amplitude_pct'] for d in drops]
-            avg_drop_pct = float(np.mean(drop_amps))
-            max_drop_pct = float(np.max(drop_amps))
-            min_drop_pct = float(np.min(drop_amps))
-            drop_amplitude_std = float(np.std(drop_amps))
-            drop_amplitude_median = float(np.median(drop_amps))
-        else:
-            avg_drop_pct = max_drop_pct = min_drop_pct = 0.0
-            drop_amplitude_std = drop_amplitude_median = 0.0
-
-        if rally_count > 0:
-            rally_durs = [r['duration_bars'] for r in rallies]
-            avg_rally_duration_bars = float(np.mean(rally_durs))
-            max_rally_duration_bars = int(np.max(rally_durs))
-        else:
-            avg_rally_duration_bars = 0.0
-            max_rally_duration_bars = 0
-
-        if drop_count > 0:
-            drop_durs = [d['duration_bars'] for d in drops]
-            avg_drop_duration_bars = float(np.mean(drop_durs))
-            max_drop_duration_bars = int(np.max(drop_durs))
-        else:
-            avg_drop_duration_bars = 0.0
-            max_drop_duration_bars = 0
-
-        if rally_count > 0:
-            rally_speeds = [r['speed_pct_per_bar'] for r in rallies]
-            avg_rally_speed_pct_per_bar = float(np.mean(rally_speeds))
-            max_rally_speed_pct_per_bar = float(np.max(rally_speeds))
-        else:
-            avg_rally_speed_pct_per_bar = 0.0
-            max_rally_speed_pct_per_bar = 0.0
-
-        if drop_count > 0:
-            drop_speeds = [d['speed_pct_per_bar'] for d in drops]
-            avg_drop_speed_pct_per_bar = float(np.mean(drop_speeds))
-            max_drop_speed_pct_per_bar = float(np.max(drop_speeds))
-        else:
-            avg_drop_speed_pct_per_bar = 0.0
-            max_drop_speed_pct_per_bar = 0.0
-
-        rally_to_drop_ratio = (
-            avg_rally_pct / avg_drop_pct if avg_drop_pct > 0 else 0.0
-        )
-        duration_symmetry = (
-            avg_rally_duration_bars / avg_drop_duration_bars
-            if avg_drop_duration_bars > 0
-            else 0.0
-        )
-
-        num_swings = min(rally_count, drop_count)
-
-        metrics = SwingMetrics(
-            num_swings=num_swings,
-            avg_rally_pct=avg_rally_pct,
-            avg_drop_pct=avg_drop_pct,
-            max_rally_pct=max_rally_pct,
-            max_drop_pct=max_drop_pct,
-            rally_to_drop_ratio=rally_to_drop_ratio,
-            rally_count=rally_count,
-            drop_count=drop_count,
-            min_rally_pct=min_rally_pct,
-            min_drop_pct=min_drop_pct,
-            rally_amplitude_std=rally_amplitude_std,
-            drop_amplitude_std=drop_amplitude_std,
-            rally_amplitude_median=rally_amplitude_median,
-            drop_amplitude_median=drop_amplitude_median,
-            avg_rally_duration_bars=avg_rally_duration_bars,
-            avg_drop_duration_bars=avg_drop_duration_bars,
-            max_rally_duration_bars=max_rally_duration_bars,
-            max_drop_duration_bars=max_drop_duration_bars,
-            avg_rally_speed_pct_per_bar=avg_rally_speed_pct_per_bar,
-            avg_drop_speed_pct_per_bar=avg_drop_speed_pct_per_bar,
-            max_rally_speed_pct_per_bar=max_rally_speed_pct_per_bar,
-            max_drop_speed_pct_per_bar=max_drop_speed_pct_per_bar,
-            duration_symmetry=duration_symmetry,
-            strategy_name='zigzag',
-            strategy_params={'legs': self.legs, 'deviation': self.deviation},
-        )
-
-        metrics.validate()
+    def _aggregate_metrics(self, movements: SwingMovements) -> SwingMetrics:
+        metrics = movement_metrics(movements, 'zigzag', self._strategy_params())
 
         logger.debug(
             "ZigZag metrics calculated: %d rallies, %d drops, ratio=%.2f",
-            rally_count,
-            drop_count,
-            rally_to_drop_ratio,
+            metrics.rally_count,
+            metrics.drop_count,
+            metrics.rally_to_drop_ratio,
         )
 
         return metrics
 
+    def _strategy_params(self) -> Dict[str, Any]:
+        return {'legs': self.legs, 'deviation': self.deviation}
+
     def _confirmation_index(
         self,
         position: int,
@@ -486,7 +499,7 @@ class ZigZagSwingStrategy:
         return conf
 
     def _empty_metrics(self) -> SwingMetrics:
-        return self._aggregate_metrics([], [])
+        return self._aggregate_metrics(swing_movements([], []))
 
     def _empty_context(self, full_data_length: int) -> SwingContext:
         return SwingContext(
@@ -494,7 +507,7 @@ class ZigZagSwingStrategy:
             indices=np.array([], dtype=int),
             full_data_length=full_data_length,
             strategy_name='zigzag',
-            strategy_params={'legs': self.legs, 'deviation': self.deviation},
+            strategy_params=self._strategy_params(),
         )
 
     def _is_degenerate(self, data: pd.DataFrame) -> bool:
@@ -525,12 +538,17 @@ class ZigZagSwingStrategy:
         """Get strategy metadata for logging and traceability."""
         return {
             'name': 'ZigZag',
-            'description': 'Swing detection via pandas-ta ZigZag algorithm',
+            'description': 'Swing detection via ZigZag algorithm',
             'params': {
                 'legs': self.legs,
-                'deviation': self.deviation
+                'deviation': self.deviation,
+                'engine': self.engine,
             },
-            'source': 'pandas-ta library via LibraryManager',
+            'source': (
+                'built-in zigzag_pivots kernel (global), pandas-ta library via LibraryManager (per-zone)'
+                if self.engine == 'native'
+                else 'pandas-ta library via LibraryManager'
+            ),
             'calculates': [
                 'swing amplitudes (rally/drop)',
                 'swing durations (bars)',
@@ -544,6 +562,7 @@ class ZigZagSwingStrategy:
         """Return configuration parameters for cache key generation."""
         return {
             'legs': self.legs,
-            'deviation': self.deviation
+            'deviation': self.deviation,
+            'engine': self.engine,
         }
 
@@ -3,21 +3,59 @@ Combined Volatility Strategy using Bollinger Bands and ATR.
 
 This strategy combines two classic volatility indicators to provide
 a comprehensive assessment of zone volatility and market conditions.
+
+Besides the per-zone :meth:`CombinedVolatilityStrategy.calculate_volatility`,
+the strategy can compute the bands once on the full frame
+(:meth:`~CombinedVolatilityStrategy.calculate_global`) and derive the metrics
+of many zones with segment reductions over those columns
+(:meth:`~CombinedVolatilityStrategy.calculate_volatility_batch`).
 """
 
 from dataclasses import dataclass
-from typing import Dict, Any
+from typing import Any, ClassVar, Dict, List, Optional, Sequence, Tuple
 import pandas as pd
 import numpy as np
 
 from ..base import VolatilityMetrics, VolatilityCalculationStrategy
 from ..registry import StrategyRegistry
+from ...batch_features import ColumnSource, ZoneSegments, _column_getter
 from .....core.logging_config import get_logger
-from .....indicators import LibraryManager
 
 logger = get_logger(__name__)
 
 
+def bollinger_bands(close, length: int, std: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Lower, middle and upper Bollinger Bands of ``close``.
+
+    The middle band is the ``length``-bar simple moving average; the bands are
+    ``std`` population standard deviations (ddof=0, the classic Bollinger and
+    TA-Lib definition) away from it. The first ``length - 1`` values are NaN.
+    """
+    series = pd.Series(np.asarray(close, dtype=float))
+    rolling = series.rolling(window=length)
+    middle = rolling.mean().to_numpy()
+    offset = rolling.std(ddof=0).to_numpy() * std
+    return middle - offset, middle, middle + offset
+
+
+@dataclass(frozen=True)
+class BollingerColumns:
+    """Bollinger Bands of a full frame, computed once per analysis run.
+
+    Attributes:
+        lower: Lower band.
+        upper: Upper band.
+        width_pct: Band width as % of the middle band (NaN where undefined).
+    """
+
+    lower: np.ndarray
+    upper: np.ndarray
+    width_pct: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.width_pct)
+
+
 @StrategyRegistry.register_volatility_strategy('combined')
 @dataclass
 class CombinedVolatilityStrategy:
@@ -39,6 +77,9 @@ class CombinedVolatilityStrategy:
     bb_std: float = 2.0
     touch_threshold: float = 0.01
     
+    # Derived columns the pipeline adds to the prepared frame (see zones.columns)
+    derived_columns: ClassVar[Tuple[str, ...]] = ('atr',)
+    
     def calculate_volatility(self, zone_data: pd.DataFrame) -> VolatilityMetrics:
         """
         Calculate volatility metrics using Bollinger Bands and ATR.
@@ -78,64 +119,127 @@ class CombinedVolatilityStrategy:
                 logger.warning("ATR column not found, using estimated ATR from price range")
                 atr_metrics = self._estimate_atr_metrics(zone_data)
             
-            # Calculate composite score and regime
-            volatility_score = self._calculate_volatility_score(bb_metrics, atr_metrics)
-            volatility_regime = self._classify_volatility_regime(volatility_score)
-            
-            result = VolatilityMetrics(
-                bollinger_width_pct=bb_metrics['width_pct'],
-                bollinger_width_std=bb_metrics['width_std'],
-                bollinger_squeeze_ratio=bb_metrics['squeeze_ratio'],
-                bollinger_upper_touches=bb_metrics['upper_touches'],
-                bollinger_lower_touches=bb_metrics['lower_touches'],
-                atr_normalized_range=atr_metrics['normalized_range'],
-                atr_trend=atr_metrics['trend'],
-                avg_atr=atr_metrics['avg_atr'],
-                volatility_score=volatility_score,
-                volatility_regime=volatility_regime,
-                strategy_name='combined',
-                strategy_params={
-                    'bb_length': self.bb_length,
-                    'bb_std': self.bb_std,
-                    'touch_threshold': self.touch_threshold
-                }
-            )
-            
-            result.validate()
-            return result
+            return self._build_metrics(bb_metrics, atr_metrics)
             
         except Exception as e:
             logger.error(f"Volatility calculation failed: {e}", exc_info=True)
             raise
     
+    def calculate_global(self, full_data: ColumnSource) -> BollingerColumns:
+        """
+        Compute Bollinger Bands once on the full frame.
+        
+        Args:
+            full_data: Full-length columns (DataFrame, ZoneColumnStore or a
+                mapping of NumPy arrays) with a ``close`` column
+        
+        Returns:
+            BollingerColumns aligned with the rows of ``full_data``
+        """
+        get, columns, _ = _column_getter(full_data)
+        if 'close' not in columns:
+            raise ValueError("Data must contain columns: ['close']")
+        
+        lower, middle, upper = bollinger_bands(get('close'), self.bb_length, self.bb_std)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            width_pct = (upper - lower) / middle * 100
+        width_pct[~np.isfinite(width_pct)] = np.nan
+        return BollingerColumns(lower=lower, upper=upper, width_pct=width_pct)
+    
+    def calculate_volatility_batch(self,
+                                   data: ColumnSource,
+                                   start_idx: Sequence[int],
+                                   end_idx: Sequence[int],
+                                   bands: Optional[BollingerColumns] = None) -> List[Optional[VolatilityMetrics]]:
+        """
+        Calculate volatility metrics of many zones of one frame at once.
+        
+        Metrics are segment reductions over full-frame columns and match
+        :meth:`calculate_volatility` on each zone slice up to floating point
+        rounding: the first ``bb_length - 1`` bars of every zone are treated as
+        the band warm-up, exactly as when the bands are computed on the slice.
+        
+        Args:
+            data: Full-length columns (DataFrame, ZoneColumnStore or a mapping
+                of NumPy arrays) with ``high``, ``low``, ``close`` and
+                optionally ``atr``
+            start_idx: Inclusive zone start positions
+            end_idx: Inclusive zone end positions
+            bands: Precomputed :meth:`calculate_global` result for ``data``
+        
+        Returns:
+            One VolatilityMetrics per zone (in input order); None for zones
+            where :meth:`calculate_volatility` would raise (fewer than 3 bars,
+            invalid metrics)
+        """
+        get, columns, n_rows = _column_getter(data)
+        missing_cols = [col for col in ['high', 'low', 'close'] if col not in columns]
+        if missing_cols:
+            raise ValueError(f"Zone data must contain columns: {missing_cols}")
+        
+        seg = ZoneSegments(start_idx, end_idx, n_rows)
+        if len(seg) == 0:
+            return []
+        if bands is None:
+            bands = self.calculate_global(data)
+        elif len(bands) != n_rows:
+            raise ValueError(f"Bands cover {len(bands)} rows, data has {n_rows}")
+        
+        bb_rows = _rows(self._batch_bollinger_metrics(seg, get('close'), bands))
+        if 'atr' in columns:
+            atr_rows = _rows(self._batch_atr_metrics(seg, get))
+        else:
+            logger.warning("ATR column not found, using estimated ATR from price range")
+            atr_rows = _rows(self._batch_estimated_atr_metrics(seg, get))
+        
+        results: List[Optional[VolatilityMetrics]] = []
+        for length, bb_metrics, atr_metrics in zip(seg.lengths.tolist(), bb_rows, atr_rows):
+            if length < 3:
+                results.append(None)
+                continue
+            try:
+                results.append(self._build_metrics(bb_metrics, atr_metrics))
+            except AssertionError as e:
+                logger.debug(f"Volatility metrics invalid for zone: {e}")
+                results.append(None)
+        return results
+    
+    def _build_metrics(self, bb_metrics: Dict[str, Any], atr_metrics: Dict[str, Any]) -> VolatilityMetrics:
+        """Composite score, regime and validated VolatilityMetrics."""
+        volatility_score = self._calculate_volatility_score(bb_metrics, atr_metrics)
+        volatility_regime = self._classify_volatility_regime(volatility_score)
+        
+        result = VolatilityMetrics(
+            bollinger_width_pct=bb_metrics['width_pct'],
+            bollinger_width_std=bb_metrics['width_std'],
+            bollinger_squeeze_ratio=bb_metrics['squeeze_ratio'],
+            bollinger_upper_touches=bb_metrics['upper_touches'],
+            bollinger_lower_touches=bb_metrics['lower_touches'],
+            atr_normalized_range=atr_metrics['normalized_range'],
+            atr_trend=atr_metrics['trend'],
+            avg_atr=atr_metrics['avg_atr'],
+            volatility_score=volatility_score,
+            volatility_regime=volatility_regime,
+            strategy_name='combined',
+            strategy_params={
+                'bb_length': self.bb_length,
+                'bb_std': self.bb_std,
+                'touch_threshold': self.touch_threshold
+            }
+        )
+        
+        result.validate()
+        return result
+    
     def _calculate_bollinger_metrics(self, zone_data: pd.DataFrame) -> Dict[str, Any]:
         """Calculate Bollinger Bands metrics."""
         try:
-            # Create Bollinger Bands indicator via LibraryManager
-            bbands_indicator = LibraryManager.create_indicator(
-                'pandas_ta',
-                'bbands',
-                length=self.bb_length,
-                std=self.bb_std
+            close = zone_data['close']
+            bb_lower, bb_middle, bb_upper = (
+                pd.Series(band, index=close.index)
+                for band in bollinger_bands(close, self.bb_length, self.bb_std)
             )
             
-            # Calculate Bollinger Bands
-            bb_result = bbands_indicator.calculate(zone_data)
-            bb_df = bb_result.data
-            
-            # Extract bands (pandas-ta returns: BBL_20_2.0, BBM_20_2.0, BBU_20_2.0, BBB_20_2.0, BBP_20_2.0)
-            # Find column names
-            bb_cols = [col for col in bb_df.columns if 'BB' in col]
-            
-            # Identify specific columns
-            lower_col = [col for col in bb_cols if 'BBL' in col][0]
-            middle_col = [col for col in bb_cols if 'BBM' in col][0]
-            upper_col = [col for col in bb_cols if 'BBU' in col][0]
-            
-            bb_lower = bb_df[lower_col]
-            bb_middle = bb_df[middle_col]
-            bb_upper = bb_df[upper_col]
-            
             # Calculate width as percentage of middle band
             bb_width = (bb_upper - bb_lower) / bb_middle * 100
             bb_width = bb_width.replace([np.inf, -np.inf], np.nan).dropna()
@@ -149,7 +253,6 @@ class CombinedVolatilityStrategy:
             squeeze_ratio = (current_width / width_pct) if width_pct > 0 else 1.0
             
             # Band touches (price within threshold of band)
-            close = zone_data['close']
             upper_threshold = bb_upper * (1 - self.touch_threshold)
             lower_threshold = bb_lower * (1 + self.touch_threshold)
             
@@ -243,6 +346,89 @@ class CombinedVolatilityStrategy:
             'trend': atr_trend
         }
     
+    def _batch_bollinger_metrics(self,
+                                 seg: ZoneSegments,
+                                 close: np.ndarray,
+                                 bands: BollingerColumns) -> Dict[str, np.ndarray]:
+        """Bollinger metrics of every zone as segment reductions."""
+        warm_up = seg.local_pos < self.bb_length - 1
+        width = seg.gather(bands.width_pct)
+        width[warm_up] = np.nan
+        
+        counts = seg.count(width)
+        width_pct = np.where(counts > 0, seg.mean(width), 0.0)
+        # Like pandas: std of a single value is NaN (and fails validation)
+        width_std = np.where(counts > 0, seg.std(width), 0.0)
+        
+        last_valid = np.maximum.reduceat(np.where(np.isnan(width), -1, seg.local_pos), seg.offsets)
+        current_width = np.where(
+            last_valid >= 0, width[seg.offsets + np.maximum(last_valid, 0)], width_pct
+        )
+        with np.errstate(invalid='ignore', divide='ignore'):
+            squeeze_ratio = np.where(width_pct > 0, current_width / width_pct, 1.0)
+        
+        close = seg.gather(close)
+        with np.errstate(invalid='ignore'):
+            upper_touch = close >= seg.gather(bands.upper) * (1 - self.touch_threshold)
+            lower_touch = close <= seg.gather(bands.lower) * (1 + self.touch_threshold)
+        
+        return {
+            'width_pct': width_pct,
+            'width_std': width_std,
+            'squeeze_ratio': squeeze_ratio,
+            'upper_touches': np.add.reduceat((upper_touch & ~warm_up).astype(np.int64), seg.offsets),
+            'lower_touches': np.add.reduceat((lower_touch & ~warm_up).astype(np.int64), seg.offsets),
+        }
+    
+    def _batch_atr_metrics(self, seg: ZoneSegments, get) -> Dict[str, np.ndarray]:
+        """ATR metrics of every zone (vectorized :meth:`_calculate_atr_metrics`)."""
+        atr = seg.gather(get('atr'))
+        return self._batch_range_metrics(seg, get, seg.mean(atr), seg.first(atr), seg.last(atr))
+    
+    def _batch_estimated_atr_metrics(self, seg: ZoneSegments, get) -> Dict[str, np.ndarray]:
+        """True Range metrics of every zone (vectorized :meth:`_estimate_atr_metrics`)."""
+        high = seg.gather(get('high'))
+        low = seg.gather(get('low'))
+        close = seg.gather(get('close'))
+        
+        prev_close = np.empty_like(close)
+        prev_close[0] = np.nan
+        prev_close[1:] = close[:-1]
+        prev_close[seg.is_first] = np.nan
+        true_range = np.fmax(
+            np.fmax(high - low, np.abs(high - prev_close)), np.abs(low - prev_close)
+        )
+        
+        lengths = seg.lengths[seg.segment_of]
+        long_zone = seg.lengths >= 5
+        tr_start = np.where(
+            long_zone, seg.mean(np.where(seg.local_pos < 5, true_range, np.nan)), seg.first(true_range)
+        )
+        tr_end = np.where(
+            long_zone, seg.mean(np.where(seg.local_pos >= lengths - 5, true_range, np.nan)), seg.last(true_range)
+        )
+        return self._batch_range_metrics(seg, get, seg.mean(true_range), tr_start, tr_end)
+    
+    def _batch_range_metrics(self,
+                             seg: ZoneSegments,
+                             get,
+                             avg_atr: np.ndarray,
+                             atr_start: np.ndarray,
+                             atr_end: np.ndarray) -> Dict[str, np.ndarray]:
+        price_range = seg.max(seg.gather(get('high'))) - seg.min(seg.gather(get('low')))
+        with np.errstate(invalid='ignore', divide='ignore'):
+            normalized_range = np.where(avg_atr > 0, price_range / avg_atr, 0.0)
+            atr_change = np.where(atr_start > 0, atr_end / atr_start - 1, 0.0)
+        
+        trend = np.where(
+            atr_change > 0.2, 'increasing', np.where(atr_change < -0.2, 'decreasing', 'stable')
+        )
+        return {
+            'avg_atr': avg_atr,
+            'normalized_range': normalized_range,
+            'trend': trend,
+        }
+    
     def _calculate_volatility_score(
         self,
         bb_metrics: Dict[str, Any],
@@ -302,7 +488,13 @@ class CombinedVolatilityStrategy:
                 'bb_std': self.bb_std,
                 'touch_threshold': self.touch_threshold
             },
-            'indicators': ['Bollinger Bands (pandas-ta)', 'ATR'],
+            'indicators': ['Bollinger Bands', 'ATR'],
             'source': 'Classic technical analysis'
         }
 
+
+def _rows(columns: Dict[str, np.ndarray]) -> List[Dict[str, Any]]:
+    """Per-zone metric dicts (Python scalars) from per-zone metric arrays."""
+    names = list(columns)
+    values = [columns[name].tolist() for name in names]
+    return [dict(zip(names, row)) for row in zip(*values)]
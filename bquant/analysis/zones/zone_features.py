@@ -17,7 +17,8 @@ from ...core.logging_config import get_logger
 from ...core.exceptions import AnalysisError
 from ...core.config import create_swing_strategy, create_divergence_strategy, create_shape_strategy, create_volume_strategy, create_volatility_strategy
 from .. import AnalysisResult, BaseAnalyzer
-from .models import ZoneInfo
+from .models import ZoneInfo, ZoneColumnStore
+from .batch_features import compute_zone_base_features
 
 # Получаем логгер для модуля
 logger = get_logger(__name__)
@@ -97,6 +98,9 @@ class ZoneFeaturesAnalyzer(BaseAnalyzer):
     Поддерживает расширяемую архитектуру метрик через Strategy Pattern (Phase 3.0+).
     """
     
+    # 'atr' используется, если есть во входных данных; пайплайн добавляет его
+    # только для стратегий, которые его объявляют (см. zones.columns)
+    
     def __init__(self, 
                  min_duration: int = 2, 
                  min_amplitude: float = 0.001,
@@ -345,28 +349,7 @@ class ZoneFeaturesAnalyzer(BaseAnalyzer):
                 })
                 
                 # Legacy metadata (for backward compatibility with MACD zones)
-                # Keep MACD-specific metadata keys if primary_indicator is MACD-related
-                if 'macd_hist' in primary_indicator.lower() or primary_indicator == 'macd_hist':
-                    metadata.update({
-                        'hist_max': metadata['oscillator_max'],  # Alias for BC
-                        'hist_min': metadata['oscillator_min'],  # Alias for BC
-                        'hist_avg': metadata['oscillator_avg'],  # Alias for BC
-                        'hist_std': metadata['oscillator_std'],  # Alias for BC
-                    })
-                elif 'rsi' in primary_indicator.lower():
-                    metadata.update({
-                        'rsi_max': metadata['oscillator_max'],  # Alias for BC
-                        'rsi_min': metadata['oscillator_min'],  # Alias for BC
-                        'rsi_avg': metadata['oscillator_avg'],  # Alias for BC
-                        'rsi_std': metadata['oscillator_std'],  # Alias for BC
-                    })
-                elif 'ao' in primary_indicator.lower() or primary_indicator.startswith('AO_'):
-                    metadata.update({
-                        'ao_max': metadata['oscillator_max'],  # Alias for BC
-                        'ao_min': metadata['oscillator_min'],  # Alias for BC
-                        'ao_avg': metadata['oscillator_avg'],  # Alias for BC
-                        'ao_std': metadata['oscillator_std'],  # Alias for BC
-                    })
+                self._add_oscillator_aliases(metadata, primary_indicator)
             
             if 'atr' in data.columns:
                 metadata.update({
@@ -375,145 +358,8 @@ class ZoneFeaturesAnalyzer(BaseAnalyzer):
                     'avg_atr': float(data['atr'].mean())
                 })
             
-            # Calculate swing metrics using strategy (if available)
-            if self.swing_strategy is not None:
-                swing_context = zone_info.get('swing_context')
-
-                # Pre-set calculation mode for logging and metadata consistency.
-                if swing_context is not None:
-                    metadata['swing_calculation_mode'] = 'global'
-                else:
-                    metadata['swing_calculation_mode'] = 'per_zone'
-
-                try:
-                    if swing_context is not None:
-                        temp_zone = ZoneInfo(
-                            zone_id=zone_info['zone_id'],
-                            type=zone_info['type'],
-                            start_idx=zone_info['start_idx'],
-                            end_idx=zone_info['end_idx'],
-                            start_time=zone_info['start_time'],
-                            end_time=zone_info['end_time'],
-                            duration=zone_info['duration'],
-                            data=data,
-                            indicator_context=zone_info.get('indicator_context'),
-                            swing_context=swing_context,
-                        )
-
-                        swing_metrics = self.swing_strategy.aggregate_for_zone(
-                            temp_zone,
-                            swing_context,
-                        )
-                        metadata['swing_metrics'] = swing_metrics.to_dict()
-                        self.logger.debug(
-                            "Swing metrics aggregated from global context: %s rallies, %s drops, ratio=%.2f",
-                            swing_metrics.rally_count,
-                            swing_metrics.drop_count,
-                            swing_metrics.rally_to_drop_ratio,
-                        )
-                    else:
-                        swing_metrics = self.swing_strategy.calculate(data)
-                        metadata['swing_metrics'] = swing_metrics.to_dict()
-                        self.logger.debug(
-                            "Swing metrics calculated in per_zone mode: %s rallies, %s drops, ratio=%.2f",
-                            swing_metrics.rally_count,
-                            swing_metrics.drop_count,
-                            swing_metrics.rally_to_drop_ratio,
-                        )
-                except Exception as e:
-                    self.logger.warning(f"Failed to calculate swing metrics: {e}")
-                    metadata['swing_metrics'] = None
-            
-            # Calculate shape metrics using strategy (v2.1 - with indicator_col parameter)
-            if self.shape_strategy is not None:
-                try:
-                    # Use primary_indicator from context if available
-                    if primary_indicator and primary_indicator in data.columns:
-                        shape_metrics = self.shape_strategy.calculate(data, indicator_col=primary_indicator)
-                        metadata['shape_metrics'] = shape_metrics.to_dict()
-                        self.logger.debug(
-                            f"Shape metrics calculated for '{primary_indicator}': "
-                            f"skewness={shape_metrics.hist_skewness:.2f}, kurtosis={shape_metrics.hist_kurtosis:.2f}"
-                        )
-                    else:
-                        # Fallback: try to find ANY oscillator column (universal, no hardcoded names)
-                        fallback_col = self._find_any_oscillator(data)
-                        if fallback_col:
-                            shape_metrics = self.shape_strategy.calculate(data, indicator_col=fallback_col)
-                            metadata['shape_metrics'] = shape_metrics.to_dict()
-                            self.logger.debug(f"Shape analysis used fallback column: {fallback_col}")
-                        else:
-                            metadata['shape_metrics'] = None
-                            self.logger.debug("No suitable column for shape analysis")
-                except Exception as e:
-                    self.logger.debug(f"Shape metrics not available: {e}")
-                    metadata['shape_metrics'] = None
-            
-            # Calculate divergence metrics using strategy (v2.1 - with indicator parameters)
-            if self.divergence_strategy is not None:
-                try:
-                    # Use primary_indicator and signal_line from context if available
-                    if primary_indicator and primary_indicator in data.columns:
-                        divergence_metrics = self.divergence_strategy.calculate_divergence(
-                            data,
-                            indicator_col=primary_indicator,
-                            indicator_line_col=signal_line if signal_line and signal_line in data.columns else None
-                        )
-                        metadata['divergence_metrics'] = divergence_metrics.to_dict()
-                        self.logger.debug(
-                            f"Divergence metrics calculated for '{primary_indicator}': "
-                            f"type={divergence_metrics.divergence_type}, count={divergence_metrics.divergence_count}"
-                        )
-                    else:
-                        # Fallback: try to find ANY oscillator column
-                        fallback_col = self._find_any_oscillator(data)
-                        if fallback_col:
-                            divergence_metrics = self.divergence_strategy.calculate_divergence(
-                                data, indicator_col=fallback_col
-                            )
-                            metadata['divergence_metrics'] = divergence_metrics.to_dict()
-                            self.logger.debug(f"Divergence analysis used fallback column: {fallback_col}")
-                        else:
-                            metadata['divergence_metrics'] = None
-                            self.logger.debug("No suitable column for divergence analysis")
-                except Exception as e:
-                    self.logger.debug(f"Divergence metrics not available: {e}")
-                    metadata['divergence_metrics'] = None
-            
-            # Calculate volatility metrics using strategy (if available)
-            if self.volatility_strategy is not None:
-                try:
-                    volatility_metrics = self.volatility_strategy.calculate_volatility(data)
-                    metadata['volatility_metrics'] = volatility_metrics.to_dict()
-                    self.logger.debug(
-                        f"Volatility metrics calculated: score={volatility_metrics.volatility_score:.2f}, "
-                        f"regime={volatility_metrics.volatility_regime}, "
-                        f"bb_width={volatility_metrics.bollinger_width_pct:.2f}%"
-                    )
-                except Exception as e:
-                    self.logger.warning(f"Failed to calculate volatility metrics: {e}")
-                    metadata['volatility_metrics'] = None
-            
-            # Calculate volume metrics using strategy (v2.1 - with indicator_col parameter)
-            if self.volume_strategy is not None and 'volume' in data.columns:
-                try:
-                    # Calculate baseline volume (average of previous bars, if available)
-                    # For now, we don't have access to pre-zone data, so baseline_volume=None
-                    # Strategy will handle this gracefully
-                    
-                    # v2.1: Pass indicator_col for volume-indicator correlation
-                    volume_metrics = self.volume_strategy.calculate_volume(
-                        data, 
-                        baseline_volume=None,
-                        indicator_col=primary_indicator  # From context (or None)
-                    )
-                    metadata['volume_metrics'] = volume_metrics.to_dict()
-                    self.logger.debug(
-                        f"Volume metrics calculated: avg={volume_metrics.avg_volume_zone}"
-                    )
-                except Exception as e:
-                    self.logger.debug(f"Volume metrics not available: {e}")
-                    metadata['volume_metrics'] = None
+            # Strategy-based metrics (swing/shape/divergence/volatility/volume)
+            self._calculate_strategy_metrics(zone_info, data, primary_indicator, signal_line, metadata)
             
             return ZoneFeatures(
                 zone_id=zone_id,
@@ -541,12 +387,204 @@ class ZoneFeaturesAnalyzer(BaseAnalyzer):
             self.logger.error(f"Failed to extract zone features: {e}")
             raise AnalysisError(f"Failed to extract zone features: {e}")
     
-    def extract_all_zones_features(self, zones: List) -> List[ZoneFeatures]:
+    @staticmethod
+    def _add_oscillator_aliases(metadata: Dict[str, Any], primary_indicator: str) -> None:
+        """Legacy alias keys (hist_*/rsi_*/ao_*) for oscillator metadata (BC)."""
+        if 'macd_hist' in primary_indicator.lower() or primary_indicator == 'macd_hist':
+            metadata.update({
+                'hist_max': metadata['oscillator_max'],  # Alias for BC
+                'hist_min': metadata['oscillator_min'],  # Alias for BC
+                'hist_avg': metadata['oscillator_avg'],  # Alias for BC
+                'hist_std': metadata['oscillator_std'],  # Alias for BC
+            })
+        elif 'rsi' in primary_indicator.lower():
+            metadata.update({
+                'rsi_max': metadata['oscillator_max'],  # Alias for BC
+                'rsi_min': metadata['oscillator_min'],  # Alias for BC
+                'rsi_avg': metadata['oscillator_avg'],  # Alias for BC
+                'rsi_std': metadata['oscillator_std'],  # Alias for BC
+            })
+        elif 'ao' in primary_indicator.lower() or primary_indicator.startswith('AO_'):
+            metadata.update({
+                'ao_max': metadata['oscillator_max'],  # Alias for BC
+                'ao_min': metadata['oscillator_min'],  # Alias for BC
+                'ao_avg': metadata['oscillator_avg'],  # Alias for BC
+                'ao_std': metadata['oscillator_std'],  # Alias for BC
+            })
+    
+    def _calculate_strategy_metrics(self,
+                                    zone_info: Dict[str, Any],
+                                    data: pd.DataFrame,
+                                    primary_indicator: Optional[str],
+                                    signal_line: Optional[str],
+                                    metadata: Dict[str, Any]) -> None:
+        """
+        Расчет метрик стратегий (swing/shape/divergence/volatility/volume) в metadata.
+        
+        Общая часть для поштучного и пакетного извлечения признаков.
+        """
+        # Calculate swing metrics using strategy (if available)
+        if self.swing_strategy is not None:
+            swing_context = zone_info.get('swing_context')
+
+            # Pre-set calculation mode for logging and metadata consistency.
+            if swing_context is not None:
+                metadata['swing_calculation_mode'] = 'global'
+            else:
+                metadata['swing_calculation_mode'] = 'per_zone'
+
+            try:
+                if swing_context is not None and zone_info.get('global_swing_metrics') is not None:
+                    swing_metrics = zone_info['global_swing_metrics']
+                    metadata['swing_metrics'] = swing_metrics.to_dict()
+                elif swing_context is not None:
+                    temp_zone = ZoneInfo(
+                        zone_id=zone_info['zone_id'],
+                        type=zone_info['type'],
+                        start_idx=zone_info['start_idx'],
+                        end_idx=zone_info['end_idx'],
+                        start_time=zone_info['start_time'],
+                        end_time=zone_info['end_time'],
+                        duration=zone_info['duration'],
+                        data=data,
+                        indicator_context=zone_info.get('indicator_context'),
+                        swing_context=swing_context,
+                    )
+
+                    swing_metrics = self.swing_strategy.aggregate_for_zone(
+                        temp_zone,
+                        swing_context,
+                    )
+                    metadata['swing_metrics'] = swing_metrics.to_dict()
+                    self.logger.debug(
+                        "Swing metrics aggregated from global context: %s rallies, %s drops, ratio=%.2f",
+                        swing_metrics.rally_count,
+                        swing_metrics.drop_count,
+                        swing_metrics.rally_to_drop_ratio,
+                    )
+                else:
+                    swing_metrics = self.swing_strategy.calculate(data)
+                    metadata['swing_metrics'] = swing_metrics.to_dict()
+                    self.logger.debug(
+                        "Swing metrics calculated in per_zone mode: %s rallies, %s drops, ratio=%.2f",
+                        swing_metrics.rally_count,
+                        swing_metrics.drop_count,
+                        swing_metrics.rally_to_drop_ratio,
+                    )
+            except Exception as e:
+                self.logger.warning(f"Failed to calculate swing metrics: {e}")
+                metadata['swing_metrics'] = None
+        
+        # Calculate shape metrics using strategy (v2.1 - with indicator_col parameter)
+        if self.shape_strategy is not None:
+            try:
+                # Use primary_indicator from context if available
+                if primary_indicator and primary_indicator in data.columns:
+                    shape_metrics = self.shape_strategy.calculate(data, indicator_col=primary_indicator)
+                    metadata['shape_metrics'] = shape_metrics.to_dict()
+                    self.logger.debug(
+                        f"Shape metrics calculated for '{primary_indicator}': "
+                        f"skewness={shape_metrics.hist_skewness:.2f}, kurtosis={shape_metrics.hist_kurtosis:.2f}"
+                    )
+                else:
+                    # Fallback: try to find ANY oscillator column (universal, no hardcoded names)
+                    fallback_col = self._find_any_oscillator(data)
+                    if fallback_col:
+                        shape_metrics = self.shape_strategy.calculate(data, indicator_col=fallback_col)
+                        metadata['shape_metrics'] = shape_metrics.to_dict()
+                        self.logger.debug(f"Shape analysis used fallback column: {fallback_col}")
+                    else:
+                        metadata['shape_metrics'] = None
+                        self.logger.debug("No suitable column for shape analysis")
+            except Exception as e:
+                self.logger.debug(f"Shape metrics not available: {e}")
+                metadata['shape_metrics'] = None
+        
+        # Calculate divergence metrics using strategy (v2.1 - with indicator parameters)
+        if self.divergence_strategy is not None:
+            try:
+                if 'global_divergence_metrics' in zone_info:
+                    metadata['divergence_metrics'] = zone_info['global_divergence_metrics'].to_dict()
+                # Use primary_indicator and signal_line from context if available
+                elif primary_indicator and primary_indicator in data.columns:
+                    divergence_metrics = self.divergence_strategy.calculate_divergence(
+                        data,
+                        indicator_col=primary_indicator,
+                        indicator_line_col=signal_line if signal_line and signal_line in data.columns else None
+                    )
+                    metadata['divergence_metrics'] = divergence_metrics.to_dict()
+                    self.logger.debug(
+                        f"Divergence metrics calculated for '{primary_indicator}': "
+                        f"type={divergence_metrics.divergence_type}, count={divergence_metrics.divergence_count}"
+                    )
+                else:
+                    # Fallback: try to find ANY oscillator column
+                    fallback_col = self._find_any_oscillator(data)
+                    if fallback_col:
+                        divergence_metrics = self.divergence_strategy.calculate_divergence(
+                            data, indicator_col=fallback_col
+                        )
+                        metadata['divergence_metrics'] = divergence_metrics.to_dict()
+                        self.logger.debug(f"Divergence analysis used fallback column: {fallback_col}")
+                    else:
+                        metadata['divergence_metrics'] = None
+                        self.logger.debug("No suitable column for divergence analysis")
+            except Exception as e:
+                self.logger.debug(f"Divergence metrics not available: {e}")
+                metadata['divergence_metrics'] = None
+        
+        # Calculate volatility metrics using strategy (if available)
+        if self.volatility_strategy is not None:
+            try:
+                if 'global_volatility_metrics' in zone_info:
+                    volatility_metrics = zone_info['global_volatility_metrics']
+                    if volatility_metrics is None:
+                        raise ValueError("no valid volatility metrics for zone in batch calculation")
+                else:
+                    volatility_metrics = self.volatility_strategy.calculate_volatility(data)
+                metadata['volatility_metrics'] = volatility_metrics.to_dict()
+                self.logger.debug(
+                    f"Volatility metrics calculated: score={volatility_metrics.volatility_score:.2f}, "
+                    f"regime={volatility_metrics.volatility_regime}, "
+                    f"bb_width={volatility_metrics.bollinger_width_pct:.2f}%"
+                )
+            except Exception as e:
+                self.logger.warning(f"Failed to calculate volatility metrics: {e}")
+                metadata['volatility_metrics'] = None
+        
+        # Calculate volume metrics using strategy (v2.1 - with indicator_col parameter)
+        if self.volume_strategy is not None and 'volume' in data.columns:
+            try:
+                # Calculate baseline volume (average of previous bars, if available)
+                # For now, we don't have access to pre-zone data, so baseline_volume=None
+                # Strategy will handle this gracefully
+                
+                # v2.1: Pass indicator_col for volume-indicator correlation
+                volume_metrics = self.volume_strategy.calculate_volume(
+                    data, 
+                    baseline_volume=None,
+                    indicator_col=primary_indicator  # From context (or None)
+                )
+                metadata['volume_metrics'] = volume_metrics.to_dict()
+                self.logger.debug(
+                    f"Volume metrics calculated: avg={volume_metrics.avg_volume_zone}"
+                )
+            except Exception as e:
+                self.logger.debug(f"Volume metrics not available: {e}")
+                metadata['volume_metrics'] = None
+    
+    def extract_all_zones_features(self, zones: List, batch: bool = True) -> List[ZoneFeatures]:
         """
         Извлечение признаков для списка зон (новая архитектура).
         
+        Если зоны разделяют общий :class:`ZoneColumnStore` (результат detection
+        стратегий), базовые признаки считаются одним векторизованным проходом
+        (:meth:`extract_base_features_batch`), а поштучно выполняются только
+        стратегии метрик. Иначе используется поштучный путь.
+        
         Args:
             zones: Список ZoneInfo объектов
+            batch: Разрешить пакетный расчет базовых признаков
         
         Returns:
             List[ZoneFeatures]: Список признаков для каждой зоны
@@ -558,6 +596,14 @@ class ZoneFeaturesAnalyzer(BaseAnalyzer):
             analyzer = ZoneFeaturesAnalyzer()
             features = analyzer.extract_all_zones_features(zones)
         """
+        if batch:
+            features_list = self._extract_all_zones_features_batch(zones)
+            if features_list is not None:
+                self.logger.info(
+                    f"Extracted features for {len(features_list)}/{len(zones)} zones (batch)"
+                )
+                return features_list
+        
         features_list = []
         
         for zone in zones:
@@ -574,12 +620,274 @@ class ZoneFeaturesAnalyzer(BaseAnalyzer):
         
         return features_list
     
-    def analyze_zones_distribution(self, zones_features: List[Union[ZoneFeatures, Dict[str, Any]]]) -> AnalysisResult:
+    def extract_base_features_batch(self,
+                                    data: Union[pd.DataFrame, ZoneColumnStore, Dict[str, np.ndarray]],
+                                    start_idx,
+                                    end_idx,
+                                    zone_types=None,
+                                    indicator_col: Optional[str] = None) -> pd.DataFrame:
+        """
+        Пакетный расчет базовых признаков по массивам границ зон.
+        
+        Args:
+            data: Полные колонки (DataFrame, ZoneColumnStore или dict NumPy массивов)
+            start_idx: Позиции начала зон (включительно)
+            end_idx: Позиции конца зон (включительно)
+            zone_types: Типы зон ('bull'/'bear') для type-specific метрик
+            indicator_col: Колонка осциллятора для amplitude/slope/correlation
+        
+        Returns:
+            pd.DataFrame: Одна строка на зону, колонки соответствуют полям
+            ZoneFeatures и ключам metadata.
+        """
+        return compute_zone_base_features(
+            data, start_idx, end_idx, zone_types=zone_types, indicator_col=indicator_col
+        )
+    
+    def _extract_all_zones_features_batch(self, zones: List) -> Optional[List[ZoneFeatures]]:
+        """
+        Пакетный путь extract_all_zones_features.
+        
+        Returns None, если зоны не разделяют общий column store (или данные
+        зоны были материализованы и могли измениться) - тогда вызывающий
+        код использует поштучный путь.
+        """
+        if not zones:
+            return None
+        
+        first_view = getattr(zones[0], 'data_view', None)
+        if first_view is None:
+            return None
+        store = first_view.store
+        contexts = [zone.indicator_context or {} for zone in zones]
+        primary_indicator = contexts[0].get('detection_indicator')
+        signal_line = contexts[0].get('signal_line')
+        for zone, context in zip(zones, contexts):
+            view = getattr(zone, 'data_view', None)
+            if view is None or view.store is not store or zone.is_materialized:
+                return None
+            if (context.get('detection_indicator') != primary_indicator
+                    or context.get('signal_line') != signal_line):
+                return None
+        
+        columns = set(store.columns)
+        if not {'close', 'high', 'low'}.issubset(columns):
+            return None
+        
+        has_primary = bool(primary_indicator) and primary_indicator in columns
+        osc_col = primary_indicator if has_primary else self._find_any_oscillator(store.frame)
+        
+        valid_zones = []
+        for zone in zones:
+            if len(zone.data_view) < self.min_duration:
+                self.logger.warning(
+                    f"Failed to extract features for zone {zone.zone_id}: "
+                    f"Zone duration {len(zone.data_view)} is less than minimum {self.min_duration}"
+                )
+                continue
+            valid_zones.append(zone)
+        if not valid_zones:
+            return []
+        
+        table = self.extract_base_features_batch(
+            store,
+            [zone.data_view.start for zone in valid_zones],
+            [zone.data_view.stop - 1 for zone in valid_zones],
+            zone_types=[zone.type for zone in valid_zones],
+            indicator_col=osc_col,
+        )
+        rows = table.to_dict('records')
+        index = store.index
+        
+        macd_related = has_primary and (
+            primary_indicator.lower() in ['macd', 'macd_hist'] or 'macd' in primary_indicator.lower()
+        )
+        has_macd_pair = 'macd' in columns and 'macd_hist' in columns
+        global_swing_metrics = self._global_swing_metrics(valid_zones)
+        global_volatility_metrics = self._global_volatility_metrics(store, valid_zones)
+        global_divergence_metrics = None
+        if osc_col:
+            global_divergence_metrics = self._global_divergence_metrics(
+                store, valid_zones, osc_col,
+                signal_line if has_primary and signal_line in columns else None,
+            )
+        
+        needs_frame = (
+            self.shape_strategy is not None
+            or (self.divergence_strategy is not None and global_divergence_metrics is None)
+            or (self.volatility_strategy is not None and global_volatility_metrics is None)
+            or (self.volume_strategy is not None and 'volume' in columns)
+            or any(self.swing_strategy is not None and zone.swing_context is None for zone in valid_zones)
+        )
+        
+        features_list = []
+        for position, (zone, row) in enumerate(zip(valid_zones, rows)):
+            try:
+                duration = int(row['duration'])
+                
+                hist_amplitude = float(row['hist_amplitude']) if osc_col else None
+                hist_slope = float(row['hist_slope']) if osc_col and duration >= 2 else None
+                correlation_price_hist = (
+                    float(row['correlation_price_hist']) if osc_col and duration >= 3 else None
+                )
+                macd_amplitude = None
+                if macd_related:
+                    if 'macd' in columns:
+                        macd_amplitude = row['max_macd'] - row['min_macd']
+                    else:
+                        macd_amplitude = hist_amplitude
+                
+                atr_normalized_return = None
+                if 'atr' in columns and row['atr_start'] > 0:
+                    atr_normalized_return = row['atr_normalized_return']
+                
+                metadata = {
+                    'data_points': duration,
+                    'start_timestamp': str(index[row['start_idx']]),
+                    'end_timestamp': str(index[row['end_idx']]),
+                    'max_price': row['max_price'],
+                    'min_price': row['min_price'],
+                    'price_range': row['price_range'],
+                }
+                if has_macd_pair:
+                    metadata.update({key: row[key] for key in (
+                        'max_macd', 'min_macd', 'avg_macd', 'macd_std',
+                        'max_hist', 'min_hist', 'avg_hist', 'hist_std',
+                    )})
+                if has_primary:
+                    metadata.update({
+                        'oscillator_name': primary_indicator,
+                        'oscillator_max': row['oscillator_max'],
+                        'oscillator_min': row['oscillator_min'],
+                        'oscillator_avg': row['oscillator_avg'],
+                        'oscillator_std': row['oscillator_std'],
+                    })
+                    self._add_oscillator_aliases(metadata, primary_indicator)
+                if 'atr' in columns:
+                    metadata.update({
+                        'atr_start': row['atr_start'],
+                        'atr_end': row['atr_end'],
+                        'avg_atr': row['avg_atr'],
+                    })
+                
+                zone_info = {
+                    'zone_id': zone.zone_id,
+                    'type': zone.type,
+                    'start_idx': zone.start_idx,
+                    'end_idx': zone.end_idx,
+                    'start_time': zone.start_time,
+                    'end_time': zone.end_time,
+                    'duration': zone.duration,
+                    'indicator_context': zone.indicator_context,
+                    'swing_context': zone.swing_context,
+                    'global_swing_metrics': (
+                        global_swing_metrics[position] if global_swing_metrics is not None else None
+                    ),
+                }
+                if global_volatility_metrics is not None:
+                    zone_info['global_volatility_metrics'] = global_volatility_metrics[position]
+                if global_divergence_metrics is not None:
+                    zone_info['global_divergence_metrics'] = global_divergence_metrics[position]
+                data = zone.get_data(cache=False) if needs_frame else zone.data_view
+                self._calculate_strategy_metrics(zone_info, data, primary_indicator, signal_line, metadata)
+                
+                is_bull = zone.type == 'bull'
+                is_bear = zone.type == 'bear'
+                features_list.append(ZoneFeatures(
+                    zone_id=zone.zone_id,
+                    zone_type=zone.type,
+                    duration=duration,
+                    start_price=row['start_price'],
+                    end_price=row['end_price'],
+                    price_return=row['price_return'],
+                    macd_amplitude=macd_amplitude,
+                    hist_amplitude=hist_amplitude,
+                    price_range_pct=row['price_range_pct'],
+                    atr_normalized_return=atr_normalized_return,
+                    correlation_price_hist=correlation_price_hist,
+                    num_peaks=int(row['num_peaks']),
+                    num_troughs=int(row['num_troughs']),
+                    drawdown_from_peak=row['drawdown_from_peak'] if is_bull else None,
+                    rally_from_trough=row['rally_from_trough'] if is_bear else None,
+                    peak_time_ratio=row['peak_time_ratio'] if is_bull else None,
+                    trough_time_ratio=row['trough_time_ratio'] if is_bear else None,
+                    hist_slope=hist_slope,
+                    metadata=metadata,
+                ))
+            except Exception as e:
+                self.logger.warning(f"Failed to extract features for zone {zone.zone_id}: {e}")
+                continue
+        
+        return features_list
+    
+    def _global_swing_metrics(self, zones: List[ZoneInfo]) -> Optional[List[Any]]:
+        """
+        Swing-метрики всех зон из общего глобального SwingContext за один векторный проход.
+        
+        Возвращает None, если стратегия не поддерживает ``aggregate_for_zones``
+        или зоны не разделяют один контекст (тогда метрики считаются по зонам).
+        """
+        if self.swing_strategy is None or not hasattr(self.swing_strategy, 'aggregate_for_zones'):
+            return None
+        context = zones[0].swing_context
+        if context is None or any(zone.swing_context is not context for zone in zones):
+            return None
+        try:
+            return self.swing_strategy.aggregate_for_zones(zones, context)
+        except Exception as e:
+            self.logger.warning(f"Batch swing aggregation failed, falling back to per-zone: {e}")
+            return None
+    
+    def _global_volatility_metrics(self, store: ZoneColumnStore, zones: List[ZoneInfo]) -> Optional[List[Any]]:
+        """
+        Volatility-метрики всех зон по колонкам, рассчитанным один раз на полном фрейме.
+        
+        Возвращает None, если стратегия не поддерживает ``calculate_volatility_batch``
+        (тогда метрики считаются по зонам).
+        """
+        if self.volatility_strategy is None or not hasattr(self.volatility_strategy, 'calculate_volatility_batch'):
+            return None
+        try:
+            return self.volatility_strategy.calculate_volatility_batch(
+                store,
+                [zone.data_view.start for zone in zones],
+                [zone.data_view.stop - 1 for zone in zones],
+            )
+        except Exception as e:
+            self.logger.warning(f"Batch volatility calculation failed, falling back to per-zone: {e}")
+            return None
+    
+    def _global_divergence_metrics(self,
+                                   store: ZoneColumnStore,
+                                   zones: List[ZoneInfo],
+                                   indicator_col: str,
+                                   indicator_line_col: Optional[str]) -> Optional[List[Any]]:
+        """
+        Divergence-метрики всех зон по экстремумам, найденным один раз на всем ряде.
+        
+        Возвращает None, если стратегия не поддерживает ``calculate_divergence_batch``
+        (тогда метрики считаются по зонам).
+        """
+        if self.divergence_strategy is None or not hasattr(self.divergence_strategy, 'calculate_divergence_batch'):
+            return None
+        try:
+            return self.divergence_strategy.calculate_divergence_batch(
+                store,
+                [zone.data_view.start for zone in zones],
+                [zone.data_view.stop - 1 for zone in zones],
+                indicator_col=indicator_col,
+                indicator_line_col=indicator_line_col,
+            )
+        except Exception as e:
+            self.logger.warning(f"Batch divergence calculation failed, falling back to per-zone: {e}")
+            return None
+    
+    def analyze_zones_distribution(self, zones_features: Union[List[Union[ZoneFeatures, Dict[str, Any]]], 'ZoneFeatureTable']) -> AnalysisResult:
         """
         Анализ распределения характеристик зон.
         
         Args:
-            zones_features: Список объектов ZoneFeatures или словарей
+            zones_features: Список объектов ZoneFeatures или словарей, либо ZoneFeatureTable
         
         Returns:
             AnalysisResult с анализом распределения
@@ -590,17 +898,9 @@ class ZoneFeaturesAnalyzer(BaseAnalyzer):
             if not zones_features:
                 raise AnalysisError("No zones features provided")
             
-            # Конвертируем в DataFrame
-            features_dicts = []
-            for zone in zones_features:
-                if isinstance(zone, ZoneFeatures):
-                    features_dicts.append(zone.to_dict())
-                elif isinstance(zone, dict):
-                    features_dicts.append(zone)
-                else:
-                    raise AnalysisError(f"Invalid zone features type: {type(zone)}")
-            
-            df_features = pd.DataFrame(features_dicts)
+            # Конвертируем в DataFrame (ZoneFeatureTable используется без конвертации)
+            from .feature_table import as_feature_frame
+            df_features = as_feature_frame(zones_features)
             
             # Разделяем по типу зон
             bull_zones = df_features[df_features['zone_type'] == 'bull']
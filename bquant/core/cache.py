@@ -6,18 +6,23 @@
 """
 
 import hashlib
+import os
 import pickle
+import sqlite3
+import threading
 import time
-from typing import Any, Dict, Optional, Callable, Union, Tuple
+from typing import Any, Dict, List, Optional, Callable, Union, Tuple
 from functools import wraps
 from pathlib import Path
 import pandas as pd
 import numpy as np
+from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 
 from .logging_config import get_logger
 from .config import get_cache_config
+from .fingerprint import fingerprint
 
 logger = get_logger(__name__)
 
@@ -78,20 +83,49 @@ class CacheEntry:
 class MemoryCache:
     """
     Кэш в памяти с поддержкой TTL и LRU эвикции.
+    
+    LRU-порядок хранится в ``OrderedDict`` (обращение и эвикция за O(1)).
+    Помимо лимита числа записей поддерживается бюджет по памяти ``max_bytes``
+    (по ``CacheEntry.size_bytes``) и опциональные бюджеты по пространствам имен
+    (``'indicators'``, ``'zones'``, ``'swing'``, ...): при превышении
+    вытесняются наименее недавно использованные записи того же пространства.
     """
     
-    def __init__(self, max_size: int = 100, default_ttl: int = 3600):
+    DEFAULT_NAMESPACE = 'default'
+    
+    # Пространство имен по префиксу ключа (если не указано явно в put)
+    NAMESPACE_PREFIXES: Tuple[Tuple[str, str], ...] = (
+        ('zone_analysis_', 'zones'),
+        ('swing_', 'swing'),
+        ('indicator_', 'indicators'),
+    )
+    
+    def __init__(self,
+                 max_size: int = 100,
+                 default_ttl: int = 3600,
+                 max_bytes: Optional[int] = None,
+                 namespace_budgets: Optional[Dict[str, int]] = None):
         """
         Инициализация кэша.
         
         Args:
             max_size: Максимальное количество записей
             default_ttl: Время жизни записи по умолчанию (секунды)
+            max_bytes: Бюджет памяти на весь кэш в байтах (None = без ограничения)
+            namespace_budgets: Бюджеты памяти по пространствам имен,
+                например ``{'indicators': 512 * 2**20, 'zones': 256 * 2**20}``
         """
         self.max_size = max_size
         self.default_ttl = default_ttl
-        self._cache: Dict[str, CacheEntry] = {}
-        self._access_order: List[str] = []
+        self.max_bytes = max_bytes
+        self.namespace_budgets: Dict[str, int] = dict(namespace_budgets or {})
+        # key -> entry в LRU-порядке (первый - наименее недавно использованный)
+        self._cache: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        # namespace -> ключи в LRU-порядке (для эвикции внутри пространства)
+        self._namespaces: Dict[str, "OrderedDict[str, None]"] = {}
+        self._key_namespace: Dict[str, str] = {}
+        self._namespace_bytes: Dict[str, int] = {}
+        self._total_bytes = 0
         self.logger = get_logger(f"{__name__}.MemoryCache")
         
         # Статистика
@@ -105,12 +139,11 @@ class MemoryCache:
         key_parts = [func_name]
         
         # Добавляем args
+        mode = get_cache_config().get('fingerprint_mode', 'full')
         for arg in args:
-            if isinstance(arg, pd.DataFrame):
-                # Для DataFrame используем хэш данных
-                key_parts.append(pd.util.hash_pandas_object(arg).sum())
-            elif isinstance(arg, (pd.Series, np.ndarray)):
-                key_parts.append(str(hash(arg.tobytes() if hasattr(arg, 'tobytes') else str(arg))))
+            if isinstance(arg, (pd.DataFrame, pd.Series, np.ndarray)):
+                # Отпечаток по сырым буферам колонок (мемоизируется для pandas-объектов)
+                key_parts.append(fingerprint(arg, mode=mode))
             else:
                 key_parts.append(str(hash(str(arg))))
         
@@ -123,37 +156,49 @@ class MemoryCache:
         key_string = "|".join(str(part) for part in key_parts)
         return hashlib.md5(key_string.encode()).hexdigest()
     
+    def _resolve_namespace(self, key: str, namespace: Optional[str]) -> str:
+        """Пространство имен записи: явно заданное или по префиксу ключа."""
+        if namespace:
+            return namespace
+        for prefix, name in self.NAMESPACE_PREFIXES:
+            if key.startswith(prefix):
+                return name
+        return self.DEFAULT_NAMESPACE
+    
     def get(self, key: str) -> Optional[Any]:
         """Получить значение из кэша."""
-        if key not in self._cache:
+        entry = self._cache.get(key)
+        if entry is None:
             self._misses += 1
             return None
         
-        entry = self._cache[key]
-        
         # Проверяем истечение
         if entry.is_expired():
             self.logger.debug(f"Cache entry expired: {key}")
-            del self._cache[key]
-            if key in self._access_order:
-                self._access_order.remove(key)
+            self._remove(key)
             self._misses += 1
             return None
         
-        # Обновляем статистику и порядок доступа
+        # Обновляем статистику и порядок доступа (LRU)
         entry.touch()
         self._hits += 1
-        
-        # Перемещаем в конец списка (LRU)
-        if key in self._access_order:
-            self._access_order.remove(key)
-        self._access_order.append(key)
+        self._touch(key)
         
         self.logger.debug(f"Cache hit: {key}")
         return entry.data
     
-    def put(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
-        """Сохранить значение в кэше."""
+    def put(self, key: str, value: Any, ttl: Optional[int] = None,
+            namespace: Optional[str] = None) -> None:
+        """
+        Сохранить значение в кэше.
+        
+        Args:
+            key: Ключ
+            value: Значение
+            ttl: Время жизни в секундах (None = default_ttl)
+            namespace: Пространство имен для бюджета памяти
+                (по умолчанию определяется по префиксу ключа)
+        """
         # Определяем время истечения
         expiry = None
         if ttl is not None or self.default_ttl > 0:
@@ -166,29 +211,69 @@ class MemoryCache:
             timestamp=datetime.now(),
             expiry=expiry
         )
+        namespace = self._resolve_namespace(key, namespace)
+        size = int(entry.size_bytes)
         
-        # Проверяем, нужна ли эвикция
-        if len(self._cache) >= self.max_size and key not in self._cache:
-            self._evict_lru()
+        if key in self._cache:
+            self._remove(key)
         
-        # Сохраняем запись
-        self._cache[key] = entry
+        # Запись больше бюджета не кэшируем (иначе она вытеснит всё остальное)
+        budget = self.namespace_budgets.get(namespace)
+        if (self.max_bytes is not None and size > self.max_bytes) or (budget is not None and size > budget):
+            self.logger.debug(f"Cache entry {key} ({size} bytes) exceeds memory budget, not cached")
+            return
         
-        # Обновляем порядок доступа
-        if key in self._access_order:
-            self._access_order.remove(key)
-        self._access_order.append(key)
+        # Эвикция до вставки: лимит записей, бюджет пространства имен, общий бюджет
+        while self._cache and len(self._cache) >= self.max_size:
+            self._evict_lru()
+        if budget is not None:
+            while self._namespace_bytes.get(namespace, 0) + size > budget:
+                self._evict_lru(namespace)
+        if self.max_bytes is not None:
+            while self._cache and self._total_bytes + size > self.max_bytes:
+                self._evict_lru()
+        
+        # Сохраняем запись (в конец LRU-порядка)
+        self._cache[key] = entry
+        self._namespaces.setdefault(namespace, OrderedDict())[key] = None
+        self._key_namespace[key] = namespace
+        self._namespace_bytes[namespace] = self._namespace_bytes.get(namespace, 0) + size
+        self._total_bytes += size
         
-        self.logger.debug(f"Cache put: {key}, expires: {expiry}")
+        self.logger.debug(f"Cache put: {key} [{namespace}], {size} bytes, expires: {expiry}")
     
-    def _evict_lru(self) -> None:
-        """Удаляет наименее недавно использованную запись."""
-        if not self._access_order:
-            return
-        
-        lru_key = self._access_order[0]
-        del self._cache[lru_key]
-        self._access_order.remove(lru_key)
+    def _touch(self, key: str) -> None:
+        """Переместить ключ в конец LRU-порядка (O(1))."""
+        self._cache.move_to_end(key)
+        self._namespaces[self._key_namespace[key]].move_to_end(key)
+    
+    def _remove(self, key: str) -> None:
+        """Удалить запись и обновить учет памяти (O(1))."""
+        entry = self._cache.pop(key)
+        namespace = self._key_namespace.pop(key)
+        keys = self._namespaces[namespace]
+        del keys[key]
+        size = int(entry.size_bytes)
+        self._namespace_bytes[namespace] -= size
+        if not keys:
+            # Счетчик живет, пока в пространстве есть ключи (записи могут быть нулевого размера)
+            del self._namespaces[namespace]
+            del self._namespace_bytes[namespace]
+        self._total_bytes -= size
+    
+    def _evict_lru(self, namespace: Optional[str] = None) -> None:
+        """Удаляет наименее недавно использованную запись (в пространстве имен, если задано)."""
+        if namespace is not None:
+            keys = self._namespaces.get(namespace)
+            if not keys:
+                return
+            lru_key = next(iter(keys))
+        else:
+            if not self._cache:
+                return
+            lru_key = next(iter(self._cache))
+        
+        self._remove(lru_key)
         self._evictions += 1
         
         self.logger.debug(f"Evicted LRU entry: {lru_key}")
@@ -196,9 +281,7 @@ class MemoryCache:
     def invalidate(self, key: str) -> bool:
         """Удалить запись из кэша."""
         if key in self._cache:
-            del self._cache[key]
-            if key in self._access_order:
-                self._access_order.remove(key)
+            self._remove(key)
             self.logger.debug(f"Invalidated cache entry: {key}")
             return True
         return False
@@ -207,15 +290,15 @@ class MemoryCache:
         """Очистить весь кэш."""
         count = len(self._cache)
         self._cache.clear()
-        self._access_order.clear()
+        self._namespaces.clear()
+        self._key_namespace.clear()
+        self._namespace_bytes.clear()
+        self._total_bytes = 0
         self.logger.info(f"Cleared cache: {count} entries removed")
     
     def cleanup_expired(self) -> int:
         """Удалить истекшие записи."""
-        expired_keys = []
-        for key, entry in self._cache.items():
-            if entry.is_expired():
-                expired_keys.append(key)
+        expired_keys = [key for key, entry in self._cache.items() if entry.is_expired()]
         
         for key in expired_keys:
             self.invalidate(key)
@@ -230,7 +313,7 @@ class MemoryCache:
         total_requests = self._hits + self._misses
         hit_rate = (self._hits / total_requests * 100) if total_requests > 0 else 0
         
-        total_size = sum(entry.size_bytes for entry in self._cache.values())
+        total_size = self._total_bytes
         
         return {
             'entries': len(self._cache),
@@ -240,7 +323,16 @@ class MemoryCache:
             'hit_rate': hit_rate,
             'evictions': self._evictions,
             'total_size_bytes': total_size,
-            'avg_size_bytes': total_size / len(self._cache) if self._cache else 0
+            'avg_size_bytes': total_size / len(self._cache) if self._cache else 0,
+            'max_bytes': self.max_bytes,
+            'namespaces': {
+                name: {
+                    'entries': len(keys),
+                    'size_bytes': self._namespace_bytes.get(name, 0),
+                    'max_bytes': self.namespace_budgets.get(name),
+                }
+                for name, keys in self._namespaces.items()
+            }
         }
 
 
@@ -363,6 +455,351 @@ class DiskCache:
             self.logger.info(f"Cleaned up {expired_count} expired disk cache entries")
         
         return expired_count
+    
+    def stats(self) -> Dict[str, Any]:
+        """Статистика дискового кэша."""
+        return {
+            'backend': 'pickle',
+            'entries': len(list(self.cache_dir.glob("*.pkl"))),
+            'cache_dir': str(self.cache_dir)
+        }
+
+
+class ColumnarDiskCache:
+    """
+    Колоночный дисковый кэш: payload отдельно, метаданные в SQLite-индексе.
+    
+    - ``pd.DataFrame``/``pd.Series`` сохраняются в Arrow IPC (``.arrow``) и
+      читаются через memory map: числовые колонки без NaN возвращаются как
+      read-only view (для изменения на месте нужен ``.copy()``)
+    - ``np.ndarray`` (не object) сохраняются в ``.npy`` и открываются через
+      ``np.load(mmap_mode='c')`` (copy-on-write: файл кэша не изменяется)
+    - остальные объекты - pickle самого значения
+    
+    Истечение, размер, hits и время создания хранятся в ``index.sqlite``,
+    поэтому ``cleanup_expired()`` и ``stats()`` не читают payload-файлы.
+    API совпадает с :class:`DiskCache`.
+    """
+    
+    INDEX_FILE = "index.sqlite"
+    DATA_DIR = "data"
+    _META_KEY = b"bquant"
+    
+    def __init__(self, cache_dir: Union[str, Path] = None):
+        """
+        Инициализация колоночного дискового кэша.
+        
+        Args:
+            cache_dir: Директория для кэша (по умолчанию .cache/bquant)
+        """
+        if cache_dir is None:
+            cache_dir = Path.home() / ".cache" / "bquant"
+        
+        self.cache_dir = Path(cache_dir)
+        self.data_dir = self.cache_dir / self.DATA_DIR
+        self.data_dir.mkdir(parents=True, exist_ok=True)
+        self.index_path = self.cache_dir / self.INDEX_FILE
+        
+        self.logger = get_logger(f"{__name__}.ColumnarDiskCache")
+        conn = sqlite3.connect(self.index_path, timeout=30)
+        try:
+            # WAL: читатели не блокируют писателя (несколько процессов пакетного запуска)
+            conn.execute("PRAGMA journal_mode=WAL")
+        finally:
+            conn.close()
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                " key TEXT PRIMARY KEY,"
+                " kind TEXT NOT NULL,"
+                " file TEXT NOT NULL,"
+                " created_at REAL NOT NULL,"
+                " expiry REAL,"
+                " size_bytes INTEGER NOT NULL,"
+                " hits INTEGER NOT NULL DEFAULT 0,"
+                " last_access REAL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS entries_expiry ON entries(expiry)")
+        self.logger.info(f"Columnar disk cache initialized: {self.cache_dir}")
+    
+    def _connect(self, write: bool = True, timeout: float = 30) -> "_ClosingConnection":
+        """
+        Короткоживущее соединение (безопасно для fork/нескольких процессов).
+        
+        Пишущие транзакции открываются через ``BEGIN IMMEDIATE``: блокировка
+        записи берется сразу (с ожиданием ``timeout``), а не при переходе от
+        чтения к записи, где SQLite отвечает "database is locked" без ожидания.
+        """
+        conn = sqlite3.connect(self.index_path, timeout=timeout, isolation_level=None)
+        return _ClosingConnection(conn, "BEGIN IMMEDIATE" if write else "BEGIN")
+    
+    # --- payload (de)serialization ---------------------------------------------------
+    
+    def _write_payload(self, key: str, value: Any) -> Tuple[str, str]:
+        """Записать payload атомарно; вернуть (kind, имя файла)."""
+        kind, suffix = self._payload_kind(value)
+        file_name = f"{key}{suffix}"
+        target = self.data_dir / file_name
+        tmp = target.with_name(f".{file_name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            if kind in ('frame', 'series'):
+                import pyarrow as pa
+                frame = value.to_frame() if kind == 'series' else value
+                table = pa.Table.from_pandas(frame, preserve_index=True)
+                # attrs, freq индекса и имя Series Arrow не сохраняет
+                extra = {
+                    'attrs': dict(value.attrs),
+                    'freq': getattr(value.index, 'freqstr', None),
+                    'name': value.name if kind == 'series' else None,
+                }
+                table = table.replace_schema_metadata({
+                    **(table.schema.metadata or {}),
+                    self._META_KEY: pickle.dumps(extra, protocol=pickle.HIGHEST_PROTOCOL),
+                })
+                with pa.OSFile(str(tmp), 'wb') as sink:
+                    with pa.ipc.new_file(sink, table.schema) as writer:
+                        writer.write_table(table)
+            elif kind == 'ndarray':
+                with open(tmp, 'wb') as f:
+                    np.save(f, value, allow_pickle=False)
+            else:
+                with open(tmp, 'wb') as f:
+                    pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, target)
+        except Exception:
+            if tmp.exists():
+                tmp.unlink()
+            if kind in ('frame', 'series'):
+                # Например, object-колонки со смешанными типами - fallback на pickle
+                return self._write_pickle(key, value)
+            raise
+        return kind, file_name
+    
+    def _write_pickle(self, key: str, value: Any) -> Tuple[str, str]:
+        file_name = f"{key}.pkl"
+        target = self.data_dir / file_name
+        tmp = target.with_name(f".{file_name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp, 'wb') as f:
+            pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, target)
+        return 'pickle', file_name
+    
+    @staticmethod
+    def _payload_kind(value: Any) -> Tuple[str, str]:
+        if isinstance(value, pd.DataFrame):
+            return 'frame', '.arrow'
+        if isinstance(value, pd.Series):
+            return 'series', '.arrow'
+        if isinstance(value, np.ndarray) and value.dtype != object:
+            return 'ndarray', '.npy'
+        return 'pickle', '.pkl'
+    
+    def _read_payload(self, kind: str, file_name: str) -> Any:
+        path = self.data_dir / file_name
+        if kind in ('frame', 'series'):
+            import pyarrow as pa
+            with pa.memory_map(str(path), 'r') as source:
+                table = pa.ipc.open_file(source).read_all()
+            # split_blocks: числовые колонки без NaN остаются view на mmap-буфер
+            frame = table.to_pandas(split_blocks=True)
+            extra = pickle.loads((table.schema.metadata or {}).get(self._META_KEY, pickle.dumps({})))
+            if extra.get('freq') is not None:
+                frame.index.freq = extra['freq']
+            frame.attrs.update(extra.get('attrs') or {})
+            if kind == 'series':
+                series = frame.iloc[:, 0]
+                series.name = extra.get('name')
+                series.attrs.update(frame.attrs)
+                return series
+            return frame
+        if kind == 'ndarray':
+            return np.load(path, mmap_mode='c', allow_pickle=False)
+        with open(path, 'rb') as f:
+            return pickle.load(f)
+    
+    def _remove_file(self, file_name: str) -> None:
+        try:
+            (self.data_dir / file_name).unlink()
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            # Windows: файл может быть открыт через mmap
+            self.logger.debug(f"Could not remove cache file {file_name}: {e}")
+    
+    # --- DiskCache API ---------------------------------------------------------------
+    
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Получить значение из дискового кэша (ошибка индекса - промах).
+        
+        Чтение индекса не берет блокировку записи, поэтому процессы читают
+        параллельно; счетчик hits обновляется без ожидания (при занятой
+        блокировке попадание не учитывается).
+        
+        DataFrame/Series возвращаются поверх memory map: числовые колонки без
+        NaN доступны только для чтения, ``np.ndarray`` - copy-on-write. Для
+        изменения DataFrame на месте используйте ``.copy()``.
+        """
+        try:
+            with self._connect(write=False) as conn:
+                row = conn.execute(
+                    "SELECT kind, file, expiry FROM entries WHERE key = ?", (key,)
+                ).fetchone()
+        except sqlite3.Error as e:
+            self.logger.warning(f"Disk cache index unavailable for {key}, treating as miss: {e}")
+            return None
+        if row is None:
+            return None
+        
+        kind, file_name, expiry = row
+        now = time.time()
+        if expiry is not None and now > expiry:
+            try:
+                self.invalidate(key)
+            except sqlite3.Error:
+                pass
+            return None
+        
+        try:
+            value = self._read_payload(kind, file_name)
+        except Exception as e:
+            self.logger.warning(f"Failed to load from disk cache {key}: {e}")
+            # Удаляем поврежденную запись
+            try:
+                self.invalidate(key)
+            except sqlite3.Error:
+                pass
+            return None
+        
+        self._record_hit(key, now)
+        return value
+    
+    def _record_hit(self, key: str, now: float) -> None:
+        """Учесть попадание, не ожидая блокировки записи (best-effort)."""
+        try:
+            with self._connect(timeout=0) as conn:
+                conn.execute(
+                    "UPDATE entries SET hits = hits + 1, last_access = ? WHERE key = ?", (now, key)
+                )
+        except sqlite3.Error:
+            pass
+    
+    def put(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
+        """Сохранить значение в дисковый кэш."""
+        now = time.time()
+        expiry = now + ttl if ttl is not None else None
+        
+        try:
+            kind, file_name = self._write_payload(key, value)
+            size_bytes = (self.data_dir / file_name).stat().st_size
+            with self._connect() as conn:
+                previous = conn.execute(
+                    "SELECT file FROM entries WHERE key = ?", (key,)
+                ).fetchone()
+                conn.execute(
+                    "INSERT OR REPLACE INTO entries"
+                    " (key, kind, file, created_at, expiry, size_bytes, hits, last_access)"
+                    " VALUES (?, ?, ?, ?, ?, ?, 0, NULL)",
+                    (key, kind, file_name, now, expiry, int(size_bytes)),
+                )
+            if previous is not None and previous[0] != file_name:
+                self._remove_file(previous[0])
+            
+            self.logger.debug(f"Saved to disk cache: {key} ({kind})")
+            return True
+            
+        except sqlite3.Error as e:
+            self.logger.warning(f"Disk cache index unavailable, skipped write of {key}: {e}")
+            return False
+        except Exception as e:
+            self.logger.error(f"Failed to save to disk cache {key}: {e}")
+            return False
+    
+    def invalidate(self, key: str) -> bool:
+        """Удалить запись из дискового кэша."""
+        with self._connect() as conn:
+            row = conn.execute("SELECT file FROM entries WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return False
+            conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+        self._remove_file(row[0])
+        self.logger.debug(f"Removed from disk cache: {key}")
+        return True
+    
+    def clear(self) -> int:
+        """Очистить весь дисковый кэш (включая файлы legacy pickle-кэша)."""
+        with self._connect() as conn:
+            files = [row[0] for row in conn.execute("SELECT file FROM entries")]
+            conn.execute("DELETE FROM entries")
+        for file_name in files:
+            self._remove_file(file_name)
+        count = len(files)
+        for file_path in self.cache_dir.glob("*.pkl"):
+            file_path.unlink()
+            count += 1
+        
+        self.logger.info(f"Cleared disk cache: {count} files removed")
+        return count
+    
+    def cleanup_expired(self) -> int:
+        """Удалить истекшие записи (по индексу, без чтения payload)."""
+        with self._connect() as conn:
+            expired = conn.execute(
+                "SELECT key, file FROM entries WHERE expiry IS NOT NULL AND expiry < ?",
+                (time.time(),),
+            ).fetchall()
+            conn.executemany("DELETE FROM entries WHERE key = ?", [(key,) for key, _ in expired])
+        for _, file_name in expired:
+            self._remove_file(file_name)
+        
+        if expired:
+            self.logger.info(f"Cleaned up {len(expired)} expired disk cache entries")
+        
+        return len(expired)
+    
+    def stats(self) -> Dict[str, Any]:
+        """Статистика дискового кэша (по индексу, без чтения payload)."""
+        with self._connect(write=False) as conn:
+            entries, total_size, total_hits = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size_bytes), 0), COALESCE(SUM(hits), 0) FROM entries"
+            ).fetchone()
+            by_kind = dict(conn.execute("SELECT kind, COUNT(*) FROM entries GROUP BY kind"))
+            expired = conn.execute(
+                "SELECT COUNT(*) FROM entries WHERE expiry IS NOT NULL AND expiry < ?",
+                (time.time(),),
+            ).fetchone()[0]
+        
+        return {
+            'backend': 'columnar',
+            'entries': entries,
+            'expired_entries': expired,
+            'total_size_bytes': total_size,
+            'hits': total_hits,
+            'entries_by_kind': by_kind,
+            'cache_dir': str(self.cache_dir)
+        }
+
+
+class _ClosingConnection:
+    """Контекстный менеджер: транзакция + закрытие sqlite-соединения."""
+    
+    def __init__(self, conn: sqlite3.Connection, begin: str = "BEGIN IMMEDIATE"):
+        self._conn = conn
+        self._begin = begin
+    
+    def __enter__(self) -> sqlite3.Connection:
+        try:
+            self._conn.execute(self._begin)
+        except BaseException:
+            self._conn.close()
+            raise
+        return self._conn
+    
+    def __exit__(self, exc_type, exc, tb) -> None:
+        try:
+            self._conn.execute("ROLLBACK" if exc_type else "COMMIT")
+        finally:
+            self._conn.close()
 
 
 class CacheManager:
@@ -370,19 +807,44 @@ class CacheManager:
     Менеджер кэширования, объединяющий память и диск.
     """
     
-    def __init__(self, memory_size: int = 100, disk_cache: bool = True):
+    def __init__(self,
+                 memory_size: int = 100,
+                 disk_cache: bool = True,
+                 disk_backend: str = 'columnar',
+                 cache_dir: Union[str, Path, None] = None,
+                 memory_max_bytes: Optional[int] = None,
+                 namespace_budgets: Optional[Dict[str, int]] = None):
         """
         Инициализация менеджера кэша.
         
         Args:
             memory_size: Размер кэша в памяти
             disk_cache: Использовать ли дисковый кэш
+            disk_backend: Бэкенд дискового кэша: 'columnar' (Arrow IPC/.npy + SQLite-индекс)
+                или 'pickle' (один pickle-файл на ключ)
+            cache_dir: Директория дискового кэша (по умолчанию ~/.cache/bquant)
+            memory_max_bytes: Бюджет памяти кэша в байтах (None = без ограничения)
+            namespace_budgets: Бюджеты памяти по пространствам имен
+                ('indicators', 'zones', 'swing', ...)
         """
-        self.memory_cache = MemoryCache(max_size=memory_size)
-        self.disk_cache = DiskCache() if disk_cache else None
+        self.memory_cache = MemoryCache(
+            max_size=memory_size,
+            max_bytes=memory_max_bytes,
+            namespace_budgets=namespace_budgets
+        )
+        self.disk_cache = self._create_disk_cache(disk_backend, cache_dir) if disk_cache else None
         self.logger = get_logger(f"{__name__}.CacheManager")
     
-    def get(self, key: str) -> Optional[Any]:
+    @staticmethod
+    def _create_disk_cache(backend: str, cache_dir: Union[str, Path, None]):
+        """Создать дисковый кэш выбранного бэкенда."""
+        if backend == 'columnar':
+            return ColumnarDiskCache(cache_dir)
+        if backend == 'pickle':
+            return DiskCache(cache_dir)
+        raise ValueError(f"Unknown disk cache backend: {backend}. Use 'columnar' or 'pickle'")
+    
+    def get(self, key: str, namespace: Optional[str] = None) -> Optional[Any]:
         """Получить значение из кэша (сначала память, потом диск)."""
         # Сначала проверяем память
         result = self.memory_cache.get(key)
@@ -394,15 +856,16 @@ class CacheManager:
             result = self.disk_cache.get(key)
             if result is not None:
                 # Сохраняем в память для быстрого доступа
-                self.memory_cache.put(key, result)
+                self.memory_cache.put(key, result, namespace=namespace)
                 return result
         
         return None
     
-    def put(self, key: str, value: Any, ttl: Optional[int] = None, disk: bool = True) -> None:
+    def put(self, key: str, value: Any, ttl: Optional[int] = None, disk: bool = True,
+            namespace: Optional[str] = None) -> None:
         """Сохранить значение в кэш."""
         # Всегда сохраняем в память
-        self.memory_cache.put(key, value, ttl)
+        self.memory_cache.put(key, value, ttl, namespace=namespace)
         
         # Сохраняем на диск если разрешено
         if disk and self.disk_cache:
@@ -437,11 +900,7 @@ class CacheManager:
         }
         
         if self.disk_cache:
-            disk_files = len(list(self.disk_cache.cache_dir.glob("*.pkl")))
-            stats['disk'] = {
-                'entries': disk_files,
-                'cache_dir': str(self.disk_cache.cache_dir)
-            }
+            stats['disk'] = self.disk_cache.stats()
         
         return stats
 
@@ -458,13 +917,18 @@ def get_cache_manager() -> CacheManager:
         cache_config = get_cache_config()
         _global_cache_manager = CacheManager(
             memory_size=cache_config.get('memory_size', 100),
-            disk_cache=cache_config.get('enable_disk_cache', True)
+            disk_cache=cache_config.get('enable_disk_cache', True),
+            disk_backend=cache_config.get('disk_backend', 'columnar'),
+            cache_dir=cache_config.get('cache_dir'),
+            memory_max_bytes=cache_config.get('memory_max_bytes'),
+            namespace_budgets=cache_config.get('memory_namespace_budgets')
         )
     
     return _global_cache_manager
 
 
-def cached(ttl: Optional[int] = None, disk: bool = True, key_prefix: str = ""):
+def cached(ttl: Optional[int] = None, disk: bool = True, key_prefix: str = "",
+           namespace: Optional[str] = None):
     """
     Декоратор для кэширования результатов функций.
     
@@ -472,6 +936,7 @@ def cached(ttl: Optional[int] = None, disk: bool = True, key_prefix: str = ""):
         ttl: Время жизни кэша в секундах
         disk: Сохранять ли на диск
         key_prefix: Префикс для ключа кэша
+        namespace: Пространство имен для бюджета памяти ('indicators', 'zones', ...)
     """
     def decorator(func: Callable) -> Callable:
         @wraps(func)
@@ -483,7 +948,7 @@ def cached(ttl: Optional[int] = None, disk: bool = True, key_prefix: str = ""):
             key = cache_manager.memory_cache._generate_key(func_name, args, kwargs)
             
             # Проверяем кэш
-            result = cache_manager.get(key)
+            result = cache_manager.get(key, namespace=namespace)
             if result is not None:
                 logger.debug(f"Cache hit for {func_name}")
                 return result
@@ -493,7 +958,7 @@ def cached(ttl: Optional[int] = None, disk: bool = True, key_prefix: str = ""):
             result = func(*args, **kwargs)
             
             # Сохраняем в кэш
-            cache_manager.put(key, result, ttl, disk)
+            cache_manager.put(key, result, ttl, disk, namespace=namespace)
             
             return result
         
@@ -525,6 +990,7 @@ __all__ = [
     'CacheEntry',
     'MemoryCache',
     'DiskCache', 
+    'ColumnarDiskCache',
     'CacheManager',
     'get_cache_manager',
     'cached',
@@ -101,8 +101,12 @@ CACHE_CONFIG = {
     'enable_memory_cache': True,
     'enable_disk_cache': True,
     'memory_size': 100,  # Количество записей в памяти
+    'memory_max_bytes': 1024 ** 3,  # Бюджет памяти кэша в байтах (None = без ограничения)
+    'memory_namespace_budgets': {},  # Бюджеты по пространствам имен: {'indicators': ..., 'zones': ..., 'swing': ...}
     'default_ttl': 3600,  # Время жизни по умолчанию (секунды)
     'cache_dir': None,  # None = используется ~/.cache/bquant
+    'disk_backend': 'columnar',  # 'columnar' (Arrow IPC/.npy + SQLite-индекс) или 'pickle'
+    'fingerprint_mode': 'full',  # Отпечатки данных для ключей: 'full' или 'sampled' (блоки строк + длина и границы индекса)
     'auto_cleanup': True,  # Автоматическая очистка истекших записей
     'cleanup_interval': 300  # Интервал очистки в секундах
 }
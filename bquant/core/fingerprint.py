@@ -0,0 +1,231 @@
+"""
+Быстрые отпечатки (fingerprints) содержимого данных для ключей кэша
+
+Отпечаток считается хэшем (xxhash, если установлен, иначе blake2b) по сырым
+буферам колонок без промежуточных pandas-объектов. Для очень больших таблиц
+доступен режим ``'sampled'``: хэшируются равномерно расположенные блоки строк
+плюс защитные признаки (длина, первая и последняя метка индекса).
+
+Отпечатки мемоизируются в weakref-реестре по объекту: повторный вызов для того
+же DataFrame/Series не перечитывает данные, пока не изменились длина, колонки,
+границы индекса или буферы колонок. Изменения значений "на месте" (``df.loc[...] = x``)
+буфер не меняют — после таких правок вызовите :func:`invalidate_fingerprint`.
+"""
+
+import hashlib
+import threading
+import weakref
+from typing import Any, Dict, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+try:
+    import xxhash
+    _XXHASH_AVAILABLE = True
+except ImportError:  # pragma: no cover - optional dependency
+    xxhash = None
+    _XXHASH_AVAILABLE = False
+
+
+FINGERPRINT_MODES = ('full', 'sampled')
+
+# Параметры режима 'sampled'
+DEFAULT_SAMPLE_ROWS = 65536
+DEFAULT_SAMPLE_CHUNKS = 16
+
+PandasObject = Union[pd.DataFrame, pd.Series]
+
+# id(obj) -> (weakref, {(columns, mode, sample_rows): (guard, fingerprint)})
+_registry: Dict[int, Tuple[weakref.ref, Dict[Tuple, Tuple[Tuple, str]]]] = {}
+_registry_lock = threading.RLock()
+
+
+def _new_hasher():
+    """Создать хэшер: xxh3_128 при наличии xxhash, иначе blake2b."""
+    if _XXHASH_AVAILABLE:
+        return xxhash.xxh3_128(), 'xxh3'
+    return hashlib.blake2b(digest_size=16), 'b2'
+
+
+def _update_array(hasher, values: np.ndarray) -> None:
+    """Добавить в хэш dtype, форму и сырой буфер массива."""
+    if values.dtype == object:
+        # Python-объекты не имеют стабильного буфера
+        values = pd.util.hash_pandas_object(pd.Series(values), index=False).to_numpy()
+    values = np.ascontiguousarray(values)
+    hasher.update(f"{values.dtype.str}{values.shape}".encode())
+    hasher.update(memoryview(values).cast('B'))
+
+
+def _column_values(series: pd.Series) -> np.ndarray:
+    """Значения колонки как numpy-массив (без копии для numpy-dtype)."""
+    if isinstance(series.dtype, np.dtype):
+        return series.to_numpy()
+    if isinstance(series.dtype, pd.DatetimeTZDtype):
+        return series.array.asi8
+    return pd.util.hash_pandas_object(series, index=False).to_numpy()
+
+
+def _index_values(index: pd.Index) -> np.ndarray:
+    """Значения индекса как numpy-массив."""
+    if isinstance(index, pd.DatetimeIndex):
+        return index.asi8
+    if isinstance(index, pd.RangeIndex):
+        return np.array([index.start, index.stop, index.step], dtype=np.int64)
+    if isinstance(index.dtype, np.dtype) and index.dtype != object:
+        return index.to_numpy()
+    return pd.util.hash_pandas_object(index).to_numpy()
+
+
+def _sample_positions(n_rows: int, sample_rows: int, n_chunks: int) -> np.ndarray:
+    """Позиции строк равномерно расположенных блоков (первый и последний включены)."""
+    chunk = max(1, sample_rows // n_chunks)
+    starts = np.linspace(0, n_rows - chunk, n_chunks).astype(np.int64)
+    return np.unique((starts[:, None] + np.arange(chunk)).ravel())
+
+
+def _as_frame(obj: PandasObject) -> pd.DataFrame:
+    if isinstance(obj, pd.Series):
+        return obj.to_frame(name=obj.name if obj.name is not None else 0)
+    return obj
+
+
+def _buffer_address(values: np.ndarray) -> int:
+    return values.__array_interface__['data'][0] if isinstance(values, np.ndarray) else id(values)
+
+
+def _guard(index: pd.Index, names: Tuple, arrays: Sequence[np.ndarray]) -> Tuple:
+    """Дешевые признаки, по которым мемоизированный отпечаток считается актуальным."""
+    bounds = (index[0], index[-1]) if len(index) else ()
+    return (
+        len(index),
+        names,
+        bounds,
+        tuple(_buffer_address(values) for values in arrays),
+    )
+
+
+def _select(frame: pd.DataFrame, columns: Optional[Sequence[str]]) -> Tuple[Tuple, list]:
+    """Имена и значения колонок; выбор по одной колонке не копирует блоки."""
+    if columns is None:
+        return tuple(frame.columns), [_column_values(frame.iloc[:, i]) for i in range(frame.shape[1])]
+    missing = [col for col in columns if col not in frame.columns]
+    if missing:
+        raise KeyError(f"Columns not found for fingerprint: {missing}")
+    return tuple(columns), [_column_values(frame[col]) for col in columns]
+
+
+def _compute(index: pd.Index, names: Tuple, arrays: Sequence[np.ndarray], mode: str,
+             sample_rows: int) -> str:
+    hasher, algo = _new_hasher()
+    n_rows = len(index)
+    index_values = _index_values(index)
+
+    positions = None
+    if mode == 'sampled' and n_rows > sample_rows:
+        positions = _sample_positions(n_rows, sample_rows, DEFAULT_SAMPLE_CHUNKS)
+        # Защита режима: длина и границы индекса всегда входят в отпечаток
+        hasher.update(f"sampled|{n_rows}|{index[0]!r}|{index[-1]!r}".encode())
+        if not isinstance(index, pd.RangeIndex):
+            index_values = index_values[positions]
+    else:
+        hasher.update(f"full|{n_rows}".encode())
+
+    hasher.update(repr(names).encode())
+    _update_array(hasher, index_values)
+    for values in arrays:
+        _update_array(hasher, values if positions is None else values[positions])
+
+    return f"{algo}:{hasher.hexdigest()}"
+
+
+def fingerprint_frame(obj: PandasObject,
+                      columns: Optional[Sequence[str]] = None,
+                      mode: str = 'full',
+                      sample_rows: int = DEFAULT_SAMPLE_ROWS,
+                      memoize: bool = True) -> str:
+    """
+    Отпечаток содержимого DataFrame/Series.
+
+    Args:
+        obj: DataFrame или Series
+        columns: Подмножество колонок (None = все колонки)
+        mode: 'full' - все строки; 'sampled' - блоки строк плюс длина и
+            границы индекса (для таблиц длиннее sample_rows)
+        sample_rows: Число строк в выборке режима 'sampled'
+        memoize: Использовать weakref-реестр для повторных вызовов
+
+    Returns:
+        Строка вида ``'<алгоритм>:<hex>'``
+    """
+    if mode not in FINGERPRINT_MODES:
+        raise ValueError(f"Unknown fingerprint mode: {mode}. Use one of {FINGERPRINT_MODES}")
+
+    frame = _as_frame(obj)
+    names, arrays = _select(frame, columns)
+
+    if not memoize:
+        return _compute(frame.index, names, arrays, mode, sample_rows)
+
+    memo_key = (tuple(columns) if columns is not None else None, mode, sample_rows)
+    guard = _guard(frame.index, names, arrays)
+    obj_id = id(obj)
+
+    with _registry_lock:
+        record = _registry.get(obj_id)
+        if record is not None and record[0]() is obj:
+            cached = record[1].get(memo_key)
+            if cached is not None and cached[0] == guard:
+                return cached[1]
+
+    fingerprint = _compute(frame.index, names, arrays, mode, sample_rows)
+
+    with _registry_lock:
+        record = _registry.get(obj_id)
+        if record is None or record[0]() is not obj:
+            ref = weakref.ref(obj, lambda _, key=obj_id: _forget(key))
+            record = (ref, {})
+            _registry[obj_id] = record
+        record[1][memo_key] = (guard, fingerprint)
+
+    return fingerprint
+
+
+def fingerprint_array(values: np.ndarray) -> str:
+    """Отпечаток numpy-массива по сырому буферу (без мемоизации)."""
+    hasher, algo = _new_hasher()
+    _update_array(hasher, np.asarray(values))
+    return f"{algo}:{hasher.hexdigest()}"
+
+
+def fingerprint(value: Any, mode: str = 'full') -> str:
+    """Отпечаток DataFrame, Series или numpy-массива."""
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return fingerprint_frame(value, mode=mode)
+    return fingerprint_array(value)
+
+
+def invalidate_fingerprint(obj: PandasObject) -> None:
+    """Сбросить мемоизированные отпечатки объекта (после правок на месте)."""
+    with _registry_lock:
+        record = _registry.get(id(obj))
+        if record is not None and record[0]() is obj:
+            del _registry[id(obj)]
+
+
+def _forget(obj_id: int) -> None:
+    with _registry_lock:
+        record = _registry.get(obj_id)
+        if record is not None and record[0]() is None:
+            del _registry[obj_id]
+
+
+# Экспорт
+__all__ = [
+    'FINGERPRINT_MODES',
+    'fingerprint',
+    'fingerprint_frame',
+    'fingerprint_array',
+    'invalidate_fingerprint',
+]
@@ -13,6 +13,7 @@ from datetime import datetime, timedelta
 import pandas as pd
 import numpy as np
 import psutil
+from scipy.signal import lfilter
 import os
 from contextlib import contextmanager
 
@@ -248,7 +249,7 @@ class OptimizedIndicators:
     """
     
     @staticmethod
-    @cached(ttl=3600, disk=True, key_prefix="opt_")
+    @cached(ttl=3600, disk=True, key_prefix="opt_", namespace="indicators")
     @performance_monitor()
     def sma(prices: np.ndarray, period: int) -> np.ndarray:
         """
@@ -264,17 +265,16 @@ class OptimizedIndicators:
         if len(prices) < period:
             return np.full(len(prices), np.nan)
         
-        # Используем convolution для быстрого расчета
+        # Скользящее окно, заканчивающееся на текущем баре (mode='valid' -
+        # только полные окна); первые period-1 значений - NaN
         kernel = np.ones(period) / period
-        sma_values = np.convolve(prices, kernel, mode='same')
-        
-        # Устанавливаем NaN для первых period-1 значений
-        sma_values[:period-1] = np.nan
+        sma_values = np.full(len(prices), np.nan)
+        sma_values[period-1:] = np.convolve(prices, kernel, mode='valid')
         
         return sma_values
     
     @staticmethod
-    @cached(ttl=3600, disk=True, key_prefix="opt_")
+    @cached(ttl=3600, disk=True, key_prefix="opt_", namespace="indicators")
     @performance_monitor()
     def ema(prices: np.ndarray, period: int) -> np.ndarray:
         """
@@ -290,18 +290,17 @@ class OptimizedIndicators:
         if len(prices) == 0:
             return np.array([])
         
+        prices = np.asarray(prices, dtype=np.float64)
         alpha = 2.0 / (period + 1)
-        ema_values = np.zeros_like(prices)
-        ema_values[0] = prices[0]
         
-        # Векторизованный расчет EMA
-        for i in range(1, len(prices)):
-            ema_values[i] = alpha * prices[i] + (1 - alpha) * ema_values[i-1]
+        # Рекурсия ema[i] = alpha * x[i] + (1 - alpha) * ema[i-1] как IIR-фильтр
+        # (scipy.signal.lfilter), начальное условие - ema[0] = x[0]
+        ema_values, _ = lfilter([alpha], [1.0, alpha - 1.0], prices, zi=[(1 - alpha) * prices[0]])
         
         return ema_values
     
     @staticmethod
-    @cached(ttl=3600, disk=True, key_prefix="opt_")
+    @cached(ttl=3600, disk=True, key_prefix="opt_", namespace="indicators")
     @performance_monitor()
     def rsi(prices: np.ndarray, period: int = 14) -> np.ndarray:
         """
@@ -342,7 +341,7 @@ class OptimizedIndicators:
         return rsi_values
     
     @staticmethod
-    @cached(ttl=3600, disk=True, key_prefix="opt_")
+    @cached(ttl=3600, disk=True, key_prefix="opt_", namespace="indicators")
     @performance_monitor()
     def macd(prices: np.ndarray, fast: int = 12, slow: int = 26, signal: int = 9) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
         """
@@ -377,7 +376,7 @@ class OptimizedIndicators:
         return macd_line, signal_line, histogram
     
     @staticmethod
-    @cached(ttl=3600, disk=True, key_prefix="opt_")
+    @cached(ttl=3600, disk=True, key_prefix="opt_", namespace="indicators")
     @performance_monitor()
     def bollinger_bands(prices: np.ndarray, period: int = 20, std_dev: float = 2.0) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
         """
@@ -399,13 +398,10 @@ class OptimizedIndicators:
         middle_band = OptimizedIndicators.sma(prices, period)
         
         # Стандартное отклонение для окна
-        std_values = np.zeros_like(prices)
-        for i in range(period-1, len(prices)):
-            window = prices[i-period+1:i+1]
-            std_values[i] = np.std(window)
-        
-        # Устанавливаем NaN для первых period-1 значений
-        std_values[:period-1] = np.nan
+        # Стандартное отклонение по всем окнам сразу; первые period-1 значений - NaN
+        std_values = np.full(len(prices), np.nan)
+        windows = np.lib.stride_tricks.sliding_window_view(np.asarray(prices, dtype=np.float64), period)
+        std_values[period-1:] = windows.std(axis=1)
         
         # Верхняя и нижняя полосы
         upper_band = middle_band + (std_dev * std_values)
@@ -14,6 +14,10 @@ from .loader import (
     get_available_timeframes
 )
 
+from .bulk import DataFileCollection
+from .lake import DataLake
+from .chunked import ChunkedProcessor
+
 from .processor import (
     clean_ohlcv_data,
     remove_price_outliers,
@@ -54,6 +58,8 @@ __all__ = [
     "get_data_info",
     "get_available_symbols",
     "get_available_timeframes",
+    "DataFileCollection",
+    "DataLake",
     
     # Processor functions
     "clean_ohlcv_data",
@@ -65,6 +71,7 @@ __all__ = [
     "add_technical_features",
     "create_lagged_features",
     "prepare_data_for_analysis",
+    "ChunkedProcessor",
     
     # Validator functions
     "validate_ohlcv_data",
@@ -0,0 +1,358 @@
+"""
+Bulk loading of OHLCV data directories
+
+:class:`DataFileCollection` indexes the CSV files of a data directory by
+``SYMBOL_TIMEFRAME`` key and loads a file only when its key is first
+accessed. Every parsed and validated file is converted once to a Parquet
+sidecar keyed by the source path, size and modification time, so later
+sessions read columnar data instead of re-parsing CSV. Cache misses can be
+converted up front on a process pool (:meth:`DataFileCollection.prefetch`),
+and ``columns`` restricts what is read from the sidecars.
+"""
+
+import glob
+import hashlib
+import json
+import os
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import timedelta, timezone
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from ..core.config import SUPPORTED_TIMEFRAMES, get_data_dir, get_processed_data_dir, validate_timeframe
+from ..core.logging_config import get_logger
+from .loader import _parse_filename, load_ohlcv_data
+
+logger = get_logger(__name__)
+
+# Bumped whenever the loader output changes, invalidating existing sidecars
+SIDECAR_FORMAT_VERSION = 1
+
+SIDECAR_SUFFIX = '.parquet'
+
+# Sidecar directory inside get_processed_data_dir()
+SIDECAR_DIRNAME = 'ohlcv_cache'
+
+_METADATA_KEY = b'bquant'
+
+
+@dataclass(frozen=True)
+class DataFileEntry:
+    """CSV file of a data directory and the key it is loaded under."""
+
+    key: str
+    path: Path
+    symbol: str
+    timeframe: str
+
+
+def default_sidecar_dir() -> Path:
+    """Sidecar directory for the current processed data directory."""
+    return get_processed_data_dir() / SIDECAR_DIRNAME
+
+
+def discover_data_files(data_dir: Union[str, Path], pattern: str = '*.csv') -> Dict[str, DataFileEntry]:
+    """
+    Index the data files of a directory by ``SYMBOL_TIMEFRAME`` key.
+
+    Files whose name cannot be parsed are skipped; when two files map to the
+    same key, the last one in name order wins (as in the sequential loader).
+
+    Args:
+        data_dir: Directory to search (not recursive)
+        pattern: Glob pattern of data files
+
+    Returns:
+        Mapping of key to :class:`DataFileEntry`, in file name order
+    """
+    entries: Dict[str, DataFileEntry] = {}
+    for file_path in sorted(Path(data_dir).glob(pattern)):
+        symbol, timeframe, _ = _parse_filename(file_path.stem)
+        if symbol is None or timeframe == 'unknown':
+            logger.warning(f"Could not parse filename: {file_path.stem}")
+            continue
+
+        try:
+            if timeframe in SUPPORTED_TIMEFRAMES:
+                timeframe = validate_timeframe(timeframe)
+        except ValueError:
+            logger.warning(f"Unsupported timeframe '{timeframe}' for {symbol}, loading anyway")
+
+        key = f"{symbol}_{timeframe}"
+        if key in entries:
+            logger.warning(f"Duplicate data key '{key}': {entries[key].path.name} replaced by {file_path.name}")
+        entries[key] = DataFileEntry(key, file_path, symbol, timeframe)
+    return entries
+
+
+def sidecar_path(source: Union[str, Path], cache_dir: Union[str, Path]) -> Path:
+    """
+    Sidecar file of a source file in its current state.
+
+    The name combines the file stem, a digest of the resolved path and a
+    digest of size, modification time and :data:`SIDECAR_FORMAT_VERSION`,
+    so an edited source never matches an old sidecar.
+    """
+    source = Path(source).resolve()
+    stat = source.stat()
+    path_digest = hashlib.sha1(str(source).encode('utf-8')).hexdigest()[:8]
+    state = f"{stat.st_size}|{stat.st_mtime_ns}|{SIDECAR_FORMAT_VERSION}"
+    state_digest = hashlib.sha1(state.encode('utf-8')).hexdigest()[:12]
+    return Path(cache_dir) / f"{source.stem}-{path_digest}-{state_digest}{SIDECAR_SUFFIX}"
+
+
+def write_sidecar(df: pd.DataFrame, path: Path) -> Path:
+    """
+    Write a loaded frame to a Parquet sidecar.
+
+    The file is written under a temporary name and moved into place, so
+    concurrent writers and interrupted runs never leave a partial sidecar.
+    Sidecars of older versions of the same source are removed.
+    """
+    table = pa.Table.from_pandas(df, preserve_index=True)
+    tz = getattr(df.index, 'tz', None)
+    extra = {'utc_offset': None}
+    if isinstance(tz, timezone):
+        # Parquet reads fixed offsets back as pytz.FixedOffset
+        extra['utc_offset'] = int(tz.utcoffset(None).total_seconds())
+    metadata = dict(table.schema.metadata or {})
+    metadata[_METADATA_KEY] = json.dumps(extra).encode('utf-8')
+    table = table.replace_schema_metadata(metadata)
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    # Prices are high-cardinality: dictionary encoding only slows writes and reads
+    pq.write_table(table, tmp_path, use_dictionary=False)
+    os.replace(tmp_path, path)
+
+    source_prefix = glob.escape(path.name.rsplit('-', 1)[0])
+    for stale in path.parent.glob(f"{source_prefix}-*{SIDECAR_SUFFIX}"):
+        if stale != path:
+            stale.unlink(missing_ok=True)
+    return path
+
+
+def read_sidecar(path: Path, columns: Optional[Sequence[str]] = None) -> pd.DataFrame:
+    """
+    Read a Parquet sidecar, optionally only some of its columns.
+
+    Requested columns missing from the file are ignored; the index is always read.
+    """
+    if columns is not None:
+        available = set(pq.read_schema(path).names)
+        columns = [column for column in columns if column in available]
+
+    table = pq.read_table(path, columns=columns, use_pandas_metadata=True)
+    df = table.to_pandas()
+    extra = json.loads((table.schema.metadata or {}).get(_METADATA_KEY, b'{}'))
+    if extra.get('utc_offset') is not None and isinstance(df.index, pd.DatetimeIndex):
+        df.index = df.index.tz_convert(timezone(timedelta(seconds=extra['utc_offset'])))
+    return df
+
+
+def _project(df: pd.DataFrame, columns: Optional[Sequence[str]]) -> pd.DataFrame:
+    if columns is None:
+        return df
+    return df[[column for column in columns if column in df.columns]]
+
+
+def _convert_file(entry: DataFileEntry,
+                  cache_dir: Optional[Path]) -> Tuple[str, Optional[pd.DataFrame], Optional[str]]:
+    """
+    Parse and validate one file; never raises (errors are returned).
+
+    With a cache directory the frame is written to its sidecar and not
+    returned, so pool workers send back only the outcome.
+    """
+    try:
+        df = load_ohlcv_data(entry.path, entry.symbol, entry.timeframe)
+    except Exception as e:  # noqa: BLE001 - one bad file must not stop the batch
+        return entry.key, None, f"{type(e).__name__}: {e}"
+
+    if cache_dir is None:
+        return entry.key, df, None
+    try:
+        write_sidecar(df, sidecar_path(entry.path, cache_dir))
+    except Exception as e:  # noqa: BLE001 - an unwritable cache only costs speed
+        logger.warning(f"Could not write sidecar for {entry.path}: {e}")
+        return entry.key, df, None
+    return entry.key, None, None
+
+
+class DataFileCollection(Mapping):
+    """
+    Read-only mapping ``SYMBOL_TIMEFRAME -> DataFrame`` over a data directory.
+
+    Keys come from file names and are known up front; a file is loaded on
+    first access and kept for later lookups. Loading prefers the Parquet
+    sidecar and falls back to parsing and validating the CSV (which then
+    writes the sidecar). Files that fail to load raise
+    :class:`~bquant.core.exceptions.DataLoadingError` (or
+    ``DataValidationError``) on access and are skipped by :meth:`to_dict`.
+    """
+
+    def __init__(self,
+                 data_dir: Optional[Union[str, Path]] = None,
+                 columns: Optional[Sequence[str]] = None,
+                 use_cache: bool = True,
+                 cache_dir: Optional[Union[str, Path]] = None,
+                 pattern: str = '*.csv'):
+        """
+        Args:
+            data_dir: Data directory (default: ``get_data_dir()``)
+            columns: Columns to load (normalized names, e.g. ``['close']``);
+                ``None`` loads all. The time index is always loaded.
+            use_cache: Read and write Parquet sidecars
+            cache_dir: Sidecar directory (default: ``<processed data dir>/ohlcv_cache``)
+            pattern: Glob pattern of data files
+        """
+        self.data_dir = Path(data_dir) if data_dir is not None else get_data_dir()
+        self.columns = list(columns) if columns is not None else None
+        self.cache_dir: Optional[Path] = None
+        if use_cache:
+            self.cache_dir = Path(cache_dir) if cache_dir is not None else default_sidecar_dir()
+
+        if self.data_dir.exists():
+            self.entries = discover_data_files(self.data_dir, pattern)
+        else:
+            logger.warning(f"Data directory not found: {self.data_dir}")
+            self.entries = {}
+        self.errors: Dict[str, str] = {}
+        self._frames: Dict[str, pd.DataFrame] = {}
+
+    def __getitem__(self, key: str) -> pd.DataFrame:
+        frame = self._frames.get(key)
+        if frame is None:
+            entry = self.entries[key]
+            frame = self._read_cached(entry)
+            if frame is None:
+                frame = self._load(entry)
+            self._frames[key] = frame
+        return frame
+
+    def __contains__(self, key: object) -> bool:
+        # Mapping.__contains__ would load the file
+        return key in self.entries
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.entries)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({str(self.data_dir)!r}, files={len(self)}, loaded={len(self._frames)})"
+
+    @property
+    def loaded_keys(self) -> List[str]:
+        """Keys already loaded into memory."""
+        return list(self._frames)
+
+    def _sidecar(self, entry: DataFileEntry) -> Optional[Path]:
+        if self.cache_dir is None:
+            return None
+        try:
+            return sidecar_path(entry.path, self.cache_dir)
+        except OSError:
+            return None
+
+    def _read_cached(self, entry: DataFileEntry) -> Optional[pd.DataFrame]:
+        path = self._sidecar(entry)
+        if path is None or not path.exists():
+            return None
+        try:
+            return read_sidecar(path, self.columns)
+        except Exception as e:  # noqa: BLE001 - a corrupt sidecar is re-created from the CSV
+            logger.warning(f"Ignoring unreadable sidecar {path}: {e}")
+            return None
+
+    def _load(self, entry: DataFileEntry) -> pd.DataFrame:
+        df = load_ohlcv_data(entry.path, entry.symbol, entry.timeframe)
+        path = self._sidecar(entry)
+        if path is not None:
+            try:
+                write_sidecar(df, path)
+            except Exception as e:  # noqa: BLE001
+                logger.warning(f"Could not write sidecar for {entry.path}: {e}")
+        self.errors.pop(entry.key, None)
+        return _project(df, self.columns)
+
+    def prefetch(self, keys: Optional[Iterable[str]] = None, n_jobs: Optional[int] = 1,
+                 mp_context=None) -> 'DataFileCollection':
+        """
+        Parse the files without a valid sidecar on a process pool and load the keys.
+
+        Args:
+            keys: Keys to load (default: all)
+            n_jobs: Worker processes (1: in-process, default; ``None`` or
+                negative: CPU count)
+            mp_context: multiprocessing context for the process pool
+
+        Returns:
+            self; failures are recorded in :attr:`errors`
+        """
+        keys = list(self.entries) if keys is None else [key for key in keys if key in self.entries]
+        pending = [key for key in keys if key not in self._frames]
+        misses = []
+        for key in pending:
+            frame = self._read_cached(self.entries[key])
+            if frame is None:
+                misses.append(self.entries[key])
+            else:
+                self._frames[key] = frame
+
+        cpus = os.cpu_count() or 1
+        workers = cpus if n_jobs is None or n_jobs < 0 else max(1, int(n_jobs))
+        workers = min(workers, len(misses))
+        if misses:
+            logger.info(f"Parsing {len(misses)} of {len(pending)} data files ({max(workers, 1)} workers)")
+
+        if workers > 1:
+            with ProcessPoolExecutor(max_workers=workers, mp_context=mp_context) as executor:
+                outcomes = list(executor.map(_convert_file, misses, [self.cache_dir] * len(misses)))
+        else:
+            outcomes = [_convert_file(entry, self.cache_dir) for entry in misses]
+
+        for key, frame, error in outcomes:
+            if error is not None:
+                logger.error(f"Error loading {self.entries[key].path}: {error}")
+                self.errors[key] = error
+                continue
+            self.errors.pop(key, None)
+            if frame is not None:
+                self._frames[key] = _project(frame, self.columns)
+            else:
+                self[key]  # reads the sidecar just written
+        return self
+
+    def to_dict(self) -> Dict[str, pd.DataFrame]:
+        """Loaded frames of all keys, skipping files that failed to load."""
+        result = {}
+        for key in self.entries:
+            if key in self.errors:
+                continue
+            try:
+                result[key] = self[key]
+            except Exception as e:  # noqa: BLE001 - same policy as the sequential loader
+                logger.error(f"Error loading {self.entries[key].path}: {e}")
+                self.errors[key] = f"{type(e).__name__}: {e}"
+        return result
+
+
+__all__ = [
+    'SIDECAR_FORMAT_VERSION',
+    'SIDECAR_DIRNAME',
+    'DataFileEntry',
+    'DataFileCollection',
+    'default_sidecar_dir',
+    'discover_data_files',
+    'sidecar_path',
+    'write_sidecar',
+    'read_sidecar',
+]
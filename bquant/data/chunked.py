@@ -0,0 +1,593 @@
+"""
+Chunked (out-of-core) processing of OHLCV data
+
+:class:`ChunkedProcessor` applies the functions of :mod:`bquant.data.processor`
+to a Parquet or CSV source that does not fit in memory. The source is read in
+chunks of at most ``chunk_rows`` consecutive bars, every step carries the state
+it needs across chunk boundaries, and results are written incrementally::
+
+    (ChunkedProcessor('XAUUSD_1s.parquet', chunk_rows=2_000_000)
+        .clean_ohlcv_data()
+        .resample_ohlcv('1min')
+        .add_technical_features()
+        .create_lagged_features(['close'], [1, 2, 3])
+        .write('XAUUSD_1min_features.parquet'))
+
+State carried between chunks:
+
+- forward fill: the last filled row;
+- rolling windows and ``shift`` lags: the last input rows of the longest
+  look-back (``TECHNICAL_FEATURES_LOOKBACK``, ``max(lags)``);
+- resampling: the bars of the last, possibly incomplete period;
+- outlier removal: statistics over the whole series, computed in extra
+  passes over the source before the results are produced (one pass per
+  column, since each column's statistics exclude rows dropped by the
+  previous ones). The ``iqr`` method keeps the values of one column in
+  memory to compute exact quartiles.
+
+The results match the in-memory functions; rolling statistics may differ in
+the last bits of precision.
+"""
+
+import os
+from datetime import timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from ..core.exceptions import DataError, DataLoadingError, DataProcessingError
+from ..core.logging_config import get_logger
+from .ingest import TIME_COLUMN_NAMES, iter_ohlcv_csv
+from .loader import _normalize_column_names
+from .processor import (
+    OUTLIER_METHODS,
+    TECHNICAL_FEATURES_LOOKBACK,
+    _fix_ohlc_relationships,
+    _handle_missing_values,
+    _lagged_features,
+    _ohlcv_agg_rules,
+    _outlier_keep_mask,
+    _outlier_statistics,
+    _resample_frame,
+    _technical_features,
+)
+
+logger = get_logger(__name__)
+
+# Default number of bars per chunk
+DEFAULT_CHUNK_ROWS = 1_000_000
+
+PARQUET_SUFFIXES = ('.parquet', '.pq')
+
+Source = Union[str, Path, pd.DataFrame]
+
+
+def _normalize_timezone(df: pd.DataFrame) -> pd.DataFrame:
+    """Fixed UTC offsets as ``datetime.timezone`` (pyarrow returns pytz.FixedOffset)."""
+    tz = getattr(df.index, 'tz', None)
+    if tz is None or isinstance(tz, timezone) or str(tz) == 'UTC':
+        return df
+    offset = tz.utcoffset(None)
+    if offset is not None:  # None for region time zones
+        df.index = df.index.tz_convert(timezone(offset))
+    return df
+
+
+def _parquet_files(path: Path) -> List[Path]:
+    """A Parquet file, or the visible Parquet files of a directory in path order."""
+    if path.is_file():
+        return [path]
+    return sorted(
+        file for file in path.rglob('*.parquet')
+        if not any(part.startswith(('_', '.')) for part in file.relative_to(path).parts)
+    )
+
+
+def _iter_parquet(path: Path, chunk_rows: int, columns: Optional[Sequence[str]]) -> Iterator[pd.DataFrame]:
+    for file in _parquet_files(path):
+        parquet_file = pq.ParquetFile(file)
+        schema = parquet_file.schema_arrow
+        selected = None
+        if columns is not None:
+            index_columns = [c for c in (schema.pandas_metadata or {}).get('index_columns', []) if isinstance(c, str)]
+            keep = set(columns) | set(index_columns) | set(TIME_COLUMN_NAMES)
+            selected = [name for name in schema.names if name in keep]
+        for batch in parquet_file.iter_batches(batch_size=chunk_rows, columns=selected):
+            df = pa.Table.from_batches([batch]).to_pandas()
+            if not isinstance(df.index, pd.DatetimeIndex):
+                # Files without pandas index metadata (e.g. DataLake partitions)
+                time_column = next((c for c in TIME_COLUMN_NAMES if c in df.columns), None)
+                if time_column is not None:
+                    df = df.set_index(time_column)
+            yield _normalize_timezone(df)
+
+
+def _iter_csv(path: Path) -> Iterator[pd.DataFrame]:
+    for df in iter_ohlcv_csv(path):
+        df = _normalize_column_names(df)
+        yield df.dropna(how='all')  # as load_ohlcv_data
+
+
+def _rechunk(frames: Iterator[pd.DataFrame], chunk_rows: int) -> Iterator[pd.DataFrame]:
+    """Regroup frames into chunks of exactly ``chunk_rows`` rows (the last may be shorter)."""
+    buffer: List[pd.DataFrame] = []
+    buffered = 0
+    for frame in frames:
+        while len(frame):
+            take = min(chunk_rows - buffered, len(frame))
+            buffer.append(frame.iloc[:take])
+            buffered += take
+            frame = frame.iloc[take:]
+            if buffered == chunk_rows:
+                yield buffer[0] if len(buffer) == 1 else pd.concat(buffer)
+                buffer, buffered = [], 0
+    if buffered:
+        yield buffer[0] if len(buffer) == 1 else pd.concat(buffer)
+
+
+def iter_source_chunks(source: Source,
+                       chunk_rows: int = DEFAULT_CHUNK_ROWS,
+                       columns: Optional[Sequence[str]] = None) -> Iterator[pd.DataFrame]:
+    """
+    Read an OHLCV source in chunks of at most ``chunk_rows`` consecutive rows.
+
+    Args:
+        source: Parquet file, directory of Parquet files (read in path order,
+            e.g. a :class:`~bquant.data.lake.DataLake` timeframe directory),
+            CSV file in a layout :func:`~bquant.data.ingest.read_ohlcv_csv`
+            understands, or an in-memory DataFrame
+        chunk_rows: Maximum rows per chunk
+        columns: Columns to read; ``None`` reads all. The time index is always read.
+
+    Yields:
+        DataFrames indexed by time, as :func:`~bquant.data.loader.load_ohlcv_data` returns them
+
+    Raises:
+        DataLoadingError: If the source does not exist or cannot be parsed
+        DataProcessingError: If the source is not sorted by time
+    """
+    if chunk_rows < 1:
+        raise ValueError(f"chunk_rows must be positive, got: {chunk_rows}")
+
+    if isinstance(source, pd.DataFrame):
+        frames: Iterator[pd.DataFrame] = (
+            source.iloc[begin:begin + chunk_rows] for begin in range(0, len(source), chunk_rows)
+        )
+    else:
+        path = Path(source)
+        if not path.exists():
+            raise DataLoadingError(f"Data source not found: {path}", {'source': str(path)})
+        if path.is_dir() or path.suffix.lower() in PARQUET_SUFFIXES:
+            frames = _iter_parquet(path, chunk_rows, columns)
+        else:
+            frames = _iter_csv(path)
+
+    previous = None
+    for chunk in _rechunk(frames, chunk_rows):
+        if columns is not None:
+            chunk = chunk[[column for column in columns if column in chunk.columns]]
+        if isinstance(chunk.index, pd.DatetimeIndex) and len(chunk):
+            if not chunk.index.is_monotonic_increasing or (previous is not None and chunk.index[0] < previous):
+                raise DataProcessingError(
+                    "Chunked processing needs a source sorted by time",
+                    {'source': str(source) if not isinstance(source, pd.DataFrame) else 'DataFrame'}
+                )
+            previous = chunk.index[-1]
+        yield chunk
+
+
+class _ChunkStep:
+    """
+    One processing step with the state it carries between chunks.
+
+    Steps that need statistics of the whole series declare ``fit_passes``;
+    each pass feeds them the complete output of the preceding steps before
+    the results are produced.
+    """
+
+    fit_passes = 0
+
+    def reset(self) -> None:
+        """Forget the carried state (start of a pass over the source)."""
+
+    def begin_fit(self, pass_index: int) -> None:
+        pass
+
+    def fit(self, pass_index: int, chunk: pd.DataFrame) -> None:
+        pass
+
+    def end_fit(self, pass_index: int) -> None:
+        pass
+
+    def process(self, chunk: pd.DataFrame) -> pd.DataFrame:
+        return chunk
+
+    def flush(self) -> Optional[pd.DataFrame]:
+        """Rows held back until the end of the source."""
+        return None
+
+
+class _RowStep(_ChunkStep):
+    """Row-local function: no state."""
+
+    def __init__(self, func: Callable[[pd.DataFrame], pd.DataFrame]):
+        self.func = func
+
+    def process(self, chunk: pd.DataFrame) -> pd.DataFrame:
+        return self.func(chunk)
+
+
+class _ForwardFillStep(_ChunkStep):
+    """Drop empty rows and forward-fill gaps, carrying the last filled row."""
+
+    def __init__(self):
+        self._last: Optional[pd.DataFrame] = None
+
+    def reset(self) -> None:
+        self._last = None
+
+    def process(self, chunk: pd.DataFrame) -> pd.DataFrame:
+        chunk = chunk.dropna(how='all')
+        if not len(chunk):
+            return chunk
+        if self._last is None:
+            filled = _handle_missing_values(chunk, 'forward')
+        else:
+            filled = _handle_missing_values(pd.concat([self._last, chunk]), 'forward').iloc[1:]
+        self._last = filled.iloc[-1:]
+        return filled
+
+
+class _OverlapStep(_ChunkStep):
+    """Function looking back ``lookback`` rows: recomputed over the carried input tail."""
+
+    def __init__(self, func: Callable[[pd.DataFrame], pd.DataFrame], lookback: int):
+        self.func = func
+        self.lookback = lookback
+        self._tail: Optional[pd.DataFrame] = None
+
+    def reset(self) -> None:
+        self._tail = None
+
+    def process(self, chunk: pd.DataFrame) -> pd.DataFrame:
+        if self._tail is not None and len(self._tail):
+            extended = pd.concat([self._tail, chunk])
+        else:
+            extended = chunk
+        carried = len(extended) - len(chunk)
+        if self.lookback:
+            self._tail = extended.iloc[-self.lookback:]
+        return self.func(extended).iloc[carried:]
+
+
+class _ResampleStep(_ChunkStep):
+    """Resample, holding back the bars of the last (possibly incomplete) period."""
+
+    def __init__(self, target_timeframe: str):
+        self.target_timeframe = target_timeframe
+        self._pending: Optional[pd.DataFrame] = None
+        self._origin: Any = None
+
+    def reset(self) -> None:
+        self._pending = None
+        self._origin = None
+
+    def _resample(self, df: pd.DataFrame) -> pd.DataFrame:
+        agg_rules = _ohlcv_agg_rules(df.columns)
+        if not agg_rules:
+            raise DataProcessingError("No OHLCV columns found for resampling")
+        return _resample_frame(df, self.target_timeframe, agg_rules, origin=self._origin)
+
+    def process(self, chunk: pd.DataFrame) -> pd.DataFrame:
+        data = chunk if self._pending is None else pd.concat([self._pending, chunk])
+        if self._origin is None:
+            # 'start_day' of the whole series, not of every chunk
+            self._origin = data.index[0].normalize()
+        sizes = data.resample(self.target_timeframe, origin=self._origin).size()
+        split = len(data) - int(sizes.iloc[-1])
+        self._pending = data.iloc[split:]
+        return self._resample(data.iloc[:split])
+
+    def flush(self) -> Optional[pd.DataFrame]:
+        if self._pending is None or not len(self._pending):
+            return None
+        return self._resample(self._pending)
+
+
+class _OutlierStep(_ChunkStep):
+    """
+    Drop rows outside the outlier bounds of the whole series.
+
+    Pass ``i`` computes the statistics of the ``i``-th column over the rows
+    kept by the previous columns, as :func:`remove_price_outliers` does.
+    """
+
+    def __init__(self, columns: Sequence[str], threshold: float, method: str):
+        self.columns = list(columns)
+        self.threshold = threshold
+        self.method = method
+        self.fit_passes = len(self.columns)
+        self._stats: Dict[str, Tuple[float, float]] = {}
+        self._moments: Tuple[int, float, float] = (0, 0.0, 0.0)
+        self._values: List[np.ndarray] = []
+        self._rows = 0
+        self._removed = 0
+
+    def _keep(self, chunk: pd.DataFrame, columns: Sequence[str]) -> np.ndarray:
+        keep = np.ones(len(chunk), dtype=bool)
+        for column in columns:
+            if column in self._stats:
+                values = chunk[column].to_numpy(dtype=np.float64)
+                keep &= _outlier_keep_mask(values, self._stats[column], self.method, self.threshold)
+        return keep
+
+    def begin_fit(self, pass_index: int) -> None:
+        if pass_index == 0:
+            self._stats = {}
+        self._moments = (0, 0.0, 0.0)
+        self._values = []
+
+    def fit(self, pass_index: int, chunk: pd.DataFrame) -> None:
+        column = self.columns[pass_index]
+        if column not in chunk.columns:
+            return
+        values = chunk[column].to_numpy(dtype=np.float64)
+        values = values[self._keep(chunk, self.columns[:pass_index])]
+        values = values[~np.isnan(values)]
+        if self.method == 'iqr':
+            self._values.append(values)
+        elif len(values):
+            # Chan et al. parallel update of count, mean and sum of squared deviations
+            count, mean, m2 = self._moments
+            n = len(values)
+            chunk_mean = values.mean()
+            delta = chunk_mean - mean
+            total = count + n
+            mean += delta * n / total
+            m2 += ((values - chunk_mean) ** 2).sum() + delta ** 2 * count * n / total
+            self._moments = (total, mean, m2)
+
+    def end_fit(self, pass_index: int) -> None:
+        column = self.columns[pass_index]
+        if self.method == 'iqr':
+            if self._values:
+                self._stats[column] = _outlier_statistics(np.concatenate(self._values), self.method)
+                self._values = []
+            return
+        count, mean, m2 = self._moments
+        if count:
+            std = np.sqrt(m2 / (count - 1)) if count > 1 else np.nan
+            self._stats[column] = (mean, std)
+
+    def reset(self) -> None:
+        self._rows = 0
+        self._removed = 0
+
+    def process(self, chunk: pd.DataFrame) -> pd.DataFrame:
+        keep = self._keep(chunk, self.columns)
+        self._rows += len(chunk)
+        self._removed += int(len(chunk) - keep.sum())
+        return chunk[keep]
+
+    def flush(self) -> Optional[pd.DataFrame]:
+        if self._removed:
+            logger.debug(f"Removed {self._removed} outlier rows ({self._removed / self._rows:.2%})")
+        return None
+
+
+class ChunkedProcessor:
+    """
+    Out-of-core pipeline of :mod:`bquant.data.processor` steps.
+
+    Steps are added with methods named after the in-memory functions and
+    run when the results are consumed (:meth:`iter_chunks`, :meth:`write`,
+    :meth:`to_frame`). Memory use is bounded by ``chunk_rows`` plus the
+    carried state of each step.
+
+    Args:
+        source: Parquet file, directory of Parquet files, CSV file or
+            DataFrame (see :func:`iter_source_chunks`)
+        chunk_rows: Maximum bars read per chunk
+        columns: Source columns to read; ``None`` reads all
+    """
+
+    def __init__(self, source: Source, chunk_rows: int = DEFAULT_CHUNK_ROWS,
+                 columns: Optional[Sequence[str]] = None):
+        if chunk_rows < 1:
+            raise ValueError(f"chunk_rows must be positive, got: {chunk_rows}")
+        self.source = source
+        self.chunk_rows = chunk_rows
+        self.columns = list(columns) if columns is not None else None
+        self._steps: List[_ChunkStep] = []
+
+    def __repr__(self) -> str:
+        steps = ', '.join(type(step).__name__.strip('_') for step in self._steps)
+        return f"ChunkedProcessor(chunk_rows={self.chunk_rows}, steps=[{steps}])"
+
+    def clean_ohlcv_data(self, fill_method: str = 'forward', remove_outliers: bool = True,
+                         outlier_threshold: float = 3.0) -> 'ChunkedProcessor':
+        """
+        Chunked :func:`~bquant.data.processor.clean_ohlcv_data`.
+
+        Only ``fill_method='forward'`` is supported: backward fill and
+        interpolation need bars of later chunks.
+        """
+        if fill_method != 'forward':
+            raise DataProcessingError(
+                f"fill_method '{fill_method}' is not supported in chunked mode (use 'forward')",
+                {'fill_method': fill_method}
+            )
+        self._steps.append(_ForwardFillStep())
+        if remove_outliers:
+            self.remove_price_outliers(threshold=outlier_threshold)
+        self._steps.append(_RowStep(_fix_ohlc_relationships))
+        return self
+
+    def remove_price_outliers(self, columns: Optional[List[str]] = None, threshold: float = 3.0,
+                              method: str = 'z_score') -> 'ChunkedProcessor':
+        """Chunked :func:`~bquant.data.processor.remove_price_outliers`."""
+        if method not in OUTLIER_METHODS:
+            raise DataProcessingError(
+                f"Unknown outlier detection method: {method}",
+                {'method': method, 'threshold': threshold, 'columns': columns}
+            )
+        if columns is None:
+            columns = ['open', 'high', 'low', 'close']
+        self._steps.append(_OutlierStep(columns, threshold, method))
+        return self
+
+    def resample_ohlcv(self, target_timeframe: str) -> 'ChunkedProcessor':
+        """Chunked :func:`~bquant.data.processor.resample_ohlcv`."""
+        self._steps.append(_ResampleStep(target_timeframe))
+        return self
+
+    def add_technical_features(self) -> 'ChunkedProcessor':
+        """Chunked :func:`~bquant.data.processor.add_technical_features`."""
+        self._steps.append(_OverlapStep(
+            lambda df: df.assign(**_technical_features(df)),
+            TECHNICAL_FEATURES_LOOKBACK,
+        ))
+        return self
+
+    def create_lagged_features(self, columns: List[str], lags: List[int]) -> 'ChunkedProcessor':
+        """Chunked :func:`~bquant.data.processor.create_lagged_features`."""
+        if any(lag < 0 for lag in lags):
+            raise DataProcessingError(
+                f"Lag must be non-negative, got: {min(lags)}",
+                {'columns': columns, 'lags': lags}
+            )
+        columns, lags = list(columns), list(lags)
+        self._steps.append(_OverlapStep(
+            lambda df: df.assign(**_lagged_features(df, columns, lags)),
+            max(lags, default=0),
+        ))
+        return self
+
+    def _source_chunks(self) -> Iterator[pd.DataFrame]:
+        return iter_source_chunks(self.source, self.chunk_rows, self.columns)
+
+    def _run(self, steps: Sequence[_ChunkStep]) -> Iterator[pd.DataFrame]:
+        """One pass over the source through ``steps``."""
+        for step in steps:
+            step.reset()
+        for chunk in self._source_chunks():
+            for step in steps:
+                chunk = step.process(chunk)
+                if not len(chunk):
+                    break
+            else:
+                yield chunk
+        for position, step in enumerate(steps):
+            held = step.flush()
+            if held is None:
+                continue
+            for later in steps[position + 1:]:
+                held = later.process(held)
+                if not len(held):
+                    break
+            else:
+                if len(held):
+                    yield held
+
+    def iter_chunks(self) -> Iterator[pd.DataFrame]:
+        """
+        Process the source and yield the results chunk by chunk.
+
+        Raises:
+            DataLoadingError: If the source cannot be read
+            DataProcessingError: If a step fails
+        """
+        try:
+            for position, step in enumerate(self._steps):
+                for pass_index in range(step.fit_passes):
+                    step.begin_fit(pass_index)
+                    for chunk in self._run(self._steps[:position]):
+                        step.fit(pass_index, chunk)
+                    step.end_fit(pass_index)
+            yield from self._run(self._steps)
+        except DataError:
+            raise
+        except Exception as e:
+            raise DataProcessingError(
+                f"Chunked processing failed: {e}",
+                {'processor': repr(self), 'error': str(e)}
+            )
+
+    def to_frame(self) -> pd.DataFrame:
+        """All results as one DataFrame (for results that fit in memory)."""
+        chunks = list(self.iter_chunks())
+        if not chunks:
+            return pd.DataFrame()
+        return pd.concat(chunks)
+
+    def _write_parquet(self, path: Path) -> Tuple[int, int, List[str]]:
+        n_chunks, n_rows, columns = 0, 0, []
+        writer: Optional[pq.ParquetWriter] = None
+        try:
+            for chunk in self.iter_chunks():
+                table = pa.Table.from_pandas(chunk, preserve_index=True)
+                if writer is None:
+                    # Prices are high-cardinality: no dictionary encoding
+                    writer = pq.ParquetWriter(path, table.schema, use_dictionary=False)
+                elif not table.schema.equals(writer.schema, check_metadata=False):
+                    table = table.cast(writer.schema)
+                writer.write_table(table)
+                n_chunks, n_rows, columns = n_chunks + 1, n_rows + len(chunk), list(chunk.columns)
+        finally:
+            if writer is not None:
+                writer.close()
+        if writer is None:
+            pq.write_table(pa.Table.from_pandas(pd.DataFrame()), path)
+        return n_chunks, n_rows, columns
+
+    def _write_csv(self, path: Path) -> Tuple[int, int, List[str]]:
+        n_chunks, n_rows, columns = 0, 0, []
+        with open(path, 'w', newline='', encoding='utf-8') as handle:
+            for chunk in self.iter_chunks():
+                chunk.to_csv(handle, header=n_chunks == 0, index=True)
+                n_chunks, n_rows, columns = n_chunks + 1, n_rows + len(chunk), list(chunk.columns)
+        return n_chunks, n_rows, columns
+
+    def write(self, output: Union[str, Path]) -> Dict[str, Any]:
+        """
+        Process the source and append the results to ``output`` chunk by chunk.
+
+        The format follows the suffix: ``.parquet``/``.pq`` (one row group per
+        chunk) or CSV. The file is written under a temporary name and moved
+        into place when complete.
+
+        Args:
+            output: Output file path
+
+        Returns:
+            Summary: ``output``, ``chunks``, ``rows``, ``columns``
+        """
+        output = Path(output)
+        output.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = output.with_name(f"{output.name}.{os.getpid()}.tmp")
+        write_chunks = self._write_parquet if output.suffix.lower() in PARQUET_SUFFIXES else self._write_csv
+
+        try:
+            n_chunks, n_rows, columns = write_chunks(tmp_path)
+            os.replace(tmp_path, output)
+        except (pa.ArrowException, ValueError) as e:
+            raise DataProcessingError(
+                f"Failed to write chunked results to {output}: {e}",
+                {'output': str(output), 'error': str(e)}
+            )
+        finally:
+            tmp_path.unlink(missing_ok=True)
+
+        logger.info(f"Wrote {n_rows} rows in {n_chunks} chunks to {output}")
+        return {'output': output, 'chunks': n_chunks, 'rows': n_rows, 'columns': columns}
+
+
+__all__ = [
+    'DEFAULT_CHUNK_ROWS',
+    'ChunkedProcessor',
+    'iter_source_chunks',
+]
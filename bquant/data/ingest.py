@@ -0,0 +1,440 @@
+"""
+Sniff-once CSV ingestion for OHLCV exports
+
+The layout of a file (encoding, delimiter, header, time column(s) and
+timestamp format) is detected from the first few KB, and the whole file is
+then parsed exactly once with the pyarrow CSV reader, timestamps included
+(explicit format, no inference). Detected layouts are cached per file path, size and
+modification time. Files too large for memory can be parsed block by block
+with :func:`iter_ohlcv_csv`.
+
+Supported layouts:
+- files with a header (TradingView, pandas ``to_csv``, generic exports);
+- MetaTrader exports without a header (``time,open,high,low,close,volume[,...]``);
+- MetaTrader exports with separate date and time columns;
+- ISO 8601 timestamps (with or without an offset), ``strptime`` formats and
+  unix epoch seconds/milliseconds (converted to naive UTC).
+"""
+
+import codecs
+import csv
+import io
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+import chardet
+import pandas as pd
+import pyarrow as pa
+from pyarrow import compute as pc
+from pyarrow import csv as pacsv
+
+from ..core.exceptions import DataLoadingError
+from ..core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Bytes read to detect the layout
+SNIFF_BYTES = 64 * 1024
+
+# Rows of the sample used to detect the timestamp format
+SNIFF_ROWS = 50
+
+# Bytes parsed per block by iter_ohlcv_csv
+STREAM_BLOCK_BYTES = 16 * 1024 * 1024
+
+DATE_FORMATS = ('%Y-%m-%d', '%Y.%m.%d', '%Y/%m/%d', '%d.%m.%Y', '%m/%d/%Y')
+TIME_OF_DAY_FORMATS = ('%H:%M:%S', '%H:%M')
+DATETIME_FORMATS = tuple(
+    f"{date} {time}" for date in DATE_FORMATS for time in TIME_OF_DAY_FORMATS
+) + DATE_FORMATS
+
+ISO8601 = 'ISO8601'
+UNIX_SECONDS = 'unix_s'
+UNIX_MILLISECONDS = 'unix_ms'
+
+TIME_COLUMN_NAMES = ('time', 'timestamp', 'datetime', 'date')
+
+# Column names of MetaTrader exports without a header (after the time column)
+MT_VALUE_COLUMNS = ('open', 'high', 'low', 'close', 'volume')
+
+_DELIMITERS = (',', ';', '\t')
+
+
+@dataclass(frozen=True)
+class CsvLayout:
+    """Layout of an OHLCV CSV file detected from its first bytes.
+
+    Attributes:
+        encoding: Text encoding passed to the CSV reader.
+        delimiter: Field delimiter.
+        has_header: Whether the first row holds column names.
+        columns: Names of all columns in file order.
+        time_columns: Column(s) combined into the time index (one, or date + time).
+        time_format: ``strptime`` format, :data:`ISO8601`, :data:`UNIX_SECONDS`
+            or :data:`UNIX_MILLISECONDS`.
+        index_name: Name of the resulting time index.
+        utc_offset: UTC offset (seconds) of ISO 8601 timestamps with an offset.
+    """
+
+    encoding: str
+    delimiter: str
+    has_header: bool
+    columns: Tuple[str, ...]
+    time_columns: Tuple[str, ...]
+    time_format: str
+    index_name: Optional[str]
+    utc_offset: Optional[int] = None
+
+
+_layout_cache: Dict[Tuple[str, int, int], CsvLayout] = {}
+_layout_lock = threading.Lock()
+
+
+def _detect_encoding(raw: bytes) -> str:
+    """Encoding of a file sample (BOM, then UTF-8, then chardet)."""
+    if raw.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+        return 'utf-16'
+    if raw.startswith(codecs.BOM_UTF8):
+        return 'utf-8-sig'
+    try:
+        raw.decode('utf-8')
+        return 'utf-8'
+    except UnicodeDecodeError as e:
+        # A multi-byte character cut at the end of the sample is still UTF-8
+        if e.start >= len(raw) - 3 and e.reason == 'unexpected end of data':
+            return 'utf-8'
+    result = chardet.detect(raw)
+    if result['encoding'] and result['confidence'] >= 0.7:
+        return result['encoding']
+    return 'cp1252'
+
+
+def _sample_rows(raw: bytes, encoding: str, complete: bool) -> Tuple[List[List[str]], str]:
+    text = raw.decode(encoding, errors='replace')
+    lines = text.splitlines()
+    if not complete and lines:
+        lines = lines[:-1]  # the last line of a partial read may be cut
+    lines = [line for line in lines if line.strip()]
+    if not lines:
+        return [], ','
+    first = lines[0]
+    delimiter = max(_DELIMITERS, key=first.count)
+    rows = list(csv.reader(io.StringIO('\n'.join(lines[:SNIFF_ROWS + 1])), delimiter=delimiter))
+    return rows, delimiter
+
+
+def _is_number(value: str) -> bool:
+    try:
+        float(value)
+    except ValueError:
+        return False
+    return True
+
+
+def _matches(values: Sequence[str], fmt: str) -> bool:
+    try:
+        for value in values:
+            datetime.strptime(value.strip(), fmt)
+    except ValueError:
+        return False
+    return True
+
+
+def _time_format(values: Sequence[str]) -> Optional[str]:
+    """Timestamp format shared by all sample values, if any."""
+    values = [value.strip() for value in values]
+    if not values or any(not value for value in values):
+        return None
+    if all(value.isdigit() for value in values):
+        digits = {len(value) for value in values}
+        if digits <= {9, 10}:
+            return UNIX_SECONDS
+        if digits <= {12, 13}:
+            return UNIX_MILLISECONDS
+        return None
+    for fmt in DATETIME_FORMATS:
+        if _matches(values, fmt):
+            return fmt
+    try:
+        pd.to_datetime(pd.Series(values), format=ISO8601)
+    except (ValueError, TypeError):
+        return None
+    return ISO8601
+
+
+def _utc_offset(values: Sequence[str]) -> Optional[int]:
+    """Common UTC offset of ISO 8601 sample values (None if naive)."""
+    times = pd.to_datetime(pd.Series([value.strip() for value in values]), format=ISO8601)
+    tz = times.dt.tz
+    if tz is None:
+        return None
+    return int(tz.utcoffset(times.iloc[0].to_pydatetime()).total_seconds())
+
+
+def _split_time_format(rows: List[List[str]], position: int) -> Optional[str]:
+    """Combined format when ``position`` holds dates and the next column times of day."""
+    dates = [row[position] for row in rows]
+    if position + 1 >= min(len(row) for row in rows):
+        return None
+    times = [row[position + 1] for row in rows]
+    for date_fmt in DATE_FORMATS:
+        if not _matches(dates, date_fmt):
+            continue
+        for time_fmt in TIME_OF_DAY_FORMATS:
+            if _matches(times, time_fmt):
+                return f"{date_fmt} {time_fmt}"
+    return None
+
+
+def _headerless_layout(rows: List[List[str]], encoding: str, delimiter: str) -> Optional[CsvLayout]:
+    """MetaTrader layout: time (or date + time) followed by numeric columns."""
+    width = len(rows[0])
+    if any(len(row) != width for row in rows):
+        return None
+
+    split_format = _split_time_format(rows, 0)
+    if split_format is not None:
+        time_columns, time_format = ('date', 'time'), split_format
+    else:
+        time_format = _time_format([row[0] for row in rows])
+        if time_format is None:
+            return None
+        time_columns = ('time',)
+    utc_offset = _utc_offset([row[0] for row in rows]) if time_format == ISO8601 else None
+
+    n_values = width - len(time_columns)
+    values = [row[len(time_columns):] for row in rows]
+    if n_values < len(MT_VALUE_COLUMNS) or not all(_is_number(v) for row in values for v in row[:len(MT_VALUE_COLUMNS)]):
+        return None
+    extra = [f'col_{i}' for i in range(len(MT_VALUE_COLUMNS) + 1, n_values + 1)]
+    columns = time_columns + MT_VALUE_COLUMNS + tuple(extra)
+    return CsvLayout(encoding, delimiter, False, columns, time_columns, time_format, 'time', utc_offset)
+
+
+def _header_layout(rows: List[List[str]], encoding: str, delimiter: str) -> Optional[CsvLayout]:
+    """Layout of a file whose first row holds column names."""
+    header, data = rows[0], rows[1:]
+    if not data or any(len(row) != len(header) for row in data):
+        return None
+
+    lowered = [name.strip().lower() for name in header]
+    candidates = [lowered.index(name) for name in TIME_COLUMN_NAMES if name in lowered]
+    for position in list(dict.fromkeys(candidates)) or [0]:
+        split_format = _split_time_format(data, position)
+        if split_format is not None:
+            time_columns = (header[position], header[position + 1])
+            return CsvLayout(encoding, delimiter, True, tuple(header), time_columns, split_format, 'time')
+
+        values = [row[position] for row in data]
+        time_format = _time_format(values)
+        if time_format is not None:
+            name = header[position]
+            utc_offset = _utc_offset(values) if time_format == ISO8601 else None
+            return CsvLayout(
+                encoding, delimiter, True, tuple(header), (name,), time_format, name or None, utc_offset
+            )
+    return None
+
+
+def sniff_csv_layout(file_path: Union[str, Path]) -> Optional[CsvLayout]:
+    """
+    Detect the layout of an OHLCV CSV file from its first bytes.
+
+    Args:
+        file_path: Path to CSV file
+
+    Returns:
+        Detected layout, or None if the file does not look like an OHLCV export
+    """
+    with open(file_path, 'rb') as f:
+        raw = f.read(SNIFF_BYTES + 1)
+    complete = len(raw) <= SNIFF_BYTES
+    raw = raw[:SNIFF_BYTES]
+    if not raw:
+        return None
+
+    encoding = _detect_encoding(raw)
+    rows, delimiter = _sample_rows(raw, encoding, complete)
+    if len(rows) < 2:
+        return None
+
+    layout = _headerless_layout(rows, encoding, delimiter)
+    if layout is None:
+        layout = _header_layout(rows, encoding, delimiter)
+    return layout
+
+
+def get_csv_layout(file_path: Union[str, Path]) -> Optional[CsvLayout]:
+    """
+    Layout of a CSV file, cached per resolved path, size and modification time.
+
+    Args:
+        file_path: Path to CSV file
+
+    Returns:
+        Detected layout, or None if the file does not look like an OHLCV export
+    """
+    path = Path(file_path).resolve()
+    stat = path.stat()
+    key = (str(path), stat.st_size, stat.st_mtime_ns)
+    with _layout_lock:
+        layout = _layout_cache.get(key)
+    if layout is None:
+        layout = sniff_csv_layout(path)
+        if layout is not None:
+            with _layout_lock:
+                _layout_cache[key] = layout
+    return layout
+
+
+def clear_layout_cache() -> None:
+    """Forget all cached CSV layouts."""
+    with _layout_lock:
+        _layout_cache.clear()
+
+
+def _time_column_type(layout: CsvLayout) -> pa.DataType:
+    """Arrow type of the time column as read by the CSV parser."""
+    if len(layout.time_columns) == 2:
+        return pa.string()
+    if layout.time_format in (UNIX_SECONDS, UNIX_MILLISECONDS):
+        return pa.int64()
+    if layout.time_format == ISO8601 and layout.utc_offset is not None:
+        return pa.timestamp('ns', tz='UTC')
+    return pa.timestamp('ns')
+
+
+def _time_index(table: pa.Table, layout: CsvLayout) -> pd.DatetimeIndex:
+    """Time index from the parsed time column(s)."""
+    if len(layout.time_columns) == 2:
+        date_col, time_col = layout.time_columns
+        joined = pc.binary_join_element_wise(table[date_col], table[time_col], ' ')
+        column = pc.strptime(joined, format=layout.time_format, unit='ns')
+    else:
+        column = table[layout.time_columns[0]]
+
+    if layout.time_format == UNIX_SECONDS:
+        times = pd.to_datetime(column.to_numpy(), unit='s')
+    elif layout.time_format == UNIX_MILLISECONDS:
+        times = pd.to_datetime(column.to_numpy(), unit='ms')
+    else:
+        times = pd.DatetimeIndex(column.to_pandas())
+        if layout.utc_offset is not None:
+            times = times.tz_convert(timezone(timedelta(seconds=layout.utc_offset)))
+    return pd.DatetimeIndex(times).rename(layout.index_name)
+
+
+def read_ohlcv_csv(file_path: Union[str, Path], layout: Optional[CsvLayout] = None) -> pd.DataFrame:
+    """
+    Parse an OHLCV CSV file in a single pass.
+
+    Args:
+        file_path: Path to CSV file
+        layout: Known layout (default: :func:`get_csv_layout`)
+
+    Returns:
+        DataFrame indexed by time, value columns in file order
+
+    Raises:
+        DataLoadingError: If the layout cannot be detected or the file does
+            not match it
+    """
+    if layout is None:
+        layout = get_csv_layout(file_path)
+    if layout is None:
+        raise DataLoadingError(
+            f"Unrecognized CSV layout: {file_path}",
+            {'file_path': str(file_path)}
+        )
+
+    try:
+        table = pacsv.read_csv(file_path, **_csv_options(layout))
+        return _to_frame(table, layout)
+    except (pa.ArrowException, ValueError, TypeError) as e:
+        raise DataLoadingError(
+            f"Failed to parse CSV file with detected layout: {e}",
+            {'file_path': str(file_path), 'error': str(e)}
+        )
+
+
+def iter_ohlcv_csv(file_path: Union[str, Path],
+                   layout: Optional[CsvLayout] = None,
+                   block_size: int = STREAM_BLOCK_BYTES) -> Iterator[pd.DataFrame]:
+    """
+    Parse an OHLCV CSV file block by block.
+
+    Same layout handling and result as :func:`read_ohlcv_csv`, but only one
+    block of ``block_size`` bytes is held in memory at a time.
+
+    Args:
+        file_path: Path to CSV file
+        layout: Known layout (default: :func:`get_csv_layout`)
+        block_size: Bytes parsed per block
+
+    Yields:
+        DataFrames indexed by time, in file order
+
+    Raises:
+        DataLoadingError: If the layout cannot be detected or the file does
+            not match it
+    """
+    if layout is None:
+        layout = get_csv_layout(file_path)
+    if layout is None:
+        raise DataLoadingError(
+            f"Unrecognized CSV layout: {file_path}",
+            {'file_path': str(file_path)}
+        )
+
+    try:
+        with pacsv.open_csv(file_path, **_csv_options(layout, block_size)) as reader:
+            for batch in reader:
+                yield _to_frame(pa.Table.from_batches([batch]), layout)
+    except (pa.ArrowException, ValueError, TypeError) as e:
+        raise DataLoadingError(
+            f"Failed to parse CSV file with detected layout: {e}",
+            {'file_path': str(file_path), 'error': str(e)}
+        )
+
+
+def _csv_options(layout: CsvLayout, block_size: Optional[int] = None) -> Dict[str, object]:
+    """pyarrow CSV reader options of a layout."""
+    read_options = pacsv.ReadOptions(
+        encoding=layout.encoding,
+        column_names=list(layout.columns),
+        skip_rows=1 if layout.has_header else 0,
+    )
+    if block_size is not None:
+        read_options.block_size = block_size
+    time_type = _time_column_type(layout)
+    parsers = [layout.time_format] if pa.types.is_timestamp(time_type) and layout.time_format != ISO8601 else None
+    return {
+        'read_options': read_options,
+        'parse_options': pacsv.ParseOptions(delimiter=layout.delimiter),
+        'convert_options': pacsv.ConvertOptions(
+            column_types={name: time_type for name in layout.time_columns},
+            timestamp_parsers=parsers,
+            strings_can_be_null=False,
+        ),
+    }
+
+
+def _to_frame(table: pa.Table, layout: CsvLayout) -> pd.DataFrame:
+    """DataFrame indexed by time from a parsed table."""
+    index = _time_index(table, layout)
+    frame = table.drop_columns(list(layout.time_columns)).to_pandas()
+    frame.index = index
+    return frame
+
+
+__all__ = [
+    'CsvLayout',
+    'sniff_csv_layout',
+    'get_csv_layout',
+    'clear_layout_cache',
+    'read_ohlcv_csv',
+    'iter_ohlcv_csv',
+]
@@ -0,0 +1,495 @@
+"""
+Partitioned Parquet data lake for OHLCV data
+
+Bars are stored as a Hive-partitioned Parquet dataset::
+
+    <lake>/symbol=XAUUSD/timeframe=1h/year_month=2024-01/part-0.parquet
+
+next to a JSON catalog (``_catalog.json``) with the rows, time range,
+columns and monthly partitions of every symbol/timeframe. Reads use the
+catalog to pick only the months of the requested range and push the time
+range and column projection down to the Parquet scan, so loading a month
+touches one partition file. ``_``-prefixed files are ignored by pyarrow, so
+the lake can also be scanned as a regular dataset (:meth:`DataLake.to_dataset`).
+"""
+
+import json
+import os
+import shutil
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from ..core.config import SUPPORTED_TIMEFRAMES, TIMEFRAME_MAPPING, get_processed_data_dir
+from ..core.exceptions import DataLoadingError, DataProcessingError
+from ..core.logging_config import get_logger
+from .bulk import DataFileEntry, discover_data_files
+from .loader import load_ohlcv_data
+
+logger = get_logger(__name__)
+
+# Version of the catalog/partition layout
+LAKE_FORMAT_VERSION = 1
+
+# Lake directory inside get_processed_data_dir()
+LAKE_DIRNAME = 'lake'
+
+CATALOG_FILENAME = '_catalog.json'
+
+# Name of the time column inside partition files
+TIME_COLUMN = 'time'
+
+PARTITION_FILENAME = 'part-0.parquet'
+
+_catalog_cache: Dict[Path, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+_catalog_lock = threading.Lock()
+
+
+def get_data_lake_dir() -> Path:
+    """Lake directory for the current processed data directory."""
+    return get_processed_data_dir() / LAKE_DIRNAME
+
+
+def universal_timeframe(timeframe: str) -> str:
+    """
+    Universal timeframe name of a provider-specific one (``'60'``/``'H1'`` -> ``'1h'``).
+
+    Unknown names are returned unchanged.
+    """
+    if timeframe in SUPPORTED_TIMEFRAMES:
+        return timeframe
+    for mapping in TIMEFRAME_MAPPING.values():
+        for universal, provider in mapping.items():
+            if provider == timeframe:
+                return universal
+    return timeframe
+
+
+def _timezone_spec(tz: Any) -> Optional[Dict[str, Any]]:
+    if tz is None:
+        return None
+    if isinstance(tz, timezone):
+        return {'offset_seconds': int(tz.utcoffset(None).total_seconds())}
+    return {'name': str(tz)}
+
+
+def _timezone_from_spec(spec: Optional[Dict[str, Any]]) -> Any:
+    if not spec:
+        return None
+    if 'offset_seconds' in spec:
+        return timezone(timedelta(seconds=spec['offset_seconds']))
+    return spec['name']
+
+
+def as_index_timestamp(value: Any, tz: Any) -> pd.Timestamp:
+    """
+    Timestamp comparable with an index in time zone ``tz``.
+
+    Naive bounds are wall-clock times of the index; aware bounds on a naive
+    index are converted to naive UTC.
+    """
+    ts = pd.Timestamp(value)
+    if tz is not None:
+        return ts.tz_localize(tz) if ts.tzinfo is None else ts.tz_convert(tz)
+    return ts.tz_convert('UTC').tz_localize(None) if ts.tzinfo is not None else ts
+
+
+def select_range(df: pd.DataFrame,
+                 start: Any = None,
+                 end: Any = None,
+                 columns: Optional[Sequence[str]] = None) -> pd.DataFrame:
+    """
+    Rows with ``start <= time <= end`` and the requested columns of a loaded frame.
+
+    Requested columns missing from the frame are ignored.
+    """
+    if start is not None or end is not None:
+        tz = getattr(df.index, 'tz', None)
+        mask = pd.Series(True, index=df.index)
+        if start is not None:
+            mask &= df.index >= as_index_timestamp(start, tz)
+        if end is not None:
+            mask &= df.index <= as_index_timestamp(end, tz)
+        df = df[mask.to_numpy()]
+    if columns is not None:
+        df = df[[column for column in columns if column in df.columns]]
+    return df
+
+
+def _source_state(path: Path) -> Dict[str, Any]:
+    stat = path.stat()
+    return {'path': str(path.resolve()), 'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+
+
+def _write_partitions(root: Path, symbol: str, timeframe: str, df: pd.DataFrame,
+                      source: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Replace the partitions of one symbol/timeframe; returns its catalog entry.
+
+    Partitions are written to a hidden directory and swapped in (the old
+    dataset is renamed aside first and deleted afterwards), so readers never
+    see a half-written dataset and a failed swap keeps the previous one.
+    """
+    if not isinstance(df.index, pd.DatetimeIndex):
+        try:
+            df = df.set_axis(pd.to_datetime(df.index, format='ISO8601'), axis=0)
+        except (ValueError, TypeError) as e:
+            raise DataProcessingError(
+                f"Cannot partition {symbol} {timeframe} by month: index is not datetime",
+                {'symbol': symbol, 'timeframe': timeframe, 'error': str(e)}
+            )
+    if not df.index.is_monotonic_increasing:
+        df = df.sort_index()
+
+    index_name = df.index.name
+    table = pa.Table.from_pandas(df.rename_axis(TIME_COLUMN).reset_index(), preserve_index=False)
+    # Wall-clock months as year * 100 + month (strftime is far slower)
+    months = (df.index.year * 100 + df.index.month).to_numpy()
+
+    dataset_dir = root / f"symbol={symbol}" / f"timeframe={timeframe}"
+    staging_dir = dataset_dir.with_name(f".{dataset_dir.name}.{os.getpid()}.tmp")
+    shutil.rmtree(staging_dir, ignore_errors=True)
+
+    partitions: Dict[str, int] = {}
+    # The index is sorted, so every month is one contiguous slice
+    bounds = [0, *(np.flatnonzero(months[1:] != months[:-1]) + 1).tolist(), len(months)] if len(months) else [0]
+    for begin, stop in zip(bounds[:-1], bounds[1:]):
+        month = f"{months[begin] // 100:04d}-{months[begin] % 100:02d}"
+        partition_dir = staging_dir / f"year_month={month}"
+        partition_dir.mkdir(parents=True)
+        pq.write_table(table.slice(begin, stop - begin), partition_dir / PARTITION_FILENAME,
+                       use_dictionary=False)
+        partitions[month] = stop - begin
+
+    staging_dir.mkdir(parents=True, exist_ok=True)
+    # Move the old dataset aside, swap the new one in, then delete the old one:
+    # the dataset directory is missing only between two renames
+    retired_dir = dataset_dir.with_name(f".{dataset_dir.name}.{os.getpid()}.old")
+    shutil.rmtree(retired_dir, ignore_errors=True)
+    if dataset_dir.exists():
+        os.replace(dataset_dir, retired_dir)
+    try:
+        os.replace(staging_dir, dataset_dir)
+    except OSError:
+        if retired_dir.exists() and not dataset_dir.exists():
+            os.replace(retired_dir, dataset_dir)
+        raise
+    shutil.rmtree(retired_dir, ignore_errors=True)
+
+    return {
+        'symbol': symbol,
+        'timeframe': timeframe,
+        'rows': len(df),
+        'start': df.index[0].isoformat() if len(df) else None,
+        'end': df.index[-1].isoformat() if len(df) else None,
+        'columns': [str(column) for column in df.columns],
+        'index_name': index_name,
+        'timezone': _timezone_spec(getattr(df.index, 'tz', None)),
+        'partitions': partitions,
+        'source': source,
+    }
+
+
+def _ingest_file(root: Path, symbol: str, timeframe: str,
+                 entry: DataFileEntry) -> Tuple[str, Optional[Dict[str, Any]], Optional[str]]:
+    """Parse one CSV and write its partitions; never raises (errors are returned)."""
+    key = f"{symbol}/{timeframe}"
+    try:
+        df = load_ohlcv_data(entry.path, symbol, timeframe)
+        return key, _write_partitions(root, symbol, timeframe, df, _source_state(entry.path)), None
+    except Exception as e:  # noqa: BLE001 - one bad file must not stop the batch
+        return key, None, f"{type(e).__name__}: {e}"
+
+
+class DataLake:
+    """
+    Hive-partitioned Parquet store of OHLCV data with a JSON catalog.
+
+    Datasets are addressed by symbol and universal timeframe (``'1h'``,
+    ``'15m'``, ...). Provider-specific timeframes of CSV files (``'60'``,
+    ``'M15'``) are mapped to universal names on ingestion.
+    """
+
+    def __init__(self, root: Optional[Union[str, Path]] = None):
+        """
+        Args:
+            root: Lake directory (default: ``<processed data dir>/lake``)
+        """
+        self.root = Path(root) if root is not None else get_data_lake_dir()
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({str(self.root)!r}, datasets={len(self.datasets)})"
+
+    # Catalog
+
+    @property
+    def catalog_path(self) -> Path:
+        return self.root / CATALOG_FILENAME
+
+    def _read_catalog(self) -> Dict[str, Any]:
+        path = self.catalog_path
+        try:
+            stat = path.stat()
+        except OSError:
+            return {'format_version': LAKE_FORMAT_VERSION, 'datasets': {}}
+
+        state = (stat.st_size, stat.st_mtime_ns)
+        with _catalog_lock:
+            cached = _catalog_cache.get(path)
+        if cached is not None and cached[0] == state:
+            return cached[1]
+
+        catalog = json.loads(path.read_text(encoding='utf-8'))
+        if catalog.get('format_version') != LAKE_FORMAT_VERSION:
+            raise DataLoadingError(
+                f"Unsupported data lake format: {catalog.get('format_version')}",
+                {'catalog': str(path)}
+            )
+        with _catalog_lock:
+            _catalog_cache[path] = (state, catalog)
+        return catalog
+
+    def _update_catalog(self, entries: Iterable[Dict[str, Any]] = (), removed: Iterable[str] = ()) -> None:
+        catalog = self._read_catalog()
+        datasets = dict(catalog['datasets'])
+        for entry in entries:
+            datasets[f"{entry['symbol']}/{entry['timeframe']}"] = entry
+        for key in removed:
+            datasets.pop(key, None)
+
+        catalog = {
+            'format_version': LAKE_FORMAT_VERSION,
+            'updated': datetime.now(timezone.utc).isoformat(),
+            'datasets': dict(sorted(datasets.items())),
+        }
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.catalog_path.with_name(f"{CATALOG_FILENAME}.{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(catalog, indent=1, ensure_ascii=False), encoding='utf-8')
+        os.replace(tmp_path, self.catalog_path)
+
+    @property
+    def datasets(self) -> Dict[str, Dict[str, Any]]:
+        """Catalog entries keyed by ``'SYMBOL/timeframe'``."""
+        return self._read_catalog()['datasets']
+
+    def info(self, symbol: str, timeframe: str) -> Optional[Dict[str, Any]]:
+        """Catalog entry of a symbol/timeframe or ``None``."""
+        return self.datasets.get(f"{symbol}/{universal_timeframe(timeframe)}")
+
+    def has(self, symbol: str, timeframe: str) -> bool:
+        return self.info(symbol, timeframe) is not None
+
+    def symbols(self) -> List[str]:
+        return sorted({entry['symbol'] for entry in self.datasets.values()})
+
+    def timeframes(self, symbol: str) -> List[str]:
+        return sorted(entry['timeframe'] for entry in self.datasets.values() if entry['symbol'] == symbol)
+
+    def source_path(self, symbol: str, timeframe: str) -> Optional[Path]:
+        """Source CSV a symbol/timeframe was converted from (``None`` if written directly)."""
+        entry = self.info(symbol, timeframe)
+        source = entry.get('source') if entry is not None else None
+        return Path(source['path']) if source else None
+
+    def is_current(self, symbol: str, timeframe: str) -> bool:
+        """
+        Whether the stored data still matches its source CSV.
+
+        Datasets without a source, or whose source no longer exists, are current.
+        """
+        entry = self.info(symbol, timeframe)
+        if entry is None:
+            return False
+        source = entry.get('source')
+        if not source or not Path(source['path']).exists():
+            return True
+        return _source_state(Path(source['path'])) == source
+
+    # Writing
+
+    def write(self, symbol: str, timeframe: str, df: pd.DataFrame) -> Dict[str, Any]:
+        """
+        Store a frame as the data of a symbol/timeframe, replacing existing partitions.
+
+        Args:
+            symbol: Trading symbol
+            timeframe: Timeframe (provider-specific names are mapped to universal ones)
+            df: OHLCV frame with a datetime index
+
+        Returns:
+            Catalog entry of the dataset
+
+        Raises:
+            DataProcessingError: If the index cannot be converted to datetime
+        """
+        entry = _write_partitions(self.root, symbol, universal_timeframe(timeframe), df)
+        self._update_catalog([entry])
+        return entry
+
+    def ingest(self, data_dir: Optional[Union[str, Path]] = None, n_jobs: Optional[int] = None,
+               force: bool = False, mp_context=None) -> Dict[str, str]:
+        """
+        Convert the CSV files of a data directory into the lake.
+
+        Files whose size and modification time match the catalog are skipped
+        unless ``force``. Files are parsed and written on a process pool.
+
+        Args:
+            data_dir: Directory with CSV files (default: ``get_data_dir()``)
+            n_jobs: Worker processes (``None`` or negative: CPU count; 1: in-process)
+            force: Convert unchanged files as well
+            mp_context: multiprocessing context for the process pool
+
+        Returns:
+            Mapping ``'SYMBOL/timeframe' -> status`` (``'converted'``,
+            ``'unchanged'`` or the error message)
+        """
+        from ..core.config import get_data_dir
+
+        data_dir = Path(data_dir) if data_dir is not None else get_data_dir()
+        if not data_dir.exists():
+            logger.warning(f"Data directory not found: {data_dir}")
+            return {}
+
+        # Several provider files may map to one universal key: last in name order wins
+        sources: Dict[str, Tuple[str, str, DataFileEntry]] = {}
+        for entry in discover_data_files(data_dir).values():
+            timeframe = universal_timeframe(entry.timeframe)
+            sources[f"{entry.symbol}/{timeframe}"] = (entry.symbol, timeframe, entry)
+
+        status: Dict[str, str] = {}
+        tasks = []
+        datasets = self.datasets
+        for key, (symbol, timeframe, entry) in sources.items():
+            stored = datasets.get(key, {}).get('source')
+            if not force and stored and stored == _source_state(entry.path):
+                status[key] = 'unchanged'
+            else:
+                tasks.append((symbol, timeframe, entry))
+
+        cpus = os.cpu_count() or 1
+        workers = cpus if n_jobs is None or n_jobs < 0 else max(1, int(n_jobs))
+        workers = min(workers, len(tasks))
+        logger.info(f"Converting {len(tasks)} of {len(sources)} data files into {self.root}")
+
+        self.root.mkdir(parents=True, exist_ok=True)
+        roots = [self.root] * len(tasks)
+        if workers > 1:
+            with ProcessPoolExecutor(max_workers=workers, mp_context=mp_context) as executor:
+                outcomes = list(executor.map(_ingest_file, roots, *zip(*tasks)))
+        else:
+            outcomes = [_ingest_file(root, *task) for root, task in zip(roots, tasks)]
+
+        entries = []
+        for key, entry, error in outcomes:
+            if error is not None:
+                logger.error(f"Error converting {sources[key][2].path}: {error}")
+                status[key] = error
+            else:
+                entries.append(entry)
+                status[key] = 'converted'
+        self._update_catalog(entries)
+        return status
+
+    def remove(self, symbol: str, timeframe: str) -> None:
+        """Delete the partitions and catalog entry of a symbol/timeframe."""
+        timeframe = universal_timeframe(timeframe)
+        shutil.rmtree(self.root / f"symbol={symbol}" / f"timeframe={timeframe}", ignore_errors=True)
+        self._update_catalog(removed=[f"{symbol}/{timeframe}"])
+
+    # Reading
+
+    def partition_files(self, symbol: str, timeframe: str, start: Any = None, end: Any = None) -> List[Path]:
+        """Partition files of a symbol/timeframe overlapping ``[start, end]``."""
+        entry = self.info(symbol, timeframe)
+        if entry is None:
+            return []
+        tz = _timezone_from_spec(entry.get('timezone'))
+        first = as_index_timestamp(start, tz).strftime('%Y-%m') if start is not None else None
+        last = as_index_timestamp(end, tz).strftime('%Y-%m') if end is not None else None
+
+        dataset_dir = self.root / f"symbol={symbol}" / f"timeframe={entry['timeframe']}"
+        return [
+            dataset_dir / f"year_month={month}" / PARTITION_FILENAME
+            for month in entry['partitions']
+            if (first is None or month >= first) and (last is None or month <= last)
+        ]
+
+    def read(self, symbol: str, timeframe: str, start: Any = None, end: Any = None,
+             columns: Optional[Sequence[str]] = None) -> pd.DataFrame:
+        """
+        Load the bars of a symbol/timeframe with ``start <= time <= end``.
+
+        Only the partitions of the requested months are opened; the time
+        filter and the column projection are applied by the Parquet scan.
+
+        Args:
+            symbol: Trading symbol
+            timeframe: Timeframe
+            start: First timestamp (inclusive); naive values are wall-clock times of the data
+            end: Last timestamp (inclusive)
+            columns: Columns to load; ``None`` loads all. The time index is always loaded.
+
+        Returns:
+            DataFrame indexed by time, as :func:`load_ohlcv_data` returns it
+
+        Raises:
+            DataLoadingError: If the symbol/timeframe is not in the lake
+        """
+        entry = self.info(symbol, timeframe)
+        if entry is None:
+            raise DataLoadingError(
+                f"No data for {symbol} {timeframe} in the data lake",
+                {'symbol': symbol, 'timeframe': timeframe, 'lake': str(self.root)}
+            )
+
+        tz = _timezone_from_spec(entry.get('timezone'))
+        selected = entry['columns'] if columns is None else [c for c in columns if c in entry['columns']]
+        files = self.partition_files(symbol, timeframe, start, end)
+
+        if files:
+            dataset = ds.dataset([str(path) for path in files], format='parquet')
+            time_type = dataset.schema.field(TIME_COLUMN).type
+            condition = None
+            for bound, is_start in ((start, True), (end, False)):
+                if bound is None:
+                    continue
+                value = pa.scalar(as_index_timestamp(bound, tz).value, pa.timestamp('ns', tz=time_type.tz))
+                value = pc.cast(value, time_type, safe=False)
+                term = ds.field(TIME_COLUMN) >= value if is_start else ds.field(TIME_COLUMN) <= value
+                condition = term if condition is None else condition & term
+            table = dataset.to_table(columns=[TIME_COLUMN] + selected, filter=condition)
+        elif entry['partitions']:
+            # Empty range: keep the column types of the stored data
+            schema_file = self.partition_files(symbol, timeframe)[0]
+            table = pq.read_schema(schema_file).empty_table().select([TIME_COLUMN] + selected)
+        else:
+            return pd.DataFrame(columns=selected, index=pd.DatetimeIndex([], name=entry.get('index_name')))
+
+        df = table.to_pandas().set_index(TIME_COLUMN)
+        if tz is not None:
+            df.index = df.index.tz_convert(tz)
+        return df.rename_axis(entry.get('index_name'))
+
+    def to_dataset(self) -> ds.Dataset:
+        """The whole lake as a Hive-partitioned pyarrow dataset."""
+        return ds.dataset(self.root, format='parquet', partitioning='hive')
+
+
+__all__ = [
+    'LAKE_FORMAT_VERSION',
+    'LAKE_DIRNAME',
+    'DataLake',
+    'get_data_lake_dir',
+    'universal_timeframe',
+    'select_range',
+]
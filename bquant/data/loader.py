@@ -8,7 +8,7 @@ This module provides functions to load and prepare financial data for analysis.
 import pandas as pd
 import numpy as np
 from pathlib import Path
-from typing import Dict, Any, Optional, List, Union
+from typing import TYPE_CHECKING, Dict, Any, Optional, List, Set, Tuple, Union
 import warnings
 import chardet
 
@@ -21,10 +21,34 @@ from ..core.exceptions import (
     create_data_validation_error
 )
 from ..core.logging_config import get_logger
+from .ingest import read_ohlcv_csv
+
+if TYPE_CHECKING:
+    from .bulk import DataFileCollection
+    from .lake import DataLake
 
 # Получаем логгер для модуля
 logger = get_logger(__name__)
 
+# DataLake of the configured lake directory, created on first use
+_default_lake: Optional['DataLake'] = None
+
+
+def _get_default_lake() -> 'DataLake':
+    """
+    Shared ``DataLake`` of the current lake directory.
+    
+    Created lazily and reused across loader calls; recreated when the
+    processed data directory (and with it the lake root) changes.
+    """
+    global _default_lake
+    from .lake import DataLake, get_data_lake_dir
+    
+    root = get_data_lake_dir()
+    if _default_lake is None or _default_lake.root != root:
+        _default_lake = DataLake(root)
+    return _default_lake
+
 
 def _detect_file_encoding(file_path: Path) -> str:
     """
@@ -158,6 +182,66 @@ def _try_read_csv_with_encoding(file_path: Path, encoding: str, logger_with_cont
     return None
 
 
+def _read_csv_fallback(file_path: Path, logger_with_context) -> pd.DataFrame:
+    """
+    Read CSV file trying several encodings and date formats.
+    
+    Used when the layout of the file cannot be sniffed (see
+    :func:`bquant.data.ingest.read_ohlcv_csv`); each attempt re-reads the file.
+    
+    Args:
+        file_path: Path to CSV file
+        logger_with_context: Logger with context
+        
+    Returns:
+        DataFrame read from the file
+        
+    Raises:
+        DataLoadingError: If the file cannot be read
+    """
+    try:
+        # Detect file encoding
+        encoding = _detect_file_encoding(file_path)
+        logger_with_context.info(f"Detected encoding: {encoding}")
+
+        # Try to read with detected encoding
+        df = _try_read_csv_with_encoding(file_path, encoding, logger_with_context)
+
+        # If failed, try common encodings as fallback
+        if df is None:
+            common_encodings = ['utf-8', 'windows-1252', 'cp1252', 'iso-8859-1', 'utf-16']
+            for fallback_encoding in common_encodings:
+                if fallback_encoding != encoding:
+                    logger_with_context.info(f"Trying fallback encoding: {fallback_encoding}")
+                    df = _try_read_csv_with_encoding(file_path, fallback_encoding, logger_with_context)
+                    if df is not None:
+                        break
+
+        # If still failed, try without date parsing
+        if df is None:
+            try:
+                df = pd.read_csv(file_path, index_col=0, encoding=encoding)
+                logger_with_context.warning("Could not parse dates automatically")
+            except Exception:
+                # Last resort: try without index_col
+                try:
+                    df = pd.read_csv(file_path, encoding=encoding)
+                    logger_with_context.warning("Could not set index automatically")
+                except Exception as e:
+                    raise DataLoadingError(
+                        f"Failed to read CSV file with any encoding: {e}",
+                        {'file_path': str(file_path), 'error': str(e)}
+                    )
+
+    except Exception as e:
+        raise DataLoadingError(
+            f"Failed to read CSV file: {e}",
+            {'file_path': str(file_path), 'error': str(e)}
+        )
+    
+    return df
+
+
 def _is_mt_format_without_headers(df: pd.DataFrame) -> bool:
     """
     Detect if DataFrame is in MetaTrader format without headers.
@@ -190,6 +274,19 @@ def _is_mt_format_without_headers(df: pd.DataFrame) -> bool:
         return False
 
 
+def _normalize_column_names(df: pd.DataFrame) -> pd.DataFrame:
+    """Lowercase column names and map common variations, in place."""
+    df.columns = df.columns.str.lower().str.strip()
+    
+    # Map common column name variations
+    column_mapping = {
+        'o': 'open', 'h': 'high', 'l': 'low', 'c': 'close', 'v': 'volume',
+        'vol': 'volume', 'adj close': 'adj_close', 'adj_close': 'adj_close'
+    }
+    df.rename(columns=column_mapping, inplace=True)
+    return df
+
+
 def load_ohlcv_data(
     file_path: Union[str, Path], 
     symbol: Optional[str] = None,
@@ -233,56 +330,15 @@ def load_ohlcv_data(
                 {'file_path': str(file_path), 'symbol': symbol, 'timeframe': timeframe}
             )
         
-        # Try to read CSV file with encoding detection
+        # Single pass with the sniffed layout; multi-attempt reader as fallback
         try:
-            # Detect file encoding
-            encoding = _detect_file_encoding(file_path)
-            logger_with_context.info(f"Detected encoding: {encoding}")
-            
-            # Try to read with detected encoding
-            df = _try_read_csv_with_encoding(file_path, encoding, logger_with_context)
-            
-            # If failed, try common encodings as fallback
-            if df is None:
-                common_encodings = ['utf-8', 'windows-1252', 'cp1252', 'iso-8859-1', 'utf-16']
-                for fallback_encoding in common_encodings:
-                    if fallback_encoding != encoding:
-                        logger_with_context.info(f"Trying fallback encoding: {fallback_encoding}")
-                        df = _try_read_csv_with_encoding(file_path, fallback_encoding, logger_with_context)
-                        if df is not None:
-                            break
-            
-            # If still failed, try without date parsing
-            if df is None:
-                try:
-                    df = pd.read_csv(file_path, index_col=0, encoding=encoding)
-                    logger_with_context.warning("Could not parse dates automatically")
-                except Exception:
-                    # Last resort: try without index_col
-                    try:
-                        df = pd.read_csv(file_path, encoding=encoding)
-                        logger_with_context.warning("Could not set index automatically")
-                    except Exception as e:
-                        raise DataLoadingError(
-                            f"Failed to read CSV file with any encoding: {e}",
-                            {'file_path': str(file_path), 'error': str(e)}
-                        )
-                
-        except Exception as e:
-            raise DataLoadingError(
-                f"Failed to read CSV file: {e}",
-                {'file_path': str(file_path), 'error': str(e)}
-            )
+            df = read_ohlcv_csv(file_path)
+        except DataLoadingError as e:
+            logger_with_context.info(f"Falling back to multi-attempt CSV reader: {e}")
+            df = _read_csv_fallback(file_path, logger_with_context)
         
         # Validate column names (make lowercase and consistent)
-        df.columns = df.columns.str.lower().str.strip()
-        
-        # Map common column name variations
-        column_mapping = {
-            'o': 'open', 'h': 'high', 'l': 'low', 'c': 'close', 'v': 'volume',
-            'vol': 'volume', 'adj close': 'adj_close', 'adj_close': 'adj_close'
-        }
-        df.rename(columns=column_mapping, inplace=True)
+        _normalize_column_names(df)
         
         # Validate data structure if requested
         if validate_data:
@@ -311,16 +367,29 @@ def load_symbol_data(
     symbol: str, 
     timeframe: str, 
     data_source: str = 'tradingview', 
-    quote_provider: str = 'default'
+    quote_provider: str = 'default',
+    start: Optional[Any] = None,
+    end: Optional[Any] = None,
+    columns: Optional[List[str]] = None
 ) -> pd.DataFrame:
     """
     Load data for any symbol and timeframe using config.
     
+    If the data lake (``bquant.data.lake``) holds the symbol/timeframe
+    converted from the file this call resolves to (same ``data_source`` and
+    ``quote_provider``) and the file has not changed since conversion, only
+    the partitions of the requested range are read, with the time and column
+    filters pushed down to the Parquet scan. Otherwise the CSV file is loaded
+    and filtered.
+    
     Args:
         symbol: Trading symbol (e.g., 'XAUUSD', 'EURUSD')
         timeframe: Timeframe (e.g., '1h', '1d', '5m')
         data_source: Data source ('tradingview', 'metatrader', 'generic', 'custom')
         quote_provider: Quote provider (e.g., 'oanda', 'forexcom', 'icmarkets')
+        start: First timestamp to load (inclusive, optional)
+        end: Last timestamp to load (inclusive, optional)
+        columns: Columns to load (optional; the time index is always loaded)
     
     Returns:
         DataFrame with OHLCV data
@@ -329,6 +398,8 @@ def load_symbol_data(
         DataLoadingError: If data cannot be loaded
         DataValidationError: If data validation fails
     """
+    from .lake import select_range
+    
     # Validate timeframe
     timeframe = validate_timeframe(timeframe)
     
@@ -341,8 +412,18 @@ def load_symbol_data(
     # Get file path using config with mapped timeframe
     file_path = get_data_path(symbol, mapped_timeframe, data_source, quote_provider)
     
+    # The lake copy is used only if it was converted from this very file
+    lake = _get_default_lake()
+    if lake.source_path(symbol, timeframe) == file_path.resolve():
+        if lake.is_current(symbol, timeframe):
+            return lake.read(symbol, timeframe, start=start, end=end, columns=columns)
+        logger.warning(f"Data lake copy of {symbol} {timeframe} is stale, loading the source file")
+    
     # Load data
-    return load_ohlcv_data(file_path, symbol, timeframe)
+    df = load_ohlcv_data(file_path, symbol, timeframe)
+    if start is None and end is None and columns is None:
+        return df
+    return select_range(df, start, end, columns)
 
 
 def load_xauusd_data(timeframe: str = '1h') -> pd.DataFrame:
@@ -358,60 +439,48 @@ def load_xauusd_data(timeframe: str = '1h') -> pd.DataFrame:
     return load_symbol_data('XAUUSD', timeframe)
 
 
-def load_all_data_files(data_dir: Optional[Path] = None) -> Dict[str, pd.DataFrame]:
+def load_all_data_files(
+    data_dir: Optional[Path] = None,
+    columns: Optional[List[str]] = None,
+    lazy: bool = False,
+    n_jobs: Optional[int] = 1,
+    use_cache: bool = False,
+    cache_dir: Optional[Path] = None
+) -> Union[Dict[str, pd.DataFrame], 'DataFileCollection']:
     """
     Load all available data files from data directory.
     
+    By default files are parsed sequentially in the current process and
+    nothing is written. With ``use_cache`` parsed files are kept as Parquet
+    sidecars keyed by source path, size and modification time (see
+    ``bquant.data.bulk``); with ``n_jobs`` other than 1 files without a valid
+    sidecar are parsed on a process pool (on spawn platforms the calling
+    script needs an ``if __name__ == '__main__':`` guard).
+    
     Args:
         data_dir: Directory to search for data files (default: from get_data_dir())
+        columns: Columns to load (normalized names); None loads all
+        lazy: Return a ``DataFileCollection`` that loads each file on first access
+        n_jobs: Worker processes for parsing (1: sequential, default; None: CPU count)
+        use_cache: Read and write Parquet sidecars (default: off)
+        cache_dir: Sidecar directory (default: ``<processed data dir>/ohlcv_cache``)
     
     Returns:
         Dictionary with symbol_timeframe as key and DataFrame as value
+        (``DataFileCollection`` mapping if ``lazy``)
     """
-    if data_dir is None:
-        data_dir = get_data_dir()
+    from .bulk import DataFileCollection
     
-    all_data = {}
+    collection = DataFileCollection(data_dir, columns=columns, use_cache=use_cache, cache_dir=cache_dir)
+    if lazy:
+        return collection
     
-    if not data_dir.exists():
-        logger.warning(f"Data directory not found: {data_dir}")
-        return all_data
-    
-    # Поиск CSV файлов в директории
-    csv_files = list(data_dir.glob("*.csv"))
-    if not csv_files:
-        logger.warning(f"No CSV files found in {data_dir}")
-        return all_data
-    
-    logger.info(f"Found {len(csv_files)} CSV files in {data_dir}")
-    
-    for file_path in csv_files:
-        try:
-            # Parse filename to extract symbol and timeframe
-            filename = file_path.stem
-            
-            # Try to detect data source and parse accordingly
-            symbol, timeframe, quote_provider = _parse_filename(filename)
-            
-            if symbol is None or timeframe == 'unknown':
-                logger.warning(f"Could not parse filename: {filename}")
-                continue
-            
-            # Try to validate timeframe if it's supported
-            try:
-                if timeframe in SUPPORTED_TIMEFRAMES:
-                    timeframe = validate_timeframe(timeframe)
-            except ValueError:
-                logger.warning(f"Unsupported timeframe '{timeframe}' for {symbol}, loading anyway")
-            
-            df = load_ohlcv_data(file_path, symbol, timeframe)
-            key = f"{symbol}_{timeframe}"
-            all_data[key] = df
-            
-        except Exception as e:
-            logger.error(f"Error loading {file_path}: {e}")
-            continue
+    if not collection:
+        logger.warning(f"No CSV files found in {collection.data_dir}")
+        return {}
     
+    logger.info(f"Found {len(collection)} data files in {collection.data_dir}")
+    all_data = collection.prefetch(n_jobs=n_jobs).to_dict()
     logger.info(f"Successfully loaded {len(all_data)} data files")
     return all_data
 
@@ -444,36 +513,56 @@ def get_data_info(df: pd.DataFrame) -> Dict[str, Any]:
     return info
 
 
+def _available_datasets(data_dir: Optional[Path]) -> Set[Tuple[str, str]]:
+    """
+    ``(symbol, universal timeframe)`` pairs of a data directory.
+    
+    CSV file names are merged with data lake entries converted from files of
+    the directory, so files not yet ingested and lake copies of removed files
+    are both listed under the same timeframe names.
+    """
+    from .lake import universal_timeframe
+    
+    data_dir = Path(data_dir) if data_dir is not None else get_data_dir()
+    datasets = set()
+    
+    if data_dir.exists():
+        for file_path in data_dir.glob("*.csv"):
+            symbol, timeframe, _ = _parse_filename(file_path.stem)
+            if symbol and symbol != 'unknown' and timeframe != 'unknown':
+                datasets.add((symbol, universal_timeframe(timeframe)))
+    
+    root = data_dir.resolve()
+    for entry in _get_default_lake().datasets.values():
+        source = entry.get('source')
+        if source and Path(source['path']).parent == root:
+            datasets.add((entry['symbol'], entry['timeframe']))
+    
+    return datasets
+
+
 def get_available_symbols(data_dir: Optional[Path] = None) -> List[str]:
     """
     Get list of available symbols in data directory.
     
+    Includes data lake datasets converted from files of the directory.
+    
     Args:
         data_dir: Directory to search (default: from get_data_dir())
     
     Returns:
         List of available symbols
     """
-    if data_dir is None:
-        data_dir = get_data_dir()
-    
-    symbols = set()
-    
-    if not data_dir.exists():
-        return []
-    
-    for file_path in data_dir.glob("*.csv"):
-        symbol, _, _ = _parse_filename(file_path.stem)
-        if symbol and symbol != 'unknown':
-            symbols.add(symbol)
-    
-    return sorted(list(symbols))
+    return sorted({symbol for symbol, _ in _available_datasets(data_dir)})
 
 
 def get_available_timeframes(symbol: str, data_dir: Optional[Path] = None) -> List[str]:
     """
     Get list of available timeframes for a symbol.
     
+    Timeframes are universal names (``'1h'``, ``'15m'``) as accepted by
+    :func:`load_symbol_data`, for CSV files and data lake datasets alike.
+    
     Args:
         symbol: Trading symbol
         data_dir: Directory to search (default: from get_data_dir())
@@ -481,20 +570,7 @@ def get_available_timeframes(symbol: str, data_dir: Optional[Path] = None) -> Li
     Returns:
         List of available timeframes for the symbol
     """
-    if data_dir is None:
-        data_dir = get_data_dir()
-    
-    timeframes = set()
-    
-    if not data_dir.exists():
-        return []
-    
-    for file_path in data_dir.glob("*.csv"):
-        parsed_symbol, timeframe, _ = _parse_filename(file_path.stem)
-        if parsed_symbol == symbol and timeframe != 'unknown':
-            timeframes.add(timeframe)
-    
-    return sorted(list(timeframes))
+    return sorted({timeframe for parsed, timeframe in _available_datasets(data_dir) if parsed == symbol})
 
 
 # Вспомогательные функции
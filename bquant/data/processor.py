@@ -16,6 +16,11 @@ from ..core.logging_config import get_logger
 # Получаем логгер для модуля
 logger = get_logger(__name__)
 
+OUTLIER_METHODS = ('z_score', 'iqr')
+
+# Rows of history add_technical_features looks back (price_ma_50)
+TECHNICAL_FEATURES_LOOKBACK = 50
+
 
 def clean_ohlcv_data(
     df: pd.DataFrame, 
@@ -45,11 +50,9 @@ def clean_ohlcv_data(
             logger.warning("Empty DataFrame provided for cleaning")
             return df.copy()
         
-        cleaned_df = df.copy()
-        
-        # Remove rows with all NaN values
-        initial_rows = len(cleaned_df)
-        cleaned_df.dropna(how='all', inplace=True)
+        # Remove rows with all NaN values (returns a new frame)
+        initial_rows = len(df)
+        cleaned_df = df.dropna(how='all')
         removed_empty = initial_rows - len(cleaned_df)
         if removed_empty > 0:
             logger.info(f"Removed {removed_empty} empty rows")
@@ -105,30 +108,22 @@ def remove_price_outliers(
             logger.warning("No price columns found for outlier removal")
             return df.copy()
         
+        if method not in OUTLIER_METHODS:
+            raise ValueError(f"Unknown outlier detection method: {method}")
+        
         logger.info(f"Removing outliers from columns: {existing_columns}")
         
-        cleaned_df = df.copy()
-        initial_rows = len(cleaned_df)
+        initial_rows = len(df)
         
-        if method == 'z_score':
-            for col in existing_columns:
-                z_scores = np.abs((cleaned_df[col] - cleaned_df[col].mean()) / cleaned_df[col].std())
-                outlier_mask = z_scores <= threshold
-                cleaned_df = cleaned_df[outlier_mask]
-        
-        elif method == 'iqr':
-            for col in existing_columns:
-                Q1 = cleaned_df[col].quantile(0.25)
-                Q3 = cleaned_df[col].quantile(0.75)
-                IQR = Q3 - Q1
-                lower_bound = Q1 - threshold * IQR
-                upper_bound = Q3 + threshold * IQR
-                
-                outlier_mask = (cleaned_df[col] >= lower_bound) & (cleaned_df[col] <= upper_bound)
-                cleaned_df = cleaned_df[outlier_mask]
+        # Each column's statistics are taken over the rows kept by the
+        # previous columns; the frame itself is filtered once at the end
+        keep = np.ones(initial_rows, dtype=bool)
+        for col in existing_columns:
+            values = df[col].to_numpy(dtype=np.float64)
+            stats = _outlier_statistics(values[keep], method)
+            keep &= _outlier_keep_mask(values, stats, method, threshold)
         
-        else:
-            raise ValueError(f"Unknown outlier detection method: {method}")
+        cleaned_df = df[keep]
         
         removed_rows = initial_rows - len(cleaned_df)
         if removed_rows > 0:
@@ -220,29 +215,13 @@ def resample_ohlcv(
         if df.empty:
             return df.copy()
         
-        # Define aggregation rules for OHLCV data
-        agg_rules = {
-            'open': 'first',
-            'high': 'max',
-            'low': 'min',
-            'close': 'last'
-        }
-        
-        # Add volume if it exists
-        if 'volume' in df.columns:
-            agg_rules['volume'] = 'sum'
-        
-        # Filter aggregation rules to only include existing columns
-        existing_agg_rules = {k: v for k, v in agg_rules.items() if k in df.columns}
+        # Aggregation rules of the OHLCV columns present in the frame
+        existing_agg_rules = _ohlcv_agg_rules(df.columns)
         
         if not existing_agg_rules:
             raise DataProcessingError("No OHLCV columns found for resampling")
         
-        # Perform resampling
-        resampled = df.resample(target_timeframe).agg(existing_agg_rules)
-        
-        # Remove rows with NaN values (incomplete periods)
-        resampled.dropna(inplace=True)
+        resampled = _resample_frame(df, target_timeframe, existing_agg_rules)
         
         logger.info(f"Resampled from {len(df)} to {len(resampled)} rows")
         return resampled
@@ -371,6 +350,26 @@ def detect_market_sessions(
 
 # Вспомогательные функции
 
+def _outlier_statistics(values: np.ndarray, method: str) -> Tuple[float, float]:
+    """Statistics of one column for outlier detection: (mean, std) or (Q1, Q3)."""
+    series = pd.Series(values)
+    if method == 'z_score':
+        return series.mean(), series.std()
+    return series.quantile(0.25), series.quantile(0.75)
+
+
+def _outlier_keep_mask(values: np.ndarray, stats: Tuple[float, float],
+                       method: str, threshold: float) -> np.ndarray:
+    """Rows of ``values`` within the outlier bounds (NaN values are not kept)."""
+    with np.errstate(divide='ignore', invalid='ignore'):
+        if method == 'z_score':
+            mean, std = stats
+            return np.abs((values - mean) / std) <= threshold
+        q1, q3 = stats
+        iqr = q3 - q1
+        return (values >= q1 - threshold * iqr) & (values <= q3 + threshold * iqr)
+
+
 def _handle_missing_values(df: pd.DataFrame, method: str) -> pd.DataFrame:
     """Handle missing values in DataFrame."""
     if method == 'forward':
@@ -383,6 +382,20 @@ def _handle_missing_values(df: pd.DataFrame, method: str) -> pd.DataFrame:
         raise ValueError(f"Unknown fill method: {method}")
 
 
+def _ohlcv_agg_rules(columns) -> Dict[str, str]:
+    """Aggregation rules of the OHLCV columns present in ``columns``."""
+    agg_rules = {'open': 'first', 'high': 'max', 'low': 'min', 'close': 'last', 'volume': 'sum'}
+    return {k: v for k, v in agg_rules.items() if k in columns}
+
+
+def _resample_frame(df: pd.DataFrame, target_timeframe: str, agg_rules: Dict[str, str],
+                    origin: Any = 'start_day') -> pd.DataFrame:
+    """Resample with ``agg_rules`` and drop periods without data."""
+    resampled = df.resample(target_timeframe, origin=origin).agg(agg_rules)
+    # Remove rows with NaN values (incomplete periods)
+    return resampled.dropna()
+
+
 def _fix_ohlc_relationships(df: pd.DataFrame) -> pd.DataFrame:
     """Fix logical inconsistencies in OHLC data."""
     result_df = df.copy()
@@ -435,52 +448,7 @@ def add_technical_features(df: pd.DataFrame) -> pd.DataFrame:
     try:
         logger.info("Adding technical features")
         
-        df_features = df.copy()
-        
-        # Price-based features
-        if all(col in df_features.columns for col in ['open', 'high', 'low', 'close']):
-            # Body size (candlestick body)
-            df_features['body_size'] = df_features['close'] - df_features['open']
-            df_features['body_size_pct'] = df_features['body_size'] / df_features['open']
-            
-            # Upper and lower shadows (candlestick wicks)
-            df_features['upper_shadow'] = df_features['high'] - df_features[['open', 'close']].max(axis=1)
-            df_features['lower_shadow'] = df_features[['open', 'close']].min(axis=1) - df_features['low']
-            
-            # True range (volatility measure)
-            df_features['true_range'] = np.maximum(
-                df_features['high'] - df_features['low'],
-                np.maximum(
-                    np.abs(df_features['high'] - df_features['close'].shift(1)),
-                    np.abs(df_features['low'] - df_features['close'].shift(1))
-                )
-            )
-            
-            # Price changes
-            df_features['price_change'] = df_features['close'].pct_change()
-            df_features['price_change_abs'] = df_features['price_change'].abs()
-            
-            # Rolling statistics
-            df_features['price_ma_20'] = df_features['close'].rolling(window=20).mean()
-            df_features['price_ma_50'] = df_features['close'].rolling(window=50).mean()
-            df_features['price_std_20'] = df_features['close'].rolling(window=20).std()
-            
-            # Price position within range
-            df_features['price_position'] = (df_features['close'] - df_features['low']) / (df_features['high'] - df_features['low'])
-            
-            # Momentum indicators
-            df_features['roc_5'] = df_features['close'].pct_change(periods=5)  # 5-period Rate of Change
-            df_features['roc_10'] = df_features['close'].pct_change(periods=10)  # 10-period Rate of Change
-        
-        # Volume-based features
-        if 'volume' in df_features.columns:
-            df_features['volume_ma_20'] = df_features['volume'].rolling(window=20).mean()
-            df_features['volume_ratio'] = df_features['volume'] / df_features['volume_ma_20']
-            df_features['volume_std_20'] = df_features['volume'].rolling(window=20).std()
-            
-            # Volume-price relationship
-            if 'close' in df_features.columns:
-                df_features['volume_price_trend'] = df_features['volume'] * df_features['price_change']
+        df_features = df.assign(**_technical_features(df))
         
         logger.info(f"Added {len(df_features.columns) - len(df.columns)} technical features")
         return df_features
@@ -492,6 +460,77 @@ def add_technical_features(df: pd.DataFrame) -> pd.DataFrame:
         )
 
 
+def _technical_features(df: pd.DataFrame) -> Dict[str, pd.Series]:
+    """Columns added by :func:`add_technical_features`, in output order."""
+    features: Dict[str, pd.Series] = {}
+    
+    # Price-based features
+    if all(col in df.columns for col in ['open', 'high', 'low', 'close']):
+        open_, high, low, close = df['open'], df['high'], df['low'], df['close']
+        prev_close = close.shift(1)
+        
+        # Body size (candlestick body)
+        features['body_size'] = close - open_
+        features['body_size_pct'] = features['body_size'] / open_
+        
+        # Upper and lower shadows (candlestick wicks)
+        features['upper_shadow'] = high - df[['open', 'close']].max(axis=1)
+        features['lower_shadow'] = df[['open', 'close']].min(axis=1) - low
+        
+        # True range (volatility measure)
+        features['true_range'] = np.maximum(
+            high - low,
+            np.maximum(np.abs(high - prev_close), np.abs(low - prev_close))
+        )
+        
+        # Price changes
+        features['price_change'] = close.pct_change()
+        features['price_change_abs'] = features['price_change'].abs()
+        
+        # Rolling statistics
+        features['price_ma_20'] = close.rolling(window=20).mean()
+        features['price_ma_50'] = close.rolling(window=50).mean()
+        features['price_std_20'] = close.rolling(window=20).std()
+        
+        # Price position within range
+        features['price_position'] = (close - low) / (high - low)
+        
+        # Momentum indicators
+        features['roc_5'] = close.pct_change(periods=5)  # 5-period Rate of Change
+        features['roc_10'] = close.pct_change(periods=10)  # 10-period Rate of Change
+    
+    # Volume-based features
+    if 'volume' in df.columns:
+        volume = df['volume']
+        features['volume_ma_20'] = volume.rolling(window=20).mean()
+        features['volume_ratio'] = volume / features['volume_ma_20']
+        features['volume_std_20'] = volume.rolling(window=20).std()
+        
+        # Volume-price relationship
+        if 'price_change' in features:
+            features['volume_price_trend'] = volume * features['price_change']
+    
+    return features
+
+
+def _lagged_features(df: pd.DataFrame, columns: List[str], lags: List[int]) -> Dict[str, pd.Series]:
+    """Columns added by :func:`create_lagged_features`, in output order."""
+    # Validate columns exist
+    missing_columns = [col for col in columns if col not in df.columns]
+    if missing_columns:
+        raise ValueError(f"Columns not found in DataFrame: {missing_columns}")
+    
+    negative = [lag for lag in lags if lag < 0]
+    if negative:
+        raise ValueError(f"Lag must be non-negative, got: {negative[0]}")
+    
+    return {
+        f"{col}_lag_{lag}": df[col].shift(lag)
+        for col in columns
+        for lag in lags
+    }
+
+
 def create_lagged_features(
     df: pd.DataFrame, 
     columns: List[str],
@@ -514,22 +553,9 @@ def create_lagged_features(
     try:
         logger.info(f"Creating lagged features for {len(columns)} columns with lags {lags}")
         
-        df_lagged = df.copy()
-        
-        # Validate columns exist
-        missing_columns = [col for col in columns if col not in df.columns]
-        if missing_columns:
-            raise ValueError(f"Columns not found in DataFrame: {missing_columns}")
-        
-        created_features = 0
-        for col in columns:
-            for lag in lags:
-                if lag < 0:
-                    raise ValueError(f"Lag must be non-negative, got: {lag}")
-                
-                lag_col_name = f"{col}_lag_{lag}"
-                df_lagged[lag_col_name] = df_lagged[col].shift(lag)
-                created_features += 1
+        lagged = _lagged_features(df, columns, lags)
+        df_lagged = df.assign(**lagged)
+        created_features = len(columns) * len(lags)
         
         logger.info(f"Created {created_features} lagged features")
         return df_lagged
@@ -50,6 +50,7 @@ from .datasets import (
 )
 from .utils import (
     load_embedded_data,
+    load_embedded_frame,
     convert_to_dataframe,
     convert_to_list_of_dicts,
     validate_data_integrity,
@@ -107,19 +108,14 @@ def get_sample_data(
         raise ValueError(f"Unsupported format '{format}'. Supported: {supported_formats}")
     
     try:
-        # Загружаем embedded данные
-        embedded_data = load_embedded_data(dataset_name)
-        raw_data = embedded_data['DATA']
-        
-        logger.debug(f"Loaded {len(raw_data)} records for {dataset_name}")
-        
-        # Конвертируем в нужный формат
+        # Собираем нужный формат прямо из колоночного файла
         if format in ['pandas', 'dataframe']:
-            result = convert_to_dataframe(raw_data, dataset_name)
-            logger.debug(f"Converted to DataFrame with shape {result.shape}")
+            result = load_embedded_frame(dataset_name)
+            logger.debug(f"Loaded DataFrame with shape {result.shape}")
             return result
             
         elif format in ['dict', 'list']:
+            raw_data = load_embedded_data(dataset_name)['DATA']
             logger.debug(f"Returning {len(raw_data)} records as list of dicts")
             return raw_data
         
@@ -5,11 +5,16 @@
 и предоставляет функции для работы с ними.
 """
 
+from pathlib import Path
 from typing import Dict, List, Any
 from ...core.logging_config import get_logger
+from ...core.utils import deprecated
 
 logger = get_logger(__name__)
 
+# Папка с колоночными файлами датасетов (package data)
+EMBEDDED_DIR = Path(__file__).parent / 'embedded'
+
 # Реестр доступных датасетов
 AVAILABLE_DATASETS = {
     'tv_xauusd_1h': {
@@ -29,8 +34,8 @@ AVAILABLE_DATASETS = {
         'period_end': '2025-08-12T13:00:00+07:00',
         'license': 'Open data, free for research and educational use',
         'disclaimer': 'For demonstration purposes only. Not for production trading.',
-        'file_module': 'embedded.tv_xauusd_1h',
-        'size_bytes': 555425,
+        'data_file': 'tv_xauusd_1h.arrow',
+        'size_bytes': 122234,
         'updated': '2025-08-25 18:38:50',
         'original_filename': 'OANDA_XAUUSD, 60.csv'
     },
@@ -48,8 +53,8 @@ AVAILABLE_DATASETS = {
         'period_end': '2025-05-30T07:30:00',
         'license': 'Open data, free for research and educational use',
         'disclaimer': 'For demonstration purposes only. Not for production trading.',
-        'file_module': 'embedded.mt_xauusd_m15',
-        'size_bytes': 207315,
+        'data_file': 'mt_xauusd_m15.arrow',
+        'size_bytes': 79474,
         'updated': '2025-08-25 18:38:51',
         'original_filename': 'XAUUSDM15.csv'
     }
@@ -135,15 +140,15 @@ def validate_dataset_name(dataset_name: str) -> bool:
     return dataset_name in AVAILABLE_DATASETS
 
 
-def get_dataset_file_module(dataset_name: str) -> str:
+def get_dataset_file(dataset_name: str) -> Path:
     """
-    Получить имя модуля для загрузки данных датасета.
+    Получить путь к колоночному файлу с данными датасета.
     
     Args:
         dataset_name: Название датасета
     
     Returns:
-        Имя модуля для импорта
+        Путь к ``.arrow`` файлу в ``bquant/data/samples/embedded``
     
     Raises:
         KeyError: Если датасет не найден
@@ -151,7 +156,27 @@ def get_dataset_file_module(dataset_name: str) -> str:
     if not validate_dataset_name(dataset_name):
         raise KeyError(f"Dataset '{dataset_name}' not found")
     
-    return AVAILABLE_DATASETS[dataset_name]['file_module']
+    return EMBEDDED_DIR / AVAILABLE_DATASETS[dataset_name]['data_file']
+
+
+@deprecated("Sample data is no longer stored as Python modules; use get_dataset_file() instead")
+def get_dataset_file_module(dataset_name: str) -> str:
+    """
+    Получить прежнее имя модуля данных датасета (``'embedded.<имя>'``).
+    
+    Оставлено для совместимости: модулей с данными больше нет, данные
+    лежат в файле :func:`get_dataset_file`.
+    
+    Args:
+        dataset_name: Название датасета
+    
+    Returns:
+        Имя модуля в прежнем формате
+    
+    Raises:
+        KeyError: Если датасет не найден
+    """
+    return f"embedded.{get_dataset_file(dataset_name).stem}"
 
 
 def get_datasets_by_symbol(symbol: str) -> List[str]:
@@ -233,11 +258,13 @@ def print_datasets_info():
 # Экспорт основных функций
 __all__ = [
     'AVAILABLE_DATASETS',
+    'EMBEDDED_DIR',
     'get_dataset_registry',
     'get_dataset_info',
     'list_dataset_names',
     'get_datasets_summary',
     'validate_dataset_name',
+    'get_dataset_file',
     'get_dataset_file_module',
     'get_datasets_by_symbol',
     'get_datasets_by_timeframe',
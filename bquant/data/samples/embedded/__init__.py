@@ -1,16 +1,17 @@
 """
 Embedded sample data for BQuant
 
-Этот модуль содержит встроенные тестовые данные в виде Python структур.
-Данные генерируются автоматически из исходных файлов с помощью 
-scripts/data/extract_samples.py
+Этот пакет содержит встроенные тестовые данные в виде колоночных Arrow IPC ``.arrow``
+файлов (package data, формат описан в bquant.data.samples.storage).
+Данные генерируются автоматически из исходных файлов с помощью
+SampleDataGenerator или scripts/data/extract_samples.py
 
 Доступные датасеты:
 - tv_xauusd_1h: TradingView XAUUSD 1H данные
 - mt_xauusd_m15: MetaTrader XAUUSD M15 данные
 """
 
-# Этот модуль содержит только embedded файлы
+# Этот пакет содержит только embedded файлы
 # Импорт данных осуществляется через bquant.data.samples API
 
 __all__ = []
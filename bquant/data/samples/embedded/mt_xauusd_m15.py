@@ -1,9018 +0,0 @@
-"""
-Embedded sample data for MetaTrader XAUUSD 15M
-
-Auto-generated from original MetaTrader dataset
-Generated on: 2025-08-25 18:38:51
-Rows: 1000
-Source: MetaTrader
-
-DO NOT EDIT THIS FILE MANUALLY!
-Use scripts/data/extract_samples.py to regenerate.
-"""
-
-from typing import Dict, List, Any
-
-DATASET_INFO = {'name': 'MetaTrader XAUUSD 15M', 'description': '15-минутные данные XAUUSD с базовыми метриками', 'source': 'MetaTrader', 'symbol': 'XAUUSD', 'timeframe': '15M', 'rows': 1000, 'columns': ['2021.05.27 02:00', '1896.26000', '1896.66000', '1895.71000', '1896.64000', '288', '0'], 'period_start': None, 'period_end': None, 'license': 'Open data, free for research and educational use', 'disclaimer': 'For demonstration purposes only. Not for production trading.', 'updated': '2025-08-25 18:38:51', 'extracted_from': 'XAUUSDM15.csv'}
-
-DATA = [
-    {
-        'time': '2025.08.07 19:15',
-        'open': 3390.72,
-        'high': 3391.52,
-        'low': 3389.29,
-        'close': 3389.69,
-        'volume': 2072.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.07 19:30',
-        'open': 3389.69,
-        'high': 3390.2,
-        'low': 3387.14,
-        'close': 3388.39,
-        'volume': 2068.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.07 19:45',
-        'open': 3388.41,
-        'high': 3390.05,
-        'low': 3388.0,
-        'close': 3388.8,
-        'volume': 1592.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.07 20:00',
-        'open': 3388.79,
-        'high': 3388.95,
-        'low': 3384.88,
-        'close': 3385.54,
-        'volume': 2467.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.07 20:15',
-        'open': 3385.49,
-        'high': 3389.14,
-        'low': 3384.29,
-        'close': 3389.0,
-        'volume': 3252.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.07 20:30',
-        'open': 3388.97,
-        'high': 3392.12,
-        'low': 3388.02,
-        'close': 3391.66,
-        'volume': 2226.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.07 20:45',
-        'open': 3391.67,
-        'high': 3392.93,
-        'low': 3391.67,
-        'close': 3392.2,
-        'volume': 1673.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.07 21:00',
-        'open': 3392.2,
-        'high': 3393.86,
-        'low': 3391.37,
-        'close': 3391.38,
-        'volume': 1816.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.07 21:15',
-        'open': 3391.38,
-        'high': 3392.31,
-        'low': 3389.03,
-        'close': 3389.03,
-        'volume': 2022.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.07 21:30',
-        'open': 3389.06,
-        'high': 3390.97,
-        'low': 3388.51,
-        'close': 3389.13,
-        'volume': 2151.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.07 21:45',
-        'open': 3389.13,
-        'high': 3390.07,
-        'low': 3387.69,
-        'close': 3388.25,
-        'volume': 1908.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.07 22:00',
-        'open': 3388.24,
-        'high': 3389.58,
-        'low': 3387.38,
-        'close': 3388.93,
-        'volume': 1716.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.07 22:15',
-        'open': 3388.92,
-        'high': 3390.22,
-        'low': 3388.57,
-        'close': 3389.84,
-        'volume': 1935.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.07 22:30',
-        'open': 3389.84,
-        'high': 3399.89,
-        'low': 3389.84,
-        'close': 3399.63,
-        'volume': 5199.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.07 22:45',
-        'open': 3399.61,
-        'high': 3400.82,
-        'low': 3396.93,
-        'close': 3399.77,
-        'volume': 4202.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.07 23:00',
-        'open': 3399.78,
-        'high': 3401.16,
-        'low': 3397.95,
-        'close': 3400.11,
-        'volume': 2704.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.07 23:15',
-        'open': 3400.11,
-        'high': 3401.78,
-        'low': 3399.52,
-        'close': 3401.17,
-        'volume': 1905.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.07 23:30',
-        'open': 3401.18,
-        'high': 3401.67,
-        'low': 3397.01,
-        'close': 3399.0,
-        'volume': 2666.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.07 23:45',
-        'open': 3399.0,
-        'high': 3399.34,
-        'low': 3392.51,
-        'close': 3395.82,
-        'volume': 2219.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.08 01:00',
-        'open': 3404.22,
-        'high': 3408.84,
-        'low': 3391.77,
-        'close': 3394.26,
-        'volume': 3478.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.08 01:15',
-        'open': 3394.38,
-        'high': 3394.58,
-        'low': 3389.15,
-        'close': 3392.97,
-        'volume': 3656.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.08 01:30',
-        'open': 3392.95,
-        'high': 3403.75,
-        'low': 3390.63,
-        'close': 3401.34,
-        'volume': 3655.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.08 01:45',
-        'open': 3401.32,
-        'high': 3406.59,
-        'low': 3394.45,
-        'close': 3405.58,
-        'volume': 3232.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.08 02:00',
-        'open': 3405.51,
-        'high': 3406.52,
-        'low': 3397.37,
-        'close': 3399.86,
-        'volume': 1446.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.08 02:15',
-        'open': 3399.83,
-        'high': 3400.45,
-        'low': 3396.2,
-        'close': 3397.87,
-        'volume': 1512.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.08 02:30',
-        'open': 3397.9,
-        'high': 3401.89,
-        'low': 3396.88,
-        'close': 3400.73,
-        'volume': 1218.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.08 02:45',
-        'open': 3400.74,
-        'high': 3401.73,
-        'low': 3398.47,
-        'close': 3400.52,
-        'volume': 2131.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.08 03:00',
-        'open': 3400.51,
-        'high': 3402.39,
-        'low': 3397.72,
-        'close': 3399.8,
-        'volume': 5189.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.08 03:15',
-        'open': 3399.82,
-        'high': 3400.09,
-        'low': 3391.29,
-        'close': 3391.91,
-        'volume': 4873.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.08 03:30',
-        'open': 3391.96,
-        'high': 3394.21,
-        'low': 3389.64,
-        'close': 3394.03,
-        'volume': 4389.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.08 03:45',
-        'open': 3394.02,
-        'high': 3395.41,
-        'low': 3387.82,
-        'close': 3389.87,
-        'volume': 4743.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.08 04:00',
-        'open': 3389.91,
-        'high': 3390.85,
-        'low': 3382.94,
-        'close': 3384.47,
-        'volume': 5009.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.08 04:15',
-        'open': 3384.47,
-        'high': 3385.72,
-        'low': 3381.97,
-        'close': 3384.63,
-        'volume': 4719.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.08 04:30',
-        'open': 3384.63,
-        'high': 3385.3,
-        'low': 3381.16,
-        'close': 3383.06,
-        'volume': 3894.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.08 04:45',
-        'open': 3383.07,
-        'high': 3385.57,
-        'low': 3382.5,
-        'close': 3383.38,
-        'volume': 3666.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.08 05:00',
-        'open': 3383.35,
-        'high': 3388.0,
-        'low': 3383.15,
-        'close': 3387.51,
-        'volume': 3536.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.08 05:15',
-        'open': 3387.5,
-        'high': 3388.52,
-        'low': 3386.2,
-        'close': 3386.77,
-        'volume': 3097.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.08 05:30',
-        'open': 3386.8,
-        'high': 3389.42,
-        'low': 3386.34,
-        'close': 3388.71,
-        'volume': 3610.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.08 05:45',
-        'open': 3388.74,
-        'high': 3389.97,
-        'low': 3387.62,
-        'close': 3388.19,
-        'volume': 3081.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.08 06:00',
-        'open': 3388.19,
-        'high': 3388.41,
-        'low': 3383.65,
-        'close': 3386.1,
-        'volume': 4056.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.08 06:15',
-        'open': 3386.1,
-        'high': 3389.72,
-        'low': 3385.28,
-        'close': 3388.77,
-        'volume': 3393.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.08 06:30',
-        'open': 3388.78,
-        'high': 3397.76,
-        'low': 3388.61,
-        'close': 3395.7,
-        'volume': 4198.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.08 06:45',
-        'open': 3395.72,
-        'high': 3396.87,
-        'low': 3394.7,
-        'close': 3395.78,
-        'volume': 3667.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.08 07:00',
-        'open': 3395.78,
-        'high': 3397.28,
-        'low': 3395.04,
-        'close': 3396.3,
-        'volume': 2533.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.08 07:15',
-        'open': 3396.32,
-        'high': 3398.94,
-        'low': 3395.81,
-        'close': 3398.1,
-        'volume': 2301.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.08 07:30',
-        'open': 3398.11,
-        'high': 3398.72,
-        'low': 3396.12,
-        'close': 3397.59,
-        'volume': 2621.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.08 07:45',
-        'open': 3397.62,
-        'high': 3399.18,
-        'low': 3393.52,
-        'close': 3394.33,
-        'volume': 3002.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.08 08:00',
-        'open': 3394.32,
-        'high': 3395.98,
-        'low': 3392.28,
-        'close': 3394.15,
-        'volume': 2566.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.08 08:15',
-        'open': 3394.17,
-        'high': 3395.79,
-        'low': 3390.74,
-        'close': 3391.8,
-        'volume': 2830.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.08 08:30',
-        'open': 3391.78,
-        'high': 3393.9,
-        'low': 3390.17,
-        'close': 3392.26,
-        'volume': 3296.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.08 08:45',
-        'open': 3392.28,
-        'high': 3394.66,
-        'low': 3391.75,
-        'close': 3392.42,
-        'volume': 2815.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.08 09:00',
-        'open': 3392.4,
-        'high': 3397.59,
-        'low': 3391.91,
-        'close': 3394.67,
-        'volume': 3826.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.08 09:15',
-        'open': 3394.66,
-        'high': 3395.41,
-        'low': 3392.36,
-        'close': 3393.94,
-        'volume': 3898.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.08 09:30',
-        'open': 3393.92,
-        'high': 3395.36,
-        'low': 3389.42,
-        'close': 3390.07,
-        'volume': 3760.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.08 09:45',
-        'open': 3390.08,
-        'high': 3394.93,
-        'low': 3388.67,
-        'close': 3393.44,
-        'volume': 3476.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.08 10:00',
-        'open': 3393.43,
-        'high': 3400.39,
-        'low': 3393.43,
-        'close': 3396.02,
-        'volume': 4216.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.08 10:15',
-        'open': 3396.03,
-        'high': 3397.48,
-        'low': 3394.3,
-        'close': 3394.94,
-        'volume': 3693.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.08 10:30',
-        'open': 3394.9,
-        'high': 3400.41,
-        'low': 3392.27,
-        'close': 3398.61,
-        'volume': 5601.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.08 10:45',
-        'open': 3398.6,
-        'high': 3404.22,
-        'low': 3398.15,
-        'close': 3401.96,
-        'volume': 5115.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.08 11:00',
-        'open': 3402.0,
-        'high': 3402.63,
-        'low': 3400.04,
-        'close': 3400.82,
-        'volume': 3957.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.08 11:15',
-        'open': 3400.82,
-        'high': 3401.51,
-        'low': 3398.18,
-        'close': 3399.42,
-        'volume': 2654.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.08 11:30',
-        'open': 3399.44,
-        'high': 3399.86,
-        'low': 3397.24,
-        'close': 3398.83,
-        'volume': 4549.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.08 11:45',
-        'open': 3398.84,
-        'high': 3399.15,
-        'low': 3394.11,
-        'close': 3394.34,
-        'volume': 4389.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.08 12:00',
-        'open': 3394.35,
-        'high': 3399.14,
-        'low': 3394.0,
-        'close': 3398.63,
-        'volume': 4385.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.08 12:15',
-        'open': 3398.63,
-        'high': 3401.27,
-        'low': 3398.48,
-        'close': 3399.43,
-        'volume': 3776.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.08 12:30',
-        'open': 3399.43,
-        'high': 3401.28,
-        'low': 3396.66,
-        'close': 3400.31,
-        'volume': 4227.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.08 12:45',
-        'open': 3400.3,
-        'high': 3401.23,
-        'low': 3399.65,
-        'close': 3400.6,
-        'volume': 3561.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.08 13:00',
-        'open': 3400.62,
-        'high': 3401.0,
-        'low': 3395.58,
-        'close': 3397.04,
-        'volume': 3630.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.08 13:15',
-        'open': 3397.04,
-        'high': 3397.12,
-        'low': 3389.56,
-        'close': 3390.34,
-        'volume': 4327.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.08 13:30',
-        'open': 3390.34,
-        'high': 3391.56,
-        'low': 3386.56,
-        'close': 3388.26,
-        'volume': 5044.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.08 13:45',
-        'open': 3388.23,
-        'high': 3389.49,
-        'low': 3384.41,
-        'close': 3384.96,
-        'volume': 4416.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.08 14:00',
-        'open': 3384.98,
-        'high': 3388.56,
-        'low': 3384.21,
-        'close': 3385.41,
-        'volume': 5147.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.08 14:15',
-        'open': 3385.43,
-        'high': 3385.93,
-        'low': 3380.4,
-        'close': 3381.87,
-        'volume': 4238.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.08 14:30',
-        'open': 3381.85,
-        'high': 3387.18,
-        'low': 3381.28,
-        'close': 3387.08,
-        'volume': 5875.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.08 14:45',
-        'open': 3387.1,
-        'high': 3388.62,
-        'low': 3383.87,
-        'close': 3386.1,
-        'volume': 5854.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.08 15:00',
-        'open': 3386.1,
-        'high': 3390.42,
-        'low': 3385.18,
-        'close': 3387.4,
-        'volume': 6383.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.08 15:15',
-        'open': 3387.4,
-        'high': 3396.49,
-        'low': 3385.87,
-        'close': 3394.35,
-        'volume': 6512.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.08 15:30',
-        'open': 3394.34,
-        'high': 3401.9,
-        'low': 3394.31,
-        'close': 3398.94,
-        'volume': 8021.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.08 15:45',
-        'open': 3398.97,
-        'high': 3399.43,
-        'low': 3389.29,
-        'close': 3391.49,
-        'volume': 6974.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.08 16:00',
-        'open': 3391.54,
-        'high': 3395.83,
-        'low': 3388.2,
-        'close': 3395.57,
-        'volume': 6936.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.08 16:15',
-        'open': 3395.54,
-        'high': 3395.6,
-        'low': 3387.57,
-        'close': 3392.57,
-        'volume': 6462.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.08 16:30',
-        'open': 3392.61,
-        'high': 3397.73,
-        'low': 3389.69,
-        'close': 3396.29,
-        'volume': 6179.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.08 16:45',
-        'open': 3396.29,
-        'high': 3401.63,
-        'low': 3395.91,
-        'close': 3400.12,
-        'volume': 4859.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.08 17:00',
-        'open': 3400.1,
-        'high': 3401.23,
-        'low': 3384.09,
-        'close': 3388.04,
-        'volume': 6853.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.08 17:15',
-        'open': 3388.03,
-        'high': 3390.02,
-        'low': 3383.03,
-        'close': 3383.27,
-        'volume': 5040.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.08 17:30',
-        'open': 3383.26,
-        'high': 3388.7,
-        'low': 3381.22,
-        'close': 3386.94,
-        'volume': 3728.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.08 17:45',
-        'open': 3386.93,
-        'high': 3391.15,
-        'low': 3386.08,
-        'close': 3390.59,
-        'volume': 3357.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.08 18:00',
-        'open': 3390.58,
-        'high': 3392.68,
-        'low': 3388.74,
-        'close': 3391.24,
-        'volume': 3415.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.08 18:15',
-        'open': 3391.25,
-        'high': 3395.1,
-        'low': 3389.67,
-        'close': 3393.18,
-        'volume': 3407.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.08 18:30',
-        'open': 3393.2,
-        'high': 3394.64,
-        'low': 3390.96,
-        'close': 3392.47,
-        'volume': 2926.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.08 18:45',
-        'open': 3392.46,
-        'high': 3395.25,
-        'low': 3391.05,
-        'close': 3395.25,
-        'volume': 3258.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.08 19:00',
-        'open': 3395.27,
-        'high': 3397.4,
-        'low': 3394.15,
-        'close': 3395.16,
-        'volume': 2649.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.08 19:15',
-        'open': 3395.15,
-        'high': 3398.6,
-        'low': 3393.57,
-        'close': 3397.83,
-        'volume': 2846.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.08 19:30',
-        'open': 3397.82,
-        'high': 3400.59,
-        'low': 3397.81,
-        'close': 3398.55,
-        'volume': 2387.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.08 19:45',
-        'open': 3398.53,
-        'high': 3400.38,
-        'low': 3397.51,
-        'close': 3397.52,
-        'volume': 2029.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.08 20:00',
-        'open': 3397.51,
-        'high': 3398.96,
-        'low': 3395.31,
-        'close': 3398.79,
-        'volume': 2719.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.08 20:15',
-        'open': 3398.8,
-        'high': 3398.95,
-        'low': 3395.75,
-        'close': 3398.53,
-        'volume': 2855.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.08 20:30',
-        'open': 3398.52,
-        'high': 3399.55,
-        'low': 3396.02,
-        'close': 3397.12,
-        'volume': 1911.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.08 20:45',
-        'open': 3397.13,
-        'high': 3398.19,
-        'low': 3382.76,
-        'close': 3382.79,
-        'volume': 2124.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.08 21:00',
-        'open': 3381.97,
-        'high': 3404.2,
-        'low': 3376.38,
-        'close': 3397.56,
-        'volume': 9421.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.08 21:15',
-        'open': 3397.57,
-        'high': 3398.79,
-        'low': 3389.52,
-        'close': 3394.18,
-        'volume': 6775.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.08 21:30',
-        'open': 3394.16,
-        'high': 3397.15,
-        'low': 3390.92,
-        'close': 3395.68,
-        'volume': 4430.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.08 21:45',
-        'open': 3395.67,
-        'high': 3400.64,
-        'low': 3393.4,
-        'close': 3395.37,
-        'volume': 3862.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.08 22:00',
-        'open': 3395.37,
-        'high': 3400.88,
-        'low': 3394.22,
-        'close': 3397.86,
-        'volume': 3950.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.08 22:15',
-        'open': 3397.86,
-        'high': 3399.48,
-        'low': 3393.35,
-        'close': 3394.35,
-        'volume': 3361.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.08 22:30',
-        'open': 3394.35,
-        'high': 3398.45,
-        'low': 3392.16,
-        'close': 3396.21,
-        'volume': 3896.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.08 22:45',
-        'open': 3396.2,
-        'high': 3399.54,
-        'low': 3395.29,
-        'close': 3398.54,
-        'volume': 3992.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.08 23:00',
-        'open': 3398.53,
-        'high': 3398.86,
-        'low': 3394.56,
-        'close': 3394.96,
-        'volume': 1930.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.08 23:15',
-        'open': 3394.94,
-        'high': 3396.34,
-        'low': 3393.54,
-        'close': 3395.44,
-        'volume': 1973.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.08 23:30',
-        'open': 3395.44,
-        'high': 3398.63,
-        'low': 3392.38,
-        'close': 3398.06,
-        'volume': 1790.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.08 23:45',
-        'open': 3398.04,
-        'high': 3398.33,
-        'low': 3395.96,
-        'close': 3397.14,
-        'volume': 754.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.11 01:00',
-        'open': 3397.07,
-        'high': 3405.13,
-        'low': 3390.69,
-        'close': 3394.81,
-        'volume': 2872.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.11 01:15',
-        'open': 3394.79,
-        'high': 3396.55,
-        'low': 3392.41,
-        'close': 3394.82,
-        'volume': 1513.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.11 01:30',
-        'open': 3394.76,
-        'high': 3394.76,
-        'low': 3392.51,
-        'close': 3393.7,
-        'volume': 1098.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.11 01:45',
-        'open': 3393.7,
-        'high': 3395.69,
-        'low': 3393.16,
-        'close': 3395.26,
-        'volume': 868.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.11 02:00',
-        'open': 3395.27,
-        'high': 3396.91,
-        'low': 3393.37,
-        'close': 3393.64,
-        'volume': 1173.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.11 02:15',
-        'open': 3393.68,
-        'high': 3395.79,
-        'low': 3392.61,
-        'close': 3394.63,
-        'volume': 781.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.11 02:30',
-        'open': 3394.63,
-        'high': 3395.0,
-        'low': 3393.41,
-        'close': 3394.0,
-        'volume': 784.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.11 02:45',
-        'open': 3393.98,
-        'high': 3394.37,
-        'low': 3390.29,
-        'close': 3391.51,
-        'volume': 1423.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.11 03:00',
-        'open': 3391.51,
-        'high': 3391.57,
-        'low': 3386.57,
-        'close': 3387.48,
-        'volume': 3166.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.11 03:15',
-        'open': 3387.47,
-        'high': 3390.2,
-        'low': 3386.32,
-        'close': 3387.99,
-        'volume': 2326.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.11 03:30',
-        'open': 3387.99,
-        'high': 3388.19,
-        'low': 3382.58,
-        'close': 3383.63,
-        'volume': 2904.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.11 03:45',
-        'open': 3383.64,
-        'high': 3384.61,
-        'low': 3381.57,
-        'close': 3381.59,
-        'volume': 2784.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.11 04:00',
-        'open': 3381.58,
-        'high': 3383.97,
-        'low': 3367.79,
-        'close': 3372.89,
-        'volume': 4937.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.11 04:15',
-        'open': 3372.88,
-        'high': 3376.09,
-        'low': 3371.68,
-        'close': 3375.22,
-        'volume': 3529.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.11 04:30',
-        'open': 3375.21,
-        'high': 3375.56,
-        'low': 3371.1,
-        'close': 3374.77,
-        'volume': 3052.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.11 04:45',
-        'open': 3374.75,
-        'high': 3379.94,
-        'low': 3373.79,
-        'close': 3377.45,
-        'volume': 3227.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.11 05:00',
-        'open': 3377.46,
-        'high': 3378.72,
-        'low': 3373.09,
-        'close': 3373.28,
-        'volume': 3245.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.11 05:15',
-        'open': 3373.31,
-        'high': 3377.37,
-        'low': 3369.64,
-        'close': 3377.28,
-        'volume': 2974.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.11 05:30',
-        'open': 3377.33,
-        'high': 3378.34,
-        'low': 3374.06,
-        'close': 3376.04,
-        'volume': 2784.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.11 05:45',
-        'open': 3376.05,
-        'high': 3379.9,
-        'low': 3376.05,
-        'close': 3377.2,
-        'volume': 2499.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.11 06:00',
-        'open': 3377.19,
-        'high': 3378.49,
-        'low': 3376.11,
-        'close': 3377.96,
-        'volume': 2169.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.11 06:15',
-        'open': 3377.97,
-        'high': 3379.68,
-        'low': 3377.82,
-        'close': 3378.46,
-        'volume': 2017.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.11 06:30',
-        'open': 3378.45,
-        'high': 3380.12,
-        'low': 3374.17,
-        'close': 3375.02,
-        'volume': 2225.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.11 06:45',
-        'open': 3375.03,
-        'high': 3378.72,
-        'low': 3374.63,
-        'close': 3378.22,
-        'volume': 1929.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.11 07:00',
-        'open': 3378.24,
-        'high': 3378.58,
-        'low': 3376.08,
-        'close': 3377.84,
-        'volume': 1863.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.11 07:15',
-        'open': 3377.86,
-        'high': 3379.69,
-        'low': 3376.82,
-        'close': 3377.68,
-        'volume': 1842.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.11 07:30',
-        'open': 3377.69,
-        'high': 3378.73,
-        'low': 3376.51,
-        'close': 3377.5,
-        'volume': 1580.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.11 07:45',
-        'open': 3377.49,
-        'high': 3377.74,
-        'low': 3375.56,
-        'close': 3375.86,
-        'volume': 1447.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.11 08:00',
-        'open': 3375.87,
-        'high': 3379.33,
-        'low': 3373.98,
-        'close': 3378.55,
-        'volume': 2363.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.11 08:15',
-        'open': 3378.55,
-        'high': 3380.04,
-        'low': 3377.2,
-        'close': 3377.2,
-        'volume': 2044.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.11 08:30',
-        'open': 3377.22,
-        'high': 3377.84,
-        'low': 3375.2,
-        'close': 3376.42,
-        'volume': 2228.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.11 08:45',
-        'open': 3376.44,
-        'high': 3378.78,
-        'low': 3376.31,
-        'close': 3377.18,
-        'volume': 1849.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.11 09:00',
-        'open': 3377.15,
-        'high': 3377.23,
-        'low': 3371.6,
-        'close': 3373.39,
-        'volume': 2942.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.11 09:15',
-        'open': 3373.39,
-        'high': 3373.99,
-        'low': 3366.41,
-        'close': 3366.54,
-        'volume': 2778.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.11 09:30',
-        'open': 3366.54,
-        'high': 3369.27,
-        'low': 3363.76,
-        'close': 3365.86,
-        'volume': 3548.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.11 09:45',
-        'open': 3365.85,
-        'high': 3368.79,
-        'low': 3364.13,
-        'close': 3365.84,
-        'volume': 2408.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.11 10:00',
-        'open': 3365.81,
-        'high': 3365.82,
-        'low': 3359.52,
-        'close': 3363.03,
-        'volume': 3532.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.11 10:15',
-        'open': 3363.0,
-        'high': 3366.37,
-        'low': 3362.8,
-        'close': 3365.38,
-        'volume': 2823.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.11 10:30',
-        'open': 3365.38,
-        'high': 3365.7,
-        'low': 3358.84,
-        'close': 3362.27,
-        'volume': 3588.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.11 10:45',
-        'open': 3362.26,
-        'high': 3362.39,
-        'low': 3357.26,
-        'close': 3360.12,
-        'volume': 4129.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.11 11:00',
-        'open': 3360.15,
-        'high': 3362.97,
-        'low': 3358.99,
-        'close': 3358.99,
-        'volume': 3196.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.11 11:15',
-        'open': 3358.98,
-        'high': 3365.8,
-        'low': 3358.79,
-        'close': 3364.94,
-        'volume': 3037.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.11 11:30',
-        'open': 3364.94,
-        'high': 3365.58,
-        'low': 3362.13,
-        'close': 3363.22,
-        'volume': 2158.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.11 11:45',
-        'open': 3363.23,
-        'high': 3364.35,
-        'low': 3361.41,
-        'close': 3361.9,
-        'volume': 2664.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.11 12:00',
-        'open': 3361.91,
-        'high': 3361.91,
-        'low': 3355.98,
-        'close': 3355.99,
-        'volume': 2612.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.11 12:15',
-        'open': 3355.98,
-        'high': 3363.62,
-        'low': 3354.28,
-        'close': 3363.47,
-        'volume': 2837.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.11 12:30',
-        'open': 3363.46,
-        'high': 3363.6,
-        'low': 3357.33,
-        'close': 3358.86,
-        'volume': 2868.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.11 12:45',
-        'open': 3358.86,
-        'high': 3359.19,
-        'low': 3352.99,
-        'close': 3353.32,
-        'volume': 2492.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.11 13:00',
-        'open': 3353.34,
-        'high': 3359.76,
-        'low': 3353.11,
-        'close': 3359.72,
-        'volume': 2481.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.11 13:15',
-        'open': 3359.73,
-        'high': 3363.77,
-        'low': 3359.36,
-        'close': 3360.92,
-        'volume': 2537.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.11 13:30',
-        'open': 3360.94,
-        'high': 3363.48,
-        'low': 3360.24,
-        'close': 3360.63,
-        'volume': 2220.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.11 13:45',
-        'open': 3360.64,
-        'high': 3360.89,
-        'low': 3358.23,
-        'close': 3358.43,
-        'volume': 2012.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.11 14:00',
-        'open': 3358.44,
-        'high': 3358.82,
-        'low': 3353.43,
-        'close': 3354.4,
-        'volume': 2779.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.11 14:15',
-        'open': 3354.4,
-        'high': 3355.79,
-        'low': 3350.09,
-        'close': 3352.1,
-        'volume': 3098.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.11 14:30',
-        'open': 3352.09,
-        'high': 3353.66,
-        'low': 3349.82,
-        'close': 3353.66,
-        'volume': 3424.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.11 14:45',
-        'open': 3353.68,
-        'high': 3355.31,
-        'low': 3351.26,
-        'close': 3355.2,
-        'volume': 2719.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.11 15:00',
-        'open': 3355.17,
-        'high': 3356.92,
-        'low': 3353.25,
-        'close': 3353.65,
-        'volume': 2496.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.11 15:15',
-        'open': 3353.65,
-        'high': 3356.59,
-        'low': 3347.33,
-        'close': 3349.06,
-        'volume': 3491.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.11 15:30',
-        'open': 3349.06,
-        'high': 3355.28,
-        'low': 3344.42,
-        'close': 3354.94,
-        'volume': 4671.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.11 15:45',
-        'open': 3354.93,
-        'high': 3357.55,
-        'low': 3352.9,
-        'close': 3356.84,
-        'volume': 2989.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.11 16:00',
-        'open': 3356.84,
-        'high': 3358.73,
-        'low': 3348.69,
-        'close': 3350.03,
-        'volume': 3822.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.11 16:15',
-        'open': 3350.02,
-        'high': 3352.61,
-        'low': 3348.27,
-        'close': 3350.46,
-        'volume': 3237.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.11 16:30',
-        'open': 3350.47,
-        'high': 3358.4,
-        'low': 3349.57,
-        'close': 3357.88,
-        'volume': 4625.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.11 16:45',
-        'open': 3357.9,
-        'high': 3362.79,
-        'low': 3357.9,
-        'close': 3358.55,
-        'volume': 3894.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.11 17:00',
-        'open': 3358.55,
-        'high': 3359.29,
-        'low': 3354.86,
-        'close': 3358.56,
-        'volume': 4019.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.11 17:15',
-        'open': 3358.55,
-        'high': 3359.24,
-        'low': 3351.86,
-        'close': 3352.01,
-        'volume': 3458.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.11 17:30',
-        'open': 3351.99,
-        'high': 3352.58,
-        'low': 3341.42,
-        'close': 3346.64,
-        'volume': 4262.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.11 17:45',
-        'open': 3346.66,
-        'high': 3348.95,
-        'low': 3344.82,
-        'close': 3346.27,
-        'volume': 2816.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.11 18:00',
-        'open': 3346.28,
-        'high': 3348.93,
-        'low': 3344.91,
-        'close': 3346.23,
-        'volume': 2685.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.11 18:15',
-        'open': 3346.23,
-        'high': 3350.17,
-        'low': 3346.01,
-        'close': 3349.87,
-        'volume': 2152.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.11 18:30',
-        'open': 3349.83,
-        'high': 3352.22,
-        'low': 3348.03,
-        'close': 3349.24,
-        'volume': 2185.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.11 18:45',
-        'open': 3349.25,
-        'high': 3349.74,
-        'low': 3347.69,
-        'close': 3349.35,
-        'volume': 2415.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.11 19:00',
-        'open': 3349.36,
-        'high': 3350.25,
-        'low': 3345.35,
-        'close': 3347.42,
-        'volume': 2739.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.11 19:15',
-        'open': 3347.45,
-        'high': 3349.44,
-        'low': 3346.38,
-        'close': 3346.47,
-        'volume': 1840.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.11 19:30',
-        'open': 3346.47,
-        'high': 3347.06,
-        'low': 3342.81,
-        'close': 3344.3,
-        'volume': 2089.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.11 19:45',
-        'open': 3344.32,
-        'high': 3344.65,
-        'low': 3342.51,
-        'close': 3344.12,
-        'volume': 1961.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.11 20:00',
-        'open': 3344.14,
-        'high': 3344.52,
-        'low': 3342.2,
-        'close': 3343.13,
-        'volume': 1702.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.11 20:15',
-        'open': 3343.12,
-        'high': 3345.65,
-        'low': 3341.99,
-        'close': 3345.31,
-        'volume': 1921.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.11 20:30',
-        'open': 3345.36,
-        'high': 3358.71,
-        'low': 3341.34,
-        'close': 3358.39,
-        'volume': 6221.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.11 20:45',
-        'open': 3358.4,
-        'high': 3358.81,
-        'low': 3355.09,
-        'close': 3357.58,
-        'volume': 3232.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.11 21:00',
-        'open': 3357.58,
-        'high': 3358.61,
-        'low': 3353.83,
-        'close': 3354.18,
-        'volume': 2527.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.11 21:15',
-        'open': 3354.17,
-        'high': 3356.1,
-        'low': 3352.26,
-        'close': 3355.11,
-        'volume': 2240.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.11 21:30',
-        'open': 3355.12,
-        'high': 3356.9,
-        'low': 3354.0,
-        'close': 3355.87,
-        'volume': 1715.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.11 21:45',
-        'open': 3355.88,
-        'high': 3356.52,
-        'low': 3354.18,
-        'close': 3356.15,
-        'volume': 1401.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.11 22:00',
-        'open': 3356.15,
-        'high': 3356.79,
-        'low': 3352.78,
-        'close': 3353.21,
-        'volume': 1210.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.11 22:15',
-        'open': 3353.21,
-        'high': 3353.72,
-        'low': 3351.72,
-        'close': 3352.9,
-        'volume': 1007.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.11 22:30',
-        'open': 3352.89,
-        'high': 3354.05,
-        'low': 3352.1,
-        'close': 3353.94,
-        'volume': 1284.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.11 22:45',
-        'open': 3353.94,
-        'high': 3354.32,
-        'low': 3350.53,
-        'close': 3351.6,
-        'volume': 2092.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.11 23:00',
-        'open': 3351.59,
-        'high': 3351.75,
-        'low': 3350.14,
-        'close': 3350.32,
-        'volume': 1064.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.11 23:15',
-        'open': 3350.32,
-        'high': 3351.3,
-        'low': 3349.34,
-        'close': 3349.37,
-        'volume': 902.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.11 23:30',
-        'open': 3349.37,
-        'high': 3349.81,
-        'low': 3346.55,
-        'close': 3346.95,
-        'volume': 1427.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.11 23:45',
-        'open': 3346.96,
-        'high': 3347.33,
-        'low': 3342.13,
-        'close': 3342.25,
-        'volume': 1276.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.12 01:00',
-        'open': 3343.75,
-        'high': 3346.54,
-        'low': 3340.97,
-        'close': 3346.12,
-        'volume': 1056.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.12 01:15',
-        'open': 3346.13,
-        'high': 3346.16,
-        'low': 3344.13,
-        'close': 3344.7,
-        'volume': 775.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.12 01:30',
-        'open': 3344.67,
-        'high': 3345.18,
-        'low': 3342.8,
-        'close': 3343.24,
-        'volume': 746.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.12 01:45',
-        'open': 3343.22,
-        'high': 3347.06,
-        'low': 3343.17,
-        'close': 3346.88,
-        'volume': 821.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.12 02:00',
-        'open': 3346.91,
-        'high': 3347.78,
-        'low': 3346.22,
-        'close': 3347.57,
-        'volume': 862.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.12 02:15',
-        'open': 3347.57,
-        'high': 3349.45,
-        'low': 3346.86,
-        'close': 3346.86,
-        'volume': 874.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.12 02:30',
-        'open': 3346.85,
-        'high': 3349.1,
-        'low': 3346.62,
-        'close': 3347.74,
-        'volume': 804.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.12 02:45',
-        'open': 3347.75,
-        'high': 3349.52,
-        'low': 3347.75,
-        'close': 3348.95,
-        'volume': 639.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.12 03:00',
-        'open': 3348.95,
-        'high': 3351.35,
-        'low': 3347.36,
-        'close': 3351.34,
-        'volume': 1498.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.12 03:15',
-        'open': 3351.34,
-        'high': 3353.24,
-        'low': 3350.16,
-        'close': 3350.68,
-        'volume': 1660.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.12 03:30',
-        'open': 3350.67,
-        'high': 3354.94,
-        'low': 3350.36,
-        'close': 3354.74,
-        'volume': 1483.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.12 03:45',
-        'open': 3354.75,
-        'high': 3355.69,
-        'low': 3354.17,
-        'close': 3354.46,
-        'volume': 1362.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.12 04:00',
-        'open': 3354.47,
-        'high': 3357.36,
-        'low': 3352.87,
-        'close': 3356.5,
-        'volume': 2239.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.12 04:15',
-        'open': 3356.46,
-        'high': 3357.36,
-        'low': 3349.9,
-        'close': 3351.1,
-        'volume': 1959.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.12 04:30',
-        'open': 3351.11,
-        'high': 3351.63,
-        'low': 3346.22,
-        'close': 3350.08,
-        'volume': 2728.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.12 04:45',
-        'open': 3350.07,
-        'high': 3352.45,
-        'low': 3348.9,
-        'close': 3349.77,
-        'volume': 2175.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.12 05:00',
-        'open': 3349.78,
-        'high': 3352.63,
-        'low': 3349.71,
-        'close': 3351.05,
-        'volume': 1453.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.12 05:15',
-        'open': 3351.05,
-        'high': 3352.93,
-        'low': 3350.25,
-        'close': 3352.33,
-        'volume': 1476.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.12 05:30',
-        'open': 3352.32,
-        'high': 3354.21,
-        'low': 3350.22,
-        'close': 3350.63,
-        'volume': 1527.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.12 05:45',
-        'open': 3350.61,
-        'high': 3353.5,
-        'low': 3350.13,
-        'close': 3353.03,
-        'volume': 1688.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.12 06:00',
-        'open': 3353.04,
-        'high': 3355.32,
-        'low': 3353.04,
-        'close': 3354.77,
-        'volume': 1245.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.12 06:15',
-        'open': 3354.79,
-        'high': 3354.86,
-        'low': 3351.07,
-        'close': 3351.26,
-        'volume': 1511.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.12 06:30',
-        'open': 3351.26,
-        'high': 3351.64,
-        'low': 3349.4,
-        'close': 3350.21,
-        'volume': 1282.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.12 06:45',
-        'open': 3350.21,
-        'high': 3350.87,
-        'low': 3347.75,
-        'close': 3349.43,
-        'volume': 1228.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.12 07:00',
-        'open': 3349.42,
-        'high': 3352.31,
-        'low': 3348.6,
-        'close': 3351.2,
-        'volume': 1107.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.12 07:15',
-        'open': 3351.22,
-        'high': 3353.04,
-        'low': 3351.13,
-        'close': 3351.99,
-        'volume': 1096.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.12 07:30',
-        'open': 3351.98,
-        'high': 3354.18,
-        'low': 3349.67,
-        'close': 3354.15,
-        'volume': 1615.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.12 07:45',
-        'open': 3354.18,
-        'high': 3355.72,
-        'low': 3353.06,
-        'close': 3354.37,
-        'volume': 1330.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.12 08:00',
-        'open': 3354.38,
-        'high': 3354.9,
-        'low': 3353.01,
-        'close': 3353.68,
-        'volume': 1300.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.12 08:15',
-        'open': 3353.69,
-        'high': 3354.73,
-        'low': 3352.97,
-        'close': 3353.15,
-        'volume': 1238.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.12 08:30',
-        'open': 3353.15,
-        'high': 3354.19,
-        'low': 3352.29,
-        'close': 3352.54,
-        'volume': 1463.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.12 08:45',
-        'open': 3352.52,
-        'high': 3355.67,
-        'low': 3350.51,
-        'close': 3354.56,
-        'volume': 1672.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.12 09:00',
-        'open': 3354.58,
-        'high': 3354.89,
-        'low': 3346.95,
-        'close': 3348.49,
-        'volume': 2552.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.12 09:15',
-        'open': 3348.51,
-        'high': 3348.52,
-        'low': 3342.29,
-        'close': 3344.91,
-        'volume': 3075.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.12 09:30',
-        'open': 3344.91,
-        'high': 3348.93,
-        'low': 3342.31,
-        'close': 3348.79,
-        'volume': 2211.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.12 09:45',
-        'open': 3348.79,
-        'high': 3348.86,
-        'low': 3343.69,
-        'close': 3345.33,
-        'volume': 2069.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.12 10:00',
-        'open': 3345.35,
-        'high': 3347.98,
-        'low': 3343.77,
-        'close': 3344.87,
-        'volume': 1851.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.12 10:15',
-        'open': 3344.87,
-        'high': 3349.08,
-        'low': 3344.8,
-        'close': 3349.04,
-        'volume': 1447.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.12 10:30',
-        'open': 3349.06,
-        'high': 3358.1,
-        'low': 3348.34,
-        'close': 3355.46,
-        'volume': 2661.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.12 10:45',
-        'open': 3355.46,
-        'high': 3357.22,
-        'low': 3352.54,
-        'close': 3355.6,
-        'volume': 2157.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.12 11:00',
-        'open': 3355.59,
-        'high': 3355.8,
-        'low': 3351.39,
-        'close': 3353.01,
-        'volume': 1748.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.12 11:15',
-        'open': 3353.0,
-        'high': 3353.64,
-        'low': 3348.58,
-        'close': 3349.66,
-        'volume': 1670.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.12 11:30',
-        'open': 3349.65,
-        'high': 3350.88,
-        'low': 3345.95,
-        'close': 3347.04,
-        'volume': 1766.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.12 11:45',
-        'open': 3347.05,
-        'high': 3349.22,
-        'low': 3345.56,
-        'close': 3347.89,
-        'volume': 1577.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.12 12:00',
-        'open': 3347.89,
-        'high': 3351.76,
-        'low': 3346.84,
-        'close': 3350.94,
-        'volume': 1642.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.12 12:15',
-        'open': 3350.93,
-        'high': 3351.33,
-        'low': 3348.27,
-        'close': 3348.43,
-        'volume': 1018.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.12 12:30',
-        'open': 3348.4,
-        'high': 3349.1,
-        'low': 3347.33,
-        'close': 3348.14,
-        'volume': 1025.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.12 12:45',
-        'open': 3348.13,
-        'high': 3348.49,
-        'low': 3344.45,
-        'close': 3345.58,
-        'volume': 1439.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.12 13:00',
-        'open': 3345.57,
-        'high': 3348.64,
-        'low': 3344.11,
-        'close': 3348.47,
-        'volume': 1861.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.12 13:15',
-        'open': 3348.46,
-        'high': 3350.46,
-        'low': 3347.1,
-        'close': 3349.35,
-        'volume': 1764.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.12 13:30',
-        'open': 3349.32,
-        'high': 3350.08,
-        'low': 3345.06,
-        'close': 3345.06,
-        'volume': 1465.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.12 13:45',
-        'open': 3345.07,
-        'high': 3346.75,
-        'low': 3343.95,
-        'close': 3344.73,
-        'volume': 1698.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.12 14:00',
-        'open': 3344.74,
-        'high': 3345.14,
-        'low': 3341.98,
-        'close': 3343.7,
-        'volume': 1855.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.12 14:15',
-        'open': 3343.71,
-        'high': 3343.81,
-        'low': 3339.51,
-        'close': 3343.06,
-        'volume': 1816.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.12 14:30',
-        'open': 3343.06,
-        'high': 3346.33,
-        'low': 3336.04,
-        'close': 3346.33,
-        'volume': 2785.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.12 14:45',
-        'open': 3346.36,
-        'high': 3348.28,
-        'low': 3344.65,
-        'close': 3347.44,
-        'volume': 1715.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.12 15:00',
-        'open': 3347.43,
-        'high': 3348.33,
-        'low': 3343.8,
-        'close': 3344.19,
-        'volume': 2033.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.12 15:15',
-        'open': 3344.16,
-        'high': 3344.59,
-        'low': 3338.59,
-        'close': 3339.92,
-        'volume': 2872.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.12 15:30',
-        'open': 3339.89,
-        'high': 3354.59,
-        'low': 3339.84,
-        'close': 3349.47,
-        'volume': 7416.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.12 15:45',
-        'open': 3349.5,
-        'high': 3358.02,
-        'low': 3347.92,
-        'close': 3349.87,
-        'volume': 5260.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.12 16:00',
-        'open': 3349.86,
-        'high': 3354.24,
-        'low': 3342.6,
-        'close': 3344.1,
-        'volume': 5011.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.12 16:15',
-        'open': 3344.11,
-        'high': 3350.09,
-        'low': 3343.78,
-        'close': 3347.51,
-        'volume': 4141.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.12 16:30',
-        'open': 3347.51,
-        'high': 3355.89,
-        'low': 3340.1,
-        'close': 3354.87,
-        'volume': 5232.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.12 16:45',
-        'open': 3354.78,
-        'high': 3357.03,
-        'low': 3343.62,
-        'close': 3345.56,
-        'volume': 7201.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.12 17:00',
-        'open': 3345.57,
-        'high': 3346.53,
-        'low': 3335.77,
-        'close': 3335.83,
-        'volume': 5381.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.12 17:15',
-        'open': 3335.86,
-        'high': 3337.41,
-        'low': 3331.1,
-        'close': 3335.0,
-        'volume': 5535.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.12 17:30',
-        'open': 3335.0,
-        'high': 3338.84,
-        'low': 3333.32,
-        'close': 3336.08,
-        'volume': 3622.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.12 17:45',
-        'open': 3336.08,
-        'high': 3338.36,
-        'low': 3332.4,
-        'close': 3337.37,
-        'volume': 3897.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.12 18:00',
-        'open': 3337.38,
-        'high': 3344.74,
-        'low': 3336.85,
-        'close': 3343.03,
-        'volume': 3602.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.12 18:15',
-        'open': 3343.02,
-        'high': 3359.05,
-        'low': 3341.8,
-        'close': 3354.76,
-        'volume': 4593.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.12 18:30',
-        'open': 3354.81,
-        'high': 3358.25,
-        'low': 3349.81,
-        'close': 3353.2,
-        'volume': 4789.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.12 18:45',
-        'open': 3353.23,
-        'high': 3354.27,
-        'low': 3349.0,
-        'close': 3349.8,
-        'volume': 3264.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.12 19:00',
-        'open': 3349.8,
-        'high': 3350.52,
-        'low': 3346.67,
-        'close': 3347.0,
-        'volume': 2958.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.12 19:15',
-        'open': 3346.99,
-        'high': 3349.23,
-        'low': 3345.86,
-        'close': 3349.0,
-        'volume': 2624.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.12 19:30',
-        'open': 3349.0,
-        'high': 3351.19,
-        'low': 3347.24,
-        'close': 3348.95,
-        'volume': 2652.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.12 19:45',
-        'open': 3348.96,
-        'high': 3349.91,
-        'low': 3347.14,
-        'close': 3349.44,
-        'volume': 1950.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.12 20:00',
-        'open': 3349.44,
-        'high': 3349.83,
-        'low': 3347.95,
-        'close': 3349.83,
-        'volume': 1942.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.12 20:15',
-        'open': 3349.84,
-        'high': 3350.53,
-        'low': 3347.34,
-        'close': 3348.08,
-        'volume': 2248.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.12 20:30',
-        'open': 3348.08,
-        'high': 3349.87,
-        'low': 3347.77,
-        'close': 3348.35,
-        'volume': 1702.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.12 20:45',
-        'open': 3348.36,
-        'high': 3349.04,
-        'low': 3346.42,
-        'close': 3349.04,
-        'volume': 1503.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.12 21:00',
-        'open': 3349.04,
-        'high': 3350.77,
-        'low': 3348.42,
-        'close': 3349.01,
-        'volume': 1440.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.12 21:15',
-        'open': 3349.01,
-        'high': 3350.49,
-        'low': 3347.97,
-        'close': 3349.0,
-        'volume': 1522.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.12 21:30',
-        'open': 3349.0,
-        'high': 3349.58,
-        'low': 3347.48,
-        'close': 3348.57,
-        'volume': 1232.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.12 21:45',
-        'open': 3348.57,
-        'high': 3349.63,
-        'low': 3348.18,
-        'close': 3348.99,
-        'volume': 1285.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.12 22:00',
-        'open': 3348.98,
-        'high': 3349.32,
-        'low': 3345.57,
-        'close': 3346.55,
-        'volume': 1346.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.12 22:15',
-        'open': 3346.56,
-        'high': 3348.36,
-        'low': 3345.87,
-        'close': 3348.17,
-        'volume': 1202.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.12 22:30',
-        'open': 3348.16,
-        'high': 3349.26,
-        'low': 3347.5,
-        'close': 3347.92,
-        'volume': 1706.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.12 22:45',
-        'open': 3347.92,
-        'high': 3348.52,
-        'low': 3346.79,
-        'close': 3347.62,
-        'volume': 1477.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.12 23:00',
-        'open': 3347.62,
-        'high': 3347.78,
-        'low': 3346.03,
-        'close': 3346.76,
-        'volume': 1022.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.12 23:15',
-        'open': 3346.75,
-        'high': 3348.36,
-        'low': 3346.64,
-        'close': 3348.04,
-        'volume': 732.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.12 23:30',
-        'open': 3348.03,
-        'high': 3349.33,
-        'low': 3347.35,
-        'close': 3349.3,
-        'volume': 720.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.12 23:45',
-        'open': 3349.29,
-        'high': 3349.97,
-        'low': 3348.0,
-        'close': 3348.27,
-        'volume': 495.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.13 01:00',
-        'open': 3346.97,
-        'high': 3351.58,
-        'low': 3346.97,
-        'close': 3351.34,
-        'volume': 820.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.13 01:15',
-        'open': 3351.36,
-        'high': 3353.69,
-        'low': 3351.16,
-        'close': 3351.84,
-        'volume': 702.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.13 01:30',
-        'open': 3351.85,
-        'high': 3352.04,
-        'low': 3350.39,
-        'close': 3350.39,
-        'volume': 595.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.13 01:45',
-        'open': 3350.35,
-        'high': 3351.18,
-        'low': 3349.82,
-        'close': 3350.39,
-        'volume': 556.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.13 02:00',
-        'open': 3350.41,
-        'high': 3351.62,
-        'low': 3350.0,
-        'close': 3351.22,
-        'volume': 655.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.13 02:15',
-        'open': 3351.21,
-        'high': 3352.01,
-        'low': 3350.98,
-        'close': 3351.41,
-        'volume': 445.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.13 02:30',
-        'open': 3351.42,
-        'high': 3352.01,
-        'low': 3350.89,
-        'close': 3351.3,
-        'volume': 707.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.13 02:45',
-        'open': 3351.31,
-        'high': 3351.31,
-        'low': 3349.71,
-        'close': 3350.54,
-        'volume': 608.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.13 03:00',
-        'open': 3350.54,
-        'high': 3350.71,
-        'low': 3346.07,
-        'close': 3347.8,
-        'volume': 1525.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.13 03:15',
-        'open': 3347.79,
-        'high': 3347.79,
-        'low': 3343.68,
-        'close': 3346.56,
-        'volume': 1662.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.13 03:30',
-        'open': 3346.58,
-        'high': 3346.96,
-        'low': 3344.64,
-        'close': 3345.49,
-        'volume': 1243.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.13 03:45',
-        'open': 3345.47,
-        'high': 3345.94,
-        'low': 3342.71,
-        'close': 3343.53,
-        'volume': 1375.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.13 04:00',
-        'open': 3343.54,
-        'high': 3348.69,
-        'low': 3343.37,
-        'close': 3348.47,
-        'volume': 2018.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.13 04:15',
-        'open': 3348.46,
-        'high': 3349.2,
-        'low': 3342.87,
-        'close': 3345.72,
-        'volume': 2230.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.13 04:30',
-        'open': 3345.71,
-        'high': 3349.88,
-        'low': 3345.38,
-        'close': 3349.6,
-        'volume': 2088.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.13 04:45',
-        'open': 3349.59,
-        'high': 3351.98,
-        'low': 3349.25,
-        'close': 3350.82,
-        'volume': 1940.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.13 05:00',
-        'open': 3350.83,
-        'high': 3351.53,
-        'low': 3346.65,
-        'close': 3346.92,
-        'volume': 1950.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.13 05:15',
-        'open': 3346.93,
-        'high': 3351.85,
-        'low': 3346.77,
-        'close': 3351.85,
-        'volume': 1667.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.13 05:30',
-        'open': 3351.85,
-        'high': 3353.38,
-        'low': 3349.55,
-        'close': 3352.9,
-        'volume': 1566.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.13 05:45',
-        'open': 3352.92,
-        'high': 3354.34,
-        'low': 3351.16,
-        'close': 3351.75,
-        'volume': 1617.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.13 06:00',
-        'open': 3351.75,
-        'high': 3352.03,
-        'low': 3349.53,
-        'close': 3350.98,
-        'volume': 1501.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.13 06:15',
-        'open': 3350.97,
-        'high': 3352.96,
-        'low': 3348.6,
-        'close': 3351.38,
-        'volume': 1727.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.13 06:30',
-        'open': 3351.38,
-        'high': 3351.54,
-        'low': 3349.43,
-        'close': 3351.15,
-        'volume': 983.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.13 06:45',
-        'open': 3351.16,
-        'high': 3351.38,
-        'low': 3349.16,
-        'close': 3349.53,
-        'volume': 981.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.13 07:00',
-        'open': 3349.55,
-        'high': 3352.27,
-        'low': 3348.17,
-        'close': 3351.73,
-        'volume': 1190.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.13 07:15',
-        'open': 3351.73,
-        'high': 3352.3,
-        'low': 3350.22,
-        'close': 3350.62,
-        'volume': 814.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.13 07:30',
-        'open': 3350.62,
-        'high': 3350.92,
-        'low': 3349.31,
-        'close': 3350.35,
-        'volume': 675.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.13 07:45',
-        'open': 3350.34,
-        'high': 3351.83,
-        'low': 3349.97,
-        'close': 3351.83,
-        'volume': 707.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.13 08:00',
-        'open': 3351.82,
-        'high': 3352.06,
-        'low': 3348.58,
-        'close': 3350.14,
-        'volume': 1035.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.13 08:15',
-        'open': 3350.13,
-        'high': 3351.22,
-        'low': 3349.03,
-        'close': 3350.91,
-        'volume': 916.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.13 08:30',
-        'open': 3350.91,
-        'high': 3351.13,
-        'low': 3345.92,
-        'close': 3345.96,
-        'volume': 2174.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.13 08:45',
-        'open': 3345.98,
-        'high': 3349.43,
-        'low': 3345.71,
-        'close': 3349.21,
-        'volume': 1453.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.13 09:00',
-        'open': 3349.24,
-        'high': 3354.25,
-        'low': 3348.93,
-        'close': 3353.49,
-        'volume': 2243.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.13 09:15',
-        'open': 3353.49,
-        'high': 3356.52,
-        'low': 3353.49,
-        'close': 3355.06,
-        'volume': 2257.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.13 09:30',
-        'open': 3355.07,
-        'high': 3356.49,
-        'low': 3353.72,
-        'close': 3354.81,
-        'volume': 1913.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.13 09:45',
-        'open': 3354.79,
-        'high': 3357.5,
-        'low': 3354.79,
-        'close': 3357.08,
-        'volume': 1716.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.13 10:00',
-        'open': 3357.09,
-        'high': 3359.2,
-        'low': 3353.87,
-        'close': 3358.07,
-        'volume': 1903.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.13 10:15',
-        'open': 3358.08,
-        'high': 3360.75,
-        'low': 3356.2,
-        'close': 3359.19,
-        'volume': 1684.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.13 10:30',
-        'open': 3359.19,
-        'high': 3360.92,
-        'low': 3356.48,
-        'close': 3356.9,
-        'volume': 1539.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.13 10:45',
-        'open': 3356.9,
-        'high': 3358.7,
-        'low': 3354.5,
-        'close': 3354.64,
-        'volume': 1689.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.13 11:00',
-        'open': 3354.65,
-        'high': 3355.78,
-        'low': 3352.84,
-        'close': 3353.85,
-        'volume': 2121.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.13 11:15',
-        'open': 3353.84,
-        'high': 3355.76,
-        'low': 3352.89,
-        'close': 3353.87,
-        'volume': 1881.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.13 11:30',
-        'open': 3353.86,
-        'high': 3360.18,
-        'low': 3353.56,
-        'close': 3359.91,
-        'volume': 1821.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.13 11:45',
-        'open': 3359.91,
-        'high': 3363.39,
-        'low': 3358.6,
-        'close': 3360.2,
-        'volume': 2057.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.13 12:00',
-        'open': 3360.2,
-        'high': 3360.86,
-        'low': 3358.63,
-        'close': 3359.25,
-        'volume': 1308.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.13 12:15',
-        'open': 3359.25,
-        'high': 3363.37,
-        'low': 3358.84,
-        'close': 3362.03,
-        'volume': 1306.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.13 12:30',
-        'open': 3362.03,
-        'high': 3366.19,
-        'low': 3361.78,
-        'close': 3365.24,
-        'volume': 2134.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.13 12:45',
-        'open': 3365.26,
-        'high': 3366.65,
-        'low': 3363.93,
-        'close': 3364.53,
-        'volume': 1887.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.13 13:00',
-        'open': 3364.55,
-        'high': 3366.18,
-        'low': 3363.06,
-        'close': 3363.97,
-        'volume': 1364.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.13 13:15',
-        'open': 3363.97,
-        'high': 3365.86,
-        'low': 3363.58,
-        'close': 3364.02,
-        'volume': 1033.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.13 13:30',
-        'open': 3364.04,
-        'high': 3366.7,
-        'low': 3364.04,
-        'close': 3365.56,
-        'volume': 1217.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.13 13:45',
-        'open': 3365.54,
-        'high': 3366.96,
-        'low': 3363.79,
-        'close': 3366.04,
-        'volume': 1255.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.13 14:00',
-        'open': 3366.04,
-        'high': 3367.05,
-        'low': 3361.18,
-        'close': 3362.7,
-        'volume': 1606.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.13 14:15',
-        'open': 3362.72,
-        'high': 3363.09,
-        'low': 3359.45,
-        'close': 3360.12,
-        'volume': 1997.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.13 14:30',
-        'open': 3360.13,
-        'high': 3362.2,
-        'low': 3358.96,
-        'close': 3358.96,
-        'volume': 2094.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.13 14:45',
-        'open': 3358.96,
-        'high': 3362.4,
-        'low': 3358.82,
-        'close': 3362.3,
-        'volume': 1442.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.13 15:00',
-        'open': 3362.32,
-        'high': 3363.71,
-        'low': 3356.39,
-        'close': 3357.29,
-        'volume': 2439.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.13 15:15',
-        'open': 3357.31,
-        'high': 3361.83,
-        'low': 3356.5,
-        'close': 3358.69,
-        'volume': 2207.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.13 15:30',
-        'open': 3358.69,
-        'high': 3360.02,
-        'low': 3355.52,
-        'close': 3358.49,
-        'volume': 2895.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.13 15:45',
-        'open': 3358.48,
-        'high': 3360.92,
-        'low': 3357.45,
-        'close': 3358.09,
-        'volume': 1954.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.13 16:00',
-        'open': 3358.08,
-        'high': 3358.26,
-        'low': 3354.49,
-        'close': 3357.58,
-        'volume': 2699.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.13 16:15',
-        'open': 3357.57,
-        'high': 3358.35,
-        'low': 3354.16,
-        'close': 3357.26,
-        'volume': 2126.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.13 16:30',
-        'open': 3357.25,
-        'high': 3362.44,
-        'low': 3356.38,
-        'close': 3362.26,
-        'volume': 3039.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.13 16:45',
-        'open': 3362.29,
-        'high': 3365.86,
-        'low': 3360.05,
-        'close': 3365.08,
-        'volume': 3199.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.13 17:00',
-        'open': 3365.08,
-        'high': 3370.75,
-        'low': 3363.17,
-        'close': 3366.73,
-        'volume': 3883.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.13 17:15',
-        'open': 3366.74,
-        'high': 3367.31,
-        'low': 3363.41,
-        'close': 3365.05,
-        'volume': 2556.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.13 17:30',
-        'open': 3365.07,
-        'high': 3366.71,
-        'low': 3363.32,
-        'close': 3364.08,
-        'volume': 2262.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.13 17:45',
-        'open': 3364.08,
-        'high': 3364.22,
-        'low': 3361.05,
-        'close': 3363.13,
-        'volume': 2322.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.13 18:00',
-        'open': 3363.13,
-        'high': 3363.68,
-        'low': 3358.06,
-        'close': 3358.3,
-        'volume': 2378.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.13 18:15',
-        'open': 3358.3,
-        'high': 3358.35,
-        'low': 3355.67,
-        'close': 3355.87,
-        'volume': 2371.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.13 18:30',
-        'open': 3355.87,
-        'high': 3357.34,
-        'low': 3354.37,
-        'close': 3355.27,
-        'volume': 1969.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.13 18:45',
-        'open': 3355.27,
-        'high': 3357.75,
-        'low': 3354.96,
-        'close': 3357.75,
-        'volume': 1520.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.13 19:00',
-        'open': 3357.75,
-        'high': 3359.48,
-        'low': 3357.15,
-        'close': 3359.17,
-        'volume': 1376.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.13 19:15',
-        'open': 3359.18,
-        'high': 3360.37,
-        'low': 3358.85,
-        'close': 3359.65,
-        'volume': 1289.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.13 19:30',
-        'open': 3359.65,
-        'high': 3360.89,
-        'low': 3357.08,
-        'close': 3357.34,
-        'volume': 1208.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.13 19:45',
-        'open': 3357.33,
-        'high': 3359.63,
-        'low': 3357.33,
-        'close': 3357.89,
-        'volume': 972.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.13 20:00',
-        'open': 3357.89,
-        'high': 3358.89,
-        'low': 3357.23,
-        'close': 3358.46,
-        'volume': 859.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.13 20:15',
-        'open': 3358.46,
-        'high': 3359.34,
-        'low': 3356.96,
-        'close': 3357.55,
-        'volume': 1222.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.13 20:30',
-        'open': 3357.54,
-        'high': 3357.84,
-        'low': 3353.27,
-        'close': 3354.51,
-        'volume': 1174.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.13 20:45',
-        'open': 3354.5,
-        'high': 3355.27,
-        'low': 3352.73,
-        'close': 3353.67,
-        'volume': 1070.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.13 21:00',
-        'open': 3353.66,
-        'high': 3354.4,
-        'low': 3351.36,
-        'close': 3353.06,
-        'volume': 1158.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.13 21:15',
-        'open': 3353.06,
-        'high': 3353.24,
-        'low': 3349.98,
-        'close': 3350.99,
-        'volume': 1183.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.13 21:30',
-        'open': 3350.99,
-        'high': 3353.33,
-        'low': 3350.95,
-        'close': 3352.53,
-        'volume': 926.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.13 21:45',
-        'open': 3352.55,
-        'high': 3354.37,
-        'low': 3352.55,
-        'close': 3353.73,
-        'volume': 871.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.13 22:00',
-        'open': 3353.71,
-        'high': 3354.12,
-        'low': 3352.58,
-        'close': 3353.83,
-        'volume': 633.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.13 22:15',
-        'open': 3353.84,
-        'high': 3356.83,
-        'low': 3353.65,
-        'close': 3355.52,
-        'volume': 740.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.13 22:30',
-        'open': 3355.52,
-        'high': 3356.15,
-        'low': 3354.68,
-        'close': 3355.75,
-        'volume': 900.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.13 22:45',
-        'open': 3355.75,
-        'high': 3358.76,
-        'low': 3355.61,
-        'close': 3357.79,
-        'volume': 1297.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.13 23:00',
-        'open': 3357.8,
-        'high': 3358.18,
-        'low': 3356.4,
-        'close': 3357.61,
-        'volume': 697.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.13 23:15',
-        'open': 3357.62,
-        'high': 3358.03,
-        'low': 3356.63,
-        'close': 3356.98,
-        'volume': 514.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.13 23:30',
-        'open': 3357.0,
-        'high': 3357.0,
-        'low': 3355.65,
-        'close': 3356.17,
-        'volume': 389.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.13 23:45',
-        'open': 3356.18,
-        'high': 3356.39,
-        'low': 3355.83,
-        'close': 3355.9,
-        'volume': 299.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.14 01:00',
-        'open': 3356.03,
-        'high': 3358.95,
-        'low': 3355.99,
-        'close': 3356.82,
-        'volume': 764.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.14 01:15',
-        'open': 3356.84,
-        'high': 3358.03,
-        'low': 3356.84,
-        'close': 3357.06,
-        'volume': 380.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.14 01:30',
-        'open': 3357.06,
-        'high': 3358.48,
-        'low': 3356.66,
-        'close': 3357.65,
-        'volume': 586.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.14 01:45',
-        'open': 3357.63,
-        'high': 3358.26,
-        'low': 3357.41,
-        'close': 3357.6,
-        'volume': 376.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.14 02:00',
-        'open': 3357.58,
-        'high': 3361.29,
-        'low': 3357.56,
-        'close': 3360.14,
-        'volume': 1014.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.14 02:15',
-        'open': 3360.16,
-        'high': 3361.43,
-        'low': 3359.85,
-        'close': 3360.98,
-        'volume': 691.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.14 02:30',
-        'open': 3360.98,
-        'high': 3363.1,
-        'low': 3360.78,
-        'close': 3362.79,
-        'volume': 1019.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.14 02:45',
-        'open': 3362.8,
-        'high': 3363.35,
-        'low': 3361.51,
-        'close': 3362.72,
-        'volume': 908.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.14 03:00',
-        'open': 3362.72,
-        'high': 3368.49,
-        'low': 3362.71,
-        'close': 3367.92,
-        'volume': 2189.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.14 03:15',
-        'open': 3367.92,
-        'high': 3373.33,
-        'low': 3367.9,
-        'close': 3372.97,
-        'volume': 1983.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.14 03:30',
-        'open': 3372.96,
-        'high': 3375.02,
-        'low': 3369.66,
-        'close': 3371.08,
-        'volume': 2082.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.14 03:45',
-        'open': 3371.09,
-        'high': 3372.02,
-        'low': 3369.18,
-        'close': 3369.57,
-        'volume': 1534.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.14 04:00',
-        'open': 3369.55,
-        'high': 3370.9,
-        'low': 3367.31,
-        'close': 3369.01,
-        'volume': 2403.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.14 04:15',
-        'open': 3369.01,
-        'high': 3370.24,
-        'low': 3365.36,
-        'close': 3366.05,
-        'volume': 2160.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.14 04:30',
-        'open': 3366.08,
-        'high': 3367.83,
-        'low': 3365.17,
-        'close': 3366.81,
-        'volume': 1788.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.14 04:45',
-        'open': 3366.8,
-        'high': 3370.46,
-        'low': 3366.33,
-        'close': 3367.38,
-        'volume': 2064.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.14 05:00',
-        'open': 3367.38,
-        'high': 3369.27,
-        'low': 3365.71,
-        'close': 3368.65,
-        'volume': 2001.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.14 05:15',
-        'open': 3368.65,
-        'high': 3368.89,
-        'low': 3365.21,
-        'close': 3365.35,
-        'volume': 1284.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.14 05:30',
-        'open': 3365.36,
-        'high': 3368.31,
-        'low': 3364.37,
-        'close': 3367.75,
-        'volume': 1399.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.14 05:45',
-        'open': 3367.74,
-        'high': 3367.78,
-        'low': 3362.79,
-        'close': 3362.84,
-        'volume': 1721.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.14 06:00',
-        'open': 3362.84,
-        'high': 3364.11,
-        'low': 3358.8,
-        'close': 3359.93,
-        'volume': 2490.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.14 06:15',
-        'open': 3359.93,
-        'high': 3359.93,
-        'low': 3357.08,
-        'close': 3357.38,
-        'volume': 2203.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.14 06:30',
-        'open': 3357.39,
-        'high': 3358.38,
-        'low': 3355.35,
-        'close': 3357.33,
-        'volume': 1708.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.14 06:45',
-        'open': 3357.33,
-        'high': 3360.45,
-        'low': 3356.55,
-        'close': 3360.45,
-        'volume': 1886.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.14 07:00',
-        'open': 3360.48,
-        'high': 3361.17,
-        'low': 3359.33,
-        'close': 3360.38,
-        'volume': 1219.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.14 07:15',
-        'open': 3360.39,
-        'high': 3361.11,
-        'low': 3359.75,
-        'close': 3360.98,
-        'volume': 1079.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.14 07:30',
-        'open': 3361.0,
-        'high': 3361.79,
-        'low': 3358.54,
-        'close': 3360.75,
-        'volume': 1396.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.14 07:45',
-        'open': 3360.76,
-        'high': 3361.63,
-        'low': 3360.33,
-        'close': 3360.42,
-        'volume': 869.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.14 08:00',
-        'open': 3360.42,
-        'high': 3361.44,
-        'low': 3359.15,
-        'close': 3360.83,
-        'volume': 1078.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.14 08:15',
-        'open': 3360.84,
-        'high': 3361.74,
-        'low': 3358.59,
-        'close': 3359.14,
-        'volume': 1315.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.14 08:30',
-        'open': 3359.16,
-        'high': 3359.23,
-        'low': 3356.18,
-        'close': 3359.08,
-        'volume': 2122.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.14 08:45',
-        'open': 3359.04,
-        'high': 3359.77,
-        'low': 3358.19,
-        'close': 3358.91,
-        'volume': 1292.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.14 09:00',
-        'open': 3358.9,
-        'high': 3361.22,
-        'low': 3355.98,
-        'close': 3359.38,
-        'volume': 2326.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.14 09:15',
-        'open': 3359.37,
-        'high': 3359.37,
-        'low': 3356.42,
-        'close': 3358.89,
-        'volume': 1925.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.14 09:30',
-        'open': 3358.88,
-        'high': 3359.93,
-        'low': 3357.33,
-        'close': 3358.64,
-        'volume': 1790.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.14 09:45',
-        'open': 3358.64,
-        'high': 3362.35,
-        'low': 3357.97,
-        'close': 3362.0,
-        'volume': 1819.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.14 10:00',
-        'open': 3362.02,
-        'high': 3366.34,
-        'low': 3361.63,
-        'close': 3362.64,
-        'volume': 2642.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.14 10:15',
-        'open': 3362.64,
-        'high': 3365.03,
-        'low': 3361.47,
-        'close': 3362.59,
-        'volume': 1973.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.14 10:30',
-        'open': 3362.57,
-        'high': 3362.64,
-        'low': 3352.28,
-        'close': 3352.48,
-        'volume': 2511.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.14 10:45',
-        'open': 3352.46,
-        'high': 3352.58,
-        'low': 3343.65,
-        'close': 3346.04,
-        'volume': 3532.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.14 11:00',
-        'open': 3346.03,
-        'high': 3347.53,
-        'low': 3341.52,
-        'close': 3344.64,
-        'volume': 3572.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.14 11:15',
-        'open': 3344.64,
-        'high': 3349.79,
-        'low': 3341.79,
-        'close': 3349.73,
-        'volume': 2493.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.14 11:30',
-        'open': 3349.72,
-        'high': 3350.3,
-        'low': 3344.4,
-        'close': 3346.3,
-        'volume': 2296.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.14 11:45',
-        'open': 3346.31,
-        'high': 3348.22,
-        'low': 3345.93,
-        'close': 3346.15,
-        'volume': 2010.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.14 12:00',
-        'open': 3346.15,
-        'high': 3355.33,
-        'low': 3345.1,
-        'close': 3354.87,
-        'volume': 2720.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.14 12:15',
-        'open': 3354.88,
-        'high': 3359.08,
-        'low': 3354.63,
-        'close': 3356.19,
-        'volume': 2540.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.14 12:30',
-        'open': 3356.28,
-        'high': 3358.06,
-        'low': 3354.56,
-        'close': 3355.0,
-        'volume': 1894.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.14 12:45',
-        'open': 3354.99,
-        'high': 3358.17,
-        'low': 3353.89,
-        'close': 3356.56,
-        'volume': 1691.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.14 13:00',
-        'open': 3356.56,
-        'high': 3358.72,
-        'low': 3355.38,
-        'close': 3358.22,
-        'volume': 1473.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.14 13:15',
-        'open': 3358.22,
-        'high': 3358.82,
-        'low': 3356.29,
-        'close': 3357.49,
-        'volume': 1508.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.14 13:30',
-        'open': 3357.49,
-        'high': 3359.01,
-        'low': 3353.47,
-        'close': 3354.14,
-        'volume': 1475.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.14 13:45',
-        'open': 3354.15,
-        'high': 3355.08,
-        'low': 3352.14,
-        'close': 3354.97,
-        'volume': 1458.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.14 14:00',
-        'open': 3354.98,
-        'high': 3357.08,
-        'low': 3353.28,
-        'close': 3354.29,
-        'volume': 1622.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.14 14:15',
-        'open': 3354.29,
-        'high': 3355.55,
-        'low': 3352.5,
-        'close': 3355.21,
-        'volume': 1671.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.14 14:30',
-        'open': 3355.21,
-        'high': 3356.78,
-        'low': 3353.22,
-        'close': 3354.04,
-        'volume': 1136.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.14 14:45',
-        'open': 3354.04,
-        'high': 3355.76,
-        'low': 3353.85,
-        'close': 3355.4,
-        'volume': 1241.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.14 15:00',
-        'open': 3355.4,
-        'high': 3358.33,
-        'low': 3354.85,
-        'close': 3355.4,
-        'volume': 1639.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.14 15:15',
-        'open': 3355.39,
-        'high': 3356.07,
-        'low': 3352.8,
-        'close': 3353.2,
-        'volume': 2037.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.14 15:30',
-        'open': 3353.15,
-        'high': 3353.53,
-        'low': 3341.95,
-        'close': 3352.9,
-        'volume': 6149.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.14 15:45',
-        'open': 3352.91,
-        'high': 3356.4,
-        'low': 3349.13,
-        'close': 3350.59,
-        'volume': 4495.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.14 16:00',
-        'open': 3350.55,
-        'high': 3355.86,
-        'low': 3348.99,
-        'close': 3352.96,
-        'volume': 4241.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.14 16:15',
-        'open': 3352.95,
-        'high': 3355.98,
-        'low': 3344.92,
-        'close': 3345.33,
-        'volume': 4102.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.14 16:30',
-        'open': 3345.33,
-        'high': 3349.24,
-        'low': 3344.46,
-        'close': 3348.24,
-        'volume': 4786.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.14 16:45',
-        'open': 3348.22,
-        'high': 3348.78,
-        'low': 3343.76,
-        'close': 3344.14,
-        'volume': 3818.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.14 17:00',
-        'open': 3344.11,
-        'high': 3345.94,
-        'low': 3334.25,
-        'close': 3338.29,
-        'volume': 5311.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.14 17:15',
-        'open': 3338.29,
-        'high': 3345.93,
-        'low': 3337.26,
-        'close': 3344.84,
-        'volume': 4136.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.14 17:30',
-        'open': 3344.83,
-        'high': 3346.6,
-        'low': 3340.55,
-        'close': 3340.79,
-        'volume': 3246.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.14 17:45',
-        'open': 3340.79,
-        'high': 3342.38,
-        'low': 3339.15,
-        'close': 3340.55,
-        'volume': 2994.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.14 18:00',
-        'open': 3340.57,
-        'high': 3341.76,
-        'low': 3335.37,
-        'close': 3336.97,
-        'volume': 3191.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.14 18:15',
-        'open': 3336.98,
-        'high': 3340.61,
-        'low': 3336.06,
-        'close': 3339.45,
-        'volume': 2546.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.14 18:30',
-        'open': 3339.44,
-        'high': 3342.59,
-        'low': 3337.94,
-        'close': 3340.52,
-        'volume': 2213.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.14 18:45',
-        'open': 3340.52,
-        'high': 3342.83,
-        'low': 3339.74,
-        'close': 3341.72,
-        'volume': 1952.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.14 19:00',
-        'open': 3341.69,
-        'high': 3342.02,
-        'low': 3333.16,
-        'close': 3334.26,
-        'volume': 2365.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.14 19:15',
-        'open': 3334.25,
-        'high': 3334.92,
-        'low': 3329.8,
-        'close': 3332.14,
-        'volume': 3475.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.14 19:30',
-        'open': 3332.13,
-        'high': 3335.34,
-        'low': 3330.76,
-        'close': 3334.08,
-        'volume': 2235.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.14 19:45',
-        'open': 3334.08,
-        'high': 3335.04,
-        'low': 3332.85,
-        'close': 3334.37,
-        'volume': 1570.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.14 20:00',
-        'open': 3334.36,
-        'high': 3337.22,
-        'low': 3331.9,
-        'close': 3337.05,
-        'volume': 1897.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.14 20:15',
-        'open': 3337.1,
-        'high': 3338.41,
-        'low': 3336.07,
-        'close': 3336.97,
-        'volume': 1681.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.14 20:30',
-        'open': 3336.99,
-        'high': 3337.41,
-        'low': 3335.52,
-        'close': 3337.27,
-        'volume': 1399.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.14 20:45',
-        'open': 3337.26,
-        'high': 3338.34,
-        'low': 3335.98,
-        'close': 3337.82,
-        'volume': 1041.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.14 21:00',
-        'open': 3337.81,
-        'high': 3338.3,
-        'low': 3336.1,
-        'close': 3336.81,
-        'volume': 1082.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.14 21:15',
-        'open': 3336.82,
-        'high': 3337.91,
-        'low': 3336.04,
-        'close': 3337.0,
-        'volume': 1148.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.14 21:30',
-        'open': 3337.01,
-        'high': 3339.34,
-        'low': 3336.81,
-        'close': 3338.65,
-        'volume': 1081.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.14 21:45',
-        'open': 3338.64,
-        'high': 3339.07,
-        'low': 3338.14,
-        'close': 3338.28,
-        'volume': 959.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.14 22:00',
-        'open': 3338.26,
-        'high': 3340.99,
-        'low': 3337.97,
-        'close': 3340.84,
-        'volume': 903.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.14 22:15',
-        'open': 3340.85,
-        'high': 3341.0,
-        'low': 3339.51,
-        'close': 3340.46,
-        'volume': 711.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.14 22:30',
-        'open': 3340.48,
-        'high': 3340.99,
-        'low': 3339.13,
-        'close': 3339.49,
-        'volume': 760.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.14 22:45',
-        'open': 3339.49,
-        'high': 3340.12,
-        'low': 3337.93,
-        'close': 3337.94,
-        'volume': 1181.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.14 23:00',
-        'open': 3337.95,
-        'high': 3338.5,
-        'low': 3334.98,
-        'close': 3335.12,
-        'volume': 729.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.14 23:15',
-        'open': 3335.14,
-        'high': 3335.87,
-        'low': 3334.52,
-        'close': 3335.45,
-        'volume': 740.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.14 23:30',
-        'open': 3335.45,
-        'high': 3335.89,
-        'low': 3334.73,
-        'close': 3335.3,
-        'volume': 628.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.14 23:45',
-        'open': 3335.31,
-        'high': 3335.9,
-        'low': 3334.72,
-        'close': 3334.72,
-        'volume': 394.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.15 01:00',
-        'open': 3336.06,
-        'high': 3337.7,
-        'low': 3334.42,
-        'close': 3335.43,
-        'volume': 566.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.15 01:15',
-        'open': 3335.42,
-        'high': 3335.42,
-        'low': 3332.58,
-        'close': 3333.99,
-        'volume': 770.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.15 01:30',
-        'open': 3334.01,
-        'high': 3334.81,
-        'low': 3333.09,
-        'close': 3333.95,
-        'volume': 677.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.15 01:45',
-        'open': 3333.94,
-        'high': 3333.94,
-        'low': 3332.46,
-        'close': 3333.32,
-        'volume': 813.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.15 02:00',
-        'open': 3333.33,
-        'high': 3333.83,
-        'low': 3332.2,
-        'close': 3333.59,
-        'volume': 695.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.15 02:15',
-        'open': 3333.6,
-        'high': 3334.56,
-        'low': 3333.43,
-        'close': 3334.56,
-        'volume': 523.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.15 02:30',
-        'open': 3334.55,
-        'high': 3336.53,
-        'low': 3334.02,
-        'close': 3336.39,
-        'volume': 660.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.15 02:45',
-        'open': 3336.39,
-        'high': 3336.61,
-        'low': 3334.73,
-        'close': 3335.55,
-        'volume': 783.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.15 03:00',
-        'open': 3335.56,
-        'high': 3335.89,
-        'low': 3332.43,
-        'close': 3333.28,
-        'volume': 1562.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.15 03:15',
-        'open': 3333.27,
-        'high': 3336.11,
-        'low': 3333.24,
-        'close': 3335.89,
-        'volume': 1143.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.15 03:30',
-        'open': 3335.88,
-        'high': 3336.67,
-        'low': 3334.71,
-        'close': 3336.45,
-        'volume': 806.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.15 03:45',
-        'open': 3336.45,
-        'high': 3338.7,
-        'low': 3335.69,
-        'close': 3337.12,
-        'volume': 1623.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.15 04:00',
-        'open': 3337.12,
-        'high': 3337.56,
-        'low': 3335.15,
-        'close': 3336.51,
-        'volume': 1928.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.15 04:15',
-        'open': 3336.53,
-        'high': 3337.32,
-        'low': 3333.34,
-        'close': 3336.61,
-        'volume': 1782.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.15 04:30',
-        'open': 3336.6,
-        'high': 3339.02,
-        'low': 3335.21,
-        'close': 3338.55,
-        'volume': 2175.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.15 04:45',
-        'open': 3338.56,
-        'high': 3340.2,
-        'low': 3337.89,
-        'close': 3339.61,
-        'volume': 1674.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.15 05:00',
-        'open': 3339.61,
-        'high': 3340.05,
-        'low': 3338.25,
-        'close': 3338.62,
-        'volume': 1204.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.15 05:15',
-        'open': 3338.62,
-        'high': 3339.15,
-        'low': 3336.7,
-        'close': 3337.96,
-        'volume': 1346.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.15 05:30',
-        'open': 3337.99,
-        'high': 3340.11,
-        'low': 3337.49,
-        'close': 3339.29,
-        'volume': 1463.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.15 05:45',
-        'open': 3339.29,
-        'high': 3340.81,
-        'low': 3339.12,
-        'close': 3340.48,
-        'volume': 1322.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.15 06:00',
-        'open': 3340.48,
-        'high': 3341.15,
-        'low': 3340.13,
-        'close': 3341.01,
-        'volume': 1084.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.15 06:15',
-        'open': 3341.01,
-        'high': 3341.1,
-        'low': 3340.22,
-        'close': 3340.81,
-        'volume': 930.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.15 06:30',
-        'open': 3340.8,
-        'high': 3344.2,
-        'low': 3340.79,
-        'close': 3342.27,
-        'volume': 1531.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.15 06:45',
-        'open': 3342.26,
-        'high': 3344.81,
-        'low': 3342.26,
-        'close': 3343.4,
-        'volume': 931.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.15 07:00',
-        'open': 3343.39,
-        'high': 3345.38,
-        'low': 3343.31,
-        'close': 3345.24,
-        'volume': 1323.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.15 07:15',
-        'open': 3345.26,
-        'high': 3346.2,
-        'low': 3344.58,
-        'close': 3345.71,
-        'volume': 1146.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.15 07:30',
-        'open': 3345.7,
-        'high': 3346.57,
-        'low': 3343.41,
-        'close': 3345.11,
-        'volume': 1402.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.15 07:45',
-        'open': 3345.12,
-        'high': 3345.5,
-        'low': 3344.06,
-        'close': 3345.45,
-        'volume': 926.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.15 08:00',
-        'open': 3345.45,
-        'high': 3348.64,
-        'low': 3345.11,
-        'close': 3345.97,
-        'volume': 1479.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.15 08:15',
-        'open': 3345.95,
-        'high': 3346.0,
-        'low': 3343.1,
-        'close': 3343.4,
-        'volume': 1254.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.15 08:30',
-        'open': 3343.39,
-        'high': 3346.86,
-        'low': 3342.0,
-        'close': 3346.8,
-        'volume': 1713.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.15 08:45',
-        'open': 3346.82,
-        'high': 3347.31,
-        'low': 3343.27,
-        'close': 3343.79,
-        'volume': 1413.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.15 09:00',
-        'open': 3343.8,
-        'high': 3343.98,
-        'low': 3341.44,
-        'close': 3342.01,
-        'volume': 1842.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.15 09:15',
-        'open': 3342.01,
-        'high': 3344.78,
-        'low': 3340.92,
-        'close': 3341.44,
-        'volume': 1789.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.15 09:30',
-        'open': 3341.45,
-        'high': 3343.91,
-        'low': 3340.89,
-        'close': 3341.89,
-        'volume': 1239.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.15 09:45',
-        'open': 3341.88,
-        'high': 3343.5,
-        'low': 3340.2,
-        'close': 3340.39,
-        'volume': 1184.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.15 10:00',
-        'open': 3340.39,
-        'high': 3342.87,
-        'low': 3340.12,
-        'close': 3342.09,
-        'volume': 1459.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.15 10:15',
-        'open': 3342.08,
-        'high': 3345.8,
-        'low': 3341.75,
-        'close': 3344.65,
-        'volume': 1548.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.15 10:30',
-        'open': 3344.66,
-        'high': 3345.1,
-        'low': 3340.32,
-        'close': 3343.26,
-        'volume': 2045.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.15 10:45',
-        'open': 3343.25,
-        'high': 3346.53,
-        'low': 3342.68,
-        'close': 3346.16,
-        'volume': 1588.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.15 11:00',
-        'open': 3346.17,
-        'high': 3348.25,
-        'low': 3341.57,
-        'close': 3341.59,
-        'volume': 1822.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.15 11:15',
-        'open': 3341.59,
-        'high': 3342.28,
-        'low': 3338.87,
-        'close': 3339.42,
-        'volume': 1860.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.15 11:30',
-        'open': 3339.41,
-        'high': 3341.35,
-        'low': 3338.38,
-        'close': 3339.36,
-        'volume': 1269.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.15 11:45',
-        'open': 3339.37,
-        'high': 3342.79,
-        'low': 3339.18,
-        'close': 3341.19,
-        'volume': 1938.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.15 12:00',
-        'open': 3341.19,
-        'high': 3342.29,
-        'low': 3338.45,
-        'close': 3339.49,
-        'volume': 1978.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.15 12:15',
-        'open': 3339.49,
-        'high': 3344.87,
-        'low': 3338.68,
-        'close': 3344.23,
-        'volume': 1692.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.15 12:30',
-        'open': 3344.24,
-        'high': 3344.75,
-        'low': 3340.64,
-        'close': 3341.83,
-        'volume': 1769.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.15 12:45',
-        'open': 3341.83,
-        'high': 3343.15,
-        'low': 3340.99,
-        'close': 3342.61,
-        'volume': 1263.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.15 13:00',
-        'open': 3342.62,
-        'high': 3342.64,
-        'low': 3339.29,
-        'close': 3339.89,
-        'volume': 1534.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.15 13:15',
-        'open': 3339.9,
-        'high': 3341.13,
-        'low': 3337.39,
-        'close': 3338.13,
-        'volume': 1486.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.15 13:30',
-        'open': 3338.13,
-        'high': 3339.55,
-        'low': 3336.84,
-        'close': 3338.11,
-        'volume': 1293.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.15 13:45',
-        'open': 3338.11,
-        'high': 3340.47,
-        'low': 3336.35,
-        'close': 3337.63,
-        'volume': 1565.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.15 14:00',
-        'open': 3337.64,
-        'high': 3340.62,
-        'low': 3337.12,
-        'close': 3339.58,
-        'volume': 1779.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.15 14:15',
-        'open': 3339.58,
-        'high': 3340.19,
-        'low': 3337.71,
-        'close': 3339.98,
-        'volume': 1220.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.15 14:30',
-        'open': 3339.98,
-        'high': 3343.89,
-        'low': 3339.78,
-        'close': 3343.22,
-        'volume': 1978.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.15 14:45',
-        'open': 3343.23,
-        'high': 3344.15,
-        'low': 3341.99,
-        'close': 3342.3,
-        'volume': 1636.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.15 15:00',
-        'open': 3342.3,
-        'high': 3342.83,
-        'low': 3338.71,
-        'close': 3339.14,
-        'volume': 1887.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.15 15:15',
-        'open': 3339.15,
-        'high': 3339.71,
-        'low': 3337.14,
-        'close': 3337.2,
-        'volume': 2746.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.15 15:30',
-        'open': 3337.29,
-        'high': 3343.62,
-        'low': 3333.54,
-        'close': 3342.78,
-        'volume': 4312.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.15 15:45',
-        'open': 3342.77,
-        'high': 3343.83,
-        'low': 3340.34,
-        'close': 3342.64,
-        'volume': 2909.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.15 16:00',
-        'open': 3342.65,
-        'high': 3345.92,
-        'low': 3340.47,
-        'close': 3341.4,
-        'volume': 3033.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.15 16:15',
-        'open': 3341.39,
-        'high': 3341.64,
-        'low': 3336.39,
-        'close': 3338.41,
-        'volume': 3368.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.15 16:30',
-        'open': 3338.41,
-        'high': 3340.25,
-        'low': 3334.92,
-        'close': 3336.31,
-        'volume': 3860.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.15 16:45',
-        'open': 3336.3,
-        'high': 3337.11,
-        'low': 3332.83,
-        'close': 3335.37,
-        'volume': 3532.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.15 17:00',
-        'open': 3335.35,
-        'high': 3340.96,
-        'low': 3335.14,
-        'close': 3338.73,
-        'volume': 3168.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.15 17:15',
-        'open': 3338.73,
-        'high': 3342.63,
-        'low': 3338.31,
-        'close': 3338.54,
-        'volume': 2941.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.15 17:30',
-        'open': 3338.53,
-        'high': 3343.24,
-        'low': 3338.49,
-        'close': 3341.97,
-        'volume': 2410.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.15 17:45',
-        'open': 3341.98,
-        'high': 3343.57,
-        'low': 3340.49,
-        'close': 3341.75,
-        'volume': 2153.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.15 18:00',
-        'open': 3341.75,
-        'high': 3344.58,
-        'low': 3341.75,
-        'close': 3342.38,
-        'volume': 2101.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.15 18:15',
-        'open': 3342.39,
-        'high': 3344.01,
-        'low': 3341.84,
-        'close': 3343.31,
-        'volume': 1803.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.15 18:30',
-        'open': 3343.31,
-        'high': 3345.05,
-        'low': 3342.12,
-        'close': 3342.65,
-        'volume': 1696.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.15 18:45',
-        'open': 3342.64,
-        'high': 3343.68,
-        'low': 3341.38,
-        'close': 3342.27,
-        'volume': 1668.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.15 19:00',
-        'open': 3342.29,
-        'high': 3342.44,
-        'low': 3339.74,
-        'close': 3339.79,
-        'volume': 1661.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.15 19:15',
-        'open': 3339.8,
-        'high': 3340.25,
-        'low': 3337.18,
-        'close': 3338.64,
-        'volume': 1597.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.15 19:30',
-        'open': 3338.65,
-        'high': 3339.48,
-        'low': 3337.54,
-        'close': 3338.49,
-        'volume': 1481.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.15 19:45',
-        'open': 3338.49,
-        'high': 3338.5,
-        'low': 3335.74,
-        'close': 3338.16,
-        'volume': 1397.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.15 20:00',
-        'open': 3338.18,
-        'high': 3338.91,
-        'low': 3335.1,
-        'close': 3335.72,
-        'volume': 1390.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.15 20:15',
-        'open': 3335.72,
-        'high': 3337.43,
-        'low': 3335.72,
-        'close': 3336.43,
-        'volume': 1329.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.15 20:30',
-        'open': 3336.42,
-        'high': 3337.24,
-        'low': 3335.52,
-        'close': 3336.67,
-        'volume': 1081.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.15 20:45',
-        'open': 3336.67,
-        'high': 3336.76,
-        'low': 3335.48,
-        'close': 3336.0,
-        'volume': 1017.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.15 21:00',
-        'open': 3336.02,
-        'high': 3336.49,
-        'low': 3334.74,
-        'close': 3336.25,
-        'volume': 1332.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.15 21:15',
-        'open': 3336.25,
-        'high': 3338.2,
-        'low': 3336.2,
-        'close': 3337.1,
-        'volume': 995.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.15 21:30',
-        'open': 3337.1,
-        'high': 3337.57,
-        'low': 3336.56,
-        'close': 3336.74,
-        'volume': 739.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.15 21:45',
-        'open': 3336.74,
-        'high': 3336.74,
-        'low': 3335.59,
-        'close': 3335.96,
-        'volume': 941.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.15 22:00',
-        'open': 3335.96,
-        'high': 3336.32,
-        'low': 3334.43,
-        'close': 3335.28,
-        'volume': 1152.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.15 22:15',
-        'open': 3335.29,
-        'high': 3337.42,
-        'low': 3335.19,
-        'close': 3337.22,
-        'volume': 845.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.15 22:30',
-        'open': 3337.24,
-        'high': 3338.16,
-        'low': 3336.84,
-        'close': 3336.9,
-        'volume': 1076.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.15 22:45',
-        'open': 3336.91,
-        'high': 3339.58,
-        'low': 3336.57,
-        'close': 3339.13,
-        'volume': 1417.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.15 23:00',
-        'open': 3339.14,
-        'high': 3339.43,
-        'low': 3338.18,
-        'close': 3338.19,
-        'volume': 745.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.15 23:15',
-        'open': 3338.18,
-        'high': 3338.3,
-        'low': 3336.36,
-        'close': 3336.92,
-        'volume': 747.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.15 23:30',
-        'open': 3336.93,
-        'high': 3337.4,
-        'low': 3336.13,
-        'close': 3336.24,
-        'volume': 651.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.15 23:45',
-        'open': 3336.24,
-        'high': 3336.83,
-        'low': 3335.68,
-        'close': 3336.04,
-        'volume': 639.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.18 01:00',
-        'open': 3336.22,
-        'high': 3338.87,
-        'low': 3333.0,
-        'close': 3333.39,
-        'volume': 1458.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.18 01:15',
-        'open': 3333.38,
-        'high': 3335.3,
-        'low': 3333.01,
-        'close': 3334.97,
-        'volume': 784.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.18 01:30',
-        'open': 3334.98,
-        'high': 3335.12,
-        'low': 3333.93,
-        'close': 3334.68,
-        'volume': 567.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.18 01:45',
-        'open': 3334.68,
-        'high': 3335.04,
-        'low': 3333.99,
-        'close': 3334.32,
-        'volume': 398.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.18 02:00',
-        'open': 3334.31,
-        'high': 3334.37,
-        'low': 3330.04,
-        'close': 3330.19,
-        'volume': 1135.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.18 02:15',
-        'open': 3330.21,
-        'high': 3330.74,
-        'low': 3323.56,
-        'close': 3329.16,
-        'volume': 2224.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.18 02:30',
-        'open': 3329.17,
-        'high': 3329.64,
-        'low': 3327.94,
-        'close': 3328.27,
-        'volume': 831.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.18 02:45',
-        'open': 3328.29,
-        'high': 3328.38,
-        'low': 3325.85,
-        'close': 3327.06,
-        'volume': 1195.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.18 03:00',
-        'open': 3327.07,
-        'high': 3335.06,
-        'low': 3326.78,
-        'close': 3334.85,
-        'volume': 2074.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.18 03:15',
-        'open': 3334.84,
-        'high': 3342.08,
-        'low': 3334.21,
-        'close': 3340.11,
-        'volume': 2887.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.18 03:30',
-        'open': 3340.11,
-        'high': 3341.43,
-        'low': 3338.82,
-        'close': 3340.83,
-        'volume': 1713.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.18 03:45',
-        'open': 3340.81,
-        'high': 3342.73,
-        'low': 3340.21,
-        'close': 3340.6,
-        'volume': 1489.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.18 04:00',
-        'open': 3340.58,
-        'high': 3344.1,
-        'low': 3340.02,
-        'close': 3342.74,
-        'volume': 2720.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.18 04:15',
-        'open': 3342.74,
-        'high': 3343.96,
-        'low': 3339.84,
-        'close': 3340.4,
-        'volume': 1921.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.18 04:30',
-        'open': 3340.42,
-        'high': 3345.41,
-        'low': 3339.64,
-        'close': 3344.16,
-        'volume': 2008.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.18 04:45',
-        'open': 3344.16,
-        'high': 3347.4,
-        'low': 3343.57,
-        'close': 3346.85,
-        'volume': 1759.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.18 05:00',
-        'open': 3346.84,
-        'high': 3347.51,
-        'low': 3344.5,
-        'close': 3344.5,
-        'volume': 1480.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.18 05:15',
-        'open': 3344.49,
-        'high': 3344.64,
-        'low': 3342.41,
-        'close': 3342.76,
-        'volume': 1179.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.18 05:30',
-        'open': 3342.77,
-        'high': 3344.68,
-        'low': 3342.77,
-        'close': 3344.04,
-        'volume': 1443.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.18 05:45',
-        'open': 3344.04,
-        'high': 3344.35,
-        'low': 3342.69,
-        'close': 3343.38,
-        'volume': 810.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.18 06:00',
-        'open': 3343.37,
-        'high': 3345.93,
-        'low': 3343.32,
-        'close': 3344.1,
-        'volume': 999.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.18 06:15',
-        'open': 3344.08,
-        'high': 3346.89,
-        'low': 3343.94,
-        'close': 3346.7,
-        'volume': 1233.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.18 06:30',
-        'open': 3346.68,
-        'high': 3348.48,
-        'low': 3346.42,
-        'close': 3348.2,
-        'volume': 1032.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.18 06:45',
-        'open': 3348.22,
-        'high': 3351.77,
-        'low': 3346.44,
-        'close': 3347.04,
-        'volume': 2013.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.18 07:00',
-        'open': 3347.04,
-        'high': 3350.85,
-        'low': 3346.79,
-        'close': 3350.84,
-        'volume': 1071.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.18 07:15',
-        'open': 3350.83,
-        'high': 3352.66,
-        'low': 3350.54,
-        'close': 3352.39,
-        'volume': 1226.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.18 07:30',
-        'open': 3352.39,
-        'high': 3355.57,
-        'low': 3352.39,
-        'close': 3355.11,
-        'volume': 1409.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.18 07:45',
-        'open': 3355.1,
-        'high': 3358.16,
-        'low': 3355.08,
-        'close': 3357.49,
-        'volume': 1464.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.18 08:00',
-        'open': 3357.49,
-        'high': 3358.36,
-        'low': 3354.89,
-        'close': 3355.18,
-        'volume': 1554.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.18 08:15',
-        'open': 3355.21,
-        'high': 3355.42,
-        'low': 3351.24,
-        'close': 3351.24,
-        'volume': 1632.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.18 08:30',
-        'open': 3351.22,
-        'high': 3351.43,
-        'low': 3346.63,
-        'close': 3348.13,
-        'volume': 3068.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.18 08:45',
-        'open': 3348.1,
-        'high': 3351.32,
-        'low': 3346.99,
-        'close': 3349.59,
-        'volume': 2103.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.18 09:00',
-        'open': 3349.56,
-        'high': 3351.09,
-        'low': 3348.79,
-        'close': 3349.7,
-        'volume': 1662.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.18 09:15',
-        'open': 3349.69,
-        'high': 3349.74,
-        'low': 3346.01,
-        'close': 3349.47,
-        'volume': 1964.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.18 09:30',
-        'open': 3349.46,
-        'high': 3350.66,
-        'low': 3348.22,
-        'close': 3349.43,
-        'volume': 1310.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.18 09:45',
-        'open': 3349.4,
-        'high': 3350.3,
-        'low': 3347.81,
-        'close': 3349.4,
-        'volume': 1427.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.18 10:00',
-        'open': 3349.41,
-        'high': 3354.28,
-        'low': 3348.12,
-        'close': 3353.72,
-        'volume': 2045.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.18 10:15',
-        'open': 3353.71,
-        'high': 3355.55,
-        'low': 3352.25,
-        'close': 3352.34,
-        'volume': 1620.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.18 10:30',
-        'open': 3352.33,
-        'high': 3352.62,
-        'low': 3349.04,
-        'close': 3350.6,
-        'volume': 1602.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.18 10:45',
-        'open': 3350.59,
-        'high': 3351.23,
-        'low': 3347.19,
-        'close': 3349.02,
-        'volume': 1708.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.18 11:00',
-        'open': 3349.03,
-        'high': 3349.91,
-        'low': 3344.59,
-        'close': 3345.46,
-        'volume': 1739.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.18 11:15',
-        'open': 3345.45,
-        'high': 3347.92,
-        'low': 3344.57,
-        'close': 3347.84,
-        'volume': 1725.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.18 11:30',
-        'open': 3347.82,
-        'high': 3348.88,
-        'low': 3346.71,
-        'close': 3348.73,
-        'volume': 1247.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.18 11:45',
-        'open': 3348.73,
-        'high': 3349.82,
-        'low': 3347.68,
-        'close': 3348.65,
-        'volume': 1198.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.18 12:00',
-        'open': 3348.64,
-        'high': 3350.98,
-        'low': 3348.18,
-        'close': 3350.38,
-        'volume': 1198.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.18 12:15',
-        'open': 3350.37,
-        'high': 3350.47,
-        'low': 3348.11,
-        'close': 3348.65,
-        'volume': 1221.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.18 12:30',
-        'open': 3348.65,
-        'high': 3351.64,
-        'low': 3347.87,
-        'close': 3349.34,
-        'volume': 1828.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.18 12:45',
-        'open': 3349.34,
-        'high': 3350.59,
-        'low': 3347.58,
-        'close': 3348.14,
-        'volume': 1354.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.18 13:00',
-        'open': 3348.13,
-        'high': 3350.33,
-        'low': 3347.93,
-        'close': 3349.98,
-        'volume': 1249.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.18 13:15',
-        'open': 3349.98,
-        'high': 3351.36,
-        'low': 3348.03,
-        'close': 3348.66,
-        'volume': 1352.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.18 13:30',
-        'open': 3348.66,
-        'high': 3350.08,
-        'low': 3347.97,
-        'close': 3349.32,
-        'volume': 1448.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.18 13:45',
-        'open': 3349.32,
-        'high': 3349.51,
-        'low': 3346.49,
-        'close': 3346.59,
-        'volume': 969.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.18 14:00',
-        'open': 3346.58,
-        'high': 3348.68,
-        'low': 3346.53,
-        'close': 3348.04,
-        'volume': 1033.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.18 14:15',
-        'open': 3348.04,
-        'high': 3348.65,
-        'low': 3347.47,
-        'close': 3348.57,
-        'volume': 988.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.18 14:30',
-        'open': 3348.56,
-        'high': 3348.56,
-        'low': 3346.76,
-        'close': 3346.94,
-        'volume': 899.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.18 14:45',
-        'open': 3346.95,
-        'high': 3347.0,
-        'low': 3344.53,
-        'close': 3345.43,
-        'volume': 1251.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.18 15:00',
-        'open': 3345.42,
-        'high': 3347.95,
-        'low': 3345.11,
-        'close': 3347.02,
-        'volume': 1428.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.18 15:15',
-        'open': 3347.01,
-        'high': 3347.53,
-        'low': 3345.28,
-        'close': 3346.33,
-        'volume': 1774.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.18 15:30',
-        'open': 3346.34,
-        'high': 3348.75,
-        'low': 3345.89,
-        'close': 3347.82,
-        'volume': 2084.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.18 15:45',
-        'open': 3347.81,
-        'high': 3347.91,
-        'low': 3343.13,
-        'close': 3344.72,
-        'volume': 1826.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.18 16:00',
-        'open': 3344.74,
-        'high': 3344.91,
-        'low': 3341.04,
-        'close': 3341.21,
-        'volume': 3031.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.18 16:15',
-        'open': 3341.19,
-        'high': 3344.13,
-        'low': 3340.36,
-        'close': 3343.0,
-        'volume': 2595.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.18 16:30',
-        'open': 3343.0,
-        'high': 3343.91,
-        'low': 3337.78,
-        'close': 3339.93,
-        'volume': 3155.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.18 16:45',
-        'open': 3339.93,
-        'high': 3340.07,
-        'low': 3335.75,
-        'close': 3336.78,
-        'volume': 2485.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.18 17:00',
-        'open': 3336.8,
-        'high': 3338.31,
-        'low': 3332.36,
-        'close': 3335.5,
-        'volume': 3438.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.18 17:15',
-        'open': 3335.49,
-        'high': 3337.26,
-        'low': 3334.99,
-        'close': 3335.81,
-        'volume': 2298.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.18 17:30',
-        'open': 3335.8,
-        'high': 3338.64,
-        'low': 3334.7,
-        'close': 3335.6,
-        'volume': 2263.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.18 17:45',
-        'open': 3335.6,
-        'high': 3335.96,
-        'low': 3332.92,
-        'close': 3334.29,
-        'volume': 2415.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.18 18:00',
-        'open': 3334.29,
-        'high': 3335.18,
-        'low': 3332.23,
-        'close': 3334.53,
-        'volume': 2031.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.18 18:15',
-        'open': 3334.55,
-        'high': 3335.87,
-        'low': 3333.39,
-        'close': 3334.63,
-        'volume': 1721.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.18 18:30',
-        'open': 3334.64,
-        'high': 3335.6,
-        'low': 3333.18,
-        'close': 3335.04,
-        'volume': 1224.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.18 18:45',
-        'open': 3335.03,
-        'high': 3336.8,
-        'low': 3333.95,
-        'close': 3335.61,
-        'volume': 1363.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.18 19:00',
-        'open': 3335.61,
-        'high': 3335.81,
-        'low': 3331.96,
-        'close': 3333.49,
-        'volume': 1699.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.18 19:15',
-        'open': 3333.42,
-        'high': 3333.42,
-        'low': 3331.84,
-        'close': 3332.45,
-        'volume': 1413.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.18 19:30',
-        'open': 3332.46,
-        'high': 3334.58,
-        'low': 3331.75,
-        'close': 3332.56,
-        'volume': 1272.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.18 19:45',
-        'open': 3332.56,
-        'high': 3334.47,
-        'low': 3332.34,
-        'close': 3334.29,
-        'volume': 1422.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.18 20:00',
-        'open': 3334.31,
-        'high': 3334.32,
-        'low': 3331.73,
-        'close': 3333.83,
-        'volume': 1364.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.18 20:15',
-        'open': 3333.82,
-        'high': 3334.11,
-        'low': 3331.95,
-        'close': 3332.56,
-        'volume': 1380.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.18 20:30',
-        'open': 3332.56,
-        'high': 3334.42,
-        'low': 3332.35,
-        'close': 3334.31,
-        'volume': 971.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.18 20:45',
-        'open': 3334.31,
-        'high': 3334.83,
-        'low': 3332.88,
-        'close': 3333.67,
-        'volume': 759.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.18 21:00',
-        'open': 3333.63,
-        'high': 3333.74,
-        'low': 3332.71,
-        'close': 3332.98,
-        'volume': 687.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.18 21:15',
-        'open': 3332.97,
-        'high': 3333.16,
-        'low': 3332.03,
-        'close': 3332.95,
-        'volume': 723.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.18 21:30',
-        'open': 3332.94,
-        'high': 3333.35,
-        'low': 3331.43,
-        'close': 3331.92,
-        'volume': 685.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.18 21:45',
-        'open': 3331.91,
-        'high': 3332.45,
-        'low': 3331.42,
-        'close': 3331.84,
-        'volume': 626.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.18 22:00',
-        'open': 3331.84,
-        'high': 3332.03,
-        'low': 3330.23,
-        'close': 3331.19,
-        'volume': 1036.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.18 22:15',
-        'open': 3331.19,
-        'high': 3332.28,
-        'low': 3330.52,
-        'close': 3331.8,
-        'volume': 1086.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.18 22:30',
-        'open': 3331.8,
-        'high': 3332.74,
-        'low': 3331.33,
-        'close': 3331.38,
-        'volume': 895.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.18 22:45',
-        'open': 3331.38,
-        'high': 3334.53,
-        'low': 3331.38,
-        'close': 3333.85,
-        'volume': 1175.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.18 23:00',
-        'open': 3333.85,
-        'high': 3334.28,
-        'low': 3333.24,
-        'close': 3333.52,
-        'volume': 532.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.18 23:15',
-        'open': 3333.52,
-        'high': 3333.72,
-        'low': 3333.24,
-        'close': 3333.31,
-        'volume': 287.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.18 23:30',
-        'open': 3333.31,
-        'high': 3333.96,
-        'low': 3332.45,
-        'close': 3332.87,
-        'volume': 400.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.18 23:45',
-        'open': 3332.88,
-        'high': 3333.19,
-        'low': 3332.68,
-        'close': 3332.87,
-        'volume': 250.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.19 01:00',
-        'open': 3332.87,
-        'high': 3334.21,
-        'low': 3331.31,
-        'close': 3332.97,
-        'volume': 680.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.19 01:15',
-        'open': 3332.96,
-        'high': 3334.57,
-        'low': 3332.88,
-        'close': 3333.84,
-        'volume': 611.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.19 01:30',
-        'open': 3333.82,
-        'high': 3334.27,
-        'low': 3333.34,
-        'close': 3333.35,
-        'volume': 398.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.19 01:45',
-        'open': 3333.32,
-        'high': 3334.4,
-        'low': 3332.99,
-        'close': 3334.4,
-        'volume': 320.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.19 02:00',
-        'open': 3334.4,
-        'high': 3334.6,
-        'low': 3333.48,
-        'close': 3333.53,
-        'volume': 410.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.19 02:15',
-        'open': 3333.51,
-        'high': 3333.56,
-        'low': 3331.71,
-        'close': 3332.24,
-        'volume': 525.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.19 02:30',
-        'open': 3332.24,
-        'high': 3333.24,
-        'low': 3331.38,
-        'close': 3332.85,
-        'volume': 691.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.19 02:45',
-        'open': 3332.85,
-        'high': 3332.85,
-        'low': 3330.54,
-        'close': 3330.91,
-        'volume': 838.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.19 03:00',
-        'open': 3330.93,
-        'high': 3337.75,
-        'low': 3326.03,
-        'close': 3336.17,
-        'volume': 3186.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.19 03:15',
-        'open': 3336.18,
-        'high': 3339.16,
-        'low': 3335.66,
-        'close': 3337.19,
-        'volume': 1820.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.19 03:30',
-        'open': 3337.19,
-        'high': 3338.39,
-        'low': 3334.89,
-        'close': 3335.92,
-        'volume': 1487.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.19 03:45',
-        'open': 3335.92,
-        'high': 3336.28,
-        'low': 3332.69,
-        'close': 3335.13,
-        'volume': 1667.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.19 04:00',
-        'open': 3335.14,
-        'high': 3335.64,
-        'low': 3330.02,
-        'close': 3331.42,
-        'volume': 2854.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.19 04:15',
-        'open': 3331.4,
-        'high': 3335.22,
-        'low': 3330.88,
-        'close': 3332.52,
-        'volume': 2319.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.19 04:30',
-        'open': 3332.51,
-        'high': 3334.0,
-        'low': 3330.95,
-        'close': 3333.12,
-        'volume': 2244.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.19 04:45',
-        'open': 3333.12,
-        'high': 3335.63,
-        'low': 3332.63,
-        'close': 3332.98,
-        'volume': 1986.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.19 05:00',
-        'open': 3332.97,
-        'high': 3333.02,
-        'low': 3329.53,
-        'close': 3332.09,
-        'volume': 2228.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.19 05:15',
-        'open': 3332.09,
-        'high': 3334.71,
-        'low': 3331.72,
-        'close': 3333.55,
-        'volume': 1383.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.19 05:30',
-        'open': 3333.55,
-        'high': 3334.72,
-        'low': 3333.11,
-        'close': 3333.73,
-        'volume': 1098.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.19 05:45',
-        'open': 3333.73,
-        'high': 3338.04,
-        'low': 3332.32,
-        'close': 3338.02,
-        'volume': 1618.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.19 06:00',
-        'open': 3338.03,
-        'high': 3341.08,
-        'low': 3337.47,
-        'close': 3341.08,
-        'volume': 2173.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.19 06:15',
-        'open': 3341.08,
-        'high': 3341.58,
-        'low': 3340.15,
-        'close': 3341.0,
-        'volume': 1712.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.19 06:30',
-        'open': 3341.01,
-        'high': 3341.57,
-        'low': 3337.98,
-        'close': 3338.29,
-        'volume': 1262.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.19 06:45',
-        'open': 3338.32,
-        'high': 3338.48,
-        'low': 3337.16,
-        'close': 3337.79,
-        'volume': 1050.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.19 07:00',
-        'open': 3337.8,
-        'high': 3338.0,
-        'low': 3336.09,
-        'close': 3336.93,
-        'volume': 897.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.19 07:15',
-        'open': 3336.92,
-        'high': 3338.09,
-        'low': 3335.75,
-        'close': 3336.29,
-        'volume': 814.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.19 07:30',
-        'open': 3336.29,
-        'high': 3338.18,
-        'low': 3334.45,
-        'close': 3335.09,
-        'volume': 1357.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.19 07:45',
-        'open': 3335.1,
-        'high': 3337.9,
-        'low': 3335.09,
-        'close': 3337.69,
-        'volume': 802.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.19 08:00',
-        'open': 3337.68,
-        'high': 3338.7,
-        'low': 3337.49,
-        'close': 3338.04,
-        'volume': 879.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.19 08:15',
-        'open': 3338.04,
-        'high': 3340.58,
-        'low': 3336.42,
-        'close': 3339.84,
-        'volume': 1396.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.19 08:30',
-        'open': 3339.85,
-        'high': 3340.57,
-        'low': 3337.95,
-        'close': 3338.6,
-        'volume': 1367.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.19 08:45',
-        'open': 3338.58,
-        'high': 3339.19,
-        'low': 3335.75,
-        'close': 3336.15,
-        'volume': 1570.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.19 09:00',
-        'open': 3336.15,
-        'high': 3338.04,
-        'low': 3335.12,
-        'close': 3337.35,
-        'volume': 1601.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.19 09:15',
-        'open': 3337.33,
-        'high': 3338.72,
-        'low': 3335.98,
-        'close': 3336.53,
-        'volume': 1379.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.19 09:30',
-        'open': 3336.51,
-        'high': 3337.38,
-        'low': 3334.63,
-        'close': 3334.82,
-        'volume': 1205.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.19 09:45',
-        'open': 3334.81,
-        'high': 3336.82,
-        'low': 3334.44,
-        'close': 3335.96,
-        'volume': 1257.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.19 10:00',
-        'open': 3335.97,
-        'high': 3341.72,
-        'low': 3334.96,
-        'close': 3338.54,
-        'volume': 2100.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.19 10:15',
-        'open': 3338.54,
-        'high': 3341.2,
-        'low': 3338.52,
-        'close': 3339.78,
-        'volume': 1754.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.19 10:30',
-        'open': 3339.77,
-        'high': 3340.12,
-        'low': 3337.55,
-        'close': 3339.77,
-        'volume': 1660.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.19 10:45',
-        'open': 3339.79,
-        'high': 3340.86,
-        'low': 3338.66,
-        'close': 3340.74,
-        'volume': 1163.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.19 11:00',
-        'open': 3340.72,
-        'high': 3340.93,
-        'low': 3336.76,
-        'close': 3336.94,
-        'volume': 1393.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.19 11:15',
-        'open': 3336.93,
-        'high': 3339.45,
-        'low': 3336.51,
-        'close': 3338.65,
-        'volume': 1164.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.19 11:30',
-        'open': 3338.63,
-        'high': 3339.06,
-        'low': 3337.57,
-        'close': 3338.51,
-        'volume': 1040.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.19 11:45',
-        'open': 3338.51,
-        'high': 3339.45,
-        'low': 3337.07,
-        'close': 3337.98,
-        'volume': 1177.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.19 12:00',
-        'open': 3337.98,
-        'high': 3339.38,
-        'low': 3337.33,
-        'close': 3337.38,
-        'volume': 1232.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.19 12:15',
-        'open': 3337.39,
-        'high': 3338.32,
-        'low': 3336.98,
-        'close': 3337.87,
-        'volume': 923.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.19 12:30',
-        'open': 3337.87,
-        'high': 3339.34,
-        'low': 3336.92,
-        'close': 3338.85,
-        'volume': 1047.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.19 12:45',
-        'open': 3338.85,
-        'high': 3339.63,
-        'low': 3338.53,
-        'close': 3339.32,
-        'volume': 970.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.19 13:00',
-        'open': 3339.31,
-        'high': 3343.01,
-        'low': 3339.26,
-        'close': 3342.75,
-        'volume': 1435.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.19 13:15',
-        'open': 3342.75,
-        'high': 3345.26,
-        'low': 3342.75,
-        'close': 3343.79,
-        'volume': 1586.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.19 13:30',
-        'open': 3343.78,
-        'high': 3343.88,
-        'low': 3342.22,
-        'close': 3342.56,
-        'volume': 1044.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.19 13:45',
-        'open': 3342.57,
-        'high': 3344.03,
-        'low': 3341.7,
-        'close': 3343.48,
-        'volume': 1074.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.19 14:00',
-        'open': 3343.51,
-        'high': 3344.71,
-        'low': 3342.78,
-        'close': 3343.02,
-        'volume': 1312.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.19 14:15',
-        'open': 3343.02,
-        'high': 3343.33,
-        'low': 3341.04,
-        'close': 3341.69,
-        'volume': 933.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.19 14:30',
-        'open': 3341.7,
-        'high': 3341.93,
-        'low': 3339.26,
-        'close': 3341.27,
-        'volume': 1179.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.19 14:45',
-        'open': 3341.28,
-        'high': 3342.21,
-        'low': 3339.67,
-        'close': 3339.71,
-        'volume': 1515.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.19 15:00',
-        'open': 3339.71,
-        'high': 3340.52,
-        'low': 3336.75,
-        'close': 3336.8,
-        'volume': 1906.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.19 15:15',
-        'open': 3336.81,
-        'high': 3339.95,
-        'low': 3336.08,
-        'close': 3338.19,
-        'volume': 1805.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.19 15:30',
-        'open': 3338.13,
-        'high': 3338.13,
-        'low': 3334.55,
-        'close': 3335.88,
-        'volume': 2333.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.19 15:45',
-        'open': 3335.87,
-        'high': 3337.24,
-        'low': 3334.3,
-        'close': 3334.74,
-        'volume': 1689.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.19 16:00',
-        'open': 3334.77,
-        'high': 3335.52,
-        'low': 3325.71,
-        'close': 3329.66,
-        'volume': 3548.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.19 16:15',
-        'open': 3329.67,
-        'high': 3332.85,
-        'low': 3328.61,
-        'close': 3331.73,
-        'volume': 3054.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.19 16:30',
-        'open': 3331.71,
-        'high': 3338.23,
-        'low': 3331.55,
-        'close': 3337.9,
-        'volume': 4107.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.19 16:45',
-        'open': 3337.91,
-        'high': 3339.25,
-        'low': 3333.79,
-        'close': 3333.98,
-        'volume': 2919.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.19 17:00',
-        'open': 3334.01,
-        'high': 3336.96,
-        'low': 3332.17,
-        'close': 3334.72,
-        'volume': 2538.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.19 17:15',
-        'open': 3334.74,
-        'high': 3336.34,
-        'low': 3333.64,
-        'close': 3335.5,
-        'volume': 2526.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.19 17:30',
-        'open': 3335.49,
-        'high': 3336.62,
-        'low': 3325.48,
-        'close': 3326.16,
-        'volume': 3918.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.19 17:45',
-        'open': 3326.17,
-        'high': 3326.98,
-        'low': 3320.91,
-        'close': 3325.3,
-        'volume': 4499.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.19 18:00',
-        'open': 3325.32,
-        'high': 3326.51,
-        'low': 3321.57,
-        'close': 3323.18,
-        'volume': 3241.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.19 18:15',
-        'open': 3323.18,
-        'high': 3326.71,
-        'low': 3322.12,
-        'close': 3324.13,
-        'volume': 2404.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.19 18:30',
-        'open': 3324.11,
-        'high': 3326.13,
-        'low': 3322.49,
-        'close': 3323.18,
-        'volume': 1782.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.19 18:45',
-        'open': 3323.18,
-        'high': 3323.77,
-        'low': 3321.66,
-        'close': 3322.61,
-        'volume': 1771.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.19 19:00',
-        'open': 3322.62,
-        'high': 3324.38,
-        'low': 3320.55,
-        'close': 3320.9,
-        'volume': 1765.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.19 19:15',
-        'open': 3320.9,
-        'high': 3322.65,
-        'low': 3318.65,
-        'close': 3319.44,
-        'volume': 1722.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.19 19:30',
-        'open': 3319.45,
-        'high': 3320.74,
-        'low': 3318.07,
-        'close': 3319.2,
-        'volume': 1755.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.19 19:45',
-        'open': 3319.2,
-        'high': 3320.48,
-        'low': 3317.01,
-        'close': 3317.44,
-        'volume': 1843.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.19 20:00',
-        'open': 3317.44,
-        'high': 3318.96,
-        'low': 3316.88,
-        'close': 3317.83,
-        'volume': 1890.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.19 20:15',
-        'open': 3317.84,
-        'high': 3318.91,
-        'low': 3314.88,
-        'close': 3315.51,
-        'volume': 1981.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.19 20:30',
-        'open': 3315.51,
-        'high': 3319.94,
-        'low': 3315.47,
-        'close': 3319.29,
-        'volume': 1812.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.19 20:45',
-        'open': 3319.29,
-        'high': 3319.5,
-        'low': 3317.48,
-        'close': 3317.49,
-        'volume': 1220.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.19 21:00',
-        'open': 3317.48,
-        'high': 3318.44,
-        'low': 3316.81,
-        'close': 3318.07,
-        'volume': 1277.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.19 21:15',
-        'open': 3318.07,
-        'high': 3319.06,
-        'low': 3318.02,
-        'close': 3318.92,
-        'volume': 968.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.19 21:30',
-        'open': 3318.91,
-        'high': 3319.55,
-        'low': 3318.12,
-        'close': 3318.15,
-        'volume': 875.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.19 21:45',
-        'open': 3318.15,
-        'high': 3320.21,
-        'low': 3318.1,
-        'close': 3318.51,
-        'volume': 1123.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.19 22:00',
-        'open': 3318.51,
-        'high': 3318.87,
-        'low': 3316.57,
-        'close': 3317.28,
-        'volume': 1383.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.19 22:15',
-        'open': 3317.28,
-        'high': 3318.08,
-        'low': 3316.64,
-        'close': 3316.96,
-        'volume': 1191.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.19 22:30',
-        'open': 3316.96,
-        'high': 3317.39,
-        'low': 3315.53,
-        'close': 3315.98,
-        'volume': 1245.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.19 22:45',
-        'open': 3315.98,
-        'high': 3316.72,
-        'low': 3315.57,
-        'close': 3315.89,
-        'volume': 1287.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.19 23:00',
-        'open': 3315.88,
-        'high': 3316.67,
-        'low': 3315.33,
-        'close': 3315.48,
-        'volume': 631.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.19 23:15',
-        'open': 3315.46,
-        'high': 3316.92,
-        'low': 3314.92,
-        'close': 3316.69,
-        'volume': 789.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.19 23:30',
-        'open': 3316.68,
-        'high': 3317.47,
-        'low': 3315.77,
-        'close': 3315.85,
-        'volume': 691.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.19 23:45',
-        'open': 3315.85,
-        'high': 3315.85,
-        'low': 3315.06,
-        'close': 3315.57,
-        'volume': 409.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.20 01:00',
-        'open': 3315.36,
-        'high': 3317.49,
-        'low': 3315.36,
-        'close': 3316.57,
-        'volume': 621.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.20 01:15',
-        'open': 3316.58,
-        'high': 3317.32,
-        'low': 3316.04,
-        'close': 3317.11,
-        'volume': 415.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.20 01:30',
-        'open': 3317.11,
-        'high': 3317.11,
-        'low': 3315.92,
-        'close': 3316.57,
-        'volume': 385.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.20 01:45',
-        'open': 3316.56,
-        'high': 3317.41,
-        'low': 3315.76,
-        'close': 3316.84,
-        'volume': 526.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.20 02:00',
-        'open': 3316.84,
-        'high': 3316.84,
-        'low': 3315.05,
-        'close': 3315.21,
-        'volume': 787.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.20 02:15',
-        'open': 3315.2,
-        'high': 3315.95,
-        'low': 3315.0,
-        'close': 3315.55,
-        'volume': 590.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.20 02:30',
-        'open': 3315.53,
-        'high': 3316.67,
-        'low': 3315.04,
-        'close': 3315.53,
-        'volume': 668.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.20 02:45',
-        'open': 3315.52,
-        'high': 3315.61,
-        'low': 3312.77,
-        'close': 3314.22,
-        'volume': 1083.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.20 03:00',
-        'open': 3314.22,
-        'high': 3316.09,
-        'low': 3313.24,
-        'close': 3313.92,
-        'volume': 1567.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.20 03:15',
-        'open': 3313.91,
-        'high': 3314.9,
-        'low': 3313.18,
-        'close': 3313.72,
-        'volume': 1087.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.20 03:30',
-        'open': 3313.71,
-        'high': 3314.49,
-        'low': 3312.85,
-        'close': 3313.68,
-        'volume': 1051.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.20 03:45',
-        'open': 3313.69,
-        'high': 3317.16,
-        'low': 3313.07,
-        'close': 3315.99,
-        'volume': 1793.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.20 04:00',
-        'open': 3316.0,
-        'high': 3316.78,
-        'low': 3312.07,
-        'close': 3313.51,
-        'volume': 2363.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.20 04:15',
-        'open': 3313.5,
-        'high': 3315.73,
-        'low': 3311.51,
-        'close': 3312.02,
-        'volume': 2107.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.20 04:30',
-        'open': 3312.03,
-        'high': 3317.15,
-        'low': 3311.53,
-        'close': 3317.08,
-        'volume': 2355.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.20 04:45',
-        'open': 3317.11,
-        'high': 3317.72,
-        'low': 3315.03,
-        'close': 3315.25,
-        'volume': 1925.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.20 05:00',
-        'open': 3315.22,
-        'high': 3316.07,
-        'low': 3313.11,
-        'close': 3314.44,
-        'volume': 1950.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.20 05:15',
-        'open': 3314.45,
-        'high': 3317.1,
-        'low': 3313.63,
-        'close': 3314.66,
-        'volume': 1406.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.20 05:30',
-        'open': 3314.65,
-        'high': 3315.41,
-        'low': 3312.61,
-        'close': 3312.89,
-        'volume': 1757.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.20 05:45',
-        'open': 3312.9,
-        'high': 3315.12,
-        'low': 3312.42,
-        'close': 3314.05,
-        'volume': 1344.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.20 06:00',
-        'open': 3314.04,
-        'high': 3317.46,
-        'low': 3314.01,
-        'close': 3316.54,
-        'volume': 1770.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.20 06:15',
-        'open': 3316.56,
-        'high': 3318.18,
-        'low': 3315.4,
-        'close': 3317.3,
-        'volume': 1676.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.20 06:30',
-        'open': 3317.29,
-        'high': 3318.53,
-        'low': 3316.62,
-        'close': 3317.91,
-        'volume': 1096.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.20 06:45',
-        'open': 3317.91,
-        'high': 3318.47,
-        'low': 3317.04,
-        'close': 3317.5,
-        'volume': 932.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.20 07:00',
-        'open': 3317.49,
-        'high': 3318.85,
-        'low': 3317.16,
-        'close': 3318.66,
-        'volume': 937.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.20 07:15',
-        'open': 3318.66,
-        'high': 3319.4,
-        'low': 3318.16,
-        'close': 3318.46,
-        'volume': 762.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.20 07:30',
-        'open': 3318.45,
-        'high': 3320.75,
-        'low': 3318.29,
-        'close': 3320.24,
-        'volume': 1172.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.20 07:45',
-        'open': 3320.26,
-        'high': 3320.92,
-        'low': 3318.65,
-        'close': 3318.67,
-        'volume': 999.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.20 08:00',
-        'open': 3318.67,
-        'high': 3320.41,
-        'low': 3318.67,
-        'close': 3319.3,
-        'volume': 992.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.20 08:15',
-        'open': 3319.3,
-        'high': 3319.39,
-        'low': 3318.16,
-        'close': 3318.59,
-        'volume': 868.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.20 08:30',
-        'open': 3318.59,
-        'high': 3321.33,
-        'low': 3318.47,
-        'close': 3320.25,
-        'volume': 1697.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.20 08:45',
-        'open': 3320.27,
-        'high': 3324.23,
-        'low': 3319.88,
-        'close': 3323.47,
-        'volume': 1395.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.20 09:00',
-        'open': 3323.48,
-        'high': 3325.48,
-        'low': 3322.53,
-        'close': 3325.38,
-        'volume': 2420.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.20 09:15',
-        'open': 3325.38,
-        'high': 3325.89,
-        'low': 3323.02,
-        'close': 3323.45,
-        'volume': 1943.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.20 09:30',
-        'open': 3323.45,
-        'high': 3324.81,
-        'low': 3323.08,
-        'close': 3324.18,
-        'volume': 1264.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.20 09:45',
-        'open': 3324.19,
-        'high': 3324.5,
-        'low': 3322.21,
-        'close': 3323.01,
-        'volume': 1566.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.20 10:00',
-        'open': 3322.99,
-        'high': 3325.96,
-        'low': 3321.58,
-        'close': 3325.96,
-        'volume': 1594.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.20 10:15',
-        'open': 3325.96,
-        'high': 3327.53,
-        'low': 3324.33,
-        'close': 3324.54,
-        'volume': 1544.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.20 10:30',
-        'open': 3324.54,
-        'high': 3326.29,
-        'low': 3323.64,
-        'close': 3325.53,
-        'volume': 1316.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.20 10:45',
-        'open': 3325.53,
-        'high': 3326.54,
-        'low': 3323.95,
-        'close': 3324.82,
-        'volume': 1256.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.20 11:00',
-        'open': 3324.8,
-        'high': 3324.84,
-        'low': 3322.93,
-        'close': 3322.94,
-        'volume': 1241.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.20 11:15',
-        'open': 3322.93,
-        'high': 3323.62,
-        'low': 3321.53,
-        'close': 3321.6,
-        'volume': 1561.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.20 11:30',
-        'open': 3321.61,
-        'high': 3323.84,
-        'low': 3320.92,
-        'close': 3323.73,
-        'volume': 1545.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.20 11:45',
-        'open': 3323.71,
-        'high': 3325.56,
-        'low': 3323.05,
-        'close': 3324.88,
-        'volume': 1250.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.20 12:00',
-        'open': 3324.9,
-        'high': 3326.92,
-        'low': 3323.5,
-        'close': 3326.83,
-        'volume': 1455.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.20 12:15',
-        'open': 3326.9,
-        'high': 3327.41,
-        'low': 3325.42,
-        'close': 3325.48,
-        'volume': 1380.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.20 12:30',
-        'open': 3325.48,
-        'high': 3327.39,
-        'low': 3325.36,
-        'close': 3325.76,
-        'volume': 1362.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.20 12:45',
-        'open': 3325.76,
-        'high': 3327.2,
-        'low': 3325.52,
-        'close': 3326.16,
-        'volume': 1273.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.20 13:00',
-        'open': 3326.14,
-        'high': 3327.04,
-        'low': 3325.26,
-        'close': 3325.83,
-        'volume': 1061.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.20 13:15',
-        'open': 3325.82,
-        'high': 3326.78,
-        'low': 3323.81,
-        'close': 3326.78,
-        'volume': 1772.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.20 13:30',
-        'open': 3326.79,
-        'high': 3327.82,
-        'low': 3326.08,
-        'close': 3327.06,
-        'volume': 1398.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.20 13:45',
-        'open': 3327.06,
-        'high': 3327.49,
-        'low': 3325.49,
-        'close': 3326.55,
-        'volume': 1275.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.20 14:00',
-        'open': 3326.5,
-        'high': 3329.08,
-        'low': 3325.73,
-        'close': 3328.94,
-        'volume': 1726.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.20 14:15',
-        'open': 3328.94,
-        'high': 3331.15,
-        'low': 3328.54,
-        'close': 3330.84,
-        'volume': 1892.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.20 14:30',
-        'open': 3330.83,
-        'high': 3331.6,
-        'low': 3328.96,
-        'close': 3328.96,
-        'volume': 1970.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.20 14:45',
-        'open': 3328.96,
-        'high': 3332.85,
-        'low': 3328.96,
-        'close': 3332.3,
-        'volume': 2224.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.20 15:00',
-        'open': 3332.3,
-        'high': 3335.33,
-        'low': 3332.1,
-        'close': 3334.93,
-        'volume': 2439.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.20 15:15',
-        'open': 3334.91,
-        'high': 3338.3,
-        'low': 3334.68,
-        'close': 3337.88,
-        'volume': 2662.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.20 15:30',
-        'open': 3337.89,
-        'high': 3341.75,
-        'low': 3337.56,
-        'close': 3339.65,
-        'volume': 3458.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.20 15:45',
-        'open': 3339.66,
-        'high': 3344.83,
-        'low': 3339.12,
-        'close': 3342.87,
-        'volume': 2321.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.20 16:00',
-        'open': 3342.85,
-        'high': 3343.41,
-        'low': 3340.27,
-        'close': 3343.05,
-        'volume': 3013.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.20 16:15',
-        'open': 3343.07,
-        'high': 3343.74,
-        'low': 3338.9,
-        'close': 3340.71,
-        'volume': 2034.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.20 16:30',
-        'open': 3340.73,
-        'high': 3348.35,
-        'low': 3340.5,
-        'close': 3346.62,
-        'volume': 2926.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.20 16:45',
-        'open': 3346.68,
-        'high': 3346.8,
-        'low': 3340.32,
-        'close': 3344.87,
-        'volume': 3279.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.20 17:00',
-        'open': 3344.86,
-        'high': 3345.95,
-        'low': 3340.56,
-        'close': 3342.06,
-        'volume': 2833.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.20 17:15',
-        'open': 3342.07,
-        'high': 3344.67,
-        'low': 3339.98,
-        'close': 3344.34,
-        'volume': 2193.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.20 17:30',
-        'open': 3344.35,
-        'high': 3346.93,
-        'low': 3344.19,
-        'close': 3346.17,
-        'volume': 2112.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.20 17:45',
-        'open': 3346.17,
-        'high': 3350.22,
-        'low': 3345.7,
-        'close': 3346.89,
-        'volume': 3206.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.20 18:00',
-        'open': 3346.88,
-        'high': 3346.92,
-        'low': 3342.1,
-        'close': 3342.76,
-        'volume': 2202.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.20 18:15',
-        'open': 3342.76,
-        'high': 3343.02,
-        'low': 3339.56,
-        'close': 3341.17,
-        'volume': 2013.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.20 18:30',
-        'open': 3341.18,
-        'high': 3342.94,
-        'low': 3339.91,
-        'close': 3340.45,
-        'volume': 1745.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.20 18:45',
-        'open': 3340.45,
-        'high': 3341.56,
-        'low': 3338.9,
-        'close': 3340.66,
-        'volume': 1265.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.20 19:00',
-        'open': 3340.66,
-        'high': 3343.88,
-        'low': 3340.66,
-        'close': 3343.25,
-        'volume': 1337.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.20 19:15',
-        'open': 3343.25,
-        'high': 3345.85,
-        'low': 3342.76,
-        'close': 3343.68,
-        'volume': 1492.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.20 19:30',
-        'open': 3343.67,
-        'high': 3345.53,
-        'low': 3343.62,
-        'close': 3345.52,
-        'volume': 1141.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.20 19:45',
-        'open': 3345.52,
-        'high': 3345.96,
-        'low': 3344.06,
-        'close': 3345.09,
-        'volume': 1053.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.20 20:00',
-        'open': 3345.09,
-        'high': 3346.19,
-        'low': 3344.04,
-        'close': 3346.05,
-        'volume': 1195.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.20 20:15',
-        'open': 3346.05,
-        'high': 3346.29,
-        'low': 3345.27,
-        'close': 3345.51,
-        'volume': 1285.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.20 20:30',
-        'open': 3345.51,
-        'high': 3346.24,
-        'low': 3345.13,
-        'close': 3346.07,
-        'volume': 1187.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.20 20:45',
-        'open': 3346.08,
-        'high': 3348.05,
-        'low': 3345.48,
-        'close': 3346.87,
-        'volume': 1103.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.20 21:00',
-        'open': 3346.91,
-        'high': 3347.11,
-        'low': 3344.1,
-        'close': 3344.75,
-        'volume': 1467.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.20 21:15',
-        'open': 3344.73,
-        'high': 3345.27,
-        'low': 3344.01,
-        'close': 3344.16,
-        'volume': 1218.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.20 21:30',
-        'open': 3344.15,
-        'high': 3346.3,
-        'low': 3344.14,
-        'close': 3345.28,
-        'volume': 1159.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.20 21:45',
-        'open': 3345.28,
-        'high': 3346.17,
-        'low': 3345.16,
-        'close': 3345.65,
-        'volume': 1023.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.20 22:00',
-        'open': 3345.66,
-        'high': 3348.0,
-        'low': 3345.02,
-        'close': 3347.85,
-        'volume': 1102.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.20 22:15',
-        'open': 3347.83,
-        'high': 3349.19,
-        'low': 3347.73,
-        'close': 3348.55,
-        'volume': 1124.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.20 22:30',
-        'open': 3348.55,
-        'high': 3349.01,
-        'low': 3347.43,
-        'close': 3348.07,
-        'volume': 891.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.20 22:45',
-        'open': 3348.08,
-        'high': 3349.13,
-        'low': 3347.99,
-        'close': 3348.72,
-        'volume': 1525.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.20 23:00',
-        'open': 3348.72,
-        'high': 3348.9,
-        'low': 3347.5,
-        'close': 3347.67,
-        'volume': 693.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.20 23:15',
-        'open': 3347.66,
-        'high': 3349.05,
-        'low': 3347.44,
-        'close': 3349.05,
-        'volume': 536.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.20 23:30',
-        'open': 3349.06,
-        'high': 3349.21,
-        'low': 3348.08,
-        'close': 3348.62,
-        'volume': 606.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.20 23:45',
-        'open': 3348.59,
-        'high': 3348.59,
-        'low': 3347.46,
-        'close': 3347.85,
-        'volume': 465.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.21 01:00',
-        'open': 3349.84,
-        'high': 3352.02,
-        'low': 3349.32,
-        'close': 3350.93,
-        'volume': 837.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.21 01:15',
-        'open': 3350.92,
-        'high': 3351.39,
-        'low': 3348.76,
-        'close': 3350.07,
-        'volume': 925.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.21 01:30',
-        'open': 3350.08,
-        'high': 3351.14,
-        'low': 3349.19,
-        'close': 3350.12,
-        'volume': 748.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.21 01:45',
-        'open': 3350.12,
-        'high': 3350.58,
-        'low': 3349.52,
-        'close': 3349.64,
-        'volume': 640.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.21 02:00',
-        'open': 3349.64,
-        'high': 3349.64,
-        'low': 3347.3,
-        'close': 3347.8,
-        'volume': 835.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.21 02:15',
-        'open': 3347.8,
-        'high': 3348.42,
-        'low': 3347.15,
-        'close': 3347.89,
-        'volume': 742.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.21 02:30',
-        'open': 3347.9,
-        'high': 3348.31,
-        'low': 3346.66,
-        'close': 3346.7,
-        'volume': 606.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.21 02:45',
-        'open': 3346.69,
-        'high': 3347.92,
-        'low': 3346.31,
-        'close': 3346.84,
-        'volume': 930.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.21 03:00',
-        'open': 3346.83,
-        'high': 3346.83,
-        'low': 3344.14,
-        'close': 3344.63,
-        'volume': 1183.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.21 03:15',
-        'open': 3344.63,
-        'high': 3345.48,
-        'low': 3342.43,
-        'close': 3343.79,
-        'volume': 1193.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.21 03:30',
-        'open': 3343.8,
-        'high': 3343.91,
-        'low': 3342.53,
-        'close': 3343.91,
-        'volume': 932.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.21 03:45',
-        'open': 3343.92,
-        'high': 3343.97,
-        'low': 3341.44,
-        'close': 3342.29,
-        'volume': 1425.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.21 04:00',
-        'open': 3342.29,
-        'high': 3343.9,
-        'low': 3340.77,
-        'close': 3343.9,
-        'volume': 1572.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.21 04:15',
-        'open': 3343.91,
-        'high': 3344.66,
-        'low': 3341.73,
-        'close': 3342.77,
-        'volume': 1593.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.21 04:30',
-        'open': 3342.77,
-        'high': 3346.3,
-        'low': 3341.58,
-        'close': 3344.66,
-        'volume': 1891.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.21 04:45',
-        'open': 3344.66,
-        'high': 3344.97,
-        'low': 3342.62,
-        'close': 3342.76,
-        'volume': 1392.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.21 05:00',
-        'open': 3342.75,
-        'high': 3343.96,
-        'low': 3341.58,
-        'close': 3343.05,
-        'volume': 1330.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.21 05:15',
-        'open': 3343.04,
-        'high': 3343.22,
-        'low': 3340.4,
-        'close': 3341.11,
-        'volume': 1197.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.21 05:30',
-        'open': 3341.12,
-        'high': 3342.34,
-        'low': 3341.12,
-        'close': 3341.94,
-        'volume': 1239.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.21 05:45',
-        'open': 3341.94,
-        'high': 3344.95,
-        'low': 3341.92,
-        'close': 3344.58,
-        'volume': 1425.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.21 06:00',
-        'open': 3344.59,
-        'high': 3344.67,
-        'low': 3342.93,
-        'close': 3343.95,
-        'volume': 983.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.21 06:15',
-        'open': 3343.94,
-        'high': 3344.78,
-        'low': 3342.79,
-        'close': 3342.81,
-        'volume': 1065.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.21 06:30',
-        'open': 3342.81,
-        'high': 3343.14,
-        'low': 3341.93,
-        'close': 3342.4,
-        'volume': 796.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.21 06:45',
-        'open': 3342.38,
-        'high': 3342.82,
-        'low': 3339.74,
-        'close': 3339.88,
-        'volume': 1170.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.21 07:00',
-        'open': 3339.88,
-        'high': 3340.48,
-        'low': 3339.35,
-        'close': 3339.77,
-        'volume': 762.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.21 07:15',
-        'open': 3339.76,
-        'high': 3340.01,
-        'low': 3338.67,
-        'close': 3339.97,
-        'volume': 860.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.21 07:30',
-        'open': 3339.96,
-        'high': 3340.99,
-        'low': 3338.59,
-        'close': 3338.73,
-        'volume': 856.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.21 07:45',
-        'open': 3338.74,
-        'high': 3339.06,
-        'low': 3337.95,
-        'close': 3338.23,
-        'volume': 676.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.21 08:00',
-        'open': 3338.24,
-        'high': 3338.48,
-        'low': 3337.02,
-        'close': 3337.28,
-        'volume': 818.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.21 08:15',
-        'open': 3337.29,
-        'high': 3339.91,
-        'low': 3337.13,
-        'close': 3338.83,
-        'volume': 1144.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.21 08:30',
-        'open': 3338.84,
-        'high': 3340.62,
-        'low': 3338.62,
-        'close': 3339.15,
-        'volume': 1384.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.21 08:45',
-        'open': 3339.14,
-        'high': 3340.19,
-        'low': 3338.66,
-        'close': 3338.81,
-        'volume': 1005.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.21 09:00',
-        'open': 3338.81,
-        'high': 3339.84,
-        'low': 3337.86,
-        'close': 3338.34,
-        'volume': 1733.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.21 09:15',
-        'open': 3338.34,
-        'high': 3338.44,
-        'low': 3334.27,
-        'close': 3334.55,
-        'volume': 2070.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.21 09:30',
-        'open': 3334.54,
-        'high': 3337.9,
-        'low': 3334.51,
-        'close': 3337.39,
-        'volume': 1560.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.21 09:45',
-        'open': 3337.38,
-        'high': 3337.39,
-        'low': 3335.2,
-        'close': 3336.53,
-        'volume': 1213.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.21 10:00',
-        'open': 3336.55,
-        'high': 3338.81,
-        'low': 3335.26,
-        'close': 3338.79,
-        'volume': 1516.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.21 10:15',
-        'open': 3338.8,
-        'high': 3339.2,
-        'low': 3336.97,
-        'close': 3337.89,
-        'volume': 1543.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.21 10:30',
-        'open': 3337.92,
-        'high': 3340.58,
-        'low': 3337.17,
-        'close': 3339.9,
-        'volume': 1306.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.21 10:45',
-        'open': 3339.89,
-        'high': 3341.45,
-        'low': 3338.66,
-        'close': 3339.61,
-        'volume': 1168.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.21 11:00',
-        'open': 3339.61,
-        'high': 3340.48,
-        'low': 3338.96,
-        'close': 3340.27,
-        'volume': 1107.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.21 11:15',
-        'open': 3340.28,
-        'high': 3340.69,
-        'low': 3339.25,
-        'close': 3339.95,
-        'volume': 780.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.21 11:30',
-        'open': 3339.94,
-        'high': 3340.94,
-        'low': 3338.65,
-        'close': 3338.83,
-        'volume': 912.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.21 11:45',
-        'open': 3338.83,
-        'high': 3341.32,
-        'low': 3337.87,
-        'close': 3339.59,
-        'volume': 1452.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.21 12:00',
-        'open': 3339.59,
-        'high': 3340.61,
-        'low': 3337.98,
-        'close': 3340.42,
-        'volume': 1162.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.21 12:15',
-        'open': 3340.43,
-        'high': 3340.63,
-        'low': 3338.44,
-        'close': 3339.38,
-        'volume': 995.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.21 12:30',
-        'open': 3339.37,
-        'high': 3340.34,
-        'low': 3338.54,
-        'close': 3339.34,
-        'volume': 921.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.21 12:45',
-        'open': 3339.36,
-        'high': 3342.11,
-        'low': 3339.36,
-        'close': 3340.61,
-        'volume': 1149.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.21 13:00',
-        'open': 3340.61,
-        'high': 3341.48,
-        'low': 3339.09,
-        'close': 3340.32,
-        'volume': 887.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.21 13:15',
-        'open': 3340.34,
-        'high': 3340.51,
-        'low': 3338.57,
-        'close': 3339.53,
-        'volume': 713.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.21 13:30',
-        'open': 3339.52,
-        'high': 3339.52,
-        'low': 3329.01,
-        'close': 3330.49,
-        'volume': 2225.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.21 13:45',
-        'open': 3330.49,
-        'high': 3331.62,
-        'low': 3327.53,
-        'close': 3328.38,
-        'volume': 2447.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.21 14:00',
-        'open': 3328.38,
-        'high': 3329.64,
-        'low': 3325.17,
-        'close': 3329.43,
-        'volume': 2300.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.21 14:15',
-        'open': 3329.44,
-        'high': 3332.74,
-        'low': 3328.86,
-        'close': 3331.03,
-        'volume': 1747.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.21 14:30',
-        'open': 3331.04,
-        'high': 3334.23,
-        'low': 3330.15,
-        'close': 3333.73,
-        'volume': 1754.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.21 14:45',
-        'open': 3333.73,
-        'high': 3334.35,
-        'low': 3332.16,
-        'close': 3333.57,
-        'volume': 1694.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.21 15:00',
-        'open': 3333.57,
-        'high': 3342.74,
-        'low': 3333.57,
-        'close': 3341.41,
-        'volume': 2470.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.21 15:15',
-        'open': 3341.45,
-        'high': 3342.1,
-        'low': 3336.37,
-        'close': 3337.81,
-        'volume': 2540.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.21 15:30',
-        'open': 3337.78,
-        'high': 3345.04,
-        'low': 3336.68,
-        'close': 3339.15,
-        'volume': 4176.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.21 15:45',
-        'open': 3339.16,
-        'high': 3343.21,
-        'low': 3337.84,
-        'close': 3341.91,
-        'volume': 2746.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.21 16:00',
-        'open': 3341.89,
-        'high': 3343.46,
-        'low': 3339.2,
-        'close': 3342.19,
-        'volume': 3272.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.21 16:15',
-        'open': 3342.18,
-        'high': 3345.39,
-        'low': 3341.35,
-        'close': 3345.27,
-        'volume': 2369.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.21 16:30',
-        'open': 3345.28,
-        'high': 3347.58,
-        'low': 3344.8,
-        'close': 3345.2,
-        'volume': 3209.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.21 16:45',
-        'open': 3345.13,
-        'high': 3345.13,
-        'low': 3336.1,
-        'close': 3339.34,
-        'volume': 4676.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.21 17:00',
-        'open': 3339.37,
-        'high': 3345.41,
-        'low': 3337.91,
-        'close': 3344.83,
-        'volume': 4631.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.21 17:15',
-        'open': 3344.82,
-        'high': 3345.53,
-        'low': 3342.38,
-        'close': 3344.76,
-        'volume': 3108.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.21 17:30',
-        'open': 3344.78,
-        'high': 3348.03,
-        'low': 3342.57,
-        'close': 3342.76,
-        'volume': 3156.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.21 17:45',
-        'open': 3342.76,
-        'high': 3344.68,
-        'low': 3341.56,
-        'close': 3344.18,
-        'volume': 2505.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.21 18:00',
-        'open': 3344.18,
-        'high': 3345.24,
-        'low': 3338.61,
-        'close': 3338.75,
-        'volume': 2519.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.21 18:15',
-        'open': 3338.77,
-        'high': 3344.65,
-        'low': 3337.55,
-        'close': 3342.99,
-        'volume': 2620.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.21 18:30',
-        'open': 3343.02,
-        'high': 3345.88,
-        'low': 3341.3,
-        'close': 3345.62,
-        'volume': 2737.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.21 18:45',
-        'open': 3345.63,
-        'high': 3346.1,
-        'low': 3343.03,
-        'close': 3343.53,
-        'volume': 1799.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.21 19:00',
-        'open': 3343.54,
-        'high': 3343.87,
-        'low': 3341.6,
-        'close': 3341.85,
-        'volume': 1594.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.21 19:15',
-        'open': 3341.85,
-        'high': 3342.2,
-        'low': 3340.0,
-        'close': 3341.05,
-        'volume': 1345.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.21 19:30',
-        'open': 3341.05,
-        'high': 3341.28,
-        'low': 3338.97,
-        'close': 3340.95,
-        'volume': 1312.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.21 19:45',
-        'open': 3340.93,
-        'high': 3341.2,
-        'low': 3338.28,
-        'close': 3339.7,
-        'volume': 1235.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.21 20:00',
-        'open': 3339.71,
-        'high': 3342.05,
-        'low': 3339.43,
-        'close': 3341.16,
-        'volume': 1163.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.21 20:15',
-        'open': 3341.16,
-        'high': 3341.36,
-        'low': 3337.86,
-        'close': 3338.45,
-        'volume': 1148.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.21 20:30',
-        'open': 3338.47,
-        'high': 3340.11,
-        'low': 3338.02,
-        'close': 3338.02,
-        'volume': 981.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.21 20:45',
-        'open': 3338.02,
-        'high': 3338.64,
-        'low': 3336.93,
-        'close': 3337.01,
-        'volume': 862.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.21 21:00',
-        'open': 3337.01,
-        'high': 3338.36,
-        'low': 3336.61,
-        'close': 3337.41,
-        'volume': 1099.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.21 21:15',
-        'open': 3337.41,
-        'high': 3339.34,
-        'low': 3337.29,
-        'close': 3338.54,
-        'volume': 877.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.21 21:30',
-        'open': 3338.53,
-        'high': 3339.06,
-        'low': 3338.16,
-        'close': 3338.72,
-        'volume': 691.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.21 21:45',
-        'open': 3338.71,
-        'high': 3339.53,
-        'low': 3338.44,
-        'close': 3339.29,
-        'volume': 599.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.21 22:00',
-        'open': 3339.29,
-        'high': 3340.37,
-        'low': 3338.99,
-        'close': 3340.18,
-        'volume': 758.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.21 22:15',
-        'open': 3340.18,
-        'high': 3341.67,
-        'low': 3340.11,
-        'close': 3341.51,
-        'volume': 822.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.21 22:30',
-        'open': 3341.51,
-        'high': 3341.86,
-        'low': 3340.64,
-        'close': 3340.72,
-        'volume': 611.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.21 22:45',
-        'open': 3340.71,
-        'high': 3341.2,
-        'low': 3337.95,
-        'close': 3338.75,
-        'volume': 1148.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.21 23:00',
-        'open': 3338.74,
-        'high': 3339.21,
-        'low': 3338.1,
-        'close': 3338.39,
-        'volume': 425.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.21 23:15',
-        'open': 3338.4,
-        'high': 3338.63,
-        'low': 3337.96,
-        'close': 3338.61,
-        'volume': 424.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.21 23:30',
-        'open': 3338.61,
-        'high': 3339.01,
-        'low': 3338.09,
-        'close': 3338.31,
-        'volume': 431.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.21 23:45',
-        'open': 3338.31,
-        'high': 3338.51,
-        'low': 3337.87,
-        'close': 3338.43,
-        'volume': 200.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.22 01:00',
-        'open': 3338.28,
-        'high': 3339.96,
-        'low': 3338.28,
-        'close': 3339.19,
-        'volume': 459.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.22 01:15',
-        'open': 3339.16,
-        'high': 3340.52,
-        'low': 3338.85,
-        'close': 3340.2,
-        'volume': 524.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.22 01:30',
-        'open': 3340.2,
-        'high': 3340.53,
-        'low': 3339.71,
-        'close': 3340.06,
-        'volume': 592.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.22 01:45',
-        'open': 3340.05,
-        'high': 3340.29,
-        'low': 3338.81,
-        'close': 3338.89,
-        'volume': 579.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.22 02:00',
-        'open': 3338.89,
-        'high': 3339.45,
-        'low': 3337.95,
-        'close': 3338.06,
-        'volume': 482.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.22 02:15',
-        'open': 3338.06,
-        'high': 3338.15,
-        'low': 3337.37,
-        'close': 3337.89,
-        'volume': 358.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.22 02:30',
-        'open': 3337.83,
-        'high': 3339.47,
-        'low': 3337.51,
-        'close': 3338.77,
-        'volume': 484.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.22 02:45',
-        'open': 3338.78,
-        'high': 3339.48,
-        'low': 3337.98,
-        'close': 3338.31,
-        'volume': 477.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.22 03:00',
-        'open': 3338.32,
-        'high': 3338.39,
-        'low': 3336.37,
-        'close': 3336.42,
-        'volume': 1012.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.22 03:15',
-        'open': 3336.43,
-        'high': 3338.36,
-        'low': 3335.05,
-        'close': 3337.6,
-        'volume': 1583.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.22 03:30',
-        'open': 3337.59,
-        'high': 3339.05,
-        'low': 3337.09,
-        'close': 3337.44,
-        'volume': 864.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.22 03:45',
-        'open': 3337.44,
-        'high': 3339.82,
-        'low': 3336.84,
-        'close': 3339.53,
-        'volume': 950.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.22 04:00',
-        'open': 3339.56,
-        'high': 3340.18,
-        'low': 3338.54,
-        'close': 3338.91,
-        'volume': 1299.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.22 04:15',
-        'open': 3338.92,
-        'high': 3339.0,
-        'low': 3336.81,
-        'close': 3337.32,
-        'volume': 1239.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.22 04:30',
-        'open': 3337.32,
-        'high': 3338.48,
-        'low': 3336.24,
-        'close': 3337.96,
-        'volume': 1397.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.22 04:45',
-        'open': 3337.97,
-        'high': 3338.25,
-        'low': 3333.77,
-        'close': 3334.1,
-        'volume': 1789.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.22 05:00',
-        'open': 3334.1,
-        'high': 3336.2,
-        'low': 3333.32,
-        'close': 3334.51,
-        'volume': 1835.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.22 05:15',
-        'open': 3334.5,
-        'high': 3335.93,
-        'low': 3334.22,
-        'close': 3335.15,
-        'volume': 1275.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.22 05:30',
-        'open': 3335.15,
-        'high': 3335.56,
-        'low': 3333.47,
-        'close': 3333.85,
-        'volume': 1372.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.22 05:45',
-        'open': 3333.84,
-        'high': 3334.49,
-        'low': 3332.76,
-        'close': 3334.06,
-        'volume': 1113.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.22 06:00',
-        'open': 3334.07,
-        'high': 3334.07,
-        'low': 3331.4,
-        'close': 3332.39,
-        'volume': 1395.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.22 06:15',
-        'open': 3332.39,
-        'high': 3334.21,
-        'low': 3332.38,
-        'close': 3333.66,
-        'volume': 1230.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.22 06:30',
-        'open': 3333.65,
-        'high': 3335.31,
-        'low': 3333.34,
-        'close': 3334.06,
-        'volume': 1182.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.22 06:45',
-        'open': 3334.06,
-        'high': 3334.09,
-        'low': 3331.77,
-        'close': 3331.9,
-        'volume': 988.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.22 07:00',
-        'open': 3331.91,
-        'high': 3332.66,
-        'low': 3331.39,
-        'close': 3331.8,
-        'volume': 1012.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.22 07:15',
-        'open': 3331.81,
-        'high': 3331.87,
-        'low': 3329.24,
-        'close': 3329.36,
-        'volume': 1121.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.22 07:30',
-        'open': 3329.35,
-        'high': 3329.97,
-        'low': 3328.63,
-        'close': 3329.15,
-        'volume': 982.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.22 07:45',
-        'open': 3329.14,
-        'high': 3329.4,
-        'low': 3327.99,
-        'close': 3328.41,
-        'volume': 920.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.22 08:00',
-        'open': 3328.41,
-        'high': 3329.03,
-        'low': 3327.76,
-        'close': 3328.59,
-        'volume': 976.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.22 08:15',
-        'open': 3328.6,
-        'high': 3329.75,
-        'low': 3327.23,
-        'close': 3329.6,
-        'volume': 1209.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.22 08:30',
-        'open': 3329.61,
-        'high': 3330.28,
-        'low': 3328.05,
-        'close': 3330.13,
-        'volume': 1524.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.22 08:45',
-        'open': 3330.12,
-        'high': 3331.24,
-        'low': 3329.29,
-        'close': 3330.05,
-        'volume': 1314.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.22 09:00',
-        'open': 3330.04,
-        'high': 3330.2,
-        'low': 3327.71,
-        'close': 3329.41,
-        'volume': 1671.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.22 09:15',
-        'open': 3329.42,
-        'high': 3330.35,
-        'low': 3326.98,
-        'close': 3327.43,
-        'volume': 1480.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.22 09:30',
-        'open': 3327.43,
-        'high': 3327.77,
-        'low': 3326.12,
-        'close': 3326.12,
-        'volume': 1320.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.22 09:45',
-        'open': 3326.11,
-        'high': 3329.42,
-        'low': 3325.57,
-        'close': 3329.41,
-        'volume': 1386.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.22 10:00',
-        'open': 3329.42,
-        'high': 3333.87,
-        'low': 3328.86,
-        'close': 3333.14,
-        'volume': 1759.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.22 10:15',
-        'open': 3333.14,
-        'high': 3335.0,
-        'low': 3332.29,
-        'close': 3332.44,
-        'volume': 1619.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.22 10:30',
-        'open': 3332.44,
-        'high': 3332.57,
-        'low': 3328.07,
-        'close': 3328.32,
-        'volume': 1417.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.22 10:45',
-        'open': 3328.32,
-        'high': 3328.32,
-        'low': 3325.82,
-        'close': 3327.48,
-        'volume': 1830.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.22 11:00',
-        'open': 3327.47,
-        'high': 3329.21,
-        'low': 3325.98,
-        'close': 3328.6,
-        'volume': 1605.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.22 11:15',
-        'open': 3328.59,
-        'high': 3330.6,
-        'low': 3325.36,
-        'close': 3329.13,
-        'volume': 2025.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.22 11:30',
-        'open': 3329.14,
-        'high': 3330.38,
-        'low': 3327.88,
-        'close': 3328.15,
-        'volume': 1209.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.22 11:45',
-        'open': 3328.14,
-        'high': 3330.43,
-        'low': 3326.94,
-        'close': 3328.71,
-        'volume': 1304.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.22 12:00',
-        'open': 3328.72,
-        'high': 3331.24,
-        'low': 3328.67,
-        'close': 3330.98,
-        'volume': 1064.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.22 12:15',
-        'open': 3331.0,
-        'high': 3331.26,
-        'low': 3328.17,
-        'close': 3328.24,
-        'volume': 861.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.22 12:30',
-        'open': 3328.24,
-        'high': 3331.57,
-        'low': 3328.16,
-        'close': 3330.47,
-        'volume': 1070.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.22 12:45',
-        'open': 3330.46,
-        'high': 3331.17,
-        'low': 3329.39,
-        'close': 3330.08,
-        'volume': 873.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.22 13:00',
-        'open': 3330.08,
-        'high': 3331.45,
-        'low': 3330.01,
-        'close': 3330.61,
-        'volume': 898.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.22 13:15',
-        'open': 3330.62,
-        'high': 3330.7,
-        'low': 3328.93,
-        'close': 3330.39,
-        'volume': 924.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.22 13:30',
-        'open': 3330.4,
-        'high': 3331.17,
-        'low': 3329.16,
-        'close': 3330.28,
-        'volume': 923.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.22 13:45',
-        'open': 3330.28,
-        'high': 3331.66,
-        'low': 3329.85,
-        'close': 3330.89,
-        'volume': 821.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.22 14:00',
-        'open': 3330.89,
-        'high': 3331.0,
-        'low': 3329.2,
-        'close': 3329.49,
-        'volume': 1168.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.22 14:15',
-        'open': 3329.49,
-        'high': 3329.5,
-        'low': 3327.83,
-        'close': 3329.38,
-        'volume': 1314.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.22 14:30',
-        'open': 3329.39,
-        'high': 3331.01,
-        'low': 3328.55,
-        'close': 3329.22,
-        'volume': 1346.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.22 14:45',
-        'open': 3329.22,
-        'high': 3330.09,
-        'low': 3327.69,
-        'close': 3329.36,
-        'volume': 1210.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.22 15:00',
-        'open': 3329.36,
-        'high': 3329.48,
-        'low': 3325.05,
-        'close': 3325.68,
-        'volume': 2037.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.22 15:15',
-        'open': 3325.68,
-        'high': 3329.94,
-        'low': 3325.37,
-        'close': 3325.98,
-        'volume': 3030.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.22 15:30',
-        'open': 3326.0,
-        'high': 3327.14,
-        'low': 3321.42,
-        'close': 3324.32,
-        'volume': 3513.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.22 15:45',
-        'open': 3324.32,
-        'high': 3326.35,
-        'low': 3323.35,
-        'close': 3323.47,
-        'volume': 2473.0,
-        'spread': 0.0,
-    },
-    {
-        'time': '2025.08.22 16:00',
-        'open': 3323.46,
-        'high': 3324.75,
-        'low': 3323.19,
-        'close': 3324.61,
-        'volume': 341.0,
-        'spread': 0.0,
-    },
-]
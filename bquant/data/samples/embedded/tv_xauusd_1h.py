@@ -1,17018 +0,0 @@
-"""
-Embedded sample data for TradingView XAUUSD 1H
-
-Auto-generated from original TradingView via OANDA dataset
-Generated on: 2025-08-25 18:38:50
-Rows: 1000
-Source: TradingView via OANDA
-
-DO NOT EDIT THIS FILE MANUALLY!
-Use scripts/data/extract_samples.py to regenerate.
-"""
-
-from typing import Dict, List, Any
-
-DATASET_INFO = {'name': 'TradingView XAUUSD 1H', 'description': 'Часовые данные XAUUSD с техническими индикаторами', 'source': 'TradingView via OANDA', 'symbol': 'XAUUSD', 'timeframe': '1H', 'rows': 1000, 'columns': ['time', 'open', 'high', 'low', 'close', 'Volume', 'Accumulation/Distribution', 'MACD', 'Signal', 'RSI', 'RSI-based MA', 'Regular Bullish', 'Regular Bullish Label', 'Regular Bearish', 'Regular Bearish Label'], 'period_start': '2025-06-11T20:00:00+07:00', 'period_end': '2025-08-12T13:00:00+07:00', 'license': 'Open data, free for research and educational use', 'disclaimer': 'For demonstration purposes only. Not for production trading.', 'updated': '2025-08-25 18:38:50', 'extracted_from': 'OANDA_XAUUSD, 60.csv'}
-
-DATA = [
-    {
-        'time': '2025-06-11T20:00:00+07:00',
-        'open': 3336.94,
-        'high': 3344.77,
-        'low': 3327.95,
-        'close': 3330.0,
-        'volume': 54323.0,
-        'accumulation_distribution': 6642770.32110492,
-        'macd': 1.9401445111593605,
-        'signal': 2.76537114439529,
-        'rsi': 47.8275212676637,
-        'rsi_based_ma': 55.23196702366443,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-11T21:00:00+07:00',
-        'open': 3329.98,
-        'high': 3341.31,
-        'low': 3328.575,
-        'close': 3337.635,
-        'volume': 37324.0,
-        'accumulation_distribution': 6658552.789891729,
-        'macd': 2.030300040450129,
-        'signal': 2.6183569236062576,
-        'rsi': 53.65638494735591,
-        'rsi_based_ma': 55.13888568068245,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-11T22:00:00+07:00',
-        'open': 3337.715,
-        'high': 3342.93,
-        'low': 3329.655,
-        'close': 3333.22,
-        'volume': 22725.0,
-        'accumulation_distribution': 6648033.383112067,
-        'macd': 1.72560365980371,
-        'signal': 2.439806270845748,
-        'rsi': 50.16611327700602,
-        'rsi_based_ma': 55.03537205529848,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-11T23:00:00+07:00',
-        'open': 3333.265,
-        'high': 3334.57,
-        'low': 3328.185,
-        'close': 3330.39,
-        'volume': 16495.0,
-        'accumulation_distribution': 6642931.170895935,
-        'macd': 1.241461439527484,
-        'signal': 2.2001373045820958,
-        'rsi': 48.01029281922148,
-        'rsi_based_ma': 54.29267310412921,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-12T00:00:00+07:00',
-        'open': 3330.41,
-        'high': 3331.435,
-        'low': 3319.38,
-        'close': 3324.365,
-        'volume': 21476.0,
-        'accumulation_distribution': 6639216.740369182,
-        'macd': 0.3673732448432929,
-        'signal': 1.8335844926343348,
-        'rsi': 43.7042250783799,
-        'rsi_based_ma': 53.18929821897969,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-12T01:00:00+07:00',
-        'open': 3324.37,
-        'high': 3347.38,
-        'low': 3323.9,
-        'close': 3343.925,
-        'volume': 28737.0,
-        'accumulation_distribution': 6659496.641987581,
-        'macd': 1.2387016023430988,
-        'signal': 1.7146079145760875,
-        'rsi': 57.14311948752936,
-        'rsi_based_ma': 52.9356823858756,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-12T02:00:00+07:00',
-        'open': 3343.93,
-        'high': 3349.39,
-        'low': 3342.385,
-        'close': 3346.835,
-        'volume': 15825.0,
-        'accumulation_distribution': 6663777.637704926,
-        'macd': 2.1393867644601414,
-        'signal': 1.7995636845528984,
-        'rsi': 58.72188075542785,
-        'rsi_based_ma': 52.93950590042157,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-12T03:00:00+07:00',
-        'open': 3346.86,
-        'high': 3355.61,
-        'low': 3346.685,
-        'close': 3355.25,
-        'volume': 5993.0,
-        'accumulation_distribution': 6669287.168797363,
-        'macd': 3.491953352849123,
-        'signal': 2.138041618212143,
-        'rsi': 62.9699888984629,
-        'rsi_based_ma': 53.42240519433877,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-12T05:00:00+07:00',
-        'open': 3357.905,
-        'high': 3369.875,
-        'low': 3356.3,
-        'close': 3369.025,
-        'volume': 9527.0,
-        'accumulation_distribution': 6677621.1006574,
-        'macd': 5.610722579046978,
-        'signal': 2.83257781037911,
-        'rsi': 68.65649371158224,
-        'rsi_based_ma': 53.89343256255086,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-12T06:00:00+07:00',
-        'open': 3369.01,
-        'high': 3373.645,
-        'low': 3357.625,
-        'close': 3365.535,
-        'volume': 17252.0,
-        'accumulation_distribution': 6677405.719883367,
-        'macd': 6.928382541691462,
-        'signal': 3.651738756641581,
-        'rsi': 65.89549748731461,
-        'rsi_based_ma': 54.255937085683065,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-12T07:00:00+07:00',
-        'open': 3365.505,
-        'high': 3371.26,
-        'low': 3362.26,
-        'close': 3366.035,
-        'volume': 26877.0,
-        'accumulation_distribution': 6673075.536550032,
-        'macd': 7.921667326764236,
-        'signal': 4.505724470666111,
-        'rsi': 66.1057972950731,
-        'rsi_based_ma': 55.33741205323869,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-12T08:00:00+07:00',
-        'open': 3366.03,
-        'high': 3376.935,
-        'low': 3362.57,
-        'close': 3371.08,
-        'volume': 31735.0,
-        'accumulation_distribution': 6678940.933347804,
-        'macd': 9.012056633282556,
-        'signal': 5.4069909031894,
-        'rsi': 68.23424134510654,
-        'rsi_based_ma': 56.789446429805615,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-12T09:00:00+07:00',
-        'open': 3371.055,
-        'high': 3377.895,
-        'low': 3368.97,
-        'close': 3374.685,
-        'volume': 22536.0,
-        'accumulation_distribution': 6685266.163599905,
-        'macd': 10.051227096984348,
-        'signal': 6.33583814194839,
-        'rsi': 69.69853835598339,
-        'rsi_based_ma': 58.157287335010274,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-12T10:00:00+07:00',
-        'open': 3374.66,
-        'high': 3376.685,
-        'low': 3371.655,
-        'close': 3373.5,
-        'volume': 16319.0,
-        'accumulation_distribution': 6680918.756045232,
-        'macd': 10.656318177127105,
-        'signal': 7.199934148984132,
-        'rsi': 68.5794567711588,
-        'rsi_based_ma': 59.24068224980466,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-12T11:00:00+07:00',
-        'open': 3373.52,
-        'high': 3373.885,
-        'low': 3369.505,
-        'close': 3370.47,
-        'volume': 8933.0,
-        'accumulation_distribution': 6675921.9866388375,
-        'macd': 10.767243460120426,
-        'signal': 7.913396011211391,
-        'rsi': 65.67575432953751,
-        'rsi_based_ma': 60.51555603993851,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-12T12:00:00+07:00',
-        'open': 3370.47,
-        'high': 3375.86,
-        'low': 3367.8,
-        'close': 3374.535,
-        'volume': 13130.0,
-        'accumulation_distribution': 6684735.051154966,
-        'macd': 11.055720608219872,
-        'signal': 8.541860930613087,
-        'rsi': 67.65443373045302,
-        'rsi_based_ma': 61.51541666730258,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-12T13:00:00+07:00',
-        'open': 3374.61,
-        'high': 3375.685,
-        'low': 3365.29,
-        'close': 3375.04,
-        'volume': 20642.0,
-        'accumulation_distribution': 6702815.417677332,
-        'macd': 11.19602925008394,
-        'signal': 9.072694594507258,
-        'rsi': 67.90198667441132,
-        'rsi_based_ma': 62.78226476711725,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-12T14:00:00+07:00',
-        'open': 3374.985,
-        'high': 3375.32,
-        'low': 3338.59,
-        'close': 3346.305,
-        'volume': 31480.0,
-        'accumulation_distribution': 6684559.931698567,
-        'macd': 8.886116884022158,
-        'signal': 9.03537905241024,
-        'rsi': 46.22378174820175,
-        'rsi_based_ma': 62.65465683347298,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-12T15:00:00+07:00',
-        'open': 3346.475,
-        'high': 3361.205,
-        'low': 3346.42,
-        'close': 3356.885,
-        'volume': 28664.0,
-        'accumulation_distribution': 6696473.376406042,
-        'macd': 7.819078797973816,
-        'signal': 8.792119001522954,
-        'rsi': 52.26638786326395,
-        'rsi_based_ma': 63.26623988953612,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-12T16:00:00+07:00',
-        'open': 3356.88,
-        'high': 3368.105,
-        'low': 3355.545,
-        'close': 3365.45,
-        'volume': 18403.0,
-        'accumulation_distribution': 6707096.127202219,
-        'macd': 7.577221849668149,
-        'signal': 8.549139571151994,
-        'rsi': 56.52528503465585,
-        'rsi_based_ma': 63.22210885718802,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-12T17:00:00+07:00',
-        'open': 3365.475,
-        'high': 3385.96,
-        'low': 3362.6,
-        'close': 3382.66,
-        'volume': 25213.0,
-        'accumulation_distribution': 6725185.591243315,
-        'macd': 8.674260173933817,
-        'signal': 8.574163691708359,
-        'rsi': 63.56058252651746,
-        'rsi_based_ma': 63.567730412265846,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-12T18:00:00+07:00',
-        'open': 3382.665,
-        'high': 3388.68,
-        'low': 3373.255,
-        'close': 3379.305,
-        'volume': 26122.0,
-        'accumulation_distribution': 6719554.754938614,
-        'macd': 9.167275839111426,
-        'signal': 8.692786121188972,
-        'rsi': 61.472149929444505,
-        'rsi_based_ma': 63.46074191447882,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-12T19:00:00+07:00',
-        'open': 3379.3,
-        'high': 3390.54,
-        'low': 3376.455,
-        'close': 3388.325,
-        'volume': 34712.0,
-        'accumulation_distribution': 6743349.171694026,
-        'macd': 10.168615453263556,
-        'signal': 8.98795198760389,
-        'rsi': 64.81902261028681,
-        'rsi_based_ma': 63.18663683581486,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-12T20:00:00+07:00',
-        'open': 3388.33,
-        'high': 3399.05,
-        'low': 3379.255,
-        'close': 3392.065,
-        'volume': 50783.0,
-        'accumulation_distribution': 6758292.893593496,
-        'macd': 11.135606712747176,
-        'signal': 9.417482932632549,
-        'rsi': 66.13271751247582,
-        'rsi_based_ma': 63.20358112332638,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-12T21:00:00+07:00',
-        'open': 3392.08,
-        'high': 3393.29,
-        'low': 3382.985,
-        'close': 3383.865,
-        'volume': 43169.0,
-        'accumulation_distribution': 6722496.765015133,
-        'macd': 11.112188392254666,
-        'signal': 9.75642402455697,
-        'rsi': 60.77433443280306,
-        'rsi_based_ma': 62.822762347449945,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-12T22:00:00+07:00',
-        'open': 3383.875,
-        'high': 3390.38,
-        'low': 3377.885,
-        'close': 3385.87,
-        'volume': 33974.0,
-        'accumulation_distribution': 6731945.316435699,
-        'macd': 11.12714909964916,
-        'signal': 10.030569039575408,
-        'rsi': 61.59375053928194,
-        'rsi_based_ma': 62.34844157560533,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-12T23:00:00+07:00',
-        'open': 3385.92,
-        'high': 3391.43,
-        'low': 3381.025,
-        'close': 3383.83,
-        'volume': 21755.0,
-        'accumulation_distribution': 6721919.826286732,
-        'macd': 10.84933029091644,
-        'signal': 10.194321289843614,
-        'rsi': 60.21545416076692,
-        'rsi_based_ma': 61.67107841880415,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-13T00:00:00+07:00',
-        'open': 3383.825,
-        'high': 3385.05,
-        'low': 3378.165,
-        'close': 3382.635,
-        'volume': 18554.0,
-        'accumulation_distribution': 6727457.730426166,
-        'macd': 10.412699255118696,
-        'signal': 10.237996882898631,
-        'rsi': 59.37725256165349,
-        'rsi_based_ma': 61.01377811812521,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-13T01:00:00+07:00',
-        'open': 3382.685,
-        'high': 3386.42,
-        'low': 3381.925,
-        'close': 3385.995,
-        'volume': 17185.0,
-        'accumulation_distribution': 6741393.06413028,
-        'macd': 10.219980360916452,
-        'signal': 10.234393578502196,
-        'rsi': 61.020245416411385,
-        'rsi_based_ma': 60.68124176718762,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-13T02:00:00+07:00',
-        'open': 3385.81,
-        'high': 3389.505,
-        'low': 3384.8,
-        'close': 3388.275,
-        'volume': 12161.0,
-        'accumulation_distribution': 6747195.709188729,
-        'macd': 10.134403103510977,
-        'signal': 10.214395483503951,
-        'rsi': 62.13925996651552,
-        'rsi_based_ma': 60.28730078404924,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-13T03:00:00+07:00',
-        'open': 3388.27,
-        'high': 3389.03,
-        'low': 3384.84,
-        'close': 3386.58,
-        'volume': 3900.0,
-        'accumulation_distribution': 6746534.850000184,
-        'macd': 9.816649946244524,
-        'signal': 10.134846376052067,
-        'rsi': 60.7431693126408,
-        'rsi_based_ma': 59.77595668677992,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-13T05:00:00+07:00',
-        'open': 3383.865,
-        'high': 3385.03,
-        'low': 3379.535,
-        'close': 3383.57,
-        'volume': 4729.0,
-        'accumulation_distribution': 6748750.896406008,
-        'macd': 9.215713427631272,
-        'signal': 9.951019786367908,
-        'rsi': 58.240772677331016,
-        'rsi_based_ma': 60.63431318171772,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-13T06:00:00+07:00',
-        'open': 3383.525,
-        'high': 3396.345,
-        'low': 3382.655,
-        'close': 3395.875,
-        'volume': 8681.0,
-        'accumulation_distribution': 6756835.830664591,
-        'macd': 9.621467284243408,
-        'signal': 9.885109285943008,
-        'rsi': 64.65177727401246,
-        'rsi_based_ma': 61.51898385391405,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-13T07:00:00+07:00',
-        'open': 3395.855,
-        'high': 3420.095,
-        'low': 3391.835,
-        'close': 3415.35,
-        'volume': 62577.0,
-        'accumulation_distribution': 6798398.8274798775,
-        'macd': 11.383280507694508,
-        'signal': 10.184743530293307,
-        'rsi': 71.98299173192795,
-        'rsi_based_ma': 62.62310576086205,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-13T08:00:00+07:00',
-        'open': 3415.255,
-        'high': 3433.47,
-        'low': 3414.04,
-        'close': 3427.625,
-        'volume': 42588.0,
-        'accumulation_distribution': 6815363.887696039,
-        'macd': 13.61309678808857,
-        'signal': 10.87041418185236,
-        'rsi': 75.44045360966327,
-        'rsi_based_ma': 63.471667981086746,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-13T09:00:00+07:00',
-        'open': 3427.58,
-        'high': 3444.325,
-        'low': 3424.92,
-        'close': 3441.44,
-        'volume': 30946.0,
-        'accumulation_distribution': 6837108.216992613,
-        'macd': 16.307020121296773,
-        'signal': 11.957735369741242,
-        'rsi': 78.6359177938147,
-        'rsi_based_ma': 64.69765139997033,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-13T10:00:00+07:00',
-        'open': 3441.415,
-        'high': 3444.495,
-        'low': 3423.855,
-        'close': 3425.64,
-        'volume': 28438.0,
-        'accumulation_distribution': 6813588.9989693565,
-        'macd': 16.971409967869477,
-        'signal': 12.960470289366889,
-        'rsi': 67.7748384772996,
-        'rsi_based_ma': 64.90878110475695,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-13T11:00:00+07:00',
-        'open': 3425.615,
-        'high': 3430.385,
-        'low': 3422.915,
-        'close': 3425.33,
-        'volume': 14990.0,
-        'accumulation_distribution': 6808291.328286625,
-        'macd': 17.273807597317045,
-        'signal': 13.82313775095692,
-        'rsi': 67.57762153649723,
-        'rsi_based_ma': 65.0119885350442,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-13T12:00:00+07:00',
-        'open': 3425.365,
-        'high': 3428.92,
-        'low': 3418.05,
-        'close': 3426.255,
-        'volume': 19164.0,
-        'accumulation_distribution': 6818058.445121952,
-        'macd': 17.387665482527154,
-        'signal': 14.536043297270968,
-        'rsi': 67.87798234543628,
-        'rsi_based_ma': 65.51939195737513,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-13T13:00:00+07:00',
-        'open': 3426.22,
-        'high': 3428.67,
-        'low': 3408.5,
-        'close': 3416.455,
-        'volume': 27780.0,
-        'accumulation_distribution': 6812191.176901823,
-        'macd': 16.49695396259176,
-        'signal': 14.928225430335129,
-        'rsi': 61.38925151340548,
-        'rsi_based_ma': 65.50478488409826,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-13T14:00:00+07:00',
-        'open': 3416.41,
-        'high': 3419.105,
-        'low': 3407.925,
-        'close': 3415.0,
-        'volume': 22790.0,
-        'accumulation_distribution': 6818245.407671053,
-        'macd': 15.495035205234217,
-        'signal': 15.041587385314944,
-        'rsi': 60.4650705901914,
-        'rsi_based_ma': 65.52261462905714,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-13T15:00:00+07:00',
-        'open': 3414.925,
-        'high': 3426.22,
-        'low': 3414.365,
-        'close': 3424.365,
-        'volume': 16203.0,
-        'accumulation_distribution': 6829377.709231576,
-        'macd': 15.28054005111926,
-        'signal': 15.089377918475808,
-        'rsi': 64.20073802555535,
-        'rsi_based_ma': 65.86714930505013,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-13T16:00:00+07:00',
-        'open': 3424.42,
-        'high': 3427.375,
-        'low': 3420.16,
-        'close': 3424.41,
-        'volume': 19065.0,
-        'accumulation_distribution': 6832773.208192075,
-        'macd': 14.941940827226972,
-        'signal': 15.05989050022604,
-        'rsi': 64.21823401167295,
-        'rsi_based_ma': 66.09557706185453,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-13T17:00:00+07:00',
-        'open': 3424.365,
-        'high': 3427.855,
-        'low': 3411.6,
-        'close': 3415.985,
-        'volume': 22310.0,
-        'accumulation_distribution': 6822500.039936154,
-        'macd': 13.834298234978178,
-        'signal': 14.814772047176469,
-        'rsi': 58.4578761600081,
-        'rsi_based_ma': 65.83262107567542,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-13T18:00:00+07:00',
-        'open': 3415.98,
-        'high': 3423.165,
-        'low': 3412.635,
-        'close': 3422.24,
-        'volume': 20945.0,
-        'accumulation_distribution': 6839765.24411469,
-        'macd': 13.307805625838228,
-        'signal': 14.51337876290882,
-        'rsi': 61.23785204363789,
-        'rsi_based_ma': 65.86795555646093,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-13T19:00:00+07:00',
-        'open': 3422.34,
-        'high': 3438.26,
-        'low': 3421.765,
-        'close': 3436.51,
-        'volume': 23884.0,
-        'accumulation_distribution': 6858581.405375679,
-        'macd': 13.882003090177475,
-        'signal': 14.387103628362553,
-        'rsi': 66.71097007824264,
-        'rsi_based_ma': 66.47296965652605,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-13T20:00:00+07:00',
-        'open': 3436.495,
-        'high': 3446.88,
-        'low': 3433.945,
-        'close': 3437.1,
-        'volume': 47196.0,
-        'accumulation_distribution': 6834408.734328132,
-        'macd': 14.220738960070776,
-        'signal': 14.353830694704197,
-        'rsi': 66.91894884667242,
-        'rsi_based_ma': 66.63491048314462,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-13T21:00:00+07:00',
-        'open': 3437.08,
-        'high': 3439.97,
-        'low': 3423.775,
-        'close': 3428.035,
-        'volume': 47585.0,
-        'accumulation_distribution': 6811857.646029273,
-        'macd': 13.600936704744072,
-        'signal': 14.203251896712173,
-        'rsi': 60.64928798719643,
-        'rsi_based_ma': 65.82536021566379,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-13T22:00:00+07:00',
-        'open': 3428.0,
-        'high': 3430.61,
-        'low': 3420.93,
-        'close': 3426.305,
-        'volume': 30368.0,
-        'accumulation_distribution': 6815214.439417702,
-        'macd': 12.822334519462856,
-        'signal': 13.927068421262309,
-        'rsi': 59.50350992896619,
-        'rsi_based_ma': 64.68700709561399,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-13T23:00:00+07:00',
-        'open': 3426.3,
-        'high': 3431.1,
-        'low': 3419.215,
-        'close': 3430.15,
-        'volume': 17501.0,
-        'accumulation_distribution': 6829917.635463138,
-        'macd': 12.372918738749831,
-        'signal': 13.616238484759814,
-        'rsi': 61.25545422205509,
-        'rsi_based_ma': 63.44554541191688,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-14T00:00:00+07:00',
-        'open': 3430.31,
-        'high': 3433.56,
-        'low': 3427.415,
-        'close': 3430.45,
-        'volume': 17235.0,
-        'accumulation_distribution': 6829707.28151684,
-        'macd': 11.903742058831996,
-        'signal': 13.27373919957425,
-        'rsi': 61.39578316361175,
-        'rsi_based_ma': 62.98989860379633,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-14T01:00:00+07:00',
-        'open': 3430.49,
-        'high': 3439.6,
-        'low': 3428.71,
-        'close': 3436.61,
-        'volume': 20685.0,
-        'accumulation_distribution': 6839033.576282681,
-        'macd': 11.891894323183353,
-        'signal': 12.99737022429607,
-        'rsi': 64.25834864923088,
-        'rsi_based_ma': 62.7528076832773,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-14T02:00:00+07:00',
-        'open': 3436.635,
-        'high': 3438.245,
-        'low': 3431.75,
-        'close': 3432.425,
-        'volume': 17156.0,
-        'accumulation_distribution': 6825443.488522867,
-        'macd': 11.413245592140356,
-        'signal': 12.680545297864928,
-        'rsi': 60.95157079690373,
-        'rsi_based_ma': 62.25806400123925,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-14T03:00:00+07:00',
-        'open': 3432.415,
-        'high': 3434.925,
-        'low': 3429.025,
-        'close': 3432.835,
-        'volume': 8388.0,
-        'accumulation_distribution': 6827888.803777103,
-        'macd': 10.940876978449978,
-        'signal': 12.332611633981935,
-        'rsi': 61.16243387557306,
-        'rsi_based_ma': 62.24186274139408,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-16T05:00:00+07:00',
-        'open': 3440.48,
-        'high': 3451.525,
-        'low': 3438.6,
-        'close': 3448.49,
-        'volume': 15400.0,
-        'accumulation_distribution': 6836056.463351571,
-        'macd': 11.694937158852554,
-        'signal': 12.20507673895606,
-        'rsi': 68.21933262478362,
-        'rsi_based_ma': 62.79573860100781,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-16T06:00:00+07:00',
-        'open': 3448.36,
-        'high': 3450.26,
-        'low': 3439.6,
-        'close': 3444.225,
-        'volume': 13993.0,
-        'accumulation_distribution': 6834205.606878775,
-        'macd': 11.812221492115896,
-        'signal': 12.126505689588027,
-        'rsi': 64.76659488288512,
-        'rsi_based_ma': 62.836156947959935,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-16T07:00:00+07:00',
-        'open': 3444.22,
-        'high': 3451.375,
-        'low': 3434.245,
-        'close': 3436.43,
-        'volume': 22581.0,
-        'accumulation_distribution': 6817385.200574046,
-        'macd': 11.147675354448438,
-        'signal': 11.93073962256011,
-        'rsi': 58.89917578063436,
-        'rsi_based_ma': 62.456224217171474,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-16T08:00:00+07:00',
-        'open': 3436.48,
-        'high': 3443.24,
-        'low': 3433.255,
-        'close': 3441.635,
-        'volume': 24453.0,
-        'accumulation_distribution': 6833976.995766837,
-        'macd': 10.915194188419264,
-        'signal': 11.72763053573194,
-        'rsi': 61.41295355113186,
-        'rsi_based_ma': 62.66730117368031,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-16T09:00:00+07:00',
-        'open': 3441.645,
-        'high': 3446.51,
-        'low': 3438.005,
-        'close': 3438.52,
-        'volume': 19783.0,
-        'accumulation_distribution': 6816589.820575773,
-        'macd': 10.360171118870312,
-        'signal': 11.454138652359614,
-        'rsi': 59.0839617528123,
-        'rsi_based_ma': 62.51345186719277,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-16T10:00:00+07:00',
-        'open': 3438.465,
-        'high': 3439.765,
-        'low': 3429.35,
-        'close': 3431.565,
-        'volume': 16219.0,
-        'accumulation_distribution': 6807269.540690992,
-        'macd': 9.252444541657953,
-        'signal': 11.01379983021928,
-        'rsi': 54.14651681431261,
-        'rsi_based_ma': 61.6159909197692,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-16T11:00:00+07:00',
-        'open': 3431.655,
-        'high': 3433.325,
-        'low': 3426.915,
-        'close': 3427.7,
-        'volume': 11157.0,
-        'accumulation_distribution': 6798845.222438262,
-        'macd': 7.970807541942577,
-        'signal': 10.40520137256394,
-        'rsi': 51.56754746041252,
-        'rsi_based_ma': 60.51946224932205,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-16T12:00:00+07:00',
-        'open': 3427.695,
-        'high': 3430.58,
-        'low': 3417.77,
-        'close': 3421.72,
-        'volume': 23769.0,
-        'accumulation_distribution': 6789734.700190018,
-        'macd': 6.39880353883882,
-        'signal': 9.603921805818915,
-        'rsi': 47.77595700331703,
-        'rsi_based_ma': 59.59993860761639,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-16T13:00:00+07:00',
-        'open': 3421.65,
-        'high': 3421.65,
-        'low': 3413.08,
-        'close': 3418.38,
-        'volume': 27048.0,
-        'accumulation_distribution': 6796141.636012656,
-        'macd': 4.827816886391702,
-        'signal': 8.648700821933474,
-        'rsi': 45.75251891810071,
-        'rsi_based_ma': 58.61772496398314,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-16T14:00:00+07:00',
-        'open': 3418.28,
-        'high': 3419.91,
-        'low': 3409.58,
-        'close': 3412.68,
-        'volume': 19903.0,
-        'accumulation_distribution': 6788184.289449248,
-        'macd': 3.08726817707975,
-        'signal': 7.536414292962729,
-        'rsi': 42.44840527546819,
-        'rsi_based_ma': 57.27436432494121,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-16T15:00:00+07:00',
-        'open': 3412.75,
-        'high': 3418.66,
-        'low': 3409.77,
-        'close': 3414.06,
-        'volume': 15901.0,
-        'accumulation_distribution': 6787629.8113840055,
-        'macd': 1.79849334013079,
-        'signal': 6.388830102396342,
-        'rsi': 43.51202140549182,
-        'rsi_based_ma': 55.9969527707898,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-16T16:00:00+07:00',
-        'open': 3414.045,
-        'high': 3419.58,
-        'low': 3411.93,
-        'close': 3412.08,
-        'volume': 14033.0,
-        'accumulation_distribution': 6774147.125109496,
-        'macd': 0.6103250964797553,
-        'signal': 5.2331291012130245,
-        'rsi': 42.30398608989714,
-        'rsi_based_ma': 54.42878401655168,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-16T17:00:00+07:00',
-        'open': 3412.18,
-        'high': 3421.425,
-        'low': 3410.795,
-        'close': 3421.085,
-        'volume': 13612.0,
-        'accumulation_distribution': 6786888.366878075,
-        'macd': 0.3908163574774335,
-        'signal': 4.264666552465906,
-        'rsi': 49.210340802557205,
-        'rsi_based_ma': 53.5901247312412,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-16T18:00:00+07:00',
-        'open': 3421.135,
-        'high': 3422.785,
-        'low': 3410.815,
-        'close': 3415.015,
-        'volume': 16375.0,
-        'accumulation_distribution': 6782004.59494825,
-        'macd': -0.2698336956723324,
-        'signal': 3.3577665028382584,
-        'rsi': 45.27609333308598,
-        'rsi_based_ma': 52.45538612106356,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-16T19:00:00+07:00',
-        'open': 3415.095,
-        'high': 3417.895,
-        'low': 3411.125,
-        'close': 3415.625,
-        'volume': 20998.0,
-        'accumulation_distribution': 6788921.218286507,
-        'macd': -0.7357010171353977,
-        'signal': 2.539072998843527,
-        'rsi': 45.745518903719166,
-        'rsi_based_ma': 50.850113712416096,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-16T20:00:00+07:00',
-        'open': 3415.615,
-        'high': 3418.11,
-        'low': 3382.54,
-        'close': 3388.34,
-        'volume': 48120.0,
-        'accumulation_distribution': 6756493.993096741,
-        'macd': -3.2688939212202968,
-        'signal': 1.3774796148307622,
-        'rsi': 32.3699887603491,
-        'rsi_based_ma': 48.53607041794924,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-16T21:00:00+07:00',
-        'open': 3388.26,
-        'high': 3399.635,
-        'low': 3387.57,
-        'close': 3396.985,
-        'volume': 44731.0,
-        'accumulation_distribution': 6781575.23760565,
-        'macd': -4.526707234435435,
-        'signal': 0.1966422449775227,
-        'rsi': 38.50516200398553,
-        'rsi_based_ma': 47.07935514818861,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-16T22:00:00+07:00',
-        'open': 3397.1,
-        'high': 3405.925,
-        'low': 3397.07,
-        'close': 3404.625,
-        'volume': 24400.0,
-        'accumulation_distribution': 6798810.923658727,
-        'macd': -4.851128408784007,
-        'signal': -0.8129118857747832,
-        'rsi': 43.39252088332642,
-        'rsi_based_ma': 45.79218138620252,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-16T23:00:00+07:00',
-        'open': 3404.595,
-        'high': 3405.105,
-        'low': 3397.28,
-        'close': 3399.49,
-        'volume': 14742.0,
-        'accumulation_distribution': 6792396.034201857,
-        'macd': -5.45965065753262,
-        'signal': -1.7422596401263508,
-        'rsi': 41.03209158332479,
-        'rsi_based_ma': 44.50276208838198,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-17T00:00:00+07:00',
-        'open': 3399.505,
-        'high': 3400.37,
-        'low': 3391.175,
-        'close': 3392.7,
-        'volume': 14246.0,
-        'accumulation_distribution': 6782875.461064281,
-        'macd': -6.4158472836743385,
-        'signal': -2.6769771688359483,
-        'rsi': 38.08216154345215,
-        'rsi_based_ma': 43.35530814046337,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-17T01:00:00+07:00',
-        'open': 3392.735,
-        'high': 3394.185,
-        'low': 3384.12,
-        'close': 3385.34,
-        'volume': 11810.0,
-        'accumulation_distribution': 6773928.491367312,
-        'macd': -7.679011622860344,
-        'signal': -3.6773840596408274,
-        'rsi': 35.13364234196433,
-        'rsi_based_ma': 42.18145777485993,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-17T02:00:00+07:00',
-        'open': 3385.505,
-        'high': 3388.57,
-        'low': 3382.91,
-        'close': 3384.1,
-        'volume': 16770.0,
-        'accumulation_distribution': 6764210.187480386,
-        'macd': -8.680077568115848,
-        'signal': -4.677922761335831,
-        'rsi': 34.64692632742661,
-        'rsi_based_ma': 41.24366986943918,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-17T03:00:00+07:00',
-        'open': 3384.05,
-        'high': 3386.09,
-        'low': 3383.37,
-        'close': 3385.22,
-        'volume': 3814.0,
-        'accumulation_distribution': 6765584.349245092,
-        'macd': -9.27612550165668,
-        'signal': -5.597563309400001,
-        'rsi': 35.51585953843153,
-        'rsi_based_ma': 40.51247991374853,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-17T05:00:00+07:00',
-        'open': 3388.445,
-        'high': 3398.625,
-        'low': 3386.735,
-        'close': 3395.525,
-        'volume': 8515.0,
-        'accumulation_distribution': 6769659.231499087,
-        'macd': -8.815352509397599,
-        'signal': -6.24112114939952,
-        'rsi': 43.02239018573824,
-        'rsi_based_ma': 40.55347883591067,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-17T06:00:00+07:00',
-        'open': 3395.48,
-        'high': 3402.955,
-        'low': 3392.94,
-        'close': 3402.9,
-        'volume': 13983.0,
-        'accumulation_distribution': 6783488.6488730265,
-        'macd': -7.765569082307138,
-        'signal': -6.546010735981044,
-        'rsi': 47.713490392972496,
-        'rsi_based_ma': 40.85358376358787,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-17T07:00:00+07:00',
-        'open': 3402.9,
-        'high': 3403.43,
-        'low': 3391.515,
-        'close': 3394.315,
-        'volume': 19008.0,
-        'accumulation_distribution': 6773414.329108025,
-        'macd': -7.539435980372218,
-        'signal': -6.744695784859279,
-        'rsi': 43.24958123278115,
-        'rsi_based_ma': 40.92112627379386,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-17T08:00:00+07:00',
-        'open': 3394.325,
-        'high': 3402.57,
-        'low': 3393.315,
-        'close': 3393.725,
-        'volume': 17994.0,
-        'accumulation_distribution': 6757014.611117749,
-        'macd': -7.323412199877566,
-        'signal': -6.860439067862936,
-        'rsi': 42.95217115708012,
-        'rsi_based_ma': 40.47411415625978,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-17T09:00:00+07:00',
-        'open': 3393.715,
-        'high': 3400.47,
-        'low': 3388.55,
-        'close': 3390.13,
-        'volume': 16210.0,
-        'accumulation_distribution': 6745101.892996944,
-        'macd': -7.357485737098159,
-        'signal': -6.959848401709981,
-        'rsi': 41.09768867520202,
-        'rsi_based_ma': 40.17565668069665,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-17T10:00:00+07:00',
-        'open': 3390.105,
-        'high': 3392.7,
-        'low': 3373.67,
-        'close': 3387.73,
-        'volume': 23035.0,
-        'accumulation_distribution': 6756104.948698468,
-        'macd': -7.491788528514917,
-        'signal': -7.066236427070968,
-        'rsi': 39.86038546925377,
-        'rsi_based_ma': 39.75529000680626,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-17T11:00:00+07:00',
-        'open': 3387.705,
-        'high': 3396.365,
-        'low': 3387.155,
-        'close': 3394.105,
-        'volume': 10511.0,
-        'accumulation_distribution': 6761457.455756014,
-        'macd': -7.003087997248713,
-        'signal': -7.053606741106517,
-        'rsi': 44.62902547772904,
-        'rsi_based_ma': 40.63093548661912,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-17T12:00:00+07:00',
-        'open': 3394.055,
-        'high': 3395.55,
-        'low': 3390.735,
-        'close': 3392.64,
-        'volume': 14419.0,
-        'accumulation_distribution': 6758447.88254729,
-        'macd': -6.657261791871861,
-        'signal': -6.974337751259585,
-        'rsi': 43.77010374224339,
-        'rsi_based_ma': 41.007002753637536,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-17T13:00:00+07:00',
-        'open': 3392.625,
-        'high': 3392.625,
-        'low': 3381.055,
-        'close': 3385.5,
-        'volume': 19303.0,
-        'accumulation_distribution': 6753976.660421102,
-        'macd': -6.880021752994253,
-        'signal': -6.955474551606519,
-        'rsi': 39.75435802917964,
-        'rsi_based_ma': 40.74713397834133,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-17T14:00:00+07:00',
-        'open': 3385.445,
-        'high': 3391.975,
-        'low': 3383.21,
-        'close': 3387.845,
-        'volume': 14707.0,
-        'accumulation_distribution': 6754824.011818706,
-        'macd': -6.789078454694391,
-        'signal': -6.922195332224094,
-        'rsi': 41.64789789492235,
-        'rsi_based_ma': 40.79112014345544,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-17T15:00:00+07:00',
-        'open': 3387.87,
-        'high': 3388.7,
-        'low': 3377.85,
-        'close': 3378.945,
-        'volume': 14875.0,
-        'accumulation_distribution': 6742951.431173545,
-        'macd': -7.350429677340344,
-        'signal': -7.007842201247344,
-        'rsi': 36.90672136874229,
-        'rsi_based_ma': 40.70716013097616,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-17T16:00:00+07:00',
-        'open': 3378.92,
-        'high': 3385.97,
-        'low': 3375.785,
-        'close': 3385.695,
-        'volume': 19298.0,
-        'accumulation_distribution': 6761207.320226075,
-        'macd': -7.168007647478135,
-        'signal': -7.039875290493503,
-        'rsi': 42.27409964840884,
-        'rsi_based_ma': 41.2171927957222,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-17T17:00:00+07:00',
-        'open': 3385.73,
-        'high': 3398.8,
-        'low': 3385.425,
-        'close': 3398.225,
-        'volume': 19113.0,
-        'accumulation_distribution': 6778676.959478411,
-        'macd': -5.943853548326842,
-        'signal': -6.82067094206017,
-        'rsi': 50.66430087311933,
-        'rsi_based_ma': 42.3612909775574,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-17T18:00:00+07:00',
-        'open': 3398.26,
-        'high': 3400.2,
-        'low': 3388.305,
-        'close': 3388.65,
-        'volume': 19368.0,
-        'accumulation_distribution': 6760432.450020656,
-        'macd': -5.680839897444002,
-        'signal': -6.592704733136936,
-        'rsi': 45.25166713456907,
-        'rsi_based_ma': 43.05670580585293,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-17T19:00:00+07:00',
-        'open': 3388.665,
-        'high': 3391.665,
-        'low': 3383.565,
-        'close': 3386.775,
-        'volume': 28078.0,
-        'accumulation_distribution': 6754608.864835471,
-        'macd': -5.559608804616346,
-        'signal': -6.386085547432819,
-        'rsi': 44.25462744229846,
-        'rsi_based_ma': 43.14472275275009,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-17T20:00:00+07:00',
-        'open': 3386.795,
-        'high': 3397.57,
-        'low': 3385.95,
-        'close': 3390.68,
-        'volume': 38796.0,
-        'accumulation_distribution': 6747397.215954231,
-        'macd': -5.089759842376679,
-        'signal': -6.126820406421591,
-        'rsi': 46.87970875948424,
-        'rsi_based_ma': 43.08516692178664,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-17T21:00:00+07:00',
-        'open': 3390.665,
-        'high': 3392.21,
-        'low': 3366.115,
-        'close': 3385.165,
-        'volume': 47931.0,
-        'accumulation_distribution': 6769447.863779485,
-        'macd': -5.103584617347224,
-        'signal': -5.922173248606717,
-        'rsi': 43.74651965063559,
-        'rsi_based_ma': 43.12066252306196,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-17T22:00:00+07:00',
-        'open': 3385.175,
-        'high': 3388.49,
-        'low': 3372.555,
-        'close': 3379.315,
-        'volume': 25545.0,
-        'accumulation_distribution': 6765576.43767343,
-        'macd': -5.522922151955299,
-        'signal': -5.842323029276434,
-        'rsi': 40.64347802707007,
-        'rsi_based_ma': 42.95575587091838,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-17T23:00:00+07:00',
-        'open': 3379.365,
-        'high': 3385.975,
-        'low': 3376.725,
-        'close': 3382.965,
-        'volume': 19159.0,
-        'accumulation_distribution': 6772266.553349107,
-        'macd': -5.497355580471776,
-        'signal': -5.773329539515503,
-        'rsi': 43.34378615735349,
-        'rsi_based_ma': 43.116191405357775,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-18T00:00:00+07:00',
-        'open': 3382.985,
-        'high': 3391.305,
-        'low': 3381.365,
-        'close': 3390.395,
-        'volume': 19619.0,
-        'accumulation_distribution': 6788293.342081501,
-        'macd': -4.821970311298628,
-        'signal': -5.583057693872128,
-        'rsi': 48.48170234317799,
-        'rsi_based_ma': 43.73199975349522,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-18T01:00:00+07:00',
-        'open': 3390.485,
-        'high': 3392.6,
-        'low': 3382.42,
-        'close': 3382.895,
-        'volume': 18836.0,
-        'accumulation_distribution': 6771215.122042208,
-        'macd': -4.836161678057124,
-        'signal': -5.433678490709127,
-        'rsi': 44.13117328572859,
-        'rsi_based_ma': 43.69643888263804,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-18T02:00:00+07:00',
-        'open': 3382.905,
-        'high': 3386.57,
-        'low': 3382.465,
-        'close': 3385.815,
-        'volume': 14233.0,
-        'accumulation_distribution': 6780212.597072658,
-        'macd': -4.559232843716472,
-        'signal': -5.258789361310596,
-        'rsi': 46.15698849227065,
-        'rsi_based_ma': 43.86693065049713,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-18T03:00:00+07:00',
-        'open': 3385.8,
-        'high': 3390.455,
-        'low': 3383.655,
-        'close': 3388.455,
-        'volume': 4792.0,
-        'accumulation_distribution': 6782185.773543246,
-        'macd': -4.0797104482221584,
-        'signal': -5.022973578692908,
-        'rsi': 47.99309162630244,
-        'rsi_based_ma': 44.45541162172019,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-18T05:00:00+07:00',
-        'open': 3395.865,
-        'high': 3395.975,
-        'low': 3388.885,
-        'close': 3388.885,
-        'volume': 5626.0,
-        'accumulation_distribution': 6776559.773543246,
-        'macd': -3.623221842655312,
-        'signal': -4.743023231485389,
-        'rsi': 48.302326128864266,
-        'rsi_based_ma': 44.93072792414461,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-18T06:00:00+07:00',
-        'open': 3389.155,
-        'high': 3390.545,
-        'low': 3385.145,
-        'close': 3387.43,
-        'volume': 5849.0,
-        'accumulation_distribution': 6775660.760580283,
-        'macd': -3.3403521734198875,
-        'signal': -4.462489019872288,
-        'rsi': 47.27793772851865,
-        'rsi_based_ma': 45.67152909270006,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-18T07:00:00+07:00',
-        'open': 3387.425,
-        'high': 3388.965,
-        'low': 3383.065,
-        'close': 3385.8,
-        'volume': 13670.0,
-        'accumulation_distribution': 6774664.47244469,
-        'macd': -3.2106924362879,
-        'signal': -4.21212970315541,
-        'rsi': 46.098453185918416,
-        'rsi_based_ma': 45.944697202522185,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-18T08:00:00+07:00',
-        'open': 3385.795,
-        'high': 3388.785,
-        'low': 3378.815,
-        'close': 3379.06,
-        'volume': 15740.0,
-        'accumulation_distribution': 6759698.053186916,
-        'macd': -3.610181902224213,
-        'signal': -4.09174014296917,
-        'rsi': 41.48924583803673,
-        'rsi_based_ma': 45.28933612858771,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-18T09:00:00+07:00',
-        'open': 3379.015,
-        'high': 3379.795,
-        'low': 3370.645,
-        'close': 3379.49,
-        'volume': 15361.0,
-        'accumulation_distribution': 6774034.986520248,
-        'macd': -3.847728556137099,
-        'signal': -4.042937825602756,
-        'rsi': 41.88845048743353,
-        'rsi_based_ma': 45.04910636807803,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-18T10:00:00+07:00',
-        'open': 3379.44,
-        'high': 3391.595,
-        'low': 3379.335,
-        'close': 3391.115,
-        'volume': 13428.0,
-        'accumulation_distribution': 6786411.528118944,
-        'macd': -3.0626414210987605,
-        'signal': -3.846878544701957,
-        'rsi': 51.51880732385124,
-        'rsi_based_ma': 45.567976359617525,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-18T11:00:00+07:00',
-        'open': 3391.045,
-        'high': 3400.11,
-        'low': 3389.475,
-        'close': 3395.125,
-        'volume': 12474.0,
-        'accumulation_distribution': 6787191.51965632,
-        'macd': -2.092756726455264,
-        'signal': -3.4960541810526182,
-        'rsi': 54.33034403192243,
-        'rsi_based_ma': 46.100164593363104,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-18T12:00:00+07:00',
-        'open': 3395.175,
-        'high': 3395.67,
-        'low': 3384.32,
-        'close': 3386.53,
-        'volume': 17078.0,
-        'accumulation_distribution': 6776764.159303897,
-        'macd': -1.9946675015753497,
-        'signal': -3.1957768451571646,
-        'rsi': 47.91619588845754,
-        'rsi_based_ma': 46.39799861035039,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-18T13:00:00+07:00',
-        'open': 3386.58,
-        'high': 3386.97,
-        'low': 3379.505,
-        'close': 3382.515,
-        'volume': 18369.0,
-        'accumulation_distribution': 6773208.47209693,
-        'macd': -2.215370615967913,
-        'signal': -2.999695599319314,
-        'rsi': 45.22994283563719,
-        'rsi_based_ma': 46.72560323953376,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-18T14:00:00+07:00',
-        'open': 3382.525,
-        'high': 3386.215,
-        'low': 3377.18,
-        'close': 3385.995,
-        'volume': 15591.0,
-        'accumulation_distribution': 6788040.198162231,
-        'macd': -2.085432935039534,
-        'signal': -2.8168430664633584,
-        'rsi': 47.95348809671624,
-        'rsi_based_ma': 47.05486766377395,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-18T15:00:00+07:00',
-        'open': 3385.945,
-        'high': 3388.515,
-        'low': 3382.6,
-        'close': 3383.635,
-        'volume': 11683.0,
-        'accumulation_distribution': 6780445.75437525,
-        'macd': -2.1481263994396613,
-        'signal': -2.683099733058619,
-        'rsi': 46.27299603684359,
-        'rsi_based_ma': 46.8971029276072,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-18T16:00:00+07:00',
-        'open': 3383.585,
-        'high': 3385.655,
-        'low': 3375.575,
-        'close': 3378.275,
-        'volume': 11115.0,
-        'accumulation_distribution': 6775285.218660965,
-        'macd': -2.600343485229587,
-        'signal': -2.6665484834928126,
-        'rsi': 42.61986072909478,
-        'rsi_based_ma': 46.789152030704784,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-18T17:00:00+07:00',
-        'open': 3378.29,
-        'high': 3382.61,
-        'low': 3375.8,
-        'close': 3380.3,
-        'volume': 13916.0,
-        'accumulation_distribution': 6779760.408088277,
-        'macd': -2.7634726152905387,
-        'signal': -2.685933309852358,
-        'rsi': 44.405584295064585,
-        'rsi_based_ma': 46.66405173090436,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-18T18:00:00+07:00',
-        'open': 3380.3,
-        'high': 3387.065,
-        'low': 3379.005,
-        'close': 3382.185,
-        'volume': 16439.0,
-        'accumulation_distribution': 6776293.125209864,
-        'macd': -2.7094174024859967,
-        'signal': -2.6906301283790857,
-        'rsi': 46.0875333787582,
-        'rsi_based_ma': 46.527940427508334,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-18T19:00:00+07:00',
-        'open': 3382.125,
-        'high': 3389.95,
-        'low': 3381.745,
-        'close': 3386.635,
-        'volume': 21728.0,
-        'accumulation_distribution': 6780463.947878971,
-        'macd': -2.281204145701849,
-        'signal': -2.6087449318436384,
-        'rsi': 49.93808107074452,
-        'rsi_based_ma': 46.64478006621407,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-18T20:00:00+07:00',
-        'open': 3386.675,
-        'high': 3396.945,
-        'low': 3385.71,
-        'close': 3392.325,
-        'volume': 26283.0,
-        'accumulation_distribution': 6785131.0226453245,
-        'macd': -1.465809666503901,
-        'signal': -2.380157878775691,
-        'rsi': 54.42075707705048,
-        'rsi_based_ma': 47.15498144825205,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-18T21:00:00+07:00',
-        'open': 3392.315,
-        'high': 3392.495,
-        'low': 3373.825,
-        'close': 3386.79,
-        'volume': 46482.0,
-        'accumulation_distribution': 6803205.972832792,
-        'macd': -1.2518019159469986,
-        'signal': -2.1544866862099523,
-        'rsi': 49.75367866954298,
-        'rsi_based_ma': 47.416068982796666,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-18T22:00:00+07:00',
-        'open': 3386.785,
-        'high': 3392.945,
-        'low': 3381.24,
-        'close': 3392.825,
-        'volume': 18943.0,
-        'accumulation_distribution': 6821760.5644603,
-        'macd': -0.588441975585738,
-        'signal': -1.8412777440851091,
-        'rsi': 54.35053126930348,
-        'rsi_based_ma': 48.33473222788715,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-18T23:00:00+07:00',
-        'open': 3392.855,
-        'high': 3394.85,
-        'low': 3390.05,
-        'close': 3391.06,
-        'volume': 14129.0,
-        'accumulation_distribution': 6813577.518626966,
-        'macd': -0.2028073559222321,
-        'signal': -1.513583666452534,
-        'rsi': 52.82831900367336,
-        'rsi_based_ma': 49.11615140761857,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-19T00:00:00+07:00',
-        'open': 3391.065,
-        'high': 3391.28,
-        'low': 3384.41,
-        'close': 3385.495,
-        'volume': 11303.0,
-        'accumulation_distribution': 6805844.752979222,
-        'macd': -0.3422923991388416,
-        'signal': -1.2793254129897955,
-        'rsi': 48.24067276216163,
-        'rsi_based_ma': 48.88199893892645,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-19T01:00:00+07:00',
-        'open': 3385.5,
-        'high': 3395.925,
-        'low': 3378.475,
-        'close': 3379.3,
-        'volume': 40350.0,
-        'accumulation_distribution': 6769310.082492117,
-        'macd': -0.9418628187627291,
-        'signal': -1.2118328941443823,
-        'rsi': 43.69198874832621,
-        'rsi_based_ma': 48.12211641866958,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-19T02:00:00+07:00',
-        'open': 3379.315,
-        'high': 3379.38,
-        'low': 3363.005,
-        'close': 3366.93,
-        'volume': 38191.0,
-        'accumulation_distribution': 6749427.439744024,
-        'macd': -2.387658870390624,
-        'signal': -1.4469980893936305,
-        'rsi': 36.326394655803135,
-        'rsi_based_ma': 47.294273473479976,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-19T03:00:00+07:00',
-        'open': 3366.825,
-        'high': 3369.69,
-        'low': 3362.605,
-        'close': 3369.3,
-        'volume': 9442.0,
-        'accumulation_distribution': 6757829.953505492,
-        'macd': -3.3041354479296388,
-        'signal': -1.818425561100832,
-        'rsi': 38.46671795143002,
-        'rsi_based_ma': 46.811185981750896,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-19T05:00:00+07:00',
-        'open': 3371.415,
-        'high': 3379.935,
-        'low': 3370.61,
-        'close': 3375.235,
-        'volume': 6816.0,
-        'accumulation_distribution': 6757775.133130156,
-        'macd': -3.5110713938884146,
-        'signal': -2.1569547276583485,
-        'rsi': 43.58119118774713,
-        'rsi_based_ma': 46.49887905968168,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-19T06:00:00+07:00',
-        'open': 3375.26,
-        'high': 3377.16,
-        'low': 3370.815,
-        'close': 3375.13,
-        'volume': 7871.0,
-        'accumulation_distribution': 6760609.685533624,
-        'macd': -3.6415645550368936,
-        'signal': -2.453876693134057,
-        'rsi': 43.51228535535932,
-        'rsi_based_ma': 46.30168543957566,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-19T07:00:00+07:00',
-        'open': 3375.22,
-        'high': 3383.43,
-        'low': 3374.82,
-        'close': 3379.6,
-        'volume': 13327.0,
-        'accumulation_distribution': 6762080.144302498,
-        'macd': -3.3457222789561456,
-        'signal': -2.632245810298475,
-        'rsi': 47.33016105467537,
-        'rsi_based_ma': 46.63813546283142,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-19T08:00:00+07:00',
-        'open': 3379.535,
-        'high': 3388.175,
-        'low': 3374.61,
-        'close': 3374.885,
-        'volume': 25629.0,
-        'accumulation_distribution': 6737490.285474632,
-        'macd': -3.451934486824939,
-        'signal': -2.796183545603768,
-        'rsi': 43.95542998230237,
-        'rsi_based_ma': 46.6059815833484,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-19T09:00:00+07:00',
-        'open': 3374.88,
-        'high': 3379.59,
-        'low': 3374.18,
-        'close': 3376.83,
-        'volume': 11030.0,
-        'accumulation_distribution': 6737266.015604022,
-        'macd': -3.34065419969329,
-        'signal': -2.9050776764216724,
-        'rsi': 45.67616578525647,
-        'rsi_based_ma': 46.57659818381256,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-19T10:00:00+07:00',
-        'open': 3376.835,
-        'high': 3377.39,
-        'low': 3369.74,
-        'close': 3373.69,
-        'volume': 11175.0,
-        'accumulation_distribution': 6737631.211682454,
-        'macd': -3.465882986701672,
-        'signal': -3.017238738477672,
-        'rsi': 43.36154359069149,
-        'rsi_based_ma': 46.10684550666592,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-19T11:00:00+07:00',
-        'open': 3373.705,
-        'high': 3375.26,
-        'low': 3372.125,
-        'close': 3374.685,
-        'volume': 6447.0,
-        'accumulation_distribution': 6741713.283452787,
-        'macd': -3.4451262473294264,
-        'signal': -3.102816240248023,
-        'rsi': 44.32433891198952,
-        'rsi_based_ma': 45.38567278059013,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-19T12:00:00+07:00',
-        'open': 3374.66,
-        'high': 3375.455,
-        'low': 3360.295,
-        'close': 3364.61,
-        'volume': 16618.0,
-        'accumulation_distribution': 6734555.266302392,
-        'macd': -4.19330685041632,
-        'signal': -3.3209143622816826,
-        'rsi': 37.39296775549704,
-        'rsi_based_ma': 44.50276485815828,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-19T13:00:00+07:00',
-        'open': 3364.605,
-        'high': 3364.825,
-        'low': 3347.53,
-        'close': 3357.455,
-        'volume': 39420.0,
-        'accumulation_distribution': 6740378.804897361,
-        'macd': -5.302470492715656,
-        'signal': -3.7172255883684775,
-        'rsi': 33.3985476726716,
-        'rsi_based_ma': 43.006194601256006,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-19T14:00:00+07:00',
-        'open': 3357.46,
-        'high': 3369.225,
-        'low': 3350.79,
-        'close': 3366.07,
-        'volume': 25757.0,
-        'accumulation_distribution': 6757319.603649735,
-        'macd': -5.423809864970735,
-        'signal': -4.058542443688929,
-        'rsi': 41.50142748398965,
-        'rsi_based_ma': 42.1971309212786,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-19T15:00:00+07:00',
-        'open': 3366.06,
-        'high': 3371.775,
-        'low': 3362.34,
-        'close': 3368.745,
-        'volume': 17488.0,
-        'accumulation_distribution': 6763575.247528908,
-        'macd': -5.243676212293394,
-        'signal': -4.295569197409822,
-        'rsi': 43.78826787083882,
-        'rsi_based_ma': 41.87910200046984,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-19T16:00:00+07:00',
-        'open': 3368.685,
-        'high': 3373.84,
-        'low': 3363.66,
-        'close': 3370.35,
-        'volume': 15415.0,
-        'accumulation_distribution': 6768420.827096688,
-        'macd': -4.914754675725362,
-        'signal': -4.41940629307293,
-        'rsi': 45.17317177951563,
-        'rsi_based_ma': 41.98490078841193,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-19T17:00:00+07:00',
-        'open': 3370.375,
-        'high': 3379.18,
-        'low': 3369.145,
-        'close': 3375.14,
-        'volume': 13718.0,
-        'accumulation_distribution': 6771093.342293499,
-        'macd': -4.218935754759059,
-        'signal': -4.379312185410155,
-        'rsi': 49.1960364987666,
-        'rsi_based_ma': 42.90416092005217,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-19T18:00:00+07:00',
-        'open': 3375.13,
-        'high': 3375.58,
-        'low': 3370.455,
-        'close': 3372.06,
-        'volume': 14162.0,
-        'accumulation_distribution': 6765801.590098377,
-        'macd': -3.8713974462557417,
-        'signal': -4.277729237579273,
-        'rsi': 46.817288427940994,
-        'rsi_based_ma': 43.50063023980296,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-19T19:00:00+07:00',
-        'open': 3372.065,
-        'high': 3372.66,
-        'low': 3363.84,
-        'close': 3368.005,
-        'volume': 16463.0,
-        'accumulation_distribution': 6764886.978987266,
-        'macd': -3.87846689177286,
-        'signal': -4.19787676841799,
-        'rsi': 43.81361801246858,
-        'rsi_based_ma': 43.517232155854494,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-19T20:00:00+07:00',
-        'open': 3368.055,
-        'high': 3373.005,
-        'low': 3361.525,
-        'close': 3369.635,
-        'volume': 22012.0,
-        'accumulation_distribution': 6773975.557384479,
-        'macd': -3.709778088211806,
-        'signal': -4.100257032376753,
-        'rsi': 45.33193058031124,
-        'rsi_based_ma': 43.64720681477963,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-19T21:00:00+07:00',
-        'open': 3369.63,
-        'high': 3371.11,
-        'low': 3361.695,
-        'close': 3364.765,
-        'volume': 20006.0,
-        'accumulation_distribution': 6767016.486752507,
-        'macd': -3.923827850798261,
-        'signal': -4.064971196061054,
-        'rsi': 41.70572950917769,
-        'rsi_based_ma': 43.24546170438693,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-19T22:00:00+07:00',
-        'open': 3364.755,
-        'high': 3372.245,
-        'low': 3362.215,
-        'close': 3369.29,
-        'volume': 17428.0,
-        'accumulation_distribution': 6774175.346174242,
-        'macd': -3.6858460083713,
-        'signal': -3.989146158523104,
-        'rsi': 46.02595982856168,
-        'rsi_based_ma': 43.39335669340546,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-19T23:00:00+07:00',
-        'open': 3369.24,
-        'high': 3371.78,
-        'low': 3366.11,
-        'close': 3371.19,
-        'volume': 10174.0,
-        'accumulation_distribution': 6782232.0057862345,
-        'macd': -3.305822103240189,
-        'signal': -3.852481347466521,
-        'rsi': 47.77608907137687,
-        'rsi_based_ma': 43.54335121384264,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-20T00:00:00+07:00',
-        'open': 3371.075,
-        'high': 3375.625,
-        'low': 3365.93,
-        'close': 3368.38,
-        'volume': 10247.0,
-        'accumulation_distribution': 6777163.99495591,
-        'macd': -3.1945689342260266,
-        'signal': -3.720898864818422,
-        'rsi': 45.429892966454126,
-        'rsi_based_ma': 43.69109045496854,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-20T01:00:00+07:00',
-        'open': 3368.3,
-        'high': 3371.535,
-        'low': 3366.68,
-        'close': 3370.38,
-        'volume': 2731.0,
-        'accumulation_distribution': 6778595.590218526,
-        'macd': -2.9114552669443583,
-        'signal': -3.559010145243609,
-        'rsi': 47.40945776100976,
-        'rsi_based_ma': 43.911456087041415,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-20T05:00:00+07:00',
-        'open': 3369.735,
-        'high': 3370.525,
-        'low': 3362.1,
-        'close': 3365.815,
-        'volume': 7445.0,
-        'accumulation_distribution': 6777716.32909093,
-        'macd': -3.020623131416869,
-        'signal': -3.451332742478261,
-        'rsi': 43.52812936895048,
-        'rsi_based_ma': 44.3496819165738,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-20T06:00:00+07:00',
-        'open': 3365.785,
-        'high': 3370.565,
-        'low': 3363.71,
-        'close': 3368.88,
-        'volume': 9427.0,
-        'accumulation_distribution': 6782508.903124481,
-        'macd': -2.827229029434875,
-        'signal': -3.326511999869584,
-        'rsi': 46.68419312246821,
-        'rsi_based_ma': 45.29865659155927,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-20T07:00:00+07:00',
-        'open': 3368.87,
-        'high': 3370.475,
-        'low': 3364.69,
-        'close': 3368.23,
-        'volume': 12618.0,
-        'accumulation_distribution': 6785333.502951621,
-        'macd': -2.695342151478144,
-        'signal': -3.200278030191296,
-        'rsi': 46.09583354504896,
-        'rsi_based_ma': 45.62682845306351,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-20T08:00:00+07:00',
-        'open': 3368.245,
-        'high': 3368.38,
-        'low': 3356.15,
-        'close': 3356.54,
-        'volume': 20053.0,
-        'accumulation_distribution': 6766559.435085718,
-        'macd': -3.493831439101996,
-        'signal': -3.258988711973436,
-        'rsi': 37.051700321356265,
-        'rsi_based_ma': 45.14564505667189,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-20T09:00:00+07:00',
-        'open': 3356.545,
-        'high': 3360.69,
-        'low': 3351.64,
-        'close': 3352.525,
-        'volume': 20867.0,
-        'accumulation_distribution': 6749773.605251464,
-        'macd': -4.39989761670904,
-        'signal': -3.4871704929205567,
-        'rsi': 34.54476438930902,
-        'rsi_based_ma': 44.38647310022856,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-20T10:00:00+07:00',
-        'open': 3352.575,
-        'high': 3356.465,
-        'low': 3344.675,
-        'close': 3355.62,
-        'volume': 20567.0,
-        'accumulation_distribution': 6767392.494140352,
-        'macd': -4.812742654814883,
-        'signal': -3.752284925299422,
-        'rsi': 38.025779833798815,
-        'rsi_based_ma': 43.58859762415943,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-20T11:00:00+07:00',
-        'open': 3355.615,
-        'high': 3357.82,
-        'low': 3352.555,
-        'close': 3354.245,
-        'volume': 7273.0,
-        'accumulation_distribution': 6764788.580560105,
-        'macd': -5.191037284045251,
-        'signal': -4.040035397048587,
-        'rsi': 37.08225269379203,
-        'rsi_based_ma': 42.89323792886309,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-20T12:00:00+07:00',
-        'open': 3354.25,
-        'high': 3355.27,
-        'low': 3342.725,
-        'close': 3344.79,
-        'volume': 16773.0,
-        'accumulation_distribution': 6753537.500847072,
-        'macd': -6.182509859265338,
-        'signal': -4.468530289491937,
-        'rsi': 31.32616930756336,
-        'rsi_based_ma': 42.00127730708414,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-20T13:00:00+07:00',
-        'open': 3344.845,
-        'high': 3348.835,
-        'low': 3340.415,
-        'close': 3345.32,
-        'volume': 20766.0,
-        'accumulation_distribution': 6756965.617236622,
-        'macd': -6.846569456839006,
-        'signal': -4.944138122961351,
-        'rsi': 31.96369938521059,
-        'rsi_based_ma': 41.04640365029123,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-20T14:00:00+07:00',
-        'open': 3345.26,
-        'high': 3355.43,
-        'low': 3343.44,
-        'close': 3347.725,
-        'volume': 16950.0,
-        'accumulation_distribution': 6752130.838254136,
-        'macd': -7.096968634917175,
-        'signal': -5.374704225352516,
-        'rsi': 34.91630538924504,
-        'rsi_based_ma': 40.56144478458176,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-20T15:00:00+07:00',
-        'open': 3347.625,
-        'high': 3352.595,
-        'low': 3346.805,
-        'close': 3351.15,
-        'volume': 12801.0,
-        'accumulation_distribution': 6758542.392658282,
-        'macd': -6.939053818483444,
-        'signal': -5.6875741439787015,
-        'rsi': 38.97777339096026,
-        'rsi_based_ma': 40.05800289618166,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-20T16:00:00+07:00',
-        'open': 3351.14,
-        'high': 3359.27,
-        'low': 3349.31,
-        'close': 3355.32,
-        'volume': 12930.0,
-        'accumulation_distribution': 6761216.669766717,
-        'macd': -6.40360427491305,
-        'signal': -5.830780170165571,
-        'rsi': 43.59310778617588,
-        'rsi_based_ma': 39.7592185186673,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-20T17:00:00+07:00',
-        'open': 3355.395,
-        'high': 3358.0,
-        'low': 3355.035,
-        'close': 3355.49,
-        'volume': 8831.0,
-        'accumulation_distribution': 6755096.027270932,
-        'macd': -5.897555723398909,
-        'signal': -5.844135280812239,
-        'rsi': 43.77979093952884,
-        'rsi_based_ma': 39.64135408817264,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-20T18:00:00+07:00',
-        'open': 3355.495,
-        'high': 3356.095,
-        'low': 3346.39,
-        'close': 3347.16,
-        'volume': 16290.0,
-        'accumulation_distribution': 6741390.942263204,
-        'macd': -6.098371750293609,
-        'signal': -5.8949825747085125,
-        'rsi': 37.27068814208912,
-        'rsi_based_ma': 38.91715625824974,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-20T19:00:00+07:00',
-        'open': 3347.21,
-        'high': 3350.825,
-        'low': 3341.9,
-        'close': 3344.555,
-        'volume': 23373.0,
-        'accumulation_distribution': 6731923.895204379,
-        'macd': -6.394015398142528,
-        'signal': -5.994789139395316,
-        'rsi': 35.493459950802304,
-        'rsi_based_ma': 38.343251299810575,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-20T20:00:00+07:00',
-        'open': 3344.535,
-        'high': 3373.875,
-        'low': 3343.115,
-        'close': 3370.365,
-        'volume': 36763.0,
-        'accumulation_distribution': 6760296.899755744,
-        'macd': -4.493861385509263,
-        'signal': -5.694603588618105,
-        'rsi': 57.24624959297812,
-        'rsi_based_ma': 39.09768390484701,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-20T21:00:00+07:00',
-        'open': 3370.335,
-        'high': 3374.63,
-        'low': 3365.285,
-        'close': 3369.33,
-        'volume': 31378.0,
-        'accumulation_distribution': 6756082.946839746,
-        'macd': -3.0364887387399904,
-        'signal': -5.162980618642482,
-        'rsi': 56.42454389656707,
-        'rsi_based_ma': 39.83544892995544,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-20T22:00:00+07:00',
-        'open': 3369.34,
-        'high': 3371.895,
-        'low': 3365.865,
-        'close': 3369.905,
-        'volume': 15743.0,
-        'accumulation_distribution': 6761435.044683861,
-        'macd': -1.8141997563561745,
-        'signal': -4.493224446185221,
-        'rsi': 56.795574447589445,
-        'rsi_based_ma': 41.24572565325781,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-20T23:00:00+07:00',
-        'open': 3369.915,
-        'high': 3373.47,
-        'low': 3367.885,
-        'close': 3371.51,
-        'volume': 11821.0,
-        'accumulation_distribution': 6764959.120780549,
-        'macd': -0.7078571091169579,
-        'signal': -3.736150978771568,
-        'rsi': 57.87380549682885,
-        'rsi_based_ma': 42.91208573236637,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-21T00:00:00+07:00',
-        'open': 3371.525,
-        'high': 3371.79,
-        'low': 3366.635,
-        'close': 3367.46,
-        'volume': 10951.0,
-        'accumulation_distribution': 6757513.290518667,
-        'macd': -0.1560746121735974,
-        'signal': -3.020135705451974,
-        'rsi': 54.198166398529935,
-        'rsi_based_ma': 44.06725620127573,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-21T01:00:00+07:00',
-        'open': 3367.525,
-        'high': 3368.025,
-        'low': 3364.685,
-        'close': 3366.685,
-        'volume': 8045.0,
-        'accumulation_distribution': 6759103.021057588,
-        'macd': 0.2161888781629386,
-        'signal': -2.3728707887289917,
-        'rsi': 53.49797061260759,
-        'rsi_based_ma': 45.239807481191136,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-21T02:00:00+07:00',
-        'open': 3366.71,
-        'high': 3370.805,
-        'low': 3364.92,
-        'close': 3365.65,
-        'volume': 8501.0,
-        'accumulation_distribution': 6752711.02020797,
-        'macd': 0.4228205144304411,
-        'signal': -1.8137325280971048,
-        'rsi': 52.52208219330437,
-        'rsi_based_ma': 46.75380125874407,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-21T03:00:00+07:00',
-        'open': 3365.645,
-        'high': 3369.5,
-        'low': 3364.73,
-        'close': 3368.75,
-        'volume': 4939.0,
-        'accumulation_distribution': 6756096.875553883,
-        'macd': 0.8271863774384656,
-        'signal': -1.2855487469899909,
-        'rsi': 55.16042010954784,
-        'rsi_based_ma': 48.41070988191102,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-23T05:00:00+07:00',
-        'open': 3383.825,
-        'high': 3389.22,
-        'low': 3372.19,
-        'close': 3379.265,
-        'volume': 17042.0,
-        'accumulation_distribution': 6753214.846193929,
-        'macd': 1.9733740321889852,
-        'signal': -0.6337641911541954,
-        'rsi': 62.72650396206876,
-        'rsi_based_ma': 50.39715263711271,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-23T06:00:00+07:00',
-        'open': 3379.175,
-        'high': 3380.7,
-        'low': 3371.315,
-        'close': 3372.82,
-        'volume': 14389.0,
-        'accumulation_distribution': 6743440.751894516,
-        'macd': 2.3347646559145687,
-        'signal': -0.0400584217404424,
-        'rsi': 56.44018553556131,
-        'rsi_based_ma': 51.644467790298506,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-23T07:00:00+07:00',
-        'open': 3372.82,
-        'high': 3373.615,
-        'low': 3358.32,
-        'close': 3365.77,
-        'volume': 25397.0,
-        'accumulation_distribution': 6742784.863368854,
-        'macd': 2.028905290959756,
-        'signal': 0.3737343207995972,
-        'rsi': 50.48054326659632,
-        'rsi_based_ma': 52.13642746747139,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-23T08:00:00+07:00',
-        'open': 3365.765,
-        'high': 3368.18,
-        'low': 3351.935,
-        'close': 3355.325,
-        'volume': 32983.0,
-        'accumulation_distribution': 6723567.621448263,
-        'macd': 0.9329310843318126,
-        'signal': 0.4855736735060403,
-        'rsi': 43.20206950153172,
-        'rsi_based_ma': 52.0951616504716,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-23T09:00:00+07:00',
-        'open': 3355.33,
-        'high': 3364.965,
-        'low': 3354.825,
-        'close': 3361.59,
-        'volume': 16783.0,
-        'accumulation_distribution': 6729178.506063648,
-        'macd': 0.563402220628177,
-        'signal': 0.5011393829304677,
-        'rsi': 48.04125497815137,
-        'rsi_based_ma': 52.86448785304748,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-23T10:00:00+07:00',
-        'open': 3361.525,
-        'high': 3366.445,
-        'low': 3360.45,
-        'close': 3363.46,
-        'volume': 15113.0,
-        'accumulation_distribution': 6729241.529416442,
-        'macd': 0.4166385556677596,
-        'signal': 0.4842392174779261,
-        'rsi': 49.42631802934947,
-        'rsi_based_ma': 53.859692001515135,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-23T11:00:00+07:00',
-        'open': 3363.48,
-        'high': 3365.095,
-        'low': 3356.905,
-        'close': 3358.545,
-        'volume': 8932.0,
-        'accumulation_distribution': 6723886.691809604,
-        'macd': -0.0951750115305003,
-        'signal': 0.3683563716762408,
-        'rsi': 45.95859625601173,
-        'rsi_based_ma': 53.05343104887468,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-23T12:00:00+07:00',
-        'open': 3358.59,
-        'high': 3360.685,
-        'low': 3347.035,
-        'close': 3356.85,
-        'volume': 20471.0,
-        'accumulation_distribution': 6732854.939428652,
-        'macd': -0.630297606782733,
-        'signal': 0.168625575984446,
-        'rsi': 44.79148486024436,
-        'rsi_based_ma': 52.22249826056591,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-23T13:00:00+07:00',
-        'open': 3356.955,
-        'high': 3359.98,
-        'low': 3352.75,
-        'close': 3357.705,
-        'volume': 18359.0,
-        'accumulation_distribution': 6739660.211904447,
-        'macd': -0.9741651944382284,
-        'signal': -0.0599325781000888,
-        'rsi': 45.5427314340343,
-        'rsi_based_ma': 51.41872375959769,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-23T14:00:00+07:00',
-        'open': 3357.7,
-        'high': 3358.84,
-        'low': 3351.695,
-        'close': 3357.66,
-        'volume': 17479.0,
-        'accumulation_distribution': 6751365.882303325,
-        'macd': -1.236065268020866,
-        'signal': -0.2951591160842443,
-        'rsi': 45.50763267481507,
-        'rsi_based_ma': 50.53542570088241,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-23T15:00:00+07:00',
-        'open': 3357.73,
-        'high': 3362.445,
-        'low': 3357.73,
-        'close': 3361.94,
-        'volume': 17084.0,
-        'accumulation_distribution': 6764790.3192068245,
-        'macd': -1.0857469180587032,
-        'signal': -0.453276676479136,
-        'rsi': 49.49446188286009,
-        'rsi_based_ma': 50.199446806906,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-23T16:00:00+07:00',
-        'open': 3361.93,
-        'high': 3369.145,
-        'low': 3361.69,
-        'close': 3366.65,
-        'volume': 18947.0,
-        'accumulation_distribution': 6771055.155558267,
-        'macd': -0.5798764510732326,
-        'signal': -0.4785966313979554,
-        'rsi': 53.52423268648515,
-        'rsi_based_ma': 50.20132266932583,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-23T17:00:00+07:00',
-        'open': 3366.66,
-        'high': 3368.35,
-        'low': 3364.055,
-        'close': 3367.865,
-        'volume': 12888.0,
-        'accumulation_distribution': 6781032.478026252,
-        'macd': -0.0800078350466719,
-        'signal': -0.3988788721276987,
-        'rsi': 54.53206125214024,
-        'rsi_based_ma': 50.34489260209982,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-23T18:00:00+07:00',
-        'open': 3367.875,
-        'high': 3382.15,
-        'low': 3367.875,
-        'close': 3380.785,
-        'volume': 24814.0,
-        'accumulation_distribution': 6801100.963490349,
-        'macd': 1.343194161384872,
-        'signal': -0.0504642654251844,
-        'rsi': 63.57701831530974,
-        'rsi_based_ma': 50.94607818822567,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-23T19:00:00+07:00',
-        'open': 3380.755,
-        'high': 3381.18,
-        'low': 3355.935,
-        'close': 3360.485,
-        'volume': 28157.0,
-        'accumulation_distribution': 6783093.644615325,
-        'macd': 0.8235581852395626,
-        'signal': 0.1243402247077649,
-        'rsi': 47.56607921194252,
-        'rsi_based_ma': 49.8631907060738,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-23T20:00:00+07:00',
-        'open': 3360.48,
-        'high': 3387.895,
-        'low': 3359.835,
-        'close': 3380.775,
-        'volume': 39287.0,
-        'accumulation_distribution': 6802443.122163436,
-        'macd': 2.0256262018187954,
-        'signal': 0.504597420129971,
-        'rsi': 58.74832288593458,
-        'rsi_based_ma': 50.02805765967189,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-23T21:00:00+07:00',
-        'open': 3380.655,
-        'high': 3386.825,
-        'low': 3369.88,
-        'close': 3386.49,
-        'volume': 41145.0,
-        'accumulation_distribution': 6841961.26173263,
-        'macd': 3.4002307595164893,
-        'signal': 1.0837240880072745,
-        'rsi': 61.254743911017314,
-        'rsi_based_ma': 50.79764341998767,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-23T22:00:00+07:00',
-        'open': 3386.495,
-        'high': 3389.905,
-        'low': 3384.625,
-        'close': 3387.265,
-        'volume': 22814.0,
-        'accumulation_distribution': 6841961.261732629,
-        'macd': 4.500274435667052,
-        'signal': 1.76703415753923,
-        'rsi': 61.59551637652067,
-        'rsi_based_ma': 52.111461053915455,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-23T23:00:00+07:00',
-        'open': 3387.285,
-        'high': 3393.64,
-        'low': 3380.405,
-        'close': 3389.92,
-        'volume': 28842.0,
-        'accumulation_distribution': 6854589.851834632,
-        'macd': 5.5226417097374,
-        'signal': 2.518155667978864,
-        'rsi': 62.8025157253809,
-        'rsi_based_ma': 53.16583682157471,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-24T00:00:00+07:00',
-        'open': 3389.835,
-        'high': 3391.75,
-        'low': 3375.615,
-        'close': 3382.545,
-        'volume': 28370.0,
-        'accumulation_distribution': 6850589.743374762,
-        'macd': 5.672386534610268,
-        'signal': 3.149001841305145,
-        'rsi': 57.40541924903079,
-        'rsi_based_ma': 53.73577262298052,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-24T01:00:00+07:00',
-        'open': 3382.565,
-        'high': 3388.145,
-        'low': 3376.865,
-        'close': 3378.66,
-        'volume': 19004.0,
-        'accumulation_distribution': 6837634.002240011,
-        'macd': 5.415150867093871,
-        'signal': 3.60223164646289,
-        'rsi': 54.736860861627214,
-        'rsi_based_ma': 54.36279152338163,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-24T02:00:00+07:00',
-        'open': 3378.665,
-        'high': 3382.205,
-        'low': 3375.665,
-        'close': 3376.285,
-        'volume': 16610.0,
-        'accumulation_distribution': 6824173.298876096,
-        'macd': 4.962443140497271,
-        'signal': 3.874273945269766,
-        'rsi': 53.111427879027225,
-        'rsi_based_ma': 54.9570731675804,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-24T03:00:00+07:00',
-        'open': 3376.23,
-        'high': 3377.41,
-        'low': 3367.325,
-        'close': 3369.2,
-        'volume': 6775.0,
-        'accumulation_distribution': 6819917.510576641,
-        'macd': 3.9860203559496767,
-        'signal': 3.896623227405749,
-        'rsi': 48.48585854628859,
-        'rsi_based_ma': 55.16729653274143,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-24T05:00:00+07:00',
-        'open': 3358.435,
-        'high': 3363.9,
-        'low': 3350.45,
-        'close': 3355.54,
-        'volume': 12272.0,
-        'accumulation_distribution': 6816933.909089653,
-        'macd': 2.085905406735037,
-        'signal': 3.5344796632716062,
-        'rsi': 41.06079609182574,
-        'rsi_based_ma': 54.84966534824218,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-24T06:00:00+07:00',
-        'open': 3355.59,
-        'high': 3357.5,
-        'low': 3341.52,
-        'close': 3344.49,
-        'volume': 21502.0,
-        'accumulation_distribution': 6803424.517349978,
-        'macd': -0.308041125062573,
-        'signal': 2.7659755056047706,
-        'rsi': 36.22773322907908,
-        'rsi_based_ma': 53.90204187297211,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-24T07:00:00+07:00',
-        'open': 3344.485,
-        'high': 3355.335,
-        'low': 3333.28,
-        'close': 3351.18,
-        'volume': 30974.0,
-        'accumulation_distribution': 6822727.969174961,
-        'macd': -1.6464546058150518,
-        'signal': 1.883489483320806,
-        'rsi': 40.773038480796096,
-        'rsi_based_ma': 52.99124228685146,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-24T08:00:00+07:00',
-        'open': 3351.205,
-        'high': 3354.55,
-        'low': 3342.245,
-        'close': 3347.77,
-        'volume': 32981.0,
-        'accumulation_distribution': 6819364.202007143,
-        'macd': -2.948328932833647,
-        'signal': 0.9171258000899152,
-        'rsi': 39.23789202971178,
-        'rsi_based_ma': 51.898801628106575,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-24T09:00:00+07:00',
-        'open': 3347.72,
-        'high': 3352.96,
-        'low': 3346.06,
-        'close': 3352.035,
-        'volume': 16235.0,
-        'accumulation_distribution': 6831246.339688301,
-        'macd': -3.594488830836326,
-        'signal': 0.0148028739046669,
-        'rsi': 42.17063819300933,
-        'rsi_based_ma': 50.36977447651368,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-24T10:00:00+07:00',
-        'open': 3351.955,
-        'high': 3357.955,
-        'low': 3351.66,
-        'close': 3352.49,
-        'volume': 12482.0,
-        'accumulation_distribution': 6822055.859942471,
-        'macd': -4.023480331199153,
-        'signal': -0.7928537671160971,
-        'rsi': 42.4895462429619,
-        'rsi_based_ma': 50.00716497872935,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-24T11:00:00+07:00',
-        'open': 3352.505,
-        'high': 3353.52,
-        'low': 3347.105,
-        'close': 3348.655,
-        'volume': 10610.0,
-        'accumulation_distribution': 6816573.061813087,
-        'macd': -4.619659081270584,
-        'signal': -1.5582148299469945,
-        'rsi': 40.464078229922286,
-        'rsi_based_ma': 48.70114750329991,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-24T12:00:00+07:00',
-        'open': 3348.65,
-        'high': 3348.865,
-        'low': 3326.72,
-        'close': 3332.12,
-        'volume': 26580.0,
-        'accumulation_distribution': 6802955.987981522,
-        'macd': -6.353136346069732,
-        'signal': -2.517199133171542,
-        'rsi': 33.13079211631826,
-        'rsi_based_ma': 46.69229380367855,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-24T13:00:00+07:00',
-        'open': 3332.205,
-        'high': 3333.255,
-        'low': 3316.075,
-        'close': 3322.95,
-        'volume': 36861.0,
-        'accumulation_distribution': 6795596.66143903,
-        'macd': -8.370383361555469,
-        'signal': -3.687835978848328,
-        'rsi': 29.89502189669368,
-        'rsi_based_ma': 44.42797276940519,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-24T14:00:00+07:00',
-        'open': 3322.945,
-        'high': 3331.86,
-        'low': 3316.63,
-        'close': 3329.705,
-        'volume': 31047.0,
-        'accumulation_distribution': 6817857.543907841,
-        'macd': -9.31659816443971,
-        'signal': -4.8135884159666045,
-        'rsi': 34.936134698371845,
-        'rsi_based_ma': 42.43751698176168,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-24T15:00:00+07:00',
-        'open': 3329.775,
-        'high': 3332.375,
-        'low': 3324.695,
-        'close': 3327.435,
-        'volume': 21799.0,
-        'accumulation_distribution': 6811613.038699507,
-        'macd': -10.132845110694234,
-        'signal': -5.87743975491213,
-        'rsi': 34.050039536678625,
-        'rsi_based_ma': 40.76927557373653,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-24T16:00:00+07:00',
-        'open': 3327.36,
-        'high': 3328.875,
-        'low': 3317.98,
-        'close': 3318.59,
-        'volume': 19580.0,
-        'accumulation_distribution': 6794225.56738239,
-        'macd': -11.362464853649726,
-        'signal': -6.974444774659649,
-        'rsi': 30.774702210834025,
-        'rsi_based_ma': 39.057692812965584,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-24T17:00:00+07:00',
-        'open': 3318.585,
-        'high': 3327.735,
-        'low': 3318.555,
-        'close': 3325.61,
-        'volume': 13066.0,
-        'accumulation_distribution': 6801242.493308316,
-        'macd': -11.63635536617994,
-        'signal': -7.906826892963708,
-        'rsi': 36.03381877094112,
-        'rsi_based_ma': 37.83786359095944,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-24T18:00:00+07:00',
-        'open': 3325.57,
-        'high': 3329.035,
-        'low': 3317.965,
-        'close': 3321.25,
-        'volume': 17198.0,
-        'accumulation_distribution': 6794251.436397747,
-        'macd': -12.066140179516424,
-        'signal': -8.738689550274252,
-        'rsi': 34.29134387583426,
-        'rsi_based_ma': 36.82396968592699,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-24T19:00:00+07:00',
-        'open': 3321.145,
-        'high': 3321.145,
-        'low': 3304.48,
-        'close': 3314.825,
-        'volume': 33690.0,
-        'accumulation_distribution': 6802388.385092616,
-        'macd': -12.77789591441524,
-        'signal': -9.546530823102447,
-        'rsi': 31.847346063089503,
-        'rsi_based_ma': 36.16586611244583,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-24T20:00:00+07:00',
-        'open': 3314.77,
-        'high': 3317.96,
-        'low': 3295.315,
-        'close': 3302.12,
-        'volume': 47191.0,
-        'accumulation_distribution': 6783559.915894117,
-        'macd': -14.203426522504742,
-        'signal': -10.477909962982908,
-        'rsi': 27.650647015551144,
-        'rsi_based_ma': 35.55321709719383,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-24T21:00:00+07:00',
-        'open': 3302.135,
-        'high': 3310.41,
-        'low': 3298.645,
-        'close': 3304.515,
-        'volume': 41741.0,
-        'accumulation_distribution': 6783471.218486552,
-        'macd': -14.96737869097933,
-        'signal': -11.375803708582191,
-        'rsi': 29.5356817850998,
-        'rsi_based_ma': 34.75054876178695,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-24T22:00:00+07:00',
-        'open': 3304.51,
-        'high': 3317.115,
-        'low': 3299.845,
-        'close': 3313.34,
-        'volume': 29573.0,
-        'accumulation_distribution': 6800115.6631883485,
-        'macd': -14.691359692593778,
-        'signal': -12.03891490538451,
-        'rsi': 36.13833972218245,
-        'rsi_based_ma': 34.529152168391995,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-24T23:00:00+07:00',
-        'open': 3313.35,
-        'high': 3320.495,
-        'low': 3311.385,
-        'close': 3318.485,
-        'volume': 16693.0,
-        'accumulation_distribution': 6809442.487557175,
-        'macd': -13.897255238672187,
-        'signal': -12.410582972042048,
-        'rsi': 39.68662495826011,
-        'rsi_based_ma': 34.35172265162419,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-25T00:00:00+07:00',
-        'open': 3318.565,
-        'high': 3321.295,
-        'low': 3317.985,
-        'close': 3318.075,
-        'volume': 14984.0,
-        'accumulation_distribution': 6795273.327436326,
-        'macd': -13.14942690310818,
-        'signal': -12.558351758255274,
-        'rsi': 39.49828618720807,
-        'rsi_based_ma': 34.138061219070345,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-25T01:00:00+07:00',
-        'open': 3318.025,
-        'high': 3319.12,
-        'low': 3315.73,
-        'close': 3317.285,
-        'volume': 13138.0,
-        'accumulation_distribution': 6794188.182893553,
-        'macd': -12.47669043617725,
-        'signal': -12.54201949383967,
-        'rsi': 39.113121941736615,
-        'rsi_based_ma': 34.041564341342806,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-25T02:00:00+07:00',
-        'open': 3317.23,
-        'high': 3325.38,
-        'low': 3316.09,
-        'close': 3323.655,
-        'volume': 15180.0,
-        'accumulation_distribution': 6803730.830902165,
-        'macd': -11.299285051132756,
-        'signal': -12.293472605298287,
-        'rsi': 43.86634361921856,
-        'rsi_based_ma': 34.80838944869283,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-25T03:00:00+07:00',
-        'open': 3323.63,
-        'high': 3324.6,
-        'low': 3321.805,
-        'close': 3323.45,
-        'volume': 4668.0,
-        'accumulation_distribution': 6804557.542887853,
-        'macd': -10.264402939760204,
-        'signal': -11.887658672190671,
-        'rsi': 43.747979118388606,
-        'rsi_based_ma': 35.7978863930996,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-25T05:00:00+07:00',
-        'open': 3322.825,
-        'high': 3323.63,
-        'low': 3320.97,
-        'close': 3321.67,
-        'volume': 3136.0,
-        'accumulation_distribution': 6803072.069203643,
-        'macd': -9.478618915866718,
-        'signal': -11.40585072092588,
-        'rsi': 42.671323109636106,
-        'rsi_based_ma': 36.35039985104705,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-25T06:00:00+07:00',
-        'open': 3321.695,
-        'high': 3324.995,
-        'low': 3321.695,
-        'close': 3324.205,
-        'volume': 3470.0,
-        'accumulation_distribution': 6804880.67526425,
-        'macd': -8.552735490698524,
-        'signal': -10.835227674880407,
-        'rsi': 44.75649953689831,
-        'rsi_based_ma': 37.115146993919886,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-25T07:00:00+07:00',
-        'open': 3324.21,
-        'high': 3330.095,
-        'low': 3323.71,
-        'close': 3326.99,
-        'volume': 11211.0,
-        'accumulation_distribution': 6805187.946211782,
-        'macd': -7.507695935473293,
-        'signal': -10.169721326998983,
-        'rsi': 47.03571770872832,
-        'rsi_based_ma': 38.27664810091233,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-25T08:00:00+07:00',
-        'open': 3327.04,
-        'high': 3334.905,
-        'low': 3326.49,
-        'close': 3334.73,
-        'volume': 16860.0,
-        'accumulation_distribution': 6821346.6984399455,
-        'macd': -5.985939065305502,
-        'signal': -9.332964874660288,
-        'rsi': 52.85704425978169,
-        'rsi_based_ma': 39.47830706440095,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-25T09:00:00+07:00',
-        'open': 3334.76,
-        'high': 3335.335,
-        'low': 3327.87,
-        'close': 3329.53,
-        'volume': 12961.0,
-        'accumulation_distribution': 6814150.001186095,
-        'macd': -5.1402783942021415,
-        'signal': -8.494427578568658,
-        'rsi': 48.96338975025984,
-        'rsi_based_ma': 40.52631034114563,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-25T10:00:00+07:00',
-        'open': 3329.55,
-        'high': 3332.16,
-        'low': 3327.255,
-        'close': 3328.375,
-        'volume': 10324.0,
-        'accumulation_distribution': 6808540.733092313,
-        'macd': -4.511281818332464,
-        'signal': -7.697798426521419,
-        'rsi': 48.11557005971636,
-        'rsi_based_ma': 41.6883263409047,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-25T11:00:00+07:00',
-        'open': 3328.305,
-        'high': 3329.335,
-        'low': 3325.87,
-        'close': 3327.52,
-        'volume': 5406.0,
-        'accumulation_distribution': 6808283.3045208845,
-        'macd': -4.03527274244243,
-        'signal': -6.965293289705621,
-        'rsi': 47.460432456817934,
-        'rsi_based_ma': 43.103311015280894,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-25T12:00:00+07:00',
-        'open': 3327.5,
-        'high': 3333.785,
-        'low': 3326.775,
-        'close': 3331.715,
-        'volume': 9522.0,
-        'accumulation_distribution': 6812181.755305478,
-        'macd': -3.281701269964742,
-        'signal': -6.228574885757445,
-        'rsi': 50.98667053314347,
-        'rsi_based_ma': 44.63552449728402,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-25T13:00:00+07:00',
-        'open': 3331.755,
-        'high': 3333.515,
-        'low': 3329.0,
-        'close': 3331.815,
-        'volume': 12095.0,
-        'accumulation_distribution': 6815168.671141581,
-        'macd': -2.6459207571119805,
-        'signal': -5.5120440600283525,
-        'rsi': 51.07097380447077,
-        'rsi_based_ma': 45.70214121744747,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-25T14:00:00+07:00',
-        'open': 3331.84,
-        'high': 3337.205,
-        'low': 3326.775,
-        'close': 3330.705,
-        'volume': 16967.0,
-        'accumulation_distribution': 6810987.924257592,
-        'macd': -2.2061961871327185,
-        'signal': -4.850874485449226,
-        'rsi': 50.0420737664137,
-        'rsi_based_ma': 46.44181613231558,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-25T15:00:00+07:00',
-        'open': 3330.7,
-        'high': 3332.455,
-        'low': 3326.515,
-        'close': 3327.295,
-        'volume': 13685.0,
-        'accumulation_distribution': 6800896.964661634,
-        'macd': -2.108563590286394,
-        'signal': -4.30241230641666,
-        'rsi': 46.91507612750134,
-        'rsi_based_ma': 46.97158684233653,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-25T16:00:00+07:00',
-        'open': 3327.305,
-        'high': 3327.355,
-        'low': 3321.5,
-        'close': 3325.35,
-        'volume': 13876.0,
-        'accumulation_distribution': 6805269.504371283,
-        'macd': -2.1631982954322666,
-        'signal': -3.8745695042197807,
-        'rsi': 45.18088523743697,
-        'rsi_based_ma': 47.40499850631512,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-25T17:00:00+07:00',
-        'open': 3325.345,
-        'high': 3329.625,
-        'low': 3324.145,
-        'close': 3324.55,
-        'volume': 11661.0,
-        'accumulation_distribution': 6795332.119334787,
-        'macd': -2.245169095242545,
-        'signal': -3.5486894224243337,
-        'rsi': 44.45303676556802,
-        'rsi_based_ma': 47.44690515962581,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-25T18:00:00+07:00',
-        'open': 3324.535,
-        'high': 3329.55,
-        'low': 3322.21,
-        'close': 3322.7,
-        'volume': 13822.0,
-        'accumulation_distribution': 6783355.563476476,
-        'macd': -2.4313836068290584,
-        'signal': -3.3252282593052787,
-        'rsi': 42.73840458858628,
-        'rsi_based_ma': 47.37479269321136,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-25T19:00:00+07:00',
-        'open': 3322.705,
-        'high': 3329.475,
-        'low': 3318.22,
-        'close': 3320.755,
-        'volume': 16342.0,
-        'accumulation_distribution': 6774375.086355197,
-        'macd': -2.7047267870539144,
-        'signal': -3.2011279648550057,
-        'rsi': 40.950038564225885,
-        'rsi_based_ma': 47.25184379711062,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-25T20:00:00+07:00',
-        'open': 3320.775,
-        'high': 3321.675,
-        'low': 3312.055,
-        'close': 3314.57,
-        'volume': 27832.0,
-        'accumulation_distribution': 6761095.576999689,
-        'macd': -3.381451765440488,
-        'signal': -3.237192724972102,
-        'rsi': 35.81743865590583,
-        'rsi_based_ma': 46.6133394484683,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-25T21:00:00+07:00',
-        'open': 3314.505,
-        'high': 3326.405,
-        'low': 3312.26,
-        'close': 3323.505,
-        'volume': 26655.0,
-        'accumulation_distribution': 6776820.99057339,
-        'macd': -3.160350802461835,
-        'signal': -3.221824340470049,
-        'rsi': 46.29050191858868,
-        'rsi_based_ma': 46.56010974917261,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-25T22:00:00+07:00',
-        'open': 3323.55,
-        'high': 3327.225,
-        'low': 3321.725,
-        'close': 3325.69,
-        'volume': 15379.0,
-        'accumulation_distribution': 6783615.712391573,
-        'macd': -2.7768061642027533,
-        'signal': -3.1328207052165897,
-        'rsi': 48.50347520853892,
-        'rsi_based_ma': 46.2491405312267,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-25T23:00:00+07:00',
-        'open': 3325.74,
-        'high': 3335.22,
-        'low': 3324.195,
-        'close': 3334.815,
-        'volume': 18475.0,
-        'accumulation_distribution': 6800733.365452798,
-        'macd': -1.7167434856328327,
-        'signal': -2.849605261299838,
-        'rsi': 56.55426273340549,
-        'rsi_based_ma': 46.791345744308536,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-26T00:00:00+07:00',
-        'open': 3334.82,
-        'high': 3335.425,
-        'low': 3324.81,
-        'close': 3328.065,
-        'volume': 21337.0,
-        'accumulation_distribution': 6792481.986743425,
-        'macd': -1.4051075581419354,
-        'signal': -2.560705720668257,
-        'rsi': 50.29092731788074,
-        'rsi_based_ma': 46.94672840560599,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-26T01:00:00+07:00',
-        'open': 3328.08,
-        'high': 3331.87,
-        'low': 3326.31,
-        'close': 3331.755,
-        'volume': 13542.0,
-        'accumulation_distribution': 6805463.796095944,
-        'macd': -0.8505767595875113,
-        'signal': -2.2186799284521084,
-        'rsi': 53.3335780672886,
-        'rsi_based_ma': 47.36623880635389,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-26T02:00:00+07:00',
-        'open': 3331.655,
-        'high': 3336.15,
-        'low': 3330.49,
-        'close': 3333.8,
-        'volume': 15320.0,
-        'accumulation_distribution': 6808062.241325627,
-        'macd': -0.2432882221496584,
-        'signal': -1.8236015871916185,
-        'rsi': 54.978290788025774,
-        'rsi_based_ma': 47.651354538845474,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-26T03:00:00+07:00',
-        'open': 3333.81,
-        'high': 3335.705,
-        'low': 3331.445,
-        'close': 3332.395,
-        'volume': 4246.0,
-        'accumulation_distribution': 6805709.997194172,
-        'macd': 0.1232003837876618,
-        'signal': -1.4342411929957624,
-        'rsi': 53.5810712952572,
-        'rsi_based_ma': 47.8306472167588,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-26T05:00:00+07:00',
-        'open': 3334.315,
-        'high': 3335.05,
-        'low': 3331.395,
-        'close': 3333.34,
-        'volume': 3581.0,
-        'accumulation_distribution': 6805940.239328235,
-        'macd': 0.4843159538663713,
-        'signal': -1.0505297636233355,
-        'rsi': 54.42011919507474,
-        'rsi_based_ma': 48.14336474737745,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-26T06:00:00+07:00',
-        'open': 3333.315,
-        'high': 3340.325,
-        'low': 3333.015,
-        'close': 3339.12,
-        'volume': 8478.0,
-        'accumulation_distribution': 6811623.166824816,
-        'macd': 1.222804609012201,
-        'signal': -0.5958628890962284,
-        'rsi': 59.2695579440804,
-        'rsi_based_ma': 49.02582773427595,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-26T07:00:00+07:00',
-        'open': 3339.185,
-        'high': 3339.395,
-        'low': 3332.175,
-        'close': 3334.04,
-        'volume': 12585.0,
-        'accumulation_distribution': 6805539.835799884,
-        'macd': 1.3822153261894528,
-        'signal': -0.2002472460390921,
-        'rsi': 53.84704354502525,
-        'rsi_based_ma': 49.64483904196083,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-26T08:00:00+07:00',
-        'open': 3334.135,
-        'high': 3336.84,
-        'low': 3329.3,
-        'close': 3330.23,
-        'volume': 19259.0,
-        'accumulation_distribution': 6791031.729699087,
-        'macd': 1.1874263971835717,
-        'signal': 0.0772874826054406,
-        'rsi': 50.14181482844924,
-        'rsi_based_ma': 50.05118033216662,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-26T09:00:00+07:00',
-        'open': 3330.285,
-        'high': 3341.95,
-        'low': 3329.335,
-        'close': 3339.59,
-        'volume': 14907.0,
-        'accumulation_distribution': 6800361.16013904,
-        'macd': 1.7679487303307724,
-        'signal': 0.415419732150507,
-        'rsi': 57.82054905813146,
-        'rsi_based_ma': 51.128476365705566,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-26T10:00:00+07:00',
-        'open': 3339.615,
-        'high': 3343.255,
-        'low': 3336.435,
-        'close': 3338.06,
-        'volume': 11466.0,
-        'accumulation_distribution': 6794359.163071591,
-        'macd': 2.0805750741883458,
-        'signal': 0.7484508005580748,
-        'rsi': 56.294325832927846,
-        'rsi_based_ma': 52.22449688489856,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-26T11:00:00+07:00',
-        'open': 3338.105,
-        'high': 3338.245,
-        'low': 3333.495,
-        'close': 3334.02,
-        'volume': 8235.0,
-        'accumulation_distribution': 6787944.531492644,
-        'macd': 1.97952078434264,
-        'signal': 0.9946647973149878,
-        'rsi': 52.36387606122278,
-        'rsi_based_ma': 53.40638527099264,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-26T12:00:00+07:00',
-        'open': 3334.035,
-        'high': 3338.42,
-        'low': 3332.5,
-        'close': 3334.24,
-        'volume': 12610.0,
-        'accumulation_distribution': 6782747.166627778,
-        'macd': 1.8953384115652625,
-        'signal': 1.1747995201650427,
-        'rsi': 52.55812803680936,
-        'rsi_based_ma': 53.854072850865535,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-26T13:00:00+07:00',
-        'open': 3334.185,
-        'high': 3340.5,
-        'low': 3331.025,
-        'close': 3339.835,
-        'volume': 17950.0,
-        'accumulation_distribution': 6798177.536020918,
-        'macd': 2.254109049285489,
-        'signal': 1.390661425989132,
-        'rsi': 57.32432040664064,
-        'rsi_based_ma': 54.48413322215851,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-26T14:00:00+07:00',
-        'open': 3339.785,
-        'high': 3347.18,
-        'low': 3339.67,
-        'close': 3346.1,
-        'volume': 17693.0,
-        'accumulation_distribution': 6810781.737086165,
-        'macd': 3.009281383120197,
-        'signal': 1.714385417415345,
-        'rsi': 61.93572265399441,
-        'rsi_based_ma': 54.86852321648629,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-26T15:00:00+07:00',
-        'open': 3346.085,
-        'high': 3350.415,
-        'low': 3344.465,
-        'close': 3348.2,
-        'volume': 18916.0,
-        'accumulation_distribution': 6815614.059775239,
-        'macd': 3.7341681816160417,
-        'signal': 2.1183419702554844,
-        'rsi': 63.36473126395583,
-        'rsi_based_ma': 55.80236635549166,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-26T16:00:00+07:00',
-        'open': 3348.2,
-        'high': 3348.845,
-        'low': 3338.845,
-        'close': 3340.665,
-        'volume': 22094.0,
-        'accumulation_distribution': 6801562.27577524,
-        'macd': 3.658462189763668,
-        'signal': 2.426366014157121,
-        'rsi': 55.33718262126624,
-        'rsi_based_ma': 55.94548096649005,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-26T17:00:00+07:00',
-        'open': 3340.63,
-        'high': 3343.51,
-        'low': 3338.025,
-        'close': 3343.335,
-        'volume': 14389.0,
-        'accumulation_distribution': 6815033.108045066,
-        'macd': 3.770447954668725,
-        'signal': 2.6951824022594417,
-        'rsi': 57.39681678253034,
-        'rsi_based_ma': 56.11823282324038,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-26T18:00:00+07:00',
-        'open': 3343.345,
-        'high': 3344.175,
-        'low': 3331.58,
-        'close': 3332.975,
-        'volume': 17454.0,
-        'accumulation_distribution': 6801445.456596078,
-        'macd': 2.9887792752674613,
-        'signal': 2.7539017768610456,
-        'rsi': 48.12351327404981,
-        'rsi_based_ma': 55.728407250297,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-26T19:00:00+07:00',
-        'open': 3332.98,
-        'high': 3344.15,
-        'low': 3321.68,
-        'close': 3322.095,
-        'volume': 30780.0,
-        'accumulation_distribution': 6771802.412537334,
-        'macd': 1.4743804036538677,
-        'signal': 2.49799750221961,
-        'rsi': 40.68863864158358,
-        'rsi_based_ma': 54.74758721076192,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-26T20:00:00+07:00',
-        'open': 3322.08,
-        'high': 3328.75,
-        'low': 3309.99,
-        'close': 3319.985,
-        'volume': 50960.0,
-        'accumulation_distribution': 6775143.606567185,
-        'macd': 0.102764417020353,
-        'signal': 2.018950885179758,
-        'rsi': 39.41678889192407,
-        'rsi_based_ma': 53.32953227846504,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-26T21:00:00+07:00',
-        'open': 3319.975,
-        'high': 3323.94,
-        'low': 3311.985,
-        'close': 3318.44,
-        'volume': 38619.0,
-        'accumulation_distribution': 6778228.604057775,
-        'macd': -1.096282460450766,
-        'signal': 1.3959042160536537,
-        'rsi': 38.46858960367725,
-        'rsi_based_ma': 52.23107128265446,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-26T22:00:00+07:00',
-        'open': 3318.395,
-        'high': 3325.03,
-        'low': 3318.395,
-        'close': 3324.92,
-        'volume': 19671.0,
-        'accumulation_distribution': 6797247.362912334,
-        'macd': -1.5062903278658268,
-        'signal': 0.8154653072697575,
-        'rsi': 44.49904419285414,
-        'rsi_based_ma': 51.828016237254815,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-26T23:00:00+07:00',
-        'open': 3324.935,
-        'high': 3333.415,
-        'low': 3323.845,
-        'close': 3331.41,
-        'volume': 18424.0,
-        'accumulation_distribution': 6807951.379631246,
-        'macd': -1.2926350635575543,
-        'signal': 0.393845233104295,
-        'rsi': 49.805048462524645,
-        'rsi_based_ma': 51.25548048042575,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-27T00:00:00+07:00',
-        'open': 3331.415,
-        'high': 3336.55,
-        'low': 3331.25,
-        'close': 3332.84,
-        'volume': 15651.0,
-        'accumulation_distribution': 6801690.979631247,
-        'macd': -0.9964363799704188,
-        'signal': 0.1157889104893522,
-        'rsi': 50.91847408952473,
-        'rsi_based_ma': 50.87149107018268,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-27T01:00:00+07:00',
-        'open': 3332.825,
-        'high': 3334.94,
-        'low': 3331.28,
-        'close': 3334.1,
-        'volume': 11870.0,
-        'accumulation_distribution': 6808112.455041082,
-        'macd': -0.6525036634279786,
-        'signal': -0.0378696042941139,
-        'rsi': 51.93026800982108,
-        'rsi_based_ma': 50.84051906651113,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-27T02:00:00+07:00',
-        'open': 3334.125,
-        'high': 3334.39,
-        'low': 3328.42,
-        'close': 3331.34,
-        'volume': 16838.0,
-        'accumulation_distribution': 6807745.798424667,
-        'macd': -0.5957757098585716,
-        'signal': -0.1494508254070055,
-        'rsi': 49.52204976737514,
-        'rsi_based_ma': 50.6236563329801,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-27T03:00:00+07:00',
-        'open': 3331.41,
-        'high': 3332.43,
-        'low': 3327.725,
-        'close': 3327.82,
-        'volume': 4011.0,
-        'accumulation_distribution': 6803896.772919885,
-        'macd': -0.8253389860096831,
-        'signal': -0.284628457527541,
-        'rsi': 46.556701247432414,
-        'rsi_based_ma': 49.85454067875095,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-27T05:00:00+07:00',
-        'open': 3325.33,
-        'high': 3325.37,
-        'low': 3318.835,
-        'close': 3321.545,
-        'volume': 4806.0,
-        'accumulation_distribution': 6803076.774450107,
-        'macd': -1.4963604817289706,
-        'signal': -0.526974862367827,
-        'rsi': 41.75652453248994,
-        'rsi_based_ma': 48.41316938435778,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-27T06:00:00+07:00',
-        'open': 3321.525,
-        'high': 3323.765,
-        'low': 3316.295,
-        'close': 3318.79,
-        'volume': 7090.0,
-        'accumulation_distribution': 6800722.932415301,
-        'macd': -2.2248091124865823,
-        'signal': -0.8665417123915781,
-        'rsi': 39.81554802451553,
-        'rsi_based_ma': 46.7310848672549,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-27T07:00:00+07:00',
-        'open': 3318.73,
-        'high': 3320.04,
-        'low': 3313.3,
-        'close': 3318.98,
-        'volume': 14261.0,
-        'accumulation_distribution': 6810498.276628951,
-        'macd': -2.755020329034778,
-        'signal': -1.2442374357202182,
-        'rsi': 40.02260991712899,
-        'rsi_based_ma': 45.63718681695938,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-27T08:00:00+07:00',
-        'open': 3318.97,
-        'high': 3322.18,
-        'low': 3314.99,
-        'close': 3316.5,
-        'volume': 19963.0,
-        'accumulation_distribution': 6798920.291927978,
-        'macd': -3.3368664920963056,
-        'signal': -1.6627632469954357,
-        'rsi': 38.17634921042793,
-        'rsi_based_ma': 44.264296276094925,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-27T09:00:00+07:00',
-        'open': 3316.51,
-        'high': 3320.445,
-        'low': 3308.61,
-        'close': 3308.91,
-        'volume': 18080.0,
-        'accumulation_distribution': 6781756.895223288,
-        'macd': -4.360171987462309,
-        'signal': -2.2022449950888103,
-        'rsi': 33.137995694937146,
-        'rsi_based_ma': 43.19390216330117,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-27T10:00:00+07:00',
-        'open': 3308.87,
-        'high': 3311.025,
-        'low': 3292.665,
-        'close': 3294.405,
-        'volume': 24471.0,
-        'accumulation_distribution': 6761924.189340935,
-        'macd': -6.269312509616157,
-        'signal': -3.01565849799428,
-        'rsi': 26.05975648509542,
-        'rsi_based_ma': 42.1489820092663,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-27T11:00:00+07:00',
-        'open': 3294.385,
-        'high': 3297.63,
-        'low': 3291.16,
-        'close': 3294.01,
-        'volume': 13989.0,
-        'accumulation_distribution': 6760259.346991632,
-        'macd': -7.725142690680514,
-        'signal': -3.9575553365315264,
-        'rsi': 25.89753013716245,
-        'rsi_based_ma': 41.18332066964047,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-27T12:00:00+07:00',
-        'open': 3294.035,
-        'high': 3301.015,
-        'low': 3289.325,
-        'close': 3297.515,
-        'volume': 23964.0,
-        'accumulation_distribution': 6769873.64639283,
-        'macd': -8.498113428658144,
-        'signal': -4.86566695495685,
-        'rsi': 30.05820177347989,
-        'rsi_based_ma': 40.58257868176923,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-27T13:00:00+07:00',
-        'open': 3297.525,
-        'high': 3300.045,
-        'low': 3286.93,
-        'close': 3295.12,
-        'volume': 27564.0,
-        'accumulation_distribution': 6776735.747803428,
-        'macd': -9.19792681677518,
-        'signal': -5.732118927320515,
-        'rsi': 28.865552330641023,
-        'rsi_based_ma': 39.46590069161115,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-27T14:00:00+07:00',
-        'open': 3295.135,
-        'high': 3295.465,
-        'low': 3283.52,
-        'close': 3284.54,
-        'volume': 27584.0,
-        'accumulation_distribution': 6753862.619297777,
-        'macd': -10.485382584482068,
-        'signal': -6.682771658752825,
-        'rsi': 24.282027449324573,
-        'rsi_based_ma': 37.64282776209685,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-27T15:00:00+07:00',
-        'open': 3284.46,
-        'high': 3291.165,
-        'low': 3281.9,
-        'close': 3289.44,
-        'volume': 22176.0,
-        'accumulation_distribution': 6767780.961445646,
-        'macd': -10.983698270469176,
-        'signal': -7.542956981096095,
-        'rsi': 29.838672012629036,
-        'rsi_based_ma': 36.13712761374716,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-27T16:00:00+07:00',
-        'open': 3289.345,
-        'high': 3289.84,
-        'low': 3282.23,
-        'close': 3282.88,
-        'volume': 19881.0,
-        'accumulation_distribution': 6751296.190092164,
-        'macd': -11.77225103561068,
-        'signal': -8.388815791999011,
-        'rsi': 26.98366594637189,
-        'rsi_based_ma': 34.35522746635793,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-27T17:00:00+07:00',
-        'open': 3282.89,
-        'high': 3291.07,
-        'low': 3279.805,
-        'close': 3285.74,
-        'volume': 17615.0,
-        'accumulation_distribution': 6752242.224268816,
-        'macd': -12.027758175985127,
-        'signal': -9.116604268796234,
-        'rsi': 30.122800372994817,
-        'rsi_based_ma': 32.96956679533077,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-27T18:00:00+07:00',
-        'open': 3285.725,
-        'high': 3288.035,
-        'low': 3276.19,
-        'close': 3281.47,
-        'volume': 18608.0,
-        'accumulation_distribution': 6750223.542968689,
-        'macd': -12.431500144358324,
-        'signal': -9.779583443908653,
-        'rsi': 28.17518501219864,
-        'rsi_based_ma': 31.65660134995693,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-27T19:00:00+07:00',
-        'open': 3281.455,
-        'high': 3282.415,
-        'low': 3269.55,
-        'close': 3270.295,
-        'volume': 35666.0,
-        'accumulation_distribution': 6718688.311721118,
-        'macd': -13.497605673489945,
-        'signal': -10.52318788982491,
-        'rsi': 23.83230157189809,
-        'rsi_based_ma': 30.37629970991465,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-27T20:00:00+07:00',
-        'open': 3270.195,
-        'high': 3274.53,
-        'low': 3255.85,
-        'close': 3274.285,
-        'volume': 53353.0,
-        'accumulation_distribution': 6770641.795125827,
-        'macd': -13.86076407183009,
-        'signal': -11.190703126225946,
-        'rsi': 28.09403576038657,
-        'rsi_based_ma': 29.53904883390544,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-27T21:00:00+07:00',
-        'open': 3274.335,
-        'high': 3278.235,
-        'low': 3263.665,
-        'close': 3272.51,
-        'volume': 41628.0,
-        'accumulation_distribution': 6779555.958475176,
-        'macd': -14.128927898770598,
-        'signal': -11.778348080734876,
-        'rsi': 27.360617751579483,
-        'rsi_based_ma': 28.63462082208048,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-27T22:00:00+07:00',
-        'open': 3272.52,
-        'high': 3277.61,
-        'low': 3271.035,
-        'close': 3274.68,
-        'volume': 23966.0,
-        'accumulation_distribution': 6782162.147068331,
-        'macd': -14.004908926729511,
-        'signal': -12.223660249933804,
-        'rsi': 29.774297201272205,
-        'rsi_based_ma': 28.03447424999793,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-27T23:00:00+07:00',
-        'open': 3274.695,
-        'high': 3278.685,
-        'low': 3273.42,
-        'close': 3277.705,
-        'volume': 18054.0,
-        'accumulation_distribution': 6793495.189803373,
-        'macd': -13.506832422403932,
-        'signal': -12.480294684427829,
-        'rsi': 33.11096309427066,
-        'rsi_based_ma': 28.032543349950323,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-28T00:00:00+07:00',
-        'open': 3277.73,
-        'high': 3282.94,
-        'low': 3272.77,
-        'close': 3277.465,
-        'volume': 20512.0,
-        'accumulation_distribution': 6791921.998062961,
-        'macd': -12.981822825882318,
-        'signal': -12.580600312718726,
-        'rsi': 32.97708809594597,
-        'rsi_based_ma': 28.52663846501108,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-28T01:00:00+07:00',
-        'open': 3277.47,
-        'high': 3278.495,
-        'low': 3270.6,
-        'close': 3275.86,
-        'volume': 19509.0,
-        'accumulation_distribution': 6798408.524345419,
-        'macd': -12.55058370808456,
-        'signal': -12.574596991791893,
-        'rsi': 32.0439995452912,
-        'rsi_based_ma': 28.96567199416313,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-28T02:00:00+07:00',
-        'open': 3275.865,
-        'high': 3276.685,
-        'low': 3268.43,
-        'close': 3270.615,
-        'volume': 19373.0,
-        'accumulation_distribution': 6789291.128221857,
-        'macd': -12.488096265843067,
-        'signal': -12.557296846602128,
-        'rsi': 29.14207469075612,
-        'rsi_based_ma': 28.900234345397145,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-28T03:00:00+07:00',
-        'open': 3270.65,
-        'high': 3275.585,
-        'low': 3270.33,
-        'close': 3274.175,
-        'volume': 6129.0,
-        'accumulation_distribution': 6792131.112046787,
-        'macd': -12.01283577672666,
-        'signal': -12.448404632627035,
-        'rsi': 33.54134057423947,
-        'rsi_based_ma': 29.23421921993989,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-30T05:00:00+07:00',
-        'open': 3271.64,
-        'high': 3274.055,
-        'low': 3244.415,
-        'close': 3263.855,
-        'volume': 15691.0,
-        'accumulation_distribution': 6797022.638362576,
-        'macd': -12.326830142499148,
-        'signal': -12.424089734601456,
-        'rsi': 28.095731040211945,
-        'rsi_based_ma': 29.506626619288987,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-30T06:00:00+07:00',
-        'open': 3263.98,
-        'high': 3270.98,
-        'low': 3262.875,
-        'close': 3263.815,
-        'volume': 8965.0,
-        'accumulation_distribution': 6790137.120163933,
-        'macd': -12.43555131064022,
-        'signal': -12.42638204980921,
-        'rsi': 28.07670373965631,
-        'rsi_based_ma': 29.38077174264808,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-30T07:00:00+07:00',
-        'open': 3263.81,
-        'high': 3269.91,
-        'low': 3262.695,
-        'close': 3264.57,
-        'volume': 11005.0,
-        'accumulation_distribution': 6784851.974633788,
-        'macd': -12.318788108350418,
-        'signal': -12.404863261517452,
-        'rsi': 29.053356848565528,
-        'rsi_based_ma': 29.528606807090483,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-30T08:00:00+07:00',
-        'open': 3264.485,
-        'high': 3276.1,
-        'low': 3259.39,
-        'close': 3274.08,
-        'volume': 24659.0,
-        'accumulation_distribution': 6803549.133819904,
-        'macd': -11.328289438654792,
-        'signal': -12.18954849694492,
-        'rsi': 40.088955421370216,
-        'rsi_based_ma': 30.240475024831586,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-30T09:00:00+07:00',
-        'open': 3274.075,
-        'high': 3283.385,
-        'low': 3273.725,
-        'close': 3280.28,
-        'volume': 15368.0,
-        'accumulation_distribution': 6809037.705248476,
-        'macd': -9.92857350725626,
-        'signal': -11.737353499007188,
-        'rsi': 45.98761402402796,
-        'rsi_based_ma': 31.51279138281939,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-30T10:00:00+07:00',
-        'open': 3280.265,
-        'high': 3282.85,
-        'low': 3277.965,
-        'close': 3279.07,
-        'volume': 10236.0,
-        'accumulation_distribution': 6803432.526128722,
-        'macd': -8.815308050949625,
-        'signal': -11.152944409395676,
-        'rsi': 45.05528232790684,
-        'rsi_based_ma': 33.028718579677154,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-30T11:00:00+07:00',
-        'open': 3279.09,
-        'high': 3286.48,
-        'low': 3277.0,
-        'close': 3285.64,
-        'volume': 7375.0,
-        'accumulation_distribution': 6809500.564103406,
-        'macd': -7.318529610242422,
-        'signal': -10.386061449565023,
-        'rsi': 50.8785341617514,
-        'rsi_based_ma': 34.65618275120322,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-30T12:00:00+07:00',
-        'open': 3285.645,
-        'high': 3291.545,
-        'low': 3284.69,
-        'close': 3289.125,
-        'volume': 12191.0,
-        'accumulation_distribution': 6813084.060091736,
-        'macd': -5.784432203873621,
-        'signal': -9.465735600426743,
-        'rsi': 53.682707688842754,
-        'rsi_based_ma': 36.53633203243631,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-30T13:00:00+07:00',
-        'open': 3289.12,
-        'high': 3295.66,
-        'low': 3287.94,
-        'close': 3292.215,
-        'volume': 14217.0,
-        'accumulation_distribution': 6814612.571749767,
-        'macd': -4.27008885468058,
-        'signal': -8.42660625127751,
-        'rsi': 56.07694129836613,
-        'rsi_based_ma': 38.41509232508587,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-30T14:00:00+07:00',
-        'open': 3292.17,
-        'high': 3296.83,
-        'low': 3290.835,
-        'close': 3293.085,
-        'volume': 13871.0,
-        'accumulation_distribution': 6811153.498355272,
-        'macd': -2.9655738220685635,
-        'signal': -7.334399765435721,
-        'rsi': 56.75475013662406,
-        'rsi_based_ma': 40.10393425668254,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-30T15:00:00+07:00',
-        'open': 3292.99,
-        'high': 3296.66,
-        'low': 3288.165,
-        'close': 3289.21,
-        'volume': 12221.0,
-        'accumulation_distribution': 6801939.195235791,
-        'macd': -2.218838980881628,
-        'signal': -6.311287608524903,
-        'rsi': 52.84326711043081,
-        'rsi_based_ma': 41.522947043431465,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-30T16:00:00+07:00',
-        'open': 3289.15,
-        'high': 3289.15,
-        'low': 3277.48,
-        'close': 3287.935,
-        'volume': 18907.0,
-        'accumulation_distribution': 6816909.262073836,
-        'macd': -1.7102138035315877,
-        'signal': -5.39107284752624,
-        'rsi': 51.58354831789831,
-        'rsi_based_ma': 42.91862909861768,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-30T17:00:00+07:00',
-        'open': 3287.945,
-        'high': 3288.92,
-        'low': 3282.52,
-        'close': 3283.525,
-        'volume': 11210.0,
-        'accumulation_distribution': 6809219.902698836,
-        'macd': -1.6440235500117524,
-        'signal': -4.641662988023342,
-        'rsi': 47.37665561313411,
-        'rsi_based_ma': 44.22109916450182,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-30T18:00:00+07:00',
-        'open': 3283.55,
-        'high': 3283.865,
-        'low': 3274.625,
-        'close': 3278.0,
-        'volume': 15334.0,
-        'accumulation_distribution': 6805087.688413123,
-        'macd': -2.014170518906212,
-        'signal': -4.116164494199916,
-        'rsi': 42.68034785542624,
-        'rsi_based_ma': 44.87388539887231,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-30T19:00:00+07:00',
-        'open': 3278.03,
-        'high': 3289.075,
-        'low': 3278.03,
-        'close': 3282.155,
-        'volume': 21444.0,
-        'accumulation_distribution': 6799661.162383245,
-        'macd': -1.9497652037221087,
-        'signal': -3.6828846361043546,
-        'rsi': 46.94007889331458,
-        'rsi_based_ma': 46.2199102455225,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-30T20:00:00+07:00',
-        'open': 3282.14,
-        'high': 3287.205,
-        'low': 3277.975,
-        'close': 3284.915,
-        'volume': 29521.0,
-        'accumulation_distribution': 6814533.605503506,
-        'macd': -1.656914712296384,
-        'signal': -3.2776906513427604,
-        'rsi': 49.61846254761517,
-        'rsi_based_ma': 47.75860730323384,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-30T21:00:00+07:00',
-        'open': 3284.9,
-        'high': 3289.67,
-        'low': 3279.255,
-        'close': 3287.79,
-        'volume': 25359.0,
-        'accumulation_distribution': 6830737.556055594,
-        'macd': -1.179246495796633,
-        'signal': -2.858001820233535,
-        'rsi': 52.31849857200331,
-        'rsi_based_ma': 49.42040314062225,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-30T22:00:00+07:00',
-        'open': 3287.76,
-        'high': 3290.805,
-        'low': 3283.81,
-        'close': 3289.635,
-        'volume': 18513.0,
-        'accumulation_distribution': 6843057.5010162825,
-        'macd': -0.6443868219489559,
-        'signal': -2.41527882057662,
-        'rsi': 54.021428663365626,
-        'rsi_based_ma': 50.41557980076478,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-06-30T23:00:00+07:00',
-        'open': 3289.645,
-        'high': 3297.575,
-        'low': 3289.12,
-        'close': 3297.38,
-        'volume': 14874.0,
-        'accumulation_distribution': 6857245.41467684,
-        'macd': 0.3998409774699212,
-        'signal': -1.852254860967311,
-        'rsi': 60.41302005836479,
-        'rsi_based_ma': 51.44596594607456,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-01T00:00:00+07:00',
-        'open': 3297.36,
-        'high': 3298.64,
-        'low': 3292.14,
-        'close': 3294.04,
-        'volume': 14939.0,
-        'accumulation_distribution': 6851039.983907609,
-        'macd': 0.9469728319718342,
-        'signal': -1.292409322379482,
-        'rsi': 56.749288227559965,
-        'rsi_based_ma': 52.28125208176407,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-01T01:00:00+07:00',
-        'open': 3294.035,
-        'high': 3299.675,
-        'low': 3292.635,
-        'close': 3298.525,
-        'volume': 11459.0,
-        'accumulation_distribution': 6858755.276521245,
-        'macd': 1.722623454935274,
-        'signal': -0.6894027669165307,
-        'rsi': 60.23650056805547,
-        'rsi_based_ma': 52.94967825364292,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-01T02:00:00+07:00',
-        'open': 3298.545,
-        'high': 3309.645,
-        'low': 3298.125,
-        'close': 3308.735,
-        'volume': 16334.0,
-        'accumulation_distribution': 6872508.731382357,
-        'macd': 3.1251688324146016,
-        'signal': 0.0735115529496958,
-        'rsi': 66.79918922759133,
-        'rsi_based_ma': 53.88656979212497,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-01T03:00:00+07:00',
-        'open': 3308.74,
-        'high': 3309.32,
-        'low': 3302.365,
-        'close': 3303.15,
-        'volume': 5864.0,
-        'accumulation_distribution': 6867968.452446341,
-        'macd': 3.742887645739757,
-        'signal': 0.807386771507708,
-        'rsi': 60.880102578167765,
-        'rsi_based_ma': 54.22965274068223,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-01T05:00:00+07:00',
-        'open': 3303.3,
-        'high': 3314.59,
-        'low': 3302.395,
-        'close': 3311.505,
-        'volume': 6685.0,
-        'accumulation_distribution': 6871271.209723913,
-        'macd': 4.850697113208753,
-        'signal': 1.6160488398479171,
-        'rsi': 65.76703154461387,
-        'rsi_based_ma': 54.87338712696721,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-01T06:00:00+07:00',
-        'open': 3311.575,
-        'high': 3312.545,
-        'low': 3308.65,
-        'close': 3312.535,
-        'volume': 6989.0,
-        'accumulation_distribution': 6878224.322689253,
-        'macd': 5.745525646260376,
-        'signal': 2.441944201130409,
-        'rsi': 66.32552059563116,
-        'rsi_based_ma': 55.83640523305295,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-01T07:00:00+07:00',
-        'open': 3312.53,
-        'high': 3314.96,
-        'low': 3310.02,
-        'close': 3314.825,
-        'volume': 9182.0,
-        'accumulation_distribution': 6886904.472486823,
-        'macd': 6.563804119205997,
-        'signal': 3.2663161847455267,
-        'rsi': 67.59145885777477,
-        'rsi_based_ma': 56.9798274144727,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-01T08:00:00+07:00',
-        'open': 3314.73,
-        'high': 3321.06,
-        'low': 3313.99,
-        'close': 3317.935,
-        'volume': 18282.0,
-        'accumulation_distribution': 6889024.874184136,
-        'macd': 7.378195468446393,
-        'signal': 4.0886920414857,
-        'rsi': 69.28048208493915,
-        'rsi_based_ma': 58.54438644817306,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-01T09:00:00+07:00',
-        'open': 3317.895,
-        'high': 3319.47,
-        'low': 3314.52,
-        'close': 3316.2,
-        'volume': 13107.0,
-        'accumulation_distribution': 6884814.746911408,
-        'macd': 7.793764810803168,
-        'signal': 4.829706595349194,
-        'rsi': 67.17708593678827,
-        'rsi_based_ma': 60.29415345398464,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-01T10:00:00+07:00',
-        'open': 3316.16,
-        'high': 3322.76,
-        'low': 3315.85,
-        'close': 3321.265,
-        'volume': 10296.0,
-        'accumulation_distribution': 6890655.603640785,
-        'macd': 8.434581078338397,
-        'signal': 5.550681491947034,
-        'rsi': 70.03704291062,
-        'rsi_based_ma': 61.94393659807788,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-01T11:00:00+07:00',
-        'open': 3321.27,
-        'high': 3323.15,
-        'low': 3318.995,
-        'close': 3322.975,
-        'volume': 9763.0,
-        'accumulation_distribution': 6899596.20893561,
-        'macd': 8.97693477993107,
-        'signal': 6.235932149543841,
-        'rsi': 70.95711829914869,
-        'rsi_based_ma': 63.46812629461598,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-01T12:00:00+07:00',
-        'open': 3322.98,
-        'high': 3332.395,
-        'low': 3322.975,
-        'close': 3328.79,
-        'volume': 14802.0,
-        'accumulation_distribution': 6903068.864986566,
-        'macd': 9.763429164028366,
-        'signal': 6.941431552440746,
-        'rsi': 73.89297235456544,
-        'rsi_based_ma': 65.00916013622756,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-01T13:00:00+07:00',
-        'open': 3328.78,
-        'high': 3334.63,
-        'low': 3325.115,
-        'close': 3331.395,
-        'volume': 17988.0,
-        'accumulation_distribution': 6908825.403084306,
-        'macd': 10.476170585597174,
-        'signal': 7.648379359072032,
-        'rsi': 75.10696298133907,
-        'rsi_based_ma': 66.51526973036853,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-01T14:00:00+07:00',
-        'open': 3331.455,
-        'high': 3339.99,
-        'low': 3330.9,
-        'close': 3339.56,
-        'volume': 20556.0,
-        'accumulation_distribution': 6927436.611005099,
-        'macd': 11.56653870123546,
-        'signal': 8.432011227504717,
-        'rsi': 78.48411266994925,
-        'rsi_based_ma': 67.80606205976741,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-01T15:00:00+07:00',
-        'open': 3339.515,
-        'high': 3342.5,
-        'low': 3336.885,
-        'close': 3339.635,
-        'volume': 14073.0,
-        'accumulation_distribution': 6927148.383934752,
-        'macd': 12.294986214043549,
-        'signal': 9.204606224812483,
-        'rsi': 78.51294893438174,
-        'rsi_based_ma': 69.36060925311183,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-01T16:00:00+07:00',
-        'open': 3339.66,
-        'high': 3348.155,
-        'low': 3338.31,
-        'close': 3345.8,
-        'volume': 22256.0,
-        'accumulation_distribution': 6938756.769917484,
-        'macd': 13.217388268647484,
-        'signal': 10.007162633579483,
-        'rsi': 80.79183267211386,
-        'rsi_based_ma': 70.82884726054456,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-01T17:00:00+07:00',
-        'open': 3345.83,
-        'high': 3349.755,
-        'low': 3344.47,
-        'close': 3348.76,
-        'volume': 17179.0,
-        'accumulation_distribution': 6949467.234439719,
-        'macd': 14.025567789848536,
-        'signal': 10.810843664833294,
-        'rsi': 81.790425548146,
-        'rsi_based_ma': 71.8996498548699,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-01T18:00:00+07:00',
-        'open': 3348.77,
-        'high': 3353.025,
-        'low': 3347.07,
-        'close': 3349.08,
-        'volume': 19780.0,
-        'accumulation_distribution': 6943039.980031657,
-        'macd': 14.524448408568787,
-        'signal': 11.553564613580392,
-        'rsi': 81.8999786230109,
-        'rsi_based_ma': 73.4010695723587,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-01T19:00:00+07:00',
-        'open': 3349.02,
-        'high': 3358.085,
-        'low': 3348.395,
-        'close': 3354.625,
-        'volume': 27336.0,
-        'accumulation_distribution': 6950854.29582113,
-        'macd': 15.192124694933227,
-        'signal': 12.28127662985096,
-        'rsi': 83.72694336580273,
-        'rsi_based_ma': 74.68392041672932,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-01T20:00:00+07:00',
-        'open': 3354.55,
-        'high': 3355.615,
-        'low': 3344.5,
-        'close': 3351.805,
-        'volume': 34428.0,
-        'accumulation_distribution': 6961679.834282668,
-        'macd': 15.31714600539044,
-        'signal': 12.888450504958858,
-        'rsi': 79.34082802240995,
-        'rsi_based_ma': 75.6135852329278,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-01T21:00:00+07:00',
-        'open': 3351.845,
-        'high': 3354.535,
-        'low': 3343.755,
-        'close': 3345.88,
-        'volume': 39927.0,
-        'accumulation_distribution': 6937493.998475619,
-        'macd': 14.767893231470223,
-        'signal': 13.264339050261132,
-        'rsi': 70.93294375530644,
-        'rsi_based_ma': 75.85226272560864,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-01T22:00:00+07:00',
-        'open': 3345.905,
-        'high': 3346.78,
-        'low': 3337.045,
-        'close': 3340.3,
-        'volume': 36124.0,
-        'accumulation_distribution': 6925526.879831552,
-        'macd': 13.72414369940816,
-        'signal': 13.356299980090537,
-        'rsi': 64.0490634859261,
-        'rsi_based_ma': 75.47858996853628,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-01T23:00:00+07:00',
-        'open': 3340.33,
-        'high': 3343.615,
-        'low': 3337.69,
-        'close': 3341.83,
-        'volume': 22348.0,
-        'accumulation_distribution': 6934409.502616362,
-        'macd': 12.872042001075442,
-        'signal': 13.259448384287518,
-        'rsi': 65.05060039574587,
-        'rsi_based_ma': 75.3266981441761,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-02T00:00:00+07:00',
-        'open': 3341.805,
-        'high': 3342.28,
-        'low': 3337.05,
-        'close': 3339.82,
-        'volume': 20725.0,
-        'accumulation_distribution': 6935637.944298962,
-        'macd': 11.897409137697196,
-        'signal': 12.987040534969454,
-        'rsi': 62.58394218111277,
-        'rsi_based_ma': 74.79433380635416,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-02T01:00:00+07:00',
-        'open': 3339.805,
-        'high': 3339.945,
-        'low': 3336.945,
-        'close': 3338.04,
-        'volume': 13588.0,
-        'accumulation_distribution': 6931969.1842989605,
-        'macd': 10.856230579350267,
-        'signal': 12.560878543845616,
-        'rsi': 60.39969860393322,
-        'rsi_based_ma': 74.04023239955305,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-02T02:00:00+07:00',
-        'open': 3338.06,
-        'high': 3340.165,
-        'low': 3336.94,
-        'close': 3338.13,
-        'volume': 18206.0,
-        'accumulation_distribution': 6927198.930035396,
-        'macd': 9.923954152390706,
-        'signal': 12.033493665554634,
-        'rsi': 60.4748123259482,
-        'rsi_based_ma': 73.08179239750896,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-02T03:00:00+07:00',
-        'open': 3338.1,
-        'high': 3340.51,
-        'low': 3336.92,
-        'close': 3338.72,
-        'volume': 3871.0,
-        'accumulation_distribution': 6927209.7127652,
-        'macd': 9.12751018081417,
-        'signal': 11.45229696860654,
-        'rsi': 60.99710249173051,
-        'rsi_based_ma': 72.07394521967977,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-02T05:00:00+07:00',
-        'open': 3340.125,
-        'high': 3343.84,
-        'low': 3336.97,
-        'close': 3341.675,
-        'volume': 6666.0,
-        'accumulation_distribution': 6929674.289184415,
-        'macd': 8.635224901877336,
-        'signal': 10.8888825552607,
-        'rsi': 63.59202609292927,
-        'rsi_based_ma': 71.01022474989263,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-02T06:00:00+07:00',
-        'open': 3341.73,
-        'high': 3341.965,
-        'low': 3336.815,
-        'close': 3338.155,
-        'volume': 7120.0,
-        'accumulation_distribution': 6926259.454232959,
-        'macd': 7.870326465081689,
-        'signal': 10.2851713372249,
-        'rsi': 58.59132511630849,
-        'rsi_based_ma': 69.58725162003027,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-02T07:00:00+07:00',
-        'open': 3338.21,
-        'high': 3345.045,
-        'low': 3334.615,
-        'close': 3339.025,
-        'volume': 21660.0,
-        'accumulation_distribution': 6922915.964300074,
-        'macd': 7.250758442349252,
-        'signal': 9.678288758249767,
-        'rsi': 59.44027968157511,
-        'rsi_based_ma': 68.06214069213465,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-02T08:00:00+07:00',
-        'open': 3339.065,
-        'high': 3342.955,
-        'low': 3331.055,
-        'close': 3332.25,
-        'volume': 24182.0,
-        'accumulation_distribution': 6903590.685308478,
-        'macd': 6.142256334027934,
-        'signal': 8.971082273405402,
-        'rsi': 50.71971427395787,
-        'rsi_based_ma': 65.84280417254978,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-02T09:00:00+07:00',
-        'open': 3332.27,
-        'high': 3338.255,
-        'low': 3328.615,
-        'close': 3336.785,
-        'volume': 18694.0,
-        'accumulation_distribution': 6916583.403150801,
-        'macd': 5.565540934812816,
-        'signal': 8.289974005686885,
-        'rsi': 55.43305994413267,
-        'rsi_based_ma': 63.95230998120133,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-02T10:00:00+07:00',
-        'open': 3336.775,
-        'high': 3342.23,
-        'low': 3334.965,
-        'close': 3340.02,
-        'volume': 15248.0,
-        'accumulation_distribution': 6922554.57452038,
-        'macd': 5.308336095714822,
-        'signal': 7.693646423692472,
-        'rsi': 58.48347376118905,
-        'rsi_based_ma': 62.149205009443214,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-02T11:00:00+07:00',
-        'open': 3340.015,
-        'high': 3342.07,
-        'low': 3339.62,
-        'close': 3340.17,
-        'volume': 7784.0,
-        'accumulation_distribution': 6918265.431663238,
-        'macd': 5.058294286213823,
-        'signal': 7.166575996196743,
-        'rsi': 58.62488593691377,
-        'rsi_based_ma': 60.66949486047921,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-02T12:00:00+07:00',
-        'open': 3340.145,
-        'high': 3344.015,
-        'low': 3336.655,
-        'close': 3338.855,
-        'volume': 13880.0,
-        'accumulation_distribution': 6912683.2577501945,
-        'macd': 4.699847919383046,
-        'signal': 6.673230380834004,
-        'rsi': 56.79838067643778,
-        'rsi_based_ma': 59.659883211988586,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-02T13:00:00+07:00',
-        'open': 3338.855,
-        'high': 3339.42,
-        'low': 3329.885,
-        'close': 3333.485,
-        'volume': 20265.0,
-        'accumulation_distribution': 6907720.617477515,
-        'macd': 3.937078282471248,
-        'signal': 6.125999961161453,
-        'rsi': 49.953885705916015,
-        'rsi_based_ma': 58.65308479913073,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-02T14:00:00+07:00',
-        'open': 3333.495,
-        'high': 3336.915,
-        'low': 3327.655,
-        'close': 3334.745,
-        'volume': 20983.0,
-        'accumulation_distribution': 6918869.252466715,
-        'macd': 3.3951125751191285,
-        'signal': 5.579822483952988,
-        'rsi': 51.43275524529248,
-        'rsi_based_ma': 57.68038157409835,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-02T15:00:00+07:00',
-        'open': 3334.68,
-        'high': 3338.065,
-        'low': 3333.005,
-        'close': 3333.62,
-        'volume': 14475.0,
-        'accumulation_distribution': 6907912.878948927,
-        'macd': 2.8420612365939637,
-        'signal': 5.032270234481183,
-        'rsi': 50.01174194551963,
-        'rsi_based_ma': 56.782367271555984,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-02T16:00:00+07:00',
-        'open': 3333.615,
-        'high': 3342.305,
-        'low': 3333.185,
-        'close': 3341.755,
-        'volume': 18150.0,
-        'accumulation_distribution': 6923873.734212086,
-        'macd': 3.0253166125462485,
-        'signal': 4.630879510094196,
-        'rsi': 58.86259219455989,
-        'rsi_based_ma': 56.67257395660074,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-02T17:00:00+07:00',
-        'open': 3341.75,
-        'high': 3345.83,
-        'low': 3340.67,
-        'close': 3344.455,
-        'volume': 12005.0,
-        'accumulation_distribution': 6929480.720646194,
-        'macd': 3.349800834588222,
-        'signal': 4.374663774993001,
-        'rsi': 61.311061660243965,
-        'rsi_based_ma': 56.73230605190758,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-02T18:00:00+07:00',
-        'open': 3344.465,
-        'high': 3347.825,
-        'low': 3339.82,
-        'close': 3342.32,
-        'volume': 17114.0,
-        'accumulation_distribution': 6923056.289665557,
-        'macd': 3.39553860587921,
-        'signal': 4.178838741170243,
-        'rsi': 58.35343731586827,
-        'rsi_based_ma': 56.54347282506028,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-02T19:00:00+07:00',
-        'open': 3342.37,
-        'high': 3351.245,
-        'low': 3337.95,
-        'close': 3346.775,
-        'volume': 37910.0,
-        'accumulation_distribution': 6935474.345325582,
-        'macd': 3.748062060812572,
-        'signal': 4.092683405098709,
-        'rsi': 62.426493621470165,
-        'rsi_based_ma': 56.460220505670335,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-02T20:00:00+07:00',
-        'open': 3346.75,
-        'high': 3346.75,
-        'low': 3335.025,
-        'close': 3337.5,
-        'volume': 44761.0,
-        'accumulation_distribution': 6909610.313342638,
-        'macd': 3.241656653015525,
-        'signal': 3.922478054682073,
-        'rsi': 51.19961897626486,
-        'rsi_based_ma': 55.93224149566721,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-02T21:00:00+07:00',
-        'open': 3337.505,
-        'high': 3343.62,
-        'low': 3333.965,
-        'close': 3343.04,
-        'volume': 28074.0,
-        'accumulation_distribution': 6934311.362539946,
-        'macd': 3.2498956451631784,
-        'signal': 3.787961572778294,
-        'rsi': 56.25964514904418,
-        'rsi_based_ma': 55.70505331477215,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-02T22:00:00+07:00',
-        'open': 3343.045,
-        'high': 3343.84,
-        'low': 3338.745,
-        'close': 3341.115,
-        'volume': 17540.0,
-        'accumulation_distribution': 6933089.242814723,
-        'macd': 3.065753594621583,
-        'signal': 3.643519977146952,
-        'rsi': 54.15828679673135,
-        'rsi_based_ma': 55.9506656378274,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-02T23:00:00+07:00',
-        'open': 3341.09,
-        'high': 3349.355,
-        'low': 3341.035,
-        'close': 3348.675,
-        'volume': 14285.0,
-        'accumulation_distribution': 6945039.194737801,
-        'macd': 3.489622317478279,
-        'signal': 3.612740445213217,
-        'rsi': 60.41205568637363,
-        'rsi_based_ma': 56.30630819084461,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-03T00:00:00+07:00',
-        'open': 3348.75,
-        'high': 3350.785,
-        'low': 3347.44,
-        'close': 3349.86,
-        'volume': 9525.0,
-        'accumulation_distribution': 6949296.257518072,
-        'macd': 3.8764753360414943,
-        'signal': 3.665487423378873,
-        'rsi': 61.303178416002005,
-        'rsi_based_ma': 56.5077156661884,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-03T01:00:00+07:00',
-        'open': 3349.85,
-        'high': 3355.265,
-        'low': 3348.66,
-        'close': 3355.09,
-        'volume': 10537.0,
-        'accumulation_distribution': 6959274.900213,
-        'macd': 4.552596927951981,
-        'signal': 3.8429093242934944,
-        'rsi': 65.04320119545413,
-        'rsi_based_ma': 56.966166756084135,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-03T02:00:00+07:00',
-        'open': 3355.095,
-        'high': 3359.62,
-        'low': 3354.635,
-        'close': 3358.255,
-        'volume': 14553.0,
-        'accumulation_distribution': 6965858.052670374,
-        'macd': 5.282919007905548,
-        'signal': 4.130911261015905,
-        'rsi': 67.11457787316797,
-        'rsi_based_ma': 57.703037984422,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-03T03:00:00+07:00',
-        'open': 3358.29,
-        'high': 3360.13,
-        'low': 3355.625,
-        'close': 3357.09,
-        'volume': 3166.0,
-        'accumulation_distribution': 6964751.182526089,
-        'macd': 5.701969993534021,
-        'signal': 4.445123007519529,
-        'rsi': 65.5743037835352,
-        'rsi_based_ma': 58.818782132823365,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-03T05:00:00+07:00',
-        'open': 3359.515,
-        'high': 3365.92,
-        'low': 3358.925,
-        'close': 3362.01,
-        'volume': 6370.0,
-        'accumulation_distribution': 6963999.89589278,
-        'macd': 6.357785210268048,
-        'signal': 4.827655448069232,
-        'rsi': 68.82795029447442,
-        'rsi_based_ma': 60.0612960649078,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-03T06:00:00+07:00',
-        'open': 3362.035,
-        'high': 3362.34,
-        'low': 3348.905,
-        'close': 3349.43,
-        'volume': 10761.0,
-        'accumulation_distribution': 6954079.911895757,
-        'macd': 5.795614394771746,
-        'signal': 5.021247237409735,
-        'rsi': 54.61459597537411,
-        'rsi_based_ma': 60.39007135275455,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-03T07:00:00+07:00',
-        'open': 3349.515,
-        'high': 3349.955,
-        'low': 3343.52,
-        'close': 3344.795,
-        'volume': 13251.0,
-        'accumulation_distribution': 6946079.890916736,
-        'macd': 4.919376697220287,
-        'signal': 5.000873129371845,
-        'rsi': 50.47848802644464,
-        'rsi_based_ma': 59.79120676931774,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-03T08:00:00+07:00',
-        'open': 3344.805,
-        'high': 3348.295,
-        'low': 3342.015,
-        'close': 3346.085,
-        'volume': 16540.0,
-        'accumulation_distribution': 6950978.680725654,
-        'macd': 4.279710390623222,
-        'signal': 4.856640581622121,
-        'rsi': 51.57763010884221,
-        'rsi_based_ma': 59.09596165850332,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-03T09:00:00+07:00',
-        'open': 3346.145,
-        'high': 3351.535,
-        'low': 3345.805,
-        'close': 3351.075,
-        'volume': 13040.0,
-        'accumulation_distribution': 6961924.99835218,
-        'macd': 4.127838379578407,
-        'signal': 4.710880141213378,
-        'rsi': 55.67585533504325,
-        'rsi_based_ma': 58.90470580273011,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-03T10:00:00+07:00',
-        'open': 3351.125,
-        'high': 3351.595,
-        'low': 3345.5,
-        'close': 3347.6,
-        'volume': 10681.0,
-        'accumulation_distribution': 6958604.162421089,
-        'macd': 3.684601466314234,
-        'signal': 4.505624406233549,
-        'rsi': 52.3528642572359,
-        'rsi_based_ma': 58.18516084814195,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-03T11:00:00+07:00',
-        'open': 3347.565,
-        'high': 3351.895,
-        'low': 3347.505,
-        'close': 3350.865,
-        'volume': 8728.0,
-        'accumulation_distribution': 6963236.563332249,
-        'macd': 3.5558021585857205,
-        'signal': 4.315659956703984,
-        'rsi': 55.06646485112263,
-        'rsi_based_ma': 58.461364124917495,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-03T12:00:00+07:00',
-        'open': 3350.87,
-        'high': 3360.54,
-        'low': 3350.185,
-        'close': 3359.43,
-        'volume': 16349.0,
-        'accumulation_distribution': 6976080.514563538,
-        'macd': 4.097616921378631,
-        'signal': 4.272051349638913,
-        'rsi': 61.29400119739471,
-        'rsi_based_ma': 58.82096098551396,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-03T13:00:00+07:00',
-        'open': 3359.425,
-        'high': 3363.755,
-        'low': 3356.535,
-        'close': 3361.92,
-        'volume': 17772.0,
-        'accumulation_distribution': 6984818.824812845,
-        'macd': 4.674051656656502,
-        'signal': 4.352451411042431,
-        'rsi': 62.90365850962438,
-        'rsi_based_ma': 59.44563039357775,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-03T14:00:00+07:00',
-        'open': 3361.91,
-        'high': 3363.135,
-        'low': 3352.575,
-        'close': 3353.065,
-        'volume': 17021.0,
-        'accumulation_distribution': 6969377.425191634,
-        'macd': 4.366027000174199,
-        'signal': 4.355166528868784,
-        'rsi': 54.26152373416959,
-        'rsi_based_ma': 59.00630668270604,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-03T15:00:00+07:00',
-        'open': 3353.15,
-        'high': 3358.41,
-        'low': 3351.775,
-        'close': 3356.24,
-        'volume': 12363.0,
-        'accumulation_distribution': 6973653.700248152,
-        'macd': 4.328218200934316,
-        'signal': 4.349776863281891,
-        'rsi': 56.56571060684103,
-        'rsi_based_ma': 58.66791612490882,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-03T16:00:00+07:00',
-        'open': 3356.125,
-        'high': 3356.46,
-        'low': 3343.94,
-        'close': 3345.785,
-        'volume': 15880.0,
-        'accumulation_distribution': 6962453.987788088,
-        'macd': 3.41525440436817,
-        'signal': 4.162872371499146,
-        'rsi': 47.991982831266256,
-        'rsi_based_ma': 57.44997195603826,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-03T17:00:00+07:00',
-        'open': 3345.8,
-        'high': 3355.545,
-        'low': 3344.84,
-        'close': 3353.255,
-        'volume': 12741.0,
-        'accumulation_distribution': 6969743.910721296,
-        'macd': 3.256946536353098,
-        'signal': 3.981687204469937,
-        'rsi': 53.42398594222993,
-        'rsi_based_ma': 56.47207253239983,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-03T18:00:00+07:00',
-        'open': 3353.28,
-        'high': 3353.845,
-        'low': 3343.135,
-        'close': 3346.115,
-        'volume': 13097.0,
-        'accumulation_distribution': 6963935.250590577,
-        'macd': 2.5262273060125158,
-        'signal': 3.690595224778453,
-        'rsi': 48.23789255695315,
-        'rsi_based_ma': 55.233757444786825,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-03T19:00:00+07:00',
-        'open': 3346.015,
-        'high': 3352.365,
-        'low': 3311.625,
-        'close': 3324.525,
-        'volume': 54602.0,
-        'accumulation_distribution': 6943911.836746689,
-        'macd': 0.202658367073127,
-        'signal': 2.9930078532373874,
-        'rsi': 36.651770126661184,
-        'rsi_based_ma': 52.93545886137159,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-03T20:00:00+07:00',
-        'open': 3324.49,
-        'high': 3338.59,
-        'low': 3322.165,
-        'close': 3332.3,
-        'volume': 51820.0,
-        'accumulation_distribution': 6956042.606914117,
-        'macd': -0.9998832046549068,
-        'signal': 2.1944296416589286,
-        'rsi': 42.04982139596213,
-        'rsi_based_ma': 52.03797496284216,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-03T21:00:00+07:00',
-        'open': 3332.12,
-        'high': 3334.725,
-        'low': 3323.58,
-        'close': 3324.665,
-        'volume': 37211.0,
-        'accumulation_distribution': 6926076.817322372,
-        'macd': -2.5397105533916147,
-        'signal': 1.24760160264882,
-        'rsi': 38.573757183491,
-        'rsi_based_ma': 51.18763704548833,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-03T22:00:00+07:00',
-        'open': 3324.655,
-        'high': 3331.565,
-        'low': 3323.06,
-        'close': 3328.12,
-        'volume': 17465.0,
-        'accumulation_distribution': 6929393.216499327,
-        'macd': -3.441572885838923,
-        'signal': 0.3097667049512714,
-        'rsi': 40.95250712746648,
-        'rsi_based_ma': 50.42869968967578,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-03T23:00:00+07:00',
-        'open': 3328.165,
-        'high': 3334.755,
-        'low': 3325.82,
-        'close': 3333.95,
-        'volume': 13463.0,
-        'accumulation_distribution': 6940430.314988414,
-        'macd': -3.643868754441882,
-        'signal': -0.4809603869273594,
-        'rsi': 44.83460731505925,
-        'rsi_based_ma': 49.6543248311055,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-04T00:00:00+07:00',
-        'open': 3333.945,
-        'high': 3334.89,
-        'low': 3328.895,
-        'close': 3329.145,
-        'volume': 7326.0,
-        'accumulation_distribution': 6933715.324162725,
-        'macd': -4.144141942043461,
-        'signal': -1.21359669795058,
-        'rsi': 42.362558840763946,
-        'rsi_based_ma': 48.940731587071774,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-04T01:00:00+07:00',
-        'open': 3329.085,
-        'high': 3330.31,
-        'low': 3327.94,
-        'close': 3329.105,
-        'volume': 3542.0,
-        'accumulation_distribution': 6933655.543572008,
-        'macd': -4.492058064044159,
-        'signal': -1.869288971169296,
-        'rsi': 42.34162916698937,
-        'rsi_based_ma': 48.03181475249084,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-04T02:00:00+07:00',
-        'open': 3329.065,
-        'high': 3329.62,
-        'low': 3327.04,
-        'close': 3328.89,
-        'volume': 3713.0,
-        'accumulation_distribution': 6935267.388533248,
-        'macd': -4.730601372574256,
-        'signal': -2.441551451450288,
-        'rsi': 42.2208837250718,
-        'rsi_based_ma': 46.669449218753485,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-04T03:00:00+07:00',
-        'open': 3328.895,
-        'high': 3328.98,
-        'low': 3325.255,
-        'close': 3326.03,
-        'volume': 1147.0,
-        'accumulation_distribution': 6934597.663701033,
-        'macd': -5.091732439113912,
-        'signal': -2.9715876489830126,
-        'rsi': 40.56376473994906,
-        'rsi_based_ma': 45.07374252091954,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-04T05:00:00+07:00',
-        'open': 3324.24,
-        'high': 3329.76,
-        'low': 3323.66,
-        'close': 3329.205,
-        'volume': 3108.0,
-        'accumulation_distribution': 6937140.109602672,
-        'macd': -5.063368090230597,
-        'signal': -3.3899437372325294,
-        'rsi': 43.2277092356052,
-        'rsi_based_ma': 44.28561291387923,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-04T06:00:00+07:00',
-        'open': 3329.225,
-        'high': 3332.11,
-        'low': 3328.54,
-        'close': 3330.915,
-        'volume': 7324.0,
-        'accumulation_distribution': 6939560.927529843,
-        'macd': -4.8470328528978825,
-        'signal': -3.6813615603656,
-        'rsi': 44.6661817958926,
-        'rsi_based_ma': 43.43564657024006,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-04T07:00:00+07:00',
-        'open': 3330.995,
-        'high': 3331.25,
-        'low': 3325.93,
-        'close': 3329.09,
-        'volume': 11814.0,
-        'accumulation_distribution': 6941781.604221573,
-        'macd': -4.767886637290758,
-        'signal': -3.898666575750632,
-        'rsi': 43.40223526561909,
-        'rsi_based_ma': 43.10780745840812,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-04T08:00:00+07:00',
-        'open': 3329.08,
-        'high': 3334.435,
-        'low': 3326.55,
-        'close': 3330.145,
-        'volume': 15926.0,
-        'accumulation_distribution': 6940377.854063044,
-        'macd': -4.567383059395979,
-        'signal': -4.032409872479701,
-        'rsi': 44.38203926578619,
-        'rsi_based_ma': 42.461954124376426,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-04T09:00:00+07:00',
-        'open': 3330.135,
-        'high': 3332.535,
-        'low': 3327.175,
-        'close': 3327.415,
-        'volume': 11030.0,
-        'accumulation_distribution': 6930335.615257073,
-        'macd': -4.576021189997846,
-        'signal': -4.14113213598333,
-        'rsi': 42.339454638140005,
-        'rsi_based_ma': 42.04063713017548,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-04T10:00:00+07:00',
-        'open': 3327.335,
-        'high': 3339.065,
-        'low': 3326.235,
-        'close': 3338.42,
-        'volume': 10142.0,
-        'accumulation_distribution': 6939457.881819817,
-        'macd': -3.652748828617405,
-        'signal': -4.043455474510145,
-        'rsi': 51.94134054972033,
-        'rsi_based_ma': 43.13274930325114,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-04T11:00:00+07:00',
-        'open': 3338.37,
-        'high': 3342.43,
-        'low': 3338.105,
-        'close': 3340.94,
-        'volume': 10276.0,
-        'accumulation_distribution': 6942653.539623287,
-        'macd': -2.6867348836203746,
-        'signal': -3.772111356332191,
-        'rsi': 53.83702799659756,
-        'rsi_based_ma': 43.97469263186796,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-04T12:00:00+07:00',
-        'open': 3340.955,
-        'high': 3342.3,
-        'low': 3338.49,
-        'close': 3339.59,
-        'volume': 10084.0,
-        'accumulation_distribution': 6938392.321775519,
-        'macd': -2.0069605975554623,
-        'signal': -3.419081204576845,
-        'rsi': 52.639124991557104,
-        'rsi_based_ma': 44.97936176101553,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-04T13:00:00+07:00',
-        'open': 3339.58,
-        'high': 3345.175,
-        'low': 3339.295,
-        'close': 3342.585,
-        'volume': 15633.0,
-        'accumulation_distribution': 6940253.39320409,
-        'macd': -1.2125851814357702,
-        'signal': -2.97778199994863,
-        'rsi': 55.02976130194974,
-        'rsi_based_ma': 45.98487991633577,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-04T14:00:00+07:00',
-        'open': 3342.68,
-        'high': 3343.805,
-        'low': 3336.45,
-        'close': 3342.98,
-        'volume': 16731.0,
-        'accumulation_distribution': 6953231.007752018,
-        'macd': -0.5448826738611388,
-        'signal': -2.4912021347311315,
-        'rsi': 55.34987292655898,
-        'rsi_based_ma': 46.735970317157175,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-04T15:00:00+07:00',
-        'open': 3342.96,
-        'high': 3344.295,
-        'low': 3340.92,
-        'close': 3342.895,
-        'volume': 8514.0,
-        'accumulation_distribution': 6954681.541085351,
-        'macd': -0.0223250662302234,
-        'signal': -1.99742672103095,
-        'rsi': 55.25871728213955,
-        'rsi_based_ma': 47.65712449154115,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-04T16:00:00+07:00',
-        'open': 3342.855,
-        'high': 3343.14,
-        'low': 3332.96,
-        'close': 3334.585,
-        'volume': 14417.0,
-        'accumulation_distribution': 6944867.21790264,
-        'macd': -0.2755654013767525,
-        'signal': -1.6530544571001105,
-        'rsi': 47.093068309946325,
-        'rsi_based_ma': 47.99651300175236,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-04T17:00:00+07:00',
-        'open': 3334.595,
-        'high': 3338.185,
-        'low': 3331.52,
-        'close': 3336.93,
-        'volume': 13729.0,
-        'accumulation_distribution': 6953425.956837373,
-        'macd': -0.2837671978436447,
-        'signal': -1.3791970052488174,
-        'rsi': 49.36686300386655,
-        'rsi_based_ma': 48.50694009309484,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-04T18:00:00+07:00',
-        'open': 3336.935,
-        'high': 3337.95,
-        'low': 3334.45,
-        'close': 3334.77,
-        'volume': 9841.0,
-        'accumulation_distribution': 6945384.453980231,
-        'macd': -0.4592669848434525,
-        'signal': -1.1952110011677444,
-        'rsi': 47.348316306945485,
-        'rsi_based_ma': 48.991550919308864,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-04T19:00:00+07:00',
-        'open': 3334.75,
-        'high': 3337.905,
-        'low': 3331.455,
-        'close': 3334.035,
-        'volume': 17052.0,
-        'accumulation_distribution': 6941974.053980229,
-        'macd': -0.6501654848025282,
-        'signal': -1.0862018978947012,
-        'rsi': 46.64933272172579,
-        'rsi_based_ma': 49.235952596888914,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-04T20:00:00+07:00',
-        'open': 3334.03,
-        'high': 3338.095,
-        'low': 3332.335,
-        'close': 3333.85,
-        'volume': 18657.0,
-        'accumulation_distribution': 6933131.413355229,
-        'macd': -0.8070783781063255,
-        'signal': -1.030377193937026,
-        'rsi': 46.46340568437634,
-        'rsi_based_ma': 49.3643257317806,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-04T21:00:00+07:00',
-        'open': 3333.855,
-        'high': 3334.3,
-        'low': 3330.95,
-        'close': 3333.225,
-        'volume': 15013.0,
-        'accumulation_distribution': 6938509.204400004,
-        'macd': -0.9706759055879955,
-        'signal': -1.01843693626722,
-        'rsi': 45.79928232184961,
-        'rsi_based_ma': 49.53554337865422,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-04T22:00:00+07:00',
-        'open': 3333.23,
-        'high': 3333.925,
-        'low': 3330.87,
-        'close': 3332.45,
-        'volume': 6435.0,
-        'accumulation_distribution': 6938730.374612769,
-        'macd': -1.1496121347477128,
-        'signal': -1.0446719759633187,
-        'rsi': 44.94147178219546,
-        'rsi_based_ma': 49.57550284411202,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-04T23:00:00+07:00',
-        'open': 3332.475,
-        'high': 3337.59,
-        'low': 3332.35,
-        'close': 3336.615,
-        'volume': 5333.0,
-        'accumulation_distribution': 6942078.765834142,
-        'macd': -0.9444526318420684,
-        'signal': -1.0246281071390686,
-        'rsi': 50.326136107185626,
-        'rsi_based_ma': 50.14598009190099,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-07T05:00:00+07:00',
-        'open': 3341.57,
-        'high': 3342.075,
-        'low': 3332.485,
-        'close': 3333.495,
-        'volume': 5372.0,
-        'accumulation_distribution': 6937838.302851869,
-        'macd': -1.0218410254988155,
-        'signal': -1.024070690811018,
-        'rsi': 46.6459306036572,
-        'rsi_based_ma': 49.76773652432506,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-07T06:00:00+07:00',
-        'open': 3333.54,
-        'high': 3334.63,
-        'low': 3326.25,
-        'close': 3328.95,
-        'volume': 9456.0,
-        'accumulation_distribution': 6934475.668006999,
-        'macd': -1.433392148443545,
-        'signal': -1.1059349823375233,
-        'rsi': 41.84539067406836,
-        'rsi_based_ma': 48.91119100128726,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-07T07:00:00+07:00',
-        'open': 3328.945,
-        'high': 3329.77,
-        'low': 3321.845,
-        'close': 3326.595,
-        'volume': 15213.0,
-        'accumulation_distribution': 6937499.071792488,
-        'macd': -1.9273607815375728,
-        'signal': -1.2702201421775332,
-        'rsi': 39.57283171152803,
-        'rsi_based_ma': 47.97788433842804,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-07T08:00:00+07:00',
-        'open': 3326.585,
-        'high': 3327.86,
-        'low': 3306.785,
-        'close': 3316.655,
-        'volume': 30799.0,
-        'accumulation_distribution': 6935548.103109214,
-        'macd': -3.085343490867217,
-        'signal': -1.63324481191547,
-        'rsi': 31.738035118219106,
-        'rsi_based_ma': 46.31418961101871,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-07T09:00:00+07:00',
-        'open': 3316.67,
-        'high': 3317.82,
-        'low': 3305.965,
-        'close': 3309.0,
-        'volume': 18895.0,
-        'accumulation_distribution': 6926327.725631356,
-        'macd': -4.568089562383648,
-        'signal': -2.2202137620091054,
-        'rsi': 27.261660746516483,
-        'rsi_based_ma': 44.30788874101568,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-07T10:00:00+07:00',
-        'open': 3308.945,
-        'high': 3315.37,
-        'low': 3307.2,
-        'close': 3310.975,
-        'volume': 16140.0,
-        'accumulation_distribution': 6925102.903109937,
-        'macd': -5.52017734419951,
-        'signal': -2.880206478447186,
-        'rsi': 30.004638062966364,
-        'rsi_based_ma': 42.50402593964616,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-07T11:00:00+07:00',
-        'open': 3310.965,
-        'high': 3312.4,
-        'low': 3305.245,
-        'close': 3307.855,
-        'volume': 15490.0,
-        'accumulation_distribution': 6920913.783613082,
-        'macd': -6.452095949961858,
-        'signal': -3.5945843727501208,
-        'rsi': 28.19573837203467,
-        'rsi_based_ma': 41.15421665836676,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-07T12:00:00+07:00',
-        'open': 3307.94,
-        'high': 3315.21,
-        'low': 3307.095,
-        'close': 3313.44,
-        'volume': 20251.0,
-        'accumulation_distribution': 6932330.705979072,
-        'macd': -6.663176385246061,
-        'signal': -4.208302775249309,
-        'rsi': 35.67192161199037,
-        'rsi_based_ma': 40.17600655894703,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-07T13:00:00+07:00',
-        'open': 3313.43,
-        'high': 3315.29,
-        'low': 3308.45,
-        'close': 3310.02,
-        'volume': 21075.0,
-        'accumulation_distribution': 6920930.486680827,
-        'macd': -7.02543967345764,
-        'signal': -4.771730154890975,
-        'rsi': 33.37998073513744,
-        'rsi_based_ma': 39.17826830381788,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-07T14:00:00+07:00',
-        'open': 3309.995,
-        'high': 3313.335,
-        'low': 3300.765,
-        'close': 3302.315,
-        'volume': 17549.0,
-        'accumulation_distribution': 6907709.402353063,
-        'macd': -7.843846071076769,
-        'signal': -5.386153338128134,
-        'rsi': 28.878254638272598,
-        'rsi_based_ma': 37.90890558357122,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-07T15:00:00+07:00',
-        'open': 3302.305,
-        'high': 3312.86,
-        'low': 3301.335,
-        'close': 3310.25,
-        'volume': 18086.0,
-        'accumulation_distribution': 6917603.739012499,
-        'macd': -7.762667652447362,
-        'signal': -5.861456200991979,
-        'rsi': 38.13200906566696,
-        'rsi_based_ma': 37.31380582509198,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-07T16:00:00+07:00',
-        'open': 3310.16,
-        'high': 3311.98,
-        'low': 3306.18,
-        'close': 3308.995,
-        'volume': 16912.0,
-        'accumulation_distribution': 6917108.042460775,
-        'macd': -7.710716838393637,
-        'signal': -6.231308328472311,
-        'rsi': 37.30527229022443,
-        'rsi_based_ma': 36.70709082283304,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-07T17:00:00+07:00',
-        'open': 3309.01,
-        'high': 3310.76,
-        'low': 3296.28,
-        'close': 3302.175,
-        'volume': 24124.0,
-        'accumulation_distribution': 6912626.443013261,
-        'macd': -8.126188800734326,
-        'signal': -6.610284422924714,
-        'rsi': 33.104836514853815,
-        'rsi_based_ma': 35.86161687516577,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-07T18:00:00+07:00',
-        'open': 3302.175,
-        'high': 3307.635,
-        'low': 3299.815,
-        'close': 3301.87,
-        'volume': 25054.0,
-        'accumulation_distribution': 6900740.210276687,
-        'macd': -8.383425366092524,
-        'signal': -6.964912611558276,
-        'rsi': 32.92628357845389,
-        'rsi_based_ma': 34.618770265970646,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-07T19:00:00+07:00',
-        'open': 3301.92,
-        'high': 3312.795,
-        'low': 3300.495,
-        'close': 3309.575,
-        'volume': 31983.0,
-        'accumulation_distribution': 6915977.639544978,
-        'macd': -7.874782500021865,
-        'signal': -7.146886589250994,
-        'rsi': 41.50895380337993,
-        'rsi_based_ma': 34.25184335166513,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-07T20:00:00+07:00',
-        'open': 3309.565,
-        'high': 3317.21,
-        'low': 3306.225,
-        'close': 3316.625,
-        'volume': 32613.0,
-        'accumulation_distribution': 6945117.065580481,
-        'macd': -6.824138858512924,
-        'signal': -7.08233704310338,
-        'rsi': 48.05815837621953,
-        'rsi_based_ma': 34.69561247324736,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-07T21:00:00+07:00',
-        'open': 3316.6,
-        'high': 3321.455,
-        'low': 3313.29,
-        'close': 3318.085,
-        'volume': 26810.0,
-        'accumulation_distribution': 6949796.091912386,
-        'macd': -5.806749807661163,
-        'signal': -6.827219596014936,
-        'rsi': 49.32363192256582,
-        'rsi_based_ma': 35.392098202607194,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-07T22:00:00+07:00',
-        'open': 3318.07,
-        'high': 3322.135,
-        'low': 3316.195,
-        'close': 3320.975,
-        'volume': 13189.0,
-        'accumulation_distribution': 6957833.832653126,
-        'macd': -4.712935026422201,
-        'signal': -6.404362682096389,
-        'rsi': 51.82559971399715,
-        'rsi_based_ma': 36.82692424516277,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-07T23:00:00+07:00',
-        'open': 3320.97,
-        'high': 3328.16,
-        'low': 3320.23,
-        'close': 3327.49,
-        'volume': 25648.0,
-        'accumulation_distribution': 6979147.870484146,
-        'macd': -3.282533872728891,
-        'signal': -5.77999692022289,
-        'rsi': 56.9817994603072,
-        'rsi_based_ma': 38.949791296147815,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-08T00:00:00+07:00',
-        'open': 3327.545,
-        'high': 3335.92,
-        'low': 3327.45,
-        'close': 3332.08,
-        'volume': 23666.0,
-        'accumulation_distribution': 6981355.206965846,
-        'macd': -1.7582875685789077,
-        'signal': -4.975655049894093,
-        'rsi': 60.21281865800172,
-        'rsi_based_ma': 41.10751848150749,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-08T01:00:00+07:00',
-        'open': 3332.085,
-        'high': 3335.845,
-        'low': 3328.62,
-        'close': 3334.495,
-        'volume': 23484.0,
-        'accumulation_distribution': 6996063.179284185,
-        'macd': -0.3513904634064602,
-        'signal': -4.050802132596567,
-        'rsi': 61.836944119423485,
-        'rsi_based_ma': 43.51046174917811,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-08T02:00:00+07:00',
-        'open': 3334.465,
-        'high': 3340.47,
-        'low': 3334.43,
-        'close': 3337.235,
-        'volume': 19154.0,
-        'accumulation_distribution': 6994699.566701406,
-        'macd': 0.9734592966392484,
-        'signal': -3.0459498467494037,
-        'rsi': 63.6499512422496,
-        'rsi_based_ma': 45.50889243705377,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-08T03:00:00+07:00',
-        'open': 3337.22,
-        'high': 3338.015,
-        'low': 3335.53,
-        'close': 3336.44,
-        'volume': 4780.0,
-        'accumulation_distribution': 6993420.411771828,
-        'macd': 1.9369346437219972,
-        'signal': -2.0493729486551238,
-        'rsi': 62.71893704089598,
-        'rsi_based_ma': 47.60453217317938,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-08T05:00:00+07:00',
-        'open': 3340.5,
-        'high': 3345.955,
-        'low': 3339.01,
-        'close': 3339.81,
-        'volume': 5094.0,
-        'accumulation_distribution': 6989499.975486731,
-        'macd': 2.9385528256957514,
-        'signal': -1.0517877937849485,
-        'rsi': 65.05251146840135,
-        'rsi_based_ma': 50.188407661045765,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-08T06:00:00+07:00',
-        'open': 3339.86,
-        'high': 3340.165,
-        'low': 3333.88,
-        'close': 3334.715,
-        'volume': 8573.0,
-        'accumulation_distribution': 6983204.924571855,
-        'macd': 3.2833698876333983,
-        'signal': -0.1847562575012791,
-        'rsi': 59.03594321733901,
-        'rsi_based_ma': 51.68154581473663,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-08T07:00:00+07:00',
-        'open': 3334.725,
-        'high': 3337.365,
-        'low': 3331.3,
-        'close': 3334.285,
-        'volume': 25172.0,
-        'accumulation_distribution': 6982810.639328655,
-        'macd': 3.481806390431757,
-        'signal': 0.5485562720853281,
-        'rsi': 58.543818952086845,
-        'rsi_based_ma': 53.19858486201252,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-08T08:00:00+07:00',
-        'open': 3334.33,
-        'high': 3337.095,
-        'low': 3329.74,
-        'close': 3334.9,
-        'volume': 25603.0,
-        'accumulation_distribution': 6993131.903094802,
-        'macd': 3.646657708687599,
-        'signal': 1.1681765594057822,
-        'rsi': 59.06934985575552,
-        'rsi_based_ma': 55.05319295779121,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-08T09:00:00+07:00',
-        'open': 3334.9,
-        'high': 3338.15,
-        'low': 3332.875,
-        'close': 3334.545,
-        'volume': 16066.0,
-        'accumulation_distribution': 6987238.498355466,
-        'macd': 3.705938283290834,
-        'signal': 1.6757289041827923,
-        'rsi': 58.60750076823012,
-        'rsi_based_ma': 56.8875656142038,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-08T10:00:00+07:00',
-        'open': 3334.465,
-        'high': 3335.565,
-        'low': 3329.7,
-        'close': 3331.61,
-        'volume': 9888.0,
-        'accumulation_distribution': 6983790.764340121,
-        'macd': 3.4760192088824624,
-        'signal': 2.0357869651227265,
-        'rsi': 54.793084515257874,
-        'rsi_based_ma': 57.83643209362365,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-08T11:00:00+07:00',
-        'open': 3331.605,
-        'high': 3332.845,
-        'low': 3327.405,
-        'close': 3329.66,
-        'volume': 10814.0,
-        'accumulation_distribution': 6981942.047428356,
-        'macd': 3.1007148718517783,
-        'signal': 2.248772546468537,
-        'rsi': 52.35502424994674,
-        'rsi_based_ma': 58.14335108460416,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-08T12:00:00+07:00',
-        'open': 3329.68,
-        'high': 3336.625,
-        'low': 3329.53,
-        'close': 3334.15,
-        'volume': 15791.0,
-        'accumulation_distribution': 6986716.070684169,
-        'macd': 3.1295138685159145,
-        'signal': 2.4249208108780125,
-        'rsi': 57.08956655737133,
-        'rsi_based_ma': 58.69806070137599,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-08T13:00:00+07:00',
-        'open': 3334.17,
-        'high': 3336.125,
-        'low': 3330.785,
-        'close': 3335.835,
-        'volume': 16641.0,
-        'accumulation_distribution': 7001549.621245967,
-        'macd': 3.25082916369729,
-        'signal': 2.590102481441868,
-        'rsi': 58.74633449722543,
-        'rsi_based_ma': 59.19239890017801,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-08T14:00:00+07:00',
-        'open': 3335.855,
-        'high': 3339.59,
-        'low': 3330.595,
-        'close': 3333.93,
-        'volume': 17578.0,
-        'accumulation_distribution': 6997006.113741798,
-        'macd': 3.1568644614749246,
-        'signal': 2.7034548774484795,
-        'rsi': 56.10873404424467,
-        'rsi_based_ma': 59.13003708474497,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-08T15:00:00+07:00',
-        'open': 3333.925,
-        'high': 3333.925,
-        'low': 3323.405,
-        'close': 3323.73,
-        'volume': 22008.0,
-        'accumulation_distribution': 6976357.9236277295,
-        'macd': 2.233594515728328,
-        'signal': 2.609482805104449,
-        'rsi': 44.569945534217794,
-        'rsi_based_ma': 58.01268900447469,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-08T16:00:00+07:00',
-        'open': 3323.735,
-        'high': 3326.845,
-        'low': 3321.185,
-        'close': 3322.095,
-        'volume': 16967.0,
-        'accumulation_distribution': 6964846.743415714,
-        'macd': 1.3543534526420444,
-        'signal': 2.358456934611968,
-        'rsi': 43.041943660881735,
-        'rsi_based_ma': 56.670188971721714,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-08T17:00:00+07:00',
-        'open': 3322.09,
-        'high': 3327.125,
-        'low': 3320.58,
-        'close': 3324.67,
-        'volume': 13031.0,
-        'accumulation_distribution': 6968102.004683859,
-        'macd': 0.8554682499088813,
-        'signal': 2.057859197671351,
-        'rsi': 46.17187762043661,
-        'rsi_based_ma': 55.42175514159221,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-08T18:00:00+07:00',
-        'open': 3324.735,
-        'high': 3327.565,
-        'low': 3320.035,
-        'close': 3325.06,
-        'volume': 13686.0,
-        'accumulation_distribution': 6972682.179982663,
-        'macd': 0.4859659600197119,
-        'signal': 1.743480550141023,
-        'rsi': 46.6500517466062,
-        'rsi_based_ma': 54.27397762057151,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-08T19:00:00+07:00',
-        'open': 3325.065,
-        'high': 3329.935,
-        'low': 3324.745,
-        'close': 3328.245,
-        'volume': 16576.0,
-        'accumulation_distribution': 6978463.020059735,
-        'macd': 0.4450058644083583,
-        'signal': 1.4837856129944902,
-        'rsi': 50.516124812479774,
-        'rsi_based_ma': 53.23566428800569,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-08T20:00:00+07:00',
-        'open': 3328.24,
-        'high': 3328.78,
-        'low': 3314.86,
-        'close': 3315.31,
-        'volume': 37017.0,
-        'accumulation_distribution': 6943839.360576975,
-        'macd': -0.6240085223457754,
-        'signal': 1.0622267859264372,
-        'rsi': 38.35869951690671,
-        'rsi_based_ma': 51.758718309403385,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-08T21:00:00+07:00',
-        'open': 3315.305,
-        'high': 3315.955,
-        'low': 3294.435,
-        'close': 3296.65,
-        'volume': 52141.0,
-        'accumulation_distribution': 6902431.84710114,
-        'macd': -2.94299120686992,
-        'signal': 0.2611831873671657,
-        'rsi': 27.919816488829028,
-        'rsi_based_ma': 49.571289562027815,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-08T22:00:00+07:00',
-        'open': 3296.67,
-        'high': 3300.375,
-        'low': 3287.11,
-        'close': 3298.205,
-        'volume': 36535.0,
-        'accumulation_distribution': 6927013.443407208,
-        'macd': -4.602274037116786,
-        'signal': -0.7115082575296247,
-        'rsi': 29.63824031634685,
-        'rsi_based_ma': 47.469067452070064,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-08T23:00:00+07:00',
-        'open': 3298.21,
-        'high': 3301.655,
-        'low': 3295.93,
-        'close': 3300.505,
-        'volume': 29221.0,
-        'accumulation_distribution': 6944495.002359172,
-        'macd': -5.666358601702086,
-        'signal': -1.702478326364117,
-        'rsi': 32.212464541196724,
-        'rsi_based_ma': 45.58370772156768,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-09T00:00:00+07:00',
-        'open': 3300.49,
-        'high': 3310.525,
-        'low': 3299.37,
-        'close': 3306.51,
-        'volume': 28411.0,
-        'accumulation_distribution': 6952454.157446578,
-        'macd': -5.956437863395422,
-        'signal': -2.553270233770378,
-        'rsi': 38.53521321601047,
-        'rsi_based_ma': 44.42243120019287,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-09T01:00:00+07:00',
-        'open': 3306.52,
-        'high': 3308.33,
-        'low': 3300.68,
-        'close': 3305.43,
-        'volume': 16001.0,
-        'accumulation_distribution': 6956323.680322395,
-        'macd': -6.20198215260325,
-        'signal': -3.2830126175369525,
-        'rsi': 37.85140624995412,
-        'rsi_based_ma': 43.38645848590768,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-09T02:00:00+07:00',
-        'open': 3305.465,
-        'high': 3306.235,
-        'low': 3302.495,
-        'close': 3303.0,
-        'volume': 11113.0,
-        'accumulation_distribution': 6948211.78460047,
-        'macd': -6.5175284515253225,
-        'signal': -3.9299157843346255,
-        'rsi': 36.29098549664512,
-        'rsi_based_ma': 41.90084555299866,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-09T03:00:00+07:00',
-        'open': 3303.01,
-        'high': 3303.885,
-        'low': 3299.43,
-        'close': 3301.72,
-        'volume': 2454.0,
-        'accumulation_distribution': 6948280.639819325,
-        'macd': -6.792585768897425,
-        'signal': -4.502449781247186,
-        'rsi': 35.46169335842583,
-        'rsi_based_ma': 40.23765690022726,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-09T05:00:00+07:00',
-        'open': 3302.83,
-        'high': 3304.12,
-        'low': 3300.39,
-        'close': 3301.625,
-        'volume': 2275.0,
-        'accumulation_distribution': 6947512.141159807,
-        'macd': -6.938256478873427,
-        'signal': -4.989611120772435,
-        'rsi': 35.3970425316535,
-        'rsi_based_ma': 38.758250363613605,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-09T06:00:00+07:00',
-        'open': 3301.665,
-        'high': 3303.965,
-        'low': 3297.29,
-        'close': 3302.365,
-        'volume': 6043.0,
-        'accumulation_distribution': 6950658.122433215,
-        'macd': -6.914286163568704,
-        'signal': -5.374546129331689,
-        'rsi': 36.37016656218735,
-        'rsi_based_ma': 38.17255186561143,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-09T07:00:00+07:00',
-        'open': 3302.355,
-        'high': 3308.145,
-        'low': 3301.925,
-        'close': 3307.175,
-        'volume': 13918.0,
-        'accumulation_distribution': 6960235.138510386,
-        'macd': -6.433007014386021,
-        'signal': -5.586238306342556,
-        'rsi': 42.43946709888669,
-        'rsi_based_ma': 38.12951782546893,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-09T08:00:00+07:00',
-        'open': 3307.11,
-        'high': 3307.305,
-        'low': 3299.385,
-        'close': 3301.89,
-        'volume': 16147.0,
-        'accumulation_distribution': 6954302.339267962,
-        'macd': -6.40422127625834,
-        'signal': -5.7498349003257125,
-        'rsi': 38.1352955539101,
-        'rsi_based_ma': 37.55547624928846,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-09T09:00:00+07:00',
-        'open': 3301.875,
-        'high': 3303.035,
-        'low': 3286.325,
-        'close': 3288.63,
-        'volume': 20456.0,
-        'accumulation_distribution': 6939489.795880769,
-        'macd': -7.366463546657087,
-        'signal': -6.073160629591987,
-        'rsi': 29.93273764582908,
-        'rsi_based_ma': 36.36138238494723,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-09T10:00:00+07:00',
-        'open': 3288.615,
-        'high': 3294.775,
-        'low': 3284.98,
-        'close': 3293.395,
-        'volume': 16503.0,
-        'accumulation_distribution': 6951342.639678625,
-        'macd': -7.656294800710839,
-        'signal': -6.3897874638157575,
-        'rsi': 35.31688776953649,
-        'rsi_based_ma': 35.275722596165565,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-09T11:00:00+07:00',
-        'open': 3293.375,
-        'high': 3296.49,
-        'low': 3291.27,
-        'close': 3294.05,
-        'volume': 10318.0,
-        'accumulation_distribution': 6952014.693318473,
-        'macd': -7.743868634505361,
-        'signal': -6.660603697953678,
-        'rsi': 36.04440557953272,
-        'rsi_based_ma': 35.11041588635313,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-09T12:00:00+07:00',
-        'open': 3294.07,
-        'high': 3297.885,
-        'low': 3289.08,
-        'close': 3289.495,
-        'volume': 16348.0,
-        'accumulation_distribution': 6937207.731365037,
-        'macd': -8.087593220703639,
-        'signal': -6.94600160250367,
-        'rsi': 33.24413781859428,
-        'rsi_based_ma': 35.490724552764945,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-09T13:00:00+07:00',
-        'open': 3289.535,
-        'high': 3292.88,
-        'low': 3285.65,
-        'close': 3292.39,
-        'volume': 16672.0,
-        'accumulation_distribution': 6951619.902872643,
-        'macd': -8.033786634725857,
-        'signal': -7.163558608948107,
-        'rsi': 36.61464671673049,
-        'rsi_based_ma': 35.98903929564949,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-09T14:00:00+07:00',
-        'open': 3292.405,
-        'high': 3296.1,
-        'low': 3288.34,
-        'close': 3291.94,
-        'volume': 18834.0,
-        'accumulation_distribution': 6950260.748233468,
-        'macd': -7.935974789475495,
-        'signal': -7.318041845053584,
-        'rsi': 36.30777677252404,
-        'rsi_based_ma': 36.28156159788716,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-09T15:00:00+07:00',
-        'open': 3291.865,
-        'high': 3292.73,
-        'low': 3282.665,
-        'close': 3285.08,
-        'volume': 17317.0,
-        'accumulation_distribution': 6941253.843613498,
-        'macd': -8.316139585481778,
-        'signal': -7.517661393139223,
-        'rsi': 31.91632008721392,
-        'rsi_based_ma': 35.808783517258824,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-09T16:00:00+07:00',
-        'open': 3285.06,
-        'high': 3290.515,
-        'low': 3284.465,
-        'close': 3289.055,
-        'volume': 10126.0,
-        'accumulation_distribution': 6946492.584109365,
-        'macd': -8.202124658301727,
-        'signal': -7.654554046171723,
-        'rsi': 36.69435261376417,
-        'rsi_based_ma': 35.72613682895954,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-09T17:00:00+07:00',
-        'open': 3289.13,
-        'high': 3296.04,
-        'low': 3288.31,
-        'close': 3295.555,
-        'volume': 9846.0,
-        'accumulation_distribution': 6955103.057589313,
-        'macd': -7.500806699305485,
-        'signal': -7.6238045767984755,
-        'rsi': 43.657464514190806,
-        'rsi_based_ma': 36.25231390164138,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-09T18:00:00+07:00',
-        'open': 3295.545,
-        'high': 3296.035,
-        'low': 3283.295,
-        'close': 3284.99,
-        'volume': 12821.0,
-        'accumulation_distribution': 6945693.610964509,
-        'macd': -7.708653806083021,
-        'signal': -7.640774422655385,
-        'rsi': 36.60906673154175,
-        'rsi_based_ma': 36.33426914257823,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-09T19:00:00+07:00',
-        'open': 3284.995,
-        'high': 3297.595,
-        'low': 3284.995,
-        'close': 3296.525,
-        'volume': 20892.0,
-        'accumulation_distribution': 6963037.287154986,
-        'macd': -6.863478134115667,
-        'signal': -7.485315164947441,
-        'rsi': 46.722693794021744,
-        'rsi_based_ma': 37.14324423274739,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-09T20:00:00+07:00',
-        'open': 3296.54,
-        'high': 3305.345,
-        'low': 3291.94,
-        'close': 3300.305,
-        'volume': 35510.0,
-        'accumulation_distribution': 6971845.25060146,
-        'macd': -5.821548725775301,
-        'signal': -7.152561877113014,
-        'rsi': 49.56252180176776,
-        'rsi_based_ma': 38.08555532128885,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-09T21:00:00+07:00',
-        'open': 3300.3,
-        'high': 3313.035,
-        'low': 3299.575,
-        'close': 3312.42,
-        'volume': 35351.0,
-        'accumulation_distribution': 7003965.810036825,
-        'macd': -3.972441084189086,
-        'signal': -6.5165377185282285,
-        'rsi': 57.3999898704441,
-        'rsi_based_ma': 39.15416409068581,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-09T22:00:00+07:00',
-        'open': 3312.44,
-        'high': 3312.985,
-        'low': 3306.405,
-        'close': 3309.64,
-        'volume': 22001.0,
-        'accumulation_distribution': 7003598.012164483,
-        'macd': -2.7002064238672574,
-        'signal': -5.753271459596034,
-        'rsi': 55.27735292684004,
-        'rsi_based_ma': 40.378596760180805,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-09T23:00:00+07:00',
-        'open': 3309.63,
-        'high': 3313.385,
-        'low': 3307.995,
-        'close': 3311.93,
-        'volume': 16923.0,
-        'accumulation_distribution': 7011384.475986374,
-        'macd': -1.489991730750717,
-        'signal': -4.9006155138269705,
-        'rsi': 56.69787656941672,
-        'rsi_based_ma': 42.29039239757992,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-10T00:00:00+07:00',
-        'open': 3311.935,
-        'high': 3314.69,
-        'low': 3308.25,
-        'close': 3309.57,
-        'volume': 19554.0,
-        'accumulation_distribution': 6999846.401452213,
-        'macd': -0.7130999714054269,
-        'signal': -4.063112405342662,
-        'rsi': 54.76722928033199,
-        'rsi_based_ma': 43.67970250549388,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-10T01:00:00+07:00',
-        'open': 3309.505,
-        'high': 3313.77,
-        'low': 3308.105,
-        'close': 3311.485,
-        'volume': 18598.0,
-        'accumulation_distribution': 7003441.248760245,
-        'macd': 0.0564659365873012,
-        'signal': -3.239196736956669,
-        'rsi': 56.07429184382264,
-        'rsi_based_ma': 45.11040866722888,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-10T02:00:00+07:00',
-        'open': 3311.49,
-        'high': 3316.99,
-        'low': 3311.025,
-        'close': 3315.79,
-        'volume': 16102.0,
-        'accumulation_distribution': 7013064.656974831,
-        'macd': 1.0021775062505185,
-        'signal': -2.390921888315232,
-        'rsi': 58.94629308433498,
-        'rsi_based_ma': 46.94627690049607,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-10T03:00:00+07:00',
-        'open': 3315.765,
-        'high': 3315.975,
-        'low': 3311.67,
-        'close': 3313.7,
-        'volume': 2394.0,
-        'accumulation_distribution': 7012928.413072391,
-        'macd': 1.5649751462287895,
-        'signal': -1.5997424814064274,
-        'rsi': 56.99787422871302,
-        'rsi_based_ma': 48.40222172278054,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-10T05:00:00+07:00',
-        'open': 3315.76,
-        'high': 3321.295,
-        'low': 3314.89,
-        'close': 3319.585,
-        'volume': 3497.0,
-        'accumulation_distribution': 7014558.162486912,
-        'macd': 2.457537683006649,
-        'signal': -0.788286448523812,
-        'rsi': 60.91543688276062,
-        'rsi_based_ma': 50.159911730654585,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-10T06:00:00+07:00',
-        'open': 3319.565,
-        'high': 3319.83,
-        'low': 3315.84,
-        'close': 3317.705,
-        'volume': 5484.0,
-        'accumulation_distribution': 7014200.809103453,
-        'macd': 2.9788611783969827,
-        'signal': -0.034856923139653,
-        'rsi': 59.06426437988384,
-        'rsi_based_ma': 52.099050608702434,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-10T07:00:00+07:00',
-        'open': 3317.695,
-        'high': 3322.09,
-        'low': 3316.64,
-        'close': 3317.71,
-        'volume': 14312.0,
-        'accumulation_distribution': 7005508.566901619,
-        'macd': 3.3537572368545625,
-        'signal': 0.6428659088591901,
-        'rsi': 59.06782709556933,
-        'rsi_based_ma': 53.69715592883137,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-10T08:00:00+07:00',
-        'open': 3317.7,
-        'high': 3326.39,
-        'low': 3316.54,
-        'close': 3322.285,
-        'volume': 18877.0,
-        'accumulation_distribution': 7008651.539490451,
-        'macd': 3.974217029243391,
-        'signal': 1.3091361329360305,
-        'rsi': 62.30089882465285,
-        'rsi_based_ma': 55.02882980815009,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-10T09:00:00+07:00',
-        'open': 3322.28,
-        'high': 3323.69,
-        'low': 3318.165,
-        'close': 3319.245,
-        'volume': 11390.0,
-        'accumulation_distribution': 7001714.462567374,
-        'macd': 4.172534906137571,
-        'signal': 1.8818158875763384,
-        'rsi': 58.96791300409791,
-        'rsi_based_ma': 56.62589025618981,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-10T10:00:00+07:00',
-        'open': 3319.23,
-        'high': 3320.24,
-        'low': 3315.43,
-        'close': 3315.765,
-        'volume': 9812.0,
-        'accumulation_distribution': 6993269.206850119,
-        'macd': 4.002755067167072,
-        'signal': 2.306003723494485,
-        'rsi': 55.319470457646446,
-        'rsi_based_ma': 57.23994573216301,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-10T11:00:00+07:00',
-        'open': 3315.77,
-        'high': 3322.605,
-        'low': 3314.84,
-        'close': 3322.295,
-        'volume': 8752.0,
-        'accumulation_distribution': 7001322.399380705,
-        'macd': 4.345032913362502,
-        'signal': 2.7138095614680884,
-        'rsi': 60.284993614390665,
-        'rsi_based_ma': 58.00583657592178,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-10T12:00:00+07:00',
-        'open': 3322.3,
-        'high': 3325.185,
-        'low': 3320.745,
-        'close': 3321.205,
-        'volume': 11182.0,
-        'accumulation_distribution': 6992457.390371696,
-        'macd': 4.476731705528437,
-        'signal': 3.066393990280158,
-        'rsi': 59.10422919497682,
-        'rsi_based_ma': 58.12756795624556,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-10T13:00:00+07:00',
-        'open': 3321.19,
-        'high': 3328.565,
-        'low': 3321.0,
-        'close': 3325.395,
-        'volume': 13333.0,
-        'accumulation_distribution': 6994616.4022685895,
-        'macd': 4.863142648615394,
-        'signal': 3.4257437219472053,
-        'rsi': 62.17145588201012,
-        'rsi_based_ma': 58.62000388161484,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-10T14:00:00+07:00',
-        'open': 3325.38,
-        'high': 3329.545,
-        'low': 3319.895,
-        'close': 3321.075,
-        'volume': 12483.0,
-        'accumulation_distribution': 6985186.239574289,
-        'macd': 4.7658504513347,
-        'signal': 3.693765067824704,
-        'rsi': 57.39205297454361,
-        'rsi_based_ma': 58.66958791055249,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-10T15:00:00+07:00',
-        'open': 3321.09,
-        'high': 3330.275,
-        'low': 3319.91,
-        'close': 3328.725,
-        'volume': 9589.0,
-        'accumulation_distribution': 6991907.328334539,
-        'macd': 5.245569095045539,
-        'signal': 4.004125873268871,
-        'rsi': 62.8398666056672,
-        'rsi_based_ma': 59.24620486236214,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-10T16:00:00+07:00',
-        'open': 3328.74,
-        'high': 3330.36,
-        'low': 3323.34,
-        'close': 3326.51,
-        'volume': 8385.0,
-        'accumulation_distribution': 6991095.106112317,
-        'macd': 5.3849433133937055,
-        'signal': 4.280289361293837,
-        'rsi': 60.43059649544973,
-        'rsi_based_ma': 59.55736948033551,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-10T17:00:00+07:00',
-        'open': 3326.545,
-        'high': 3328.825,
-        'low': 3322.305,
-        'close': 3325.31,
-        'volume': 10426.0,
-        'accumulation_distribution': 6990279.575437471,
-        'macd': 5.337046267217829,
-        'signal': 4.491640742478635,
-        'rsi': 59.10841298621638,
-        'rsi_based_ma': 59.56894947332704,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-10T18:00:00+07:00',
-        'open': 3325.36,
-        'high': 3330.325,
-        'low': 3318.365,
-        'close': 3320.54,
-        'volume': 14593.0,
-        'accumulation_distribution': 6980994.230119746,
-        'macd': 4.858186230843785,
-        'signal': 4.564949840151665,
-        'rsi': 54.04639800036091,
-        'rsi_based_ma': 59.358129742730455,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-10T19:00:00+07:00',
-        'open': 3320.58,
-        'high': 3326.18,
-        'low': 3317.94,
-        'close': 3323.815,
-        'volume': 18891.0,
-        'accumulation_distribution': 6989041.245896446,
-        'macd': 4.688900604273385,
-        'signal': 4.589739992976009,
-        'rsi': 56.782968665208045,
-        'rsi_based_ma': 59.0629534414767,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-10T20:00:00+07:00',
-        'open': 3323.885,
-        'high': 3329.615,
-        'low': 3312.01,
-        'close': 3312.875,
-        'volume': 39079.0,
-        'accumulation_distribution': 6953802.442999541,
-        'macd': 3.630128097937359,
-        'signal': 4.397817613968279,
-        'rsi': 46.76463753255025,
-        'rsi_based_ma': 58.18440866666715,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-10T21:00:00+07:00',
-        'open': 3312.855,
-        'high': 3321.78,
-        'low': 3310.175,
-        'close': 3315.065,
-        'volume': 31990.0,
-        'accumulation_distribution': 6948771.701939652,
-        'macd': 2.933937352540852,
-        'signal': 4.1050415616827935,
-        'rsi': 48.71527601069202,
-        'rsi_based_ma': 57.44494073203306,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-10T22:00:00+07:00',
-        'open': 3315.08,
-        'high': 3321.685,
-        'low': 3314.745,
-        'close': 3319.73,
-        'volume': 17189.0,
-        'accumulation_distribution': 6956276.409432448,
-        'macd': 2.727190331474503,
-        'signal': 3.8294713156411353,
-        'rsi': 52.69181355972269,
-        'rsi_based_ma': 56.75857749882376,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-10T23:00:00+07:00',
-        'open': 3319.75,
-        'high': 3320.03,
-        'low': 3312.25,
-        'close': 3315.17,
-        'volume': 14129.0,
-        'accumulation_distribution': 6952753.239766638,
-        'macd': 2.170369271306299,
-        'signal': 3.497650906774168,
-        'rsi': 48.715487443950025,
-        'rsi_based_ma': 56.02626138738463,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-11T00:00:00+07:00',
-        'open': 3315.11,
-        'high': 3318.63,
-        'low': 3314.725,
-        'close': 3317.445,
-        'volume': 7669.0,
-        'accumulation_distribution': 6955767.814670607,
-        'macd': 1.8908613834673813,
-        'signal': 3.17629300211281,
-        'rsi': 50.71380888213152,
-        'rsi_based_ma': 55.697285560562136,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-11T01:00:00+07:00',
-        'open': 3317.435,
-        'high': 3321.985,
-        'low': 3316.505,
-        'close': 3321.575,
-        'volume': 11630.0,
-        'accumulation_distribution': 6965657.559196154,
-        'macd': 1.9797841336389863,
-        'signal': 2.9369912284180457,
-        'rsi': 54.20258734450007,
-        'rsi_based_ma': 55.262827969855664,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-11T02:00:00+07:00',
-        'open': 3321.565,
-        'high': 3326.065,
-        'low': 3321.56,
-        'close': 3324.8,
-        'volume': 13394.0,
-        'accumulation_distribution': 6971529.512581282,
-        'macd': 2.284156269715368,
-        'signal': 2.8064242366775103,
-        'rsi': 56.77559741505669,
-        'rsi_based_ma': 55.0964971284328,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-11T03:00:00+07:00',
-        'open': 3324.845,
-        'high': 3325.315,
-        'low': 3323.36,
-        'close': 3324.015,
-        'volume': 3206.0,
-        'accumulation_distribution': 6970471.778565937,
-        'macd': 2.4339731139948526,
-        'signal': 2.7319340121409788,
-        'rsi': 55.95157788943835,
-        'rsi_based_ma': 54.652220128963386,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-11T05:00:00+07:00',
-        'open': 3325.94,
-        'high': 3326.83,
-        'low': 3321.915,
-        'close': 3323.425,
-        'volume': 4334.0,
-        'accumulation_distribution': 6968800.785686995,
-        'macd': 2.4765478710346542,
-        'signal': 2.680856783919714,
-        'rsi': 55.301922482510825,
-        'rsi_based_ma': 54.50292509381819,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-11T06:00:00+07:00',
-        'open': 3323.355,
-        'high': 3326.605,
-        'low': 3323.14,
-        'close': 3323.81,
-        'volume': 4700.0,
-        'accumulation_distribution': 6965918.3903046,
-        'macd': 2.512393645113661,
-        'signal': 2.6471641561585035,
-        'rsi': 55.663685121268834,
-        'rsi_based_ma': 53.99034070207545,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-11T07:00:00+07:00',
-        'open': 3323.775,
-        'high': 3336.192,
-        'low': 3323.615,
-        'close': 3330.61,
-        'volume': 19458.0,
-        'accumulation_distribution': 6968104.456457101,
-        'macd': 3.0542968168838343,
-        'signal': 2.7285906883035698,
-        'rsi': 61.57851055572533,
-        'rsi_based_ma': 54.07233456352372,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-11T08:00:00+07:00',
-        'open': 3330.455,
-        'high': 3331.695,
-        'low': 3325.17,
-        'close': 3329.605,
-        'volume': 19384.0,
-        'accumulation_distribution': 6975070.813545222,
-        'macd': 3.363887087451076,
-        'signal': 2.855649968133071,
-        'rsi': 60.2981619144329,
-        'rsi_based_ma': 54.1573166298249,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-11T09:00:00+07:00',
-        'open': 3329.55,
-        'high': 3335.115,
-        'low': 3327.085,
-        'close': 3332.505,
-        'volume': 14241.0,
-        'accumulation_distribution': 6980054.276807988,
-        'macd': 3.799447702996076,
-        'signal': 3.0444095151056723,
-        'rsi': 62.70770551580292,
-        'rsi_based_ma': 54.77598145235647,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-11T10:00:00+07:00',
-        'open': 3332.515,
-        'high': 3336.12,
-        'low': 3332.075,
-        'close': 3333.725,
-        'volume': 10378.0,
-        'accumulation_distribution': 6978142.877549645,
-        'macd': 4.194722285511489,
-        'signal': 3.274472069186836,
-        'rsi': 63.7056574528254,
-        'rsi_based_ma': 55.27045922290057,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-11T11:00:00+07:00',
-        'open': 3333.75,
-        'high': 3335.4,
-        'low': 3329.79,
-        'close': 3332.08,
-        'volume': 13150.0,
-        'accumulation_distribution': 6975728.5281735305,
-        'macd': 4.325382174542028,
-        'signal': 3.484654090257874,
-        'rsi': 61.32277259326018,
-        'rsi_based_ma': 56.310326012951286,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-11T12:00:00+07:00',
-        'open': 3332.05,
-        'high': 3341.805,
-        'low': 3331.995,
-        'close': 3334.17,
-        'volume': 22727.0,
-        'accumulation_distribution': 6963079.249886069,
-        'macd': 4.545182575639501,
-        'signal': 3.6967597873341993,
-        'rsi': 63.205852989662425,
-        'rsi_based_ma': 57.34536722573488,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-11T13:00:00+07:00',
-        'open': 3334.17,
-        'high': 3344.13,
-        'low': 3332.21,
-        'close': 3332.45,
-        'volume': 29256.0,
-        'accumulation_distribution': 6935001.3438458,
-        'macd': 4.5283859374608255,
-        'signal': 3.863085017359525,
-        'rsi': 60.59133927424208,
-        'rsi_based_ma': 57.90961906248626,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-11T14:00:00+07:00',
-        'open': 3332.46,
-        'high': 3342.385,
-        'low': 3331.245,
-        'close': 3342.065,
-        'volume': 27394.0,
-        'accumulation_distribution': 6960821.541332334,
-        'macd': 5.230629187463364,
-        'signal': 4.136593851380292,
-        'rsi': 68.44840623561612,
-        'rsi_based_ma': 59.31911326189099,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-11T15:00:00+07:00',
-        'open': 3341.995,
-        'high': 3343.855,
-        'low': 3332.815,
-        'close': 3333.17,
-        'volume': 30476.0,
-        'accumulation_distribution': 6932305.501477262,
-        'macd': 5.011638808548923,
-        'signal': 4.311602842814018,
-        'rsi': 57.105418896406505,
-        'rsi_based_ma': 59.7756568343392,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-11T16:00:00+07:00',
-        'open': 3333.19,
-        'high': 3340.03,
-        'low': 3332.83,
-        'close': 3339.495,
-        'volume': 22600.0,
-        'accumulation_distribution': 6951546.890366149,
-        'macd': 5.287510861438477,
-        'signal': 4.50678444653891,
-        'rsi': 61.93578694819196,
-        'rsi_based_ma': 60.32802823460291,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-11T17:00:00+07:00',
-        'open': 3339.51,
-        'high': 3348.41,
-        'low': 3339.495,
-        'close': 3345.065,
-        'volume': 27164.0,
-        'accumulation_distribution': 6958326.464118253,
-        'macd': 5.88772388451207,
-        'signal': 4.782972334133542,
-        'rsi': 65.608662451953,
-        'rsi_based_ma': 60.95896145152405,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-11T18:00:00+07:00',
-        'open': 3345.125,
-        'high': 3350.33,
-        'low': 3342.045,
-        'close': 3347.55,
-        'volume': 27844.0,
-        'accumulation_distribution': 6967484.569127307,
-        'macd': 6.489113302766327,
-        'signal': 5.124200527860099,
-        'rsi': 67.13241024975166,
-        'rsi_based_ma': 61.757592334403576,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-11T19:00:00+07:00',
-        'open': 3347.555,
-        'high': 3357.205,
-        'low': 3344.185,
-        'close': 3355.17,
-        'volume': 36111.0,
-        'accumulation_distribution': 6992307.414749428,
-        'macd': 7.494200587122123,
-        'signal': 5.598200539712503,
-        'rsi': 71.32751340401639,
-        'rsi_based_ma': 62.902277400225394,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-11T20:00:00+07:00',
-        'open': 3355.16,
-        'high': 3359.43,
-        'low': 3350.14,
-        'close': 3352.015,
-        'volume': 58370.0,
-        'accumulation_distribution': 6957499.040153088,
-        'macd': 7.944577227718128,
-        'signal': 6.067475877313628,
-        'rsi': 67.48670965580006,
-        'rsi_based_ma': 63.74677915269191,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-11T21:00:00+07:00',
-        'open': 3352.06,
-        'high': 3363.87,
-        'low': 3350.27,
-        'close': 3361.255,
-        'volume': 56029.0,
-        'accumulation_distribution': 6991981.59382956,
-        'macd': 8.943993943539226,
-        'signal': 6.642779490558747,
-        'rsi': 72.20689815691513,
-        'rsi_based_ma': 64.50594969563404,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-11T22:00:00+07:00',
-        'open': 3361.33,
-        'high': 3368.86,
-        'low': 3356.915,
-        'close': 3358.835,
-        'volume': 40957.0,
-        'accumulation_distribution': 6964191.180685986,
-        'macd': 9.432038448031108,
-        'signal': 7.20063128205322,
-        'rsi': 69.36651848303076,
-        'rsi_based_ma': 65.15368945053389,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-11T23:00:00+07:00',
-        'open': 3358.86,
-        'high': 3359.605,
-        'low': 3352.82,
-        'close': 3353.8,
-        'volume': 32767.0,
-        'accumulation_distribution': 6940889.666316053,
-        'macd': 9.305269459264764,
-        'signal': 7.621558917495529,
-        'rsi': 63.747866251869134,
-        'rsi_based_ma': 65.22798664596719,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-12T00:00:00+07:00',
-        'open': 3353.75,
-        'high': 3354.16,
-        'low': 3349.255,
-        'close': 3353.455,
-        'volume': 25938.0,
-        'accumulation_distribution': 6959371.482829815,
-        'macd': 9.07238470214861,
-        'signal': 7.911724074426145,
-        'rsi': 63.36910622414968,
-        'rsi_based_ma': 65.20394727249035,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-12T01:00:00+07:00',
-        'open': 3353.485,
-        'high': 3358.53,
-        'low': 3353.39,
-        'close': 3356.115,
-        'volume': 22099.0,
-        'accumulation_distribution': 6960704.30189596,
-        'macd': 8.99872986734681,
-        'signal': 8.129125233010278,
-        'rsi': 65.09129007045287,
-        'rsi_based_ma': 65.47312709228983,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-12T02:00:00+07:00',
-        'open': 3356.125,
-        'high': 3359.82,
-        'low': 3355.625,
-        'close': 3356.405,
-        'volume': 24805.0,
-        'accumulation_distribution': 6945123.568880468,
-        'macd': 8.861607362959603,
-        'signal': 8.275621659000143,
-        'rsi': 65.28292565688284,
-        'rsi_based_ma': 65.62148942566272,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-12T03:00:00+07:00',
-        'open': 3356.42,
-        'high': 3358.725,
-        'low': 3353.61,
-        'close': 3355.665,
-        'volume': 4509.0,
-        'accumulation_distribution': 6944237.636329148,
-        'macd': 8.594156883875712,
-        'signal': 8.339328703975257,
-        'rsi': 64.31273355459359,
-        'rsi_based_ma': 65.88730330283069,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-14T05:00:00+07:00',
-        'open': 3362.375,
-        'high': 3371.385,
-        'low': 3359.905,
-        'close': 3369.665,
-        'volume': 11484.0,
-        'accumulation_distribution': 6952280.437722876,
-        'macd': 9.403485917256148,
-        'signal': 8.552160146631435,
-        'rsi': 72.60701085034485,
-        'rsi_based_ma': 66.18434648959702,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-14T06:00:00+07:00',
-        'open': 3369.575,
-        'high': 3374.255,
-        'low': 3366.6,
-        'close': 3367.61,
-        'volume': 10341.0,
-        'accumulation_distribution': 6944668.218911642,
-        'macd': 9.766481759166709,
-        'signal': 8.79502446913849,
-        'rsi': 70.03399396862268,
-        'rsi_based_ma': 67.10781613761246,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-14T07:00:00+07:00',
-        'open': 3367.74,
-        'high': 3373.355,
-        'low': 3364.895,
-        'close': 3367.52,
-        'volume': 20765.0,
-        'accumulation_distribution': 6936789.300471926,
-        'macd': 9.93240178619999,
-        'signal': 9.02249993255079,
-        'rsi': 69.91713472615004,
-        'rsi_based_ma': 67.67791240746661,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-14T08:00:00+07:00',
-        'open': 3367.51,
-        'high': 3370.245,
-        'low': 3356.945,
-        'close': 3358.59,
-        'volume': 28327.0,
-        'accumulation_distribution': 6915469.505735084,
-        'macd': 9.236841673064191,
-        'signal': 9.06536828065347,
-        'rsi': 59.33736817180392,
-        'rsi_based_ma': 67.22996281602738,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-14T09:00:00+07:00',
-        'open': 3358.545,
-        'high': 3359.665,
-        'low': 3353.87,
-        'close': 3357.485,
-        'volume': 20854.0,
-        'accumulation_distribution': 6920633.524716967,
-        'macd': 8.49847586735359,
-        'signal': 8.951989797993495,
-        'rsi': 58.16450856791754,
-        'rsi_based_ma': 66.5893984101821,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-14T10:00:00+07:00',
-        'open': 3357.415,
-        'high': 3359.73,
-        'low': 3355.57,
-        'close': 3357.205,
-        'volume': 14126.0,
-        'accumulation_distribution': 6917611.375678504,
-        'macd': 7.800799229063159,
-        'signal': 8.721751684207428,
-        'rsi': 57.85246155643715,
-        'rsi_based_ma': 65.62689470678357,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-14T11:00:00+07:00',
-        'open': 3357.145,
-        'high': 3361.84,
-        'low': 3353.9,
-        'close': 3359.835,
-        'volume': 20345.0,
-        'accumulation_distribution': 6927681.381975733,
-        'macd': 7.375089051154191,
-        'signal': 8.45241915759678,
-        'rsi': 60.021990895730525,
-        'rsi_based_ma': 65.09370050963575,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-14T12:00:00+07:00',
-        'open': 3359.625,
-        'high': 3360.485,
-        'low': 3353.675,
-        'close': 3357.64,
-        'volume': 15453.0,
-        'accumulation_distribution': 6930222.844530798,
-        'macd': 6.78240912200954,
-        'signal': 8.118417150479333,
-        'rsi': 57.36784198715646,
-        'rsi_based_ma': 64.03376792608157,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-14T13:00:00+07:00',
-        'open': 3357.71,
-        'high': 3369.915,
-        'low': 3356.665,
-        'close': 3369.06,
-        'volume': 18330.0,
-        'accumulation_distribution': 6946187.236983628,
-        'macd': 7.151763489523091,
-        'signal': 7.925086418288084,
-        'rsi': 65.83304576255766,
-        'rsi_based_ma': 63.781377017476345,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-14T14:00:00+07:00',
-        'open': 3369.075,
-        'high': 3375.085,
-        'low': 3366.75,
-        'close': 3372.13,
-        'volume': 21687.0,
-        'accumulation_distribution': 6952496.892052615,
-        'macd': 7.604542398662943,
-        'signal': 7.860977614363056,
-        'rsi': 67.69037531185394,
-        'rsi_based_ma': 64.06298480747526,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-14T15:00:00+07:00',
-        'open': 3372.135,
-        'high': 3372.75,
-        'low': 3365.44,
-        'close': 3366.075,
-        'volume': 15562.0,
-        'accumulation_distribution': 6939638.55005535,
-        'macd': 7.389602314386138,
-        'signal': 7.766702554367673,
-        'rsi': 60.68365346418637,
-        'rsi_based_ma': 63.87116675319216,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-14T16:00:00+07:00',
-        'open': 3366.18,
-        'high': 3370.48,
-        'low': 3364.04,
-        'close': 3370.33,
-        'volume': 10651.0,
-        'accumulation_distribution': 6949793.385459077,
-        'macd': 7.476420170700294,
-        'signal': 7.708646077634198,
-        'rsi': 63.53977936654751,
-        'rsi_based_ma': 63.76034456005607,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-14T17:00:00+07:00',
-        'open': 3370.41,
-        'high': 3374.69,
-        'low': 3369.94,
-        'close': 3372.095,
-        'volume': 11245.0,
-        'accumulation_distribution': 6948751.743353812,
-        'macd': 7.600036210027156,
-        'signal': 7.686924104112789,
-        'rsi': 64.68577688910574,
-        'rsi_based_ma': 63.71769107664342,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-14T18:00:00+07:00',
-        'open': 3372.18,
-        'high': 3373.25,
-        'low': 3363.915,
-        'close': 3364.14,
-        'volume': 12371.0,
-        'accumulation_distribution': 6936977.095790877,
-        'macd': 6.975689389442323,
-        'signal': 7.544677161178695,
-        'rsi': 56.12349960952736,
-        'rsi_based_ma': 63.13274579485297,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-14T19:00:00+07:00',
-        'open': 3364.16,
-        'high': 3366.705,
-        'low': 3349.385,
-        'close': 3350.12,
-        'volume': 28696.0,
-        'accumulation_distribution': 6910716.610802423,
-        'macd': 5.288629180842236,
-        'signal': 7.093467565111403,
-        'rsi': 44.854631509179086,
-        'rsi_based_ma': 61.1504329847697,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-14T20:00:00+07:00',
-        'open': 3350.1,
-        'high': 3359.06,
-        'low': 3347.325,
-        'close': 3355.385,
-        'volume': 38245.0,
-        'accumulation_distribution': 6925007.563081931,
-        'macd': 4.32658908372423,
-        'signal': 6.540091868833969,
-        'rsi': 48.99627305961885,
-        'rsi_based_ma': 59.647738634126576,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-14T21:00:00+07:00',
-        'open': 3355.365,
-        'high': 3356.425,
-        'low': 3341.09,
-        'close': 3343.13,
-        'volume': 38235.0,
-        'accumulation_distribution': 6896945.292133121,
-        'macd': 2.545941268788738,
-        'signal': 5.741261748824923,
-        'rsi': 41.233554157553634,
-        'rsi_based_ma': 57.5989114506554,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-14T22:00:00+07:00',
-        'open': 3343.125,
-        'high': 3349.735,
-        'low': 3342.525,
-        'close': 3345.16,
-        'volume': 23378.0,
-        'accumulation_distribution': 6890654.956488182,
-        'macd': 1.283770573112179,
-        'signal': 4.849763513682374,
-        'rsi': 42.84881787275613,
-        'rsi_based_ma': 56.42115785786628,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-14T23:00:00+07:00',
-        'open': 3345.155,
-        'high': 3349.44,
-        'low': 3343.145,
-        'close': 3347.83,
-        'volume': 14763.0,
-        'accumulation_distribution': 6897866.429879762,
-        'macd': 0.4932519873473211,
-        'signal': 3.978461208415363,
-        'rsi': 44.99048387863395,
-        'rsi_based_ma': 55.480156094346015,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-15T00:00:00+07:00',
-        'open': 3347.89,
-        'high': 3351.77,
-        'low': 3347.48,
-        'close': 3351.12,
-        'volume': 11428.0,
-        'accumulation_distribution': 6905831.399576731,
-        'macd': 0.1307288561943096,
-        'signal': 3.2089147379711527,
-        'rsi': 47.59638019799894,
-        'rsi_based_ma': 54.74757885445757,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-15T01:00:00+07:00',
-        'open': 3351.125,
-        'high': 3351.3,
-        'low': 3347.955,
-        'close': 3348.925,
-        'volume': 6567.0,
-        'accumulation_distribution': 6903073.063253862,
-        'macd': -0.3298887406481299,
-        'signal': 2.501154042247296,
-        'rsi': 46.0296985771686,
-        'rsi_based_ma': 53.74812940313172,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-15T02:00:00+07:00',
-        'open': 3348.93,
-        'high': 3350.525,
-        'low': 3343.26,
-        'close': 3344.305,
-        'volume': 11131.0,
-        'accumulation_distribution': 6895144.236688134,
-        'macd': -1.0555590659164409,
-        'signal': 1.7898114206145486,
-        'rsi': 42.83385085121735,
-        'rsi_based_ma': 52.70998717913608,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-15T03:00:00+07:00',
-        'open': 3344.365,
-        'high': 3345.725,
-        'low': 3341.395,
-        'close': 3343.755,
-        'volume': 4405.0,
-        'accumulation_distribution': 6895540.991884439,
-        'macd': -1.6559496732816117,
-        'signal': 1.1006592018353163,
-        'rsi': 42.45593789289449,
-        'rsi_based_ma': 51.04019375987442,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-15T05:00:00+07:00',
-        'open': 3343.085,
-        'high': 3345.95,
-        'low': 3341.55,
-        'close': 3345.895,
-        'volume': 1630.0,
-        'accumulation_distribution': 6897130.241884439,
-        'macd': -1.936757702718296,
-        'signal': 0.4931758209245939,
-        'rsi': 44.50745468556965,
-        'rsi_based_ma': 49.384270857996974,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-15T06:00:00+07:00',
-        'open': 3345.88,
-        'high': 3346.535,
-        'low': 3343.92,
-        'close': 3345.34,
-        'volume': 2918.0,
-        'accumulation_distribution': 6897381.312630137,
-        'macd': -2.1789661850098128,
-        'signal': -0.0412525802622875,
-        'rsi': 44.06865305774332,
-        'rsi_based_ma': 48.19748511467962,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-15T07:00:00+07:00',
-        'open': 3345.315,
-        'high': 3349.515,
-        'low': 3344.71,
-        'close': 3347.62,
-        'volume': 7202.0,
-        'accumulation_distribution': 6898902.650819523,
-        'macd': -2.162018800081114,
-        'signal': -0.4654058242260528,
-        'rsi': 46.40628370216291,
-        'rsi_based_ma': 46.97366399579501,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-15T08:00:00+07:00',
-        'open': 3347.635,
-        'high': 3350.76,
-        'low': 3346.1,
-        'close': 3346.735,
-        'volume': 11346.0,
-        'accumulation_distribution': 6890648.801034116,
-        'macd': -2.194700834110336,
-        'signal': -0.8112648262029094,
-        'rsi': 45.60944844629466,
-        'rsi_based_ma': 45.61106910702279,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-15T09:00:00+07:00',
-        'open': 3346.755,
-        'high': 3352.16,
-        'low': 3345.795,
-        'close': 3350.975,
-        'volume': 10073.0,
-        'accumulation_distribution': 6896971.131748963,
-        'macd': -1.8570619623769744,
-        'signal': -1.0204242534377224,
-        'rsi': 50.03591285724223,
-        'rsi_based_ma': 45.17624148185957,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-15T10:00:00+07:00',
-        'open': 3351.055,
-        'high': 3358.425,
-        'low': 3350.9,
-        'close': 3357.98,
-        'volume': 10956.0,
-        'accumulation_distribution': 6906631.339057933,
-        'macd': -1.0125635647241324,
-        'signal': -1.0188521156950043,
-        'rsi': 56.35551647348798,
-        'rsi_based_ma': 45.997733265024486,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-15T11:00:00+07:00',
-        'open': 3357.99,
-        'high': 3361.44,
-        'low': 3357.735,
-        'close': 3360.26,
-        'volume': 7566.0,
-        'accumulation_distribution': 6909377.970636881,
-        'macd': -0.1574999931758611,
-        'signal': -0.8465816911911757,
-        'rsi': 58.20833525290977,
-        'rsi_based_ma': 46.65573770740241,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-15T12:00:00+07:00',
-        'open': 3360.285,
-        'high': 3365.295,
-        'low': 3360.285,
-        'close': 3362.155,
-        'volume': 7879.0,
-        'accumulation_distribution': 6907380.699179796,
-        'macd': 0.6653845713494775,
-        'signal': -0.544188438683045,
-        'rsi': 59.73820945463411,
-        'rsi_based_ma': 47.977498800051016,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-15T13:00:00+07:00',
-        'open': 3362.17,
-        'high': 3364.32,
-        'low': 3357.675,
-        'close': 3358.265,
-        'volume': 13627.0,
-        'accumulation_distribution': 6896173.542671141,
-        'macd': 0.9921985797800515,
-        'signal': -0.2369110349904256,
-        'rsi': 55.2657426049744,
-        'rsi_based_ma': 48.86442199520947,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-15T14:00:00+07:00',
-        'open': 3358.285,
-        'high': 3365.185,
-        'low': 3357.575,
-        'close': 3364.4,
-        'volume': 10173.0,
-        'accumulation_distribution': 6904247.776573901,
-        'macd': 1.7263440441656712,
-        'signal': 0.1557399808407937,
-        'rsi': 60.31235456055175,
-        'rsi_based_ma': 49.958841329632165,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-15T15:00:00+07:00',
-        'open': 3364.33,
-        'high': 3365.725,
-        'low': 3356.6,
-        'close': 3361.045,
-        'volume': 14350.0,
-        'accumulation_distribution': 6903878.214930066,
-        'macd': 2.0142204730241247,
-        'signal': 0.52743607927746,
-        'rsi': 56.55490955497197,
-        'rsi_based_ma': 50.59873628370167,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-15T16:00:00+07:00',
-        'open': 3361.065,
-        'high': 3364.725,
-        'low': 3358.655,
-        'close': 3363.435,
-        'volume': 11442.0,
-        'accumulation_distribution': 6910456.893678007,
-        'macd': 2.407465874859099,
-        'signal': 0.9034420383937878,
-        'rsi': 58.53662397510926,
-        'rsi_based_ma': 51.49208809784028,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-15T17:00:00+07:00',
-        'open': 3363.475,
-        'high': 3366.425,
-        'low': 3361.285,
-        'close': 3361.56,
-        'volume': 8839.0,
-        'accumulation_distribution': 6902563.701071003,
-        'macd': 2.538555966041713,
-        'signal': 1.2304648239233729,
-        'rsi': 56.3644544026458,
-        'rsi_based_ma': 52.45855978008517,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-15T18:00:00+07:00',
-        'open': 3361.505,
-        'high': 3362.105,
-        'low': 3354.18,
-        'close': 3354.915,
-        'volume': 11921.0,
-        'accumulation_distribution': 6892853.91495113,
-        'macd': 2.0822469951331186,
-        'signal': 1.400821258165322,
-        'rsi': 49.37206306594676,
-        'rsi_based_ma': 52.952568721017485,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-15T19:00:00+07:00',
-        'open': 3354.89,
-        'high': 3360.675,
-        'low': 3346.61,
-        'close': 3348.915,
-        'volume': 31171.0,
-        'accumulation_distribution': 6871899.64513243,
-        'macd': 1.2223781775251157,
-        'signal': 1.365132642037281,
-        'rsi': 44.05735091928979,
-        'rsi_based_ma': 52.92041845199749,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-15T20:00:00+07:00',
-        'open': 3348.945,
-        'high': 3352.58,
-        'low': 3334.38,
-        'close': 3346.89,
-        'volume': 44904.0,
-        'accumulation_distribution': 6888726.308868693,
-        'macd': 0.3732230847836035,
-        'signal': 1.1667507305865452,
-        'rsi': 42.39849975292762,
-        'rsi_based_ma': 52.80112178736781,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-15T21:00:00+07:00',
-        'open': 3346.885,
-        'high': 3352.245,
-        'low': 3342.62,
-        'close': 3347.955,
-        'volume': 38679.0,
-        'accumulation_distribution': 6892925.743154408,
-        'macd': -0.2113653563646949,
-        'signal': 0.8911275131962972,
-        'rsi': 43.60122920079116,
-        'rsi_based_ma': 52.60076075155554,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-15T22:00:00+07:00',
-        'open': 3347.96,
-        'high': 3349.89,
-        'low': 3325.335,
-        'close': 3329.02,
-        'volume': 39966.0,
-        'accumulation_distribution': 6864955.239794603,
-        'macd': -2.177451851778642,
-        'signal': 0.2774116402013094,
-        'rsi': 31.148353986366786,
-        'rsi_based_ma': 51.56782543298927,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-15T23:00:00+07:00',
-        'open': 3328.975,
-        'high': 3330.42,
-        'low': 3320.305,
-        'close': 3329.32,
-        'volume': 22267.0,
-        'accumulation_distribution': 6882379.194811904,
-        'macd': -3.669087119105825,
-        'signal': -0.5118881116601176,
-        'rsi': 31.482252594327846,
-        'rsi_based_ma': 50.24256398563824,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-16T00:00:00+07:00',
-        'open': 3329.39,
-        'high': 3331.4,
-        'low': 3325.915,
-        'close': 3328.185,
-        'volume': 12899.0,
-        'accumulation_distribution': 6880156.851147364,
-        'macd': -4.886475580753995,
-        'signal': -1.386805605478893,
-        'rsi': 30.872255272846303,
-        'rsi_based_ma': 48.42233104273527,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-16T01:00:00+07:00',
-        'open': 3328.29,
-        'high': 3331.99,
-        'low': 3325.875,
-        'close': 3328.87,
-        'volume': 12124.0,
-        'accumulation_distribution': 6879909.017950308,
-        'macd': -5.729939753489816,
-        'signal': -2.2554324350810777,
-        'rsi': 31.731978849142397,
-        'rsi_based_ma': 46.53116272818045,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-16T02:00:00+07:00',
-        'open': 3328.85,
-        'high': 3331.365,
-        'low': 3326.59,
-        'close': 3330.505,
-        'volume': 11504.0,
-        'accumulation_distribution': 6887269.168735649,
-        'macd': -6.195047697900918,
-        'signal': -3.0433554876450457,
-        'rsi': 33.846778901964896,
-        'rsi_based_ma': 44.68177483156121,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-16T03:00:00+07:00',
-        'open': 3330.52,
-        'high': 3331.025,
-        'low': 3324.935,
-        'close': 3325.005,
-        'volume': 2605.0,
-        'accumulation_distribution': 6884724.053793121,
-        'macd': -6.927596113631353,
-        'signal': -3.820203612842307,
-        'rsi': 30.431649901312625,
-        'rsi_based_ma': 42.90791106701396,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-16T05:00:00+07:00',
-        'open': 3326.32,
-        'high': 3327.855,
-        'low': 3325.635,
-        'close': 3326.715,
-        'volume': 1341.0,
-        'accumulation_distribution': 6884687.810549878,
-        'macd': -7.286172836911646,
-        'signal': -4.513397457656175,
-        'rsi': 32.70512328780272,
-        'rsi_based_ma': 40.93596597610331,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-16T06:00:00+07:00',
-        'open': 3326.825,
-        'high': 3331.805,
-        'low': 3326.455,
-        'close': 3331.1,
-        'volume': 2555.0,
-        'accumulation_distribution': 6886569.436718102,
-        'macd': -7.13427513763645,
-        'signal': -5.03757299365223,
-        'rsi': 38.27561006781255,
-        'rsi_based_ma': 39.63030172702049,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-16T07:00:00+07:00',
-        'open': 3331.105,
-        'high': 3332.73,
-        'low': 3328.98,
-        'close': 3330.54,
-        'volume': 9421.0,
-        'accumulation_distribution': 6884986.7087181015,
-        'macd': -6.978637052590329,
-        'signal': -5.425785805439849,
-        'rsi': 37.84476603393968,
-        'rsi_based_ma': 38.15231187407981,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-16T08:00:00+07:00',
-        'open': 3330.555,
-        'high': 3335.135,
-        'low': 3328.915,
-        'close': 3330.96,
-        'volume': 15592.0,
-        'accumulation_distribution': 6879647.326081445,
-        'macd': -6.743665481086282,
-        'signal': -5.689361740569136,
-        'rsi': 38.404769855704046,
-        'rsi_based_ma': 36.86947726358397,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-16T09:00:00+07:00',
-        'open': 3330.955,
-        'high': 3331.575,
-        'low': 3325.21,
-        'close': 3326.3,
-        'volume': 9159.0,
-        'accumulation_distribution': 6873625.265594408,
-        'macd': -6.854457948072195,
-        'signal': -5.922380982069748,
-        'rsi': 34.672137539729334,
-        'rsi_based_ma': 35.819482583139866,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-16T10:00:00+07:00',
-        'open': 3326.295,
-        'high': 3335.17,
-        'low': 3326.07,
-        'close': 3334.465,
-        'volume': 9013.0,
-        'accumulation_distribution': 6881241.745814188,
-        'macd': -6.211808650718012,
-        'signal': -5.980266515799401,
-        'rsi': 44.79618342334839,
-        'rsi_based_ma': 35.87225633342977,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-16T11:00:00+07:00',
-        'open': 3334.46,
-        'high': 3338.7,
-        'low': 3332.87,
-        'close': 3338.295,
-        'volume': 9579.0,
-        'accumulation_distribution': 6889489.872743864,
-        'macd': -5.331991581272632,
-        'signal': -5.850611528894048,
-        'rsi': 48.80409515279886,
-        'rsi_based_ma': 36.32979886199199,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-16T12:00:00+07:00',
-        'open': 3338.305,
-        'high': 3340.0,
-        'low': 3335.57,
-        'close': 3338.195,
-        'volume': 10187.0,
-        'accumulation_distribution': 6891375.502540704,
-        'macd': -4.589889984627462,
-        'signal': -5.59846722004073,
-        'rsi': 48.704667877216906,
-        'rsi_based_ma': 36.694330196022406,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-16T13:00:00+07:00',
-        'open': 3338.235,
-        'high': 3342.19,
-        'low': 3337.76,
-        'close': 3339.24,
-        'volume': 10038.0,
-        'accumulation_distribution': 6888044.60863551,
-        'macd': -3.8728030928441513,
-        'signal': -5.253334394601414,
-        'rsi': 49.854364841498885,
-        'rsi_based_ma': 38.03047382853184,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-16T14:00:00+07:00',
-        'open': 3339.23,
-        'high': 3340.285,
-        'low': 3336.06,
-        'close': 3337.87,
-        'volume': 6898.0,
-        'accumulation_distribution': 6887056.847688764,
-        'macd': -3.3761361195911377,
-        'signal': -4.877894739599359,
-        'rsi': 48.32515271334984,
-        'rsi_based_ma': 39.233538122747696,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-16T15:00:00+07:00',
-        'open': 3337.94,
-        'high': 3342.775,
-        'low': 3337.775,
-        'close': 3342.08,
-        'volume': 6470.0,
-        'accumulation_distribution': 6891728.187688764,
-        'macd': -2.612694632061448,
-        'signal': -4.424854718091777,
-        'rsi': 53.0872837112596,
-        'rsi_based_ma': 40.820325868348654,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-16T16:00:00+07:00',
-        'open': 3342.065,
-        'high': 3343.08,
-        'low': 3339.055,
-        'close': 3340.07,
-        'volume': 7409.0,
-        'accumulation_distribution': 6888055.900732243,
-        'macd': -2.1451242970219937,
-        'signal': -3.96890863387782,
-        'rsi': 50.68565511979546,
-        'rsi_based_ma': 42.17415988768101,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-16T17:00:00+07:00',
-        'open': 3339.97,
-        'high': 3340.485,
-        'low': 3333.945,
-        'close': 3335.01,
-        'volume': 8831.0,
-        'accumulation_distribution': 6882101.05210839,
-        'macd': -2.157995125158777,
-        'signal': -3.606725932134012,
-        'rsi': 45.14837371797521,
-        'rsi_based_ma': 42.98141666025317,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-16T18:00:00+07:00',
-        'open': 3334.97,
-        'high': 3340.34,
-        'low': 3333.84,
-        'close': 3339.435,
-        'volume': 12151.0,
-        'accumulation_distribution': 6890868.465954543,
-        'macd': -1.7904951172868095,
-        'signal': -3.243479769164572,
-        'rsi': 50.26539950720252,
-        'rsi_based_ma': 44.398113060673886,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-16T19:00:00+07:00',
-        'open': 3339.4,
-        'high': 3341.07,
-        'low': 3331.01,
-        'close': 3334.61,
-        'volume': 27671.0,
-        'accumulation_distribution': 6883001.760189136,
-        'macd': -1.8670635428316016,
-        'signal': -2.9681965238979773,
-        'rsi': 45.30266982019096,
-        'rsi_based_ma': 45.297937812987335,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-16T20:00:00+07:00',
-        'open': 3334.695,
-        'high': 3339.6,
-        'low': 3322.065,
-        'close': 3326.91,
-        'volume': 43042.0,
-        'accumulation_distribution': 6863745.159675876,
-        'macd': -2.5200209868580714,
-        'signal': -2.878561416489996,
-        'rsi': 38.730837670593615,
-        'rsi_based_ma': 45.330454070328834,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-16T21:00:00+07:00',
-        'open': 3326.905,
-        'high': 3342.685,
-        'low': 3319.695,
-        'close': 3338.145,
-        'volume': 57739.0,
-        'accumulation_distribution': 6898679.891733292,
-        'macd': -2.1066398277694134,
-        'signal': -2.7241770987458795,
-        'rsi': 50.10430270642174,
-        'rsi_based_ma': 46.20613526122041,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-16T22:00:00+07:00',
-        'open': 3338.25,
-        'high': 3377.655,
-        'low': 3335.99,
-        'close': 3343.525,
-        'volume': 121439.0,
-        'accumulation_distribution': 6821164.706205872,
-        'macd': -1.329584619619709,
-        'signal': -2.4452586029206453,
-        'rsi': 54.46348038040265,
-        'rsi_based_ma': 47.3531860129846,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-16T23:00:00+07:00',
-        'open': 3343.735,
-        'high': 3355.215,
-        'low': 3339.09,
-        'close': 3349.17,
-        'volume': 50615.0,
-        'accumulation_distribution': 6833830.227136104,
-        'macd': -0.2553153298204051,
-        'signal': -2.007269948300597,
-        'rsi': 58.55495999319333,
-        'rsi_based_ma': 49.05910190251774,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-17T00:00:00+07:00',
-        'open': 3349.155,
-        'high': 3357.35,
-        'low': 3348.88,
-        'close': 3354.8,
-        'volume': 28788.0,
-        'accumulation_distribution': 6845284.248387582,
-        'macd': 1.0383750291944125,
-        'signal': -1.3981409528015951,
-        'rsi': 62.202597285572935,
-        'rsi_based_ma': 50.30241717839092,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-17T01:00:00+07:00',
-        'open': 3354.83,
-        'high': 3357.525,
-        'low': 3349.17,
-        'close': 3350.445,
-        'volume': 23007.0,
-        'accumulation_distribution': 6829299.133486326,
-        'macd': 1.6927093557246735,
-        'signal': -0.7799708910963413,
-        'rsi': 57.95362281468954,
-        'rsi_based_ma': 50.95595486852597,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-17T02:00:00+07:00',
-        'open': 3350.475,
-        'high': 3350.665,
-        'low': 3346.07,
-        'close': 3347.14,
-        'volume': 23654.0,
-        'accumulation_distribution': 6816661.359819294,
-        'macd': 1.9224275961037165,
-        'signal': -0.2394911936563297,
-        'rsi': 54.8893215981556,
-        'rsi_based_ma': 51.397715848593016,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-17T03:00:00+07:00',
-        'open': 3347.135,
-        'high': 3349.435,
-        'low': 3346.33,
-        'close': 3347.6,
-        'volume': 6466.0,
-        'accumulation_distribution': 6815484.776888537,
-        'macd': 2.1171934243652686,
-        'signal': 0.2318457299479899,
-        'rsi': 55.244031145344685,
-        'rsi_based_ma': 51.78269201315344,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-17T05:00:00+07:00',
-        'open': 3350.96,
-        'high': 3352.28,
-        'low': 3348.52,
-        'close': 3349.695,
-        'volume': 3318.0,
-        'accumulation_distribution': 6814240.526888537,
-        'macd': 2.412782680987675,
-        'signal': 0.668033120155927,
-        'rsi': 56.90599382824804,
-        'rsi_based_ma': 52.39560923564616,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-17T06:00:00+07:00',
-        'open': 3349.79,
-        'high': 3350.295,
-        'low': 3345.37,
-        'close': 3346.555,
-        'volume': 2915.0,
-        'accumulation_distribution': 6812728.278157572,
-        'macd': 2.366389275993697,
-        'signal': 1.007704351323481,
-        'rsi': 53.68805153337647,
-        'rsi_based_ma': 52.438521222940224,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-17T07:00:00+07:00',
-        'open': 3346.54,
-        'high': 3347.47,
-        'low': 3339.775,
-        'close': 3340.895,
-        'volume': 13077.0,
-        'accumulation_distribution': 6803457.968216051,
-        'macd': 1.851563796001301,
-        'signal': 1.176476240259045,
-        'rsi': 48.37754958265472,
-        'rsi_based_ma': 52.27365654171588,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-17T08:00:00+07:00',
-        'open': 3340.85,
-        'high': 3344.63,
-        'low': 3337.285,
-        'close': 3344.11,
-        'volume': 15977.0,
-        'accumulation_distribution': 6817172.738127556,
-        'macd': 1.6835772940589775,
-        'signal': 1.2778964510190316,
-        'rsi': 51.322867287454685,
-        'rsi_based_ma': 52.71469179667871,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-17T09:00:00+07:00',
-        'open': 3344.065,
-        'high': 3344.865,
-        'low': 3337.845,
-        'close': 3341.45,
-        'volume': 13739.0,
-        'accumulation_distribution': 6817544.591403909,
-        'macd': 1.320584139613402,
-        'signal': 1.2864339887379057,
-        'rsi': 48.83999443081724,
-        'rsi_based_ma': 52.61287714836546,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-17T10:00:00+07:00',
-        'open': 3341.46,
-        'high': 3342.455,
-        'low': 3336.375,
-        'close': 3341.59,
-        'volume': 11829.0,
-        'accumulation_distribution': 6826007.7739697,
-        'macd': 1.0323064928011263,
-        'signal': 1.23560848955055,
-        'rsi': 48.97989388152545,
-        'rsi_based_ma': 52.87553600988935,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-17T11:00:00+07:00',
-        'open': 3341.585,
-        'high': 3344.845,
-        'low': 3338.44,
-        'close': 3342.795,
-        'volume': 8704.0,
-        'accumulation_distribution': 6829140.126819037,
-        'macd': 0.8908091171756496,
-        'signal': 1.16664861507557,
-        'rsi': 50.24113915039843,
-        'rsi_based_ma': 53.69770040130398,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-17T12:00:00+07:00',
-        'open': 3342.765,
-        'high': 3342.995,
-        'low': 3336.04,
-        'close': 3339.56,
-        'volume': 12386.0,
-        'accumulation_distribution': 6829291.50136972,
-        'macd': 0.5117350010341397,
-        'signal': 1.035665892267284,
-        'rsi': 46.88987119558502,
-        'rsi_based_ma': 53.46809815052993,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-17T13:00:00+07:00',
-        'open': 3339.575,
-        'high': 3339.965,
-        'low': 3328.29,
-        'close': 3335.53,
-        'volume': 22694.0,
-        'accumulation_distribution': 6834743.89280441,
-        'macd': -0.1125736084904929,
-        'signal': 0.8060179921157286,
-        'rsi': 43.038444087283935,
-        'rsi_based_ma': 52.65202412959288,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-17T14:00:00+07:00',
-        'open': 3335.48,
-        'high': 3336.275,
-        'low': 3325.16,
-        'close': 3325.855,
-        'volume': 19421.0,
-        'accumulation_distribution': 6817751.609853444,
-        'macd': -1.372216267137901,
-        'signal': 0.3703711402650026,
-        'rsi': 35.49971523263018,
-        'rsi_based_ma': 51.00522093240979,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-17T15:00:00+07:00',
-        'open': 3325.845,
-        'high': 3332.18,
-        'low': 3325.585,
-        'close': 3328.81,
-        'volume': 14377.0,
-        'accumulation_distribution': 6817435.512052079,
-        'macd': -2.1077514980765955,
-        'signal': -0.125253387403317,
-        'rsi': 39.01343352184204,
-        'rsi_based_ma': 49.3488520921433,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-17T16:00:00+07:00',
-        'open': 3328.795,
-        'high': 3332.48,
-        'low': 3324.755,
-        'close': 3325.65,
-        'volume': 11864.0,
-        'accumulation_distribution': 6808320.581307742,
-        'macd': -2.9120853513982183,
-        'signal': -0.6826197802022973,
-        'rsi': 36.71035785915281,
-        'rsi_based_ma': 47.83147602389067,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-17T17:00:00+07:00',
-        'open': 3325.675,
-        'high': 3331.205,
-        'low': 3325.03,
-        'close': 3325.905,
-        'volume': 13253.0,
-        'accumulation_distribution': 6798823.492238916,
-        'macd': -3.488733409112683,
-        'signal': -1.2438425059843743,
-        'rsi': 37.03338732874801,
-        'rsi_based_ma': 46.55605214750442,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-17T18:00:00+07:00',
-        'open': 3325.875,
-        'high': 3328.58,
-        'low': 3322.34,
-        'close': 3324.26,
-        'volume': 14468.0,
-        'accumulation_distribution': 6793258.876854301,
-        'macd': -4.0319906234572045,
-        'signal': -1.8014721294789404,
-        'rsi': 35.765208015030865,
-        'rsi_based_ma': 45.1647076381963,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-17T19:00:00+07:00',
-        'open': 3324.255,
-        'high': 3328.675,
-        'low': 3309.79,
-        'close': 3313.15,
-        'volume': 41116.0,
-        'accumulation_distribution': 6766773.51069068,
-        'macd': -5.297938690269348,
-        'signal': -2.500765441637022,
-        'rsi': 28.63348750620804,
-        'rsi_based_ma': 43.14524290090772,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-17T20:00:00+07:00',
-        'open': 3313.195,
-        'high': 3321.855,
-        'low': 3311.16,
-        'close': 3319.16,
-        'volume': 45436.0,
-        'accumulation_distribution': 6789310.956225975,
-        'macd': -5.749972774634898,
-        'signal': -3.1506069082365973,
-        'rsi': 36.06101692664736,
-        'rsi_based_ma': 41.88616900042707,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-17T21:00:00+07:00',
-        'open': 3319.085,
-        'high': 3335.325,
-        'low': 3318.365,
-        'close': 3334.235,
-        'volume': 36735.0,
-        'accumulation_distribution': 6821324.122499562,
-        'macd': -4.836039675210031,
-        'signal': -3.487693461631284,
-        'rsi': 50.09198749790198,
-        'rsi_based_ma': 42.00862885151616,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-17T22:00:00+07:00',
-        'open': 3334.275,
-        'high': 3338.495,
-        'low': 3331.295,
-        'close': 3336.865,
-        'volume': 23767.0,
-        'accumulation_distribution': 6834329.953055116,
-        'macd': -3.8550830910430713,
-        'signal': -3.561171387513641,
-        'rsi': 52.068179006308405,
-        'rsi_based_ma': 42.06186540286285,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-17T23:00:00+07:00',
-        'open': 3336.87,
-        'high': 3340.07,
-        'low': 3335.56,
-        'close': 3338.865,
-        'volume': 16403.0,
-        'accumulation_distribution': 6841967.7135872645,
-        'macd': -2.883050632324739,
-        'signal': -3.425547236475861,
-        'rsi': 53.57368301576863,
-        'rsi_based_ma': 42.39998601607367,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-18T00:00:00+07:00',
-        'open': 3338.88,
-        'high': 3341.17,
-        'low': 3336.37,
-        'close': 3337.525,
-        'volume': 14236.0,
-        'accumulation_distribution': 6834582.788587266,
-        'macd': -2.195526049199998,
-        'signal': -3.1795429990206885,
-        'rsi': 52.38644872326839,
-        'rsi_based_ma': 42.64331136191244,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-18T01:00:00+07:00',
-        'open': 3337.53,
-        'high': 3339.025,
-        'low': 3335.785,
-        'close': 3338.615,
-        'volume': 14507.0,
-        'accumulation_distribution': 6845418.263895906,
-        'macd': -1.5448953809491286,
-        'signal': -2.8526134754063763,
-        'rsi': 53.29316569397488,
-        'rsi_based_ma': 42.8613132578822,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-18T02:00:00+07:00',
-        'open': 3338.61,
-        'high': 3340.86,
-        'low': 3338.275,
-        'close': 3339.855,
-        'volume': 11663.0,
-        'accumulation_distribution': 6848012.548228594,
-        'macd': -0.9186189841029772,
-        'signal': -2.4658145771456965,
-        'rsi': 54.358008798995805,
-        'rsi_based_ma': 43.39475165812582,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-18T03:00:00+07:00',
-        'open': 3339.795,
-        'high': 3340.275,
-        'low': 3337.445,
-        'close': 3339.06,
-        'volume': 3516.0,
-        'accumulation_distribution': 6848509.509359336,
-        'macd': -0.4808968044189896,
-        'signal': -2.0688310226003552,
-        'rsi': 53.51561370770693,
-        'rsi_based_ma': 44.14312091672746,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-18T05:00:00+07:00',
-        'open': 3341.45,
-        'high': 3344.11,
-        'low': 3338.325,
-        'close': 3343.335,
-        'volume': 5625.0,
-        'accumulation_distribution': 6852627.378849396,
-        'macd': 0.2085538697424453,
-        'signal': -1.613354044131795,
-        'rsi': 57.34376005643894,
-        'rsi_based_ma': 45.7034098327138,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-18T06:00:00+07:00',
-        'open': 3343.315,
-        'high': 3343.555,
-        'low': 3339.57,
-        'close': 3340.38,
-        'volume': 3957.0,
-        'accumulation_distribution': 6850278.996164327,
-        'macd': 0.5106185988465768,
-        'signal': -1.1885595155361206,
-        'rsi': 54.03142758103239,
-        'rsi_based_ma': 46.77612369408454,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-18T07:00:00+07:00',
-        'open': 3340.335,
-        'high': 3341.43,
-        'low': 3337.965,
-        'close': 3339.965,
-        'volume': 8267.0,
-        'accumulation_distribution': 6851555.430507761,
-        'macd': 0.7083545706645964,
-        'signal': -0.8091766982959772,
-        'rsi': 53.563485736346216,
-        'rsi_based_ma': 47.97991854245549,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-18T08:00:00+07:00',
-        'open': 3339.985,
-        'high': 3343.15,
-        'low': 3335.335,
-        'close': 3337.82,
-        'volume': 16639.0,
-        'accumulation_distribution': 6845498.110610129,
-        'macd': 0.6840923882355128,
-        'signal': -0.5105228809896791,
-        'rsi': 51.10010729851067,
-        'rsi_based_ma': 48.9846842545814,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-18T09:00:00+07:00',
-        'open': 3337.765,
-        'high': 3344.325,
-        'low': 3336.96,
-        'close': 3337.82,
-        'volume': 14602.0,
-        'accumulation_distribution': 6834306.217874217,
-        'macd': 0.6572876311956861,
-        'signal': -0.276960778552606,
-        'rsi': 51.10010729851067,
-        'rsi_based_ma': 50.08003420340139,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-18T10:00:00+07:00',
-        'open': 3337.85,
-        'high': 3338.575,
-        'low': 3334.19,
-        'close': 3334.705,
-        'volume': 8946.0,
-        'accumulation_distribution': 6827461.558809222,
-        'macd': 0.3803062673473505,
-        'signal': -0.1455073693726147,
-        'rsi': 47.42657244891714,
-        'rsi_based_ma': 51.4223974135949,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-18T11:00:00+07:00',
-        'open': 3334.68,
-        'high': 3337.185,
-        'low': 3333.87,
-        'close': 3337.185,
-        'volume': 6018.0,
-        'accumulation_distribution': 6833479.558809222,
-        'macd': 0.3567988595764291,
-        'signal': -0.0450461235828059,
-        'rsi': 50.47889875274152,
-        'rsi_based_ma': 52.45224611545876,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-18T12:00:00+07:00',
-        'open': 3337.17,
-        'high': 3340.37,
-        'low': 3333.445,
-        'close': 3333.56,
-        'volume': 10329.0,
-        'accumulation_distribution': 6823493.615848932,
-        'macd': 0.0451415018114857,
-        'signal': -0.0270085985039475,
-        'rsi': 46.251872005734434,
-        'rsi_based_ma': 52.17795215173252,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-18T13:00:00+07:00',
-        'open': 3333.565,
-        'high': 3342.81,
-        'low': 3331.885,
-        'close': 3342.14,
-        'volume': 15898.0,
-        'accumulation_distribution': 6837441.6552082,
-        'macd': 0.4848955206362006,
-        'signal': 0.075372225324082,
-        'rsi': 55.70622439476977,
-        'rsi_based_ma': 52.43781253662261,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-18T14:00:00+07:00',
-        'open': 3342.135,
-        'high': 3350.235,
-        'low': 3340.72,
-        'close': 3349.975,
-        'volume': 12071.0,
-        'accumulation_distribution': 6848852.9683979,
-        'macd': 1.448920515206737,
-        'signal': 0.3500818833006131,
-        'rsi': 62.23836634469357,
-        'rsi_based_ma': 53.056718488688674,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-18T15:00:00+07:00',
-        'open': 3349.995,
-        'high': 3350.43,
-        'low': 3346.305,
-        'close': 3347.635,
-        'volume': 9114.0,
-        'accumulation_distribution': 6845616.117488811,
-        'macd': 2.001032171748193,
-        'signal': 0.6802719409901291,
-        'rsi': 59.41994017415964,
-        'rsi_based_ma': 53.55911073518091,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-18T16:00:00+07:00',
-        'open': 3347.705,
-        'high': 3354.975,
-        'low': 3347.52,
-        'close': 3352.275,
-        'volume': 12072.0,
-        'accumulation_distribution': 6848943.811653801,
-        'macd': 2.7809369491324105,
-        'signal': 1.1004049426185851,
-        'rsi': 62.998096803635256,
-        'rsi_based_ma': 54.25232010015666,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-18T17:00:00+07:00',
-        'open': 3352.28,
-        'high': 3352.795,
-        'low': 3347.895,
-        'close': 3351.535,
-        'volume': 11578.0,
-        'accumulation_distribution': 6854567.4116538,
-        'macd': 3.3012505274350588,
-        'signal': 1.5405740595818802,
-        'rsi': 62.05827655576842,
-        'rsi_based_ma': 54.80233922564042,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-18T18:00:00+07:00',
-        'open': 3351.435,
-        'high': 3357.765,
-        'low': 3350.845,
-        'close': 3354.33,
-        'volume': 13959.0,
-        'accumulation_distribution': 6854668.27148039,
-        'macd': 3.894245490179856,
-        'signal': 2.011308345701475,
-        'rsi': 64.22889976352162,
-        'rsi_based_ma': 55.56757394391288,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-18T19:00:00+07:00',
-        'open': 3354.315,
-        'high': 3361.33,
-        'low': 3354.205,
-        'close': 3360.005,
-        'volume': 19870.0,
-        'accumulation_distribution': 6867148.025866356,
-        'macd': 4.767170369935229,
-        'signal': 2.562480750548226,
-        'rsi': 68.20612012356344,
-        'rsi_based_ma': 56.34345680585035,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-18T20:00:00+07:00',
-        'open': 3360.01,
-        'high': 3360.345,
-        'low': 3352.26,
-        'close': 3355.675,
-        'volume': 34933.0,
-        'accumulation_distribution': 6861725.525557143,
-        'macd': 5.051346040741464,
-        'signal': 3.060253808586874,
-        'rsi': 62.49646926571098,
-        'rsi_based_ma': 56.94810264047025,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-18T21:00:00+07:00',
-        'open': 3355.615,
-        'high': 3359.105,
-        'low': 3351.235,
-        'close': 3354.75,
-        'volume': 30140.0,
-        'accumulation_distribution': 6858508.549699455,
-        'macd': 5.14263642623655,
-        'signal': 3.476730332116809,
-        'rsi': 61.315616301248696,
-        'rsi_based_ma': 57.50182625224901,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-18T22:00:00+07:00',
-        'open': 3354.795,
-        'high': 3356.405,
-        'low': 3352.445,
-        'close': 3353.735,
-        'volume': 22092.0,
-        'accumulation_distribution': 6850809.822426727,
-        'macd': 5.074586028248177,
-        'signal': 3.7963014713430825,
-        'rsi': 59.97646333570567,
-        'rsi_based_ma': 58.13585168347722,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-18T23:00:00+07:00',
-        'open': 3353.745,
-        'high': 3357.525,
-        'low': 3351.31,
-        'close': 3353.705,
-        'volume': 19093.0,
-        'accumulation_distribution': 6846432.103199052,
-        'macd': 4.961046986767542,
-        'signal': 4.029250574427975,
-        'rsi': 59.93479769839015,
-        'rsi_based_ma': 58.76690099775433,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-19T00:00:00+07:00',
-        'open': 3353.72,
-        'high': 3353.865,
-        'low': 3350.6,
-        'close': 3352.285,
-        'volume': 15288.0,
-        'accumulation_distribution': 6846923.754041318,
-        'macd': 4.702279396014546,
-        'signal': 4.163856338745289,
-        'rsi': 57.88498183115308,
-        'rsi_based_ma': 59.513930239342606,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-19T01:00:00+07:00',
-        'open': 3352.27,
-        'high': 3353.46,
-        'low': 3350.185,
-        'close': 3351.44,
-        'volume': 10961.0,
-        'accumulation_distribution': 6844363.398316127,
-        'macd': 4.378546618119799,
-        'signal': 4.206794394620191,
-        'rsi': 56.64350400796688,
-        'rsi_based_ma': 59.95425918614443,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-19T02:00:00+07:00',
-        'open': 3351.405,
-        'high': 3352.89,
-        'low': 3347.69,
-        'close': 3348.33,
-        'volume': 10394.0,
-        'accumulation_distribution': 6836527.92139305,
-        'macd': 3.8269206910727007,
-        'signal': 4.130819653910693,
-        'rsi': 52.20559420335928,
-        'rsi_based_ma': 60.37952505740334,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-19T03:00:00+07:00',
-        'open': 3348.32,
-        'high': 3351.965,
-        'low': 3347.75,
-        'close': 3350.095,
-        'volume': 3420.0,
-        'accumulation_distribution': 6836913.330645719,
-        'macd': 3.49192122468412,
-        'signal': 4.003039968065378,
-        'rsi': 54.38963579416514,
-        'rsi_based_ma': 60.285483014503015,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-21T05:00:00+07:00',
-        'open': 3348.84,
-        'high': 3350.37,
-        'low': 3344.905,
-        'close': 3347.775,
-        'volume': 4250.0,
-        'accumulation_distribution': 6837127.19157893,
-        'macd': 3.004592056150159,
-        'signal': 3.8033503856823354,
-        'rsi': 51.08513156140609,
-        'rsi_based_ma': 59.48882338712533,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-21T06:00:00+07:00',
-        'open': 3347.725,
-        'high': 3349.505,
-        'low': 3345.52,
-        'close': 3349.14,
-        'volume': 3421.0,
-        'accumulation_distribution': 6839921.509019331,
-        'macd': 2.6974299775988584,
-        'signal': 3.5821663040656397,
-        'rsi': 52.89837213572921,
-        'rsi_based_ma': 59.02299709866602,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-21T07:00:00+07:00',
-        'open': 3349.21,
-        'high': 3354.59,
-        'low': 3347.725,
-        'close': 3352.31,
-        'volume': 10473.0,
-        'accumulation_distribution': 6843437.935093621,
-        'macd': 2.6789134775644925,
-        'signal': 3.40151573876541,
-        'rsi': 56.894661211154585,
-        'rsi_based_ma': 58.58703741348882,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-21T08:00:00+07:00',
-        'open': 3352.305,
-        'high': 3358.665,
-        'low': 3351.945,
-        'close': 3356.565,
-        'volume': 14303.0,
-        'accumulation_distribution': 6848801.560093621,
-        'macd': 2.973307519103855,
-        'signal': 3.315874094833099,
-        'rsi': 61.60372967999404,
-        'rsi_based_ma': 58.55456977950495,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-21T09:00:00+07:00',
-        'open': 3356.645,
-        'high': 3357.53,
-        'low': 3352.395,
-        'close': 3354.21,
-        'volume': 9518.0,
-        'accumulation_distribution': 6846011.961262072,
-        'macd': 2.982211027214817,
-        'signal': 3.249141481309443,
-        'rsi': 57.83764098547823,
-        'rsi_based_ma': 58.098051295358985,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-21T10:00:00+07:00',
-        'open': 3354.2,
-        'high': 3356.95,
-        'low': 3351.11,
-        'close': 3351.295,
-        'volume': 8233.0,
-        'accumulation_distribution': 6838300.572563442,
-        'macd': 2.722665786820471,
-        'signal': 3.1438463424116483,
-        'rsi': 53.4794820824376,
-        'rsi_based_ma': 57.046148578135714,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-21T11:00:00+07:00',
-        'open': 3351.325,
-        'high': 3358.8,
-        'low': 3350.7,
-        'close': 3357.875,
-        'volume': 6218.0,
-        'accumulation_distribution': 6843098.412069615,
-        'macd': 3.013191130821724,
-        'signal': 3.1177153000936637,
-        'rsi': 60.68160163613798,
-        'rsi_based_ma': 56.91651517602336,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-21T12:00:00+07:00',
-        'open': 3357.86,
-        'high': 3369.71,
-        'low': 3357.735,
-        'close': 3366.72,
-        'volume': 20830.0,
-        'accumulation_distribution': 6853526.457998632,
-        'macd': 3.91205638745123,
-        'signal': 3.2765835175651765,
-        'rsi': 67.8801634565591,
-        'rsi_based_ma': 57.38541140140267,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-21T13:00:00+07:00',
-        'open': 3366.705,
-        'high': 3370.82,
-        'low': 3365.41,
-        'close': 3368.355,
-        'volume': 15754.0,
-        'accumulation_distribution': 6854924.225096599,
-        'macd': 4.702141059882251,
-        'signal': 3.561695026028592,
-        'rsi': 69.00964985756356,
-        'rsi_based_ma': 58.03063901010681,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-21T14:00:00+07:00',
-        'open': 3368.375,
-        'high': 3370.55,
-        'low': 3363.935,
-        'close': 3364.77,
-        'volume': 17516.0,
-        'accumulation_distribution': 6841830.253819199,
-        'macd': 4.981584708540595,
-        'signal': 3.845672962530992,
-        'rsi': 63.71873344037751,
-        'rsi_based_ma': 58.30092013453447,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-21T15:00:00+07:00',
-        'open': 3364.8,
-        'high': 3366.865,
-        'low': 3363.125,
-        'close': 3366.065,
-        'volume': 13973.0,
-        'accumulation_distribution': 6849825.499808506,
-        'macd': 5.2470566873062126,
-        'signal': 4.125949707486036,
-        'rsi': 64.76949749219136,
-        'rsi_based_ma': 58.79267125318006,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-21T16:00:00+07:00',
-        'open': 3366.1,
-        'high': 3366.58,
-        'low': 3362.845,
-        'close': 3366.305,
-        'volume': 8808.0,
-        'accumulation_distribution': 6857336.471696056,
-        'macd': 5.414397335202011,
-        'signal': 4.383639233029231,
-        'rsi': 64.97196933923651,
-        'rsi_based_ma': 59.38756163398504,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-21T17:00:00+07:00',
-        'open': 3366.315,
-        'high': 3368.28,
-        'low': 3362.915,
-        'close': 3366.225,
-        'volume': 7987.0,
-        'accumulation_distribution': 6859204.819319541,
-        'macd': 5.477420380303556,
-        'signal': 4.602395462484096,
-        'rsi': 64.83820503988306,
-        'rsi_based_ma': 60.289890979451016,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-21T18:00:00+07:00',
-        'open': 3366.265,
-        'high': 3375.765,
-        'low': 3365.33,
-        'close': 3375.455,
-        'volume': 17815.0,
-        'accumulation_distribution': 6875961.333454663,
-        'macd': 6.200672961163036,
-        'signal': 4.922050962219884,
-        'rsi': 72.00061372163691,
-        'rsi_based_ma': 61.54781797427042,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-21T19:00:00+07:00',
-        'open': 3375.41,
-        'high': 3388.715,
-        'low': 3374.635,
-        'close': 3387.32,
-        'volume': 28858.0,
-        'accumulation_distribution': 6899101.022375118,
-        'macd': 7.643156630369958,
-        'signal': 5.466272095849899,
-        'rsi': 78.15949089824363,
-        'rsi_based_ma': 63.48170078404454,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-21T20:00:00+07:00',
-        'open': 3387.34,
-        'high': 3395.375,
-        'low': 3383.655,
-        'close': 3388.565,
-        'volume': 42470.0,
-        'accumulation_distribution': 6892215.954115732,
-        'macd': 8.785522392508028,
-        'signal': 6.130122155181525,
-        'rsi': 78.68920195347125,
-        'rsi_based_ma': 65.32390291388326,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-21T21:00:00+07:00',
-        'open': 3388.54,
-        'high': 3401.645,
-        'low': 3386.235,
-        'close': 3400.355,
-        'volume': 65709.0,
-        'accumulation_distribution': 6946923.706873681,
-        'macd': 10.520931210222898,
-        'signal': 7.008283966189799,
-        'rsi': 82.91509096985558,
-        'rsi_based_ma': 67.18250503950476,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-21T22:00:00+07:00',
-        'open': 3400.375,
-        'high': 3401.13,
-        'low': 3395.56,
-        'close': 3398.095,
-        'volume': 38074.0,
-        'accumulation_distribution': 6943505.933085527,
-        'macd': 11.580400441079291,
-        'signal': 7.922707261167697,
-        'rsi': 79.65441571711976,
-        'rsi_based_ma': 68.47183975644231,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-21T23:00:00+07:00',
-        'open': 3398.075,
-        'high': 3399.18,
-        'low': 3393.88,
-        'close': 3395.655,
-        'volume': 29397.0,
-        'accumulation_distribution': 6933799.376481756,
-        'macd': 12.083854676752708,
-        'signal': 8.754936744284699,
-        'rsi': 76.17157991650521,
-        'rsi_based_ma': 69.78140682294425,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-22T00:00:00+07:00',
-        'open': 3395.685,
-        'high': 3395.905,
-        'low': 3391.375,
-        'close': 3393.335,
-        'volume': 24898.0,
-        'accumulation_distribution': 6930446.665664978,
-        'macd': 12.155519907815687,
-        'signal': 9.435053376990895,
-        'rsi': 72.90737476306703,
-        'rsi_based_ma': 71.1691134429892,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-22T01:00:00+07:00',
-        'open': 3393.47,
-        'high': 3395.92,
-        'low': 3393.145,
-        'close': 3395.565,
-        'volume': 17875.0,
-        'accumulation_distribution': 6943748.242241555,
-        'macd': 12.251035175368544,
-        'signal': 9.998249736666429,
-        'rsi': 74.0581410688946,
-        'rsi_based_ma': 72.12458054532895,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-22T02:00:00+07:00',
-        'open': 3395.575,
-        'high': 3399.885,
-        'low': 3395.205,
-        'close': 3398.872,
-        'volume': 25451.0,
-        'accumulation_distribution': 6958181.352070611,
-        'macd': 12.450062405783228,
-        'signal': 10.488612270489789,
-        'rsi': 75.70610326241666,
-        'rsi_based_ma': 72.68357624574735,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-22T03:00:00+07:00',
-        'open': 3398.84,
-        'high': 3399.305,
-        'low': 3396.805,
-        'close': 3397.06,
-        'volume': 5813.0,
-        'accumulation_distribution': 6953554.204070612,
-        'macd': 12.319567359461416,
-        'signal': 10.854803288284112,
-        'rsi': 72.97080936876506,
-        'rsi_based_ma': 72.96651621083318,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-22T05:00:00+07:00',
-        'open': 3399.3,
-        'high': 3401.265,
-        'low': 3398.685,
-        'close': 3399.525,
-        'volume': 3550.0,
-        'accumulation_distribution': 6952315.831977589,
-        'macd': 12.27357189741997,
-        'signal': 11.138557010111285,
-        'rsi': 74.32958992381431,
-        'rsi_based_ma': 73.72443453107867,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-22T06:00:00+07:00',
-        'open': 3399.73,
-        'high': 3402.86,
-        'low': 3393.175,
-        'close': 3396.48,
-        'volume': 6599.0,
-        'accumulation_distribution': 6950220.640960552,
-        'macd': 11.854759818642378,
-        'signal': 11.281797571817505,
-        'rsi': 69.6703071992262,
-        'rsi_based_ma': 74.07449236729543,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-22T07:00:00+07:00',
-        'open': 3396.505,
-        'high': 3397.795,
-        'low': 3390.585,
-        'close': 3394.615,
-        'volume': 15599.0,
-        'accumulation_distribution': 6952059.6354127005,
-        'macd': 11.242758790328024,
-        'signal': 11.273989815519608,
-        'rsi': 66.90409036306156,
-        'rsi_based_ma': 74.21250101185436,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-22T08:00:00+07:00',
-        'open': 3394.61,
-        'high': 3396.02,
-        'low': 3385.18,
-        'close': 3386.015,
-        'volume': 18409.0,
-        'accumulation_distribution': 6936486.708290929,
-        'macd': 9.949108311844157,
-        'signal': 11.009013514784517,
-        'rsi': 55.88516310547748,
-        'rsi_based_ma': 73.57299801653969,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-22T09:00:00+07:00',
-        'open': 3385.98,
-        'high': 3392.005,
-        'low': 3385.33,
-        'close': 3391.71,
-        'volume': 13543.0,
-        'accumulation_distribution': 6948832.649114898,
-        'macd': 9.276486332270451,
-        'signal': 10.662508078281704,
-        'rsi': 60.52199932667476,
-        'rsi_based_ma': 72.7530969883281,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-22T10:00:00+07:00',
-        'open': 3391.72,
-        'high': 3393.91,
-        'low': 3388.87,
-        'close': 3392.52,
-        'volume': 8999.0,
-        'accumulation_distribution': 6952867.914987914,
-        'macd': 8.708403740498397,
-        'signal': 10.271687210725045,
-        'rsi': 61.147506009891785,
-        'rsi_based_ma': 71.53795521058868,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-22T11:00:00+07:00',
-        'open': 3392.535,
-        'high': 3392.535,
-        'low': 3388.055,
-        'close': 3391.13,
-        'volume': 6457.0,
-        'accumulation_distribution': 6955274.877041486,
-        'macd': 8.05320052768002,
-        'signal': 9.82798987411604,
-        'rsi': 59.40796004546245,
-        'rsi_based_ma': 70.1607236457309,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-22T12:00:00+07:00',
-        'open': 3391.15,
-        'high': 3391.96,
-        'low': 3384.855,
-        'close': 3385.5,
-        'volume': 12190.0,
-        'accumulation_distribution': 6945298.121235715,
-        'macd': 6.998973503076741,
-        'signal': 9.26218659990818,
-        'rsi': 52.84984331803972,
-        'rsi_based_ma': 68.01320595631549,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-22T13:00:00+07:00',
-        'open': 3385.465,
-        'high': 3388.085,
-        'low': 3384.38,
-        'close': 3384.745,
-        'volume': 13488.0,
-        'accumulation_distribution': 6934467.675891584,
-        'macd': 6.033023856984983,
-        'signal': 8.61635405132354,
-        'rsi': 52.02050391920772,
-        'rsi_based_ma': 66.03935511360748,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-22T14:00:00+07:00',
-        'open': 3384.735,
-        'high': 3387.66,
-        'low': 3383.42,
-        'close': 3387.66,
-        'volume': 11187.0,
-        'accumulation_distribution': 6945654.675891584,
-        'macd': 5.440008905124159,
-        'signal': 7.981085022083664,
-        'rsi': 54.95930358150369,
-        'rsi_based_ma': 64.52419251825023,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-22T15:00:00+07:00',
-        'open': 3387.675,
-        'high': 3390.23,
-        'low': 3386.21,
-        'close': 3389.045,
-        'volume': 14968.0,
-        'accumulation_distribution': 6951798.257981136,
-        'macd': 5.023885978108865,
-        'signal': 7.389645213288704,
-        'rsi': 56.3280187841556,
-        'rsi_based_ma': 63.33995280547085,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-22T16:00:00+07:00',
-        'open': 3389.06,
-        'high': 3390.68,
-        'low': 3384.715,
-        'close': 3386.165,
-        'volume': 11789.0,
-        'accumulation_distribution': 6945740.70810687,
-        'macd': 4.410867890241207,
-        'signal': 6.793889748679204,
-        'rsi': 52.73906537112772,
-        'rsi_based_ma': 61.81716168420178,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-22T17:00:00+07:00',
-        'open': 3386.12,
-        'high': 3388.75,
-        'low': 3385.93,
-        'close': 3387.11,
-        'volume': 7510.0,
-        'accumulation_distribution': 6944515.672645878,
-        'macd': 3.955701378205504,
-        'signal': 6.226252074584464,
-        'rsi': 53.779704300717775,
-        'rsi_based_ma': 60.25099032979472,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-22T18:00:00+07:00',
-        'open': 3387.095,
-        'high': 3391.715,
-        'low': 3386.71,
-        'close': 3391.46,
-        'volume': 13908.0,
-        'accumulation_distribution': 6957006.473844679,
-        'macd': 3.901018767599908,
-        'signal': 5.761205413187552,
-        'rsi': 58.32833565505693,
-        'rsi_based_ma': 59.20509935024414,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-22T19:00:00+07:00',
-        'open': 3391.465,
-        'high': 3407.935,
-        'low': 3390.935,
-        'close': 3407.54,
-        'volume': 29536.0,
-        'accumulation_distribution': 6985169.918550561,
-        'macd': 5.096455254816647,
-        'signal': 5.628255381513371,
-        'rsi': 70.05847959960687,
-        'rsi_based_ma': 58.90002004137217,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-22T20:00:00+07:00',
-        'open': 3407.545,
-        'high': 3420.295,
-        'low': 3406.42,
-        'close': 3412.485,
-        'volume': 49457.0,
-        'accumulation_distribution': 6978949.921073084,
-        'macd': 6.369444465543893,
-        'signal': 5.776493198319476,
-        'rsi': 72.6117225895924,
-        'rsi_based_ma': 59.11012114068404,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-22T21:00:00+07:00',
-        'open': 3412.425,
-        'high': 3427.805,
-        'low': 3405.095,
-        'close': 3426.26,
-        'volume': 58113.0,
-        'accumulation_distribution': 7029155.868232927,
-        'macd': 8.393074821919527,
-        'signal': 6.299809523039486,
-        'rsi': 78.19085770881371,
-        'rsi_based_ma': 59.91631880823777,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-22T22:00:00+07:00',
-        'open': 3426.255,
-        'high': 3430.675,
-        'low': 3423.61,
-        'close': 3426.525,
-        'volume': 39058.0,
-        'accumulation_distribution': 7022328.319754512,
-        'macd': 9.904032225667834,
-        'signal': 7.020654063565155,
-        'rsi': 78.28251155832905,
-        'rsi_based_ma': 61.51612941201289,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-22T23:00:00+07:00',
-        'open': 3426.545,
-        'high': 3433.095,
-        'low': 3426.31,
-        'close': 3432.305,
-        'volume': 24492.0,
-        'accumulation_distribution': 7041116.950557754,
-        'macd': 11.436046918340253,
-        'signal': 7.903732634520175,
-        'rsi': 80.2337202004099,
-        'rsi_based_ma': 62.92410947442254,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-23T00:00:00+07:00',
-        'open': 3432.33,
-        'high': 3433.51,
-        'low': 3426.49,
-        'close': 3429.435,
-        'volume': 25621.0,
-        'accumulation_distribution': 7036992.772495076,
-        'macd': 12.277072140025666,
-        'signal': 8.778400535621273,
-        'rsi': 76.55573009874199,
-        'rsi_based_ma': 64.0246969093404,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-23T01:00:00+07:00',
-        'open': 3429.445,
-        'high': 3431.06,
-        'low': 3427.96,
-        'close': 3429.67,
-        'volume': 19541.0,
-        'accumulation_distribution': 7039009.907978948,
-        'macd': 12.814831819237495,
-        'signal': 9.585686792344518,
-        'rsi': 76.65011640600297,
-        'rsi_based_ma': 65.25627950652188,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-23T02:00:00+07:00',
-        'open': 3429.66,
-        'high': 3432.63,
-        'low': 3429.0,
-        'close': 3431.62,
-        'volume': 26746.0,
-        'accumulation_distribution': 7050872.458943132,
-        'macd': 13.245671091335224,
-        'signal': 10.31768365214266,
-        'rsi': 77.46099972057385,
-        'rsi_based_ma': 67.01421924956003,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-23T03:00:00+07:00',
-        'open': 3431.61,
-        'high': 3432.815,
-        'low': 3427.875,
-        'close': 3431.56,
-        'volume': 8894.0,
-        'accumulation_distribution': 7055247.4427488,
-        'macd': 13.4274890841034,
-        'signal': 10.939644738534806,
-        'rsi': 77.37196516519124,
-        'rsi_based_ma': 68.82503790998742,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-23T05:00:00+07:00',
-        'open': 3430.92,
-        'high': 3431.2,
-        'low': 3427.495,
-        'close': 3427.905,
-        'volume': 3299.0,
-        'accumulation_distribution': 7052678.585798733,
-        'macd': 13.12535230824824,
-        'signal': 11.376786252477492,
-        'rsi': 71.9468600686639,
-        'rsi_based_ma': 70.03843480192744,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-23T06:00:00+07:00',
-        'open': 3427.92,
-        'high': 3433.35,
-        'low': 3426.255,
-        'close': 3427.375,
-        'volume': 7367.0,
-        'accumulation_distribution': 7047637.460358282,
-        'macd': 12.696779594307827,
-        'signal': 11.64078492084356,
-        'rsi': 71.16760426363075,
-        'rsi_based_ma': 71.09840519331853,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-23T07:00:00+07:00',
-        'open': 3427.265,
-        'high': 3439.035,
-        'low': 3427.01,
-        'close': 3428.9,
-        'volume': 20618.0,
-        'accumulation_distribution': 7033500.627925849,
-        'macd': 12.337963028179727,
-        'signal': 11.780220542310794,
-        'rsi': 72.10385265997948,
-        'rsi_based_ma': 72.48160428537936,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-23T08:00:00+07:00',
-        'open': 3428.88,
-        'high': 3430.72,
-        'low': 3420.975,
-        'close': 3421.17,
-        'volume': 25425.0,
-        'accumulation_distribution': 7009093.149731904,
-        'macd': 11.29959719399767,
-        'signal': 11.684095872648168,
-        'rsi': 61.247306472838886,
-        'rsi_based_ma': 73.01500444053087,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-23T09:00:00+07:00',
-        'open': 3421.12,
-        'high': 3425.08,
-        'low': 3419.21,
-        'close': 3423.165,
-        'volume': 15065.0,
-        'accumulation_distribution': 7014328.686358821,
-        'macd': 10.51643766927964,
-        'signal': 11.450564231974464,
-        'rsi': 62.8039120052086,
-        'rsi_based_ma': 73.33468846554172,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-23T10:00:00+07:00',
-        'open': 3423.165,
-        'high': 3428.775,
-        'low': 3422.885,
-        'close': 3423.1,
-        'volume': 18004.0,
-        'accumulation_distribution': 6997639.070060007,
-        'macd': 9.777820518354474,
-        'signal': 11.116015489250463,
-        'rsi': 62.71552124846552,
-        'rsi_based_ma': 72.81019144046017,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-23T11:00:00+07:00',
-        'open': 3423.06,
-        'high': 3425.38,
-        'low': 3422.08,
-        'close': 3423.735,
-        'volume': 8511.0,
-        'accumulation_distribution': 6997664.860969098,
-        'macd': 9.138358983944729,
-        'signal': 10.720484188189316,
-        'rsi': 63.25953497325301,
-        'rsi_based_ma': 72.14217803929309,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-23T12:00:00+07:00',
-        'open': 3423.725,
-        'high': 3423.93,
-        'low': 3416.445,
-        'close': 3420.44,
-        'volume': 17223.0,
-        'accumulation_distribution': 6998826.866981123,
-        'macd': 8.270366511299471,
-        'signal': 10.230460652811349,
-        'rsi': 58.49046970000606,
-        'rsi_based_ma': 70.73500746723539,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-23T13:00:00+07:00',
-        'open': 3420.415,
-        'high': 3425.265,
-        'low': 3419.595,
-        'close': 3425.175,
-        'volume': 22321.0,
-        'accumulation_distribution': 7020439.263806522,
-        'macd': 7.873787035451642,
-        'signal': 9.759125929339408,
-        'rsi': 62.82737330774883,
-        'rsi_based_ma': 69.63106902076537,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-23T14:00:00+07:00',
-        'open': 3425.11,
-        'high': 3429.77,
-        'low': 3419.94,
-        'close': 3420.72,
-        'volume': 23306.0,
-        'accumulation_distribution': 7000831.876217508,
-        'macd': 7.117962237731263,
-        'signal': 9.23089319101778,
-        'rsi': 56.81297870313771,
-        'rsi_based_ma': 67.95815891381736,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-23T15:00:00+07:00',
-        'open': 3420.82,
-        'high': 3428.85,
-        'low': 3420.555,
-        'close': 3428.555,
-        'volume': 14500.0,
-        'accumulation_distribution': 7014300.532034265,
-        'macd': 7.0696896784033925,
-        'signal': 8.798652488494902,
-        'rsi': 63.4413798926173,
-        'rsi_based_ma': 67.02141961337988,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-23T16:00:00+07:00',
-        'open': 3428.565,
-        'high': 3433.88,
-        'low': 3428.37,
-        'close': 3431.15,
-        'volume': 11378.0,
-        'accumulation_distribution': 7014403.780673103,
-        'macd': 7.158311580030841,
-        'signal': 8.47058430680209,
-        'rsi': 65.33887736231168,
-        'rsi_based_ma': 66.21347396740194,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-23T17:00:00+07:00',
-        'open': 3431.145,
-        'high': 3431.38,
-        'low': 3421.2,
-        'close': 3422.8,
-        'volume': 16631.0,
-        'accumulation_distribution': 7003000.599926543,
-        'macd': 6.48007162740214,
-        'signal': 8.0724817709221,
-        'rsi': 55.37868266934941,
-        'rsi_based_ma': 64.63616560660019,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-23T18:00:00+07:00',
-        'open': 3422.765,
-        'high': 3429.93,
-        'low': 3420.44,
-        'close': 3428.34,
-        'volume': 17588.0,
-        'accumulation_distribution': 7014695.044605153,
-        'macd': 6.316777400956198,
-        'signal': 7.721340896928919,
-        'rsi': 59.76143215232887,
-        'rsi_based_ma': 63.37827039139573,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-23T19:00:00+07:00',
-        'open': 3428.32,
-        'high': 3430.075,
-        'low': 3419.925,
-        'close': 3420.015,
-        'volume': 31196.0,
-        'accumulation_distribution': 6984052.274161801,
-        'macd': 5.452751697604981,
-        'signal': 7.267623057064132,
-        'rsi': 51.5651043139351,
-        'rsi_based_ma': 61.92243069462938,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-23T20:00:00+07:00',
-        'open': 3420.005,
-        'high': 3420.65,
-        'low': 3405.56,
-        'close': 3413.465,
-        'volume': 46797.0,
-        'accumulation_distribution': 6986285.13300872,
-        'macd': 4.191161739735435,
-        'signal': 6.652330793598392,
-        'rsi': 46.19663574201331,
-        'rsi_based_ma': 60.138790085942425,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-23T21:00:00+07:00',
-        'open': 3413.44,
-        'high': 3419.98,
-        'low': 3410.75,
-        'close': 3413.625,
-        'volume': 38143.0,
-        'accumulation_distribution': 6971904.023582934,
-        'macd': 3.167737564883737,
-        'signal': 5.955412147855461,
-        'rsi': 46.34358909497522,
-        'rsi_based_ma': 58.29877125987069,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-23T22:00:00+07:00',
-        'open': 3413.63,
-        'high': 3415.855,
-        'low': 3398.105,
-        'close': 3398.105,
-        'volume': 33069.0,
-        'accumulation_distribution': 6938835.023582934,
-        'macd': 1.0917472562118746,
-        'signal': 4.982679169526744,
-        'rsi': 36.056176546220605,
-        'rsi_based_ma': 56.49940483654081,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-23T23:00:00+07:00',
-        'open': 3398.18,
-        'high': 3398.215,
-        'low': 3381.42,
-        'close': 3387.47,
-        'volume': 56120.0,
-        'accumulation_distribution': 6923146.818760068,
-        'macd': -1.395558509912462,
-        'signal': 3.707031633638903,
-        'rsi': 30.9810880634748,
-        'rsi_based_ma': 54.22634598355983,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-24T00:00:00+07:00',
-        'open': 3387.465,
-        'high': 3394.825,
-        'low': 3385.755,
-        'close': 3393.38,
-        'volume': 37866.0,
-        'accumulation_distribution': 6948947.46705114,
-        'macd': -2.8569455516344533,
-        'signal': 2.394236196584232,
-        'rsi': 36.34328590917212,
-        'rsi_based_ma': 52.34261488789601,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-24T01:00:00+07:00',
-        'open': 3393.355,
-        'high': 3396.16,
-        'low': 3392.065,
-        'close': 3393.76,
-        'volume': 25088.0,
-        'accumulation_distribution': 6944628.287563964,
-        'macd': -3.9390357347310783,
-        'signal': 1.1275818103211697,
-        'rsi': 36.68390551573244,
-        'rsi_based_ma': 50.44435564093026,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-24T02:00:00+07:00',
-        'open': 3393.82,
-        'high': 3396.05,
-        'low': 3388.595,
-        'close': 3390.295,
-        'volume': 24822.0,
-        'accumulation_distribution': 6931126.850944247,
-        'macd': -5.018348149012581,
-        'signal': -0.1016041815455806,
-        'rsi': 34.85258345322525,
-        'rsi_based_ma': 48.755935194731634,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-24T03:00:00+07:00',
-        'open': 3390.37,
-        'high': 3390.61,
-        'low': 3386.04,
-        'close': 3387.45,
-        'volume': 6589.0,
-        'accumulation_distribution': 6928603.710900483,
-        'macd': -6.033725702663105,
-        'signal': -1.2880284857690856,
-        'rsi': 33.37915772127069,
-        'rsi_based_ma': 46.65249122426891,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-24T05:00:00+07:00',
-        'open': 3390.855,
-        'high': 3392.615,
-        'low': 3386.955,
-        'close': 3387.035,
-        'volume': 3135.0,
-        'accumulation_distribution': 6925557.33280861,
-        'macd': -6.793594433270755,
-        'signal': -2.3891416752694195,
-        'rsi': 33.15894395007928,
-        'rsi_based_ma': 44.96291731333616,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-24T06:00:00+07:00',
-        'open': 3387.04,
-        'high': 3391.72,
-        'low': 3386.66,
-        'close': 3390.115,
-        'volume': 4721.0,
-        'accumulation_distribution': 6927283.390120863,
-        'macd': -7.065815297042718,
-        'signal': -3.32447639962408,
-        'rsi': 36.50692334044544,
-        'rsi_based_ma': 43.0390275596096,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-24T07:00:00+07:00',
-        'open': 3390.165,
-        'high': 3393.37,
-        'low': 3388.545,
-        'close': 3391.595,
-        'volume': 10799.0,
-        'accumulation_distribution': 6930137.01188252,
-        'macd': -7.080508961854775,
-        'signal': -4.075682912070219,
-        'rsi': 38.1110846111961,
-        'rsi_based_ma': 41.0941852202442,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-24T08:00:00+07:00',
-        'open': 3391.62,
-        'high': 3393.48,
-        'low': 3384.07,
-        'close': 3387.665,
-        'volume': 28013.0,
-        'accumulation_distribution': 6923528.206356484,
-        'macd': -7.324835805091425,
-        'signal': -4.7255134906744605,
-        'rsi': 35.54309966988296,
-        'rsi_based_ma': 39.677357863139456,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-24T09:00:00+07:00',
-        'open': 3387.67,
-        'high': 3388.885,
-        'low': 3380.665,
-        'close': 3383.88,
-        'volume': 22531.0,
-        'accumulation_distribution': 6918621.820711715,
-        'macd': -7.734723379648585,
-        'signal': -5.327355468469285,
-        'rsi': 33.221344677763696,
-        'rsi_based_ma': 37.781637329241946,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-24T10:00:00+07:00',
-        'open': 3383.785,
-        'high': 3385.985,
-        'low': 3374.755,
-        'close': 3383.835,
-        'volume': 23264.0,
-        'accumulation_distribution': 6932977.966749115,
-        'macd': -7.971305116072472,
-        'signal': -5.8561453979899225,
-        'rsi': 33.19358294719453,
-        'rsi_based_ma': 36.46938580304619,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-24T11:00:00+07:00',
-        'open': 3383.76,
-        'high': 3385.41,
-        'low': 3381.015,
-        'close': 3382.685,
-        'volume': 13315.0,
-        'accumulation_distribution': 6929781.760833302,
-        'macd': -8.157557985166932,
-        'signal': -6.316427915425324,
-        'rsi': 32.44734302701856,
-        'rsi_based_ma': 35.48729346626085,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-24T12:00:00+07:00',
-        'open': 3382.69,
-        'high': 3382.995,
-        'low': 3374.515,
-        'close': 3379.35,
-        'volume': 20450.0,
-        'accumulation_distribution': 6932651.513191792,
-        'macd': -8.47655885998256,
-        'signal': -6.748454104336771,
-        'rsi': 30.31863237578401,
-        'rsi_based_ma': 34.34265370060434,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-24T13:00:00+07:00',
-        'open': 3379.36,
-        'high': 3379.87,
-        'low': 3370.13,
-        'close': 3375.885,
-        'volume': 23831.0,
-        'accumulation_distribution': 6936982.197996722,
-        'macd': -8.906299615351145,
-        'signal': -7.180023206539646,
-        'rsi': 28.245269580195924,
-        'rsi_based_ma': 33.784731774459715,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-24T14:00:00+07:00',
-        'open': 3375.88,
-        'high': 3377.695,
-        'low': 3366.145,
-        'close': 3367.705,
-        'volume': 20072.0,
-        'accumulation_distribution': 6922332.244749968,
-        'macd': -9.79403041097794,
-        'signal': -7.702824647427304,
-        'rsi': 24.061866144035847,
-        'rsi_based_ma': 33.29050163735693,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-24T15:00:00+07:00',
-        'open': 3367.695,
-        'high': 3374.71,
-        'low': 3365.935,
-        'close': 3369.795,
-        'volume': 17912.0,
-        'accumulation_distribution': 6920178.722242846,
-        'macd': -10.211209462696845,
-        'signal': -8.204501610481213,
-        'rsi': 27.035406636697488,
-        'rsi_based_ma': 32.625653117894466,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-24T16:00:00+07:00',
-        'open': 3369.725,
-        'high': 3370.175,
-        'low': 3361.995,
-        'close': 3363.7,
-        'volume': 16666.0,
-        'accumulation_distribution': 6910460.284590034,
-        'macd': -10.907902913898852,
-        'signal': -8.74518187116474,
-        'rsi': 24.074751293406123,
-        'rsi_based_ma': 31.724999244871157,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-24T17:00:00+07:00',
-        'open': 3363.71,
-        'high': 3367.385,
-        'low': 3362.205,
-        'close': 3364.485,
-        'volume': 11127.0,
-        'accumulation_distribution': 6909128.481501231,
-        'macd': -11.266817692887798,
-        'signal': -9.249509035509352,
-        'rsi': 25.21074205971233,
-        'rsi_based_ma': 31.036296288191657,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-24T18:00:00+07:00',
-        'open': 3364.465,
-        'high': 3366.615,
-        'low': 3361.375,
-        'close': 3362.275,
-        'volume': 14063.0,
-        'accumulation_distribution': 6899896.283027949,
-        'macd': -11.595918244028326,
-        'signal': -9.718790877213149,
-        'rsi': 24.116748819347023,
-        'rsi_based_ma': 30.37469565233996,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-24T19:00:00+07:00',
-        'open': 3362.31,
-        'high': 3365.555,
-        'low': 3352.72,
-        'close': 3353.48,
-        'volume': 31669.0,
-        'accumulation_distribution': 6871977.721672282,
-        'macd': -12.42320878131477,
-        'signal': -10.259674458033473,
-        'rsi': 20.33493568229053,
-        'rsi_based_ma': 29.458695061783622,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-24T20:00:00+07:00',
-        'open': 3353.51,
-        'high': 3372.28,
-        'low': 3351.465,
-        'close': 3366.795,
-        'volume': 45726.0,
-        'accumulation_distribution': 6893605.032265604,
-        'macd': -11.867630612165158,
-        'signal': -10.581265688859808,
-        'rsi': 36.55548025233213,
-        'rsi_based_ma': 29.46216341263267,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-24T21:00:00+07:00',
-        'open': 3366.71,
-        'high': 3377.475,
-        'low': 3365.88,
-        'close': 3373.7,
-        'volume': 39500.0,
-        'accumulation_distribution': 6907384.89427509,
-        'macd': -10.746278706282284,
-        'signal': -10.614268292344304,
-        'rsi': 43.0332587238785,
-        'rsi_based_ma': 29.81374727782427,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-24T22:00:00+07:00',
-        'open': 3373.66,
-        'high': 3375.35,
-        'low': 3370.355,
-        'close': 3372.64,
-        'volume': 28148.0,
-        'accumulation_distribution': 6904989.919300114,
-        'macd': -9.829820333226053,
-        'signal': -10.457378700520652,
-        'rsi': 42.31893742790574,
-        'rsi_based_ma': 30.29773568911161,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-24T23:00:00+07:00',
-        'open': 3372.635,
-        'high': 3373.91,
-        'low': 3366.965,
-        'close': 3367.015,
-        'volume': 20391.0,
-        'accumulation_distribution': 6884892.526211559,
-        'macd': -9.448494595552347,
-        'signal': -10.255601879526992,
-        'rsi': 38.652314785658575,
-        'rsi_based_ma': 30.68566212538982,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-25T00:00:00+07:00',
-        'open': 3367.0,
-        'high': 3371.915,
-        'low': 3366.36,
-        'close': 3370.095,
-        'volume': 18028.0,
-        'accumulation_distribution': 6891107.399298866,
-        'macd': -8.79636195668536,
-        'signal': -9.963753894958666,
-        'rsi': 41.63427744490693,
-        'rsi_based_ma': 31.288568875226417,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-25T01:00:00+07:00',
-        'open': 3370.08,
-        'high': 3373.475,
-        'low': 3367.59,
-        'close': 3372.01,
-        'volume': 12509.0,
-        'accumulation_distribution': 6897388.468967517,
-        'macd': -8.032424852653094,
-        'signal': -9.577488086497551,
-        'rsi': 43.4740110230938,
-        'rsi_based_ma': 32.07618801780322,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-25T02:00:00+07:00',
-        'open': 3372.015,
-        'high': 3373.16,
-        'low': 3370.08,
-        'close': 3370.54,
-        'volume': 15357.0,
-        'accumulation_distribution': 6886618.624811674,
-        'macd': -7.4596259836516765,
-        'signal': -9.153915665928375,
-        'rsi': 42.3699619376443,
-        'rsi_based_ma': 32.93699727222181,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-25T03:00:00+07:00',
-        'open': 3370.65,
-        'high': 3371.3,
-        'low': 3367.38,
-        'close': 3368.71,
-        'volume': 5086.0,
-        'accumulation_distribution': 6884983.839097387,
-        'macd': -7.071824864250175,
-        'signal': -8.737497505592737,
-        'rsi': 40.97489527154556,
-        'rsi_based_ma': 33.84625625017536,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-25T05:00:00+07:00',
-        'open': 3369.45,
-        'high': 3369.615,
-        'low': 3365.205,
-        'close': 3368.93,
-        'volume': 4237.0,
-        'accumulation_distribution': 6887904.582861559,
-        'macd': -6.669851624100829,
-        'signal': -8.323968329294356,
-        'rsi': 41.22543843718656,
-        'rsi_based_ma': 35.07222569968612,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-25T06:00:00+07:00',
-        'open': 3368.91,
-        'high': 3371.44,
-        'low': 3366.855,
-        'close': 3369.435,
-        'volume': 4673.0,
-        'accumulation_distribution': 6888490.618848473,
-        'macd': -6.238620719435403,
-        'signal': -7.906898807322565,
-        'rsi': 41.83575515841803,
-        'rsi_based_ma': 36.12939345123759,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-25T07:00:00+07:00',
-        'open': 3369.485,
-        'high': 3373.495,
-        'low': 3368.455,
-        'close': 3372.255,
-        'volume': 6363.0,
-        'accumulation_distribution': 6891722.618848474,
-        'macd': -5.604709090772758,
-        'signal': -7.446460864012604,
-        'rsi': 45.254426074319404,
-        'rsi_based_ma': 37.642227364159965,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-25T08:00:00+07:00',
-        'open': 3372.285,
-        'high': 3372.845,
-        'low': 3366.47,
-        'close': 3370.485,
-        'volume': 10791.0,
-        'accumulation_distribution': 6894524.047083769,
-        'macd': -5.185379933378499,
-        'signal': -6.994244677885783,
-        'rsi': 43.52520365846785,
-        'rsi_based_ma': 38.9504031926425,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-25T09:00:00+07:00',
-        'open': 3370.525,
-        'high': 3370.595,
-        'low': 3362.465,
-        'close': 3363.135,
-        'volume': 9915.0,
-        'accumulation_distribution': 6886243.253725836,
-        'macd': -5.384077830766273,
-        'signal': -6.672211308461881,
-        'rsi': 37.17310306474218,
-        'rsi_based_ma': 39.88299992445644,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-25T10:00:00+07:00',
-        'open': 3363.065,
-        'high': 3363.575,
-        'low': 3358.67,
-        'close': 3359.245,
-        'volume': 8222.0,
-        'accumulation_distribution': 6879948.939760494,
-        'macd': -5.788709199593995,
-        'signal': -6.495510886688304,
-        'rsi': 34.31846316304545,
-        'rsi_based_ma': 40.88182331593895,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-25T11:00:00+07:00',
-        'open': 3359.225,
-        'high': 3363.51,
-        'low': 3357.925,
-        'close': 3360.96,
-        'volume': 6877.0,
-        'accumulation_distribution': 6880546.136716627,
-        'macd': -5.90295076548955,
-        'signal': -6.376998862448553,
-        'rsi': 36.62899684891988,
-        'rsi_based_ma': 40.88707450140949,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-25T12:00:00+07:00',
-        'open': 3360.945,
-        'high': 3362.425,
-        'low': 3355.325,
-        'close': 3358.745,
-        'volume': 8987.0,
-        'accumulation_distribution': 6880217.035308176,
-        'macd': -6.101881328336731,
-        'signal': -6.321975355626188,
-        'rsi': 34.92038913493744,
-        'rsi_based_ma': 40.307583816485135,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-25T13:00:00+07:00',
-        'open': 3358.74,
-        'high': 3359.72,
-        'low': 3354.715,
-        'close': 3359.39,
-        'volume': 11722.0,
-        'accumulation_distribution': 6890393.277066418,
-        'macd': -6.13674850631287,
-        'signal': -6.284929985763524,
-        'rsi': 35.858655322115595,
-        'rsi_based_ma': 39.84613509464298,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-25T14:00:00+07:00',
-        'open': 3359.41,
-        'high': 3360.165,
-        'low': 3352.78,
-        'close': 3354.16,
-        'volume': 10447.0,
-        'accumulation_distribution': 6883850.639964183,
-        'macd': -6.511339617190515,
-        'signal': -6.330211912048922,
-        'rsi': 31.849028411507675,
-        'rsi_based_ma': 39.36018606791792,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-25T15:00:00+07:00',
-        'open': 3354.165,
-        'high': 3355.38,
-        'low': 3344.54,
-        'close': 3345.555,
-        'volume': 11596.0,
-        'accumulation_distribution': 6874426.215609939,
-        'macd': -7.417058127226483,
-        'signal': -6.547581155084434,
-        'rsi': 26.58234590394838,
-        'rsi_based_ma': 38.28504810070659,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-25T16:00:00+07:00',
-        'open': 3345.54,
-        'high': 3348.985,
-        'low': 3343.145,
-        'close': 3345.97,
-        'volume': 7901.0,
-        'accumulation_distribution': 6874169.1625277465,
-        'macd': -8.009036354437285,
-        'signal': -6.839872194955005,
-        'rsi': 27.207531984279285,
-        'rsi_based_ma': 37.12315674079127,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-25T17:00:00+07:00',
-        'open': 3345.945,
-        'high': 3348.16,
-        'low': 3341.07,
-        'close': 3342.99,
-        'volume': 10398.0,
-        'accumulation_distribution': 6869402.801455813,
-        'macd': -8.619286687956446,
-        'signal': -7.195755093555293,
-        'rsi': 25.52658373350528,
-        'rsi_based_ma': 35.92005829763848,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-25T18:00:00+07:00',
-        'open': 3343.045,
-        'high': 3345.24,
-        'low': 3338.8,
-        'close': 3341.1,
-        'volume': 10882.0,
-        'accumulation_distribution': 6866293.65859867,
-        'macd': -9.149946787574663,
-        'signal': -7.586593432359168,
-        'rsi': 24.4930188725772,
-        'rsi_based_ma': 34.74278141199788,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-25T19:00:00+07:00',
-        'open': 3341.09,
-        'high': 3344.295,
-        'low': 3336.345,
-        'close': 3340.885,
-        'volume': 17646.0,
-        'accumulation_distribution': 6868801.832183576,
-        'macd': -9.478584224169026,
-        'signal': -7.964991590721139,
-        'rsi': 24.372126250359717,
-        'rsi_based_ma': 33.538973398653106,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-25T20:00:00+07:00',
-        'open': 3340.88,
-        'high': 3347.635,
-        'low': 3336.94,
-        'close': 3343.935,
-        'volume': 34742.0,
-        'accumulation_distribution': 6879505.421711392,
-        'macd': -9.384740800142936,
-        'signal': -8.248941432605498,
-        'rsi': 29.675022670258627,
-        'rsi_based_ma': 32.67034964949887,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-25T21:00:00+07:00',
-        'open': 3343.91,
-        'high': 3344.88,
-        'low': 3330.625,
-        'close': 3331.94,
-        'volume': 43426.0,
-        'accumulation_distribution': 6844091.374008832,
-        'macd': -10.161134233739176,
-        'signal': -8.631379992832233,
-        'rsi': 22.88022365204246,
-        'rsi_based_ma': 31.07219233362193,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-25T22:00:00+07:00',
-        'open': 3331.965,
-        'high': 3335.935,
-        'low': 3325.115,
-        'close': 3327.875,
-        'volume': 35634.0,
-        'accumulation_distribution': 6826636.642031014,
-        'macd': -10.977896790160685,
-        'signal': -9.100683352297924,
-        'rsi': 21.115667992871067,
-        'rsi_based_ma': 29.47151121465074,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-25T23:00:00+07:00',
-        'open': 3327.9,
-        'high': 3331.39,
-        'low': 3326.245,
-        'close': 3329.94,
-        'volume': 19451.0,
-        'accumulation_distribution': 6835124.00743432,
-        'macd': -11.327976892312565,
-        'signal': -9.546142060300852,
-        'rsi': 24.309137262459103,
-        'rsi_based_ma': 28.552656514487666,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-26T00:00:00+07:00',
-        'open': 3329.93,
-        'high': 3336.92,
-        'low': 3329.67,
-        'close': 3336.035,
-        'volume': 18157.0,
-        'accumulation_distribution': 6848848.195020526,
-        'macd': -10.986951594656148,
-        'signal': -9.83430396717191,
-        'rsi': 32.93858564004063,
-        'rsi_based_ma': 28.454093834273035,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-26T01:00:00+07:00',
-        'open': 3336.09,
-        'high': 3339.5,
-        'low': 3335.995,
-        'close': 3338.835,
-        'volume': 12787.0,
-        'accumulation_distribution': 6856783.066632509,
-        'macd': -10.3711972834476,
-        'signal': -9.94168263042705,
-        'rsi': 36.519148698152414,
-        'rsi_based_ma': 28.44624753778964,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-26T02:00:00+07:00',
-        'open': 3338.845,
-        'high': 3340.335,
-        'low': 3337.195,
-        'close': 3337.68,
-        'volume': 17620.0,
-        'accumulation_distribution': 6844606.187651614,
-        'macd': -9.862715161749293,
-        'signal': -9.9258891366915,
-        'rsi': 35.67303768722799,
-        'rsi_based_ma': 28.500008148667536,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-26T03:00:00+07:00',
-        'open': 3337.61,
-        'high': 3339.195,
-        'low': 3336.11,
-        'close': 3337.07,
-        'volume': 4534.0,
-        'accumulation_distribution': 6842893.99640364,
-        'macd': -9.40059708734998,
-        'signal': -9.820830726823194,
-        'rsi': 35.2090636160371,
-        'rsi_based_ma': 28.453608741090505,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-28T05:00:00+07:00',
-        'open': 3329.475,
-        'high': 3335.53,
-        'low': 3324.02,
-        'close': 3329.635,
-        'volume': 10423.0,
-        'accumulation_distribution': 6842640.439496603,
-        'macd': -9.524514868520328,
-        'signal': -9.76156755516262,
-        'rsi': 30.074658381687986,
-        'rsi_based_ma': 28.326868024674805,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-28T06:00:00+07:00',
-        'open': 3329.615,
-        'high': 3337.47,
-        'low': 3329.395,
-        'close': 3333.72,
-        'volume': 8640.0,
-        'accumulation_distribution': 6843255.671694745,
-        'macd': -9.187191023357173,
-        'signal': -9.646692248801532,
-        'rsi': 35.62887175576664,
-        'rsi_based_ma': 28.973048442661824,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-28T07:00:00+07:00',
-        'open': 3333.685,
-        'high': 3336.13,
-        'low': 3327.755,
-        'close': 3333.42,
-        'volume': 11258.0,
-        'accumulation_distribution': 6847227.897366387,
-        'macd': -8.842140249815202,
-        'signal': -9.485781849004264,
-        'rsi': 35.40644645751395,
-        'rsi_based_ma': 29.558685190750012,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-28T08:00:00+07:00',
-        'open': 3333.45,
-        'high': 3338.815,
-        'low': 3329.98,
-        'close': 3332.145,
-        'volume': 17777.0,
-        'accumulation_distribution': 6838163.337660671,
-        'macd': -8.572745595332435,
-        'signal': -9.3031745982699,
-        'rsi': 34.42288172109539,
-        'rsi_based_ma': 30.19413504700645,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-28T09:00:00+07:00',
-        'open': 3332.16,
-        'high': 3336.555,
-        'low': 3330.67,
-        'close': 3335.71,
-        'volume': 9671.0,
-        'accumulation_distribution': 6845057.109113518,
-        'macd': -7.979598836460809,
-        'signal': -9.038459445908082,
-        'rsi': 39.48484285779836,
-        'rsi_based_ma': 31.264979617379392,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-28T10:00:00+07:00',
-        'open': 3335.675,
-        'high': 3343.42,
-        'low': 3334.56,
-        'close': 3343.42,
-        'volume': 7492.0,
-        'accumulation_distribution': 6852549.109113518,
-        'macd': -6.808904380518925,
-        'signal': -8.59254843283025,
-        'rsi': 48.70648863314025,
-        'rsi_based_ma': 33.00314835900657,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-28T11:00:00+07:00',
-        'open': 3343.26,
-        'high': 3344.175,
-        'low': 3339.525,
-        'close': 3339.725,
-        'volume': 5493.0,
-        'accumulation_distribution': 6847528.62524255,
-        'macd': -6.108857107282347,
-        'signal': -8.09581016772067,
-        'rsi': 45.155117992203614,
-        'rsi_based_ma': 34.10886945343121,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-28T12:00:00+07:00',
-        'open': 3339.67,
-        'high': 3344.2,
-        'low': 3338.085,
-        'close': 3343.405,
-        'volume': 7575.0,
-        'accumulation_distribution': 6853134.001366835,
-        'macd': -5.197209162640775,
-        'signal': -7.51608996670469,
-        'rsi': 49.13309740537103,
-        'rsi_based_ma': 35.98407472152611,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-28T13:00:00+07:00',
-        'open': 3343.385,
-        'high': 3345.52,
-        'low': 3335.85,
-        'close': 3340.09,
-        'volume': 13297.0,
-        'accumulation_distribution': 6851497.659071076,
-        'macd': -4.68817206455833,
-        'signal': -6.950506386275419,
-        'rsi': 45.90319265794805,
-        'rsi_based_ma': 37.75461219760304,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-28T14:00:00+07:00',
-        'open': 3340.085,
-        'high': 3342.11,
-        'low': 3333.96,
-        'close': 3335.11,
-        'volume': 13235.0,
-        'accumulation_distribution': 6841997.689745923,
-        'macd': -4.633192320310172,
-        'signal': -6.487043573082369,
-        'rsi': 41.49058216514365,
-        'rsi_based_ma': 38.9818582620805,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-28T15:00:00+07:00',
-        'open': 3335.055,
-        'high': 3338.905,
-        'low': 3332.405,
-        'close': 3336.145,
-        'volume': 12953.0,
-        'accumulation_distribution': 6843950.603592075,
-        'macd': -4.4547530070644825,
-        'signal': -6.080585459878792,
-        'rsi': 42.72291855083582,
-        'rsi_based_ma': 39.68073918428016,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-28T16:00:00+07:00',
-        'open': 3336.155,
-        'high': 3340.85,
-        'low': 3336.03,
-        'close': 3337.87,
-        'volume': 11497.0,
-        'accumulation_distribution': 6841231.396123195,
-        'macd': -4.126576872674377,
-        'signal': -5.689783742437909,
-        'rsi': 44.80934220561488,
-        'rsi_based_ma': 40.27289586338463,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-28T17:00:00+07:00',
-        'open': 3337.77,
-        'high': 3338.88,
-        'low': 3334.295,
-        'close': 3335.98,
-        'volume': 11281.0,
-        'accumulation_distribution': 6838241.992633554,
-        'macd': -3.9732015323670566,
-        'signal': -5.346467300423738,
-        'rsi': 42.96274967456391,
-        'rsi_based_ma': 40.79358957676576,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-28T18:00:00+07:00',
-        'open': 3336.135,
-        'high': 3338.475,
-        'low': 3334.46,
-        'close': 3336.625,
-        'volume': 9727.0,
-        'accumulation_distribution': 6839005.132110516,
-        'macd': -3.756304026059297,
-        'signal': -5.02843464555085,
-        'rsi': 43.8137218590515,
-        'rsi_based_ma': 41.40820802269536,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-28T19:00:00+07:00',
-        'open': 3336.635,
-        'high': 3338.455,
-        'low': 3325.67,
-        'close': 3328.46,
-        'volume': 21195.0,
-        'accumulation_distribution': 6827060.667894637,
-        'macd': -4.194902230221942,
-        'signal': -4.861728162485068,
-        'rsi': 36.40846239417549,
-        'rsi_based_ma': 41.8606225950159,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-28T20:00:00+07:00',
-        'open': 3328.48,
-        'high': 3330.715,
-        'low': 3301.765,
-        'close': 3302.3,
-        'volume': 37215.0,
-        'accumulation_distribution': 6791221.144578576,
-        'macd': -6.5775657550761935,
-        'signal': -5.204895681003293,
-        'rsi': 22.997167436408347,
-        'rsi_based_ma': 40.958358000776016,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-28T21:00:00+07:00',
-        'open': 3302.28,
-        'high': 3314.91,
-        'low': 3301.82,
-        'close': 3308.065,
-        'volume': 40696.0,
-        'accumulation_distribution': 6789355.781706154,
-        'macd': -7.909480872781842,
-        'signal': -5.745812719359003,
-        'rsi': 29.187638647368782,
-        'rsi_based_ma': 40.51415744290851,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-28T22:00:00+07:00',
-        'open': 3308.05,
-        'high': 3317.29,
-        'low': 3306.725,
-        'close': 3314.855,
-        'volume': 29927.0,
-        'accumulation_distribution': 6805487.751890726,
-        'macd': -8.321215157334336,
-        'signal': -6.26089320695407,
-        'rsi': 35.740205842464434,
-        'rsi_based_ma': 40.60825202300629,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-28T23:00:00+07:00',
-        'open': 3314.88,
-        'high': 3315.01,
-        'low': 3311.495,
-        'close': 3312.265,
-        'volume': 19896.0,
-        'accumulation_distribution': 6794308.633825292,
-        'macd': -8.755580022355844,
-        'signal': -6.759830570034425,
-        'rsi': 34.43141005622198,
-        'rsi_based_ma': 40.24729253717942,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-29T00:00:00+07:00',
-        'open': 3312.295,
-        'high': 3313.31,
-        'low': 3308.84,
-        'close': 3310.86,
-        'volume': 17060.0,
-        'accumulation_distribution': 6792667.51525706,
-        'macd': -9.108195457658894,
-        'signal': -7.229503547559319,
-        'rsi': 33.71023960881145,
-        'rsi_based_ma': 39.1761318925845,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-29T01:00:00+07:00',
-        'open': 3310.855,
-        'high': 3315.715,
-        'low': 3310.355,
-        'close': 3313.805,
-        'volume': 15766.0,
-        'accumulation_distribution': 6797197.298839147,
-        'macd': -9.045735237937606,
-        'signal': -7.592749885634976,
-        'rsi': 36.70292071731056,
-        'rsi_based_ma': 38.57240351580642,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-29T02:00:00+07:00',
-        'open': 3313.795,
-        'high': 3318.96,
-        'low': 3313.08,
-        'close': 3317.22,
-        'volume': 19128.0,
-        'accumulation_distribution': 6805004.645777921,
-        'macd': -8.621292214076675,
-        'signal': -7.798458351323316,
-        'rsi': 40.08099119180151,
-        'rsi_based_ma': 37.92582450055146,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-29T03:00:00+07:00',
-        'open': 3317.215,
-        'high': 3318.56,
-        'low': 3314.27,
-        'close': 3314.45,
-        'volume': 5185.0,
-        'accumulation_distribution': 6800254.750673026,
-        'macd': -8.411471700065249,
-        'signal': -7.9210610210717025,
-        'rsi': 38.295701062990354,
-        'rsi_based_ma': 37.38243224376877,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-29T05:00:00+07:00',
-        'open': 3313.84,
-        'high': 3315.485,
-        'low': 3311.92,
-        'close': 3314.625,
-        'volume': 7375.0,
-        'accumulation_distribution': 6804071.545904442,
-        'macd': -8.137265067149656,
-        'signal': -7.964301830287293,
-        'rsi': 38.482130547986166,
-        'rsi_based_ma': 37.167542842543234,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-29T06:00:00+07:00',
-        'open': 3314.66,
-        'high': 3314.735,
-        'low': 3310.465,
-        'close': 3312.65,
-        'volume': 3844.0,
-        'accumulation_distribution': 6804161.569323645,
-        'macd': -7.987248302703847,
-        'signal': -7.968891124770604,
-        'rsi': 37.11908558830437,
-        'rsi_based_ma': 36.76726905950528,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-29T07:00:00+07:00',
-        'open': 3312.65,
-        'high': 3315.93,
-        'low': 3308.16,
-        'close': 3311.705,
-        'volume': 9369.0,
-        'accumulation_distribution': 6803341.6310997065,
-        'macd': -7.854075643349461,
-        'signal': -7.945928028486375,
-        'rsi': 36.45374710947554,
-        'rsi_based_ma': 36.17044083835247,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-29T08:00:00+07:00',
-        'open': 3311.65,
-        'high': 3320.965,
-        'low': 3308.53,
-        'close': 3318.96,
-        'volume': 14094.0,
-        'accumulation_distribution': 6812890.64195616,
-        'macd': -7.081486515441156,
-        'signal': -7.773039725877331,
-        'rsi': 44.65555676836647,
-        'rsi_based_ma': 36.29135563076694,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-29T09:00:00+07:00',
-        'open': 3318.945,
-        'high': 3320.445,
-        'low': 3317.53,
-        'close': 3318.955,
-        'volume': 9407.0,
-        'accumulation_distribution': 6812680.880378114,
-        'macd': -6.395879802516447,
-        'signal': -7.497607741205154,
-        'rsi': 44.65127945648274,
-        'rsi_based_ma': 36.3511811734406,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-29T10:00:00+07:00',
-        'open': 3318.985,
-        'high': 3318.985,
-        'low': 3311.29,
-        'close': 3312.655,
-        'volume': 9149.0,
-        'accumulation_distribution': 6806777.724432696,
-        'macd': -6.288400129398724,
-        'signal': -7.255766218843869,
-        'rsi': 39.51537698750421,
-        'rsi_based_ma': 36.573103644392646,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-29T11:00:00+07:00',
-        'open': 3312.6,
-        'high': 3317.54,
-        'low': 3309.11,
-        'close': 3316.535,
-        'volume': 7966.0,
-        'accumulation_distribution': 6812844.357884653,
-        'macd': -5.823014059242269,
-        'signal': -6.969215786923549,
-        'rsi': 43.80258961281724,
-        'rsi_based_ma': 38.05920522842187,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-29T12:00:00+07:00',
-        'open': 3316.54,
-        'high': 3320.19,
-        'low': 3314.365,
-        'close': 3319.975,
-        'volume': 9073.0,
-        'accumulation_distribution': 6821247.591361048,
-        'macd': -5.117620254313351,
-        'signal': -6.598896680401509,
-        'rsi': 47.36478584136492,
-        'rsi_based_ma': 39.35757288513587,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-29T13:00:00+07:00',
-        'open': 3320.02,
-        'high': 3322.4,
-        'low': 3316.31,
-        'close': 3317.12,
-        'volume': 18688.0,
-        'accumulation_distribution': 6807530.783479274,
-        'macd': -4.734390119348518,
-        'signal': -6.225995368190911,
-        'rsi': 44.82523747515152,
-        'rsi_based_ma': 40.0065037160421,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-29T14:00:00+07:00',
-        'open': 3317.075,
-        'high': 3318.815,
-        'low': 3311.34,
-        'close': 3317.175,
-        'volume': 17268.0,
-        'accumulation_distribution': 6817221.654382285,
-        'macd': -4.375797960964519,
-        'signal': -5.855955886745632,
-        'rsi': 44.88654302946518,
-        'rsi_based_ma': 40.753298928416605,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-29T15:00:00+07:00',
-        'open': 3317.185,
-        'high': 3330.1,
-        'low': 3316.81,
-        'close': 3326.435,
-        'volume': 15307.0,
-        'accumulation_distribution': 6824086.193133226,
-        'macd': -3.3062935866068983,
-        'signal': -5.346023426717886,
-        'rsi': 54.12799223233951,
-        'rsi_based_ma': 42.21170983009719,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-29T16:00:00+07:00',
-        'open': 3326.38,
-        'high': 3328.32,
-        'low': 3320.93,
-        'close': 3324.63,
-        'volume': 16686.0,
-        'accumulation_distribution': 6824108.772294255,
-        'macd': -2.574672853573702,
-        'signal': -4.791753312089049,
-        'rsi': 52.28751138278796,
-        'rsi_based_ma': 43.32489487763128,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-29T17:00:00+07:00',
-        'open': 3324.65,
-        'high': 3326.5,
-        'low': 3322.02,
-        'close': 3322.095,
-        'volume': 9004.0,
-        'accumulation_distribution': 6815406.24550854,
-        'macd': -2.1743469475950405,
-        'signal': -4.268272039190247,
-        'rsi': 49.730024030272375,
-        'rsi_based_ma': 44.01411150895063,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-29T18:00:00+07:00',
-        'open': 3322.14,
-        'high': 3322.245,
-        'low': 3315.0,
-        'close': 3315.335,
-        'volume': 14870.0,
-        'accumulation_distribution': 6801911.386985421,
-        'macd': -2.375181671428436,
-        'signal': -3.889653965637885,
-        'rsi': 43.6050317552675,
-        'rsi_based_ma': 44.393349415541856,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-29T19:00:00+07:00',
-        'open': 3315.33,
-        'high': 3324.675,
-        'low': 3315.275,
-        'close': 3323.35,
-        'volume': 20474.0,
-        'accumulation_distribution': 6816613.461453505,
-        'macd': -1.8660899972646805,
-        'signal': -3.484941171963244,
-        'rsi': 51.26869529349764,
-        'rsi_based_ma': 45.30667546879268,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-29T20:00:00+07:00',
-        'open': 3323.37,
-        'high': 3324.375,
-        'low': 3312.895,
-        'close': 3317.655,
-        'volume': 34334.0,
-        'accumulation_distribution': 6810751.5590144815,
-        'macd': -1.9002650104152965,
-        'signal': -3.1680059396536544,
-        'rsi': 46.43966392753121,
-        'rsi_based_ma': 45.97243106445173,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-29T21:00:00+07:00',
-        'open': 3317.555,
-        'high': 3329.745,
-        'low': 3311.995,
-        'close': 3328.935,
-        'volume': 36474.0,
-        'accumulation_distribution': 6843896.6643665945,
-        'macd': -1.0055558040753567,
-        'signal': -2.735515912537995,
-        'rsi': 55.400315696531095,
-        'rsi_based_ma': 47.32575739209856,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-29T22:00:00+07:00',
-        'open': 3328.99,
-        'high': 3334.27,
-        'low': 3319.705,
-        'close': 3320.695,
-        'volume': 27323.0,
-        'accumulation_distribution': 6820288.016580808,
-        'macd': -0.95043541957466,
-        'signal': -2.378499813945328,
-        'rsi': 48.95694115066773,
-        'rsi_based_ma': 47.6329991336915,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-29T23:00:00+07:00',
-        'open': 3320.77,
-        'high': 3324.81,
-        'low': 3319.09,
-        'close': 3323.28,
-        'volume': 15817.0,
-        'accumulation_distribution': 6827643.474622767,
-        'macd': -0.6902079340588898,
-        'signal': -2.04084143796804,
-        'rsi': 50.886765122704986,
-        'rsi_based_ma': 48.07839096699309,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-30T00:00:00+07:00',
-        'open': 3323.26,
-        'high': 3329.35,
-        'low': 3323.105,
-        'close': 3328.325,
-        'volume': 13099.0,
-        'accumulation_distribution': 6836442.562693223,
-        'macd': -0.076010241030417,
-        'signal': -1.6478751985805151,
-        'rsi': 54.50217042470063,
-        'rsi_based_ma': 49.14887621250712,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-30T01:00:00+07:00',
-        'open': 3328.34,
-        'high': 3330.89,
-        'low': 3325.355,
-        'close': 3325.825,
-        'volume': 10321.0,
-        'accumulation_distribution': 6827874.361247875,
-        'macd': 0.2066347918666906,
-        'signal': -1.276973200491074,
-        'rsi': 52.442008810207845,
-        'rsi_based_ma': 49.7659775837493,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-30T02:00:00+07:00',
-        'open': 3325.84,
-        'high': 3328.805,
-        'low': 3322.67,
-        'close': 3325.075,
-        'volume': 13014.0,
-        'accumulation_distribution': 6825063.676651297,
-        'macd': 0.3658964581895816,
-        'signal': -0.948399268754943,
-        'rsi': 51.80930392297027,
-        'rsi_based_ma': 50.08344316100683,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-30T03:00:00+07:00',
-        'open': 3325.105,
-        'high': 3326.875,
-        'low': 3324.785,
-        'close': 3326.67,
-        'volume': 4957.0,
-        'accumulation_distribution': 6829048.250813977,
-        'macd': 0.6137408240188051,
-        'signal': -0.6359712502001933,
-        'rsi': 53.10508528142796,
-        'rsi_based_ma': 50.67486086145514,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-30T05:00:00+07:00',
-        'open': 3327.68,
-        'high': 3329.17,
-        'low': 3325.965,
-        'close': 3327.69,
-        'volume': 1792.0,
-        'accumulation_distribution': 6829185.236773416,
-        'macd': 0.8822942066594806,
-        'signal': -0.3323181588282585,
-        'rsi': 53.9576939877442,
-        'rsi_based_ma': 51.32280021561793,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-30T06:00:00+07:00',
-        'open': 3327.7,
-        'high': 3328.385,
-        'low': 3326.25,
-        'close': 3327.56,
-        'volume': 2717.0,
-        'accumulation_distribution': 6829802.447546248,
-        'macd': 1.0722742733250925,
-        'signal': -0.0513996723975883,
-        'rsi': 53.82337950629968,
-        'rsi_based_ma': 51.30104216375794,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-30T07:00:00+07:00',
-        'open': 3327.57,
-        'high': 3333.765,
-        'low': 3327.33,
-        'close': 3330.305,
-        'volume': 8183.0,
-        'accumulation_distribution': 6829185.702402503,
-        'macd': 1.4278737640365762,
-        'signal': 0.2444550148892446,
-        'rsi': 56.29716883212944,
-        'rsi_based_ma': 51.58744626728234,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-30T08:00:00+07:00',
-        'open': 3330.205,
-        'high': 3333.355,
-        'low': 3321.795,
-        'close': 3323.255,
-        'volume': 17037.0,
-        'accumulation_distribution': 6816452.166070323,
-        'macd': 1.127812125545006,
-        'signal': 0.4211264370203968,
-        'rsi': 49.03191382201636,
-        'rsi_based_ma': 51.537581252406895,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-30T09:00:00+07:00',
-        'open': 3323.24,
-        'high': 3332.46,
-        'low': 3323.24,
-        'close': 3329.465,
-        'volume': 12511.0,
-        'accumulation_distribution': 6820835.086894619,
-        'macd': 1.3752531537861614,
-        'signal': 0.6119517803735498,
-        'rsi': 54.590886024064176,
-        'rsi_based_ma': 52.32228512874952,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-30T10:00:00+07:00',
-        'open': 3329.41,
-        'high': 3329.97,
-        'low': 3326.285,
-        'close': 3328.44,
-        'volume': 5433.0,
-        'accumulation_distribution': 6821756.559079152,
-        'macd': 1.4716784248721524,
-        'signal': 0.7838971092732703,
-        'rsi': 53.55265469692933,
-        'rsi_based_ma': 52.485425086137504,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-30T11:00:00+07:00',
-        'open': 3328.445,
-        'high': 3329.875,
-        'low': 3325.845,
-        'close': 3327.19,
-        'volume': 5534.0,
-        'accumulation_distribution': 6819916.469749128,
-        'macd': 1.43073892586699,
-        'signal': 0.9132654725920142,
-        'rsi': 52.247651455358735,
-        'rsi_based_ma': 52.90028133812518,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-30T12:00:00+07:00',
-        'open': 3327.195,
-        'high': 3330.77,
-        'low': 3324.56,
-        'close': 3324.96,
-        'volume': 9754.0,
-        'accumulation_distribution': 6811419.023694377,
-        'macd': 1.2044673648128992,
-        'signal': 0.9715058510361912,
-        'rsi': 49.91093598549404,
-        'rsi_based_ma': 52.50818278733682,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-30T13:00:00+07:00',
-        'open': 3324.965,
-        'high': 3327.66,
-        'low': 3323.15,
-        'close': 3327.345,
-        'volume': 14027.0,
-        'accumulation_distribution': 6823486.5979737565,
-        'macd': 1.2037193626788394,
-        'signal': 1.0179485533647208,
-        'rsi': 52.36471813732889,
-        'rsi_based_ma': 52.75159542924119,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-30T14:00:00+07:00',
-        'open': 3327.37,
-        'high': 3332.31,
-        'low': 3325.66,
-        'close': 3327.775,
-        'volume': 12410.0,
-        'accumulation_distribution': 6818970.477673005,
-        'macd': 1.2237177158481245,
-        'signal': 1.0591023858614017,
-        'rsi': 52.813541265064266,
-        'rsi_based_ma': 52.889222296552575,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-30T15:00:00+07:00',
-        'open': 3327.875,
-        'high': 3333.485,
-        'low': 3327.585,
-        'close': 3332.285,
-        'volume': 10621.0,
-        'accumulation_distribution': 6825271.070893344,
-        'macd': 1.585212520002642,
-        'signal': 1.1643244126896497,
-        'rsi': 57.352278984020245,
-        'rsi_based_ma': 53.09280147936112,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-30T16:00:00+07:00',
-        'open': 3332.24,
-        'high': 3334.09,
-        'low': 3329.425,
-        'close': 3331.335,
-        'volume': 9855.0,
-        'accumulation_distribution': 6823485.974430321,
-        'macd': 1.7745863691829982,
-        'signal': 1.2863768039883194,
-        'rsi': 56.12758991277314,
-        'rsi_based_ma': 53.356057272401486,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-30T17:00:00+07:00',
-        'open': 3331.255,
-        'high': 3333.085,
-        'low': 3326.725,
-        'close': 3328.515,
-        'volume': 15292.0,
-        'accumulation_distribution': 6816801.73543661,
-        'macd': 1.677775722595925,
-        'signal': 1.3646565877098404,
-        'rsi': 52.54098484442161,
-        'rsi_based_ma': 53.4083201953623,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-30T18:00:00+07:00',
-        'open': 3328.505,
-        'high': 3331.68,
-        'low': 3324.045,
-        'close': 3330.93,
-        'volume': 17701.0,
-        'accumulation_distribution': 6831025.132293192,
-        'macd': 1.7754565468071632,
-        'signal': 1.446816579529305,
-        'rsi': 55.18223806216136,
-        'rsi_based_ma': 53.55668825112897,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-30T19:00:00+07:00',
-        'open': 3330.94,
-        'high': 3331.965,
-        'low': 3310.815,
-        'close': 3313.38,
-        'volume': 28504.0,
-        'accumulation_distribution': 6809434.8684634045,
-        'macd': 0.4317539840462814,
-        'signal': 1.2438040604327003,
-        'rsi': 38.43984283441706,
-        'rsi_based_ma': 52.4482703116056,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-30T20:00:00+07:00',
-        'open': 3313.375,
-        'high': 3316.28,
-        'low': 3298.425,
-        'close': 3303.135,
-        'volume': 49047.0,
-        'accumulation_distribution': 6786264.247068837,
-        'macd': -1.443189664658803,
-        'signal': 0.7064053154143995,
-        'rsi': 32.28236153404961,
-        'rsi_based_ma': 50.90962617073059,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-30T21:00:00+07:00',
-        'open': 3303.12,
-        'high': 3308.455,
-        'low': 3301.355,
-        'close': 3302.205,
-        'volume': 32541.0,
-        'accumulation_distribution': 6761514.75411109,
-        'macd': -2.969904037123797,
-        'signal': -0.0288565550932398,
-        'rsi': 31.78463093530748,
-        'rsi_based_ma': 49.15873060667188,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-30T22:00:00+07:00',
-        'open': 3302.22,
-        'high': 3303.425,
-        'low': 3288.605,
-        'close': 3290.445,
-        'volume': 29216.0,
-        'accumulation_distribution': 6739553.469360753,
-        'macd': -5.070322374102034,
-        'signal': -1.0371497188949983,
-        'rsi': 26.26914230893001,
-        'rsi_based_ma': 47.53281835573714,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-30T23:00:00+07:00',
-        'open': 3290.45,
-        'high': 3298.69,
-        'low': 3290.02,
-        'close': 3298.175,
-        'volume': 16263.0,
-        'accumulation_distribution': 6753884.417457639,
-        'macd': -6.041529648098276,
-        'signal': -2.038025704735654,
-        'rsi': 34.335116928882414,
-        'rsi_based_ma': 46.085977706081295,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-31T00:00:00+07:00',
-        'open': 3298.2,
-        'high': 3302.58,
-        'low': 3297.81,
-        'close': 3302.485,
-        'volume': 16682.0,
-        'accumulation_distribution': 6769901.935277347,
-        'macd': -6.389780023473122,
-        'signal': -2.908376568483148,
-        'rsi': 38.382673047401184,
-        'rsi_based_ma': 45.00240758825787,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-31T01:00:00+07:00',
-        'open': 3302.47,
-        'high': 3305.19,
-        'low': 3279.78,
-        'close': 3280.39,
-        'volume': 48005.0,
-        'accumulation_distribution': 6724201.779826736,
-        'macd': -8.352371855764432,
-        'signal': -3.9971756259394047,
-        'rsi': 28.6373883389512,
-        'rsi_based_ma': 43.31596022280018,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-31T02:00:00+07:00',
-        'open': 3280.43,
-        'high': 3282.77,
-        'low': 3268.12,
-        'close': 3269.4,
-        'volume': 47744.0,
-        'accumulation_distribution': 6684800.758666328,
-        'macd': -10.671526461054782,
-        'signal': -5.3320457929624805,
-        'rsi': 25.208907618782447,
-        'rsi_based_ma': 41.55152962517792,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-31T03:00:00+07:00',
-        'open': 3269.405,
-        'high': 3276.435,
-        'low': 3268.94,
-        'close': 3275.29,
-        'volume': 10769.0,
-        'accumulation_distribution': 6692279.430447516,
-        'macd': -11.897057545415464,
-        'signal': -6.645048143453077,
-        'rsi': 30.042862778280323,
-        'rsi_based_ma': 39.95711138524588,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-31T05:00:00+07:00',
-        'open': 3277.29,
-        'high': 3279.97,
-        'low': 3276.285,
-        'close': 3278.915,
-        'volume': 3965.0,
-        'accumulation_distribution': 6693974.104803012,
-        'macd': -12.432478679368614,
-        'signal': -7.802534250636184,
-        'rsi': 32.91658828222684,
-        'rsi_based_ma': 38.535900457900354,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-31T06:00:00+07:00',
-        'open': 3278.91,
-        'high': 3285.91,
-        'low': 3277.74,
-        'close': 3285.41,
-        'volume': 5067.0,
-        'accumulation_distribution': 6698420.908964578,
-        'macd': -12.19216784495211,
-        'signal': -8.68046096949937,
-        'rsi': 37.843298733504696,
-        'rsi_based_ma': 37.14240186857781,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-31T07:00:00+07:00',
-        'open': 3285.405,
-        'high': 3288.485,
-        'low': 3282.875,
-        'close': 3286.475,
-        'volume': 11373.0,
-        'accumulation_distribution': 6701644.272600941,
-        'macd': -11.779990777019066,
-        'signal': -9.300366931003309,
-        'rsi': 38.63907128887532,
-        'rsi_based_ma': 35.893221966870826,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-31T08:00:00+07:00',
-        'open': 3286.48,
-        'high': 3293.99,
-        'low': 3285.04,
-        'close': 3293.86,
-        'volume': 16534.0,
-        'accumulation_distribution': 6717697.9552825065,
-        'macd': -10.733698307532904,
-        'signal': -9.587033206309227,
-        'rsi': 43.99363354316959,
-        'rsi_based_ma': 35.28269687392425,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-31T09:00:00+07:00',
-        'open': 3293.91,
-        'high': 3297.655,
-        'low': 3290.575,
-        'close': 3297.455,
-        'volume': 9768.0,
-        'accumulation_distribution': 6726914.090875726,
-        'macd': -9.504851520242935,
-        'signal': -9.570596869095969,
-        'rsi': 46.44368828064697,
-        'rsi_based_ma': 34.65851474667323,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-31T10:00:00+07:00',
-        'open': 3297.445,
-        'high': 3298.76,
-        'low': 3293.56,
-        'close': 3294.94,
-        'volume': 9138.0,
-        'accumulation_distribution': 6722626.260106496,
-        'macd': -8.634389205183652,
-        'signal': -9.383355336313503,
-        'rsi': 44.96183173288069,
-        'rsi_based_ma': 35.12437109656348,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-31T11:00:00+07:00',
-        'open': 3294.915,
-        'high': 3298.51,
-        'low': 3293.77,
-        'close': 3298.15,
-        'volume': 7068.0,
-        'accumulation_distribution': 6728620.63985333,
-        'macd': -7.597937087058199,
-        'signal': -9.026271686462444,
-        'rsi': 47.27418656174056,
-        'rsi_based_ma': 36.19521574139855,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-31T12:00:00+07:00',
-        'open': 3298.13,
-        'high': 3301.96,
-        'low': 3294.83,
-        'close': 3299.87,
-        'volume': 9167.0,
-        'accumulation_distribution': 6732413.437889796,
-        'macd': -6.562107796936743,
-        'signal': -8.533438908557304,
-        'rsi': 48.52219809134566,
-        'rsi_based_ma': 37.39075625254413,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-31T13:00:00+07:00',
-        'open': 3299.865,
-        'high': 3305.135,
-        'low': 3298.14,
-        'close': 3299.125,
-        'volume': 15329.0,
-        'accumulation_distribution': 6721401.540105664,
-        'macd': -5.735208976505874,
-        'signal': -7.973792922147018,
-        'rsi': 47.99231565618657,
-        'rsi_based_ma': 38.94241149163389,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-31T14:00:00+07:00',
-        'open': 3299.14,
-        'high': 3309.88,
-        'low': 3298.125,
-        'close': 3304.765,
-        'volume': 11746.0,
-        'accumulation_distribution': 6722925.372517403,
-        'macd': -4.572080738544173,
-        'signal': -7.293450485426449,
-        'rsi': 52.24412137159528,
-        'rsi_based_ma': 40.2216260946848,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-31T15:00:00+07:00',
-        'open': 3304.8,
-        'high': 3314.985,
-        'low': 3303.785,
-        'close': 3309.915,
-        'volume': 12172.0,
-        'accumulation_distribution': 6724077.365374546,
-        'macd': -3.1978682359986124,
-        'signal': -6.474334035540882,
-        'rsi': 55.79768213530027,
-        'rsi_based_ma': 41.46555531524903,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-31T16:00:00+07:00',
-        'open': 3309.92,
-        'high': 3313.13,
-        'low': 3304.97,
-        'close': 3306.79,
-        'volume': 13024.0,
-        'accumulation_distribution': 6716863.090864742,
-        'macd': -2.33405082533136,
-        'signal': -5.646277393498978,
-        'rsi': 53.21030275818969,
-        'rsi_based_ma': 43.22076348805177,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-31T17:00:00+07:00',
-        'open': 3306.755,
-        'high': 3308.24,
-        'low': 3293.785,
-        'close': 3296.35,
-        'volume': 17665.0,
-        'accumulation_distribution': 6705467.302210297,
-        'macd': -2.463492445745487,
-        'signal': -5.00972040394828,
-        'rsi': 45.602372062943765,
-        'rsi_based_ma': 44.67743951977759,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-31T18:00:00+07:00',
-        'open': 3296.36,
-        'high': 3307.875,
-        'low': 3295.31,
-        'close': 3306.275,
-        'volume': 20664.0,
-        'accumulation_distribution': 6720868.683825897,
-        'macd': -1.7450949409899297,
-        'signal': -4.35679531135661,
-        'rsi': 52.5483979483551,
-        'rsi_based_ma': 46.284977746211496,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-31T19:00:00+07:00',
-        'open': 3306.27,
-        'high': 3311.285,
-        'low': 3304.08,
-        'close': 3307.685,
-        'volume': 21981.0,
-        'accumulation_distribution': 6720883.937816182,
-        'macd': -1.0498821387914177,
-        'signal': -3.695412676843572,
-        'rsi': 53.45763713245367,
-        'rsi_based_ma': 47.7521955212277,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-31T20:00:00+07:00',
-        'open': 3307.69,
-        'high': 3310.455,
-        'low': 3300.72,
-        'close': 3301.39,
-        'volume': 34276.0,
-        'accumulation_distribution': 6691325.949115617,
-        'macd': -0.995400517253529,
-        'signal': -3.155410244925563,
-        'rsi': 48.94817187318579,
-        'rsi_based_ma': 48.54540074549063,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-31T21:00:00+07:00',
-        'open': 3301.37,
-        'high': 3303.31,
-        'low': 3291.425,
-        'close': 3296.19,
-        'volume': 43655.0,
-        'accumulation_distribution': 6682675.757697864,
-        'macd': -1.3561867053103924,
-        'signal': -2.795565537002529,
-        'rsi': 45.53138097090843,
-        'rsi_based_ma': 49.03770857992157,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-31T22:00:00+07:00',
-        'open': 3296.185,
-        'high': 3299.145,
-        'low': 3291.385,
-        'close': 3295.505,
-        'volume': 32034.0,
-        'accumulation_distribution': 6684657.242233946,
-        'macd': -1.6780427021608375,
-        'signal': -2.5720609700341908,
-        'rsi': 45.08491832959721,
-        'rsi_based_ma': 49.11565749323783,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-07-31T23:00:00+07:00',
-        'open': 3295.525,
-        'high': 3297.475,
-        'low': 3289.7,
-        'close': 3295.14,
-        'volume': 27246.0,
-        'accumulation_distribution': 6695538.120690538,
-        'macd': -1.940202896819756,
-        'signal': -2.445689355391304,
-        'rsi': 44.832654068378574,
-        'rsi_based_ma': 49.00058362093294,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-01T00:00:00+07:00',
-        'open': 3295.08,
-        'high': 3298.495,
-        'low': 3294.175,
-        'close': 3294.995,
-        'volume': 22280.0,
-        'accumulation_distribution': 6681716.268838683,
-        'macd': -2.1350554379700952,
-        'signal': -2.383562571907062,
-        'rsi': 44.72559083683261,
-        'rsi_based_ma': 48.98370927121522,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-01T01:00:00+07:00',
-        'open': 3295.02,
-        'high': 3297.22,
-        'low': 3292.895,
-        'close': 3295.745,
-        'volume': 19741.0,
-        'accumulation_distribution': 6687992.309301111,
-        'macd': -2.203557509379152,
-        'signal': -2.34756155940148,
-        'rsi': 45.451210363662064,
-        'rsi_based_ma': 48.85349668563818,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-01T02:00:00+07:00',
-        'open': 3295.69,
-        'high': 3296.385,
-        'low': 3290.575,
-        'close': 3291.025,
-        'volume': 18316.0,
-        'accumulation_distribution': 6672513.555428479,
-        'macd': -2.6086396734817754,
-        'signal': -2.399777182217539,
-        'rsi': 41.73774598335036,
-        'rsi_based_ma': 48.36889296363852,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-01T03:00:00+07:00',
-        'open': 3290.995,
-        'high': 3293.825,
-        'low': 3289.91,
-        'close': 3290.12,
-        'volume': 4698.0,
-        'accumulation_distribution': 6668319.555428479,
-        'macd': -2.968477384120888,
-        'signal': -2.513517222598209,
-        'rsi': 41.04529591175615,
-        'rsi_based_ma': 47.87267726760778,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-01T05:00:00+07:00',
-        'open': 3291.675,
-        'high': 3295.33,
-        'low': 3290.19,
-        'close': 3295.105,
-        'volume': 1673.0,
-        'accumulation_distribution': 6669846.086556884,
-        'macd': -2.818908896625544,
-        'signal': -2.574595557403676,
-        'rsi': 46.32747107054031,
-        'rsi_based_ma': 47.450059388961,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-01T06:00:00+07:00',
-        'open': 3295.165,
-        'high': 3295.165,
-        'low': 3288.125,
-        'close': 3288.645,
-        'volume': 4042.0,
-        'accumulation_distribution': 6666401.200193247,
-        'macd': -3.184928926119482,
-        'signal': -2.6966622311468376,
-        'rsi': 41.17853747171269,
-        'rsi_based_ma': 46.40583477013331,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-01T07:00:00+07:00',
-        'open': 3288.585,
-        'high': 3293.945,
-        'low': 3286.61,
-        'close': 3290.265,
-        'volume': 6766.0,
-        'accumulation_distribution': 6666378.139525216,
-        'macd': -3.306170499926793,
-        'signal': -2.8185638849028285,
-        'rsi': 42.89264446717688,
-        'rsi_based_ma': 45.66885917791812,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-01T08:00:00+07:00',
-        'open': 3290.21,
-        'high': 3293.53,
-        'low': 3281.745,
-        'close': 3283.855,
-        'volume': 11263.0,
-        'accumulation_distribution': 6659148.220560431,
-        'macd': -3.874822211600076,
-        'signal': -3.029815550242278,
-        'rsi': 38.154817575995686,
-        'rsi_based_ma': 45.136891000278965,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-01T09:00:00+07:00',
-        'open': 3283.79,
-        'high': 3292.425,
-        'low': 3283.465,
-        'close': 3291.785,
-        'volume': 10139.0,
-        'accumulation_distribution': 6667838.791989001,
-        'macd': -3.643596946254547,
-        'signal': -3.152571829444732,
-        'rsi': 46.088544754740425,
-        'rsi_based_ma': 44.67547291502077,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-01T10:00:00+07:00',
-        'open': 3291.77,
-        'high': 3297.19,
-        'low': 3290.655,
-        'close': 3291.505,
-        'volume': 6051.0,
-        'accumulation_distribution': 6663361.885332536,
-        'macd': -3.443251260343004,
-        'signal': -3.2107077156243866,
-        'rsi': 45.86481663325589,
-        'rsi_based_ma': 44.13312859364951,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-01T11:00:00+07:00',
-        'open': 3291.52,
-        'high': 3295.535,
-        'low': 3290.115,
-        'close': 3292.19,
-        'volume': 5350.0,
-        'accumulation_distribution': 6662108.287546558,
-        'macd': -3.192402061860776,
-        'signal': -3.2070465848716645,
-        'rsi': 46.54842180043708,
-        'rsi_based_ma': 43.96171787416745,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-01T12:00:00+07:00',
-        'open': 3292.2,
-        'high': 3300.54,
-        'low': 3291.835,
-        'close': 3296.695,
-        'volume': 7566.0,
-        'accumulation_distribution': 6662990.480539092,
-        'macd': -2.600113919895193,
-        'signal': -3.08566005187637,
-        'rsi': 50.93648886298761,
-        'rsi_based_ma': 44.34779700931596,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-01T13:00:00+07:00',
-        'open': 3296.695,
-        'high': 3297.7,
-        'low': 3290.605,
-        'close': 3292.515,
-        'volume': 11737.0,
-        'accumulation_distribution': 6657572.767360797,
-        'macd': -2.439886869410202,
-        'signal': -2.9565054153831367,
-        'rsi': 47.07488137649034,
-        'rsi_based_ma': 44.48993722695119,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-01T14:00:00+07:00',
-        'open': 3292.51,
-        'high': 3293.535,
-        'low': 3285.265,
-        'close': 3286.84,
-        'volume': 9059.0,
-        'accumulation_distribution': 6651964.293358379,
-        'macd': -2.7392544296353663,
-        'signal': -2.9130552182335827,
-        'rsi': 42.377569119865925,
-        'rsi_based_ma': 44.31457401634314,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-01T15:00:00+07:00',
-        'open': 3286.695,
-        'high': 3294.495,
-        'low': 3285.33,
-        'close': 3294.36,
-        'volume': 9195.0,
-        'accumulation_distribution': 6660888.409561326,
-        'macd': -2.3426990488474075,
-        'signal': -2.798983984356348,
-        'rsi': 49.56000691326725,
-        'rsi_based_ma': 44.65988945037418,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-01T16:00:00+07:00',
-        'open': 3294.375,
-        'high': 3296.44,
-        'low': 3292.825,
-        'close': 3294.555,
-        'volume': 9470.0,
-        'accumulation_distribution': 6660482.365301298,
-        'macd': -1.989754530579376,
-        'signal': -2.6371380936009534,
-        'rsi': 49.73497050821583,
-        'rsi_based_ma': 44.96587231784231,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-01T17:00:00+07:00',
-        'open': 3294.485,
-        'high': 3303.18,
-        'low': 3293.32,
-        'close': 3298.34,
-        'volume': 9508.0,
-        'accumulation_distribution': 6660655.93933781,
-        'macd': -1.3886184603625225,
-        'signal': -2.387434166953267,
-        'rsi': 53.13320895807034,
-        'rsi_based_ma': 45.77983395889374,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-01T18:00:00+07:00',
-        'open': 3298.36,
-        'high': 3301.5,
-        'low': 3297.03,
-        'close': 3300.495,
-        'volume': 12263.0,
-        'accumulation_distribution': 6667404.70443848,
-        'macd': -0.7299093630663265,
-        'signal': -2.055929206175879,
-        'rsi': 54.99864173758929,
-        'rsi_based_ma': 46.77650151788183,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-01T19:00:00+07:00',
-        'open': 3300.51,
-        'high': 3345.275,
-        'low': 3297.52,
-        'close': 3341.26,
-        'volume': 47066.0,
-        'accumulation_distribution': 6706556.559741589,
-        'macd': 3.0464001503492,
-        'signal': -1.035463334870863,
-        'rsi': 75.14900866737906,
-        'rsi_based_ma': 48.83518277479888,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-01T20:00:00+07:00',
-        'open': 3341.275,
-        'high': 3354.875,
-        'low': 3338.89,
-        'close': 3342.325,
-        'volume': 57422.0,
-        'accumulation_distribution': 6673813.267279906,
-        'macd': 6.055287659146416,
-        'signal': 0.3826868639325929,
-        'rsi': 75.45818824657681,
-        'rsi_based_ma': 51.28372925871775,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-01T21:00:00+07:00',
-        'open': 3342.495,
-        'high': 3355.182,
-        'low': 3341.33,
-        'close': 3345.88,
-        'volume': 48116.0,
-        'accumulation_distribution': 6657306.825466451,
-        'macd': 8.627261773911869,
-        'signal': 2.0316018459284484,
-        'rsi': 76.5088109107168,
-        'rsi_based_ma': 53.68488400468488,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-01T22:00:00+07:00',
-        'open': 3345.87,
-        'high': 3351.295,
-        'low': 3341.615,
-        'close': 3348.635,
-        'volume': 32476.0,
-        'accumulation_distribution': 6671934.445301164,
-        'macd': 10.763796914837258,
-        'signal': 3.7780408597102095,
-        'rsi': 77.31914885342881,
-        'rsi_based_ma': 56.48233623878725,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-01T23:00:00+07:00',
-        'open': 3348.63,
-        'high': 3349.53,
-        'low': 3340.63,
-        'close': 3347.4,
-        'volume': 22951.0,
-        'accumulation_distribution': 6683899.910469702,
-        'macd': 12.21653758747334,
-        'signal': 5.465740205262836,
-        'rsi': 76.05264781432813,
-        'rsi_based_ma': 58.622629314472086,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-02T00:00:00+07:00',
-        'open': 3347.31,
-        'high': 3349.49,
-        'low': 3345.715,
-        'close': 3348.25,
-        'volume': 21110.0,
-        'accumulation_distribution': 6691141.619078975,
-        'macd': 13.283311190393306,
-        'signal': 7.02925440228893,
-        'rsi': 76.3399054706278,
-        'rsi_based_ma': 60.79942137428437,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-02T01:00:00+07:00',
-        'open': 3348.245,
-        'high': 3351.325,
-        'low': 3345.905,
-        'close': 3347.665,
-        'volume': 18263.0,
-        'accumulation_distribution': 6684739.460407387,
-        'macd': 13.92105904236314,
-        'signal': 8.407615330303772,
-        'rsi': 75.66717168927227,
-        'rsi_based_ma': 62.87933208062974,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-02T02:00:00+07:00',
-        'open': 3347.67,
-        'high': 3361.335,
-        'low': 3347.66,
-        'close': 3357.185,
-        'volume': 23220.0,
-        'accumulation_distribution': 6693866.151449434,
-        'macd': 15.021504692283996,
-        'signal': 9.730393202699815,
-        'rsi': 78.92238109778037,
-        'rsi_based_ma': 64.87832438311493,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-02T03:00:00+07:00',
-        'open': 3357.2,
-        'high': 3363.6,
-        'low': 3357.06,
-        'close': 3362.895,
-        'volume': 6081.0,
-        'accumulation_distribution': 6698636.110165031,
-        'macd': 16.167990546868168,
-        'signal': 11.017912671533487,
-        'rsi': 80.59885765739051,
-        'rsi_based_ma': 67.27289411746494,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-04T05:00:00+07:00',
-        'open': 3364.795,
-        'high': 3364.815,
-        'low': 3357.815,
-        'close': 3359.34,
-        'volume': 6586.0,
-        'accumulation_distribution': 6694919.724450745,
-        'macd': 16.598394101919894,
-        'signal': 12.134008957610767,
-        'rsi': 76.51821158378144,
-        'rsi_based_ma': 69.71151143631606,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-04T06:00:00+07:00',
-        'open': 3359.425,
-        'high': 3362.24,
-        'low': 3354.68,
-        'close': 3362.215,
-        'volume': 4426.0,
-        'accumulation_distribution': 6699316.451963972,
-        'macd': 16.975794105428577,
-        'signal': 13.10236598717433,
-        'rsi': 77.5098980661443,
-        'rsi_based_ma': 71.70793223295013,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-04T07:00:00+07:00',
-        'open': 3362.205,
-        'high': 3362.5,
-        'low': 3350.2,
-        'close': 3352.265,
-        'volume': 8181.0,
-        'accumulation_distribution': 6693882.405622509,
-        'macd': 16.284289332047592,
-        'signal': 13.738750656148984,
-        'rsi': 66.96880416693773,
-        'rsi_based_ma': 72.93892035143027,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-04T08:00:00+07:00',
-        'open': 3352.2,
-        'high': 3353.75,
-        'low': 3345.005,
-        'close': 3352.355,
-        'volume': 10280.0,
-        'accumulation_distribution': 6700882.680065048,
-        'macd': 15.564115628320906,
-        'signal': 14.103823650583369,
-        'rsi': 67.01250422117491,
-        'rsi_based_ma': 73.93029858450916,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-04T09:00:00+07:00',
-        'open': 3352.335,
-        'high': 3355.4,
-        'low': 3350.335,
-        'close': 3354.4,
-        'volume': 6948.0,
-        'accumulation_distribution': 6705087.146007792,
-        'macd': 14.985642035620003,
-        'signal': 14.280187327590696,
-        'rsi': 68.04694481499617,
-        'rsi_based_ma': 74.86232023289537,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-04T10:00:00+07:00',
-        'open': 3354.55,
-        'high': 3360.925,
-        'low': 3354.43,
-        'close': 3360.35,
-        'volume': 6297.0,
-        'accumulation_distribution': 6710269.203744512,
-        'macd': 14.836289311587734,
-        'signal': 14.391407724390104,
-        'rsi': 70.90567297719319,
-        'rsi_based_ma': 74.55922482645352,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-04T11:00:00+07:00',
-        'open': 3360.335,
-        'high': 3362.25,
-        'low': 3358.77,
-        'close': 3359.0,
-        'volume': 4641.0,
-        'accumulation_distribution': 6706241.669261754,
-        'macd': 14.4425082393509,
-        'signal': 14.401627827382262,
-        'rsi': 69.38879275676607,
-        'rsi_based_ma': 74.12569657718133,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-04T12:00:00+07:00',
-        'open': 3359.015,
-        'high': 3361.02,
-        'low': 3355.54,
-        'close': 3357.68,
-        'volume': 4672.0,
-        'accumulation_distribution': 6705218.603568323,
-        'macd': 13.864104171480449,
-        'signal': 14.2941230962019,
-        'rsi': 67.86013635627731,
-        'rsi_based_ma': 73.50793410900708,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-04T13:00:00+07:00',
-        'open': 3357.695,
-        'high': 3362.705,
-        'low': 3353.57,
-        'close': 3362.62,
-        'volume': 12001.0,
-        'accumulation_distribution': 6716996.268045608,
-        'macd': 13.64701717618027,
-        'signal': 14.164701912197572,
-        'rsi': 70.48108570827195,
-        'rsi_based_ma': 73.01950102721015,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-04T14:00:00+07:00',
-        'open': 3362.64,
-        'high': 3362.64,
-        'low': 3351.775,
-        'close': 3355.905,
-        'volume': 13229.0,
-        'accumulation_distribution': 6713824.473752005,
-        'macd': 12.785743693524635,
-        'signal': 13.888910268462986,
-        'rsi': 62.96460057459169,
-        'rsi_based_ma': 72.08464051008613,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-04T15:00:00+07:00',
-        'open': 3355.985,
-        'high': 3359.93,
-        'low': 3354.09,
-        'close': 3358.605,
-        'volume': 10258.0,
-        'accumulation_distribution': 6719427.73060132,
-        'macd': 12.180634911460857,
-        'signal': 13.54725519706256,
-        'rsi': 64.59936687768,
-        'rsi_based_ma': 71.24603061058986,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-04T16:00:00+07:00',
-        'open': 3358.62,
-        'high': 3361.86,
-        'low': 3356.88,
-        'close': 3358.045,
-        'volume': 12083.0,
-        'accumulation_distribution': 6712998.021765978,
-        'macd': 11.523063815411206,
-        'signal': 13.14241692073229,
-        'rsi': 63.96867829646019,
-        'rsi_based_ma': 70.4104239396747,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-04T17:00:00+07:00',
-        'open': 3358.05,
-        'high': 3358.835,
-        'low': 3352.89,
-        'close': 3357.965,
-        'volume': 10542.0,
-        'accumulation_distribution': 6720454.558351344,
-        'macd': 10.870174052803575,
-        'signal': 12.687968347146548,
-        'rsi': 63.87274068509356,
-        'rsi_based_ma': 69.33544962448279,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-04T18:00:00+07:00',
-        'open': 3358.0,
-        'high': 3370.785,
-        'low': 3357.84,
-        'close': 3370.41,
-        'volume': 14122.0,
-        'accumulation_distribution': 6733758.365999085,
-        'macd': 11.22753763990204,
-        'signal': 12.395882205697646,
-        'rsi': 71.12713290713921,
-        'rsi_based_ma': 68.6588978566077,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-04T19:00:00+07:00',
-        'open': 3370.57,
-        'high': 3371.595,
-        'low': 3361.175,
-        'close': 3367.815,
-        'volume': 19939.0,
-        'accumulation_distribution': 6739231.066574901,
-        'macd': 11.172565662388024,
-        'signal': 12.151218897035722,
-        'rsi': 68.05829313443174,
-        'rsi_based_ma': 68.05461796736843,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-04T20:00:00+07:00',
-        'open': 3367.81,
-        'high': 3385.535,
-        'low': 3367.075,
-        'close': 3383.315,
-        'volume': 34255.0,
-        'accumulation_distribution': 6765247.052490396,
-        'macd': 12.238641000091777,
-        'signal': 12.168703317646932,
-        'rsi': 74.99739409162447,
-        'rsi_based_ma': 67.87515339775987,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-04T21:00:00+07:00',
-        'open': 3383.355,
-        'high': 3384.695,
-        'low': 3371.91,
-        'close': 3374.035,
-        'volume': 28351.0,
-        'accumulation_distribution': 6746320.514750857,
-        'macd': 12.1941286179499,
-        'signal': 12.173788377707528,
-        'rsi': 65.7831313791803,
-        'rsi_based_ma': 67.79046248434862,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-04T22:00:00+07:00',
-        'open': 3374.02,
-        'high': 3376.17,
-        'low': 3370.82,
-        'close': 3374.37,
-        'volume': 20408.0,
-        'accumulation_distribution': 6752996.028769547,
-        'macd': 12.04701346250613,
-        'signal': 12.148433394667247,
-        'rsi': 65.94578614409444,
-        'rsi_based_ma': 67.71426833598574,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-04T23:00:00+07:00',
-        'open': 3374.365,
-        'high': 3378.24,
-        'low': 3370.625,
-        'close': 3370.97,
-        'volume': 17915.0,
-        'accumulation_distribution': 6736704.318329625,
-        'macd': 11.523239326902058,
-        'signal': 12.023394581114207,
-        'rsi': 62.68866192804613,
-        'rsi_based_ma': 67.33153384406073,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-05T00:00:00+07:00',
-        'open': 3370.965,
-        'high': 3374.415,
-        'low': 3370.705,
-        'close': 3374.09,
-        'volume': 12818.0,
-        'accumulation_distribution': 6747276.577089734,
-        'macd': 11.2304448978457,
-        'signal': 11.864804644460508,
-        'rsi': 64.42506958093347,
-        'rsi_based_ma': 66.86863360147075,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-05T01:00:00+07:00',
-        'open': 3374.095,
-        'high': 3376.915,
-        'low': 3373.32,
-        'close': 3375.835,
-        'volume': 11989.0,
-        'accumulation_distribution': 6752062.172360945,
-        'macd': 11.012267554307527,
-        'signal': 11.694297226429912,
-        'rsi': 65.39507530320301,
-        'rsi_based_ma': 66.58336806907339,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-05T02:00:00+07:00',
-        'open': 3375.845,
-        'high': 3377.205,
-        'low': 3374.58,
-        'close': 3376.145,
-        'volume': 9517.0,
-        'accumulation_distribution': 6753893.061884754,
-        'macd': 10.740564307326622,
-        'signal': 11.503550642609254,
-        'rsi': 65.57465592563081,
-        'rsi_based_ma': 66.42011946688436,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-05T03:00:00+07:00',
-        'open': 3376.09,
-        'high': 3377.045,
-        'low': 3373.405,
-        'close': 3373.635,
-        'volume': 2732.0,
-        'accumulation_distribution': 6751506.314632007,
-        'macd': 10.205063879551744,
-        'signal': 11.243853289997752,
-        'rsi': 62.735860265447975,
-        'rsi_based_ma': 65.86688907811121,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-05T05:00:00+07:00',
-        'open': 3376.195,
-        'high': 3376.52,
-        'low': 3373.76,
-        'close': 3374.86,
-        'volume': 1691.0,
-        'accumulation_distribution': 6751163.213182732,
-        'macd': 9.766936035801336,
-        'signal': 10.948469839158468,
-        'rsi': 63.56488092953224,
-        'rsi_based_ma': 65.90976624632125,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-05T06:00:00+07:00',
-        'open': 3374.825,
-        'high': 3379.785,
-        'low': 3374.825,
-        'close': 3377.385,
-        'volume': 3661.0,
-        'accumulation_distribution': 6751281.309956926,
-        'macd': 9.513793867212826,
-        'signal': 10.66153464476934,
-        'rsi': 65.27950960960257,
-        'rsi_based_ma': 65.95834787003001,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-05T07:00:00+07:00',
-        'open': 3377.4,
-        'high': 3381.46,
-        'low': 3375.925,
-        'close': 3379.875,
-        'volume': 5499.0,
-        'accumulation_distribution': 6753630.927843105,
-        'macd': 9.405676283649882,
-        'signal': 10.410362972545448,
-        'rsi': 66.93215048892256,
-        'rsi_based_ma': 66.17002445520589,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-05T08:00:00+07:00',
-        'open': 3379.9,
-        'high': 3382.37,
-        'low': 3377.875,
-        'close': 3379.1,
-        'volume': 8298.0,
-        'accumulation_distribution': 6749855.753204618,
-        'macd': 9.151958219221342,
-        'signal': 10.158682021880626,
-        'rsi': 65.88105963946984,
-        'rsi_based_ma': 66.31347580908991,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-05T09:00:00+07:00',
-        'open': 3379.055,
-        'high': 3381.405,
-        'low': 3373.71,
-        'close': 3373.71,
-        'volume': 7097.0,
-        'accumulation_distribution': 6742758.753204618,
-        'macd': 8.4189089297779,
-        'signal': 9.81072740346008,
-        'rsi': 58.947694871213855,
-        'rsi_based_ma': 65.44351594938095,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-05T10:00:00+07:00',
-        'open': 3373.695,
-        'high': 3375.515,
-        'low': 3372.145,
-        'close': 3372.2,
-        'volume': 4442.0,
-        'accumulation_distribution': 6738461.74430254,
-        'macd': 7.628184740843153,
-        'signal': 9.374218870936696,
-        'rsi': 57.13364885183476,
-        'rsi_based_ma': 64.66318421490975,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-05T11:00:00+07:00',
-        'open': 3372.17,
-        'high': 3373.255,
-        'low': 3371.025,
-        'close': 3371.27,
-        'volume': 2745.0,
-        'accumulation_distribution': 6736319.905737517,
-        'macd': 6.847552572978202,
-        'signal': 8.868885611344997,
-        'rsi': 55.99079991114034,
-        'rsi_based_ma': 63.30557034487517,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-05T12:00:00+07:00',
-        'open': 3371.21,
-        'high': 3374.18,
-        'low': 3367.765,
-        'close': 3374.14,
-        'volume': 8335.0,
-        'accumulation_distribution': 6744550.96185599,
-        'macd': 6.386857255443374,
-        'signal': 8.372479940164672,
-        'rsi': 58.73409114071129,
-        'rsi_based_ma': 62.80206747069881,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-05T13:00:00+07:00',
-        'open': 3374.1,
-        'high': 3374.195,
-        'low': 3365.79,
-        'close': 3366.285,
-        'volume': 9497.0,
-        'accumulation_distribution': 6736172.585294419,
-        'macd': 5.326519245916643,
-        'signal': 7.763287801315066,
-        'rsi': 49.61785791802798,
-        'rsi_based_ma': 61.63578688312264,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-05T14:00:00+07:00',
-        'open': 3366.275,
-        'high': 3375.51,
-        'low': 3366.16,
-        'close': 3373.71,
-        'volume': 14881.0,
-        'accumulation_distribution': 6745324.002406718,
-        'macd': 5.027376711434044,
-        'signal': 7.216105583338861,
-        'rsi': 56.49214683024699,
-        'rsi_based_ma': 61.19317866185126,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-05T15:00:00+07:00',
-        'open': 3373.71,
-        'high': 3374.66,
-        'low': 3366.09,
-        'close': 3366.13,
-        'volume': 11961.0,
-        'accumulation_distribution': 6733474.65701582,
-        'macd': 4.131041372891559,
-        'signal': 6.599092741249401,
-        'rsi': 49.12335033858463,
-        'rsi_based_ma': 60.1001987159692,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-05T16:00:00+07:00',
-        'open': 3366.12,
-        'high': 3366.32,
-        'low': 3358.955,
-        'close': 3359.66,
-        'volume': 12431.0,
-        'accumulation_distribution': 6723423.522596268,
-        'macd': 2.865581590581769,
-        'signal': 5.852390511115875,
-        'rsi': 43.86395270838001,
-        'rsi_based_ma': 58.56226138776756,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-05T17:00:00+07:00',
-        'open': 3359.68,
-        'high': 3361.79,
-        'low': 3353.035,
-        'close': 3353.225,
-        'volume': 12566.0,
-        'accumulation_distribution': 6711402.934360975,
-        'macd': 1.3281349623835013,
-        'signal': 4.9475394013694,
-        'rsi': 39.35126128071071,
-        'rsi_based_ma': 56.68916177027327,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-05T18:00:00+07:00',
-        'open': 3353.19,
-        'high': 3354.465,
-        'low': 3349.89,
-        'close': 3351.455,
-        'volume': 12640.0,
-        'accumulation_distribution': 6707410.6283500455,
-        'macd': -0.0327492615597293,
-        'signal': 3.951481668783574,
-        'rsi': 38.1875140533789,
-        'rsi_based_ma': 54.93570846941119,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-05T19:00:00+07:00',
-        'open': 3351.435,
-        'high': 3367.005,
-        'low': 3349.97,
-        'close': 3366.22,
-        'volume': 19288.0,
-        'accumulation_distribution': 6724920.9846752575,
-        'macd': 0.079238873659051,
-        'signal': 3.177033109758669,
-        'rsi': 51.16229697233104,
-        'rsi_based_ma': 54.049809615325394,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-05T20:00:00+07:00',
-        'open': 3366.225,
-        'high': 3379.825,
-        'low': 3365.955,
-        'close': 3373.66,
-        'volume': 25668.0,
-        'accumulation_distribution': 6727770.928438776,
-        'macd': 0.7595801320367173,
-        'signal': 2.693542514214279,
-        'rsi': 56.15636662600614,
-        'rsi_based_ma': 53.39815654506851,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-05T21:00:00+07:00',
-        'open': 3374.2,
-        'high': 3386.66,
-        'low': 3370.625,
-        'close': 3385.29,
-        'volume': 40272.0,
-        'accumulation_distribution': 6761161.401778346,
-        'macd': 2.21170413638356,
-        'signal': 2.5971748386481357,
-        'rsi': 62.59533886643655,
-        'rsi_based_ma': 53.08838428631951,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-05T22:00:00+07:00',
-        'open': 3385.285,
-        'high': 3390.245,
-        'low': 3382.32,
-        'close': 3389.555,
-        'volume': 19326.0,
-        'accumulation_distribution': 6777122.117235758,
-        'macd': 3.664431443078684,
-        'signal': 2.810626159534245,
-        'rsi': 64.64590483752326,
-        'rsi_based_ma': 53.00015894332332,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-05T23:00:00+07:00',
-        'open': 3389.565,
-        'high': 3390.6,
-        'low': 3377.005,
-        'close': 3382.11,
-        'volume': 15152.0,
-        'accumulation_distribution': 6773349.441987505,
-        'macd': 4.166945071479404,
-        'signal': 3.0818899419232766,
-        'rsi': 58.60612159030828,
-        'rsi_based_ma': 52.97576085183006,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-06T00:00:00+07:00',
-        'open': 3382.14,
-        'high': 3382.915,
-        'low': 3379.035,
-        'close': 3380.205,
-        'volume': 13404.0,
-        'accumulation_distribution': 6768029.297657609,
-        'macd': 4.361199964710977,
-        'signal': 3.3377519464808167,
-        'rsi': 57.135168548261184,
-        'rsi_based_ma': 52.975869401574805,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-06T01:00:00+07:00',
-        'open': 3380.21,
-        'high': 3381.27,
-        'low': 3378.545,
-        'close': 3380.13,
-        'volume': 10532.0,
-        'accumulation_distribution': 6769749.202244766,
-        'macd': 4.457710778898672,
-        'signal': 3.561743712964388,
-        'rsi': 57.07443223957684,
-        'rsi_based_ma': 53.053271710748845,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-06T02:00:00+07:00',
-        'open': 3380.125,
-        'high': 3381.455,
-        'low': 3378.265,
-        'close': 3379.135,
-        'volume': 9740.0,
-        'accumulation_distribution': 6765321.929517495,
-        'macd': 4.403151322448593,
-        'signal': 3.730025234861229,
-        'rsi': 56.22057228950955,
-        'rsi_based_ma': 52.87373464994872,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-06T03:00:00+07:00',
-        'open': 3379.13,
-        'high': 3381.125,
-        'low': 3378.56,
-        'close': 3380.96,
-        'volume': 2107.0,
-        'accumulation_distribution': 6767157.853494104,
-        'macd': 4.455810992495572,
-        'signal': 3.8751823863880976,
-        'rsi': 57.47715710383054,
-        'rsi_based_ma': 53.43511316322033,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-06T05:00:00+07:00',
-        'open': 3381.475,
-        'high': 3381.505,
-        'low': 3378.245,
-        'close': 3379.83,
-        'volume': 1614.0,
-        'accumulation_distribution': 6767113.295211895,
-        'macd': 4.356147645751662,
-        'signal': 3.9713754382608095,
-        'rsi': 56.39775367987208,
-        'rsi_based_ma': 53.42837079533641,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-06T06:00:00+07:00',
-        'open': 3379.815,
-        'high': 3384.09,
-        'low': 3379.14,
-        'close': 3383.345,
-        'volume': 3452.0,
-        'accumulation_distribution': 6769526.208343208,
-        'macd': 4.508819979262626,
-        'signal': 4.078864346461174,
-        'rsi': 58.97842341698055,
-        'rsi_based_ma': 54.1323045866504,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-06T07:00:00+07:00',
-        'open': 3383.38,
-        'high': 3385.365,
-        'low': 3380.945,
-        'close': 3383.505,
-        'volume': 6886.0,
-        'accumulation_distribution': 6770616.751329633,
-        'macd': 4.58981602427275,
-        'signal': 4.181054682023489,
-        'rsi': 59.09709781168166,
-        'rsi_based_ma': 55.22038637974338,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-06T08:00:00+07:00',
-        'open': 3383.5,
-        'high': 3383.715,
-        'low': 3373.22,
-        'close': 3376.285,
-        'volume': 11516.0,
-        'accumulation_distribution': 6765827.104831301,
-        'macd': 4.025014452422965,
-        'signal': 4.149846636103384,
-        'rsi': 51.81285962615013,
-        'rsi_based_ma': 56.110500547274775,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-06T09:00:00+07:00',
-        'open': 3376.26,
-        'high': 3377.935,
-        'low': 3374.28,
-        'close': 3376.335,
-        'volume': 6630.0,
-        'accumulation_distribution': 6766652.45366851,
-        'macd': 3.540625591829212,
-        'signal': 4.02800242724855,
-        'rsi': 51.857115160143785,
-        'rsi_based_ma': 57.0869006263294,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-06T10:00:00+07:00',
-        'open': 3376.35,
-        'high': 3378.43,
-        'low': 3373.515,
-        'close': 3374.75,
-        'volume': 4167.0,
-        'accumulation_distribution': 6764579.551328734,
-        'macd': 2.9943308937363327,
-        'signal': 3.8212681205461063,
-        'rsi': 50.28066097116254,
-        'rsi_based_ma': 57.023926626245945,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-06T11:00:00+07:00',
-        'open': 3374.73,
-        'high': 3376.585,
-        'low': 3372.315,
-        'close': 3372.56,
-        'volume': 2974.0,
-        'accumulation_distribution': 6761946.830017258,
-        'macd': 2.3574979434501984,
-        'signal': 3.528514085126925,
-        'rsi': 48.1046571332018,
-        'rsi_based_ma': 56.44880451961706,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-06T12:00:00+07:00',
-        'open': 3372.5,
-        'high': 3374.795,
-        'low': 3370.795,
-        'close': 3374.395,
-        'volume': 6283.0,
-        'accumulation_distribution': 6766973.230017258,
-        'macd': 1.9780704417335075,
-        'signal': 3.218425356448241,
-        'rsi': 50.055070741202734,
-        'rsi_based_ma': 55.55307108210037,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-06T13:00:00+07:00',
-        'open': 3374.39,
-        'high': 3378.845,
-        'low': 3373.22,
-        'close': 3375.215,
-        'volume': 9140.0,
-        'accumulation_distribution': 6764316.536683925,
-        'macd': 1.7236691746711583,
-        'signal': 2.9194741200928247,
-        'rsi': 50.94236447038585,
-        'rsi_based_ma': 54.57424677016197,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-06T14:00:00+07:00',
-        'open': 3375.22,
-        'high': 3377.27,
-        'low': 3369.1,
-        'close': 3373.685,
-        'volume': 10559.0,
-        'accumulation_distribution': 6765608.947944636,
-        'macd': 1.382657707033104,
-        'signal': 2.612110837480881,
-        'rsi': 49.18652654133959,
-        'rsi_based_ma': 53.9014185523785,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-06T15:00:00+07:00',
-        'open': 3373.645,
-        'high': 3374.86,
-        'low': 3364.7,
-        'close': 3365.205,
-        'volume': 11321.0,
-        'accumulation_distribution': 6755413.362314714,
-        'macd': 0.4232594607979081,
-        'signal': 2.174340562144286,
-        'rsi': 40.79403204539067,
-        'rsi_based_ma': 52.734194516459176,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-06T16:00:00+07:00',
-        'open': 3365.17,
-        'high': 3367.965,
-        'low': 3358.255,
-        'close': 3358.93,
-        'volume': 11204.0,
-        'accumulation_distribution': 6745767.076011932,
-        'macd': -0.8337991020448499,
-        'signal': 1.572712629306459,
-        'rsi': 35.911144541772885,
-        'rsi_based_ma': 51.22253110947317,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-06T17:00:00+07:00',
-        'open': 3358.94,
-        'high': 3365.585,
-        'low': 3358.295,
-        'close': 3363.77,
-        'volume': 12210.0,
-        'accumulation_distribution': 6751897.199468723,
-        'macd': -1.4230751942773168,
-        'signal': 0.973555064589704,
-        'rsi': 41.70694247839303,
-        'rsi_based_ma': 50.185843265822,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-06T18:00:00+07:00',
-        'open': 3363.705,
-        'high': 3367.05,
-        'low': 3360.885,
-        'close': 3365.27,
-        'volume': 8763.0,
-        'accumulation_distribution': 6755599.975624439,
-        'macd': -1.748883241533349,
-        'signal': 0.4290674033650932,
-        'rsi': 43.41484779084838,
-        'rsi_based_ma': 49.18139260060899,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-06T19:00:00+07:00',
-        'open': 3365.265,
-        'high': 3369.35,
-        'low': 3360.265,
-        'close': 3367.615,
-        'volume': 16655.0,
-        'accumulation_distribution': 6765893.627247994,
-        'macd': -1.797150136203527,
-        'signal': -0.0161761045486308,
-        'rsi': 46.07480674990619,
-        'rsi_based_ma': 48.44403924846857,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-06T20:00:00+07:00',
-        'open': 3367.6,
-        'high': 3373.625,
-        'low': 3365.22,
-        'close': 3371.75,
-        'volume': 30375.0,
-        'accumulation_distribution': 6782716.426177203,
-        'macd': -1.4846281860309318,
-        'signal': -0.309866520845091,
-        'rsi': 50.494043360475786,
-        'rsi_based_ma': 47.83801210157537,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-06T21:00:00+07:00',
-        'open': 3371.735,
-        'high': 3379.4,
-        'low': 3369.48,
-        'close': 3379.31,
-        'volume': 23294.0,
-        'accumulation_distribution': 6805587.7527901055,
-        'macd': -0.6197790434625858,
-        'signal': -0.37184902536859,
-        'rsi': 57.372300466932415,
-        'rsi_based_ma': 47.714812291236136,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-06T22:00:00+07:00',
-        'open': 3379.305,
-        'high': 3380.09,
-        'low': 3370.33,
-        'close': 3377.555,
-        'volume': 23972.0,
-        'accumulation_distribution': 6817107.084757318,
-        'macd': -0.0751276748583222,
-        'signal': -0.3125047552665364,
-        'rsi': 55.446397975640494,
-        'rsi_based_ma': 47.97435074477117,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-06T23:00:00+07:00',
-        'open': 3377.565,
-        'high': 3379.465,
-        'low': 3372.95,
-        'close': 3376.175,
-        'volume': 17911.0,
-        'accumulation_distribution': 6816928.387136444,
-        'macd': 0.242364168633685,
-        'signal': -0.2015309704864921,
-        'rsi': 53.91383302553621,
-        'rsi_based_ma': 48.12125916372777,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-07T00:00:00+07:00',
-        'open': 3376.18,
-        'high': 3377.74,
-        'low': 3370.925,
-        'close': 3374.585,
-        'volume': 23536.0,
-        'accumulation_distribution': 6818672.434091691,
-        'macd': 0.3615117477952481,
-        'signal': -0.088922426830144,
-        'rsi': 52.1260966483384,
-        'rsi_based_ma': 48.25307599781176,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-07T01:00:00+07:00',
-        'open': 3374.595,
-        'high': 3374.64,
-        'low': 3369.07,
-        'close': 3371.655,
-        'volume': 18160.0,
-        'accumulation_distribution': 6817368.304827779,
-        'macd': 0.2170090049980899,
-        'signal': -0.0277361404644972,
-        'rsi': 48.90772697943421,
-        'rsi_based_ma': 48.31043812968551,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-07T02:00:00+07:00',
-        'open': 3371.645,
-        'high': 3373.275,
-        'low': 3370.345,
-        'close': 3371.78,
-        'volume': 16773.0,
-        'accumulation_distribution': 6817024.830425051,
-        'macd': 0.1112930782487637,
-        'signal': 6.97032781549e-05,
-        'rsi': 49.05224859864845,
-        'rsi_based_ma': 48.23880797664591,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-07T03:00:00+07:00',
-        'open': 3371.71,
-        'high': 3372.215,
-        'low': 3367.26,
-        'close': 3369.27,
-        'volume': 5793.0,
-        'accumulation_distribution': 6815931.701262589,
-        'macd': -0.1730290077030076,
-        'signal': -0.0345500389180775,
-        'rsi': 46.224761294956856,
-        'rsi_based_ma': 47.90183632125813,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-07T05:00:00+07:00',
-        'open': 3372.44,
-        'high': 3374.71,
-        'low': 3370.05,
-        'close': 3372.0,
-        'volume': 4490.0,
-        'accumulation_distribution': 6815199.426584477,
-        'macd': -0.1760388584325483,
-        'signal': -0.0628478028209717,
-        'rsi': 49.625887588101776,
-        'rsi_based_ma': 47.93321925316972,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-07T06:00:00+07:00',
-        'open': 3371.9,
-        'high': 3371.9,
-        'low': 3367.77,
-        'close': 3370.21,
-        'volume': 6393.0,
-        'accumulation_distribution': 6816360.383000941,
-        'macd': -0.3191828855460699,
-        'signal': -0.1141148193659913,
-        'rsi': 47.50435875137512,
-        'rsi_based_ma': 48.41252830359717,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-07T07:00:00+07:00',
-        'open': 3370.215,
-        'high': 3374.84,
-        'low': 3365.305,
-        'close': 3372.385,
-        'volume': 30168.0,
-        'accumulation_distribution': 6830993.524060197,
-        'macd': -0.2541910790332622,
-        'signal': -0.1421300712994455,
-        'rsi': 50.28544902790153,
-        'rsi_based_ma': 49.43926433832065,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-07T08:00:00+07:00',
-        'open': 3372.375,
-        'high': 3382.485,
-        'low': 3370.215,
-        'close': 3382.42,
-        'volume': 29120.0,
-        'accumulation_distribution': 6859804.999202821,
-        'macd': 0.6001380124403113,
-        'signal': 0.0063235454485058,
-        'rsi': 60.64487963156152,
-        'rsi_based_ma': 50.79197413497554,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-07T09:00:00+07:00',
-        'open': 3382.425,
-        'high': 3384.3,
-        'low': 3378.255,
-        'close': 3379.725,
-        'volume': 11768.0,
-        'accumulation_distribution': 6853760.393743764,
-        'macd': 1.0476592321138014,
-        'signal': 0.2145906827815649,
-        'rsi': 57.19775172230866,
-        'rsi_based_ma': 51.77646727293698,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-07T10:00:00+07:00',
-        'open': 3379.765,
-        'high': 3380.345,
-        'low': 3376.525,
-        'close': 3379.74,
-        'volume': 12532.0,
-        'accumulation_distribution': 6862322.833534339,
-        'macd': 1.3875387149678318,
-        'signal': 0.4491802892188183,
-        'rsi': 57.21232976015039,
-        'rsi_based_ma': 52.57200463081157,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-07T11:00:00+07:00',
-        'open': 3379.76,
-        'high': 3380.76,
-        'low': 3376.89,
-        'close': 3377.74,
-        'volume': 14883.0,
-        'accumulation_distribution': 6853977.585472323,
-        'macd': 1.4784694925319857,
-        'signal': 0.6550381298814518,
-        'rsi': 54.544800048392766,
-        'rsi_based_ma': 52.86134439423421,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-07T12:00:00+07:00',
-        'open': 3377.73,
-        'high': 3381.17,
-        'low': 3371.645,
-        'close': 3375.64,
-        'volume': 32049.0,
-        'accumulation_distribution': 6848812.7335038185,
-        'macd': 1.3653415320191016,
-        'signal': 0.7970988103089818,
-        'rsi': 51.813098915871386,
-        'rsi_based_ma': 52.46425856915842,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-07T13:00:00+07:00',
-        'open': 3375.655,
-        'high': 3388.005,
-        'low': 3375.115,
-        'close': 3387.98,
-        'volume': 38692.0,
-        'accumulation_distribution': 6887354.648166347,
-        'macd': 2.245536531252128,
-        'signal': 1.086786354497611,
-        'rsi': 63.40961137924709,
-        'rsi_based_ma': 53.03305952655889,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-07T14:00:00+07:00',
-        'open': 3387.985,
-        'high': 3397.58,
-        'low': 3386.265,
-        'close': 3396.24,
-        'volume': 31831.0,
-        'accumulation_distribution': 6911646.356959984,
-        'macd': 3.568475216904972,
-        'signal': 1.5831241269790832,
-        'rsi': 68.81889204029481,
-        'rsi_based_ma': 54.09770659904165,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-07T15:00:00+07:00',
-        'open': 3396.31,
-        'high': 3396.645,
-        'low': 3372.395,
-        'close': 3378.51,
-        'volume': 50515.0,
-        'accumulation_distribution': 6886607.581702253,
-        'macd': 3.149940281540239,
-        'signal': 1.8964873578913144,
-        'rsi': 51.29107995838249,
-        'rsi_based_ma': 54.03806254975909,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-07T16:00:00+07:00',
-        'open': 3378.49,
-        'high': 3381.315,
-        'low': 3373.535,
-        'close': 3376.68,
-        'volume': 38758.0,
-        'accumulation_distribution': 6879184.777075003,
-        'macd': 2.640148633814988,
-        'signal': 2.045219613076049,
-        'rsi': 49.87898255119435,
-        'rsi_based_ma': 54.10743794774195,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-07T17:00:00+07:00',
-        'open': 3376.715,
-        'high': 3378.91,
-        'low': 3371.92,
-        'close': 3373.095,
-        'volume': 22634.0,
-        'accumulation_distribution': 6864160.204828936,
-        'macd': 1.924669153303057,
-        'signal': 2.0211095211214505,
-        'rsi': 47.14091848443247,
-        'rsi_based_ma': 53.97091436815509,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-07T18:00:00+07:00',
-        'open': 3373.155,
-        'high': 3383.415,
-        'low': 3371.87,
-        'close': 3378.29,
-        'volume': 36262.0,
-        'accumulation_distribution': 6868227.70504548,
-        'macd': 1.756590709559532,
-        'signal': 1.968205758809067,
-        'rsi': 51.31182619532281,
-        'rsi_based_ma': 54.33427614675266,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-07T19:00:00+07:00',
-        'open': 3378.335,
-        'high': 3389.98,
-        'low': 3375.14,
-        'close': 3380.735,
-        'volume': 29512.0,
-        'accumulation_distribution': 6860969.025800198,
-        'macd': 1.7999299264606634,
-        'signal': 1.9345505923393864,
-        'rsi': 53.18415380050507,
-        'rsi_based_ma': 54.588438019067176,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-07T20:00:00+07:00',
-        'open': 3380.74,
-        'high': 3393.965,
-        'low': 3379.97,
-        'close': 3384.995,
-        'volume': 48022.0,
-        'accumulation_distribution': 6847432.277675868,
-        'macd': 2.153202191252604,
-        'signal': 1.9782809121220295,
-        'rsi': 56.33486489632109,
-        'rsi_based_ma': 55.2191884579919,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-07T21:00:00+07:00',
-        'open': 3385.015,
-        'high': 3390.5,
-        'low': 3374.77,
-        'close': 3387.815,
-        'volume': 68646.0,
-        'accumulation_distribution': 6892643.50208782,
-        'macd': 2.630401803938639,
-        'signal': 2.108705090485352,
-        'rsi': 58.33391022779855,
-        'rsi_based_ma': 55.79407854369883,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-07T22:00:00+07:00',
-        'open': 3387.865,
-        'high': 3391.065,
-        'low': 3384.33,
-        'close': 3390.255,
-        'volume': 27240.0,
-        'accumulation_distribution': 6913331.341731474,
-        'macd': 3.168943930072146,
-        'signal': 2.3207528584027104,
-        'rsi': 60.03863228180325,
-        'rsi_based_ma': 55.75077516157324,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-07T23:00:00+07:00',
-        'open': 3390.25,
-        'high': 3392.685,
-        'low': 3387.2,
-        'close': 3388.9,
-        'volume': 19292.0,
-        'accumulation_distribution': 6905997.919671311,
-        'macd': 3.446674155047731,
-        'signal': 2.5459371177317145,
-        'rsi': 58.6046716648566,
-        'rsi_based_ma': 55.8512694431838,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-08T00:00:00+07:00',
-        'open': 3388.855,
-        'high': 3393.12,
-        'low': 3384.375,
-        'close': 3392.4,
-        'volume': 25596.0,
-        'accumulation_distribution': 6927379.140940608,
-        'macd': 3.9041930019084248,
-        'signal': 2.8175882945670567,
-        'rsi': 61.18357687432456,
-        'rsi_based_ma': 56.134929951339096,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-08T01:00:00+07:00',
-        'open': 3392.425,
-        'high': 3394.18,
-        'low': 3387.625,
-        'close': 3388.26,
-        'volume': 20537.0,
-        'accumulation_distribution': 6910821.086783478,
-        'macd': 3.8878993007092495,
-        'signal': 3.0316504957954957,
-        'rsi': 56.685057267525984,
-        'rsi_based_ma': 56.28780546699147,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-08T02:00:00+07:00',
-        'open': 3388.255,
-        'high': 3400.895,
-        'low': 3387.33,
-        'close': 3399.945,
-        'volume': 31813.0,
-        'accumulation_distribution': 6938178.156079461,
-        'macd': 4.7629637877957975,
-        'signal': 3.377913154195556,
-        'rsi': 64.59707063639146,
-        'rsi_based_ma': 57.200946304171474,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-08T03:00:00+07:00',
-        'open': 3399.91,
-        'high': 3401.885,
-        'low': 3392.765,
-        'close': 3396.48,
-        'volume': 24872.0,
-        'accumulation_distribution': 6933569.19993911,
-        'macd': 5.117866576393226,
-        'signal': 3.72590383863509,
-        'rsi': 61.03666662961852,
-        'rsi_based_ma': 57.03145025062658,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-08T05:00:00+07:00',
-        'open': 3400.365,
-        'high': 3409.43,
-        'low': 3387.965,
-        'close': 3405.44,
-        'volume': 21012.0,
-        'accumulation_distribution': 6946769.610840579,
-        'macd': 6.052358885676767,
-        'signal': 4.191194848043425,
-        'rsi': 66.22130819487161,
-        'rsi_based_ma': 56.84590854738207,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-08T06:00:00+07:00',
-        'open': 3405.38,
-        'high': 3407.425,
-        'low': 3396.485,
-        'close': 3400.625,
-        'volume': 6866.0,
-        'accumulation_distribution': 6945100.1812244905,
-        'macd': 6.331435664908895,
-        'signal': 4.619243011416519,
-        'rsi': 61.48636860572006,
-        'rsi_based_ma': 57.57414345076332,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-08T07:00:00+07:00',
-        'open': 3400.64,
-        'high': 3402.34,
-        'low': 3387.155,
-        'close': 3388.802,
-        'volume': 79313.0,
-        'accumulation_distribution': 6882992.121757911,
-        'macd': 5.534787151031651,
-        'signal': 4.802351839339545,
-        'rsi': 51.70943699667788,
-        'rsi_based_ma': 57.70489019686929,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-08T08:00:00+07:00',
-        'open': 3389.42,
-        'high': 3390.68,
-        'low': 3381.215,
-        'close': 3383.54,
-        'volume': 64386.0,
-        'accumulation_distribution': 6850237.91256615,
-        'macd': 4.427797151258346,
-        'signal': 4.7274409017233054,
-        'rsi': 48.04756661164221,
-        'rsi_based_ma': 57.76965077738428,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-08T09:00:00+07:00',
-        'open': 3383.53,
-        'high': 3389.925,
-        'low': 3383.21,
-        'close': 3388.425,
-        'volume': 46728.0,
-        'accumulation_distribution': 6876089.665358407,
-        'macd': 3.8997246767776232,
-        'signal': 4.561897656734169,
-        'rsi': 51.482586136221165,
-        'rsi_based_ma': 57.78184791601986,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-08T10:00:00+07:00',
-        'open': 3388.43,
-        'high': 3398.21,
-        'low': 3383.58,
-        'close': 3396.05,
-        'volume': 64339.0,
-        'accumulation_distribution': 6921430.40971931,
-        'macd': 4.049813482506579,
-        'signal': 4.459480821888652,
-        'rsi': 56.335592396170895,
-        'rsi_based_ma': 58.00695067285314,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-08T11:00:00+07:00',
-        'open': 3396.12,
-        'high': 3399.595,
-        'low': 3393.36,
-        'close': 3394.475,
-        'volume': 48272.0,
-        'accumulation_distribution': 6890423.295044087,
-        'macd': 3.995611680926231,
-        'signal': 4.366706993696168,
-        'rsi': 55.10938435195002,
-        'rsi_based_ma': 57.9194163482552,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-08T12:00:00+07:00',
-        'open': 3394.5,
-        'high': 3395.88,
-        'low': 3390.04,
-        'close': 3392.44,
-        'volume': 47393.0,
-        'accumulation_distribution': 6881983.445729019,
-        'macd': 3.745275663381108,
-        'signal': 4.242420727633156,
-        'rsi': 53.48937559399523,
-        'rsi_based_ma': 57.57337816012639,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-08T13:00:00+07:00',
-        'open': 3392.38,
-        'high': 3398.18,
-        'low': 3388.8,
-        'close': 3393.695,
-        'volume': 59705.0,
-        'accumulation_distribution': 6884593.152552049,
-        'macd': 3.6065762118760176,
-        'signal': 4.115251824481728,
-        'rsi': 54.38003316478739,
-        'rsi_based_ma': 57.16919250891097,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-08T14:00:00+07:00',
-        'open': 3393.63,
-        'high': 3404.28,
-        'low': 3391.775,
-        'close': 3402.33,
-        'volume': 80753.0,
-        'accumulation_distribution': 6940161.290496867,
-        'macd': 4.1456398756608905,
-        'signal': 4.121329434717561,
-        'rsi': 60.048835753169975,
-        'rsi_based_ma': 57.27234708664764,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-08T15:00:00+07:00',
-        'open': 3402.225,
-        'high': 3402.635,
-        'low': 3394.16,
-        'close': 3394.455,
-        'volume': 56584.0,
-        'accumulation_distribution': 6887516.471617812,
-        'macd': 3.8925343145160696,
-        'signal': 4.075570410677263,
-        'rsi': 53.51745872016178,
-        'rsi_based_ma': 56.72476721849315,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-08T16:00:00+07:00',
-        'open': 3394.445,
-        'high': 3401.755,
-        'low': 3393.9,
-        'close': 3400.795,
-        'volume': 71907.0,
-        'accumulation_distribution': 6941847.222095215,
-        'macd': 4.155627857043783,
-        'signal': 4.091581899950567,
-        'rsi': 57.52313625972029,
-        'rsi_based_ma': 56.784630003649895,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-08T17:00:00+07:00',
-        'open': 3400.735,
-        'high': 3401.24,
-        'low': 3384.535,
-        'close': 3385.155,
-        'volume': 74876.0,
-        'accumulation_distribution': 6872529.21311587,
-        'macd': 3.066762366351213,
-        'signal': 3.886617993230696,
-        'rsi': 46.8071832021224,
-        'rsi_based_ma': 55.51392375834496,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-08T18:00:00+07:00',
-        'open': 3385.12,
-        'high': 3388.705,
-        'low': 3380.455,
-        'close': 3386.17,
-        'volume': 85372.0,
-        'accumulation_distribution': 6905436.238570418,
-        'macd': 2.259682425024039,
-        'signal': 3.561230879589365,
-        'rsi': 47.49083869031053,
-        'rsi_based_ma': 54.54636461982296,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-08T19:00:00+07:00',
-        'open': 3386.18,
-        'high': 3402.57,
-        'low': 3385.15,
-        'close': 3391.615,
-        'volume': 103541.0,
-        'accumulation_distribution': 6878748.575539416,
-        'macd': 2.0359624433572208,
-        'signal': 3.256177192342936,
-        'rsi': 51.12020043608106,
-        'rsi_based_ma': 53.46771406562363,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-08T20:00:00+07:00',
-        'open': 3391.575,
-        'high': 3401.82,
-        'low': 3387.585,
-        'close': 3400.16,
-        'volume': 83908.0,
-        'accumulation_distribution': 6943086.883934214,
-        'macd': 2.5191338258873657,
-        'signal': 3.108768519051822,
-        'rsi': 56.23281082499949,
-        'rsi_based_ma': 53.09245993842931,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-08T21:00:00+07:00',
-        'open': 3400.145,
-        'high': 3401.34,
-        'low': 3381.32,
-        'close': 3390.715,
-        'volume': 64828.0,
-        'accumulation_distribution': 6939103.944873274,
-        'macd': 2.1155315321334456,
-        'signal': 2.910121121668147,
-        'rsi': 50.00671007912173,
-        'rsi_based_ma': 52.97083658717529,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-08T22:00:00+07:00',
-        'open': 3390.73,
-        'high': 3395.505,
-        'low': 3388.905,
-        'close': 3395.42,
-        'volume': 48993.0,
-        'accumulation_distribution': 6986835.003964183,
-        'macd': 2.1505379227005506,
-        'signal': 2.7582044818746274,
-        'rsi': 52.80969940523669,
-        'rsi_based_ma': 53.3109889295749,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-08T23:00:00+07:00',
-        'open': 3395.425,
-        'high': 3400.75,
-        'low': 3393.495,
-        'close': 3397.57,
-        'volume': 35860.0,
-        'accumulation_distribution': 6991258.8082371,
-        'macd': 2.324966998812215,
-        'signal': 2.671556985262145,
-        'rsi': 54.0767837880277,
-        'rsi_based_ma': 53.4962887618468,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-09T00:00:00+07:00',
-        'open': 3397.47,
-        'high': 3399.59,
-        'low': 3378.335,
-        'close': 3381.835,
-        'volume': 35061.0,
-        'accumulation_distribution': 6967744.597227925,
-        'macd': 1.1799189302519153,
-        'signal': 2.373229374260099,
-        'rsi': 44.63163934120874,
-        'rsi_based_ma': 52.66029211506379,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-09T01:00:00+07:00',
-        'open': 3382.88,
-        'high': 3403.96,
-        'low': 3376.575,
-        'close': 3395.555,
-        'volume': 75544.0,
-        'accumulation_distribution': 6996916.691440085,
-        'macd': 1.363828062516859,
-        'signal': 2.171349111911451,
-        'rsi': 52.433080300415526,
-        'rsi_based_ma': 52.46912753995418,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-09T02:00:00+07:00',
-        'open': 3395.5,
-        'high': 3400.885,
-        'low': 3392.4,
-        'close': 3398.585,
-        'volume': 43696.0,
-        'accumulation_distribution': 7016923.640173142,
-        'macd': 1.7340836155731267,
-        'signal': 2.083896012643786,
-        'rsi': 53.975406798429816,
-        'rsi_based_ma': 52.50384405455666,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-09T03:00:00+07:00',
-        'open': 3398.76,
-        'high': 3400.065,
-        'low': 3391.965,
-        'close': 3397.765,
-        'volume': 14750.0,
-        'accumulation_distribution': 7023297.096963265,
-        'macd': 1.938995133032222,
-        'signal': 2.0549158367214733,
-        'rsi': 53.47011953225779,
-        'rsi_based_ma': 52.43885022366168,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-11T05:00:00+07:00',
-        'open': 3399.75,
-        'high': 3401.395,
-        'low': 3378.895,
-        'close': 3395.295,
-        'volume': 7523.0,
-        'accumulation_distribution': 7026740.959185488,
-        'macd': 1.8804044970470384,
-        'signal': 2.0200135687865863,
-        'rsi': 51.89421762026401,
-        'rsi_based_ma': 51.85637749988268,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-11T06:00:00+07:00',
-        'open': 3395.205,
-        'high': 3397.035,
-        'low': 3390.115,
-        'close': 3391.39,
-        'volume': 6473.0,
-        'accumulation_distribution': 7022653.240977395,
-        'macd': 1.5015610700265825,
-        'signal': 1.9163230690345856,
-        'rsi': 49.41461431921754,
-        'rsi_based_ma': 51.56331718552953,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-11T07:00:00+07:00',
-        'open': 3391.535,
-        'high': 3391.825,
-        'low': 3381.425,
-        'close': 3381.74,
-        'volume': 31185.0,
-        'accumulation_distribution': 6993357.3323235465,
-        'macd': 0.4178340423604822,
-        'signal': 1.616625263699765,
-        'rsi': 43.83988708642695,
-        'rsi_based_ma': 50.58594224458,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-11T08:00:00+07:00',
-        'open': 3381.745,
-        'high': 3383.975,
-        'low': 3367.55,
-        'close': 3377.645,
-        'volume': 44493.0,
-        'accumulation_distribution': 7003556.184378341,
-        'macd': -0.7626681478891442,
-        'signal': 1.140766581381983,
-        'rsi': 41.69049078922444,
-        'rsi_based_ma': 50.22046421508729,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-11T09:00:00+07:00',
-        'open': 3377.645,
-        'high': 3379.895,
-        'low': 3369.895,
-        'close': 3377.27,
-        'volume': 21472.0,
-        'accumulation_distribution': 7013755.384378341,
-        'macd': -1.7087861812992742,
-        'signal': 0.5708560288457315,
-        'rsi': 41.4898813760107,
-        'rsi_based_ma': 49.79182440692301,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-11T10:00:00+07:00',
-        'open': 3377.265,
-        'high': 3380.305,
-        'low': 3374.025,
-        'close': 3378.44,
-        'volume': 13943.0,
-        'accumulation_distribution': 7019416.95284968,
-        'macd': -2.337240068657138,
-        'signal': -0.0107631906548424,
-        'rsi': 42.4208157888212,
-        'rsi_based_ma': 49.17043978926159,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-11T11:00:00+07:00',
-        'open': 3378.61,
-        'high': 3379.86,
-        'low': 3375.54,
-        'close': 3375.975,
-        'volume': 12366.0,
-        'accumulation_distribution': 7009541.32784968,
-        'macd': -2.999621432613821,
-        'signal': -0.6085348390466383,
-        'rsi': 40.94279238669405,
-        'rsi_based_ma': 48.07829561509692,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-11T12:00:00+07:00',
-        'open': 3375.91,
-        'high': 3380.2,
-        'low': 3373.865,
-        'close': 3377.115,
-        'volume': 12934.0,
-        'accumulation_distribution': 7009878.20393492,
-        'macd': -3.393457299729562,
-        'signal': -1.165519331183223,
-        'rsi': 41.95013252255564,
-        'rsi_based_ma': 47.50282578962791,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-11T13:00:00+07:00',
-        'open': 3377.13,
-        'high': 3377.42,
-        'low': 3363.815,
-        'close': 3365.815,
-        'volume': 28244.0,
-        'accumulation_distribution': 6989938.209815111,
-        'macd': -4.564770787643738,
-        'signal': -1.8453696224753264,
-        'rsi': 35.48841324358523,
-        'rsi_based_ma': 46.26559106379567,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-11T14:00:00+07:00',
-        'open': 3365.75,
-        'high': 3366.67,
-        'low': 3357.02,
-        'close': 3360.185,
-        'volume': 37920.0,
-        'accumulation_distribution': 6976892.158001639,
-        'macd': -5.879563169483845,
-        'signal': -2.6522083318770298,
-        'rsi': 32.77928905262695,
-        'rsi_based_ma': 44.74434143983847,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-11T15:00:00+07:00',
-        'open': 3360.13,
-        'high': 3366.15,
-        'low': 3358.95,
-        'close': 3362.01,
-        'volume': 29173.0,
-        'accumulation_distribution': 6972516.208001642,
-        'macd': -6.6970835464871925,
-        'signal': -3.461183374799062,
-        'rsi': 34.52415709304766,
-        'rsi_based_ma': 44.02237842211269,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-11T16:00:00+07:00',
-        'open': 3361.98,
-        'high': 3363.955,
-        'low': 3352.965,
-        'close': 3353.355,
-        'volume': 30220.0,
-        'accumulation_distribution': 6944441.03056761,
-        'macd': -7.9516982743784865,
-        'signal': -4.359286354714947,
-        'rsi': 30.48299715486208,
-        'rsi_based_ma': 42.45451534028744,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-11T17:00:00+07:00',
-        'open': 3353.365,
-        'high': 3364.11,
-        'low': 3353.11,
-        'close': 3358.505,
-        'volume': 24169.0,
-        'accumulation_distribution': 6943979.622385792,
-        'macd': -8.433214676294938,
-        'signal': -5.1740720190309455,
-        'rsi': 35.33350402413565,
-        'rsi_based_ma': 41.12295085640928,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-11T18:00:00+07:00',
-        'open': 3358.555,
-        'high': 3358.91,
-        'low': 3349.915,
-        'close': 3355.435,
-        'volume': 32202.0,
-        'accumulation_distribution': 6951300.69965094,
-        'macd': -8.959266390886569,
-        'signal': -5.93111089340207,
-        'rsi': 33.8186586926909,
-        'rsi_based_ma': 39.71927508215451,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-11T19:00:00+07:00',
-        'open': 3355.46,
-        'high': 3357.705,
-        'low': 3344.42,
-        'close': 3356.91,
-        'volume': 39961.0,
-        'accumulation_distribution': 6986479.013162418,
-        'macd': -9.15165145057108,
-        'signal': -6.575219004835872,
-        'rsi': 35.25489807584769,
-        'rsi_based_ma': 38.53075225755334,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-11T20:00:00+07:00',
-        'open': 3356.86,
-        'high': 3363.005,
-        'low': 3348.04,
-        'close': 3358.545,
-        'volume': 42623.0,
-        'accumulation_distribution': 7003696.255728406,
-        'macd': -9.067660811285805,
-        'signal': -7.073707366125858,
-        'rsi': 36.8898349998828,
-        'rsi_based_ma': 37.63612516331515,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-11T21:00:00+07:00',
-        'open': 3358.615,
-        'high': 3359.445,
-        'low': 3341.46,
-        'close': 3346.38,
-        'volume': 35623.0,
-        'accumulation_distribution': 6987563.404185453,
-        'macd': -9.868948363854088,
-        'signal': -7.632755565671504,
-        'rsi': 30.681802367364867,
-        'rsi_based_ma': 36.696261969096426,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-11T22:00:00+07:00',
-        'open': 3346.435,
-        'high': 3352.325,
-        'low': 3344.855,
-        'close': 3349.54,
-        'volume': 24966.0,
-        'accumulation_distribution': 6993913.524667381,
-        'macd': -10.132191336791038,
-        'signal': -8.132642719895411,
-        'rsi': 33.798363542803926,
-        'rsi_based_ma': 36.132538594352106,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-11T23:00:00+07:00',
-        'open': 3349.545,
-        'high': 3350.4,
-        'low': 3342.64,
-        'close': 3344.21,
-        'volume': 25854.0,
-        'accumulation_distribution': 6978521.065904495,
-        'macd': -10.648154448501828,
-        'signal': -8.635745065616694,
-        'rsi': 31.24651556576204,
-        'rsi_based_ma': 35.40086960790577,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-12T00:00:00+07:00',
-        'open': 3344.205,
-        'high': 3358.88,
-        'low': 3341.155,
-        'close': 3357.635,
-        'volume': 38464.0,
-        'accumulation_distribution': 7011581.660544834,
-        'macd': -9.860112391312214,
-        'signal': -8.880618530755799,
-        'rsi': 42.93371589280272,
-        'rsi_based_ma': 35.43750532961874,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-12T01:00:00+07:00',
-        'open': 3357.645,
-        'high': 3358.865,
-        'low': 3352.435,
-        'close': 3356.255,
-        'volume': 21403.0,
-        'accumulation_distribution': 7015609.285739237,
-        'macd': -9.240420040051958,
-        'signal': -8.95257883261503,
-        'rsi': 42.14072669563041,
-        'rsi_based_ma': 35.523072065971334,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-12T02:00:00+07:00',
-        'open': 3356.26,
-        'high': 3356.92,
-        'low': 3350.41,
-        'close': 3351.525,
-        'volume': 18259.0,
-        'accumulation_distribution': 7003604.904786858,
-        'macd': -9.026924094875994,
-        'signal': -8.967447885067223,
-        'rsi': 39.451084688284034,
-        'rsi_based_ma': 35.34456864923765,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-12T03:00:00+07:00',
-        'open': 3351.495,
-        'high': 3351.785,
-        'low': 3342.335,
-        'close': 3342.665,
-        'volume': 8505.0,
-        'accumulation_distribution': 6995693.904786858,
-        'macd': -9.463564888884775,
-        'signal': -9.066671285830733,
-        'rsi': 34.951104262639305,
-        'rsi_based_ma': 35.306189436312934,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-12T05:00:00+07:00',
-        'open': 3344.04,
-        'high': 3347.51,
-        'low': 3342.495,
-        'close': 3347.365,
-        'volume': 4689.0,
-        'accumulation_distribution': 7000111.75623252,
-        'macd': -9.32288670881917,
-        'signal': -9.11791437042842,
-        'rsi': 38.930566492554895,
-        'rsi_based_ma': 35.74556639630779,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-12T06:00:00+07:00',
-        'open': 3347.345,
-        'high': 3349.69,
-        'low': 3346.155,
-        'close': 3349.09,
-        'volume': 4959.0,
-        'accumulation_distribution': 7003387.361607343,
-        'macd': -8.968818200689839,
-        'signal': -9.088095136480703,
-        'rsi': 40.37237600882624,
-        'rsi_based_ma': 36.1632963188634,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-12T07:00:00+07:00',
-        'open': 3349.125,
-        'high': 3355.77,
-        'low': 3347.42,
-        'close': 3354.595,
-        'volume': 11053.0,
-        'accumulation_distribution': 7011329.637056444,
-        'macd': -8.150060045310056,
-        'signal': -8.900488118246574,
-        'rsi': 44.847471731950165,
-        'rsi_based_ma': 37.18933021722683,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-12T08:00:00+07:00',
-        'open': 3354.59,
-        'high': 3357.51,
-        'low': 3346.225,
-        'close': 3349.945,
-        'volume': 15763.0,
-        'accumulation_distribution': 7005958.902896054,
-        'macd': -7.786644851832534,
-        'signal': -8.677719464963767,
-        'rsi': 41.98136911257044,
-        'rsi_based_ma': 37.66417772354361,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-12T09:00:00+07:00',
-        'open': 3349.885,
-        'high': 3354.475,
-        'low': 3349.795,
-        'close': 3353.075,
-        'volume': 9749.0,
-        'accumulation_distribution': 7009875.167853318,
-        'macd': -7.16349454524061,
-        'signal': -8.374874481019136,
-        'rsi': 44.55016782748671,
-        'rsi_based_ma': 38.43071409031474,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-12T10:00:00+07:00',
-        'open': 3353.085,
-        'high': 3355.42,
-        'low': 3348.16,
-        'close': 3349.57,
-        'volume': 10659.0,
-        'accumulation_distribution': 7003356.440580592,
-        'macd': -6.87323724468888,
-        'signal': -8.074547033753085,
-        'rsi': 42.29203467497028,
-        'rsi_based_ma': 38.93336670453778,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-12T11:00:00+07:00',
-        'open': 3349.54,
-        'high': 3355.77,
-        'low': 3348.735,
-        'close': 3354.47,
-        'volume': 8175.0,
-        'accumulation_distribution': 7008510.118618971,
-        'macd': -6.176616997878227,
-        'signal': -7.694961026578113,
-        'rsi': 46.38360966886952,
-        'rsi_based_ma': 39.61149346660826,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-12T12:00:00+07:00',
-        'open': 3354.46,
-        'high': 3355.87,
-        'low': 3350.445,
-        'close': 3354.515,
-        'volume': 11727.0,
-        'accumulation_distribution': 7014379.022766436,
-        'macd': -5.55685336293709,
-        'signal': -7.267339493849908,
-        'rsi': 46.42118034514727,
-        'rsi_based_ma': 40.73573475073557,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-    {
-        'time': '2025-08-12T13:00:00+07:00',
-        'open': 3354.525,
-        'high': 3354.91,
-        'low': 3348.02,
-        'close': 3349.62,
-        'volume': 4354.0,
-        'accumulation_distribution': 7012047.19983465,
-        'macd': -5.398441929716228,
-        'signal': -6.893559981023172,
-        'rsi': 42.89966034149328,
-        'rsi_based_ma': 41.38582737921339,
-        'regular_bullish': None,
-        'regular_bullish_label': None,
-        'regular_bearish': None,
-        'regular_bearish_label': None,
-    },
-]
@@ -1,8 +1,9 @@
 """
 Генератор embedded sample данных для BQuant
 
-Этот модуль предоставляет функционал для создания embedded Python файлов
-из исходных CSV данных с использованием loader.py и config.py.
+Этот модуль предоставляет функционал для создания embedded колоночных файлов
+(Arrow IPC ``.arrow``, см. :mod:`bquant.data.samples.storage`) из исходных CSV данных
+с использованием loader.py и config.py.
 """
 
 import os
@@ -15,6 +16,7 @@ from datetime import datetime
 from ...core.logging_config import get_logger
 from ...core.config import get_data_path, validate_timeframe
 from ..loader import load_ohlcv_data
+from .storage import SAMPLE_FILE_SUFFIX, write_sample_file
 
 logger = get_logger(__name__)
 
@@ -23,8 +25,8 @@ class SampleDataGenerator:
     """
     Генератор embedded sample данных.
     
-    Создает Python файлы с embedded данными из исходных CSV файлов,
-    используя loader.py для загрузки и config.py для путей.
+    Создает колоночные ``.arrow`` файлы с embedded данными из исходных CSV
+    файлов, используя loader.py для загрузки и config.py для путей.
     """
     
     def __init__(self):
@@ -316,7 +318,7 @@ class SampleDataGenerator:
     
     def _generate_embedded_file(self, dataset_name: str, metadata: Dict[str, Any], data: List[Dict[str, Any]]) -> Path:
         """
-        Сгенерировать Python файл с embedded данными.
+        Сгенерировать колоночный файл с embedded данными.
         
         Args:
             dataset_name: Название датасета
@@ -328,79 +330,14 @@ class SampleDataGenerator:
         """
         self.logger.info(f"Generating embedded file for {dataset_name}")
         
-        # Создаем папку если не существует
-        self.embedded_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Путь к выходному файлу
-        output_file = self.embedded_dir / f"{dataset_name}.py"
-        
-        # Генерируем содержимое файла
-        file_content = self._generate_file_content(dataset_name, metadata, data)
-        
-        # Записываем файл
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(file_content)
+        output_file = self.embedded_dir / f"{dataset_name}{SAMPLE_FILE_SUFFIX}"
+        time_column = self._identify_time_column(list(data[0].keys())) if data else None
+        write_sample_file(output_file, data, metadata, time_column=time_column)
         
         self.logger.info(f"Generated embedded file: {output_file}")
         self.logger.info(f"File size: {output_file.stat().st_size} bytes")
         
         return output_file
-    
-    def _generate_file_content(self, dataset_name: str, metadata: Dict[str, Any], data: List[Dict[str, Any]]) -> str:
-        """
-        Сгенерировать содержимое Python файла с embedded данными.
-        
-        Args:
-            dataset_name: Название датасета
-            metadata: Метаданные датасета
-            data: Данные в виде списка словарей
-        
-        Returns:
-            Содержимое Python файла
-        """
-        # Создаем заголовок файла
-        header = f'''"""
-Embedded sample data for {metadata['name']}
-
-Auto-generated from original {metadata['source']} dataset
-Generated on: {metadata['updated']}
-Rows: {metadata['rows']}
-Source: {metadata['source']}
-
-DO NOT EDIT THIS FILE MANUALLY!
-Use bquant.data.samples.generator.SampleDataGenerator to regenerate.
-"""
-
-from typing import Dict, List, Any
-
-'''
-        
-        # Метаданные
-        metadata_section = f'''DATASET_INFO = {repr(metadata)}
-
-'''
-        
-        # Данные (разбиваем на части для читаемости)
-        data_header = "DATA = [\n"
-        data_footer = "]\n"
-        
-        data_entries = []
-        for record in data:
-            # Форматируем каждую запись
-            formatted_record = "    {\n"
-            for key, value in record.items():
-                formatted_value = repr(value)
-                formatted_record += f"        '{key}': {formatted_value},\n"
-            formatted_record += "    },"
-            data_entries.append(formatted_record)
-        
-        # Объединяем все части
-        data_section = data_header + "\n".join(data_entries) + "\n" + data_footer
-        
-        # Финальное содержимое
-        content = header + metadata_section + data_section
-        
-        return content
 
 
 # Экспорт для удобства
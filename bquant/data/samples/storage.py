@@ -0,0 +1,244 @@
+"""
+Колоночное хранение embedded sample данных BQuant
+
+Каждый датасет хранится как один несжатый Arrow IPC файл (``.arrow``,
+пакетные данные ``bquant/data/samples/embedded``) с отдельной колонкой
+Arrow на колонку датасета:
+
+- числовые колонки — ``float64`` (пропуски — null Arrow);
+- текстовые колонки — ``string`` с null вместо ``None``;
+- колонки без значений — только имя в схеме;
+- время — исходные строки + ``int64`` наносекунды UTC и смещение/зона,
+  поэтому DataFrame собирается без повторного разбора дат.
+
+Файл открывается через memory map: буферы колонок не копируются при
+чтении, страницы подгружаются ОС по мере обращения. Метаданные
+(``DATASET_INFO``) и схема колонок лежат в метаданных схемы Arrow как JSON.
+"""
+
+import datetime
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from ...core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Версия формата файла (поле схемы); 1 - ``.npz`` архивы
+STORAGE_FORMAT_VERSION = 2
+
+SAMPLE_FILE_SUFFIX = '.arrow'
+
+_INFO_KEY = b'bquant.info'
+_SCHEMA_KEY = b'bquant.schema'
+_UTC_NS_SUFFIX = '.utc_ns'
+
+
+def _timezone_spec(tz: Any) -> Optional[Dict[str, Any]]:
+    """Сериализуемое описание часового пояса колонки времени."""
+    if tz is None:
+        return None
+    if isinstance(tz, datetime.timezone):
+        return {'offset_seconds': int(tz.utcoffset(None).total_seconds())}
+    return {'name': str(tz)}
+
+
+def _timezone_from_spec(spec: Optional[Dict[str, Any]]) -> Any:
+    if not spec:
+        return None
+    if 'offset_seconds' in spec:
+        return datetime.timezone(datetime.timedelta(seconds=spec['offset_seconds']))
+    return spec['name']
+
+
+def _column_kind(values: List[Any]) -> str:
+    present = [value for value in values if value is not None]
+    if not present:
+        return 'null'
+    if all(isinstance(value, (int, float, np.number)) and not isinstance(value, bool) for value in present):
+        return 'float'
+    if all(isinstance(value, str) for value in present):
+        return 'text'
+    raise ValueError(f"Unsupported column values: {sorted({type(v).__name__ for v in present})}")
+
+
+def write_sample_file(
+    path: Union[str, Path],
+    data: List[Dict[str, Any]],
+    dataset_info: Dict[str, Any],
+    time_column: Optional[str] = 'time',
+) -> Path:
+    """
+    Записать датасет (список словарей) в колоночный ``.arrow`` файл.
+
+    Args:
+        path: Путь к выходному файлу
+        data: Записи датасета (значения float/str/None)
+        dataset_info: Метаданные датасета (``DATASET_INFO``)
+        time_column: Колонка времени (хранится и как текст, и как datetime)
+
+    Returns:
+        Путь к созданному файлу
+
+    Raises:
+        ValueError: Если колонка содержит значения неподдерживаемого типа
+    """
+    path = Path(path)
+    columns = list(data[0].keys()) if data else []
+    arrays: Dict[str, pa.Array] = {}
+    schema: Dict[str, Any] = {
+        'format_version': STORAGE_FORMAT_VERSION,
+        'rows': len(data),
+        'columns': [],
+    }
+
+    for name in columns:
+        values = [record.get(name) for record in data]
+        kind = _column_kind(values)
+        entry: Dict[str, Any] = {'name': name, 'kind': kind}
+
+        if kind == 'float':
+            # from_pandas: NaN тоже хранится как null
+            arrays[name] = pa.array(values, type=pa.float64(), from_pandas=True)
+        elif kind == 'text':
+            arrays[name] = pa.array(values, type=pa.string())
+
+        if name == time_column and kind == 'text':
+            # Разбираем время один раз при записи, как это делал convert_to_dataframe
+            try:
+                times = pd.to_datetime(pd.Series(values))
+            except Exception as e:
+                logger.warning(f"Could not parse time column '{name}', stored as text: {e}")
+            else:
+                tz = getattr(times.dt, 'tz', None)
+                utc = times.dt.tz_convert('UTC') if tz is not None else times
+                utc_ns = utc.dt.tz_localize(None).to_numpy(dtype='datetime64[ns]').view(np.int64)
+                arrays[name + _UTC_NS_SUFFIX] = pa.array(utc_ns, type=pa.int64())
+                entry['kind'] = 'datetime'
+                entry['timezone'] = _timezone_spec(tz)
+
+        schema['columns'].append(entry)
+
+    table = pa.table(arrays)
+    table = table.replace_schema_metadata({
+        _INFO_KEY: json.dumps(dataset_info, ensure_ascii=False, default=str),
+        _SCHEMA_KEY: json.dumps(schema),
+    })
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Без сжатия: иначе буферы нельзя отобразить в память без распаковки
+    with pa.OSFile(str(path), 'wb') as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+    logger.debug(f"Wrote {len(data)} rows x {len(columns)} columns to {path}")
+    return path
+
+
+class SampleColumns:
+    """
+    Содержимое колоночного файла sample данных.
+
+    Колонки - неизменяемая таблица Arrow (при чтении из файла - поверх
+    memory map), разделяемая между вызовами; методы :meth:`to_frame`
+    и :meth:`to_records` возвращают новые объекты.
+    """
+
+    def __init__(self, info: Dict[str, Any], schema: Dict[str, Any], table: pa.Table):
+        self.info = info
+        self.schema = schema
+        self.table = table
+
+    @property
+    def columns(self) -> List[str]:
+        return [entry['name'] for entry in self.schema['columns']]
+
+    def __len__(self) -> int:
+        return int(self.schema['rows'])
+
+    def _numpy(self, name: str) -> np.ndarray:
+        """Копия колонки (view на memory map без пропусков нельзя отдавать наружу)."""
+        return np.array(self.table.column(name).to_numpy(), copy=True)
+
+    def _text(self, name: str) -> List[Any]:
+        return self.table.column(name).to_pylist()
+
+    def to_frame(self) -> pd.DataFrame:
+        """DataFrame с теми же колонками и типами, что у ``convert_to_dataframe``."""
+        n_rows = len(self)
+        frame: Dict[str, Any] = {}
+        for entry in self.schema['columns']:
+            name, kind = entry['name'], entry['kind']
+            if kind == 'float':
+                frame[name] = self._numpy(name)
+            elif kind == 'datetime':
+                times = pd.to_datetime(self._numpy(name + _UTC_NS_SUFFIX), unit='ns')
+                tz = _timezone_from_spec(entry.get('timezone'))
+                frame[name] = times.tz_localize('UTC').tz_convert(tz) if tz is not None else times
+            elif kind == 'text':
+                frame[name] = np.array(self._text(name), dtype=object)
+            else:
+                frame[name] = np.full(n_rows, None, dtype=object)
+        return pd.DataFrame(frame, index=pd.RangeIndex(n_rows))
+
+    def to_records(self) -> List[Dict[str, Any]]:
+        """Записи в исходном виде (время — исходные строки, пропуски — ``None``)."""
+        n_rows = len(self)
+        values: List[List[Any]] = []
+        for entry in self.schema['columns']:
+            name, kind = entry['name'], entry['kind']
+            if kind == 'float':
+                values.append(self.table.column(name).to_pylist())
+            elif kind in ('text', 'datetime'):
+                values.append(self._text(name))
+            else:
+                values.append([None] * n_rows)
+        names = self.columns
+        return [dict(zip(names, row)) for row in zip(*values)] if names else []
+
+
+def read_sample_file(path: Union[str, Path]) -> SampleColumns:
+    """
+    Открыть колоночный ``.arrow`` файл sample данных через memory map.
+
+    Args:
+        path: Путь к файлу
+
+    Returns:
+        :class:`SampleColumns` с метаданными, схемой и колонками
+
+    Raises:
+        FileNotFoundError: Если файл не найден
+        ValueError: Если файл не является sample файлом поддерживаемой версии
+    """
+    path = Path(path)
+    if not path.exists():
+        raise FileNotFoundError(f"Sample file not found: {path}")
+    try:
+        with pa.memory_map(str(path), 'r') as source:
+            # Буферы таблицы ссылаются на отображение и держат его открытым
+            table = pa.ipc.open_file(source).read_all()
+    except pa.ArrowInvalid as e:
+        raise ValueError(f"Not an Arrow IPC sample file: {path}: {e}")
+
+    metadata = table.schema.metadata or {}
+    if _SCHEMA_KEY not in metadata:
+        raise ValueError(f"Sample file has no schema metadata: {path}")
+    schema = json.loads(metadata[_SCHEMA_KEY])
+    info = json.loads(metadata.get(_INFO_KEY, b'{}'))
+    if schema.get('format_version') != STORAGE_FORMAT_VERSION:
+        raise ValueError(f"Unsupported sample file format: {schema.get('format_version')}")
+    return SampleColumns(info, schema, table)
+
+
+__all__ = [
+    'STORAGE_FORMAT_VERSION',
+    'SAMPLE_FILE_SUFFIX',
+    'SampleColumns',
+    'write_sample_file',
+    'read_sample_file',
+]
@@ -5,7 +5,8 @@
 валидации и конвертации sample данных.
 """
 
-import importlib
+from functools import lru_cache
+
 import pandas as pd
 import numpy as np
 from typing import Dict, List, Any, Optional, Union
@@ -15,25 +16,32 @@ from ...core.logging_config import get_logger
 from .datasets import (
     validate_dataset_name, 
     get_dataset_info, 
-    get_dataset_file_module,
+    get_dataset_file,
     list_dataset_names
 )
+from .storage import SampleColumns, read_sample_file
 
 logger = get_logger(__name__)
 
 
-def load_embedded_data(dataset_name: str) -> Dict[str, Any]:
+@lru_cache(maxsize=None)
+def _read_dataset_columns(dataset_name: str) -> SampleColumns:
+    """Колонки датасета (файл читается один раз на процесс)."""
+    return read_sample_file(get_dataset_file(dataset_name))
+
+
+def load_sample_columns(dataset_name: str) -> SampleColumns:
     """
-    Загрузить embedded данные для указанного датасета.
+    Загрузить колоночные данные датасета.
     
     Args:
         dataset_name: Название датасета
     
     Returns:
-        Словарь с ключами 'DATASET_INFO' и 'DATA'
+        :class:`~bquant.data.samples.storage.SampleColumns` (массивы только для чтения)
     
     Raises:
-        ImportError: Если не удается импортировать данные
+        ImportError: Если не удается прочитать файл данных
         KeyError: Если датасет не найден
     """
     logger.debug(f"Loading embedded data for dataset: {dataset_name}")
@@ -43,34 +51,74 @@ def load_embedded_data(dataset_name: str) -> Dict[str, Any]:
         available = list_dataset_names()
         raise KeyError(f"Dataset '{dataset_name}' not found. Available: {available}")
     
-    # Получаем имя модуля
-    module_name = get_dataset_file_module(dataset_name)
-    full_module_path = f"bquant.data.samples.{module_name}"
-    
     try:
-        # Импортируем модуль с данными
-        data_module = importlib.import_module(full_module_path)
-        
-        # Проверяем наличие необходимых атрибутов
-        if not hasattr(data_module, 'DATASET_INFO'):
-            raise ImportError(f"Module {full_module_path} missing DATASET_INFO")
-        
-        if not hasattr(data_module, 'DATA'):
-            raise ImportError(f"Module {full_module_path} missing DATA")
-        
-        result = {
-            'DATASET_INFO': data_module.DATASET_INFO,
-            'DATA': data_module.DATA
-        }
-        
-        logger.debug(f"Successfully loaded {len(result['DATA'])} records from {dataset_name}")
-        return result
-        
-    except ImportError as e:
-        logger.error(f"Failed to import embedded data for {dataset_name}: {e}")
+        return _read_dataset_columns(dataset_name)
+    except (OSError, ValueError, KeyError) as e:
+        logger.error(f"Failed to read embedded data for {dataset_name}: {e}")
         raise ImportError(f"Cannot load embedded data for '{dataset_name}': {e}")
 
 
+def load_embedded_data(dataset_name: str) -> Dict[str, Any]:
+    """
+    Загрузить embedded данные для указанного датасета.
+    
+    Args:
+        dataset_name: Название датасета
+    
+    Returns:
+        Словарь с ключами 'DATASET_INFO' и 'DATA'
+    
+    Raises:
+        ImportError: Если не удается загрузить данные
+        KeyError: Если датасет не найден
+    """
+    columns = load_sample_columns(dataset_name)
+    result = {
+        'DATASET_INFO': dict(columns.info),
+        'DATA': columns.to_records()
+    }
+    
+    logger.debug(f"Successfully loaded {len(result['DATA'])} records from {dataset_name}")
+    return result
+
+
+def load_embedded_frame(dataset_name: str) -> pd.DataFrame:
+    """
+    Загрузить embedded данные датасета сразу как DataFrame.
+    
+    DataFrame собирается из колонок без промежуточного списка словарей
+    и без повторного разбора времени; результат совпадает с
+    ``convert_to_dataframe(load_embedded_data(name)['DATA'], name)``.
+    
+    Args:
+        dataset_name: Название датасета
+    
+    Returns:
+        pandas DataFrame с данными (с метаданными в df.attrs)
+    
+    Raises:
+        ImportError: Если не удается загрузить данные
+        KeyError: Если датасет не найден
+    """
+    df = load_sample_columns(dataset_name).to_frame()
+    _attach_metadata(df, dataset_name)
+    logger.debug(f"Loaded DataFrame with shape {df.shape} for {dataset_name}")
+    return df
+
+
+def _attach_metadata(df: pd.DataFrame, dataset_name: str) -> None:
+    """Добавить метаданные датасета в df.attrs."""
+    try:
+        dataset_info = get_dataset_info(dataset_name)
+        df.attrs['symbol'] = dataset_info.get('symbol')
+        df.attrs['timeframe'] = dataset_info.get('timeframe')
+        df.attrs['source'] = dataset_info.get('source')
+        df.attrs['dataset_name'] = dataset_name
+        logger.debug(f"Added metadata to DataFrame.attrs: symbol={df.attrs['symbol']}, timeframe={df.attrs['timeframe']}")
+    except Exception as e:
+        logger.warning(f"Could not add metadata to DataFrame.attrs: {e}")
+
+
 def convert_to_dataframe(data: List[Dict[str, Any]], dataset_name: str) -> pd.DataFrame:
     """
     Конвертировать список словарей в pandas DataFrame.
@@ -106,15 +154,7 @@ def convert_to_dataframe(data: List[Dict[str, Any]], dataset_name: str) -> pd.Da
                 df[col] = pd.to_numeric(df[col], errors='coerce')
         
         # Добавляем метаданные в df.attrs
-        try:
-            dataset_info = get_dataset_info(dataset_name)
-            df.attrs['symbol'] = dataset_info.get('symbol')
-            df.attrs['timeframe'] = dataset_info.get('timeframe')
-            df.attrs['source'] = dataset_info.get('source')
-            df.attrs['dataset_name'] = dataset_name
-            logger.debug(f"Added metadata to DataFrame.attrs: symbol={df.attrs['symbol']}, timeframe={df.attrs['timeframe']}")
-        except Exception as e:
-            logger.warning(f"Could not add metadata to DataFrame.attrs: {e}")
+        _attach_metadata(df, dataset_name)
         
         logger.debug(f"Successfully created DataFrame with shape {df.shape}")
         return df
@@ -394,7 +434,9 @@ def compare_datasets(dataset1_name: str, dataset2_name: str) -> Dict[str, Any]:
 
 # Экспорт основных функций
 __all__ = [
+    'load_sample_columns',
     'load_embedded_data',
+    'load_embedded_frame',
     'convert_to_dataframe',
     'convert_to_list_of_dicts',
     'validate_data_integrity',
@@ -20,7 +20,14 @@ from .custom import (
     ExponentialMovingAverage,
     RelativeStrengthIndex,
     MACD,
-    BollingerBands
+    BollingerBands,
+    AverageTrueRange
+)
+
+# Streaming state for incremental indicator updates
+from .streaming import (
+    EwmState,
+    IndicatorState
 )
 
 # External library loaders (moved from loaders.py)
@@ -76,6 +83,7 @@ def _register_all_indicators():
         IndicatorFactory.register_indicator('rsi', RelativeStrengthIndex)
         IndicatorFactory.register_indicator('macd', MACD)
         IndicatorFactory.register_indicator('bbands', BollingerBands)
+        IndicatorFactory.register_indicator('atr', AverageTrueRange)
 
         # Загружаем индикаторы внешних библиотек через LibraryManager
         library_results = LibraryManager.load_all_libraries()
@@ -130,6 +138,11 @@ __all__ = [
     "RelativeStrengthIndex",
     "MACD",
     "BollingerBands",
+    "AverageTrueRange",
+    
+    # Streaming state
+    "EwmState",
+    "IndicatorState",
     
     # External library loaders (мигрированы в library/ на Этапе 5)
     "PandasTALoader",
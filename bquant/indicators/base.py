@@ -7,13 +7,16 @@ This module contains the base classes for all indicators in BQuant.
 import pandas as pd
 import numpy as np
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional, List, Type, Callable
+from typing import Dict, Any, Optional, List, Type, Callable, Tuple, TYPE_CHECKING
 from dataclasses import dataclass
 from enum import Enum
 
 from bquant.core.logging_config import get_logger
 from bquant.core.exceptions import IndicatorCalculationError
 
+if TYPE_CHECKING:
+    from .streaming import IndicatorState
+
 logger = get_logger(__name__)
 
 
@@ -437,6 +440,76 @@ class CustomIndicator(BaseIndicator):
         """
         pass
     
+    @property
+    def supports_streaming(self) -> bool:
+        """Поддерживает ли индикатор потоковый расчет (init_state/update)."""
+        return type(self).calculate_with_state is not CustomIndicator.calculate_with_state
+    
+    def calculate_with_state(self, data: pd.DataFrame) -> Tuple[IndicatorResult, 'IndicatorState']:
+        """
+        Вычисление индикатора на истории вместе с состоянием для продолжения.
+        
+        Args:
+            data: DataFrame с историей
+        
+        Returns:
+            (IndicatorResult по истории, IndicatorState)
+        """
+        raise NotImplementedError(f"Indicator '{self.name}' does not support streaming updates")
+    
+    def init_state(self, history: pd.DataFrame) -> 'IndicatorState':
+        """
+        Инициализировать состояние потокового расчета по истории.
+        
+        Args:
+            history: DataFrame с историей
+        
+        Returns:
+            IndicatorState для последующих вызовов update()
+        """
+        return self.calculate_with_state(history)[1]
+    
+    def update(self, state: 'IndicatorState', new_bars: pd.DataFrame) -> IndicatorResult:
+        """
+        Продолжить расчет на новых барах (состояние обновляется на месте).
+        
+        Стоимость пропорциональна числу новых баров и не зависит от длины истории.
+        
+        Args:
+            state: Состояние из init_state()/calculate_with_state()
+            new_bars: Новые бары (строго после уже обработанных)
+        
+        Returns:
+            IndicatorResult только для новых баров
+        """
+        if not self.supports_streaming:
+            raise NotImplementedError(f"Indicator '{self.name}' does not support streaming updates")
+        if state.name != self.name:
+            raise ValueError(f"State belongs to indicator '{state.name}', not '{self.name}'")
+        if len(new_bars) == 0:
+            return self._streaming_result(pd.DataFrame(columns=self.get_output_columns(), index=new_bars.index), state)
+        try:
+            data = self._update_state(state, new_bars)
+        except Exception as e:
+            raise IndicatorCalculationError(
+                f"Failed to update {self.name}: {e}",
+                {'indicator': self.name, 'parameters': state.params}
+            )
+        state.n_bars += len(new_bars)
+        return self._streaming_result(data, state)
+    
+    def _update_state(self, state: 'IndicatorState', new_bars: pd.DataFrame) -> pd.DataFrame:
+        """Расчет значений для новых баров (переопределяется потоковыми индикаторами)."""
+        raise NotImplementedError(f"Indicator '{self.name}' does not support streaming updates")
+    
+    def _streaming_result(self, data: pd.DataFrame, state: 'IndicatorState') -> IndicatorResult:
+        return IndicatorResult(
+            name=self.name,
+            data=data,
+            config=self.config,
+            metadata={**state.params, 'calculation_method': 'streaming', 'bars_processed': state.n_bars}
+        )
+    
     def get_statistics(self, data: pd.DataFrame) -> Dict[str, Any]:
         """
         Возвращает статистику по данным индикатора.
@@ -11,6 +11,7 @@ from .ema import ExponentialMovingAverage
 from .rsi import RelativeStrengthIndex
 from .macd import MACD
 from .bollinger import BollingerBands
+from .atr import AverageTrueRange
 
 # Custom indicators
 # Users can create their own indicators inheriting from CustomIndicator
@@ -22,6 +23,7 @@ __all__ = [
     "RelativeStrengthIndex",
     "MACD",
     "BollingerBands",
+    "AverageTrueRange",
     
     # Custom indicators (to be added by users)
     
@@ -39,6 +41,7 @@ try:
     IndicatorFactory.register_indicator("rsi", RelativeStrengthIndex)
     IndicatorFactory.register_indicator("macd", MACD)
     IndicatorFactory.register_indicator("bbands", BollingerBands)
+    IndicatorFactory.register_indicator("atr", AverageTrueRange)
     
     # Тихая регистрация: используем DEBUG через логгер фабрики на этапе register
     # (здесь избегаем print, чтобы не шуметь в консоли)
@@ -70,6 +73,8 @@ def register_builtin_indicators():
         registered_count += 1
         IndicatorFactory.register_indicator("bbands", BollingerBands)
         registered_count += 1
+        IndicatorFactory.register_indicator("atr", AverageTrueRange)
+        registered_count += 1
         
         # Тихая регистрация: не печатаем в консоль, полагаться на логи фабрики
         return registered_count
@@ -0,0 +1,162 @@
+"""
+Average True Range (ATR) Indicator
+
+Custom implementation of ATR indicator for BQuant.
+"""
+
+import pandas as pd
+import numpy as np
+from typing import Dict, Any, Optional, List, Tuple
+
+from ..base import CustomIndicator, IndicatorResult, IndicatorConfig, IndicatorSource
+from ..streaming import IndicatorState, ewm_mean, ewm_state, true_range
+from ...core.exceptions import IndicatorCalculationError
+from ...core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+class AverageTrueRange(CustomIndicator):
+    """
+    Average True Range (ATR) indicator.
+
+    Wilder's smoothing (``ewm(alpha=1/period, adjust=False)``) of the true range.
+    The output column is ``atr``, the name zone features look for.
+    """
+
+    def __init__(self, period: int = 14):
+        """
+        Initialize ATR indicator.
+
+        Args:
+            period: Smoothing period
+        """
+        self.period = period
+        super().__init__('atr', {'period': period})
+
+    def get_output_columns(self) -> List[str]:
+        """Returns output columns."""
+        return ['atr']
+
+    def get_description(self) -> str:
+        """Returns indicator description."""
+        return f"Average True Range with {self.period} period"
+
+    def get_min_records(self) -> int:
+        """Returns minimum records required."""
+        return self.period
+
+    def get_required_columns(self) -> List[str]:
+        """Returns required input columns."""
+        return ['high', 'low', 'close']
+
+    @staticmethod
+    def _true_range(data: pd.DataFrame, prev_close: float = np.nan) -> np.ndarray:
+        return true_range(
+            data['high'].to_numpy(dtype=np.float64),
+            data['low'].to_numpy(dtype=np.float64),
+            data['close'].to_numpy(dtype=np.float64),
+            prev_close
+        )
+
+    def calculate(self, data: pd.DataFrame, **kwargs) -> IndicatorResult:
+        """
+        Calculate ATR.
+
+        Args:
+            data: DataFrame with OHLC data
+            **kwargs: Additional parameters
+
+        Returns:
+            IndicatorResult with ATR values
+        """
+        try:
+            self.validate_data(data)
+
+            period = kwargs.get('period', self.period)
+
+            self.logger.info(f"Calculating ATR with period {period}")
+
+            tr = pd.Series(self._true_range(data), index=data.index)
+            atr_values = tr.ewm(alpha=1 / period, adjust=False).mean()
+
+            result_data = pd.DataFrame({
+                'atr': atr_values
+            }, index=data.index)
+
+            return IndicatorResult(
+                name=self.name,
+                data=result_data,
+                config=self.config,
+                metadata={
+                    'period': period,
+                    'calculation_method': 'wilder_smoothing',
+                    'first_valid_index': result_data.first_valid_index(),
+                    'last_valid_index': result_data.last_valid_index()
+                }
+            )
+
+        except Exception as e:
+            raise IndicatorCalculationError(
+                f"Failed to calculate ATR: {e}",
+                {'indicator': self.name, 'period': period}
+            )
+
+    def calculate_with_state(self, data: pd.DataFrame) -> Tuple[IndicatorResult, IndicatorState]:
+        """Calculate ATR on history and keep the smoothing state and last close."""
+        result = self.calculate(data)
+        closes = data['close'].to_numpy(dtype=np.float64)
+        state = IndicatorState(
+            name=self.name,
+            params={'period': self.period},
+            ewm={'atr': ewm_state(self._true_range(data), result.data['atr'].to_numpy(),
+                                  1.0 / self.period, adjust=False)},
+            last={'close': float(closes[-1]) if len(closes) else np.nan},
+            n_bars=len(data)
+        )
+        return result, state
+
+    def _update_state(self, state: IndicatorState, new_bars: pd.DataFrame) -> pd.DataFrame:
+        values = ewm_mean(self._true_range(new_bars, state.last['close']), state.ewm['atr'])
+        state.last['close'] = float(new_bars['close'].iloc[-1])
+        return pd.DataFrame({'atr': values}, index=new_bars.index)
+
+    @classmethod
+    def get_default_columns(cls) -> List[str]:
+        """Returns default output columns."""
+        return ['atr']
+
+    @classmethod
+    def get_info(cls) -> Dict[str, Any]:
+        """Returns class information."""
+        return {
+            'name': 'AverageTrueRange',
+            'type': 'CUSTOM',
+            'description': 'Average True Range indicator implementation (Wilder smoothing)',
+            'default_columns': cls.get_default_columns(),
+            'required_fields': {
+                'high': 'High price values (numeric)',
+                'low': 'Low price values (numeric)',
+                'close': 'Close price values (numeric)'
+            },
+            'parameters': {
+                'period': 'Smoothing period (default: 14)'
+            },
+            'usage_examples': {
+                'basic': "AverageTrueRange()",
+                'custom_period': "AverageTrueRange(period=20)"
+            },
+            'data_requirements': {
+                'min_records': 14,
+                'column_types': 'numeric',
+                'required_columns': ['high', 'low', 'close']
+            },
+            'available_methods': [
+                'calculate()',
+                'calculate_with_state()',
+                'init_state()',
+                'update()',
+                'validate_data()',
+                'get_statistics()'
+            ]
+        }
@@ -6,9 +6,10 @@ Custom implementation of Bollinger Bands indicator for BQuant.
 
 import pandas as pd
 import numpy as np
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 
 from ..base import CustomIndicator, IndicatorResult, IndicatorConfig, IndicatorSource
+from ..streaming import IndicatorState, rolling_apply
 from ...core.exceptions import IndicatorCalculationError
 from ...core.logging_config import get_logger
 
@@ -106,6 +107,38 @@ class BollingerBands(CustomIndicator):
                 {'indicator': self.name, 'period': period, 'std_dev': std_dev}
             )
     
+    def calculate_with_state(self, data: pd.DataFrame) -> Tuple[IndicatorResult, IndicatorState]:
+        """Calculate Bollinger Bands on history and keep the last ``period - 1`` closes."""
+        result = self.calculate(data)
+        closes = data['close'].to_numpy(dtype=np.float64)
+        state = IndicatorState(
+            name=self.name,
+            params={'period': self.period, 'std_dev': self.std_dev},
+            tails={'close': closes[len(closes) - (self.period - 1):].copy() if self.period > 1 else closes[:0].copy()},
+            n_bars=len(data)
+        )
+        return result, state
+    
+    def _update_state(self, state: IndicatorState, new_bars: pd.DataFrame) -> pd.DataFrame:
+        closes = new_bars['close'].to_numpy(dtype=np.float64)
+        tail = state.tails['close']
+        middle_band, _ = rolling_apply(tail, closes, self.period, lambda windows: windows.mean(axis=1))
+        std, state.tails['close'] = rolling_apply(
+            tail, closes, self.period, lambda windows: windows.std(axis=1, ddof=1)
+        )
+        upper_band = middle_band + (std * self.std_dev)
+        lower_band = middle_band - (std * self.std_dev)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            bb_width = (upper_band - lower_band) / middle_band * 100
+            bb_percent = (closes - lower_band) / (upper_band - lower_band) * 100
+        return pd.DataFrame({
+            'bb_upper': upper_band,
+            'bb_middle': middle_band,
+            'bb_lower': lower_band,
+            'bb_width': bb_width,
+            'bb_percent': bb_percent
+        }, index=new_bars.index)
+    
     @classmethod
     def get_default_columns(cls) -> List[str]:
         """Returns default output columns."""
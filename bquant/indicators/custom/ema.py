@@ -6,9 +6,10 @@ Custom implementation of EMA indicator for BQuant.
 
 import pandas as pd
 import numpy as np
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 
 from ..base import CustomIndicator, IndicatorResult, IndicatorConfig, IndicatorSource
+from ..streaming import IndicatorState, ewm_mean, ewm_state
 from ...core.exceptions import IndicatorCalculationError
 from ...core.logging_config import get_logger
 
@@ -88,6 +89,23 @@ class ExponentialMovingAverage(CustomIndicator):
                 {'indicator': self.name, 'period': period}
             )
     
+    def calculate_with_state(self, data: pd.DataFrame) -> Tuple[IndicatorResult, IndicatorState]:
+        """Calculate EMA on history and keep the recursive state."""
+        result = self.calculate(data)
+        alpha = 2.0 / (self.period + 1.0)
+        state = IndicatorState(
+            name=self.name,
+            params={'period': self.period},
+            ewm={'ema': ewm_state(data['close'].to_numpy(dtype=np.float64),
+                                  result.data[f'ema_{self.period}'].to_numpy(), alpha, adjust=False)},
+            n_bars=len(data)
+        )
+        return result, state
+    
+    def _update_state(self, state: IndicatorState, new_bars: pd.DataFrame) -> pd.DataFrame:
+        values = ewm_mean(new_bars['close'].to_numpy(dtype=np.float64), state.ewm['ema'])
+        return pd.DataFrame({f'ema_{self.period}': values}, index=new_bars.index)
+    
     @classmethod
     def get_default_columns(cls) -> List[str]:
         """Returns default output columns."""
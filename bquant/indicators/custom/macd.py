@@ -6,9 +6,10 @@ Custom implementation of MACD indicator for BQuant.
 
 import pandas as pd
 import numpy as np
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 
 from ..base import CustomIndicator, IndicatorResult, IndicatorConfig, IndicatorSource
+from ..streaming import IndicatorState, ewm_mean, ewm_state
 from ...core.exceptions import IndicatorCalculationError
 from ...core.logging_config import get_logger
 
@@ -125,6 +126,42 @@ class MACD(CustomIndicator):
                 }
             )
     
+    def calculate_with_state(self, data: pd.DataFrame) -> Tuple[IndicatorResult, IndicatorState]:
+        """Calculate MACD on history and keep the three EWM states."""
+        result = self.calculate(data)
+        closes = data['close'].to_numpy(dtype=np.float64)
+        fast_alpha = 2.0 / (self.fast_period + 1.0)
+        slow_alpha = 2.0 / (self.slow_period + 1.0)
+        fast = data['close'].ewm(span=self.fast_period).mean().to_numpy()
+        slow = data['close'].ewm(span=self.slow_period).mean().to_numpy()
+        macd_line = result.data['macd'].to_numpy()
+        state = IndicatorState(
+            name=self.name,
+            params={
+                'fast_period': self.fast_period,
+                'slow_period': self.slow_period,
+                'signal_period': self.signal_period
+            },
+            ewm={
+                'fast': ewm_state(closes, fast, fast_alpha),
+                'slow': ewm_state(closes, slow, slow_alpha),
+                'signal': ewm_state(macd_line, result.data['macd_signal'].to_numpy(),
+                                    2.0 / (self.signal_period + 1.0)),
+            },
+            n_bars=len(data)
+        )
+        return result, state
+    
+    def _update_state(self, state: IndicatorState, new_bars: pd.DataFrame) -> pd.DataFrame:
+        closes = new_bars['close'].to_numpy(dtype=np.float64)
+        macd_line = ewm_mean(closes, state.ewm['fast']) - ewm_mean(closes, state.ewm['slow'])
+        signal_line = ewm_mean(macd_line, state.ewm['signal'])
+        return pd.DataFrame({
+            'macd': macd_line,
+            'macd_signal': signal_line,
+            'macd_hist': macd_line - signal_line
+        }, index=new_bars.index)
+    
     @classmethod
     def get_default_columns(cls) -> List[str]:
         """Returns default output columns."""
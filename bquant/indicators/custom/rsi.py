@@ -6,9 +6,10 @@ Custom implementation of RSI indicator for BQuant.
 
 import pandas as pd
 import numpy as np
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 
 from ..base import CustomIndicator, IndicatorResult, IndicatorConfig, IndicatorSource
+from ..streaming import IndicatorState, ewm_mean, ewm_state
 from ...core.exceptions import IndicatorCalculationError
 from ...core.logging_config import get_logger
 
@@ -101,6 +102,42 @@ class RelativeStrengthIndex(CustomIndicator):
                 {'indicator': self.name, 'period': period}
             )
     
+    @staticmethod
+    def _gains_losses(closes: np.ndarray, prev_close: float) -> Tuple[np.ndarray, np.ndarray]:
+        changes = np.diff(closes, prepend=prev_close)
+        # NaN-изменения дают 0, как Series.where в calculate()
+        gains = np.where(changes > 0, changes, 0.0)
+        losses = np.where(changes < 0, -changes, 0.0)
+        return gains, losses
+    
+    def calculate_with_state(self, data: pd.DataFrame) -> Tuple[IndicatorResult, IndicatorState]:
+        """Calculate RSI on history and keep the smoothed gain/loss state."""
+        result = self.calculate(data)
+        closes = data['close'].to_numpy(dtype=np.float64)
+        alpha = 1.0 / self.period
+        gains, losses = self._gains_losses(closes, np.nan)
+        state = IndicatorState(
+            name=self.name,
+            params={'period': self.period},
+            ewm={
+                'gain': ewm_state(gains, pd.Series(gains).ewm(alpha=alpha).mean().to_numpy(), alpha),
+                'loss': ewm_state(losses, pd.Series(losses).ewm(alpha=alpha).mean().to_numpy(), alpha),
+            },
+            last={'close': float(closes[-1]) if len(closes) else np.nan},
+            n_bars=len(data)
+        )
+        return result, state
+    
+    def _update_state(self, state: IndicatorState, new_bars: pd.DataFrame) -> pd.DataFrame:
+        closes = new_bars['close'].to_numpy(dtype=np.float64)
+        gains, losses = self._gains_losses(closes, state.last['close'])
+        avg_gains = ewm_mean(gains, state.ewm['gain'])
+        avg_losses = ewm_mean(losses, state.ewm['loss'])
+        state.last['close'] = float(closes[-1])
+        with np.errstate(invalid='ignore', divide='ignore'):
+            rsi_values = 100 - (100 / (1 + avg_gains / avg_losses))
+        return pd.DataFrame({f'rsi_{self.period}': rsi_values}, index=new_bars.index)
+    
     @classmethod
     def get_default_columns(cls) -> List[str]:
         """Returns default output columns."""
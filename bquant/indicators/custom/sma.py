@@ -6,9 +6,10 @@ Custom implementation of SMA indicator for BQuant.
 
 import pandas as pd
 import numpy as np
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 
 from ..base import CustomIndicator, IndicatorResult, IndicatorConfig, IndicatorSource
+from ..streaming import IndicatorState, rolling_apply
 from ...core.exceptions import IndicatorCalculationError
 from ...core.logging_config import get_logger
 
@@ -88,6 +89,25 @@ class SimpleMovingAverage(CustomIndicator):
                 {'indicator': self.name, 'period': period}
             )
     
+    def calculate_with_state(self, data: pd.DataFrame) -> Tuple[IndicatorResult, IndicatorState]:
+        """Calculate SMA on history and keep the last ``period - 1`` closes."""
+        result = self.calculate(data)
+        closes = data['close'].to_numpy(dtype=np.float64)
+        state = IndicatorState(
+            name=self.name,
+            params={'period': self.period},
+            tails={'close': closes[len(closes) - (self.period - 1):].copy() if self.period > 1 else closes[:0].copy()},
+            n_bars=len(data)
+        )
+        return result, state
+    
+    def _update_state(self, state: IndicatorState, new_bars: pd.DataFrame) -> pd.DataFrame:
+        values, state.tails['close'] = rolling_apply(
+            state.tails['close'], new_bars['close'].to_numpy(dtype=np.float64),
+            self.period, lambda windows: windows.mean(axis=1)
+        )
+        return pd.DataFrame({f'sma_{self.period}': values}, index=new_bars.index)
+    
     @classmethod
     def get_default_columns(cls) -> List[str]:
         """Returns default output columns."""
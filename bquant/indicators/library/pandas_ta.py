@@ -5,16 +5,30 @@ discovering all callable indicators dynamically and generating lightweight
 wrappers for them. The goal is to avoid handwritten wrappers for every
 indicator and keep the available indicator list in sync with what pandas-ta
 exposes.
+
+Registration is cheap and lazy: at load time only signatures are inspected
+(or read from the on-disk manifest) and wrapper classes are registered; the
+sample-data probe that determines output column names runs on the first
+instantiation of each indicator. Signatures and probed column names are
+persisted to ``pandas_ta_manifest_<version>.json`` in the cache directory,
+so subsequent processes (e.g. pool workers) start without probing at all.
 """
 
 from __future__ import annotations
 
 import inspect
+import json
+import os
+import re
+import threading
+from importlib import metadata
+from pathlib import Path
 from typing import Any, Callable, Dict, Iterable, List, Optional
 
 import pandas as pd
 
 from ..base import IndicatorFactory, IndicatorResult, LibraryIndicator
+from ...core.config import get_cache_config
 from ...core.exceptions import IndicatorCalculationError
 from ...core.logging_config import get_logger
 
@@ -28,6 +42,13 @@ class PandasTALoader:
     _available_indicators: List[str] = []
     _ta_module: Optional[Any] = None
     _function_cache: Dict[str, Callable] = {}
+    _configs: Dict[str, Dict[str, Any]] = {}
+    _manifest: Optional[Dict[str, Any]] = None
+    _lock = threading.RLock()
+
+    # Директория манифеста (None = cache_dir из CACHE_CONFIG или ~/.cache/bquant)
+    manifest_dir: Optional[Path] = None
+    MANIFEST_VERSION = 1
 
     _PRICE_PARAM_COLUMNS: Dict[str, str] = {
         "open": "open",
@@ -115,7 +136,12 @@ class PandasTALoader:
     # ------------------------------------------------------------------
     @classmethod
     def register_indicators(cls) -> int:
-        """Зарегистрировать индикаторы pandas-ta в IndicatorFactory."""
+        """Зарегистрировать индикаторы pandas-ta в IndicatorFactory.
+
+        Функции не вызываются: конфигурация берется из манифеста или из
+        сигнатуры, а названия выходных колонок определяются при первом
+        создании индикатора (:meth:`_resolve_output_columns`).
+        """
 
         if cls._indicators_registered:
             return len(cls._available_indicators)
@@ -127,32 +153,47 @@ class PandasTALoader:
         if not cls._function_cache:
             cls._discover_all_functions()
 
-        registered = 0
-        registered_names: List[str] = []
+        with cls._lock:
+            entries = cls._load_manifest()["indicators"]
+            manifest_changed = False
 
-        for func_name, func in cls._function_cache.items():
-            config = cls._analyze_function_dynamically(func_name, func)
-            if config is None:
-                continue
+            registered = 0
+            registered_names: List[str] = []
+            cls._configs = {}
 
-            try:
-                indicator_class = cls._create_indicator_class_dynamically(
-                    func_name, config
-                )
-            except Exception as exc:  # pragma: no cover - defensive logging
-                logger.debug(
-                    "Failed to create dynamic pandas-ta indicator %s: %s",
-                    func_name,
-                    exc,
-                )
-                continue
+            for func_name, func in cls._function_cache.items():
+                entry = entries.get(func_name)
+                if entry is None or entry.get("origin") != cls._function_origin(func):
+                    entry = cls._analyze_function_dynamically(func_name, func)
+                    entries[func_name] = entry
+                    manifest_changed = True
 
-            registry_key = f"pandas_ta_{func_name}".lower()
-            IndicatorFactory.register_indicator(registry_key, indicator_class)
-            IndicatorFactory.register_library_function(registry_key, func)
+                if not entry["supported"]:
+                    continue
+
+                config = {**entry, "function": func}
+                try:
+                    indicator_class = cls._create_indicator_class_dynamically(
+                        func_name, config
+                    )
+                except Exception as exc:  # pragma: no cover - defensive logging
+                    logger.debug(
+                        "Failed to create dynamic pandas-ta indicator %s: %s",
+                        func_name,
+                        exc,
+                    )
+                    continue
 
-            registered += 1
-            registered_names.append(func_name)
+                cls._configs[func_name] = config
+                registry_key = f"pandas_ta_{func_name}".lower()
+                IndicatorFactory.register_indicator(registry_key, indicator_class)
+                IndicatorFactory.register_library_function(registry_key, func)
+
+                registered += 1
+                registered_names.append(func_name)
+
+            if manifest_changed:
+                cls._save_manifest()
 
         cls._available_indicators = sorted(registered_names)
         cls._indicators_registered = True
@@ -161,20 +202,144 @@ class PandasTALoader:
 
         return registered
 
+    @classmethod
+    def _resolve_output_columns(
+        cls, func_name: str, config: Optional[Dict[str, Any]] = None
+    ) -> List[str]:
+        """Названия выходных колонок (probe на sample data при первом вызове)."""
+
+        with cls._lock:
+            config = config if config is not None else cls._configs[func_name]
+            if config["output_columns"] is not None:
+                return config["output_columns"]
+
+            from .manager import _quiet_stdout_stderr
+
+            with _quiet_stdout_stderr():
+                output_columns = cls._determine_output_columns(
+                    func_name,
+                    config["function"],
+                    config["price_params"],
+                    config["tunable_params"],
+                )
+            entry = cls._load_manifest()["indicators"].get(func_name)
+            if output_columns is None:
+                # Индикатор неработоспособен: снимаем регистрацию и помним об этом
+                config["supported"] = False
+                if entry is not None:
+                    entry.update(supported=False, reason="probe_failed")
+                cls._save_manifest()
+                registry_key = f"pandas_ta_{func_name}".lower()
+                IndicatorFactory._registry.pop(registry_key, None)
+                IndicatorFactory._library_functions.pop(registry_key, None)
+                if func_name in cls._available_indicators:
+                    cls._available_indicators.remove(func_name)
+                raise KeyError(
+                    f"LIBRARY indicator '{func_name}' from 'pandas_ta' failed on sample data"
+                )
+
+            config["output_columns"] = output_columns
+            if entry is not None:
+                entry["output_columns"] = output_columns
+            cls._save_manifest()
+            return output_columns
+
+    # ------------------------------------------------------------------
+    # Manifest
+    # ------------------------------------------------------------------
+    @classmethod
+    def _library_version(cls) -> str:
+        try:
+            return metadata.version("pandas_ta")
+        except metadata.PackageNotFoundError:
+            return getattr(cls._ta_module, "version", None) or "unknown"
+
+    @classmethod
+    def get_manifest_path(cls) -> Path:
+        """Путь к манифесту для установленной версии pandas-ta."""
+
+        directory = cls.manifest_dir or get_cache_config().get("cache_dir")
+        directory = Path(directory) if directory else Path.home() / ".cache" / "bquant"
+        version = re.sub(r"[^0-9A-Za-z_.-]", "_", cls._library_version())
+        return directory / f"pandas_ta_manifest_{version}.json"
+
+    @staticmethod
+    def _function_origin(func: Callable) -> str:
+        return f"{getattr(func, '__module__', '')}.{getattr(func, '__qualname__', '')}"
+
+    @classmethod
+    def _load_manifest(cls) -> Dict[str, Any]:
+        if cls._manifest is not None:
+            return cls._manifest
+
+        manifest = {
+            "manifest_version": cls.MANIFEST_VERSION,
+            "library_version": cls._library_version(),
+            "indicators": {},
+        }
+        path = cls.get_manifest_path()
+        try:
+            with open(path, "r", encoding="utf-8") as handle:
+                stored = json.load(handle)
+            if (
+                stored.get("manifest_version") == cls.MANIFEST_VERSION
+                and stored.get("library_version") == manifest["library_version"]
+            ):
+                manifest["indicators"] = stored.get("indicators", {})
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as exc:
+            logger.debug("Ignoring unreadable pandas-ta manifest %s: %s", path, exc)
+
+        cls._manifest = manifest
+        return manifest
+
+    @classmethod
+    def _save_manifest(cls) -> None:
+        """Атомарно записать манифест (ошибки записи не критичны)."""
+
+        manifest = cls._load_manifest()
+        serializable = {}
+        for name, entry in manifest["indicators"].items():
+            try:
+                json.dumps(entry)
+            except (TypeError, ValueError):
+                continue  # несериализуемые значения по умолчанию - анализируем заново
+            serializable[name] = entry
+
+        path = cls.get_manifest_path()
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as handle:
+                json.dump({**manifest, "indicators": serializable}, handle)
+            os.replace(tmp_path, path)
+        except OSError as exc:
+            logger.debug("Failed to write pandas-ta manifest %s: %s", path, exc)
+
     # ------------------------------------------------------------------
     # Dynamic indicator analysis & generation
     # ------------------------------------------------------------------
     @classmethod
     def _analyze_function_dynamically(
         cls, func_name: str, func: Callable
-    ) -> Optional[Dict[str, Any]]:
-        """Собрать конфигурацию для динамического индикатора."""
+    ) -> Dict[str, Any]:
+        """Собрать конфигурацию (запись манифеста) по сигнатуре функции.
+
+        Функция не вызывается; ``output_columns`` остается ``None`` до
+        первого создания индикатора.
+        """
+
+        origin = cls._function_origin(func)
+
+        def unsupported(reason: str) -> Dict[str, Any]:
+            return {"origin": origin, "supported": False, "reason": reason}
 
         try:
             signature = inspect.signature(func)
         except (TypeError, ValueError):  # pragma: no cover - rare cases
             logger.debug("Failed to inspect signature for %s", func_name)
-            return None
+            return unsupported("signature")
 
         price_params: List[Dict[str, Any]] = []
         unsupported_required: List[str] = []
@@ -185,7 +350,7 @@ class PandasTALoader:
             if param.kind == inspect.Parameter.VAR_POSITIONAL:
                 # Сложно обработать произвольные *args автоматически.
                 logger.debug("Skipping %s: unsupported *args", func_name)
-                return None
+                return unsupported("var_positional")
 
             if param.kind == inspect.Parameter.VAR_KEYWORD:
                 accepts_kwargs = True
@@ -210,7 +375,7 @@ class PandasTALoader:
 
         if not price_params:
             logger.debug("Skipping %s: no price parameters detected", func_name)
-            return None
+            return unsupported("no_price_params")
 
         if unsupported_required:
             logger.debug(
@@ -218,13 +383,7 @@ class PandasTALoader:
                 func_name,
                 unsupported_required,
             )
-            return None
-
-        output_columns = cls._determine_output_columns(
-            func_name, func, price_params, tunable_params
-        )
-        if output_columns is None:
-            return None
+            return unsupported("required_params")
 
         description = (
             func.__doc__.strip().splitlines()[0]
@@ -233,11 +392,12 @@ class PandasTALoader:
         )
 
         return {
-            "function": func,
+            "origin": origin,
+            "supported": True,
             "price_params": price_params,
             "tunable_params": tunable_params,
             "accepts_kwargs": accepts_kwargs,
-            "output_columns": output_columns,
+            "output_columns": None,
             "description": description,
         }
 
@@ -338,11 +498,16 @@ class PandasTALoader:
             }
         )
         tunable_params = config["tunable_params"]
-        output_columns = config["output_columns"]
         description = config["description"]
         library_function = config["function"]
+        loader = cls
 
         def __init__(self, **kwargs):
+            output_columns = (
+                config["output_columns"]
+                if config["output_columns"] is not None
+                else loader._resolve_output_columns(func_name, config)
+            )
             parameters = dict(tunable_params)
             parameters.update(kwargs)
             LibraryIndicator.__init__(
@@ -376,6 +541,7 @@ class PandasTALoader:
                 )
 
             params = {**self.config.parameters, **kwargs}
+            output_columns = self.config.columns
             call_kwargs: Dict[str, Any] = {}
 
             for price_param in price_params:
@@ -0,0 +1,218 @@
+"""
+Streaming indicator kernels with carried state
+
+Рекурсивные (EWM) и оконные (rolling) ядра для индикаторов с сохранением
+состояния между вызовами:
+
+- ``ewm_mean`` — экспоненциальное сглаживание через ``scipy.signal.lfilter``
+  (скорость C) с семантикой ``Series.ewm(...).mean()`` (``adjust=True/False``);
+- ``rolling_apply`` — оконные статистики по хвосту предыдущих значений и новым
+  значениям (``sliding_window_view``);
+- ``IndicatorState`` — контейнер состояния, который возвращает
+  ``CustomIndicator.init_state`` и обновляет ``CustomIndicator.update``.
+
+Обновление на один бар стоит O(1) (для оконных индикаторов — O(period)) и не
+зависит от длины истории.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import numpy as np
+from scipy.signal import lfilter
+
+
+@dataclass
+class EwmState:
+    """
+    Состояние экспоненциального сглаживания.
+
+    Attributes:
+        alpha: Коэффициент сглаживания
+        adjust: Семантика ``adjust`` из pandas
+        mean: Текущее значение (NaN до первого наблюдения)
+        weight: Сумма весов (``adjust=True``) или вес последнего значения
+            с учетом пропусков (``adjust=False``)
+    """
+    alpha: float
+    adjust: bool = True
+    mean: float = np.nan
+    weight: float = 0.0
+
+    @classmethod
+    def from_span(cls, span: float, adjust: bool = True) -> 'EwmState':
+        return cls(alpha=2.0 / (span + 1.0), adjust=adjust)
+
+
+@dataclass
+class IndicatorState:
+    """
+    Состояние потокового расчета индикатора.
+
+    Attributes:
+        name: Название индикатора
+        params: Параметры расчета
+        ewm: Именованные EWM-состояния
+        tails: Хвосты входных рядов, необходимые оконным расчетам
+        last: Последние значения входов (например, предыдущий close)
+        n_bars: Количество обработанных баров
+    """
+    name: str
+    params: Dict[str, Any]
+    ewm: Dict[str, EwmState] = field(default_factory=dict)
+    tails: Dict[str, np.ndarray] = field(default_factory=dict)
+    last: Dict[str, float] = field(default_factory=dict)
+    n_bars: int = 0
+
+
+def _ewm_loop(values: np.ndarray, state: EwmState) -> np.ndarray:
+    """Последовательная реализация алгоритма pandas ``ewma`` (``ignore_na=False``)."""
+    decay = 1.0 - state.alpha
+    new_weight = 1.0 if state.adjust else state.alpha
+    mean, weight = state.mean, state.weight
+    out = np.empty(len(values), dtype=np.float64)
+    for i, value in enumerate(values):
+        if mean == mean:  # уже было наблюдение
+            weight *= decay
+            if value == value:
+                if mean != value:
+                    mean = (weight * mean + new_weight * value) / (weight + new_weight)
+                weight = weight + new_weight if state.adjust else 1.0
+        elif value == value:
+            mean, weight = value, 1.0
+        out[i] = mean
+    state.mean, state.weight = mean, weight
+    return out
+
+
+def ewm_mean(values: np.ndarray, state: EwmState) -> np.ndarray:
+    """
+    Продолжить экспоненциальное сглаживание ряда из состояния.
+
+    Результат совпадает с ``pd.Series(values).ewm(alpha=..., adjust=...).mean()``
+    на всей истории; ``state`` обновляется на месте.
+
+    Args:
+        values: Новые значения
+        state: EWM-состояние (изменяется)
+
+    Returns:
+        Сглаженные значения для ``values``
+    """
+    values = np.asarray(values, dtype=np.float64)
+    if len(values) == 0:
+        return values.copy()
+
+    decay = 1.0 - state.alpha
+    valid = ~np.isnan(values)
+
+    if state.adjust:
+        # mean = sum(w_i * x_i) / sum(w_i); числитель и знаменатель - однополюсные фильтры
+        prev_weight = state.weight if state.mean == state.mean else 0.0
+        prev_num = state.mean * prev_weight if prev_weight else 0.0
+        num, _ = lfilter([1.0], [1.0, -decay], np.where(valid, values, 0.0), zi=[decay * prev_num])
+        den, _ = lfilter([1.0], [1.0, -decay], valid.astype(np.float64), zi=[decay * prev_weight])
+        with np.errstate(invalid='ignore', divide='ignore'):
+            out = num / den
+        # До первого наблюдения значение не определено (0/0 -> NaN)
+        state.weight = float(den[-1])
+        state.mean = float(out[-1]) if den[-1] > 0 else np.nan
+        return out
+
+    if not valid.all():
+        # Пропуски внутри ряда меняют веса нелинейно - точный последовательный алгоритм
+        return _ewm_loop(values, state)
+    if state.mean == state.mean and state.weight != 1.0:
+        # Предыдущий блок закончился пропусками: первый бар с "затухшим" весом
+        head = _ewm_loop(values[:1], state)
+        return np.concatenate([head, ewm_mean(values[1:], state)])
+
+    out = np.empty(len(values), dtype=np.float64)
+    start = 0
+    prev = state.mean
+    if prev != prev:
+        out[0] = prev = values[0]
+        start = 1
+    if start < len(values):
+        out[start:], _ = lfilter([state.alpha], [1.0, -decay], values[start:], zi=[decay * prev])
+    state.mean = float(out[-1])
+    state.weight = 1.0
+    return out
+
+
+def ewm_init(values: np.ndarray, span: Optional[float] = None, alpha: Optional[float] = None,
+             adjust: bool = True) -> Tuple[np.ndarray, EwmState]:
+    """Сгладить полный ряд и вернуть значения вместе с конечным состоянием."""
+    if alpha is None:
+        if span is None:
+            raise ValueError("Either span or alpha must be provided")
+        alpha = 2.0 / (span + 1.0)
+    state = EwmState(alpha=alpha, adjust=adjust)
+    return ewm_mean(values, state), state
+
+
+def ewm_state(values: np.ndarray, smoothed: np.ndarray, alpha: float,
+              adjust: bool = True) -> EwmState:
+    """
+    Восстановить EWM-состояние по истории и уже рассчитанному сглаживанию.
+
+    Позволяет продолжить ряд, посчитанный ``Series.ewm(...).mean()``, без
+    повторного сглаживания: значение берется из ``smoothed``, вес - из позиций
+    наблюдений (векторно).
+    """
+    values = np.asarray(values, dtype=np.float64)
+    state = EwmState(alpha=alpha, adjust=adjust)
+    observed = np.flatnonzero(~np.isnan(values))
+    if len(observed) == 0:
+        return state
+    decay = 1.0 - alpha
+    ages = (len(values) - 1) - observed
+    state.weight = float(np.power(decay, ages).sum()) if adjust else float(decay ** ages[-1])
+    state.mean = float(smoothed[-1])
+    return state
+
+
+def rolling_apply(tail: np.ndarray, values: np.ndarray, window: int,
+                  func: Callable[[np.ndarray], np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Оконная статистика для новых значений с учетом хвоста предыдущих.
+
+    Args:
+        tail: Последние ``window - 1`` (или меньше) значений истории
+        values: Новые значения
+        window: Размер окна
+        func: Функция по оси 1 от матрицы окон, например ``lambda w: w.mean(axis=1)``
+
+    Returns:
+        (значения для ``values`` с NaN для неполных окон, новый хвост)
+    """
+    values = np.asarray(values, dtype=np.float64)
+    joined = np.concatenate([tail, values])
+    out = np.full(len(values), np.nan)
+    if len(joined) >= window:
+        windows = np.lib.stride_tricks.sliding_window_view(joined, window)
+        result = func(windows)
+        # Окно, заканчивающееся на values[i], имеет номер len(tail) + i - window + 1
+        first = len(tail) - window + 1
+        offset = max(0, -first)
+        out[offset:] = result[first + offset:]
+    return out, joined[-(window - 1):].copy() if window > 1 else joined[:0].copy()
+
+
+def true_range(high: np.ndarray, low: np.ndarray, close: np.ndarray,
+               prev_close: float = np.nan) -> np.ndarray:
+    """True range; для первого бара без предыдущего close равен ``high - low``."""
+    prev = np.concatenate([[prev_close], close[:-1]])
+    return np.fmax(high - low, np.fmax(np.abs(high - prev), np.abs(low - prev)))
+
+
+# Экспорт
+__all__ = [
+    'EwmState',
+    'IndicatorState',
+    'ewm_mean',
+    'ewm_init',
+    'ewm_state',
+    'rolling_apply',
+    'true_range',
+]
@@ -11,7 +11,7 @@ import pandas as pd
 
 from ..core.logging_config import get_logger
 from ..core.exceptions import AnalysisError
-from ..analysis.zones.models import ZoneInfo, SwingContext, SwingPoint
+from ..analysis.zones.models import ZoneInfo, ZoneDataView, SwingContext, SwingPoint
 from .themes import ChartThemes
 from .utils import find_all_gaps, generate_dense_axis_labels
 
@@ -281,7 +281,8 @@ class ZoneChartBuilder:
                 'start_time': zone.start_time,
                 'end_time': zone.end_time,
                 'duration': zone.duration,
-                'data': zone.data,
+                # Lazy zones expose their view: chart code only needs column metadata.
+                'data': zone.data if zone.is_materialized or zone.data_view is None else zone.data_view,
                 'features': zone.features,
                 'indicator_context': zone.indicator_context,
                 'swing_context': zone.swing_context,
@@ -378,7 +379,7 @@ class ZoneChartBuilder:
 
     def _detect_indicators_from_features(self,
                                          zone: Dict[str, Any],
-                                         data: Optional[pd.DataFrame]) -> List[str]:
+                                         data: Optional[Union[pd.DataFrame, ZoneDataView]]) -> List[str]:
         """Определение индикаторных колонок для отображения."""
 
         if data is None or data.empty:
@@ -1193,7 +1194,7 @@ class ZoneVisualizer(ZoneChartBuilder):
         if show_indicators:
             # Определяем колонки индикаторов
             zone_data = zone_dict.get('data')
-            if isinstance(zone_data, pd.DataFrame) and not zone_data.empty:
+            if isinstance(zone_data, (pd.DataFrame, ZoneDataView)) and not zone_data.empty:
                 # Используем zone_data для определения колонок, но данные возьмем из window_df
                 indicator_columns = self._detect_indicators_from_features(zone_dict, zone_data)
             if not indicator_columns:
@@ -1532,7 +1533,7 @@ class ZoneVisualizer(ZoneChartBuilder):
                 zone_indicator_columns = indicator_columns  # Используем переданные колонки или None
                 if zone_indicator_columns is None:
                     zone_data = zone.get('data')
-                    if isinstance(zone_data, pd.DataFrame) and not zone_data.empty:
+                    if isinstance(zone_data, (pd.DataFrame, ZoneDataView)) and not zone_data.empty:
                         zone_indicator_columns = self._detect_indicators_from_features(zone, zone_data)
                     if not zone_indicator_columns:
                         zone_indicator_columns = self._detect_indicators_from_features(zone, window_df)
@@ -19,7 +19,7 @@ import json
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 from datetime import datetime
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ProcessPoolExecutor, as_completed
 import time
 
 # Добавляем корневую папку проекта в path
@@ -36,6 +36,96 @@ from test_hypotheses import HypothesisTestingScript
 logger = get_logger(__name__)
 
 
+def analyze_task(
+    task: Dict[str, Any],
+    include_macd: bool,
+    include_hypotheses: bool,
+    macd_script: MACDAnalysisScript,
+    hypothesis_script: HypothesisTestingScript,
+    task_logger=logger
+) -> Dict[str, Any]:
+    """Выполнить анализ одной задачи (symbol, timeframe) переданными скриптами."""
+    symbol = task['symbol']
+    timeframe = task['timeframe']
+    use_sample_data = task['use_sample_data']
+    
+    result = {
+        'task': task,
+        'success': False,
+        'macd_result': None,
+        'hypothesis_result': None,
+        'error': None,
+        'duration': None
+    }
+    task_start = time.perf_counter()
+    
+    try:
+        # MACD анализ
+        if include_macd:
+            try:
+                macd_result = macd_script.analyze_symbol(
+                    symbol=symbol,
+                    timeframe=timeframe,
+                    use_sample_data=use_sample_data,
+                    verbose=False
+                )
+                result['macd_result'] = macd_result
+            except Exception as e:
+                task_logger.warning(f"MACD analysis failed for {symbol}: {e}")
+                result['macd_error'] = str(e)
+        
+        # Тестирование гипотез
+        if include_hypotheses:
+            try:
+                hypothesis_result = hypothesis_script.test_hypotheses(
+                    symbol=symbol,
+                    timeframe=timeframe,
+                    use_sample_data=use_sample_data,
+                    verbose=False
+                )
+                result['hypothesis_result'] = hypothesis_result
+            except Exception as e:
+                task_logger.warning(f"Hypothesis testing failed for {symbol}: {e}")
+                result['hypothesis_error'] = str(e)
+        
+        # Считаем успешным если хотя бы один анализ прошел
+        if result['macd_result'] or result['hypothesis_result']:
+            result['success'] = True
+        
+    except Exception as e:
+        result['error'] = str(e)
+        task_logger.error(f"Task analysis failed for {symbol}: {e}")
+    
+    result['duration'] = time.perf_counter() - task_start
+    return result
+
+
+_worker_scripts = None
+
+
+def _get_worker_scripts():
+    """Скрипты анализа процесса-воркера (создаются один раз на процесс)."""
+    global _worker_scripts
+    if _worker_scripts is None:
+        _worker_scripts = (MACDAnalysisScript(), HypothesisTestingScript())
+    return _worker_scripts
+
+
+def _analyze_task_in_worker(
+    task: Dict[str, Any],
+    include_macd: bool,
+    include_hypotheses: bool
+) -> Dict[str, Any]:
+    """
+    Точка входа воркера ProcessPoolExecutor.
+    
+    Функция уровня модуля с простыми аргументами: в пул не сериализуется
+    экземпляр BatchAnalysisScript (logger, скрипты, пути).
+    """
+    macd_script, hypothesis_script = _get_worker_scripts()
+    return analyze_task(task, include_macd, include_hypotheses, macd_script, hypothesis_script)
+
+
 class BatchAnalysisScript:
     """
     Скрипт для пакетного анализа множества финансовых инструментов.
@@ -75,7 +165,7 @@ class BatchAnalysisScript:
             include_macd: Включить MACD анализ
             include_hypotheses: Включить тестирование гипотез
             parallel: Использовать параллельное выполнение
-            max_workers: Максимальное количество потоков
+            max_workers: Максимальное количество процессов
             config_file: Путь к файлу конфигурации
             output_format: Формат вывода
             verbose: Подробный вывод
@@ -288,15 +378,21 @@ class BatchAnalysisScript:
         max_workers: int,
         verbose: bool
     ) -> List[Dict[str, Any]]:
-        """Выполнить анализ параллельно."""
+        """
+        Выполнить анализ параллельно.
+        
+        Анализ CPU-bound (pandas/scipy), поэтому задачи выполняются в пуле
+        процессов, а не потоков. Для произвольных пар (данные, ZoneAnalysisConfig)
+        см. bquant.analysis.zones.ZoneBatchRunner.
+        """
         results = []
         
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
             # Запускаем все задачи
             future_to_task = {
                 executor.submit(
-                    self._analyze_single_task,
-                    task, include_macd, include_hypotheses, False
+                    _analyze_task_in_worker,
+                    task, include_macd, include_hypotheses
                 ): task for task in tasks
             }
             
@@ -312,7 +408,9 @@ class BatchAnalysisScript:
                     
                     if verbose:
                         status = "✅ Success" if result['success'] else "❌ Failed"
-                        print(f"🚀 [{completed}/{len(tasks)}] {task['symbol']} {task['timeframe']} - {status}")
+                        duration = result.get('duration')
+                        timing = f" ({duration:.1f}s)" if duration is not None else ""
+                        print(f"🚀 [{completed}/{len(tasks)}] {task['symbol']} {task['timeframe']} - {status}{timing}")
                 
                 except Exception as e:
                     self.logger.error(f"Task failed: {task['symbol']} {task['timeframe']}: {e}")
@@ -337,56 +435,10 @@ class BatchAnalysisScript:
         verbose: bool
     ) -> Dict[str, Any]:
         """Выполнить анализ одной задачи."""
-        symbol = task['symbol']
-        timeframe = task['timeframe']
-        use_sample_data = task['use_sample_data']
-        
-        result = {
-            'task': task,
-            'success': False,
-            'macd_result': None,
-            'hypothesis_result': None,
-            'error': None
-        }
-        
-        try:
-            # MACD анализ
-            if include_macd:
-                try:
-                    macd_result = self.macd_script.analyze_symbol(
-                        symbol=symbol,
-                        timeframe=timeframe,
-                        use_sample_data=use_sample_data,
-                        verbose=False
-                    )
-                    result['macd_result'] = macd_result
-                except Exception as e:
-                    self.logger.warning(f"MACD analysis failed for {symbol}: {e}")
-                    result['macd_error'] = str(e)
-            
-            # Тестирование гипотез
-            if include_hypotheses:
-                try:
-                    hypothesis_result = self.hypothesis_script.test_hypotheses(
-                        symbol=symbol,
-                        timeframe=timeframe,
-                        use_sample_data=use_sample_data,
-                        verbose=False
-                    )
-                    result['hypothesis_result'] = hypothesis_result
-                except Exception as e:
-                    self.logger.warning(f"Hypothesis testing failed for {symbol}: {e}")
-                    result['hypothesis_error'] = str(e)
-            
-            # Считаем успешным если хотя бы один анализ прошел
-            if result['macd_result'] or result['hypothesis_result']:
-                result['success'] = True
-            
-        except Exception as e:
-            result['error'] = str(e)
-            self.logger.error(f"Task analysis failed for {symbol}: {e}")
-        
-        return result
+        return analyze_task(
+            task, include_macd, include_hypotheses,
+            self.macd_script, self.hypothesis_script, self.logger
+        )
     
     def _aggregate_results(
         self,
@@ -765,7 +817,7 @@ Examples:
         '--max-workers',
         type=int,
         default=4,
-        help='Maximum number of parallel workers (default: 4)'
+        help='Maximum number of worker processes (default: 4)'
     )
     
     parser.add_argument(
@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 """
 Скрипт для извлечения sample данных из исходных CSV файлов
-и генерации embedded Python структур.
+и генерации embedded колоночных файлов (Arrow IPC .arrow).
 
 Usage:
     python scripts/data/extract_samples.py --extract-all
@@ -22,6 +22,7 @@ project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
 from bquant.core.logging_config import get_logger
+from bquant.data.samples.storage import SAMPLE_FILE_SUFFIX, write_sample_file
 
 logger = get_logger(__name__)
 
@@ -29,7 +30,7 @@ logger = get_logger(__name__)
 class SampleDataExtractor:
     """
     Класс для извлечения sample данных из исходных CSV файлов
-    и генерации embedded Python структур.
+    и генерации embedded колоночных файлов (Arrow IPC .arrow).
     """
     
     def __init__(self):
@@ -312,7 +313,7 @@ class SampleDataExtractor:
     
     def generate_embedded_file(self, dataset_name: str, extracted_data: Dict[str, Any]) -> str:
         """
-        Сгенерировать Python файл с embedded данными.
+        Сгенерировать колоночный файл с embedded данными.
         
         Args:
             dataset_name: Название датасета
@@ -323,88 +324,16 @@ class SampleDataExtractor:
         """
         self.logger.info(f"Generating embedded file for {dataset_name}")
         
-        # Создаем папку если не существует
-        self.embedded_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Путь к выходному файлу
-        output_file = self.embedded_dir / f"{dataset_name}.py"
-        
-        # Генерируем содержимое файла
-        file_content = self._generate_file_content(dataset_name, extracted_data)
-        
-        # Записываем файл
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(file_content)
+        output_file = self.embedded_dir / f"{dataset_name}{SAMPLE_FILE_SUFFIX}"
+        data = extracted_data['data']
+        time_column = self._identify_time_column(list(data[0].keys())) if data else None
+        write_sample_file(output_file, data, extracted_data['metadata'], time_column=time_column)
         
         self.logger.info(f"Generated embedded file: {output_file}")
         self.logger.info(f"File size: {os.path.getsize(output_file)} bytes")
         
         return str(output_file)
     
-    def _generate_file_content(self, dataset_name: str, extracted_data: Dict[str, Any]) -> str:
-        """
-        Сгенерировать содержимое Python файла с embedded данными.
-        
-        Args:
-            dataset_name: Название датасета
-            extracted_data: Извлеченные данные
-        
-        Returns:
-            Содержимое Python файла
-        """
-        metadata = extracted_data['metadata']
-        data = extracted_data['data']
-        
-        # Создаем заголовок файла (без персональных данных)
-        source_filename = os.path.basename(metadata['extracted_from'])
-        header = f'''"""
-Embedded sample data for {metadata['name']}
-
-Auto-generated from original {metadata['source']} dataset
-Generated on: {metadata['updated']}
-Rows: {metadata['rows']}
-Source: {metadata['source']}
-
-DO NOT EDIT THIS FILE MANUALLY!
-Use scripts/data/extract_samples.py to regenerate.
-"""
-
-from typing import Dict, List, Any
-
-'''
-        
-        # Метаданные (удаляем персональные пути)
-        metadata_safe = metadata.copy()
-        if 'extracted_from' in metadata_safe:
-            # Оставляем только имя файла, без полного пути
-            metadata_safe['extracted_from'] = os.path.basename(metadata_safe['extracted_from'])
-        
-        metadata_section = f'''DATASET_INFO = {repr(metadata_safe)}
-
-'''
-        
-        # Данные (разбиваем на части для читаемости)
-        data_header = "DATA = [\n"
-        data_footer = "]\n"
-        
-        data_entries = []
-        for record in data:
-            # Форматируем каждую запись
-            formatted_record = "    {\n"
-            for key, value in record.items():
-                formatted_value = repr(value)
-                formatted_record += f"        '{key}': {formatted_value},\n"
-            formatted_record += "    },"
-            data_entries.append(formatted_record)
-        
-        # Объединяем все части
-        data_section = data_header + "\n".join(data_entries) + "\n" + data_footer
-        
-        # Финальное содержимое
-        content = header + metadata_section + data_section
-        
-        return content
-    
     def extract_all_datasets(self) -> Dict[str, str]:
         """
         Извлечь все настроенные датасеты.
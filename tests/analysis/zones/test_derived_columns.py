@@ -0,0 +1,113 @@
+"""Tests for declarative derived columns of the zone analysis pipeline."""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import bquant.data.processor as processor
+from bquant.analysis.zones.columns import compute_derived_columns, required_columns
+from bquant.analysis.zones.pipeline import IndicatorConfig, ZoneAnalysisConfig, ZoneAnalysisPipeline
+from bquant.analysis.zones.detection import ZoneDetectionConfig
+from bquant.analysis.zones.strategies.volatility import CombinedVolatilityStrategy
+from bquant.indicators.custom.atr import AverageTrueRange
+
+
+def _bars(n: int = 300, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 100 + np.cumsum(rng.normal(0, 1, n))
+    return pd.DataFrame(
+        {
+            "open": close - 0.2,
+            "high": close + rng.uniform(0.1, 1.5, n),
+            "low": close - rng.uniform(0.1, 1.5, n),
+            "close": close,
+        },
+        index=pd.date_range("2025-01-01", periods=n, freq="h"),
+    )
+
+
+def _pipeline(indicator: bool = True, volatility: bool = True) -> ZoneAnalysisPipeline:
+    config = ZoneAnalysisConfig(
+        indicator=IndicatorConfig(source="custom", name="macd", params={}) if indicator else None,
+        zone_detection=ZoneDetectionConfig(
+            min_duration=2,
+            rules={"indicator_col": "macd_hist"},
+            strategy_name="zero_crossing",
+        ),
+        perform_clustering=False,
+        run_regression=False,
+        run_validation=False,
+    )
+    pipeline = ZoneAnalysisPipeline(config, enable_cache=True)
+    if volatility:
+        pipeline.analyzer.features.volatility_strategy = CombinedVolatilityStrategy()
+    return pipeline
+
+
+def test_atr_kernel_matches_indicator() -> None:
+    df = _bars()
+    computed = compute_derived_columns(df, ["atr", "true_range"])
+
+    expected = AverageTrueRange().calculate(df).data["atr"].to_numpy()
+    np.testing.assert_allclose(computed["atr"], expected)
+    assert computed["true_range"][0] == pytest.approx(df["high"].iloc[0] - df["low"].iloc[0])
+
+
+def test_existing_and_unknown_columns_are_skipped() -> None:
+    df = _bars().assign(atr=1.0)
+
+    assert compute_derived_columns(df, ["atr", "no_such_column"]) == {}
+    assert required_columns(CombinedVolatilityStrategy(), None, CombinedVolatilityStrategy) == ("atr",)
+
+
+def test_prepare_adds_indicator_and_declared_columns(monkeypatch) -> None:
+    def fail(*args, **kwargs):
+        raise AssertionError("the pipeline must not run the derived-indicator pass")
+
+    monkeypatch.setattr(processor, "calculate_derived_indicators", fail)
+    df = _bars()
+    pipeline = _pipeline()
+
+    prepared = pipeline._prepare_data(df)
+
+    assert pipeline._required_columns() == ("atr",)
+    assert list(prepared.columns[:4]) == list(df.columns)
+    assert {"macd", "macd_signal", "macd_hist", "atr"} <= set(prepared.columns)
+    assert "atr" not in df.columns  # the source frame is left untouched
+    np.testing.assert_allclose(prepared["atr"], AverageTrueRange().calculate(df).data["atr"])
+
+
+def test_prepare_keeps_provided_columns() -> None:
+    df = _bars().assign(atr=2.5)
+    pipeline = _pipeline(indicator=False)
+
+    assert pipeline._prepare_data(df) is df
+    assert (pipeline._prepare_data(df.drop(columns="atr"))["atr"] > 0).all()
+
+
+def test_prepare_stage_key_follows_requirements() -> None:
+    df = _bars(50)
+    pipeline = _pipeline()
+    cache = pipeline._get_cache_wrapper()
+
+    before = pipeline._stage_keys(df, cache)
+    pipeline.analyzer.features.volatility_strategy = None
+    after = pipeline._stage_keys(df, cache)
+
+    assert pipeline._required_columns() == ()
+    assert before["prepare_data"] != after["prepare_data"]
+
+
+def test_undeclared_columns_are_not_added() -> None:
+    df = _bars()
+    precomputed = _pipeline(volatility=False)._prepare_data(df)
+    pipeline = _pipeline(indicator=False, volatility=False)
+
+    assert pipeline._required_columns() == ()
+    assert "atr" not in precomputed.columns
+    # No indicator and nothing declared: the caller's frame is used as is
+    assert pipeline._prepare_data(precomputed) is precomputed
+    result = pipeline.run(precomputed)
+    assert "atr" not in result.data.columns
@@ -12,7 +12,11 @@ from bquant.analysis.zones.pipeline import (
     ZoneAnalysisConfig,
     ZoneAnalysisPipeline,
 )
+from bquant.analysis.statistical import HypothesisTestRegistry, HypothesisTestSuite
+from bquant.analysis.zones.cache import ZoneAnalysisCache
 from bquant.analysis.zones.detection import ZoneDetectionConfig
+from bquant.analysis.zones.sequence_analysis import ZoneSequenceAnalyzer
+from bquant.analysis.zones.zone_features import ZoneFeaturesAnalyzer
 from bquant.data.samples import get_sample_data
 
 
@@ -73,6 +77,13 @@ class _RecordingCache:
         self.calls.append(("put", key))
         self.storage[key] = value
 
+    def result_keys(self, action: str) -> List[str]:
+        """Keys of final results (stage entries filtered out)."""
+        return [
+            key for call, key in self.calls
+            if call == action and not key.startswith(ZoneAnalysisCache.STAGE_KEY_PREFIX)
+        ]
+
     def invalidate(self, key: str) -> None:
         self.calls.append(("invalidate", key))
         self.storage.pop(key, None)
@@ -91,9 +102,119 @@ def test_pipeline_recomputes_after_preset_switch() -> None:
     pipeline.with_swing_preset("narrow_zone")
     narrow_result = pipeline.run(df)
 
-    get_calls = [key for action, key in recording_cache.calls if action == "get"]
+    get_calls = recording_cache.result_keys("get")
 
     assert len(get_calls) == 2
     assert get_calls[0] != get_calls[1]
     assert default_result is not narrow_result
-    assert len(recording_cache.storage) == 2
+    assert len(set(recording_cache.result_keys("put"))) == 2
+
+
+def _count_calls(monkeypatch, owner: Any, name: str) -> List[int]:
+    calls: List[int] = []
+    original = getattr(owner, name)
+
+    def _wrapper(self, *args, **kwargs):
+        calls.append(1)
+        return original(self, *args, **kwargs)
+
+    monkeypatch.setattr(owner, name, _wrapper)
+    return calls
+
+
+@pytest.mark.slow
+def test_changing_terminal_config_reruns_only_that_stage(monkeypatch) -> None:
+    df = get_sample_data("tv_xauusd_1h").set_index("time")
+    recording_cache = _RecordingCache()
+    prepare = _count_calls(monkeypatch, ZoneAnalysisPipeline, "_prepare_data")
+    detect = _count_calls(monkeypatch, ZoneAnalysisPipeline, "_detect_zones")
+    features = _count_calls(monkeypatch, ZoneFeaturesAnalyzer, "extract_all_zones_features")
+    clustering = _count_calls(monkeypatch, ZoneSequenceAnalyzer, "cluster_zones")
+    hypotheses = _count_calls(monkeypatch, HypothesisTestSuite, "run_all_tests")
+
+    results = []
+    for n_clusters in (2, 3):
+        config = _make_test_config()
+        config.perform_clustering = True
+        config.n_clusters = n_clusters
+        pipeline = ZoneAnalysisPipeline(config, enable_cache=True)
+        pipeline.cache_manager = recording_cache
+        results.append(pipeline.run(df))
+
+    first, second = results
+    assert (len(prepare), len(detect), len(features), len(hypotheses)) == (1, 1, 1, 1)
+    assert len(clustering) == 2
+    assert [r.clustering["clustering_summary"]["n_clusters"] for r in results] == [2, 3]
+    assert first.statistics == second.statistics
+    assert [z.features for z in first.zones] == [z.features for z in second.zones]
+    # Every run works on its own zone objects
+    assert all(a is not b for a, b in zip(first.zones, second.zones))
+
+
+def test_stage_keys_follow_config_slices() -> None:
+    df = _make_small_dataframe()
+    pipeline = ZoneAnalysisPipeline(_make_test_config(), enable_cache=True)
+    cache = pipeline._get_cache_wrapper()
+
+    before = pipeline._stage_keys(df, cache)
+    pipeline.config.n_clusters = 5
+    after_clusters = pipeline._stage_keys(df, cache)
+    pipeline.config.zone_detection.min_duration = 4
+    after_detection = pipeline._stage_keys(df, cache)
+
+    changed = {stage for stage in before if before[stage] != after_clusters[stage]}
+    assert changed == {"clustering"}
+    changed = {stage for stage in before if after_clusters[stage] != after_detection[stage]}
+    assert changed == {
+        "detect_zones", "features", "statistics", "hypothesis_tests",
+        "sequence_analysis", "clustering", "regression_results",
+    }
+    assert all(key.startswith(ZoneAnalysisCache.STAGE_KEY_PREFIX) for key in before.values())
+
+
+def test_stage_keys_track_registered_hypothesis_tests() -> None:
+    df = _make_small_dataframe()
+    pipeline = ZoneAnalysisPipeline(_make_test_config(), enable_cache=True)
+    cache = pipeline._get_cache_wrapper()
+
+    before = pipeline._stage_keys(df, cache)
+    HypothesisTestRegistry.register("test_stage_key_probe")(lambda table, alpha: None)
+    try:
+        after = pipeline._stage_keys(df, cache)
+    finally:
+        HypothesisTestRegistry.unregister("test_stage_key_probe")
+
+    changed = {stage for stage in before if before[stage] != after[stage]}
+    assert changed == {"hypothesis_tests"}
+    assert pipeline._stage_keys(df, cache) == before
+
+
+def test_none_stage_output_is_cached() -> None:
+    cache = ZoneAnalysisCache(_RecordingCache())
+    miss = object()
+
+    assert cache.load_stage("zone_analysis_stage_x", default=miss) is miss
+    cache.save_stage("zone_analysis_stage_x", None)
+
+    assert cache.load_stage("zone_analysis_stage_x", default=miss) is None
+    assert cache.load_stage("zone_analysis_stage_x") is None
+
+
+def test_none_stage_is_not_recomputed(monkeypatch) -> None:
+    df = _make_small_dataframe()
+    recording_cache = _RecordingCache()
+    config = _make_test_config()
+    config.swing_scope = "global"
+    calls: List[int] = []
+
+    def _no_swings(self, data):
+        calls.append(1)
+        return None
+
+    monkeypatch.setattr(ZoneAnalysisPipeline, "_calculate_global_swings", _no_swings)
+    for _ in range(2):
+        pipeline = ZoneAnalysisPipeline(config, enable_cache=True)
+        pipeline.cache_manager = recording_cache
+        pipeline._run_stages(df, pipeline._get_cache_wrapper())
+
+    assert len(calls) == 1
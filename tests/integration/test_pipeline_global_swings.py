@@ -2,6 +2,7 @@
 
 import os
 
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -9,7 +10,7 @@ os.environ.setdefault("BQUANT_SKIP_PANDAS_TA", "1")
 os.environ.setdefault("BQUANT_SKIP_TALIB", "1")
 
 from bquant.analysis.zones.pipeline import analyze_zones
-from bquant.analysis.zones.strategies.swing import ZigZagSwingStrategy
+from bquant.analysis.zones.strategies.swing import PivotPointsSwingStrategy, ZigZagSwingStrategy
 
 from tests.fixtures import create_sample_ohlcv_data
 from tests.fixtures.swing_mocks import use_fake_zigzag_indicator
@@ -100,3 +101,35 @@ def test_global_mode_improves_swing_coverage():
     assert results["global"] >= 0.70
     assert results["global"] > results["per_zone"]
     assert results["improvement_pct"] >= 20
+
+
+def test_global_swing_metrics_aggregated_in_one_batch(monkeypatch):
+    data = create_sample_ohlcv_data(300)
+    data.index = pd.date_range("2024-10-01", periods=len(data), freq="H")
+    data["osc"] = np.sin(np.arange(len(data)) / 6.0)
+
+    calls = []
+    original = PivotPointsSwingStrategy.aggregate_for_zones
+
+    def _spy(self, zones, context):
+        calls.append(len(zones))
+        return original(self, zones, context)
+
+    monkeypatch.setattr(PivotPointsSwingStrategy, "aggregate_for_zones", _spy)
+
+    result = (
+        analyze_zones(data)
+        .with_cache(enable=False)
+        .with_strategies(swing="pivot_points")
+        .with_swing_scope("global")
+        .detect_zones("zero_crossing", indicator_col="osc")
+        .build()
+    )
+
+    assert calls == [len(result.zones)]
+    strategy = PivotPointsSwingStrategy()
+    for zone in result.zones:
+        expected = strategy.aggregate_for_zone(zone, zone.swing_context).to_dict()
+        actual = dict(zone.features["metadata"]["swing_metrics"])
+        assert actual.pop("strategy_params") == expected.pop("strategy_params")
+        assert actual == pytest.approx(expected)
@@ -0,0 +1,59 @@
+"""Benchmark of the bulk loader against per-file sequential CSV loading."""
+
+import time
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
+import pytest
+
+from bquant.data.loader import load_all_data_files, load_ohlcv_data
+
+FILES = 24
+ROWS = 100_000
+
+
+def _write_export(path, rows, seed):
+    rng = np.random.default_rng(seed)
+    close = 2000 + np.cumsum(rng.normal(0, 0.5, rows))
+    times = pa.array(np.datetime64('2020-01-01T00:00', 's') + np.arange(rows) * np.timedelta64(15, 'm'))
+    table = pa.table({
+        'time': pc.strftime(times, format='%Y.%m.%d %H:%M'),
+        'open': np.round(close - 0.1, 5),
+        'high': np.round(close + 1.0, 5),
+        'low': np.round(close - 1.0, 5),
+        'close': np.round(close, 5),
+        'volume': rng.integers(1, 500, rows),
+    })
+    pacsv.write_csv(table, path, write_options=pacsv.WriteOptions(include_header=False, quoting_style='none'))
+
+
+@pytest.mark.performance
+@pytest.mark.slow
+def test_bulk_loading_speedup(tmp_path):
+    data_dir = tmp_path / 'data'
+    data_dir.mkdir()
+    for i in range(FILES):
+        _write_export(data_dir / f"SYM{i:02d}M15.csv", ROWS, seed=i)
+
+    start = time.perf_counter()
+    expected = {path.stem: load_ohlcv_data(path) for path in sorted(data_dir.glob('*.csv'))}
+    sequential_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    cold = load_all_data_files(data_dir, n_jobs=4, use_cache=True, cache_dir=tmp_path / 'cache')
+    cold_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    warm = load_all_data_files(data_dir, n_jobs=4, use_cache=True, cache_dir=tmp_path / 'cache')
+    warm_time = time.perf_counter() - start
+
+    assert len(cold) == len(warm) == FILES
+    for key, df in warm.items():
+        assert df.equals(expected[key.replace('_', '')])
+
+    speedup = sequential_time / max(warm_time, 1e-9)
+    print(f"{FILES} files x {ROWS} rows: sequential {sequential_time:.2f}s, "
+          f"cold pool {cold_time:.2f}s, warm sidecars {warm_time:.2f}s ({speedup:.1f}x)")
+    assert speedup >= 3.0, f"Sidecar speedup too small: {speedup:.1f}x"
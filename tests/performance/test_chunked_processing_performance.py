@@ -0,0 +1,64 @@
+"""Peak memory of chunked processing against the in-memory processor functions."""
+
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from bquant.data.chunked import ChunkedProcessor
+from bquant.data.processor import add_technical_features, clean_ohlcv_data, create_lagged_features
+
+ROWS = 2_000_000
+CHUNK_ROWS = 100_000
+
+
+def _write_second_bars(path, rows):
+    rng = np.random.default_rng(0)
+    close = 2000 * np.exp(np.cumsum(rng.normal(0, 1e-5, rows)))
+    pd.DataFrame({
+        'open': close,
+        'high': close * 1.0001,
+        'low': close * 0.9999,
+        'close': close,
+        'volume': rng.integers(1, 50, rows).astype(float),
+    }, index=pd.date_range('2024-01-01', periods=rows, freq='s', name='time')).to_parquet(path)
+
+
+def _measure(func):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+@pytest.mark.performance
+@pytest.mark.slow
+def test_chunked_peak_memory(tmp_path):
+    source = tmp_path / 'XAUUSD_1s.parquet'
+    _write_second_bars(source, ROWS)
+
+    def in_memory():
+        df = pd.read_parquet(source)
+        result = create_lagged_features(add_technical_features(clean_ohlcv_data(df)), ['close'], [1, 2, 3])
+        return len(result)
+
+    def chunked():
+        return (ChunkedProcessor(source, chunk_rows=CHUNK_ROWS)
+                .clean_ohlcv_data()
+                .add_technical_features()
+                .create_lagged_features(['close'], [1, 2, 3])
+                .write(tmp_path / 'features.parquet'))['rows']
+
+    rows_memory, memory_time, memory_peak = _measure(in_memory)
+    rows_chunked, chunked_time, chunked_peak = _measure(chunked)
+
+    assert rows_chunked == rows_memory
+    ratio = memory_peak / max(chunked_peak, 1)
+    print(f"{ROWS} rows: in-memory {memory_time:.2f}s / {memory_peak / 2**20:.0f} MiB peak, "
+          f"chunked ({CHUNK_ROWS} rows) {chunked_time:.2f}s / {chunked_peak / 2**20:.0f} MiB peak ({ratio:.1f}x less)")
+    assert ratio >= 5.0, f"Chunked peak memory not bounded: {ratio:.1f}x"
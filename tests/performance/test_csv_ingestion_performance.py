@@ -0,0 +1,63 @@
+"""Benchmark of the sniff-once CSV ingestion against the multi-attempt reader."""
+
+import time
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
+import pytest
+
+import bquant.data.loader as loader
+from bquant.data.ingest import clear_layout_cache, read_ohlcv_csv
+
+ROWS = 1_000_000
+
+
+def _export(path, rows, metatrader):
+    """Write a MetaTrader (no header) or TradingView (ISO +07:00) export."""
+    rng = np.random.default_rng(0)
+    close = 2000 + np.cumsum(rng.normal(0, 0.5, rows))
+    times = pa.array(np.datetime64('2020-01-01T00:00', 's') + np.arange(rows) * np.timedelta64(15, 'm'))
+    fmt = '%Y.%m.%d %H:%M' if metatrader else '%Y-%m-%dT%H:%M:%S+07:00'
+    columns = {
+        'time': pc.strftime(times, format=fmt),
+        'open': np.round(close - 0.1, 5),
+        'high': np.round(close + 1.0, 5),
+        'low': np.round(close - 1.0, 5),
+        'close': np.round(close, 5),
+        'Volume': rng.integers(1, 500, rows),
+    }
+    if metatrader:
+        columns['spread'] = np.zeros(rows, dtype=np.int64)
+    pacsv.write_csv(
+        pa.table(columns), path,
+        write_options=pacsv.WriteOptions(include_header=not metatrader, quoting_style='none'),
+    )
+    return path
+
+
+@pytest.mark.performance
+@pytest.mark.slow
+@pytest.mark.parametrize('metatrader', [True, False], ids=['metatrader', 'tradingview'])
+def test_ingestion_speedup_1m_rows(tmp_path, metatrader):
+    path = _export(tmp_path / 'export.csv', ROWS, metatrader)
+
+    old_start = time.perf_counter()
+    expected = loader._read_csv_fallback(path, loader.logger)
+    old_time = time.perf_counter() - old_start
+
+    clear_layout_cache()
+    new_start = time.perf_counter()
+    actual = read_ohlcv_csv(path)
+    new_time = time.perf_counter() - new_start
+
+    if expected.index.dtype == object:
+        expected.index = pd.to_datetime(expected.index, format='ISO8601')
+    expected.columns = actual.columns
+    pd.testing.assert_frame_equal(actual, expected)
+
+    speedup = old_time / max(new_time, 1e-9)
+    print(f"{'MT' if metatrader else 'TV'} {ROWS} rows: old {old_time:.2f}s, new {new_time:.2f}s ({speedup:.1f}x)")
+    assert speedup >= 2.0, f"Ingestion speedup too small: {speedup:.1f}x"
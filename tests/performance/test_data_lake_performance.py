@@ -0,0 +1,52 @@
+"""Benchmark of a one-month read from the data lake against loading the whole CSV."""
+
+import time
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
+import pytest
+
+from bquant.data.lake import DataLake, select_range
+from bquant.data.loader import load_ohlcv_data
+
+ROWS = 5 * 365 * 96  # five years of 15-minute bars
+
+
+@pytest.mark.performance
+@pytest.mark.slow
+def test_month_read_speedup(tmp_path):
+    data_dir = tmp_path / 'data'
+    data_dir.mkdir()
+    rng = np.random.default_rng(0)
+    close = 2000 * np.exp(np.cumsum(rng.normal(0, 0.0005, ROWS)))
+    times = pa.array(np.datetime64('2020-01-01T00:00', 's') + np.arange(ROWS) * np.timedelta64(15, 'm'))
+    pacsv.write_csv(pa.table({
+        'time': pc.strftime(times, format='%Y.%m.%d %H:%M'),
+        'open': np.round(close - 0.1, 5),
+        'high': np.round(close + 1.0, 5),
+        'low': np.round(close - 1.0, 5),
+        'close': np.round(close, 5),
+        'volume': rng.integers(1, 500, ROWS),
+    }), data_dir / 'XAUUSDM15.csv',
+        write_options=pacsv.WriteOptions(include_header=False, quoting_style='none'))
+
+    lake = DataLake(tmp_path / 'lake')
+    assert lake.ingest(data_dir, n_jobs=1) == {'XAUUSD/15m': 'converted'}
+
+    start = time.perf_counter()
+    full = load_ohlcv_data(data_dir / 'XAUUSDM15.csv')
+    expected = select_range(full, '2023-06-01', '2023-06-30 23:45', ['close', 'volume'])
+    csv_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    month = lake.read('XAUUSD', '15m', start='2023-06-01', end='2023-06-30 23:45', columns=['close', 'volume'])
+    lake_time = time.perf_counter() - start
+
+    assert len(month) == 30 * 96
+    assert month.equals(expected)
+
+    speedup = csv_time / max(lake_time, 1e-9)
+    print(f"{ROWS} rows, one month: CSV {csv_time:.3f}s, lake {lake_time:.4f}s ({speedup:.1f}x)")
+    assert speedup >= 5.0, f"Data lake speedup too small: {speedup:.1f}x"
@@ -0,0 +1,73 @@
+"""Startup benchmark for pandas-ta indicator registration (lazy probing + manifest)."""
+
+import time
+
+import pandas as pd
+import pytest
+
+from bquant.indicators.base import IndicatorFactory
+from bquant.indicators.library.pandas_ta import PandasTALoader
+
+
+def _make_functions(count):
+    """pandas-ta-like callables with a realistic per-call cost on the sample frame."""
+
+    def factory(i):
+        def indicator(high, low, close, volume=None, length: int = 10 + i % 5, scalar: float = 2.0):
+            mid = close.rolling(length).mean()
+            dev = (high - low).ewm(span=length).mean() * scalar
+            return pd.DataFrame({f"IND{i}_L_{length}": mid - dev, f"IND{i}_U_{length}": mid + dev})
+
+        indicator.__qualname__ = f"indicator_{i}"
+        return indicator
+
+    return {f"indicator_{i}": factory(i) for i in range(count)}
+
+
+def _fresh_process(monkeypatch, functions):
+    monkeypatch.setattr(PandasTALoader, "_indicators_registered", False)
+    monkeypatch.setattr(PandasTALoader, "_available_indicators", [])
+    monkeypatch.setattr(PandasTALoader, "_function_cache", dict(functions))
+    monkeypatch.setattr(PandasTALoader, "_configs", {})
+    monkeypatch.setattr(PandasTALoader, "_manifest", None)
+    monkeypatch.setattr(IndicatorFactory, "_registry", {})
+    monkeypatch.setattr(IndicatorFactory, "_library_functions", {})
+
+
+@pytest.mark.performance
+def test_benchmark_lazy_registration_startup(monkeypatch, tmp_path):
+    functions = _make_functions(150)
+    monkeypatch.setattr(PandasTALoader, "is_available", classmethod(lambda cls: True))
+    monkeypatch.setattr(PandasTALoader, "manifest_dir", tmp_path)
+
+    # Baseline: eager probing of every callable (previous registration behaviour)
+    eager_start = time.perf_counter()
+    for name, func in functions.items():
+        config = PandasTALoader._analyze_function_dynamically(name, func)
+        PandasTALoader._determine_output_columns(
+            name, func, config["price_params"], config["tunable_params"]
+        )
+    eager_time = time.perf_counter() - eager_start
+
+    _fresh_process(monkeypatch, functions)
+    cold_start = time.perf_counter()
+    assert PandasTALoader.register_indicators() == len(functions)
+    cold_time = time.perf_counter() - cold_start
+
+    # First use resolves columns for a single indicator and persists them
+    IndicatorFactory.create("pandas_ta", "indicator_0")
+
+    _fresh_process(monkeypatch, functions)
+    warm_start = time.perf_counter()
+    assert PandasTALoader.register_indicators() == len(functions)
+    first_use = IndicatorFactory.create("pandas_ta", "indicator_0")
+    warm_time = time.perf_counter() - warm_start
+
+    print(
+        f"\nRegistration of {len(functions)} indicators: eager probing {eager_time * 1000:.1f} ms, "
+        f"lazy cold {cold_time * 1000:.1f} ms, manifest warm {warm_time * 1000:.1f} ms"
+    )
+
+    assert first_use.config.columns == ["IND0_L_10", "IND0_U_10"]
+    assert cold_time < eager_time / 3, f"Lazy registration too slow: {cold_time:.3f}s vs {eager_time:.3f}s"
+    assert warm_time < eager_time / 3, f"Manifest start too slow: {warm_time:.3f}s vs {eager_time:.3f}s"
@@ -3,8 +3,6 @@
 import os
 import sys
 import time
-from datetime import datetime, timedelta
-
 import numpy as np
 import pandas as pd
 import pytest
@@ -12,7 +10,7 @@ import pytest
 os.environ.setdefault("BQUANT_SKIP_PANDAS_TA", "1")
 os.environ.setdefault("BQUANT_SKIP_TALIB", "1")
 
-from bquant.analysis.zones.models import SwingContext, SwingPoint, ZoneInfo
+from bquant.analysis.zones.models import SwingContext, ZoneInfo
 from bquant.analysis.zones.strategies.swing import ZigZagSwingStrategy
 
 from tests.fixtures.swing_mocks import (
@@ -24,41 +22,25 @@ from tests.fixtures.swing_mocks import (
 
 @pytest.mark.performance
 def test_memory_consumption_estimate():
-    size = 1_000
-    swing_points = [
-        SwingPoint(
-            point_id=i,
-            timestamp=datetime(2024, 1, 1) + timedelta(minutes=i),
-            index=i,
-            price=100.0 + i * 0.1,
-            swing_type="peak" if i % 2 == 0 else "trough",
-            strategy_name="zigzag",
-            strategy_params={"legs": 2},
-        )
-        for i in range(size)
-    ]
-
-    context = SwingContext(
-        swing_points=swing_points,
-        indices=np.arange(size, dtype=int),
+    size = 1_000_000
+    indices = np.arange(0, size * 2, 2, dtype=np.int64)
+    context = SwingContext.from_arrays(
+        indices,
+        100.0 + np.arange(size) * 0.1,
+        np.where(np.arange(size) % 2 == 0, 1, -1),
+        pd.date_range("2024-01-01", periods=size, freq="min"),
+        confirmation_index=indices + 2,
         full_data_length=size * 2,
         strategy_name="zigzag",
         strategy_params={"legs": 2},
     )
 
-    total_bytes = (
-        sys.getsizeof(context)
-        + sys.getsizeof(context.indices)
-        + sys.getsizeof(context.swing_points)
-        + sum(sys.getsizeof(sp) for sp in swing_points)
-        + sum(sys.getsizeof(sp.strategy_params) for sp in swing_points)
-    )
-
-    avg_bytes = total_bytes / size
-    expected_bytes = 264
-    tolerance = 0.5
+    # Columns only: the list-of-SwingPoint layout needed ~264 bytes per point.
+    avg_bytes = (sys.getsizeof(context) + context.nbytes) / size
+    assert avg_bytes <= 64, avg_bytes
 
-    assert expected_bytes * (1 - tolerance) <= avg_bytes <= expected_bytes * (1 + tolerance)
+    zone_swings = context.slice(400_000, 400_200)
+    assert np.shares_memory(zone_swings.prices, context.prices)
 
 
 @pytest.mark.performance
@@ -0,0 +1,176 @@
+"""
+Unit tests for the bulk loader: Parquet sidecars, lazy access, projection, process pool.
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import bquant.data.bulk as bulk
+from bquant.core.config import reset_directories_to_defaults, set_processed_data_dir
+from bquant.core.exceptions import DataError
+from bquant.data.bulk import DataFileCollection, discover_data_files, sidecar_path
+from bquant.data.loader import load_all_data_files, load_ohlcv_data
+
+
+def _bars(n=150, seed=0):
+    rng = np.random.default_rng(seed)
+    close = 100 + np.cumsum(rng.normal(0, 1, n))
+    return pd.DataFrame({
+        'open': close - 0.25,
+        'high': close + 1.0,
+        'low': close - 1.0,
+        'close': close,
+        'volume': rng.integers(1, 1000, n),
+    }, index=pd.date_range('2025-01-01', periods=n, freq='h'))
+
+
+def _write_tv(path, bars):
+    lines = ['time,open,high,low,close,Volume']
+    for ts, row in bars.iterrows():
+        lines.append(f"{ts.tz_localize('Asia/Bangkok').isoformat()},{row.open},{row.high},{row.low},{row.close},{int(row.volume)}")
+    path.write_text('\n'.join(lines) + '\n')
+    return path
+
+
+def _write_mt(path, bars):
+    lines = [
+        f"{ts:%Y.%m.%d %H:%M},{row.open:.5f},{row.high:.5f},{row.low:.5f},{row.close:.5f},{int(row.volume)},0"
+        for ts, row in bars.iterrows()
+    ]
+    path.write_text('\n'.join(lines) + '\n')
+    return path
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    directory = tmp_path / 'data'
+    directory.mkdir()
+    _write_tv(directory / 'OANDA_XAUUSD, 60.csv', _bars(seed=1))
+    _write_mt(directory / 'EURUSDM15.csv', _bars(seed=2))
+    _write_mt(directory / 'GBPUSD_1h.csv', _bars(seed=3))
+    (directory / 'BROKEN_1d.csv').write_text('name,comment\na,b\n')
+    return directory
+
+
+@pytest.fixture
+def parse_calls(monkeypatch):
+    calls = []
+
+    def counting(file_path, *args, **kwargs):
+        calls.append(os.path.basename(file_path))
+        return load_ohlcv_data(file_path, *args, **kwargs)
+
+    monkeypatch.setattr(bulk, 'load_ohlcv_data', counting)
+    return calls
+
+
+class TestDiscovery:
+
+    def test_keys_match_sequential_loader(self, data_dir):
+        entries = discover_data_files(data_dir)
+
+        assert sorted(entries) == ['BROKEN_1d', 'EURUSD_M15', 'GBPUSD_1h', 'XAUUSD_60']
+        assert entries['EURUSD_M15'].symbol == 'EURUSD'
+
+    def test_sidecar_name_follows_file_state(self, data_dir, tmp_path):
+        source = data_dir / 'GBPUSD_1h.csv'
+        first = sidecar_path(source, tmp_path)
+
+        os.utime(source, ns=(1, 1))
+        assert sidecar_path(source, tmp_path) != first
+        assert sidecar_path(source, tmp_path).name.startswith('GBPUSD_1h-')
+
+
+class TestDataFileCollection:
+
+    def test_lazy_access_loads_only_indexed_keys(self, data_dir, tmp_path, parse_calls):
+        files = DataFileCollection(data_dir, cache_dir=tmp_path / 'cache')
+
+        assert len(files) == 4 and 'GBPUSD_1h' in files
+        assert parse_calls == []
+
+        df = files['GBPUSD_1h']
+        assert files['GBPUSD_1h'] is df
+        assert parse_calls == ['GBPUSD_1h.csv']
+        assert files.loaded_keys == ['GBPUSD_1h']
+
+    def test_sidecar_round_trip(self, data_dir, tmp_path, parse_calls):
+        cache_dir = tmp_path / 'cache'
+        expected = DataFileCollection(data_dir, cache_dir=cache_dir)['XAUUSD_60']
+        cached = DataFileCollection(data_dir, cache_dir=cache_dir)['XAUUSD_60']
+
+        assert parse_calls == ['OANDA_XAUUSD, 60.csv']
+        pd.testing.assert_frame_equal(cached, expected)
+        assert str(cached.index.dtype) == 'datetime64[ns, UTC+07:00]'
+
+    def test_changed_source_is_converted_again(self, data_dir, tmp_path, parse_calls):
+        cache_dir = tmp_path / 'cache'
+        DataFileCollection(data_dir, cache_dir=cache_dir)['GBPUSD_1h']
+
+        _write_mt(data_dir / 'GBPUSD_1h.csv', _bars(n=200, seed=3))
+        df = DataFileCollection(data_dir, cache_dir=cache_dir)['GBPUSD_1h']
+
+        assert len(df) == 200
+        assert parse_calls == ['GBPUSD_1h.csv', 'GBPUSD_1h.csv']
+        assert len(list(cache_dir.glob('GBPUSD_1h-*.parquet'))) == 1
+
+    def test_column_projection(self, data_dir, tmp_path):
+        cache_dir = tmp_path / 'cache'
+        uncached = DataFileCollection(data_dir, columns=['close', 'volume', 'spread'], use_cache=False)
+        DataFileCollection(data_dir, cache_dir=cache_dir)['EURUSD_M15']
+        cached = DataFileCollection(data_dir, columns=['close', 'volume', 'spread'], cache_dir=cache_dir)
+
+        assert list(cached['EURUSD_M15'].columns) == ['close', 'volume']
+        pd.testing.assert_frame_equal(cached['EURUSD_M15'], uncached['EURUSD_M15'])
+
+    def test_broken_file_raises_on_access(self, data_dir, tmp_path):
+        files = DataFileCollection(data_dir, cache_dir=tmp_path / 'cache')
+
+        with pytest.raises(DataError):
+            files['BROKEN_1d']
+        with pytest.raises(KeyError):
+            files['MISSING_1h']
+
+
+class TestLoadAllDataFiles:
+
+    def test_process_pool_matches_sequential(self, data_dir, tmp_path):
+        sequential = load_all_data_files(data_dir, n_jobs=1, use_cache=False)
+        parallel = load_all_data_files(data_dir, n_jobs=2, use_cache=True, cache_dir=tmp_path / 'cache')
+
+        assert sorted(parallel) == ['EURUSD_M15', 'GBPUSD_1h', 'XAUUSD_60']
+        for key, df in sequential.items():
+            pd.testing.assert_frame_equal(parallel[key], df)
+
+    def test_second_session_reads_sidecars(self, data_dir, tmp_path, parse_calls):
+        cache_dir = tmp_path / 'cache'
+        load_all_data_files(data_dir, use_cache=True, cache_dir=cache_dir)
+        first_parse = sorted(parse_calls)
+
+        data = load_all_data_files(data_dir, columns=['close'], use_cache=True, cache_dir=cache_dir)
+
+        assert first_parse == ['BROKEN_1d.csv', 'EURUSDM15.csv', 'GBPUSD_1h.csv', 'OANDA_XAUUSD, 60.csv']
+        assert sorted(parse_calls) == sorted(first_parse + ['BROKEN_1d.csv'])
+        assert all(list(df.columns) == ['close'] for df in data.values())
+
+    def test_defaults_are_sequential_and_read_only(self, data_dir, tmp_path, monkeypatch):
+        set_processed_data_dir(tmp_path / 'processed')
+
+        def no_pool(*args, **kwargs):
+            raise AssertionError("the default load must not start a process pool")
+
+        monkeypatch.setattr(bulk, 'ProcessPoolExecutor', no_pool)
+        try:
+            data = load_all_data_files(data_dir)
+        finally:
+            reset_directories_to_defaults()
+
+        assert sorted(data) == ['EURUSD_M15', 'GBPUSD_1h', 'XAUUSD_60']
+        assert not (tmp_path / 'processed' / 'ohlcv_cache').exists()
+
+    def test_lazy_and_missing_directory(self, data_dir, tmp_path):
+        assert isinstance(load_all_data_files(data_dir, lazy=True, cache_dir=tmp_path), DataFileCollection)
+        assert load_all_data_files(tmp_path / 'missing') == {}
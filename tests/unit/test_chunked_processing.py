@@ -0,0 +1,167 @@
+"""
+Unit tests for chunked (out-of-core) processing: carried state, sources, incremental output.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from bquant.core.exceptions import DataProcessingError
+from bquant.data.chunked import ChunkedProcessor, iter_source_chunks
+from bquant.data.lake import DataLake
+from bquant.data.loader import load_ohlcv_data
+from bquant.data.processor import (
+    add_technical_features,
+    clean_ohlcv_data,
+    create_lagged_features,
+    remove_price_outliers,
+    resample_ohlcv,
+)
+
+
+def _bars(n=5000, tz=None, seed=5):
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, n)))
+    df = pd.DataFrame({
+        'open': close * 1.001,
+        'high': close * 1.01,
+        'low': close * 0.99,
+        'close': close,
+        'volume': rng.integers(1, 100, n).astype(float),
+    }, index=pd.date_range('2024-01-01', periods=n, freq='min', tz=tz, name='time'))
+    df.index.freq = None
+    return df
+
+
+def _dirty_bars(**kwargs):
+    df = _bars(**kwargs)
+    rng = np.random.default_rng(7)
+    n = len(df)
+    df.iloc[rng.choice(n, 40), :] = np.nan
+    df.iloc[rng.choice(n, 30), 0] = np.nan
+    df.iloc[rng.choice(n, 10), 3] *= 3
+    df.iloc[rng.choice(n, 10), 1] *= 0.5
+    return df
+
+
+def _write_mt(path, bars):
+    lines = [
+        f"{ts:%Y.%m.%d %H:%M},{row.open:.5f},{row.high:.5f},{row.low:.5f},{row.close:.5f},{int(row.volume)}"
+        for ts, row in bars.iterrows()
+    ]
+    path.write_text('\n'.join(lines) + '\n')
+    return path
+
+
+@pytest.mark.parametrize('chunk_rows', [97, 1000, 10_000])
+class TestMatchesInMemory:
+
+    def test_clean(self, chunk_rows):
+        df = _dirty_bars(tz='+07:00')
+        result = ChunkedProcessor(df, chunk_rows=chunk_rows).clean_ohlcv_data().to_frame()
+
+        pd.testing.assert_frame_equal(result, clean_ohlcv_data(df))
+
+    def test_iqr_outliers(self, chunk_rows):
+        df = _dirty_bars()
+        result = ChunkedProcessor(df, chunk_rows=chunk_rows).remove_price_outliers(threshold=1.0, method='iqr')
+
+        pd.testing.assert_frame_equal(result.to_frame(), remove_price_outliers(df, threshold=1.0, method='iqr'))
+
+    def test_rolling_features_and_lags(self, chunk_rows):
+        df = _dirty_bars()
+        result = (ChunkedProcessor(df, chunk_rows=chunk_rows)
+                  .add_technical_features()
+                  .create_lagged_features(['close', 'volume'], [0, 1, 5])
+                  .to_frame())
+
+        expected = create_lagged_features(add_technical_features(df), ['close', 'volume'], [0, 1, 5])
+        pd.testing.assert_frame_equal(result, expected)
+
+    @pytest.mark.parametrize('timeframe', ['7min', '1h', '1D'])
+    def test_resample(self, chunk_rows, timeframe):
+        df = _dirty_bars()
+        result = ChunkedProcessor(df, chunk_rows=chunk_rows).resample_ohlcv(timeframe).to_frame()
+
+        pd.testing.assert_frame_equal(result, resample_ohlcv(df, timeframe))
+
+    def test_chained_steps(self, chunk_rows):
+        df = _dirty_bars()
+        result = (ChunkedProcessor(df, chunk_rows=chunk_rows)
+                  .clean_ohlcv_data()
+                  .resample_ohlcv('15min')
+                  .add_technical_features()
+                  .to_frame())
+
+        expected = add_technical_features(resample_ohlcv(clean_ohlcv_data(df), '15min'))
+        pd.testing.assert_frame_equal(result, expected)
+
+
+class TestInMemoryOutliers:
+
+    @pytest.mark.parametrize('method', ['z_score', 'iqr'])
+    def test_single_filter_matches_per_column_filtering(self, method):
+        df = _dirty_bars()
+        expected = df
+        for column in ['open', 'high', 'low', 'close']:
+            values = expected[column]
+            if method == 'z_score':
+                keep = np.abs((values - values.mean()) / values.std()) <= 1.5
+            else:
+                q1, q3 = values.quantile(0.25), values.quantile(0.75)
+                keep = (values >= q1 - 1.5 * (q3 - q1)) & (values <= q3 + 1.5 * (q3 - q1))
+            expected = expected[keep]
+
+        pd.testing.assert_frame_equal(remove_price_outliers(df, threshold=1.5, method=method), expected)
+
+
+class TestSources:
+
+    def test_csv_source_matches_loader(self, tmp_path):
+        path = _write_mt(tmp_path / 'XAUUSD_1m.csv', _bars(n=3000))
+        chunks = list(iter_source_chunks(path, chunk_rows=1000, columns=['close', 'volume']))
+
+        assert [len(chunk) for chunk in chunks] == [1000, 1000, 1000]
+        pd.testing.assert_frame_equal(pd.concat(chunks), load_ohlcv_data(path)[['close', 'volume']])
+
+    def test_lake_directory_source(self, tmp_path):
+        bars = _bars(n=3000, tz='+07:00')
+        lake = DataLake(tmp_path / 'lake')
+        lake.write('XAUUSD', '1m', bars)
+        dataset_dir = lake.root / 'symbol=XAUUSD' / 'timeframe=1m'
+
+        result = ChunkedProcessor(dataset_dir, chunk_rows=500).add_technical_features().to_frame()
+        pd.testing.assert_frame_equal(result, add_technical_features(bars))
+
+    def test_unsorted_source_is_rejected(self):
+        df = _bars(n=100).iloc[::-1]
+        with pytest.raises(DataProcessingError):
+            list(iter_source_chunks(df, chunk_rows=10))
+
+    def test_non_causal_fill_is_rejected(self):
+        with pytest.raises(DataProcessingError):
+            ChunkedProcessor(_bars(n=10)).clean_ohlcv_data(fill_method='interpolate')
+
+
+class TestWrite:
+
+    def test_parquet_output(self, tmp_path):
+        df = _dirty_bars(tz='+07:00')
+        df.to_parquet(tmp_path / 'source.parquet')
+
+        summary = (ChunkedProcessor(tmp_path / 'source.parquet', chunk_rows=333)
+                   .clean_ohlcv_data()
+                   .write(tmp_path / 'out' / 'clean.parquet'))
+        written = pd.concat(iter_source_chunks(tmp_path / 'out' / 'clean.parquet'))
+
+        assert summary['chunks'] == 16 and summary['rows'] == len(written)
+        pd.testing.assert_frame_equal(written, clean_ohlcv_data(df))
+        assert [path.name for path in (tmp_path / 'out').iterdir()] == ['clean.parquet']
+
+    def test_csv_output(self, tmp_path):
+        df = _bars(n=2000)
+        summary = ChunkedProcessor(df, chunk_rows=300).resample_ohlcv('5min').write(tmp_path / 'bars_5m.csv')
+        written = load_ohlcv_data(tmp_path / 'bars_5m.csv')
+
+        assert summary['rows'] == 400
+        pd.testing.assert_frame_equal(written, resample_ohlcv(df, '5min'), check_freq=False)
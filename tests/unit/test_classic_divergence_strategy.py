@@ -218,6 +218,96 @@ class TestClassicDivergenceStrategy:
                 assert result.divergence_direction in ['bullish', 'bearish']
 
 
+class TestDivergenceBatch:
+    """Whole-series mode: extrema once, divergences attributed to zones by index range."""
+    
+    @pytest.fixture(scope="class")
+    def frame(self):
+        df = get_sample_data('tv_xauusd_1h')
+        macd = df['close'].ewm(span=12).mean() - df['close'].ewm(span=26).mean()
+        signal = macd.ewm(span=9).mean()
+        return df.assign(macd=macd, macd_hist=macd - signal)
+    
+    @staticmethod
+    def _two_regime_frame():
+        """Bearish divergence in bars 0-99, bullish divergence in bars 100-199."""
+        t = np.arange(200)
+        wave = np.sin(2 * np.pi * t / 20)
+        trend = np.where(t < 100, 1 + 0.004 * t, 1.4 - 0.004 * (t - 100))
+        close = 100 * (trend + 0.1 * wave)
+        osc = (2 - 0.01 * (t % 100)) * wave
+        return pd.DataFrame({'close': close, 'high': close + 0.1, 'low': close - 0.1, 'osc': osc})
+    
+    @pytest.mark.parametrize('indicator_line_col', [None, 'macd'])
+    def test_full_series_zone_matches_per_zone(self, frame, indicator_line_col):
+        strategy = ClassicDivergenceStrategy(min_divergence_strength=0.0)
+        
+        batch, = strategy.calculate_divergence_batch(
+            frame, [0], [len(frame) - 1], 'macd_hist', indicator_line_col
+        )
+        expected = strategy.calculate_divergence(frame, 'macd_hist', indicator_line_col)
+        
+        assert batch.divergence_count > 0
+        assert batch.to_dict() == expected.to_dict()
+    
+    def test_divergences_attributed_to_zones(self):
+        df = self._two_regime_frame()
+        strategy = ClassicDivergenceStrategy(min_divergence_strength=0.001)
+        windows = [(0, 99), (100, 199)]
+        
+        batch = strategy.calculate_divergence_batch(
+            df, [start for start, _ in windows], [end for _, end in windows], 'osc'
+        )
+        
+        assert [m.divergence_direction for m in batch] == ['bearish', 'bullish']
+        for (start, end), metrics in zip(windows, batch):
+            expected = strategy.calculate_divergence(df.iloc[start:end + 1], 'osc').to_dict()
+            actual = metrics.to_dict()
+            assert actual.pop('divergence_strength') == pytest.approx(expected.pop('divergence_strength'))
+            assert actual == expected
+    
+    def test_many_consecutive_zones_match_per_zone(self, frame):
+        strategy = ClassicDivergenceStrategy(min_divergence_strength=0.0)
+        starts = np.arange(0, len(frame) - 40, 40)
+        ends = starts + 39
+
+        batch = strategy.calculate_divergence_batch(frame, starts, ends, 'macd_hist')
+
+        assert sum(m.divergence_count > 0 for m in batch[1:]) >= 3
+        for start, end, metrics in zip(starts, ends, batch):
+            single, = strategy.calculate_divergence_batch(frame, [start], [end], 'macd_hist')
+            sliced = strategy.calculate_divergence(frame.iloc[start:end + 1], 'macd_hist')
+            assert metrics.to_dict() == single.to_dict()
+            assert metrics.divergence_count == sliced.divergence_count
+
+    def test_zone_position_does_not_change_result(self):
+        df = self._two_regime_frame()
+        strategy = ClassicDivergenceStrategy(min_divergence_strength=0.001)
+
+        alone, = strategy.calculate_divergence_batch(df, [0], [99], 'osc')
+        *_, last = strategy.calculate_divergence_batch(df, [150] * 299 + [0], [199] * 299 + [99], 'osc')
+
+        assert alone.divergence_count > 0
+        assert last.to_dict() == alone.to_dict()
+
+    def test_short_zones_empty_input_and_columns(self, frame):
+        strategy = ClassicDivergenceStrategy()
+        
+        assert strategy.calculate_divergence_batch(frame, [], [], 'macd_hist') == []
+        short, = strategy.calculate_divergence_batch(frame, [0], [5], 'macd_hist')
+        assert short.divergence_count == 0 and short.divergence_direction == 'none'
+        with pytest.raises(ValueError, match="must contain columns"):
+            strategy.calculate_divergence_batch(frame, [0], [50], 'RSI_14')
+        
+        # Overlapping windows are handled independently
+        starts = np.arange(0, len(frame) - 60, 50)
+        results = strategy.calculate_divergence_batch(frame, starts, starts + 60, 'macd_hist')
+        assert len(results) == len(starts)
+        for metrics in results:
+            metrics.validate()
+            assert (metrics.divergence_type == 'none') == (metrics.divergence_count == 0)
+
+
 def run_tests():
     """Run all classic divergence strategy tests."""
     pytest.main([__file__, '-v'])
@@ -250,6 +250,69 @@ class TestCombinedVolatilityStrategy:
             assert result.bollinger_lower_touches <= zone_len
 
 
+class TestVolatilityBatch:
+    """Global-precompute mode: bands once on the frame, zone metrics by segments."""
+
+    @pytest.fixture(scope="class")
+    def frame(self):
+        df = get_sample_data('tv_xauusd_1h')
+        return df.assign(atr=(df['high'] - df['low']).rolling(14).mean())
+
+    @staticmethod
+    def _windows(n_rows, count=200, seed=1):
+        rng = np.random.default_rng(seed)
+        starts = rng.integers(0, n_rows - 80, count)
+        ends = starts + rng.integers(0, 80, count)
+        return starts, ends
+
+    @staticmethod
+    def _per_zone(strategy, data, start, end):
+        try:
+            return strategy.calculate_volatility(data.iloc[start:end + 1]).to_dict()
+        except (AssertionError, ValueError):
+            return None
+
+    @pytest.mark.parametrize('with_atr', [True, False])
+    def test_matches_per_zone(self, frame, with_atr):
+        data = frame if with_atr else frame.drop(columns=['atr'])
+        strategy = CombinedVolatilityStrategy(bb_length=15, touch_threshold=0.002)
+        starts, ends = self._windows(len(data))
+
+        batch = strategy.calculate_volatility_batch(data, starts, ends)
+
+        assert len(batch) == len(starts)
+        for start, end, metrics in zip(starts, ends, batch):
+            expected = self._per_zone(strategy, data, start, end)
+            if expected is None:
+                assert metrics is None, (start, end)
+                continue
+            actual = metrics.to_dict()
+            assert actual.pop('strategy_params') == expected.pop('strategy_params')
+            assert actual == pytest.approx(expected, rel=1e-9, abs=1e-9), (start, end)
+
+    def test_precomputed_bands(self, frame):
+        strategy = CombinedVolatilityStrategy()
+        bands = strategy.calculate_global(frame)
+        starts, ends = self._windows(len(frame), count=20)
+
+        assert len(bands) == len(frame)
+        assert np.isnan(bands.width_pct[:strategy.bb_length - 1]).all()
+        assert strategy.calculate_volatility_batch(frame, starts, ends, bands=bands) == \
+            strategy.calculate_volatility_batch(frame, starts, ends)
+        with pytest.raises(ValueError, match="Bands cover"):
+            strategy.calculate_volatility_batch(frame.iloc[:100], [0], [50], bands=bands)
+
+    def test_short_zones_and_empty_input(self, frame):
+        strategy = CombinedVolatilityStrategy()
+
+        assert strategy.calculate_volatility_batch(frame, [], []) == []
+        short, normal = strategy.calculate_volatility_batch(frame, [10, 100], [11, 160])
+        assert short is None
+        assert isinstance(normal, VolatilityMetrics)
+        with pytest.raises(ValueError, match="must contain columns"):
+            strategy.calculate_volatility_batch(frame[['close']], [0], [10])
+
+
 def run_tests():
     """Run all combined volatility strategy tests."""
     pytest.main([__file__, '-v'])
@@ -0,0 +1,278 @@
+"""
+Tests for bquant.core.cache memory and disk backends.
+"""
+
+import pickle
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from bquant.core.cache import CacheManager, ColumnarDiskCache, DiskCache, MemoryCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ColumnarDiskCache(tmp_path / "cache")
+
+
+@pytest.fixture
+def frame():
+    n = 1000
+    df = pd.DataFrame({
+        'open': np.linspace(1, 2, n),
+        'close': np.linspace(2, 3, n),
+        'volume': np.arange(n, dtype=np.int64),
+        'label': ['a', 'b'] * (n // 2),
+    }, index=pd.date_range('2024-01-01', periods=n, freq='1h', name='time'))
+    df.attrs['symbol'] = 'XAUUSD'
+    return df
+
+
+class TestColumnarDiskCache:
+    """Arrow/.npy payloads with a SQLite metadata index."""
+
+    def test_dataframe_roundtrip_is_memory_mapped(self, cache, frame):
+        assert cache.put('frame', frame)
+        loaded = cache.get('frame')
+
+        pd.testing.assert_frame_equal(loaded, frame)
+        assert loaded.index.freq == frame.index.freq
+        assert loaded.attrs == {'symbol': 'XAUUSD'}
+        assert not loaded['close'].to_numpy().flags.writeable  # view over the mmap
+        assert (cache.data_dir / 'frame.arrow').exists()
+
+    def test_series_and_ndarray_roundtrip(self, cache):
+        series = pd.Series(np.arange(5.0), name='rsi')
+        array = np.arange(12, dtype=np.float32).reshape(3, 4)
+        cache.put('series', series)
+        cache.put('array', array)
+
+        pd.testing.assert_series_equal(cache.get('series'), series)
+        loaded = cache.get('array')
+        np.testing.assert_array_equal(loaded, array)
+        assert isinstance(loaded, np.memmap)
+
+        loaded[0, 0] = 100  # copy-on-write, cache file is untouched
+        assert cache.get('array')[0, 0] == 0
+
+    def test_other_objects_are_pickled(self, cache):
+        payload = {'cache_version': 3, 'result': [1, 2, 3]}
+        cache.put('payload', payload)
+
+        assert cache.get('payload') == payload
+        assert (cache.data_dir / 'payload.pkl').exists()
+
+    def test_replacing_entry_removes_old_payload(self, cache, frame):
+        cache.put('key', frame)
+        cache.put('key', {'now': 'pickled'})
+
+        assert cache.get('key') == {'now': 'pickled'}
+        assert not (cache.data_dir / 'key.arrow').exists()
+
+    def test_expiry_sweep_and_stats_do_not_read_payloads(self, cache, frame, monkeypatch):
+        cache.put('expired', frame, ttl=-1)
+        cache.put('fresh', frame, ttl=3600)
+        cache.put('forever', np.ones(3))
+
+        def fail(*args, **kwargs):
+            raise AssertionError("payload must not be read")
+
+        monkeypatch.setattr(cache, '_read_payload', fail)
+        monkeypatch.setattr(pickle, 'load', fail)
+
+        stats = cache.stats()
+        assert stats['entries'] == 3
+        assert stats['expired_entries'] == 1
+        assert stats['entries_by_kind'] == {'frame': 2, 'ndarray': 1}
+        assert stats['total_size_bytes'] > 0
+
+        assert cache.cleanup_expired() == 1
+        assert cache.stats()['entries'] == 2
+        assert not (cache.data_dir / 'expired.arrow').exists()
+
+    def test_expired_entry_is_not_returned(self, cache):
+        cache.put('key', [1, 2], ttl=-1)
+        assert cache.get('key') is None
+        assert cache.stats()['entries'] == 0
+
+    def test_hits_are_tracked_in_index(self, cache):
+        cache.put('key', [1, 2])
+        cache.get('key')
+        cache.get('key')
+        assert cache.stats()['hits'] == 2
+
+    def test_corrupted_payload_is_invalidated(self, cache):
+        cache.put('key', np.ones(3))
+        (cache.data_dir / 'key.npy').write_bytes(b'garbage')
+
+        assert cache.get('key') is None
+        assert cache.stats()['entries'] == 0
+
+    def test_invalidate_and_clear(self, cache, frame):
+        cache.put('a', frame)
+        cache.put('b', [1])
+        (cache.cache_dir / 'legacy.pkl').write_bytes(b'')
+
+        assert cache.invalidate('a')
+        assert not cache.invalidate('a')
+        assert cache.clear() == 2
+        assert cache.stats()['entries'] == 0
+        assert not (cache.cache_dir / 'legacy.pkl').exists()
+
+    def test_index_is_shared_between_instances(self, tmp_path, frame):
+        ColumnarDiskCache(tmp_path).put('key', frame)
+        pd.testing.assert_frame_equal(ColumnarDiskCache(tmp_path).get('key'), frame)
+
+    def test_concurrent_readers_and_writers(self, cache):
+        def work(worker):
+            results = []
+            for i in range(100):
+                key = f'key{i % 4}'
+                results.append(cache.put(key, [worker, i]))
+                cache.get(key)
+            return results
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = [ok for batch in pool.map(work, range(8)) for ok in batch]
+
+        assert all(results)
+        assert cache.stats()['entries'] == 4
+
+    def test_hit_does_not_wait_for_write_lock(self, cache, frame):
+        cache.put('key', frame)
+        writer = sqlite3.connect(cache.index_path, isolation_level=None)
+        writer.execute("BEGIN IMMEDIATE")
+        try:
+            start = time.perf_counter()
+            pd.testing.assert_frame_equal(cache.get('key'), frame)
+            assert time.perf_counter() - start < 5
+        finally:
+            writer.execute("ROLLBACK")
+            writer.close()
+
+        assert cache.stats()['hits'] == 0  # the hit is skipped while the lock is held
+        cache.get('key')
+        assert cache.stats()['hits'] == 1
+
+    def test_index_errors_are_a_miss_and_a_skipped_write(self, cache, monkeypatch):
+        cache.put('key', [1])
+
+        def locked(*args, **kwargs):
+            raise sqlite3.OperationalError('database is locked')
+
+        monkeypatch.setattr(cache, '_connect', locked)
+        assert cache.get('key') is None
+        assert cache.put('other', [2]) is False
+
+
+class TestCacheManagerBackends:
+    """CacheManager keeps its API for both disk backends."""
+
+    @pytest.mark.parametrize('backend, expected', [
+        ('columnar', ColumnarDiskCache),
+        ('pickle', DiskCache),
+    ])
+    def test_backend_selection(self, tmp_path, backend, expected):
+        manager = CacheManager(disk_backend=backend, cache_dir=tmp_path)
+        manager.put('key', {'value': 1})
+        manager.memory_cache.clear()
+
+        assert isinstance(manager.disk_cache, expected)
+        assert manager.get('key') == {'value': 1}
+        assert manager.stats()['disk']['backend'] == backend
+
+    def test_unknown_backend(self, tmp_path):
+        with pytest.raises(ValueError):
+            CacheManager(disk_backend='redis', cache_dir=tmp_path)
+
+
+class TestMemoryCache:
+    """O(1) LRU with entry, byte and per-namespace budgets."""
+
+    @staticmethod
+    def _array(n_bytes):
+        return np.zeros(n_bytes // 8, dtype=np.float64)
+
+    def test_lru_order_by_count(self):
+        cache = MemoryCache(max_size=2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        cache.get('a')  # 'b' becomes least recently used
+        cache.put('c', 3)
+
+        assert cache.get('b') is None
+        assert cache.get('a') == 1
+        assert cache.get('c') == 3
+        assert cache.stats()['evictions'] == 1
+
+    def test_evicts_by_bytes(self):
+        cache = MemoryCache(max_size=100, max_bytes=3000)
+        for key in 'abc':
+            cache.put(key, self._array(1000))
+        cache.get('a')
+        cache.put('d', self._array(1600))  # needs room of two entries
+
+        assert cache.get('b') is None and cache.get('c') is None
+        assert cache.get('a') is not None and cache.get('d') is not None
+        assert cache.stats()['total_size_bytes'] == 2600
+
+    def test_namespace_budget_only_evicts_own_namespace(self):
+        cache = MemoryCache(max_size=100, namespace_budgets={'indicators': 2000})
+        cache.put('zone_analysis_x', self._array(1000))
+        cache.put('i1', self._array(1000), namespace='indicators')
+        cache.put('i2', self._array(1000), namespace='indicators')
+        cache.put('i3', self._array(1000), namespace='indicators')
+
+        assert cache.get('i1') is None
+        assert cache.get('zone_analysis_x') is not None
+        stats = cache.stats()['namespaces']
+        assert stats['indicators'] == {'entries': 2, 'size_bytes': 2000, 'max_bytes': 2000}
+        assert stats['zones']['entries'] == 1
+
+    def test_oversized_entry_is_not_cached(self):
+        cache = MemoryCache(max_bytes=1000)
+        cache.put('small', self._array(800))
+        cache.put('huge', self._array(8000))
+
+        assert cache.get('huge') is None
+        assert cache.get('small') is not None
+
+    def test_replace_and_invalidate_keep_accounting(self):
+        cache = MemoryCache(max_bytes=10_000)
+        cache.put('a', self._array(1000))
+        cache.put('a', self._array(2000))
+        assert cache.stats()['total_size_bytes'] == 2000
+
+        assert cache.invalidate('a')
+        stats = cache.stats()
+        assert stats['entries'] == 0
+        assert stats['total_size_bytes'] == 0
+        assert stats['namespaces'] == {}
+
+    def test_zero_size_entries_keep_namespace_accounting(self):
+        cache = MemoryCache(max_bytes=10_000)
+        cache.put('a', self._array(0))
+        cache.put('b', self._array(0))
+
+        assert cache.invalidate('a')
+        assert cache.stats()['namespaces']['default']['entries'] == 1
+        assert cache.invalidate('b')
+        assert cache.stats()['namespaces'] == {}
+
+    def test_expired_entry_is_dropped(self):
+        cache = MemoryCache()
+        cache.put('a', 1, ttl=-1)
+
+        assert cache.get('a') is None
+        assert cache.stats()['total_size_bytes'] == 0
+
+    def test_cache_manager_passes_namespace(self):
+        manager = CacheManager(disk_cache=False, memory_max_bytes=10_000,
+                               namespace_budgets={'swing': 1000})
+        manager.put('ctx', self._array(800), namespace='swing')
+
+        assert manager.stats()['memory']['namespaces']['swing']['entries'] == 1
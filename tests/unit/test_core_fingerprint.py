@@ -0,0 +1,114 @@
+"""
+Tests for bquant.core.fingerprint content fingerprints.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import bquant.core.fingerprint as fp_module
+from bquant.analysis.zones.cache import ZoneAnalysisCache
+from bquant.core.cache import MemoryCache
+from bquant.core.fingerprint import (
+    fingerprint_array,
+    fingerprint_frame,
+    invalidate_fingerprint,
+)
+
+
+@pytest.fixture
+def ohlc():
+    n = 5000
+    rng = np.random.default_rng(1)
+    close = 100 + np.cumsum(rng.normal(0, 1, n))
+    return pd.DataFrame({
+        'open': close,
+        'high': close + 1,
+        'low': close - 1,
+        'close': close,
+        'label': ['a', 'b'] * (n // 2),
+    }, index=pd.date_range('2024-01-01', periods=n, freq='1min'))
+
+
+class TestFingerprintFrame:
+    """Buffer hashing, sampled mode and memoization."""
+
+    def test_equal_content_gives_equal_fingerprint(self, ohlc):
+        assert fingerprint_frame(ohlc) == fingerprint_frame(ohlc.copy())
+        assert fingerprint_frame(ohlc['close']) == fingerprint_frame(ohlc['close'].copy())
+
+    def test_content_index_and_columns_change_fingerprint(self, ohlc):
+        base = fingerprint_frame(ohlc)
+
+        changed = ohlc.copy()
+        changed.iloc[100, 3] += 1e-9
+        shifted = ohlc.copy()
+        shifted.index = shifted.index + pd.Timedelta('1min')
+        renamed = ohlc.rename(columns={'close': 'price'})
+
+        assert fingerprint_frame(changed) != base
+        assert fingerprint_frame(shifted) != base
+        assert fingerprint_frame(renamed) != base
+        assert fingerprint_frame(ohlc, ['open', 'close']) != base
+
+    def test_sampled_mode_guards_length_and_bounds(self, ohlc):
+        sampled = fingerprint_frame(ohlc, mode='sampled', sample_rows=256)
+
+        assert sampled != fingerprint_frame(ohlc)
+        assert fingerprint_frame(ohlc.iloc[:-1], mode='sampled', sample_rows=256) != sampled
+        # Short frames are hashed in full regardless of the mode
+        assert fingerprint_frame(ohlc, mode='sampled') == fingerprint_frame(ohlc)
+
+    def test_repeated_calls_skip_rehashing(self, ohlc, monkeypatch):
+        first = fingerprint_frame(ohlc, ['open', 'high', 'low', 'close'])
+
+        def fail(*args, **kwargs):
+            raise AssertionError("must be served from the registry")
+
+        monkeypatch.setattr(fp_module, '_compute', fail)
+        assert fingerprint_frame(ohlc, ['open', 'high', 'low', 'close']) == first
+
+    def test_replaced_column_and_invalidate_recompute(self, ohlc):
+        first = fingerprint_frame(ohlc)
+
+        ohlc['close'] = ohlc['close'] * 2  # new buffer -> guard mismatch
+        second = fingerprint_frame(ohlc)
+        assert second != first
+
+        ohlc.iloc[0, 0] = -1.0  # in-place edit keeps the buffer
+        assert fingerprint_frame(ohlc) == second
+        invalidate_fingerprint(ohlc)
+        assert fingerprint_frame(ohlc) != second
+
+    def test_registry_releases_dead_objects(self, ohlc):
+        frame = ohlc.copy()
+        fingerprint_frame(frame)
+        obj_id = id(frame)
+        del frame
+
+        assert obj_id not in fp_module._registry
+
+    def test_array_and_invalid_mode(self):
+        values = np.arange(10.0)
+        assert fingerprint_array(values) == fingerprint_array(values.copy())
+        assert fingerprint_array(values) != fingerprint_array(values.astype(np.float32))
+        with pytest.raises(ValueError):
+            fingerprint_frame(pd.DataFrame({'a': [1]}), mode='fast')
+
+
+class TestCacheKeys:
+    """Cache key helpers use fingerprints."""
+
+    def test_memory_cache_key_is_content_based(self, ohlc):
+        cache = MemoryCache()
+        key = cache._generate_key('f', (ohlc,), {'period': 14})
+
+        assert key == cache._generate_key('f', (ohlc.copy(),), {'period': 14})
+        assert key != cache._generate_key('f', (ohlc.iloc[:-1],), {'period': 14})
+
+    def test_zone_data_hash_ignores_extra_columns(self, ohlc):
+        with_extra = ohlc.assign(macd=1.0)
+
+        assert ZoneAnalysisCache.compute_data_hash(ohlc) == ZoneAnalysisCache.compute_data_hash(with_extra)
+        with pytest.raises(ValueError):
+            ZoneAnalysisCache.compute_data_hash(ohlc.drop(columns='low'))
@@ -0,0 +1,166 @@
+"""
+Unit tests for the sniff-once CSV ingestion engine.
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import bquant.data.loader as loader
+from bquant.core.exceptions import DataLoadingError
+from bquant.data.ingest import (
+    ISO8601,
+    UNIX_SECONDS,
+    clear_layout_cache,
+    get_csv_layout,
+    read_ohlcv_csv,
+    sniff_csv_layout,
+)
+from bquant.data.loader import _read_csv_fallback, load_ohlcv_data
+
+
+def _bars(n=40, seed=0):
+    rng = np.random.default_rng(seed)
+    close = 100 + np.cumsum(rng.normal(0, 1, n))
+    return pd.DataFrame({
+        'open': close - 0.25,
+        'high': close + 1.0,
+        'low': close - 1.0,
+        'close': close,
+        'volume': rng.integers(1, 1000, n),
+    }, index=pd.date_range('2025-01-01', periods=n, freq='h'))
+
+
+def _write(path, lines, encoding='utf-8'):
+    path.write_text('\n'.join(lines) + '\n', encoding=encoding)
+    return path
+
+
+def _mt_lines(bars, split=False):
+    lines = []
+    for ts, row in bars.iterrows():
+        time = f"{ts:%Y.%m.%d},{ts:%H:%M}" if split else f"{ts:%Y.%m.%d %H:%M}"
+        lines.append(f"{time},{row.open:.5f},{row.high:.5f},{row.low:.5f},{row.close:.5f},{int(row.volume)},0")
+    return lines
+
+
+def _tv_lines(bars, unix=False):
+    lines = ['time,open,high,low,close,Volume']
+    for ts, row in bars.iterrows():
+        time = int(ts.timestamp()) if unix else ts.tz_localize('Asia/Bangkok').isoformat()
+        lines.append(f"{time},{row.open},{row.high},{row.low},{row.close},{int(row.volume)}")
+    return lines
+
+
+@pytest.fixture(autouse=True)
+def _fresh_layout_cache():
+    clear_layout_cache()
+    yield
+    clear_layout_cache()
+
+
+class TestSniffLayout:
+
+    def test_metatrader_without_header(self, tmp_path):
+        layout = sniff_csv_layout(_write(tmp_path / 'XAUUSDM15.csv', _mt_lines(_bars())))
+
+        assert not layout.has_header
+        assert layout.columns == ('time', 'open', 'high', 'low', 'close', 'volume', 'col_6')
+        assert layout.time_format == '%Y.%m.%d %H:%M'
+
+    def test_metatrader_split_date_time(self, tmp_path):
+        layout = sniff_csv_layout(_write(tmp_path / 'mt.csv', _mt_lines(_bars(), split=True)))
+
+        assert layout.time_columns == ('date', 'time')
+        assert layout.time_format == '%Y.%m.%d %H:%M'
+
+    def test_tradingview_iso_with_offset(self, tmp_path):
+        layout = sniff_csv_layout(_write(tmp_path / 'tv.csv', _tv_lines(_bars())))
+
+        assert layout.has_header and layout.time_columns == ('time',)
+        assert layout.time_format == ISO8601
+        assert layout.utc_offset == 7 * 3600
+
+    def test_encoding_and_delimiter(self, tmp_path):
+        lines = [line.replace(',', ';') for line in _tv_lines(_bars(), unix=True)]
+        layout = sniff_csv_layout(_write(tmp_path / 'tv.csv', lines, encoding='utf-16'))
+
+        assert layout.encoding == 'utf-16'
+        assert layout.delimiter == ';'
+        assert layout.time_format == UNIX_SECONDS
+
+    def test_unrecognized_layout(self, tmp_path):
+        path = _write(tmp_path / 'notes.csv', ['name,comment', 'a,b', 'c,d'])
+
+        assert sniff_csv_layout(path) is None
+        with pytest.raises(DataLoadingError, match="Unrecognized CSV layout"):
+            read_ohlcv_csv(path)
+
+    def test_layout_cache_follows_file_changes(self, tmp_path, monkeypatch):
+        path = _write(tmp_path / 'mt.csv', _mt_lines(_bars()))
+        calls = []
+        original = sniff_csv_layout
+
+        def counting(file_path):
+            calls.append(file_path)
+            return original(file_path)
+
+        monkeypatch.setattr('bquant.data.ingest.sniff_csv_layout', counting)
+        first = get_csv_layout(path)
+        assert get_csv_layout(path) is first
+        assert len(calls) == 1
+
+        _write(path, _tv_lines(_bars()))
+        os.utime(path, ns=(1, 1))
+        assert get_csv_layout(path).has_header
+        assert len(calls) == 2
+
+
+class TestReadOhlcvCsv:
+
+    @pytest.mark.parametrize('lines', [
+        _mt_lines(_bars()),
+        _tv_lines(_bars()),
+        _bars().to_csv().splitlines(),
+        _bars().rename_axis('time').reset_index().to_csv(index=False).splitlines(),
+    ], ids=['metatrader', 'tradingview', 'pandas_index', 'time_column'])
+    def test_matches_fallback_reader(self, tmp_path, lines):
+        path = _write(tmp_path / 'data.csv', lines)
+
+        expected = _read_csv_fallback(path, loader.logger)
+        if expected.index.dtype == object:  # the fallback may leave ISO strings unparsed
+            expected.index = pd.to_datetime(expected.index, format='ISO8601')
+        actual = read_ohlcv_csv(path)
+
+        # Arrow rounds floats correctly; the pandas fast parser may differ by an ulp
+        pd.testing.assert_frame_equal(actual, expected)
+
+    def test_parses_file_once(self, tmp_path, monkeypatch):
+        path = _write(tmp_path / 'tv.csv', _tv_lines(_bars(120)))
+
+        def fail(*args, **kwargs):
+            raise AssertionError("pandas reader must not be used")
+
+        monkeypatch.setattr(pd, 'read_csv', fail)
+        df = load_ohlcv_data(path)
+
+        assert len(df) == 120
+        assert str(df.index.dtype) == 'datetime64[ns, UTC+07:00]'
+
+    def test_layouts_the_fallback_could_not_parse(self, tmp_path):
+        bars = _bars()
+        split = read_ohlcv_csv(_write(tmp_path / 'split.csv', _mt_lines(bars, split=True)))
+        unix = read_ohlcv_csv(_write(tmp_path / 'unix.csv', _tv_lines(bars, unix=True)))
+
+        assert split.index.equals(bars.index.rename('time'))
+        assert list(split.columns) == ['open', 'high', 'low', 'close', 'volume', 'col_6']
+        assert unix.index.equals(bars.index.rename('time'))  # naive UTC
+
+    def test_loader_falls_back_for_unknown_layout(self, tmp_path):
+        lines = ['time,open,high,low,close,volume', 'first,1,2,0.5,1.5,10', 'second,1,2,0.5,1.5,10']
+        df = load_ohlcv_data(_write(tmp_path / 'odd.csv', lines), validate_data=False)
+
+        assert list(df.columns) == ['open', 'high', 'low', 'close', 'volume']
+        assert df.index.tolist() == ['first', 'second']
@@ -0,0 +1,233 @@
+"""
+Unit tests for the partitioned Parquet data lake.
+"""
+
+import os
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from bquant.core.config import reset_directories_to_defaults, set_data_dir, set_processed_data_dir
+from bquant.core.exceptions import DataLoadingError
+from bquant.data.lake import DataLake, select_range, universal_timeframe
+from bquant.data import lake as lake_module, loader
+from bquant.data.loader import get_available_symbols, get_available_timeframes, load_ohlcv_data, load_symbol_data
+
+
+def _bars(n=3000, freq='h', tz=None, seed=0):
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.005, n)))
+    index = pd.date_range('2024-01-01', periods=n, freq=freq, tz=tz, name='time')
+    index.freq = None
+    return pd.DataFrame({
+        'open': close - 0.25,
+        'high': close + 1.0,
+        'low': close - 1.0,
+        'close': close,
+        'volume': rng.integers(1, 1000, n),
+    }, index=index)
+
+
+def _write_mt(path, bars):
+    lines = [
+        f"{ts:%Y.%m.%d %H:%M},{row.open:.5f},{row.high:.5f},{row.low:.5f},{row.close:.5f},{int(row.volume)}"
+        for ts, row in bars.iterrows()
+    ]
+    path.write_text('\n'.join(lines) + '\n')
+    return path
+
+
+def _write_tv(path, bars):
+    bars.rename(columns={'volume': 'Volume'}).to_csv(path, date_format='%Y-%m-%dT%H:%M:%SZ')
+    return path
+
+
+@pytest.fixture
+def lake(tmp_path):
+    return DataLake(tmp_path / 'lake')
+
+
+@pytest.fixture
+def data_dirs(tmp_path):
+    data_dir = tmp_path / 'data'
+    data_dir.mkdir()
+    set_data_dir(data_dir)
+    set_processed_data_dir(tmp_path / 'processed')
+    yield data_dir
+    reset_directories_to_defaults()
+
+
+class TestDataLake:
+
+    @pytest.mark.parametrize('tz', [None, 'UTC', '+07:00'])
+    def test_round_trip(self, lake, tz):
+        bars = _bars(tz=tz)
+        entry = lake.write('XAUUSD', '1h', bars)
+
+        assert list(entry['partitions']) == ['2024-01', '2024-02', '2024-03', '2024-04', '2024-05']
+        assert sum(entry['partitions'].values()) == len(bars)
+        pd.testing.assert_frame_equal(lake.read('XAUUSD', '1h'), bars)
+
+    def test_range_and_columns_are_pushed_down(self, lake):
+        bars = _bars(tz='+07:00')
+        lake.write('XAUUSD', '1h', bars)
+
+        files = lake.partition_files('XAUUSD', '1h', start='2024-02-10', end='2024-03-05')
+        df = lake.read('XAUUSD', '1h', start='2024-02-10', end='2024-03-05', columns=['close', 'spread'])
+
+        assert [path.parent.name for path in files] == ['year_month=2024-02', 'year_month=2024-03']
+        pd.testing.assert_frame_equal(df, select_range(bars, '2024-02-10', '2024-03-05', ['close']))
+        assert df.index[0] == pd.Timestamp('2024-02-10', tz='+07:00')
+
+    def test_empty_range_keeps_schema(self, lake):
+        lake.write('XAUUSD', '1h', _bars())
+        df = lake.read('XAUUSD', '1h', start='2030-01-01')
+
+        assert df.empty and list(df.columns) == ['open', 'high', 'low', 'close', 'volume']
+        assert df['volume'].dtype == np.int64
+
+    def test_catalog_and_removal(self, lake):
+        lake.write('XAUUSD', 'H1', _bars())
+        lake.write('EURUSD', '15m', _bars(freq='15min'))
+
+        assert universal_timeframe('60') == universal_timeframe('H1') == '1h'
+        assert lake.symbols() == ['EURUSD', 'XAUUSD']
+        assert lake.timeframes('XAUUSD') == ['1h']
+        assert DataLake(lake.root).has('XAUUSD', '60')
+
+        lake.remove('XAUUSD', '1h')
+        assert lake.symbols() == ['EURUSD']
+        assert not (lake.root / 'symbol=XAUUSD' / 'timeframe=1h').exists()
+        with pytest.raises(DataLoadingError):
+            lake.read('XAUUSD', '1h')
+
+    def test_rewrite_swaps_dataset_directory(self, lake, monkeypatch):
+        lake.write('XAUUSD', '1h', _bars(seed=1))
+        dataset_dir = lake.root / 'symbol=XAUUSD' / 'timeframe=1h'
+        moves = []
+        real_replace = os.replace
+
+        def _replace(src, dst):
+            moves.append((Path(src).name, Path(dst).name))
+            return real_replace(src, dst)
+
+        monkeypatch.setattr(lake_module.os, 'replace', _replace)
+        lake.write('XAUUSD', '1h', _bars(n=1000, seed=2))
+
+        # The old dataset is renamed aside (not deleted in place) before the swap
+        pid = os.getpid()
+        assert moves[:2] == [
+            ('timeframe=1h', f'.timeframe=1h.{pid}.old'),
+            (f'.timeframe=1h.{pid}.tmp', 'timeframe=1h'),
+        ]
+        assert lake.read('XAUUSD', '1h').shape == (1000, 5)
+        assert sorted(path.name for path in dataset_dir.parent.iterdir()) == ['timeframe=1h']
+
+    def test_failed_swap_restores_previous_dataset(self, lake, monkeypatch):
+        bars = _bars(seed=1)
+        lake.write('XAUUSD', '1h', bars)
+        real_replace = os.replace
+
+        def _replace(src, dst):
+            if str(src).endswith('.tmp'):
+                raise OSError('swap failed')
+            return real_replace(src, dst)
+
+        monkeypatch.setattr(lake_module.os, 'replace', _replace)
+        with pytest.raises(OSError, match='swap failed'):
+            lake.write('XAUUSD', '1h', _bars(n=1000, seed=2))
+
+        monkeypatch.undo()
+        pd.testing.assert_frame_equal(lake.read('XAUUSD', '1h'), bars)
+
+    def test_to_dataset_uses_hive_partitions(self, lake):
+        lake.write('XAUUSD', '1h', _bars())
+        table = lake.to_dataset().to_table(columns=['close', 'symbol', 'year_month'])
+
+        assert table.num_rows == 3000
+        assert set(table.column('symbol').to_pylist()) == {'XAUUSD'}
+
+
+class TestIngest:
+
+    @pytest.mark.parametrize('n_jobs', [1, 2])
+    def test_ingest_converts_changed_files_only(self, lake, tmp_path, n_jobs):
+        data_dir = tmp_path / 'data'
+        data_dir.mkdir()
+        _write_mt(data_dir / 'XAUUSDH1.csv', _bars(seed=1))
+        _write_mt(data_dir / 'EURUSD_15m.csv', _bars(freq='15min', seed=2))
+        (data_dir / 'BROKEN_1d.csv').write_text('name,comment\na,b\n')
+
+        status = lake.ingest(data_dir, n_jobs=n_jobs)
+        assert status['XAUUSD/1h'] == status['EURUSD/15m'] == 'converted'
+        assert 'Error' in status['BROKEN/1d']
+        assert lake.info('XAUUSD', '1h')['rows'] == 3000
+
+        _write_mt(data_dir / 'XAUUSDH1.csv', _bars(n=1000, seed=1))
+        status = lake.ingest(data_dir, n_jobs=n_jobs)
+        assert status['XAUUSD/1h'] == 'converted' and status['EURUSD/15m'] == 'unchanged'
+        assert lake.read('XAUUSD', '1h').shape == (1000, 5)
+
+
+class TestLoaderIntegration:
+
+    def test_load_symbol_data_reads_range_from_lake(self, data_dirs):
+        bars = _bars(seed=3)
+        _write_mt(data_dirs / 'XAUUSDH1.csv', bars)
+        DataLake().ingest(n_jobs=1)
+
+        df = load_symbol_data('XAUUSD', '1h', data_source='metatrader',
+                              start='2024-03-01', end='2024-03-31 23:00', columns=['close'])
+        csv = load_ohlcv_data(data_dirs / 'XAUUSDH1.csv')
+
+        assert len(df) == 31 * 24
+        pd.testing.assert_frame_equal(df, select_range(csv, '2024-03-01', '2024-03-31 23:00', ['close']))
+
+    def test_loader_reuses_one_lake_per_directory(self, data_dirs, tmp_path):
+        default = loader._get_default_lake()
+
+        assert loader._get_default_lake() is default
+        assert default.root == tmp_path / 'processed' / 'lake'
+
+        set_processed_data_dir(tmp_path / 'other')
+        assert loader._get_default_lake().root == tmp_path / 'other' / 'lake'
+
+    def test_stale_lake_falls_back_to_csv(self, data_dirs):
+        _write_mt(data_dirs / 'XAUUSDH1.csv', _bars(seed=3))
+        DataLake().ingest(n_jobs=1)
+        _write_mt(data_dirs / 'XAUUSDH1.csv', _bars(n=500, seed=3))
+        os.utime(data_dirs / 'XAUUSDH1.csv', ns=(1, 1))
+
+        assert not DataLake().is_current('XAUUSD', '1h')
+        assert len(load_symbol_data('XAUUSD', '1h', data_source='metatrader')) == 500
+
+    def test_lake_of_another_source_is_not_used(self, data_dirs):
+        _write_mt(data_dirs / 'XAUUSDH1.csv', _bars(seed=3))
+        DataLake().ingest(n_jobs=1)
+        _write_tv(data_dirs / 'OANDA_XAUUSD, 60.csv', _bars(n=200, tz='UTC'))
+
+        assert len(load_symbol_data('XAUUSD', '1h', data_source='tradingview')) == 200
+        assert len(load_symbol_data('XAUUSD', '1h', data_source='metatrader')) == 3000
+
+    def test_lake_without_source_is_not_used(self, data_dirs):
+        DataLake().write('XAUUSD', '1h', _bars(n=100))
+
+        with pytest.raises(DataLoadingError):
+            load_symbol_data('XAUUSD', '1h', data_source='metatrader')
+
+    def test_available_symbols_merge_catalog_and_files(self, data_dirs):
+        _write_mt(data_dirs / 'XAUUSDH1.csv', _bars(seed=3))
+        assert get_available_timeframes('XAUUSD') == ['1h']  # no lake yet: same names
+
+        DataLake().ingest(n_jobs=1)
+        _write_mt(data_dirs / 'EURUSDM15.csv', _bars(n=100, freq='15min'))
+        assert get_available_symbols() == ['EURUSD', 'XAUUSD']
+        assert get_available_timeframes('EURUSD') == ['15m']
+
+        (data_dirs / 'XAUUSDH1.csv').unlink()
+        assert get_available_timeframes('XAUUSD') == ['1h']  # lake copy of a removed file
+        assert get_available_symbols(data_dirs.parent) == []
+        DataLake().write('GBPUSD', '1h', _bars(n=100))
+        assert 'GBPUSD' not in get_available_symbols()
@@ -0,0 +1,149 @@
+"""
+Tests for the streaming indicator state API (init_state / update) and kernels.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from bquant.core.exceptions import IndicatorCalculationError
+from bquant.core.performance import OptimizedIndicators
+from bquant.indicators import IndicatorFactory
+from bquant.indicators.custom import AverageTrueRange
+from bquant.indicators.streaming import EwmState, ewm_init, ewm_mean, ewm_state, rolling_apply
+
+
+@pytest.fixture
+def ohlcv():
+    n = 400
+    rng = np.random.default_rng(7)
+    close = 100 + np.cumsum(rng.normal(0, 1, n))
+    return pd.DataFrame({
+        'open': close + rng.normal(0, 0.1, n),
+        'high': close + rng.uniform(0.1, 1.0, n),
+        'low': close - rng.uniform(0.1, 1.0, n),
+        'close': close,
+        'volume': rng.uniform(1000, 2000, n),
+    }, index=pd.date_range('2024-01-01', periods=n, freq='1h'))
+
+
+STREAMING_INDICATORS = [
+    ('sma', {'period': 20}),
+    ('ema', {'period': 12}),
+    ('rsi', {'period': 14}),
+    ('macd', {'fast_period': 12, 'slow_period': 26, 'signal_period': 9}),
+    ('bbands', {'period': 20, 'std_dev': 2}),
+    ('atr', {'period': 14}),
+]
+
+
+class TestEwmKernels:
+    """lfilter-based EWM matches pandas and carries state."""
+
+    @pytest.mark.parametrize('adjust', [True, False])
+    def test_chunked_matches_pandas_with_gaps(self, adjust):
+        values = np.random.default_rng(3).normal(size=300)
+        values[[0, 50, 51, 200]] = np.nan
+        expected = pd.Series(values).ewm(span=12, adjust=adjust).mean().to_numpy()
+
+        state = EwmState.from_span(12, adjust=adjust)
+        streamed = np.concatenate([ewm_mean(chunk, state) for chunk in np.array_split(values, 9)])
+
+        np.testing.assert_allclose(streamed, expected, rtol=1e-10)
+
+    @pytest.mark.parametrize('adjust', [True, False])
+    def test_state_restored_from_pandas_output(self, adjust):
+        values = np.random.default_rng(4).normal(size=300)
+        values[[10, 11]] = np.nan
+        expected = pd.Series(values).ewm(alpha=0.1, adjust=adjust).mean().to_numpy()
+
+        state = ewm_state(values[:100], expected[:100], 0.1, adjust=adjust)
+        np.testing.assert_allclose(ewm_mean(values[100:], state), expected[100:], rtol=1e-10)
+
+    def test_init_requires_span_or_alpha(self):
+        out, state = ewm_init(np.arange(5.0), span=3)
+        assert state.mean == out[-1]
+        with pytest.raises(ValueError):
+            ewm_init(np.arange(5.0))
+
+    def test_rolling_apply_short_tail(self):
+        values = np.arange(10.0)
+        out, tail = rolling_apply(np.array([]), values[:2], 4, lambda w: w.mean(axis=1))
+        assert np.isnan(out).all() and list(tail) == [0.0, 1.0]
+
+        out, tail = rolling_apply(tail, values[2:], 4, lambda w: w.mean(axis=1))
+        np.testing.assert_allclose(out, pd.Series(values).rolling(4).mean().to_numpy()[2:], equal_nan=True)
+        assert list(tail) == [7.0, 8.0, 9.0]
+
+
+class TestIndicatorState:
+    """init_state + update reproduce a full calculate()."""
+
+    @pytest.mark.parametrize('name,params', STREAMING_INDICATORS)
+    def test_update_matches_full_calculation(self, ohlcv, name, params):
+        indicator = IndicatorFactory.create('custom', name, **params)
+        expected = indicator.calculate(ohlcv).data
+
+        state = indicator.init_state(ohlcv.iloc[:150])
+        chunks = [indicator.update(state, ohlcv.iloc[start:start + 1]).data for start in range(150, 160)]
+        chunks += [indicator.update(state, ohlcv.iloc[start:start + 37]).data for start in range(160, len(ohlcv), 37)]
+        streamed = pd.concat(chunks)
+
+        assert state.n_bars == len(ohlcv)
+        assert list(streamed.columns) == list(expected.columns)
+        pd.testing.assert_frame_equal(streamed, expected.iloc[150:], rtol=1e-9, check_freq=False)
+
+    def test_update_result_metadata(self, ohlcv):
+        indicator = IndicatorFactory.create('custom', 'ema', period=10)
+        state = indicator.init_state(ohlcv.iloc[:50])
+        result = indicator.update(state, ohlcv.iloc[50:51])
+
+        assert result.metadata['calculation_method'] == 'streaming'
+        assert result.metadata['bars_processed'] == 51
+        assert indicator.update(state, ohlcv.iloc[:0]).data.empty
+        assert state.n_bars == 51
+
+    def test_state_of_other_indicator_is_rejected(self, ohlcv):
+        state = IndicatorFactory.create('custom', 'sma', period=5).init_state(ohlcv.iloc[:50])
+        with pytest.raises(ValueError):
+            IndicatorFactory.create('custom', 'ema', period=5).update(state, ohlcv.iloc[50:])
+
+    def test_missing_columns_raise_calculation_error(self, ohlcv):
+        indicator = AverageTrueRange()
+        state = indicator.init_state(ohlcv.iloc[:50])
+        with pytest.raises(IndicatorCalculationError):
+            indicator.update(state, ohlcv.iloc[50:60][['close']])
+
+    def test_unsupported_indicator(self):
+        from bquant.indicators import CustomIndicator
+
+        class Constant(CustomIndicator):
+            def calculate(self, data, **kwargs):
+                raise NotImplementedError
+
+            def get_output_columns(self):
+                return ['constant']
+
+            def get_description(self):
+                return 'Constant'
+
+        indicator = Constant('constant', {})
+        assert not indicator.supports_streaming
+        with pytest.raises(NotImplementedError):
+            indicator.init_state(pd.DataFrame({'close': [1.0]}))
+
+
+class TestOptimizedIndicators:
+    """Vectorized OptimizedIndicators kernels."""
+
+    def test_ema_sma_bbands_match_pandas(self):
+        prices = 100 + np.cumsum(np.random.default_rng(5).normal(size=500))
+        series = pd.Series(prices)
+
+        np.testing.assert_allclose(OptimizedIndicators.ema(prices, 12),
+                                   series.ewm(span=12, adjust=False).mean(), rtol=1e-12)
+        np.testing.assert_allclose(OptimizedIndicators.sma(prices, 10),
+                                   series.rolling(10).mean(), rtol=1e-12, equal_nan=True)
+        upper, middle, _ = OptimizedIndicators.bollinger_bands(prices, 20, 2.0)
+        np.testing.assert_allclose(upper, series.rolling(20).mean() + 2 * series.rolling(20).std(ddof=0),
+                                   rtol=1e-10, equal_nan=True)
@@ -12,7 +12,7 @@ from bquant.indicators.library.pandas_ta import PandasTALoader
 
 
 @pytest.fixture
-def pandas_ta_test_env(monkeypatch):
+def pandas_ta_test_env(monkeypatch, tmp_path):
     """Reset loader state and configure discovery for tests."""
 
     # Other test modules set BQUANT_SKIP_PANDAS_TA=1 via os.environ.setdefault,
@@ -24,6 +24,9 @@ def pandas_ta_test_env(monkeypatch):
     monkeypatch.setattr(PandasTALoader, "_available_indicators", [])
     monkeypatch.setattr(PandasTALoader, "_function_cache", {})
     monkeypatch.setattr(PandasTALoader, "_ta_module", None)
+    monkeypatch.setattr(PandasTALoader, "_configs", {})
+    monkeypatch.setattr(PandasTALoader, "_manifest", None)
+    monkeypatch.setattr(PandasTALoader, "manifest_dir", tmp_path)
     monkeypatch.setattr(
         PandasTALoader, "is_available", classmethod(lambda cls: True)
     )
@@ -152,3 +155,92 @@ def test_library_manager_exposes_new_indicators(pandas_ta_test_env):
 
     indicators = IndicatorFactory.list_indicators()
     assert indicators["pandas_ta_brand_new"] == "library"
+
+
+def _reset_process_state(monkeypatch):
+    """Simulate a fresh process: drop in-memory registration but keep the manifest file."""
+
+    monkeypatch.setattr(PandasTALoader, "_indicators_registered", False)
+    monkeypatch.setattr(PandasTALoader, "_configs", {})
+    monkeypatch.setattr(PandasTALoader, "_manifest", None)
+    monkeypatch.setattr(IndicatorFactory, "_registry", {})
+    monkeypatch.setattr(IndicatorFactory, "_library_functions", {})
+
+
+def test_registration_is_lazy_and_manifest_is_reused(pandas_ta_test_env, monkeypatch):
+    """Probing runs on first use only; a new process reads signatures and columns from the manifest."""
+
+    def lazy_sma(close, length: int = 3):
+        return close.rolling(length).mean().rename("LAZY_3")
+
+    def never_used(high, low, window: int = 2):
+        return (high - low).rename("NEVER")
+
+    pandas_ta_test_env({"lazy_sma": lazy_sma, "never_used": never_used})
+
+    probes = []
+    original_probe = PandasTALoader._determine_output_columns.__func__
+
+    def counting_probe(cls, func_name, *args):
+        probes.append(func_name)
+        return original_probe(cls, func_name, *args)
+
+    monkeypatch.setattr(PandasTALoader, "_determine_output_columns", classmethod(counting_probe))
+
+    assert LibraryManager.load_library("pandas_ta") == 2
+    assert probes == []
+
+    indicator = IndicatorFactory.create("pandas_ta", "lazy_sma")
+    IndicatorFactory.create("pandas_ta", "lazy_sma", length=5)
+    assert probes == ["lazy_sma"]
+    assert indicator.config.columns == ["LAZY_3"]
+
+    manifest_path = PandasTALoader.get_manifest_path()
+    assert manifest_path.exists()
+    assert PandasTALoader._library_version() in manifest_path.name
+
+    _reset_process_state(monkeypatch)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("manifest entry must be used")
+
+    monkeypatch.setattr(PandasTALoader, "_analyze_function_dynamically", classmethod(fail))
+    assert LibraryManager.load_library("pandas_ta") == 2
+    assert IndicatorFactory.create("pandas_ta", "lazy_sma").config.columns == ["LAZY_3"]
+    assert probes == ["lazy_sma"]
+
+
+def test_failed_probe_unregisters_indicator(pandas_ta_test_env, monkeypatch):
+    """An indicator that fails on sample data is dropped and skipped on the next start."""
+
+    def broken(close, length: int = 3):
+        raise RuntimeError("needs more data")
+
+    pandas_ta_test_env({"broken": broken})
+    LibraryManager.load_library("pandas_ta")
+
+    with pytest.raises(KeyError):
+        IndicatorFactory.create("pandas_ta", "broken")
+    assert "pandas_ta_broken" not in IndicatorFactory._registry
+
+    _reset_process_state(monkeypatch)
+    assert LibraryManager.load_library("pandas_ta") == 0
+
+
+def test_manifest_of_other_version_is_ignored(pandas_ta_test_env, monkeypatch):
+    """Manifest entries are keyed by the pandas-ta version."""
+
+    def simple(close, length: int = 3):
+        return close.rename("SIMPLE")
+
+    pandas_ta_test_env({"simple": simple})
+    monkeypatch.setattr(PandasTALoader, "_library_version", classmethod(lambda cls: "0.1.0"))
+    LibraryManager.load_library("pandas_ta")
+    IndicatorFactory.create("pandas_ta", "simple")
+    old_path = PandasTALoader.get_manifest_path()
+
+    _reset_process_state(monkeypatch)
+    monkeypatch.setattr(PandasTALoader, "_library_version", classmethod(lambda cls: "0.2.0"))
+
+    assert PandasTALoader.get_manifest_path() != old_path
+    assert PandasTALoader._load_manifest()["indicators"] == {}
@@ -2,10 +2,12 @@
 Unit tests for PivotPointsSwingStrategy using built-in sample data.
 """
 
+import numpy as np
 import pytest
 import pandas as pd
 
 from bquant.analysis.zones.strategies.swing import PivotPointsSwingStrategy
+from bquant.analysis.zones.strategies.swing.pivot_points import pivot_indices
 from bquant.analysis.zones.strategies.base import SwingMetrics
 from bquant.analysis.zones.strategies.registry import StrategyRegistry
 from bquant.data.samples import get_sample_data
@@ -84,6 +86,57 @@ class TestPivotPointsSwingStrategy:
         assert 'params' in metadata
 
 
+def _loop_pivots(values, left_bars, right_bars, kind):
+    """Reference per-bar loop (previous implementation)."""
+    beats = (lambda a, b: a > b) if kind == 'high' else (lambda a, b: a < b)
+    result = []
+    for i in range(left_bars, len(values) - right_bars):
+        if all(beats(values[i], values[i - j]) for j in range(1, left_bars + 1)) and all(
+            beats(values[i], values[i + j]) for j in range(1, right_bars + 1)
+        ):
+            result.append(i)
+    return result
+
+
+class TestPivotIndices:
+    """Vectorized pivot detection matches the per-bar definition."""
+
+    @pytest.mark.parametrize('left_bars,right_bars', [(2, 2), (5, 5), (1, 4), (3, 0), (0, 3), (0, 0), (13, 7), (32, 33)])
+    @pytest.mark.parametrize('kind', ['high', 'low'])
+    def test_matches_loop(self, left_bars, right_bars, kind):
+        rng = np.random.default_rng(left_bars * 10 + right_bars)
+        # Rounded prices produce ties; NaNs must never be (or neighbour) a pivot
+        values = np.round(100 + np.cumsum(rng.normal(0, 1, 3000)), 0)
+        values[rng.choice(3000, 20, replace=False)] = np.nan
+
+        expected = _loop_pivots(values, left_bars, right_bars, kind)
+        assert pivot_indices(values, left_bars, right_bars, kind).tolist() == expected
+
+    def test_short_series(self):
+        assert pivot_indices(np.array([1.0, 2.0, 1.0]), 2, 2).tolist() == []
+        assert pivot_indices(np.array([1.0, 2.0, 1.0]), 1, 1).tolist() == [1]
+        assert pivot_indices(np.array([3.0, 2.0, 3.0]), 1, 1, kind='low').tolist() == [1]
+
+    def test_strategy_confirmation_indices(self):
+        rng = np.random.default_rng(7)
+        close = 100 + np.cumsum(rng.normal(0, 1, 2000))
+        data = pd.DataFrame({
+            'high': close + rng.uniform(0, 1, 2000),
+            'low': close - rng.uniform(0, 1, 2000),
+            'close': close,
+        }, index=pd.date_range('2024-01-01', periods=2000, freq='min'))
+        strategy = PivotPointsSwingStrategy(left_bars=5, right_bars=5, min_amplitude_pct=0.0)
+
+        context = strategy.calculate_global(data)
+        highs = set(_loop_pivots(data['high'].values, 5, 5, 'high'))
+        lows = set(_loop_pivots(data['low'].values, 5, 5, 'low'))
+
+        assert context.swing_points
+        for point in context.swing_points:
+            assert point.index in (highs if point.swing_type == 'peak' else lows)
+            assert point.confirmation_index == point.index + 5
+
+
 def run_tests():
     """Run all PivotPoints swing strategy tests."""
     pytest.main([__file__, '-v'])
@@ -7,6 +7,7 @@
 
 import pytest
 import pandas as pd
+import pyarrow as pa
 import sys
 from typing import Dict, List, Any
 from pathlib import Path
@@ -33,11 +34,14 @@ from bquant.data.samples.datasets import (
     validate_dataset_name,
     get_datasets_by_symbol,
     get_datasets_by_timeframe,
-    get_datasets_by_source
+    get_datasets_by_source,
+    get_dataset_file_module
 )
 
+from bquant.data.samples.storage import read_sample_file, write_sample_file
 from bquant.data.samples.utils import (
     load_embedded_data,
+    load_embedded_frame,
     convert_to_dataframe,
     convert_to_list_of_dicts,
     validate_data_integrity,
@@ -347,6 +351,73 @@ class TestSampleDataUtils:
         assert info['total_records'] == 1000
 
 
+class TestColumnarStorage:
+    """Тесты колоночного хранения embedded данных."""
+    
+    RECORDS = [
+        {'time': '2025.05.20 02:00', 'close': 1.5, 'label': 'a', 'empty': None},
+        {'time': '2025.05.20 02:15', 'close': None, 'label': None, 'empty': None},
+        {'time': '2025.05.20 02:30', 'close': 3.0, 'label': 'bc', 'empty': None},
+    ]
+    
+    @pytest.mark.parametrize('dataset_name', ['tv_xauusd_1h', 'mt_xauusd_m15'])
+    def test_frame_matches_record_conversion(self, dataset_name):
+        """DataFrame из колонок совпадает с конвертацией списка словарей."""
+        records = load_embedded_data(dataset_name)['DATA']
+        expected = convert_to_dataframe(records, dataset_name)
+        actual = get_sample_data(dataset_name)
+        
+        pd.testing.assert_frame_equal(actual, expected, check_exact=True)
+        assert actual.attrs == expected.attrs
+    
+    def test_round_trip(self, tmp_path):
+        """Запись и чтение сохраняют записи, типы и часовой пояс."""
+        info = {'name': 'test', 'rows': 3}
+        path = write_sample_file(tmp_path / 'sample.arrow', self.RECORDS, info)
+        columns = read_sample_file(path)
+        
+        assert columns.info == info
+        assert columns.to_records() == self.RECORDS
+        frame = columns.to_frame()
+        pd.testing.assert_frame_equal(frame, convert_to_dataframe(self.RECORDS, 'test'), check_exact=True)
+        
+        aware = [dict(r, time=t) for r, t in zip(self.RECORDS, ['2025-06-11T20:00:00+07:00'] * 3)]
+        frame = read_sample_file(write_sample_file(tmp_path / 'aware.arrow', aware, info)).to_frame()
+        assert str(frame['time'].dt.tz) == 'UTC+07:00'
+        assert frame['time'].iloc[0] == pd.Timestamp('2025-06-11T20:00:00+07:00')
+    
+    def test_file_is_memory_mapped(self, tmp_path):
+        """Чтение не копирует буферы колонок в память Arrow."""
+        path = write_sample_file(tmp_path / 'sample.arrow', self.RECORDS * 1000, {'name': 'test'})
+        
+        allocated = pa.total_allocated_bytes()
+        columns = read_sample_file(path)
+        
+        assert pa.total_allocated_bytes() == allocated
+        assert columns.to_records() == self.RECORDS * 1000
+    
+    def test_invalid_file_is_rejected(self, tmp_path):
+        path = tmp_path / 'broken.arrow'
+        path.write_bytes(b'not an arrow file')
+        
+        with pytest.raises(ValueError):
+            read_sample_file(path)
+    
+    def test_dataset_file_module_is_deprecated(self):
+        with pytest.warns(DeprecationWarning, match="get_dataset_file"):
+            assert get_dataset_file_module('tv_xauusd_1h') == 'embedded.tv_xauusd_1h'
+    
+    def test_loaded_data_is_independent(self):
+        """Повторные загрузки не разделяют изменяемые данные."""
+        first = load_embedded_frame('tv_xauusd_1h')
+        first.loc[0, 'close'] = -1.0
+        records = get_sample_data('tv_xauusd_1h', format='dict')
+        records[0]['close'] = -1.0
+        
+        assert get_sample_data('tv_xauusd_1h')['close'].iloc[0] != -1.0
+        assert get_sample_data('tv_xauusd_1h', format='dict')[0]['close'] != -1.0
+
+
 class TestSampleDataIntegration:
     """Интеграционные тесты для sample data."""
     
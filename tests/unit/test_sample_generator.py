@@ -8,6 +8,7 @@ import os
 from pathlib import Path
 
 from bquant.data.samples import SampleDataGenerator
+from bquant.data.samples.storage import read_sample_file
 
 
 class TestSampleDataGenerator:
@@ -98,44 +99,6 @@ class TestSampleDataGenerator:
         
         print("[OK] test_identify_time_column: Определение временной колонки работает")
     
-    def test_generate_file_content(self):
-        """Тест генерации содержимого файла."""
-        generator = SampleDataGenerator()
-        
-        # Создаем тестовые данные
-        metadata = {
-            'name': 'Test Dataset',
-            'description': 'Test description',
-            'source': 'Test Source',
-            'symbol': 'TEST',
-            'timeframe': '1h',
-            'rows': 2,
-            'columns': ['time', 'close'],
-            'period_start': '2025-01-01',
-            'period_end': '2025-01-02',
-            'license': 'Test License',
-            'disclaimer': 'Test Disclaimer',
-            'updated': '2025-01-01 00:00:00',
-            'extracted_from': 'test.csv'
-        }
-        
-        data = [
-            {'time': '2025-01-01T00:00:00', 'close': 100.0},
-            {'time': '2025-01-01T01:00:00', 'close': 101.0}
-        ]
-        
-        content = generator._generate_file_content('test_dataset', metadata, data)
-        
-        # Проверяем структуру содержимого
-        assert '"""' in content  # Документация
-        assert 'from typing import Dict, List, Any' in content  # Импорты
-        assert 'DATASET_INFO = ' in content  # Метаданные
-        assert 'DATA = [' in content  # Данные
-        assert "'time': '2025-01-01T00:00:00'" in content  # Конкретные данные
-        assert "'close': 100.0" in content
-        
-        print("[OK] test_generate_file_content: Генерация содержимого файла работает")
-    
     def test_generate_embedded_file(self):
         """Тест генерации embedded файла."""
         generator = SampleDataGenerator()
@@ -170,13 +133,15 @@ class TestSampleDataGenerator:
                 
                 # Проверяем, что файл создан
                 assert output_file.exists()
-                assert output_file.name == 'test_dataset.py'
+                assert output_file.name == 'test_dataset.arrow'
                 
                 # Проверяем содержимое
-                content = output_file.read_text(encoding='utf-8')
-                assert 'DATASET_INFO = ' in content
-                assert 'DATA = [' in content
-                assert "'time': '2025-01-01T00:00:00'" in content
+                columns = read_sample_file(output_file)
+                assert columns.info == metadata
+                assert columns.to_records() == data
+                frame = columns.to_frame()
+                assert pd.api.types.is_datetime64_any_dtype(frame['time'])
+                assert frame['close'].tolist() == [100.0]
                 
                 print("[OK] test_generate_embedded_file: Генерация embedded файла работает")
                 
@@ -194,7 +159,6 @@ if __name__ == '__main__':
     test_generator.test_validate_source_files()
     test_generator.test_convert_value_type()
     test_generator.test_identify_time_column()
-    test_generator.test_generate_file_content()
     test_generator.test_generate_embedded_file()
     
     print("\n🎉 Все тесты SampleDataGenerator прошли успешно!")
@@ -13,6 +13,7 @@ from datetime import datetime
 # BQuant imports
 from bquant.analysis.statistical.hypothesis_testing import (
     HypothesisTestResult,
+    HypothesisTestRegistry,
     HypothesisTestSuite,
     run_all_hypothesis_tests,
     run_single_hypothesis_test
@@ -407,6 +408,64 @@ class TestHypothesisTestSuite:
         assert summary['total_tests'] == len(expected_tests)
 
 
+class TestTestExecutionEngine:
+    """Тесты реестра, параллельного запуска и векторной близости к уровням."""
+    
+    def test_near_level_mask_matches_scalar(self):
+        """Векторная проверка совпадает с _is_near_level."""
+        suite = HypothesisTestSuite()
+        rng = np.random.default_rng(0)
+        levels = list(rng.uniform(900, 3100, 25)) + [2000.0, 0.0, -5.0]
+        prices = np.concatenate([rng.uniform(800, 3200, 500), [2010.0, 2011.0, 0.0, np.nan]])
+        
+        expected = [suite._is_near_level(p, levels, 0.5) for p in prices]
+        assert suite._near_level_mask(prices, levels, 0.5).tolist() == expected
+    
+    def test_parallel_matches_serial(self):
+        zones = create_test_zones_features(80)
+        serial = HypothesisTestSuite(n_jobs=1).run_all_tests(zones).results
+        parallel = HypothesisTestSuite(n_jobs=4).run_all_tests(zones).results
+        
+        assert list(serial['tests']) == list(parallel['tests'])
+        for name, result in serial['tests'].items():
+            assert result.get('p_value') == parallel['tests'][name].get('p_value'), name
+        assert serial['summary'] == parallel['summary']
+    
+    def test_run_selected_tests(self):
+        results = HypothesisTestSuite().run_all_tests(
+            create_test_zones_features(), tests=['sequence_patterns', 'zone_duration']
+        ).results
+        
+        assert list(results['tests']) == ['sequence_patterns', 'zone_duration']
+        assert results['summary']['total_tests'] == 2
+    
+    def test_unknown_test_name(self):
+        with pytest.raises(ValueError, match="Unknown hypothesis test"):
+            HypothesisTestSuite().run_all_tests(create_test_zones_features(), tests=['nope'])
+    
+    def test_register_custom_test(self):
+        @HypothesisTestRegistry.register('bull_share', description='Share of bull zones')
+        def bull_share(suite, zones_features):
+            share = len(zones_features.by_zone_type('bull')) / len(zones_features)
+            return HypothesisTestResult(
+                hypothesis='Bull share differs from 0.5',
+                test_type='share',
+                statistic=share,
+                p_value=1.0,
+                significant=False,
+                alpha=suite.alpha
+            )
+        
+        try:
+            assert 'bull_share' in HypothesisTestRegistry.list_tests()
+            results = HypothesisTestSuite().run_all_tests(create_test_zones_features()).results
+            assert 0 < results['tests']['bull_share']['statistic'] < 1
+        finally:
+            HypothesisTestRegistry.unregister('bull_share')
+        
+        assert 'bull_share' not in HypothesisTestRegistry.list_tests()
+
+
 class TestErrorHandling:
     """Тесты обработки ошибок."""
     
@@ -1,9 +1,12 @@
+import pickle
 import sys
 from datetime import datetime, timedelta, timezone
 
 import numpy as np
+import pandas as pd
+import pytest
 
-from bquant.analysis.zones.models import SwingContext, SwingPoint
+from bquant.analysis.zones.models import SwingContext, SwingPoint, SwingPointsView
 
 
 def test_swing_context_memory_footprint_within_expected_bounds():
@@ -41,3 +44,89 @@ def test_swing_context_memory_footprint_within_expected_bounds():
     # Allow generous tolerance for interpreter differences.
     assert 40 <= avg_bytes_per_point <= 450, avg_bytes_per_point
 
+
+
+def _columnar_context(point_count=10):
+    indices = np.arange(0, point_count * 10, 10)
+    return SwingContext.from_arrays(
+        indices,
+        100.0 + np.arange(point_count),
+        ["peak" if i % 2 == 0 else "trough" for i in range(point_count)],
+        pd.date_range("2024-01-01", periods=point_count, freq="10min"),
+        confirmation_index=[int(i) + 3 for i in indices[:-1]] + [None],
+        full_data_length=point_count * 10,
+        strategy_name="pivot_points",
+        strategy_params={"left_bars": 2},
+    )
+
+
+def test_columnar_context_dtypes_and_derived_columns():
+    context = _columnar_context()
+
+    assert context.indices.dtype == np.int64
+    assert context.prices.dtype == np.float64
+    assert context.type_codes.dtype == np.int8
+    assert context.type_codes[:2].tolist() == [1, -1]
+    assert context.duration_to_next[0] == 10 and np.isnan(context.duration_to_next[-1])
+    assert context.amplitude_to_next[0] == pytest.approx(1.0)
+    assert np.isnan(context.confirmation_index[-1])
+    assert not context.prices.flags.writeable
+
+
+def test_slice_returns_view_and_materializes_points():
+    context = _columnar_context()
+    swings = context.slice(25, 45)
+
+    assert isinstance(swings, SwingPointsView)
+    assert swings.indices.tolist() == [20, 30, 40, 50]
+    assert np.shares_memory(swings.prices, context.prices)
+
+    point = swings[0]
+    assert (point.point_id, point.index, point.swing_type) == (2, 20, "peak")
+    assert point.timestamp == datetime(2024, 1, 1, 0, 20)
+    assert point.confirmation_index == 23 and point.duration_to_next == 10
+    assert point.strategy_params is context.strategy_params
+    assert [p.index for p in swings[1:]] == [30, 40, 50]
+    assert swings == context.swing_points[2:6]
+    assert context.slice(1_000, 2_000) == context.swing_points[-1:]
+
+
+def test_list_constructor_matches_from_arrays():
+    context = _columnar_context()
+    rebuilt = SwingContext(
+        swing_points=context.swing_points,
+        indices=context.indices,
+        full_data_length=context.full_data_length,
+        strategy_name=context.strategy_name,
+        strategy_params=context.strategy_params,
+    )
+
+    assert rebuilt.swing_points == context.swing_points
+    assert rebuilt.to_dict() == context.to_dict()
+
+
+def test_pickle_and_arrow_round_trip():
+    context = _columnar_context()
+
+    restored = pickle.loads(pickle.dumps(context, protocol=5))
+    assert restored.swing_points == context.swing_points
+    assert not restored.indices.flags.writeable
+
+    pytest.importorskip("pyarrow")
+    table = context.to_arrow()
+    assert table.num_rows == context.num_points
+    from_arrow = SwingContext.from_arrow(table)
+    assert from_arrow.swing_points == context.swing_points
+    assert from_arrow.strategy_params == {"left_bars": 2}
+
+
+def test_invalid_columns_raise():
+    with pytest.raises(ValueError, match="same length"):
+        SwingContext.from_arrays(
+            [1, 2], [1.0], ["peak", "trough"], [0, 1],
+            full_data_length=3, strategy_name="zigzag",
+        )
+    with pytest.raises(ValueError, match="Unknown swing type"):
+        SwingContext.from_arrays(
+            [1], [1.0], ["top"], [0], full_data_length=3, strategy_name="zigzag",
+        )
@@ -0,0 +1,143 @@
+"""
+Unit tests for the shared swing movement engine.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from bquant.analysis.zones.models import SwingContext, ZoneInfo
+from bquant.analysis.zones.strategies.swing import (
+    FindPeaksSwingStrategy,
+    PivotPointsSwingStrategy,
+    ZigZagSwingStrategy,
+)
+from bquant.analysis.zones.strategies.swing.movements import (
+    batch_movement_metrics,
+    movement_metrics,
+    swing_movements,
+)
+
+
+def _reference_movements(indices, prices, min_amplitude_pct=0.0):
+    """Leg-by-leg loop the strategies used before the shared engine."""
+    rallies, drops = [], []
+    for i in range(len(indices) - 1):
+        duration = indices[i + 1] - indices[i]
+        if duration <= 0 or prices[i] == 0:
+            continue
+        change = (prices[i + 1] / prices[i] - 1) * 100
+        if abs(change) < min_amplitude_pct * 100:
+            continue
+        movement = (abs(change), int(duration), abs(change) / duration)
+        if change > 0:
+            rallies.append(movement)
+        elif change < 0:
+            drops.append(movement)
+    return rallies, drops
+
+
+def _context(n_points=400, seed=3):
+    rng = np.random.default_rng(seed)
+    indices = np.cumsum(rng.integers(1, 8, n_points))
+    prices = 100 + np.cumsum(rng.normal(0, 1.5, n_points))
+    prices[1::37] = prices[::37][: len(prices[1::37])]  # some flat legs
+    return SwingContext.from_arrays(
+        indices,
+        prices,
+        np.where(np.diff(prices, prepend=prices[0] - 1) > 0, 1, -1),
+        pd.RangeIndex(n_points),
+        full_data_length=int(indices[-1]) + 1,
+        strategy_name='pivot_points',
+        strategy_params={'left_bars': 2},
+    )
+
+
+def _assert_metrics_close(actual, expected):
+    actual, expected = actual.to_dict(), expected.to_dict()
+    assert actual.pop('strategy_params') == expected.pop('strategy_params')
+    assert actual == pytest.approx(expected, rel=1e-9, abs=1e-12)
+
+
+def _zones(context, count=60, seed=4):
+    rng = np.random.default_rng(seed)
+    bounds = np.sort(rng.integers(-5, context.full_data_length + 5, size=(count, 2)), axis=1)
+    return [
+        ZoneInfo(
+            zone_id=i, type='bull', start_idx=int(start), end_idx=int(end),
+            start_time=None, end_time=None, duration=int(end - start + 1),
+            data=pd.DataFrame(),
+        )
+        for i, (start, end) in enumerate(bounds)
+    ]
+
+
+class TestSwingMovements:
+
+    @pytest.mark.parametrize('min_amplitude_pct', [0.0, 0.01])
+    def test_matches_reference_loop(self, min_amplitude_pct):
+        context = _context()
+        movements = swing_movements(context.indices, context.prices, min_amplitude_pct)
+        rallies, drops = _reference_movements(
+            context.indices.tolist(), context.prices.tolist(), min_amplitude_pct
+        )
+
+        assert movements.rally_count == len(rallies)
+        assert movements.drop_count == len(drops)
+        rally = movements.is_rally
+        assert movements.amplitude_pct[rally].tolist() == [m[0] for m in rallies]
+        assert movements.duration_bars[~rally].tolist() == [m[1] for m in drops]
+        assert movements.speed_pct_per_bar[~rally].tolist() == [m[2] for m in drops]
+
+    def test_degenerate_legs_are_skipped(self):
+        movements = swing_movements([0, 5, 5, 9, 12], [0.0, 10.0, 11.0, np.nan, 12.0])
+        assert len(movements) == 0
+        assert len(swing_movements([3], [1.0])) == 0
+
+    def test_metrics_of_empty_movements(self):
+        metrics = movement_metrics(swing_movements([], []), 'zigzag', {})
+        assert metrics.rally_count == metrics.drop_count == 0
+        assert metrics.max_rally_duration_bars == 0
+
+
+class TestBatchMovementMetrics:
+
+    @pytest.mark.parametrize('min_amplitude_pct', [0.0, 0.015])
+    def test_matches_per_zone_metrics(self, min_amplitude_pct):
+        context = _context()
+        zones = _zones(context)
+        batch = batch_movement_metrics(
+            context, zones, strategy_name='pivot_points',
+            strategy_params=context.strategy_params, min_amplitude_pct=min_amplitude_pct,
+        )
+
+        assert len(batch) == len(zones)
+        for zone, metrics in zip(zones, batch):
+            swings = context.get_swings_for_zone(zone)
+            expected = movement_metrics(
+                swing_movements(swings.indices, swings.prices, min_amplitude_pct),
+                'pivot_points', context.strategy_params,
+            )
+            _assert_metrics_close(metrics, expected)
+
+    @pytest.mark.parametrize('strategy', [
+        ZigZagSwingStrategy(),
+        FindPeaksSwingStrategy(min_amplitude_pct=0.01),
+        PivotPointsSwingStrategy(min_amplitude_pct=0.01),
+    ])
+    def test_strategies_batch_equals_single(self, strategy):
+        context = _context()
+        zones = _zones(context)
+        batch = strategy.aggregate_for_zones(zones, context)
+
+        assert len(batch) == len(zones)
+        for zone, metrics in zip(zones, batch):
+            _assert_metrics_close(metrics, strategy.aggregate_for_zone(zone, context))
+
+    def test_empty_inputs(self):
+        context = _context(n_points=1)
+        assert batch_movement_metrics(context, [], strategy_name='x', strategy_params={}) == []
+        metrics = batch_movement_metrics(
+            context, _zones(_context(), count=3), strategy_name='x', strategy_params={},
+        )
+        assert [m.rally_count + m.drop_count for m in metrics] == [0, 0, 0]
@@ -10,17 +10,17 @@ pivot list and only check the deviation-scan arithmetic), this oracle reruns the
 
 Runs on the embedded ``tv_xauusd_1h`` sample (1000 bars — enough for the structural
 property; the full-history 100k profile is characterisation, not needed for
-correctness) and needs the real pandas-ta zigzag, so the module is skipped when
-pandas-ta is unavailable.
+correctness). ZigZag is checked with the built-in ``native`` kernel and, when
+pandas-ta is installed, with the ``pandas_ta`` engine.
 """
 
 import importlib.util
 
 import pytest
 
-pytestmark = pytest.mark.skipif(
+requires_pandas_ta = pytest.mark.skipif(
     importlib.util.find_spec("pandas_ta") is None,
-    reason="replay-causality oracle needs the real pandas-ta detector",
+    reason="pandas_ta engine needs the real pandas-ta detector",
 )
 
 from bquant.data.samples import get_sample_data
@@ -66,24 +66,31 @@ def _repaint_violations(strategy, df) -> list:
 
 # -- the fix: ZigZag must be strictly replay-safe (issue #110) ----------------
 
-def test_zigzag_confirmation_is_replay_safe(sample):
+ENGINES = ["native", pytest.param("pandas_ta", marks=requires_pandas_ta)]
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_zigzag_confirmation_is_replay_safe(sample, engine):
     """Every ZigZag swing is observable, unchanged, at its confirmation_index.
 
     Guards the #110 fix: backtest=True (non-repainting stream) + the detector
     warm-up floor. With the old backtest=False centred detector this fails on ~35%
     of pivots on this sample (and 73% on the downstream narrow_zone cohort).
     """
-    violations = _repaint_violations(ZigZagSwingStrategy(legs=3, deviation=0.008), sample)
+    strategy = ZigZagSwingStrategy(legs=3, deviation=0.008, engine=engine)
+    violations = _repaint_violations(strategy, sample)
     assert violations == [], (
         f"{len(violations)} ZigZag pivots repaint under truncation "
         f"(first few: {violations[:5]})"
     )
 
 
-def test_zigzag_replay_safe_across_configs(sample):
+@pytest.mark.parametrize("engine", ENGINES)
+def test_zigzag_replay_safe_across_configs(sample, engine):
     """Replay-safety holds for other legs/deviation settings, not just one."""
     for legs, dev in [(2, 0.01), (5, 0.005)]:
-        violations = _repaint_violations(ZigZagSwingStrategy(legs=legs, deviation=dev), sample)
+        strategy = ZigZagSwingStrategy(legs=legs, deviation=dev, engine=engine)
+        violations = _repaint_violations(strategy, sample)
         assert violations == [], f"legs={legs} dev={dev}: {len(violations)} repaint(s)"
 
 
@@ -66,6 +66,7 @@ class TestUniversalZoneAnalyzer:
         assert analyzer.features is not None
         assert analyzer.hypotheses is not None
         assert analyzer.sequences is not None
+        assert analyzer.n_jobs == 1  # terminal stages run sequentially by default
     
     def test_analyzer_with_di(self):
         """Test analyzer with dependency injection."""
@@ -159,3 +160,29 @@ class TestUniversalZoneAnalyzer:
         assert result.metadata['total_zones'] == 4
         assert set(result.metadata['zone_types']) == {'bull', 'bear'}
 
+    
+    def test_analysis_stages_selection(self):
+        """Terminal stages depend on zone count and requested options."""
+        analyzer = UniversalZoneAnalyzer()
+        
+        assert set(analyzer.analysis_stages(2, perform_clustering=True, n_clusters=3)) == {
+            'statistics', 'hypothesis_tests'
+        }
+        assert set(analyzer.analysis_stages(4, perform_clustering=True, n_clusters=3)) == {
+            'statistics', 'hypothesis_tests', 'sequence_analysis', 'clustering'
+        }
+    
+    def test_parallel_stages_match_sequential(self, sample_data, sample_zones):
+        """Thread-pooled terminal stages give the same result as sequential ones."""
+        results = [
+            UniversalZoneAnalyzer(n_jobs=n_jobs).analyze_zones(
+                sample_zones, sample_data, perform_clustering=True, n_clusters=2
+            )
+            for n_jobs in (1, None)
+        ]
+        
+        sequential, parallel = results
+        assert parallel.statistics['total_statistics'] == sequential.statistics['total_statistics']
+        assert parallel.hypothesis_tests.results['summary'] == sequential.hypothesis_tests.results['summary']
+        assert parallel.sequence_analysis['sequence_summary'] == sequential.sequence_analysis['sequence_summary']
+        assert parallel.clustering['cluster_labels'] == sequential.clustering['cluster_labels']
@@ -472,12 +472,108 @@ class TestValidationIntegration:
         assert metrics == {'value': 42}
 
 
+def close_mean_func(data: pd.DataFrame) -> Dict[str, Any]:
+    """Module-level (picklable) analysis function sensitive to price paths."""
+    return {'close_mean': float(data['close'].mean())}
+
+
+class TestParallelValidation:
+    """Tests for executor-aware validation (n_jobs, seeds, early stopping)."""
+    
+    @pytest.fixture
+    def test_data(self):
+        return create_test_data(300, seed=7)
+    
+    def test_monte_carlo_parallel_matches_serial(self, test_data):
+        """Per-simulation seeds make results independent of scheduling."""
+        kwargs = dict(n_simulations=24, metric_key='close_mean', random_state=11)
+        serial = ValidationSuite(n_jobs=1).monte_carlo_test(close_mean_func, test_data, **kwargs)
+        parallel = ValidationSuite(n_jobs=2).monte_carlo_test(close_mean_func, test_data, **kwargs)
+        
+        np.testing.assert_allclose(serial.test_metrics['all'], parallel.test_metrics['all'])
+        assert parallel.metadata['n_jobs'] == 2
+    
+    def test_monte_carlo_keeps_legacy_seeds(self, test_data):
+        """Simulation i uses seed i (offset by random_state), as before."""
+        kwargs = dict(n_simulations=12, metric_key='close_mean')
+        legacy = ValidationSuite().monte_carlo_test(close_mean_func, test_data, **kwargs)
+        zero = ValidationSuite().monte_carlo_test(close_mean_func, test_data, random_state=0, **kwargs)
+        offset = ValidationSuite().monte_carlo_test(close_mean_func, test_data, random_state=3, **kwargs)
+        expected = [
+            close_mean_func(ValidationSuite()._generate_synthetic_data(test_data, 'returns', seed=i))['close_mean']
+            for i in range(12)
+        ]
+        
+        np.testing.assert_allclose(legacy.test_metrics['all'], expected)
+        np.testing.assert_allclose(zero.test_metrics['all'], expected)
+        np.testing.assert_allclose(offset.test_metrics['all'][:9], expected[3:])
+    
+    def test_walk_forward_passes_window_views(self, test_data):
+        shared = []
+        
+        def analyze(window):
+            shared.append(np.shares_memory(window['close'].to_numpy(), test_data['close'].to_numpy()))
+            return close_mean_func(window)
+        
+        ValidationSuite(n_jobs=1).walk_forward_test(
+            analyze, test_data, train_window=100, test_window=50, step_size=50, metric_key='close_mean'
+        )
+        assert shared and all(shared)
+    
+    def test_walk_forward_parallel_matches_serial(self, test_data):
+        kwargs = dict(train_window=100, test_window=50, step_size=50, metric_key='close_mean')
+        serial = ValidationSuite(n_jobs=1).walk_forward_test(close_mean_func, test_data, **kwargs)
+        parallel = ValidationSuite(n_jobs=2).walk_forward_test(close_mean_func, test_data, **kwargs)
+        
+        assert serial.metadata['iterations_detail'] == parallel.metadata['iterations_detail']
+        assert serial.metadata['avg_test_metric'] == pytest.approx(parallel.metadata['avg_test_metric'])
+        assert serial.iterations == parallel.iterations
+    
+    def test_unpicklable_function_falls_back_to_serial(self, test_data):
+        suite = ValidationSuite(n_jobs=2)
+        result = suite.monte_carlo_test(
+            lambda d: {'close_mean': d['close'].mean()}, test_data,
+            n_simulations=12, metric_key='close_mean'
+        )
+        assert result.iterations == 12
+    
+    def test_monte_carlo_early_stopping(self, test_data):
+        """A metric that never beats random data is decided long before n_simulations."""
+        events = []
+        result = ValidationSuite().monte_carlo_test(
+            simple_analyze_func, test_data,
+            n_simulations=1000,
+            early_stopping=True,
+            min_simulations=20,
+            progress_callback=events.append
+        )
+        
+        assert result.metadata['stopped_early'] is True
+        assert result.success is False or result.success == False
+        assert result.iterations < 1000
+        assert len(events) == result.metadata['completed_simulations']
+        assert events[-1]['exceedance_bounds'][0] > 0.05
+    
+    def test_sensitivity_progress_callback(self, test_data):
+        events = []
+        def param_func(data, window=10):
+            return {'metric': len(data) / window}
+        
+        ValidationSuite().sensitivity_analysis(
+            param_func, test_data, {'window': [8, 10, 12]},
+            metric_key='metric', progress_callback=events.append
+        )
+        assert [e['completed'] for e in events] == [1, 2, 3]
+        assert all(e['total'] == 3 for e in events)
+
+
 # Export
 __all__ = [
     'create_test_data',
     'simple_analyze_func',
     'TestValidationResult',
     'TestValidationSuite',
+    'TestParallelValidation',
     'TestSyntheticDataGeneration',
     'TestValidationIntegration'
 ]
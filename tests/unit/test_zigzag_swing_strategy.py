@@ -7,6 +7,7 @@ import pandas as pd
 import numpy as np
 
 from bquant.analysis.zones.strategies.swing import ZigZagSwingStrategy
+from bquant.analysis.zones.strategies.swing.zigzag import zigzag_pivots
 from bquant.analysis.zones.strategies.base import SwingMetrics
 from bquant.analysis.zones.strategies.registry import StrategyRegistry
 from bquant.data.samples import get_sample_data
@@ -282,6 +283,78 @@ class TestZigZagDegenerateInput:
         context = strategy.calculate_global(df)
         assert context.swing_points == []
 
+    def test_single_spike_native_engine(self):
+        """The built-in kernel needs no guard: the spike is an ordinary peak."""
+        df = self._flat_frame()
+        df.iloc[100, df.columns.get_loc('high')] = 110.0
+        strategy = ZigZagSwingStrategy(engine='native')
+        context = strategy.calculate_global(df)
+
+        peaks = [sp for sp in context.swing_points if sp.swing_type == 'peak']
+        assert [(sp.index, sp.price) for sp in peaks] == [(100, 110.0)]
+        assert peaks[0].confirmation_index == 100 + strategy.legs
+
+
+class TestZigZagPivotsKernel:
+    """Built-in non-repainting ZigZag kernel."""
+
+    PRICES = [100.0, 103.0, 106.0, 104.0, 100.0, 98.0, 101.0, 105.0, 103.0]
+
+    def _pivots(self, legs, prices=None):
+        values = np.asarray(self.PRICES if prices is None else prices, dtype=float)
+        return zigzag_pivots(values, values, legs=legs, deviation=0.025)
+
+    def test_pivots_and_confirmations(self):
+        pivots = self._pivots(legs=1)
+
+        assert pivots.positions.tolist() == [0, 2, 5, 7]
+        assert pivots.prices.tolist() == [100.0, 106.0, 98.0, 105.0]
+        assert pivots.type_codes.tolist() == [-1, 1, -1, 1]
+        # the still-forming last leg has no confirmation
+        assert pivots.confirmation_index[:-1].tolist() == [1, 4, 6]
+        assert np.isnan(pivots.confirmation_index[-1])
+
+    def test_legs_delay_confirmation(self):
+        pivots = self._pivots(legs=3)
+
+        assert pivots.positions.tolist() == [0, 2, 5, 7]
+        assert pivots.confirmation_index[:-1].tolist() == [3, 5, 8]
+
+    def test_nan_bars_are_skipped(self):
+        prices = list(self.PRICES)
+        prices[3] = np.nan
+        pivots = self._pivots(legs=1, prices=prices)
+
+        assert pivots.positions.tolist() == [0, 2, 5, 7]
+        assert pivots.confirmation_index[:-1].tolist() == [1, 4, 6]
+
+    def test_prefix_replay(self):
+        """Pivots confirmed by bar t are unchanged when the series ends at t."""
+        df = get_sample_data('tv_xauusd_1h')
+        high, low = df['high'].to_numpy(), df['low'].to_numpy()
+        full = zigzag_pivots(high, low, legs=3, deviation=0.008)
+        confirmed = ~np.isnan(full.confirmation_index)
+
+        for pos in np.flatnonzero(confirmed)[::5]:
+            end = int(full.confirmation_index[pos]) + 1
+            prefix = zigzag_pivots(high[:end], low[:end], legs=3, deviation=0.008)
+            assert prefix.positions[:pos + 1].tolist() == full.positions[:pos + 1].tolist()
+            assert prefix.confirmation_index[:pos + 1].tolist() == full.confirmation_index[:pos + 1].tolist()
+
+    def test_global_context_from_kernel(self):
+        df = get_sample_data('tv_xauusd_1h')
+        strategy = ZigZagSwingStrategy(legs=3, deviation=0.008, engine='native')
+        context = strategy.calculate_global(df)
+        pivots = zigzag_pivots(df['high'], df['low'], legs=3, deviation=0.008)
+
+        assert context.indices.tolist() == pivots.positions.tolist()
+        assert list(context.timestamps) == list(df.index[pivots.positions])
+        assert np.all(context.indices[1:] > context.indices[:-1])
+
+    def test_unknown_engine(self):
+        with pytest.raises(ValueError, match="Unknown ZigZag engine"):
+            ZigZagSwingStrategy(engine='talib')
+
 
 def test_zigzag_global_degrades_when_pandas_ta_zigzag_unavailable(monkeypatch):
     """calculate_global must degrade to an empty SwingContext (not raise) when the
@@ -315,6 +388,10 @@ def test_zigzag_global_degrades_when_pandas_ta_zigzag_unavailable(monkeypatch):
     assert context is not None
     assert context.swing_points == []
 
+    # The built-in engine does not go through LibraryManager at all.
+    native = ZigZagSwingStrategy(legs=2, deviation=0.01, engine='native').calculate_global(df)
+    assert len(native.swing_points) >= 2
+
 
 def run_tests():
     """Run all ZigZag swing strategy tests."""
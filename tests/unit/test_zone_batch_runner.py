@@ -0,0 +1,153 @@
+"""
+Unit tests for the process-pool batch runner of ZoneAnalysisPipeline.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from bquant.analysis.zones import (
+    BatchJob,
+    ZoneAnalysisConfig,
+    ZoneAnalysisResult,
+    ZoneBatchRunner,
+    ZoneDetectionConfig,
+    run_zone_analysis_batch,
+)
+from bquant.analysis.zones.batch import attach_frame, share_frame
+
+
+def _make_ohlcv(n=300, seed=0, periods=4):
+    rng = np.random.default_rng(seed)
+    close = 100 + np.cumsum(rng.normal(0, 0.5, n))
+    macd_hist = np.sin(np.linspace(0, periods * np.pi, n))
+    return pd.DataFrame({
+        'open': close + rng.normal(0, 0.1, n),
+        'high': close + rng.uniform(0.1, 1.0, n),
+        'low': close - rng.uniform(0.1, 1.0, n),
+        'close': close,
+        'volume': rng.uniform(1000, 2000, n),
+        'macd': macd_hist / 2,
+        'macd_signal': macd_hist / 3,
+        'macd_hist': macd_hist,
+    }, index=pd.date_range('2024-01-01', periods=n, freq='1h'))
+
+
+def _config(indicator_col='macd_hist'):
+    return ZoneAnalysisConfig(
+        zone_detection=ZoneDetectionConfig(
+            strategy_name='zero_crossing',
+            min_duration=2,
+            rules={'indicator_col': indicator_col},
+        ),
+        perform_clustering=False,
+    )
+
+
+class TestSharedFrameTransport:
+    """Round trip of DataFrames through shared memory."""
+
+    def test_roundtrip_preserves_frame(self):
+        df = _make_ohlcv(50)
+        df['label'] = ['a', 'b'] * 25
+        df['flag'] = df['close'] > df['open']
+        df.attrs['symbol'] = 'XAUUSD'
+
+        shm, spec = share_frame(df)
+        try:
+            restored = attach_frame(spec)
+        finally:
+            shm.close()
+            shm.unlink()
+
+        pd.testing.assert_frame_equal(restored, df)
+        assert restored.index.freq == df.index.freq
+        assert restored.attrs['symbol'] == 'XAUUSD'
+
+    def test_roundtrip_tz_aware_index(self):
+        df = _make_ohlcv(20)
+        df.index = df.index.tz_localize('Europe/Moscow')
+
+        shm, spec = share_frame(df)
+        try:
+            restored = attach_frame(spec)
+        finally:
+            shm.close()
+            shm.unlink()
+
+        pd.testing.assert_index_equal(restored.index, df.index)
+
+    def test_non_datetime_index_is_kept(self):
+        df = _make_ohlcv(20).reset_index(drop=True)
+        df.index = df.index * 10
+
+        shm, spec = share_frame(df)
+        try:
+            restored = attach_frame(spec)
+        finally:
+            shm.close()
+            shm.unlink()
+
+        pd.testing.assert_frame_equal(restored, df)
+
+
+class TestZoneBatchRunner:
+    """Process-pool execution of pipeline jobs."""
+
+    def test_run_all_matches_sequential_pipeline(self):
+        from bquant.analysis.zones import ZoneAnalysisPipeline
+
+        frames = [_make_ohlcv(seed=seed, periods=4 + seed) for seed in range(3)]
+        jobs = [BatchJob(df, _config(), job_id=f"sym{i}") for i, df in enumerate(frames)]
+
+        results = run_zone_analysis_batch(jobs, max_workers=2)
+
+        assert [item.job_id for item in results] == ['sym0', 'sym1', 'sym2']
+        for item, df in zip(results, frames):
+            assert item.success, item.error
+            assert isinstance(item.result, ZoneAnalysisResult)
+            expected = ZoneAnalysisPipeline(_config(), enable_cache=False).run(df)
+            assert len(item.result.zones) == len(expected.zones)
+            assert [z.start_idx for z in item.result.zones] == [z.start_idx for z in expected.zones]
+            assert set(item.timings) >= {'load', 'analysis', 'total', 'wall'}
+            assert item.duration == item.timings['total']
+
+    def test_failure_is_isolated(self):
+        jobs = [
+            BatchJob(_make_ohlcv(), _config(), job_id='ok'),
+            BatchJob(_make_ohlcv(), _config('missing_column'), job_id='bad'),
+            BatchJob('/nonexistent/EURUSD_1h.csv', _config()),
+        ]
+
+        results = {item.job_id: item for item in ZoneBatchRunner(max_workers=2).run(jobs)}
+
+        assert results['ok'].success
+        assert not results['bad'].success
+        assert results['bad'].error
+        assert results['bad'].traceback
+        assert not results['EURUSD_1h'].success
+        assert 'DataLoadingError' in results['EURUSD_1h'].error
+
+    def test_path_source_and_pickled_frames(self, tmp_path):
+        df = _make_ohlcv()
+        path = tmp_path / 'XAUUSD_1h.csv'
+        df.to_csv(path)
+
+        runner = ZoneBatchRunner(max_workers=1, use_shared_memory=False, max_pending=1)
+        results = runner.run_all([
+            BatchJob(path, _config(), load_kwargs={'validate_data': False}),
+            BatchJob(df, _config(), job_id='frame'),
+        ])
+
+        assert [item.job_id for item in results] == ['XAUUSD_1h', 'frame']
+        assert all(item.success for item in results), [item.error for item in results]
+        assert len(results[0].result.zones) == len(results[1].result.zones)
+
+    def test_strategies_are_applied_in_worker(self):
+        job = BatchJob(_make_ohlcv(), _config(), strategies={'swing_strategy': 'find_peaks'})
+
+        (item,) = run_zone_analysis_batch([job], max_workers=1)
+
+        assert item.success, item.error
+        zone = item.result.zones[0]
+        assert zone.features['metadata']['swing_metrics'] is not None
@@ -107,6 +107,46 @@ class TestZeroCrossingDetection:
         assert all(z.type in ['bull', 'bear'] for z in zones)
         assert all(z.duration >= 2 for z in zones)
     
+    def test_zero_crossing_zones_share_column_store(self, sample_data_macd):
+        """Zones are lazy views over one store and materialize to the source slice."""
+        strategy = ZeroCrossingDetection()
+        config = ZoneDetectionConfig(
+            min_duration=2,
+            rules={'indicator_col': 'macd_histogram'},
+            strategy_name='zero_crossing'
+        )
+        
+        zones = strategy.detect_zones(sample_data_macd, config)
+        
+        stores = {id(z.data_view.store) for z in zones}
+        assert len(stores) == 1
+        assert not any(z.is_materialized for z in zones)
+        
+        zone = zones[1]
+        pd.testing.assert_frame_equal(
+            zone.data,
+            sample_data_macd.iloc[zone.start_idx:zone.end_idx + 1]
+        )
+        assert len(zone.data) == zone.duration
+    
+    def test_zero_crossing_zones_do_not_alias_input(self, sample_data_macd):
+        """Mutating the caller's frame after detection leaves zone data untouched."""
+        strategy = ZeroCrossingDetection()
+        config = ZoneDetectionConfig(
+            min_duration=2,
+            rules={'indicator_col': 'macd_histogram'},
+            strategy_name='zero_crossing'
+        )
+        
+        zones = strategy.detect_zones(sample_data_macd, config)
+        zone = zones[0]
+        expected = sample_data_macd['close'].iloc[zone.start_idx:zone.end_idx + 1].to_numpy().copy()
+        
+        sample_data_macd['close'] = -1.0
+        
+        np.testing.assert_array_equal(zone.data_view['close'], expected)
+        np.testing.assert_array_equal(zone.data['close'].to_numpy(), expected)
+    
     def test_zero_crossing_missing_indicator(self, sample_data_macd):
         """Test error on missing indicator column."""
         strategy = ZeroCrossingDetection()
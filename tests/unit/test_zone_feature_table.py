@@ -0,0 +1,120 @@
+"""
+Unit tests for the columnar ZoneFeatureTable shared by analyzer stages.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from bquant.analysis.statistical import HypothesisTestSuite
+from bquant.analysis.zones import ZoneFeatureTable, as_feature_frame
+from bquant.analysis.zones.sequence_analysis import ZoneSequenceAnalyzer
+from bquant.analysis.zones.zone_features import ZoneFeatures, ZoneFeaturesAnalyzer
+from bquant.core.exceptions import AnalysisError
+
+
+def _features(n=30, seed=0):
+    rng = np.random.default_rng(seed)
+    features = []
+    for i in range(n):
+        zone_type = 'bull' if i % 2 == 0 else 'bear'
+        swing = {'rally_count': int(rng.integers(0, 5)), 'avg_rally_pct': float(rng.normal())}
+        if i % 3 == 0:
+            swing = None
+        features.append(ZoneFeatures(
+            zone_id=f'zone_{i}',
+            zone_type=zone_type,
+            duration=int(rng.integers(3, 40)),
+            start_price=100.0 + i,
+            end_price=101.0 + i,
+            price_return=float(rng.normal(0, 0.02)),
+            hist_amplitude=float(rng.uniform(0.1, 2.0)),
+            price_range_pct=float(rng.uniform(0.01, 0.05)),
+            correlation_price_hist=float(rng.uniform(-1, 1)),
+            num_peaks=int(rng.integers(0, 4)),
+            drawdown_from_peak=float(-rng.uniform(0, 0.05)) if zone_type == 'bull' else None,
+            rally_from_trough=float(rng.uniform(0, 0.05)) if zone_type == 'bear' else None,
+            metadata={
+                'swing_metrics': swing,
+                'shape_metrics': {'hist_skewness': float(rng.normal()), 'label': 'x'},
+            },
+        ))
+    return features
+
+
+class TestZoneFeatureTable:
+    """Construction, flattening and sharing of the feature table."""
+
+    def test_base_columns_match_dict_frame(self):
+        features = _features()
+        table = ZoneFeatureTable.from_features(features)
+        expected = pd.DataFrame([f.to_dict() for f in features])
+
+        pd.testing.assert_frame_equal(table.frame[expected.columns], expected)
+        assert len(table) == len(features)
+
+    def test_nested_metrics_are_flattened(self):
+        features = _features()
+        table = ZoneFeatureTable.from_features(features)
+
+        rally = table.column('swing_metrics.rally_count')
+        assert rally.dtype == np.float64  # missing swing metrics -> NaN
+        assert np.isnan(rally[0]) and np.isnan(rally[3])
+        assert rally[1] == features[1].metadata['swing_metrics']['rally_count']
+        assert table.frame['shape_metrics.label'].tolist() == ['x'] * len(features)
+        assert 'swing_metrics.rally_count' not in table.to_records()[0]
+
+    def test_from_features_reuses_table(self):
+        table = ZoneFeatureTable.from_features(_features())
+        assert ZoneFeatureTable.from_features(table) is table
+        assert as_feature_frame(table) is table.frame
+        assert as_feature_frame(table, copy=True) is not table.frame
+
+    def test_invalid_type(self):
+        with pytest.raises(AnalysisError, match="Invalid zone features type"):
+            ZoneFeatureTable.from_features([object()])
+
+    def test_to_arrow(self):
+        pytest.importorskip('pyarrow')
+        table = ZoneFeatureTable.from_features(_features())
+        arrow = table.to_arrow()
+
+        assert arrow.num_rows == len(table)
+        assert 'metadata' not in arrow.column_names
+        assert 'swing_metrics.rally_count' in arrow.column_names
+
+
+class TestStagesConsumeTable:
+    """Downstream stages give the same results for a table and for dicts."""
+
+    def test_hypothesis_tests_unchanged(self):
+        features = _features(60)
+        suite = HypothesisTestSuite()
+        from_dicts = suite.run_all_tests([f.to_dict() for f in features]).results
+        from_table = suite.run_all_tests(ZoneFeatureTable.from_features(features)).results
+
+        assert from_dicts['summary'] == from_table['summary']
+        for name, result in from_dicts['tests'].items():
+            assert result.get('p_value') == from_table['tests'][name].get('p_value'), name
+
+    def test_table_not_modified_by_stages(self):
+        table = ZoneFeatureTable.from_features(_features(60))
+        columns = table.columns
+
+        HypothesisTestSuite().run_all_tests(table)
+        ZoneSequenceAnalyzer().cluster_zones(table, n_clusters=3)
+        ZoneFeaturesAnalyzer().analyze_zones_distribution(table)
+
+        assert table.columns == columns
+
+    def test_distribution_and_sequences(self):
+        features = _features(40)
+        table = ZoneFeatureTable.from_features(features)
+
+        expected = ZoneFeaturesAnalyzer().analyze_zones_distribution(features).results
+        actual = ZoneFeaturesAnalyzer().analyze_zones_distribution(table).results
+        assert actual['total_statistics'] == expected['total_statistics']
+        assert actual['duration_distribution'] == expected['duration_distribution']
+
+        transitions = ZoneSequenceAnalyzer().analyze_zone_transitions(table).results
+        assert transitions['sequence_summary']['total_zones'] == len(features)
@@ -0,0 +1,180 @@
+"""
+Unit tests for vectorized (batch) zone feature extraction.
+
+Batch extraction must reproduce the per-zone ZoneFeaturesAnalyzer output
+while computing base features with segment reductions over shared columns.
+"""
+
+import math
+
+import numpy as np
+import pandas as pd
+import pytest
+from scipy.signal import find_peaks
+
+from bquant.analysis.zones.batch_features import ZoneSegments, compute_zone_base_features
+from bquant.analysis.zones.detection import ZoneDetectionConfig, ZoneDetectionRegistry
+from bquant.analysis.zones.zone_features import ZoneFeaturesAnalyzer
+
+
+def _assert_same(left, right, path="features"):
+    if isinstance(left, dict) and isinstance(right, dict):
+        assert left.keys() == right.keys(), path
+        for key in left:
+            _assert_same(left[key], right[key], f"{path}.{key}")
+    elif isinstance(left, float) or isinstance(right, float):
+        assert left is not None and right is not None, path
+        if math.isnan(right):
+            assert math.isnan(left), path
+        else:
+            assert left == pytest.approx(right, rel=1e-9, abs=1e-12), path
+    else:
+        assert left == right, path
+
+
+class TestZoneSegments:
+    """Segment reductions against per-slice NumPy/SciPy references."""
+
+    @pytest.fixture
+    def values(self):
+        rng = np.random.default_rng(7)
+        # Rounded values produce plateaus and ties
+        return np.round(rng.normal(0, 1, 400), 1)
+
+    @pytest.fixture
+    def windows(self):
+        # Overlapping, adjacent and single-bar windows
+        starts = np.array([0, 10, 10, 57, 120, 300, 399])
+        ends = np.array([9, 56, 30, 57, 299, 399, 399])
+        return starts, ends
+
+    def test_reductions_match_slices(self, values, windows):
+        starts, ends = windows
+        seg = ZoneSegments(starts, ends, len(values))
+        flat = seg.gather(values)
+
+        for i, (s, e) in enumerate(zip(starts, ends)):
+            window = values[s:e + 1]
+            assert seg.max(flat)[i] == window.max()
+            assert seg.min(flat)[i] == window.min()
+            assert seg.mean(flat)[i] == pytest.approx(window.mean())
+            assert seg.argmax(flat)[i] == np.argmax(window)
+            assert seg.argmin(flat)[i] == np.argmin(window)
+            if len(window) > 1:
+                assert seg.std(flat)[i] == pytest.approx(window.std(ddof=1))
+                assert seg.max_abs_diff(flat)[i] == pytest.approx(np.abs(np.diff(window)).max())
+            else:
+                assert np.isnan(seg.std(flat)[i])
+                assert np.isnan(seg.max_abs_diff(flat)[i])
+
+    def test_count_peaks_matches_find_peaks(self, values, windows):
+        starts, ends = windows
+        seg = ZoneSegments(starts, ends, len(values))
+        flat = seg.gather(values)
+        heights = np.array([values[s:e + 1].mean() for s, e in zip(starts, ends)])
+
+        peaks = seg.count_peaks(flat, heights)
+        for i, (s, e) in enumerate(zip(starts, ends)):
+            window = values[s:e + 1]
+            expected, _ = find_peaks(window, height=window.mean())
+            assert peaks[i] == len(expected)
+
+    def test_count_peaks_plateau(self):
+        values = np.array([0.0, 1.0, 2.0, 2.0, 2.0, 1.0, 3.0, 3.0])
+        seg = ZoneSegments([0], [7], len(values))
+        # Plateau 2,2,2 is one peak; trailing 3,3 touches the boundary
+        assert seg.count_peaks(seg.gather(values), np.array([0.0]))[0] == 1
+
+    def test_nan_aware_statistics(self):
+        values = np.array([np.nan, np.nan, 1.0, 3.0, np.nan, 5.0])
+        seg = ZoneSegments([0, 2], [1, 5], len(values))
+        flat = seg.gather(values)
+
+        assert np.isnan(seg.max(flat)[0])
+        assert seg.max(flat)[1] == 5.0
+        assert seg.mean(flat)[1] == pytest.approx(3.0)
+        assert seg.std(flat)[1] == pytest.approx(pd.Series(values[2:]).std())
+
+    def test_invalid_windows(self):
+        with pytest.raises(ValueError):
+            ZoneSegments([5], [3], 10)
+        with pytest.raises(ValueError):
+            ZoneSegments([0], [10], 10)
+
+
+class TestBatchFeatureExtraction:
+    """Batch extraction parity with ZoneFeaturesAnalyzer.extract_zone_features."""
+
+    @pytest.fixture
+    def ohlcv_with_macd(self):
+        rng = np.random.default_rng(42)
+        n = 600
+        close = np.round(100 + np.cumsum(rng.normal(0, 1, n)), 1)
+        df = pd.DataFrame({
+            'open': close,
+            'high': close + rng.random(n),
+            'low': close - rng.random(n),
+            'close': close,
+            'volume': rng.uniform(1000, 2000, n),
+        }, index=pd.date_range('2024-01-01', periods=n, freq='1h'))
+        df['macd'] = df['close'].ewm(span=12).mean() - df['close'].ewm(span=26).mean()
+        df['macd_signal'] = df['macd'].ewm(span=9).mean()
+        df['macd_hist'] = df['macd'] - df['macd_signal']
+        df['atr'] = (df['high'] - df['low']).rolling(14).mean()
+        return df
+
+    @pytest.fixture
+    def zones(self, ohlcv_with_macd):
+        config = ZoneDetectionConfig(
+            min_duration=1,
+            rules={'indicator_col': 'macd_hist'},
+            strategy_name='zero_crossing'
+        )
+        return ZoneDetectionRegistry.get('zero_crossing').detect_zones(ohlcv_with_macd, config)
+
+    def test_batch_matches_per_zone(self, zones):
+        analyzer = ZoneFeaturesAnalyzer(swing_strategy='find_peaks', min_duration=2)
+
+        batch = analyzer.extract_all_zones_features(zones, batch=True)
+        per_zone = analyzer.extract_all_zones_features(zones, batch=False)
+
+        assert len(batch) == len(per_zone) > 0
+        assert len(batch) < len(zones)  # 1-bar zones are skipped by min_duration
+        for left, right in zip(batch, per_zone):
+            _assert_same(left.to_dict(), right.to_dict())
+
+    def test_zones_stay_lazy(self, zones):
+        analyzer = ZoneFeaturesAnalyzer(swing_strategy='none', shape_strategy='none')
+        analyzer.extract_all_zones_features(zones)
+
+        assert not any(zone.is_materialized for zone in zones)
+
+    def test_materialized_zone_uses_per_zone_path(self, zones):
+        analyzer = ZoneFeaturesAnalyzer(swing_strategy='none', shape_strategy='none')
+        target = next(zone for zone in zones if zone.duration >= 2)
+        target.data['close'] = target.data['close'] * 2  # user edit must be honoured
+
+        features = analyzer.extract_all_zones_features(zones)
+        edited = next(f for f in features if f.zone_id == target.zone_id)
+
+        assert edited.start_price == pytest.approx(float(target.data['close'].iloc[0]))
+
+    def test_extract_base_features_batch_from_arrays(self, ohlcv_with_macd):
+        columns = {name: ohlcv_with_macd[name].to_numpy() for name in ohlcv_with_macd.columns}
+        table = ZoneFeaturesAnalyzer(swing_strategy='none').extract_base_features_batch(
+            columns, [0, 100], [99, 249], zone_types=['bull', 'bear'], indicator_col='macd_hist'
+        )
+
+        assert list(table['duration']) == [100, 150]
+        window = ohlcv_with_macd.iloc[100:250]
+        assert table.loc[1, 'max_price'] == window['high'].max()
+        assert table.loc[1, 'oscillator_std'] == pytest.approx(window['macd_hist'].std())
+        assert table.loc[1, 'correlation_price_hist'] == pytest.approx(
+            window['close'].corr(window['macd_hist'])
+        )
+        assert np.isnan(table.loc[0, 'rally_from_trough'])
+        assert np.isnan(table.loc[1, 'drawdown_from_peak'])
+
+    def test_missing_price_columns(self):
+        with pytest.raises(ValueError):
+            compute_zone_base_features({'close': np.ones(5)}, [0], [4])
@@ -5,7 +5,7 @@ Integration tests for ZoneFeaturesAnalyzer with divergence strategies using samp
 import pytest
 import pandas as pd
 
-from bquant.analysis.zones import ZoneFeaturesAnalyzer
+from bquant.analysis.zones import ZoneFeaturesAnalyzer, analyze_zones
 from bquant.analysis.zones.strategies.divergence import ClassicDivergenceStrategy
 from bquant.data.samples import get_sample_data
 from bquant.indicators.macd import MACDZoneAnalyzer
@@ -153,6 +153,36 @@ class TestZoneFeaturesDivergenceIntegration:
         print(f"Divergence types: {div_types}")
 
 
+def test_pipeline_divergence_metrics_from_one_batch(monkeypatch):
+    """Batch feature extraction detects extrema once and never slices per zone."""
+    df = get_sample_data('tv_xauusd_1h')
+    batch_calls = []
+    original = ClassicDivergenceStrategy.calculate_divergence_batch
+    
+    def _spy(self, data, start_idx, end_idx, indicator_col, indicator_line_col=None):
+        batch_calls.append((len(start_idx), indicator_col))
+        return original(self, data, start_idx, end_idx, indicator_col, indicator_line_col)
+    
+    def _per_zone(self, zone_data, indicator_col, indicator_line_col=None):
+        raise AssertionError("per-zone divergence path must not be used")
+    
+    monkeypatch.setattr(ClassicDivergenceStrategy, "calculate_divergence_batch", _spy)
+    monkeypatch.setattr(ClassicDivergenceStrategy, "calculate_divergence", _per_zone)
+    
+    result = (
+        analyze_zones(df)
+        .with_cache(enable=False)
+        .with_indicator('custom', 'macd')
+        .with_strategies(divergence='classic')
+        .detect_zones('zero_crossing', indicator_col='macd_hist')
+        .build()
+    )
+    
+    assert batch_calls == [(len(result.zones), 'macd_hist')]
+    metrics = [zone.features['metadata']['divergence_metrics'] for zone in result.zones]
+    assert all(m is not None and m['strategy_name'] == 'classic' for m in metrics)
+
+
 def run_tests():
     """Run all divergence integration tests."""
     pytest.main([__file__, '-v'])
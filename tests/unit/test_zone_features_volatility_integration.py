@@ -5,7 +5,7 @@ Integration tests for ZoneFeaturesAnalyzer with volatility strategies using samp
 import pytest
 import pandas as pd
 
-from bquant.analysis.zones import ZoneFeaturesAnalyzer
+from bquant.analysis.zones import ZoneFeaturesAnalyzer, analyze_zones
 from bquant.analysis.zones.strategies.volatility import CombinedVolatilityStrategy
 from bquant.data.samples import get_sample_data
 from bquant.indicators.macd import MACDZoneAnalyzer
@@ -186,6 +186,36 @@ class TestZoneFeaturesVolatilityIntegration:
         assert result1.bollinger_width_pct != result2.bollinger_width_pct
 
 
+def test_pipeline_volatility_metrics_from_one_batch(monkeypatch):
+    """Batch feature extraction computes the bands once and never slices per zone."""
+    df = get_sample_data('tv_xauusd_1h')
+    batch_calls = []
+    original = CombinedVolatilityStrategy.calculate_volatility_batch
+
+    def _spy(self, data, start_idx, end_idx, bands=None):
+        batch_calls.append(len(start_idx))
+        return original(self, data, start_idx, end_idx, bands)
+
+    def _per_zone(self, zone_data):
+        raise AssertionError("per-zone volatility path must not be used")
+
+    monkeypatch.setattr(CombinedVolatilityStrategy, "calculate_volatility_batch", _spy)
+    monkeypatch.setattr(CombinedVolatilityStrategy, "calculate_volatility", _per_zone)
+
+    result = (
+        analyze_zones(df)
+        .with_cache(enable=False)
+        .with_indicator('custom', 'macd')
+        .with_strategies(volatility='combined')
+        .detect_zones('zero_crossing', indicator_col='macd_hist')
+        .build()
+    )
+
+    assert batch_calls == [len(result.zones)]
+    metrics = [zone.features['metadata']['volatility_metrics'] for zone in result.zones]
+    assert sum(m is not None for m in metrics) > len(metrics) // 2
+
+
 def run_tests():
     """Run all volatility integration tests."""
     pytest.main([__file__, '-v'])
@@ -0,0 +1,184 @@
+"""
+Unit tests for the append-only IncrementalZonePipeline.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from bquant.analysis.zones import (
+    IncrementalZonePipeline,
+    UniversalZoneAnalyzer,
+    ZoneAnalysisConfig,
+    ZoneAnalysisPipeline,
+    ZoneDetectionConfig,
+)
+from bquant.analysis.zones.pipeline import IndicatorConfig
+from bquant.analysis.zones.zone_features import ZoneFeaturesAnalyzer
+from bquant.indicators import IndicatorFactory
+
+
+def _make_ohlcv(n=1500, seed=0):
+    rng = np.random.default_rng(seed)
+    close = 100 + np.cumsum(rng.normal(0, 1, n))
+    return pd.DataFrame({
+        'open': close + rng.normal(0, 0.1, n),
+        'high': close + rng.uniform(0.1, 1.0, n),
+        'low': close - rng.uniform(0.1, 1.0, n),
+        'close': close,
+        'volume': rng.uniform(1000, 2000, n),
+    }, index=pd.date_range('2024-01-01', periods=n, freq='1h'))
+
+
+def _config(**rules):
+    return ZoneAnalysisConfig(
+        indicator=IndicatorConfig('custom', 'macd', {}),
+        zone_detection=ZoneDetectionConfig(
+            strategy_name='zero_crossing',
+            min_duration=2,
+            rules={'indicator_col': 'macd_hist', **rules},
+        ),
+        perform_clustering=False,
+        swing_scope='per_zone',
+    )
+
+
+def _analyzer():
+    return UniversalZoneAnalyzer(features_analyzer=ZoneFeaturesAnalyzer(swing_strategy='find_peaks'))
+
+
+def _stream(pipeline, df, first=500, step=7):
+    pipeline.append(df.iloc[:first])
+    for start in range(first, len(df), step):
+        pipeline.append(df.iloc[start:start + step])
+    return pipeline
+
+
+class TestIncrementalZonePipeline:
+    """Streaming appends reproduce the batch pipeline."""
+
+    @pytest.fixture
+    def df(self):
+        return _make_ohlcv()
+
+    def test_matches_full_run(self, df):
+        full = ZoneAnalysisPipeline(_config(), zone_analyzer=_analyzer(), enable_cache=False).run(df)
+        stream = _stream(IncrementalZonePipeline(_config(), zone_analyzer=_analyzer()), df)
+
+        closed = stream.closed_zones
+        # The trailing zone of the full run is still open in the stream
+        assert len(closed) == len(full.zones) - 1
+        assert stream.open_zone.start_idx == full.zones[-1].start_idx
+        for left, right in zip(closed, full.zones):
+            assert (left.zone_id, left.type, left.start_idx, left.end_idx) == \
+                (right.zone_id, right.type, right.start_idx, right.end_idx)
+            assert left.features['price_return'] == pytest.approx(right.features['price_return'])
+            assert left.features['num_peaks'] == right.features['num_peaks']
+
+        np.testing.assert_allclose(stream.data()['macd_hist'], full.data['macd_hist'], rtol=1e-9, atol=1e-12)
+
+    def test_closed_zones_are_finalized_once(self, df):
+        stream = IncrementalZonePipeline(_config(), zone_analyzer=_analyzer())
+        stream.append(df.iloc[:800])
+        finalized = {zone.zone_id: zone for zone in stream.closed_zones}
+
+        update = stream.append(df.iloc[800:1000])
+
+        assert all(stream.closed_zones[i] is zone for i, zone in finalized.items())
+        assert [zone.zone_id for zone in update.closed_zones] == \
+            list(range(len(finalized), len(stream.closed_zones)))
+        assert update.total_bars == stream.n_bars == 1000
+
+    def test_running_statistics(self, df):
+        stream = _stream(IncrementalZonePipeline(_config(), zone_analyzer=_analyzer()), df)
+
+        durations = pd.Series([zone.features['duration'] for zone in stream.closed_zones])
+        stats = stream.statistics
+        overall = stats['duration_distribution']['overall']
+
+        assert stats['total_statistics']['total_zones'] == len(durations)
+        assert overall['mean'] == pytest.approx(durations.mean())
+        assert overall['std'] == pytest.approx(durations.std())
+        assert overall['max'] == durations.max()
+
+    def test_smoothed_detection_uses_lookback(self, df):
+        config = _config(smooth_window=3)
+        full = ZoneAnalysisPipeline(config, zone_analyzer=_analyzer(), enable_cache=False).run(df)
+        stream = _stream(IncrementalZonePipeline(config, zone_analyzer=_analyzer()), df, step=5)
+
+        assert stream.detection_lookback == 3
+        assert [(z.start_idx, z.end_idx) for z in stream.closed_zones] == \
+            [(z.start_idx, z.end_idx) for z in full.zones[:-1]]
+
+    def test_window_is_bounded_before_first_zone(self, df, monkeypatch):
+        config = _config()
+        config.zone_detection.min_duration = len(df) + 1  # no zone is ever found
+        stream = IncrementalZonePipeline(config, zone_analyzer=_analyzer())
+        windows = []
+        detect = stream._detector.detect_zones
+
+        def recording_detect(window, detection_config):
+            windows.append(len(window))
+            return detect(window, detection_config)
+
+        monkeypatch.setattr(stream._detector, 'detect_zones', recording_detect)
+        _stream(stream, df, first=100)
+
+        assert stream.closed_zones == [] and stream.open_zone is None
+        # Redetection covers the trailing segment, not the whole history
+        assert max(windows[2:]) < len(df) // 4
+
+    def test_excluded_zone_types_match_full_run(self, df):
+        config = _config()
+        config.zone_detection.zone_types = ['bull']
+        full = ZoneAnalysisPipeline(config, zone_analyzer=_analyzer(), enable_cache=False).run(df)
+        stream = _stream(IncrementalZonePipeline(config, zone_analyzer=_analyzer()), df, first=20)
+
+        expected = [(z.start_idx, z.end_idx) for z in full.zones if z.end_idx < len(df) - 1]
+        assert [(z.start_idx, z.end_idx) for z in stream.closed_zones] == expected
+
+    def test_global_swing_scope_is_rejected(self):
+        config = _config()
+        config.swing_scope = 'global'
+
+        with pytest.raises(ValueError, match="per_zone"):
+            IncrementalZonePipeline(config)
+
+    def test_result_reuses_cached_features(self, df, monkeypatch):
+        stream = _stream(IncrementalZonePipeline(_config(), zone_analyzer=_analyzer()), df)
+
+        def fail(*args, **kwargs):
+            raise AssertionError("features must not be re-extracted")
+
+        monkeypatch.setattr(stream.analyzer.features, 'extract_all_zones_features', fail)
+        result = stream.result()
+
+        assert len(result.zones) == len(stream.closed_zones)
+        assert result.statistics['total_statistics']['total_zones'] == len(stream.closed_zones)
+        assert len(result.data) == len(df)
+
+    def test_streaming_indicator_state_is_used(self, df):
+        config = ZoneAnalysisConfig(
+            indicator=IndicatorConfig('custom', 'rsi', {'period': 14}),
+            zone_detection=ZoneDetectionConfig(
+                strategy_name='threshold',
+                rules={'indicator_col': 'rsi_14', 'upper_threshold': 70, 'lower_threshold': 30},
+            ),
+            perform_clustering=False,
+            swing_scope='per_zone',
+        )
+        stream = _stream(IncrementalZonePipeline(config, zone_analyzer=_analyzer()), df)
+        expected = IndicatorFactory.create('custom', 'rsi', period=14).calculate(df).data['rsi_14']
+
+        assert stream._indicator.state.n_bars == len(df)
+        np.testing.assert_allclose(stream.data()['rsi_14'], expected, rtol=1e-9)
+
+    def test_rejects_out_of_order_and_mismatched_bars(self, df):
+        stream = IncrementalZonePipeline(_config(), zone_analyzer=_analyzer())
+        stream.append(df.iloc[:100])
+
+        with pytest.raises(ValueError):
+            stream.append(df.iloc[50:60])
+        with pytest.raises(ValueError):
+            stream.append(df.iloc[100:110].drop(columns='volume'))
+        assert stream.append(df.iloc[:0]).new_bars == 0
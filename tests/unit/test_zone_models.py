@@ -15,7 +15,12 @@ import json
 import tempfile
 import shutil
 
-from bquant.analysis.zones.models import ZoneInfo, ZoneAnalysisResult
+from bquant.analysis.zones.models import (
+    ZoneInfo,
+    ZoneAnalysisResult,
+    ZoneColumnStore,
+    ZoneDataView,
+)
 
 # Check if pyarrow is available
 try:
@@ -150,6 +155,114 @@ class TestZoneInfo:
         assert analyzer_format['indicator_context']['signal_line'] == 'ema_26'
 
 
+class TestZoneDataView:
+    """Tests for lazy zone windows over a shared column store."""
+
+    @pytest.fixture
+    def source_data(self):
+        dates = pd.date_range('2024-01-01', periods=50, freq='1h')
+        rng = np.random.default_rng(7)
+        return pd.DataFrame({
+            'open': rng.uniform(100, 105, 50),
+            'high': rng.uniform(105, 110, 50),
+            'low': rng.uniform(95, 100, 50),
+            'close': rng.uniform(100, 105, 50),
+            'macd_hist': rng.normal(0, 1, 50),
+        }, index=dates)
+
+    def _zone(self, view, data, start, end):
+        return ZoneInfo(
+            zone_id=0,
+            type='bull',
+            start_idx=start,
+            end_idx=end,
+            start_time=data.index[start],
+            end_time=data.index[end],
+            duration=end - start + 1,
+            data=view,
+        )
+
+    def test_view_columns_are_readonly_windows(self, source_data):
+        store = ZoneColumnStore(source_data)
+        view = store.view(10, 19)
+
+        assert len(view) == 10
+        assert list(view.columns) == list(source_data.columns)
+        assert view.index.equals(source_data.index[10:20])
+        np.testing.assert_array_equal(view['close'], source_data['close'].to_numpy()[10:20])
+        assert not view['close'].flags.writeable
+        with pytest.raises(ValueError):
+            view['close'][0] = 0.0
+
+    def test_views_share_one_column_buffer(self, source_data):
+        store = ZoneColumnStore(source_data)
+        first = store.view(0, 9)['high']
+        second = store.view(5, 14)['high']
+
+        assert np.shares_memory(first, second)
+
+    def test_invalid_window_rejected(self, source_data):
+        store = ZoneColumnStore(source_data)
+        with pytest.raises(ValueError, match="Invalid zone window"):
+            store.view(45, 60)
+
+    def test_zone_data_materialized_lazily_and_cached(self, source_data):
+        view = ZoneColumnStore(source_data).view(3, 7)
+        zone = self._zone(view, source_data, 3, 7)
+
+        assert zone.data_view is view
+        assert not zone.is_materialized
+
+        frame = zone.data
+        assert isinstance(frame, pd.DataFrame)
+        pd.testing.assert_frame_equal(frame, source_data.iloc[3:8])
+        assert zone.is_materialized
+        assert zone.data is frame
+
+        # Materialized frame is private: edits never leak into the shared source
+        zone.data['close'] = -1.0
+        assert (source_data['close'].iloc[3:8] > 0).all()
+        assert (zone.data['close'] == -1.0).all()
+
+    def test_get_data_without_cache_keeps_zone_lazy(self, source_data):
+        zone = self._zone(ZoneColumnStore(source_data).view(0, 4), source_data, 0, 4)
+
+        transient = zone.get_data(cache=False)
+        assert len(transient) == 5
+        assert not zone.is_materialized
+
+    def test_to_analyzer_format_reuses_cached_frame(self, source_data):
+        zone = self._zone(ZoneColumnStore(source_data).view(0, 4), source_data, 0, 4)
+
+        first = zone.to_analyzer_format()
+        second = zone.to_analyzer_format()
+
+        assert isinstance(first['data'], pd.DataFrame)
+        assert isinstance(first['data_view'], ZoneDataView)
+        assert first['data'] is second['data']
+        assert first['data'] is zone.data
+
+    def test_assigning_dataframe_replaces_view(self, source_data):
+        zone = self._zone(ZoneColumnStore(source_data).view(0, 4), source_data, 0, 4)
+        replacement = source_data.iloc[:5].copy()
+
+        zone.data = replacement
+        assert zone.data is replacement
+        assert zone.data_view is None
+
+    def test_pickle_roundtrip_preserves_view(self, source_data):
+        store = ZoneColumnStore(source_data)
+        zones = [
+            self._zone(store.view(0, 9), source_data, 0, 9),
+            self._zone(store.view(10, 19), source_data, 10, 19),
+        ]
+
+        restored = pickle.loads(pickle.dumps(zones))
+
+        assert restored[0].data_view.store is restored[1].data_view.store
+        pd.testing.assert_frame_equal(restored[1].data, source_data.iloc[10:20])
+
+
 class TestZoneAnalysisResult:
     """Tests for ZoneAnalysisResult dataclass and serialization."""
     